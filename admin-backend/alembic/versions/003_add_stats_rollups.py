@@ -0,0 +1,70 @@
+"""Add hourly stats rollup tables
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-18
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "003"
+down_revision: Union[str, None] = "002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "crypto_flow_hourly",
+        sa.Column("bucket_start", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("user_id", sa.String(36), nullable=False),
+        sa.Column("deposit_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("deposit_amount_usdt", sa.Numeric(20, 6), nullable=False, server_default="0"),
+        sa.Column("deposit_amount_krw", sa.Numeric(20, 0), nullable=False, server_default="0"),
+        sa.Column("withdrawal_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("withdrawal_amount_usdt", sa.Numeric(20, 6), nullable=False, server_default="0"),
+        sa.Column("withdrawal_amount_krw", sa.Numeric(20, 0), nullable=False, server_default="0"),
+        sa.PrimaryKeyConstraint("bucket_start", "user_id"),
+    )
+    op.create_index("ix_crypto_flow_hourly_user_id", "crypto_flow_hourly", ["user_id"])
+
+    op.create_table(
+        "revenue_hourly",
+        sa.Column("bucket_start", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("rake", sa.Numeric(20, 2), nullable=False, server_default="0"),
+        sa.Column("hands", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.PrimaryKeyConstraint("bucket_start"),
+    )
+
+    op.create_table(
+        "rollup_watermarks",
+        sa.Column("name", sa.String(50), nullable=False),
+        sa.Column("watermark", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("name"),
+    )
+
+    # 증분 집계 윈도우 조회용 (완료 시각 기준)
+    op.create_index(
+        "ix_crypto_deposits_status_credited_at",
+        "crypto_deposits",
+        ["status", "credited_at"],
+    )
+    op.create_index(
+        "ix_crypto_withdrawals_status_processed_at",
+        "crypto_withdrawals",
+        ["status", "processed_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_crypto_withdrawals_status_processed_at", table_name="crypto_withdrawals")
+    op.drop_index("ix_crypto_deposits_status_credited_at", table_name="crypto_deposits")
+    op.drop_table("rollup_watermarks")
+    op.drop_table("revenue_hourly")
+    op.drop_index("ix_crypto_flow_hourly_user_id", table_name="crypto_flow_hourly")
+    op.drop_table("crypto_flow_hourly")
@@ -0,0 +1,32 @@
+"""Persist signed withdrawal transfers
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-18
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "004"
+down_revision: Union[str, None] = "003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("crypto_withdrawals", sa.Column("signed_seqno", sa.Integer(), nullable=True))
+    op.add_column("crypto_withdrawals", sa.Column("signed_boc", sa.Text(), nullable=True))
+    op.add_column(
+        "crypto_withdrawals",
+        sa.Column("signed_valid_until", sa.DateTime(timezone=True), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("crypto_withdrawals", "signed_valid_until")
+    op.drop_column("crypto_withdrawals", "signed_boc")
+    op.drop_column("crypto_withdrawals", "signed_seqno")
@@ -6,7 +6,7 @@ RBAC 정책:
 - 자신의 활동 조회 (/api/audit/my-activity): operator 이상
 - 관리자 활동 대시보드 (/api/audit/dashboard): admin만
 """
-from fastapi import APIRouter, Query, Depends
+from fastapi import APIRouter, Query, Depends, HTTPException, status
 from pydantic import BaseModel
 from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -15,6 +15,7 @@ from app.database import get_admin_db
 from app.utils.dependencies import require_admin, require_operator
 from app.models.admin_user import AdminUser
 from app.services.audit_service import AuditService
+from app.utils.pagination import InvalidCursorError
 
 
 router = APIRouter()
@@ -38,6 +39,8 @@ class PaginatedAuditLogs(BaseModel):
     page: int
     page_size: int
     total_pages: int
+    next_cursor: str | None = None
+    total_is_estimate: bool = False
 
 
 @router.get("", response_model=PaginatedAuditLogs)
@@ -47,18 +50,26 @@ async def list_audit_logs(
     target_type: str | None = Query(None, description="Filter by target type"),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(None, description="Keyset cursor (previous response next_cursor)"),
     current_user: AdminUser = Depends(require_operator),
     db: AsyncSession = Depends(get_admin_db),
 ):
     """List audit logs (operator and above)"""
     service = AuditService(db)
-    result = await service.list_logs(
-        action=action,
-        admin_user_id=admin_user_id,
-        target_type=target_type,
-        page=page,
-        page_size=page_size
-    )
+    try:
+        result = await service.list_logs(
+            action=action,
+            admin_user_id=admin_user_id,
+            target_type=target_type,
+            page=page,
+            page_size=page_size,
+            cursor=cursor,
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     return PaginatedAuditLogs(**result)
 
 
@@ -18,6 +18,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_admin_db
+from app.utils.pagination import InvalidCursorError
 
 router = APIRouter()
 
@@ -60,6 +61,8 @@ class PaginatedDeposits(BaseModel):
     page: int
     page_size: int
     total_pages: int
+    next_cursor: Optional[str] = None
+    total_is_estimate: bool = False
 
 
 class DepositActionRequest(BaseModel):
@@ -92,6 +95,8 @@ class PaginatedWithdrawals(BaseModel):
     page: int
     page_size: int
     total_pages: int
+    next_cursor: Optional[str] = None
+    total_is_estimate: bool = False
 
 
 class WithdrawalActionRequest(BaseModel):
@@ -193,6 +198,7 @@ async def list_deposits(
     user_id: Optional[str] = Query(None),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None),
     db: AsyncSession = Depends(get_admin_db),
 ):
     """List deposits with pagination and filtering.
@@ -202,6 +208,7 @@ async def list_deposits(
     - user_id: Filter by user ID
     - page: Page number (1-indexed)
     - page_size: Items per page (max 100)
+    - cursor: next_cursor from the previous page (keyset pagination)
     """
     from app.services.crypto.deposit_service import DepositService
 
@@ -212,8 +219,11 @@ async def list_deposits(
             user_id=user_id,
             page=page,
             limit=page_size,
+            cursor=cursor,
         )
         return result
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     finally:
         await service.close()
 
@@ -377,6 +387,7 @@ async def list_withdrawals(
     user_id: Optional[str] = Query(None),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None),
     db: AsyncSession = Depends(get_admin_db),
 ):
     """List withdrawals with pagination and filtering.
@@ -386,6 +397,7 @@ async def list_withdrawals(
     - user_id: Filter by user ID
     - page: Page number (1-indexed)
     - page_size: Items per page (max 100)
+    - cursor: next_cursor from the previous page (keyset pagination)
     """
     from app.services.crypto.withdrawal_service import WithdrawalService
 
@@ -396,8 +408,11 @@ async def list_withdrawals(
             user_id=user_id,
             page=page,
             limit=page_size,
+            cursor=cursor,
         )
         return result
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     finally:
         await service.close()
 
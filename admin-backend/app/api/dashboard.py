@@ -15,7 +15,7 @@ from app.utils.dependencies import get_current_user, require_viewer
 from app.models.admin_user import AdminUser
 from app.services.metrics_service import get_metrics_service, MetricsService
 from app.services.statistics_service import StatisticsService
-from app.database import get_main_db
+from app.database import get_admin_db, get_main_db
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
@@ -265,9 +265,10 @@ async def get_daily_revenue(
     days: int = Query(30, ge=1, le=90, description="조회 일수"),
     current_user: AdminUser = Depends(require_viewer),
     main_db: AsyncSession = Depends(get_main_db),
+    admin_db: AsyncSession = Depends(get_admin_db),
 ):
     """일별 매출 조회"""
-    service = StatisticsService(main_db)
+    service = StatisticsService(main_db, admin_db=admin_db)
     revenue = await service.get_daily_revenue(days)
     return [DailyRevenueItem(**item) for item in revenue]
 
@@ -277,9 +278,10 @@ async def get_weekly_revenue(
     weeks: int = Query(12, ge=1, le=52, description="조회 주 수"),
     current_user: AdminUser = Depends(require_viewer),
     main_db: AsyncSession = Depends(get_main_db),
+    admin_db: AsyncSession = Depends(get_admin_db),
 ):
     """주별 매출 조회"""
-    service = StatisticsService(main_db)
+    service = StatisticsService(main_db, admin_db=admin_db)
     revenue = await service.get_weekly_revenue(weeks)
     return [WeeklyRevenueItem(**item) for item in revenue]
 
@@ -289,9 +291,10 @@ async def get_monthly_revenue(
     months: int = Query(12, ge=1, le=24, description="조회 개월 수"),
     current_user: AdminUser = Depends(require_viewer),
     main_db: AsyncSession = Depends(get_main_db),
+    admin_db: AsyncSession = Depends(get_admin_db),
 ):
     """월별 매출 조회"""
-    service = StatisticsService(main_db)
+    service = StatisticsService(main_db, admin_db=admin_db)
     revenue = await service.get_monthly_revenue(months)
     return [MonthlyRevenueItem(**item) for item in revenue]
 
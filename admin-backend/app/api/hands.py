@@ -16,7 +16,7 @@ from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel, Field
-from sqlalchemy import desc, func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -24,11 +24,21 @@ from app.database import get_main_db
 from app.models.admin_user import AdminUser
 from app.models.main_db import Hand, HandEvent, HandParticipant, User, Table
 from app.utils.dependencies import get_current_user
+from app.utils.pagination import (
+    COUNT_CAP,
+    InvalidCursorError,
+    Keyset,
+    capped_count_query,
+    page_offset,
+)
 from app.utils.permissions import Permission, has_permission
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# 핸드 목록 정렬 (최신순, id 타이브레이커)
+HANDS_KEYSET = Keyset((Hand.started_at, Hand.id))
+
 
 # ============================================================================
 # Request/Response Models
@@ -54,6 +64,8 @@ class PaginatedHands(BaseModel):
     page: int
     page_size: int
     total_pages: int
+    next_cursor: str | None = None
+    total_is_estimate: bool = False
 
 
 class TimelineAction(BaseModel):
@@ -174,6 +186,7 @@ async def search_hands(
     table_id: Optional[str] = Query(None, description="테이블 ID로 검색"),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Keyset cursor (이전 응답의 next_cursor)"),
     current_user: AdminUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_main_db),
 ):
@@ -183,6 +196,8 @@ async def search_hands(
     - hand_id: 특정 핸드 ID 검색
     - user_id: 특정 유저가 참가한 핸드 검색
     - table_id: 특정 테이블의 핸드 검색
+
+    cursor가 있으면 OFFSET 없이 (started_at, id) 이후 행을 조회합니다.
     """
     if not has_permission(current_user.role, Permission.VIEW_HANDS):
         raise HTTPException(
@@ -209,22 +224,28 @@ async def search_hands(
         )
         query = query.where(Hand.id.in_(subquery))
 
-    # Count total
-    count_query = select(func.count()).select_from(query.subquery())
+    # Count total (COUNT_CAP 초과 시 근사치)
+    filtered = bool(hand_id or table_id or user_id)
+    count_query = capped_count_query(
+        query, estimate_table=None if filtered else "hands"
+    )
     total_result = await db.execute(count_query)
     total = total_result.scalar() or 0
 
     # Apply pagination and ordering
-    offset = (page - 1) * page_size
-    query = (
-        query
-        .order_by(desc(Hand.started_at))
-        .limit(page_size)
-        .offset(offset)
-    )
+    try:
+        query = HANDS_KEYSET.apply(query, cursor)
+    except InvalidCursorError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    query = query.limit(page_size + 1).offset(page_offset(page, page_size, cursor))
 
     result = await db.execute(query)
-    hands = result.scalars().all()
+    hands, next_cursor = HANDS_KEYSET.page_rows(
+        result.scalars().all(), page_size, lambda h: (h.started_at, h.id)
+    )
 
     # Get table names
     table_ids = list(set(h.table_id for h in hands))
@@ -261,6 +282,8 @@ async def search_hands(
         page=page,
         page_size=page_size,
         total_pages=total_pages,
+        next_cursor=next_cursor,
+        total_is_estimate=total >= COUNT_CAP,
     )
 
 
@@ -16,6 +16,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel, ConfigDict, Field
 
 from app.config import get_settings
+from app.utils.http_client import create_client
 from app.models.admin_user import AdminUser
 from app.utils.dependencies import get_current_user, require_operator, require_supervisor
 from app.utils.permissions import Permission, has_permission
@@ -192,7 +193,7 @@ async def _call_game_backend(
     headers = {"X-API-Key": settings.main_api_key}
 
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with create_client(timeout=30.0) as client:
             method_upper = method.upper()
 
             if method_upper == "GET":
@@ -13,6 +13,7 @@ from app.utils.dependencies import require_viewer, require_operator, require_sup
 from app.models.admin_user import AdminUser
 from app.services.suspicious_user_service import SuspiciousUserService
 from app.services.audit_service import AuditService
+from app.utils.pagination import InvalidCursorError
 
 
 router = APIRouter()
@@ -45,6 +46,8 @@ class PaginatedSuspiciousUsers(BaseModel):
     page: int
     page_size: int
     total_pages: int
+    next_cursor: Optional[str] = None
+    total_is_estimate: bool = False
 
 
 class SuspicionSummary(BaseModel):
@@ -155,6 +158,7 @@ async def get_suspicious_users(
         description="정렬 기준 (suspicion_score, detection_count, last_detected)"
     ),
     sort_order: str = Query("desc", description="정렬 순서 (asc, desc)"),
+    cursor: Optional[str] = Query(None, description="Keyset 커서 (이전 응답의 next_cursor)"),
     main_db: AsyncSession = Depends(get_main_db),
     admin_db: AsyncSession = Depends(get_admin_db),
     _: AdminUser = Depends(require_viewer),
@@ -166,16 +170,21 @@ async def get_suspicious_users(
     의심 점수, 탐지 횟수, 심각도 등으로 정렬/필터링할 수 있습니다.
     """
     service = SuspiciousUserService(main_db, admin_db)
-    result = await service.get_suspicious_users(
-        page=page,
-        page_size=page_size,
-        detection_type=detection_type,
-        severity=severity,
-        status=status,
-        min_score=min_score,
-        sort_by=sort_by,
-        sort_order=sort_order,
-    )
+    try:
+        result = await service.get_suspicious_users(
+            page=page,
+            page_size=page_size,
+            detection_type=detection_type,
+            severity=severity,
+            status=status,
+            min_score=min_score,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            cursor=cursor,
+        )
+    except InvalidCursorError as e:
+        # 'status' 쿼리 파라미터가 fastapi.status를 가리므로 코드 직접 지정
+        raise HTTPException(status_code=400, detail=str(e))
     return result
 
 
@@ -10,6 +10,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel, Field
 
 from app.models.admin_user import AdminUser
+from app.utils.http_client import get_upstream_stats
 from app.utils.dependencies import require_viewer, require_supervisor
 from app.services.maintenance_service import (
     get_maintenance_service,
@@ -114,6 +115,20 @@ async def set_maintenance_mode(
     )
 
 
+@router.get("/upstreams")
+async def get_upstream_metrics(
+    _: AdminUser = Depends(require_viewer),
+):
+    """외부 API(upstream)별 요청 수 / 오류 / 지연 시간 조회
+
+    공용 HTTP 풀을 거친 요청만 집계됩니다 (프로세스 기동 이후 누적).
+
+    Returns:
+        dict: host -> 지표
+    """
+    return get_upstream_stats()
+
+
 @router.get("/health", response_model=SystemHealthResponse)
 async def system_health():
     """시스템 상태 확인 (인증 불필요)
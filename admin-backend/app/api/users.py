@@ -19,6 +19,7 @@ from app.services.user_service import (
     DuplicateNicknameError,
 )
 from app.services.audit_service import AuditService
+from app.utils.pagination import InvalidCursorError
 
 
 router = APIRouter()
@@ -46,6 +47,8 @@ class PaginatedUsers(BaseModel):
     page: int
     page_size: int
     total_pages: int
+    next_cursor: str | None = None
+    total_is_estimate: bool = False
 
 
 class TransactionItem(BaseModel):
@@ -63,6 +66,8 @@ class PaginatedTransactions(BaseModel):
     total: int
     page: int
     page_size: int
+    next_cursor: str | None = None
+    total_is_estimate: bool = False
 
 
 class LoginHistoryItem(BaseModel):
@@ -78,6 +83,8 @@ class PaginatedLoginHistory(BaseModel):
     total: int
     page: int
     page_size: int
+    next_cursor: str | None = None
+    total_is_estimate: bool = False
 
 
 class HandHistoryItem(BaseModel):
@@ -97,6 +104,8 @@ class PaginatedHandHistory(BaseModel):
     total: int
     page: int
     page_size: int
+    next_cursor: str | None = None
+    total_is_estimate: bool = False
 
 
 # 통합 활동 로그 Models
@@ -223,6 +232,7 @@ async def list_users(
     sort_order: str = Query("desc", description="Sort order (asc/desc)"),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Keyset cursor (previous response next_cursor)"),
     current_user: AdminUser = Depends(require_viewer),
     db: AsyncSession = Depends(get_main_db),
 ):
@@ -235,9 +245,15 @@ async def list_users(
             page_size=page_size,
             is_banned=is_banned,
             sort_by=sort_by,
-            sort_order=sort_order
+            sort_order=sort_order,
+            cursor=cursor,
         )
         return PaginatedUsers(**result)
+    except InvalidCursorError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     except UserServiceError as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -276,6 +292,7 @@ async def get_user_transactions(
     tx_type: Optional[str] = Query(None, description="Filter by transaction type"),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Keyset cursor (previous response next_cursor)"),
     current_user: AdminUser = Depends(require_viewer),
     db: AsyncSession = Depends(get_main_db),
 ):
@@ -286,9 +303,15 @@ async def get_user_transactions(
             user_id=user_id,
             page=page,
             page_size=page_size,
-            tx_type=tx_type
+            tx_type=tx_type,
+            cursor=cursor,
         )
         return PaginatedTransactions(**result)
+    except InvalidCursorError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     except UserServiceError as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -301,6 +324,7 @@ async def get_user_login_history(
     user_id: str,
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Keyset cursor (previous response next_cursor)"),
     current_user: AdminUser = Depends(require_viewer),
     db: AsyncSession = Depends(get_main_db),
 ):
@@ -310,9 +334,15 @@ async def get_user_login_history(
         result = await service.get_user_login_history(
             user_id=user_id,
             page=page,
-            page_size=page_size
+            page_size=page_size,
+            cursor=cursor,
         )
         return PaginatedLoginHistory(**result)
+    except InvalidCursorError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     except UserServiceError as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -325,6 +355,7 @@ async def get_user_hands(
     user_id: str,
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Keyset cursor (previous response next_cursor)"),
     current_user: AdminUser = Depends(require_viewer),
     db: AsyncSession = Depends(get_main_db),
 ):
@@ -334,9 +365,15 @@ async def get_user_hands(
         result = await service.get_user_hands(
             user_id=user_id,
             page=page,
-            page_size=page_size
+            page_size=page_size,
+            cursor=cursor,
         )
         return PaginatedHandHistory(**result)
+    except InvalidCursorError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     except UserServiceError as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
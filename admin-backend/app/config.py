@@ -93,6 +93,11 @@ class Settings(BaseSettings):
     withdrawal_monitor_interval: int = 30  # TX 모니터링 간격 (초)
     withdrawal_tx_timeout_minutes: int = 30  # TX 타임아웃 (분)
     withdrawal_max_retry: int = 3  # 최대 재시도 횟수
+    withdrawal_batch_size: int = 50  # 배치당 처리 건수
+    withdrawal_sign_concurrency: int = 4  # KMS 동시 서명 수
+    withdrawal_broadcast_rps: float = 5.0  # 초당 최대 브로드캐스트 (TON Center 제한)
+    withdrawal_seqno_poll_interval: float = 1.0  # 전송 후 seqno 반영 확인 간격 (초)
+    withdrawal_seqno_wait_seconds: float = 60.0  # 한 건당 seqno 반영 최대 대기 (초)
     
     # Telegram Bot
     telegram_bot_token: str = ""
@@ -108,6 +113,10 @@ class Settings(BaseSettings):
     deposit_monitor_enabled: bool = True  # Enable TonDepositMonitor for automatic deposit detection
     hot_wallet_min_balance: float = 1000.0  # USDT
     
+    # Stats Rollup (대시보드 사전 집계)
+    stats_rollup_enabled: bool = True
+    stats_rollup_interval: int = 60  # seconds
+    
     # Security
     withdrawal_supervisor_threshold: float = 1000.0  # USDT
     hot_wallet_alert_threshold: float = 5000.0  # USDT
@@ -116,6 +125,8 @@ class Settings(BaseSettings):
     
     # Fraud Detection
     fraud_consumer_enabled: bool = True  # Enable FraudEventConsumer for real-time fraud detection
+    fraud_redis_url: str = ""  # Game server Redis holding fraud:* streams (empty = redis_url)
+    fraud_consumer_name: str = ""  # Stable consumer name per instance (empty = hostname:pid)
     
     # Bot Detection Thresholds
     bot_min_sample_size: int = 10  # Minimum actions for analysis
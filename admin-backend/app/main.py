@@ -20,6 +20,8 @@ _wallet_alert_service = None
 _deposit_monitor = None
 _withdrawal_executor = None
 _withdrawal_monitor = None
+_stats_rollup_task = None
+_stats_rollup_job = None  # asyncio.Task running _stats_rollup_task.start()
 _redis_client = None
 
 
@@ -28,12 +30,18 @@ async def lifespan(app: FastAPI):
     """Application lifespan manager for startup/shutdown events."""
     global _fraud_consumer, _exchange_rate_task, _wallet_balance_task, _wallet_alert_service
     global _deposit_monitor, _withdrawal_executor, _withdrawal_monitor, _redis_client
+    global _stats_rollup_task, _stats_rollup_job
     import asyncio
 
     # Startup
     try:
         from redis.asyncio import Redis
-        from app.database import get_main_db_session, get_admin_db_session, AdminSessionLocal
+        from app.database import (
+            get_main_db_session,
+            get_admin_db_session,
+            AdminSessionLocal,
+            MainSessionLocal,
+        )
 
         # Redis 클라이언트 생성 (공유)
         _redis_client = Redis.from_url(
@@ -47,12 +55,17 @@ async def lifespan(app: FastAPI):
                 from app.services.fraud_event_consumer import init_fraud_consumer
 
                 # FraudConsumer용 별도 Redis (decode_responses=True 필요)
-                fraud_redis = Redis.from_url(settings.redis_url, decode_responses=True)
+                # fraud:* 스트림은 게임 서버 Redis DB에 있으므로 별도 URL 지원
+                fraud_redis = Redis.from_url(
+                    settings.fraud_redis_url or settings.redis_url,
+                    decode_responses=True,
+                )
 
                 _fraud_consumer = init_fraud_consumer(
                     fraud_redis,
                     get_main_db_session,
                     get_admin_db_session,
+                    consumer_name=settings.fraud_consumer_name or None,
                 )
                 await _fraud_consumer.start()
                 logger.info("FraudEventConsumer started successfully")
@@ -165,6 +178,24 @@ async def lifespan(app: FastAPI):
         else:
             logger.info("Withdrawal automation is disabled")
 
+        # Stats Rollup Task - 대시보드 통계 시간 단위 증분 집계
+        if settings.stats_rollup_enabled:
+            try:
+                from app.tasks.stats_rollup import StatsRollupTask
+
+                _stats_rollup_task = StatsRollupTask(
+                    admin_session_factory=AdminSessionLocal,
+                    main_session_factory=MainSessionLocal,
+                    interval=settings.stats_rollup_interval,
+                    redis=_redis_client,
+                )
+                _stats_rollup_job = asyncio.create_task(_stats_rollup_task.start())
+                logger.info(
+                    f"StatsRollupTask started (interval: {settings.stats_rollup_interval}s)"
+                )
+            except Exception as e:
+                logger.error(f"Failed to start StatsRollupTask: {e}")
+
     except Exception as e:
         logger.error(f"Error during startup: {e}")
 
@@ -195,6 +226,16 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             logger.error(f"Error stopping TonDepositMonitor: {e}")
 
+    if _stats_rollup_task:
+        try:
+            _stats_rollup_task.stop()
+            if _stats_rollup_job:
+                _stats_rollup_job.cancel()
+                await asyncio.gather(_stats_rollup_job, return_exceptions=True)
+            logger.info("StatsRollupTask stopped")
+        except Exception as e:
+            logger.error(f"Error stopping StatsRollupTask: {e}")
+
     if _exchange_rate_task:
         try:
             _exchange_rate_task.stop()
@@ -223,6 +264,13 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             logger.error(f"Error closing Redis client: {e}")
 
+    try:
+        from app.utils.http_client import close_http_pool
+
+        await close_http_pool()
+    except Exception as e:
+        logger.error(f"Error closing HTTP pool: {e}")
+
 app = FastAPI(
     title=settings.app_name,
     description="Admin Dashboard API for Holdem Game Management",
@@ -66,6 +66,10 @@ class CryptoWithdrawal(Base, UUIDMixin, TimestampMixin):
     approved_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     processed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     rejection_reason: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # 브로드캐스트 직전에 저장하는 서명된 메시지 (재시도 시 동일 BOC 재전송)
+    signed_seqno: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    signed_boc: Mapped[str | None] = mapped_column(Text, nullable=True)  # base64
+    signed_valid_until: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
 
     def __repr__(self) -> str:
         return f"<CryptoWithdrawal {self.id[:8]}... {self.amount_usdt} USDT to {self.to_address[:10]}...>"
@@ -0,0 +1,57 @@
+"""Pre-aggregated hourly rollup tables for dashboard statistics.
+
+Maintained incrementally by StatsRollupService (app/services/stats_rollup.py).
+Dashboard endpoints read these instead of grouping raw rows on every load.
+"""
+
+from datetime import datetime
+from decimal import Decimal
+from sqlalchemy import String, DateTime, Numeric, Integer, BigInteger
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class CryptoFlowHourly(Base):
+    """Hourly crypto deposit/withdrawal totals per user.
+
+    Buckets are keyed by completion time (deposit credited_at,
+    withdrawal processed_at) truncated to the hour (UTC).
+    """
+    __tablename__ = "crypto_flow_hourly"
+
+    bucket_start: Mapped[datetime] = mapped_column(DateTime(timezone=True), primary_key=True)
+    user_id: Mapped[str] = mapped_column(String(36), primary_key=True, index=True)
+    deposit_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    deposit_amount_usdt: Mapped[Decimal] = mapped_column(Numeric(20, 6), default=0, nullable=False)
+    deposit_amount_krw: Mapped[Decimal] = mapped_column(Numeric(20, 0), default=0, nullable=False)
+    withdrawal_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    withdrawal_amount_usdt: Mapped[Decimal] = mapped_column(Numeric(20, 6), default=0, nullable=False)
+    withdrawal_amount_krw: Mapped[Decimal] = mapped_column(Numeric(20, 0), default=0, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<CryptoFlowHourly {self.bucket_start} {self.user_id}>"
+
+
+class RevenueHourly(Base):
+    """Hourly rake revenue totals from main DB hand_history."""
+    __tablename__ = "revenue_hourly"
+
+    bucket_start: Mapped[datetime] = mapped_column(DateTime(timezone=True), primary_key=True)
+    rake: Mapped[Decimal] = mapped_column(Numeric(20, 2), default=0, nullable=False)
+    hands: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<RevenueHourly {self.bucket_start} rake={self.rake}>"
+
+
+class RollupWatermark(Base):
+    """Source rows before this time are reflected in the named rollup."""
+    __tablename__ = "rollup_watermarks"
+
+    name: Mapped[str] = mapped_column(String(50), primary_key=True)
+    watermark: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<RollupWatermark {self.name} @ {self.watermark}>"
@@ -9,9 +9,15 @@ from sqlalchemy import text
 import uuid
 import json
 
+from app.utils.pagination import Keyset, capped_count_sql, page_offset, page_response
+
 logger = logging.getLogger(__name__)
 
 
+# 감사 로그 목록 정렬 (최신순, id 타이브레이커)
+AUDIT_LOGS_KEYSET = Keyset(("created_at", "id"))
+
+
 class AuditServiceError(Exception):
     """Exception raised for audit service errors."""
     pass
@@ -109,7 +115,8 @@ class AuditService:
         admin_user_id: Optional[str] = None,
         target_type: Optional[str] = None,
         page: int = 1,
-        page_size: int = 20
+        page_size: int = 20,
+        cursor: Optional[str] = None,
     ) -> dict:
         """
         감사 로그 목록 조회
@@ -120,12 +127,15 @@ class AuditService:
             target_type: 대상 유형 필터
             page: 페이지 번호
             page_size: 페이지 크기
+            cursor: 이전 응답의 next_cursor (있으면 OFFSET 없이 조회)
         
         Returns:
             페이지네이션된 감사 로그 목록
         """
-        offset = (page - 1) * page_size
-        params = {"limit": page_size, "offset": offset}
+        params = {
+            "limit": page_size + 1,
+            "offset": page_offset(page, page_size, cursor),
+        }
         
         where_clauses = []
         
@@ -142,10 +152,15 @@ class AuditService:
             params["target_type"] = target_type
         
         where_sql = " AND ".join(where_clauses) if where_clauses else "1=1"
+        cursor_sql = AUDIT_LOGS_KEYSET.where_sql(cursor, params)
+        page_where_sql = f"{where_sql} AND {cursor_sql}" if cursor_sql else where_sql
         
         try:
-            # 총 개수 조회
-            count_query = text(f"SELECT COUNT(*) FROM audit_logs WHERE {where_sql}")
+            # 총 개수 조회 (COUNT_CAP 초과 시 근사치)
+            count_query = text(capped_count_sql(
+                f"FROM audit_logs WHERE {where_sql}",
+                estimate_table=None if where_clauses else "audit_logs",
+            ))
             count_result = await self.db.execute(count_query, params)
             total = count_result.scalar() or 0
             
@@ -154,12 +169,14 @@ class AuditService:
                 SELECT id, admin_user_id, admin_username, action, 
                        target_type, target_id, details, ip_address, created_at
                 FROM audit_logs
-                WHERE {where_sql}
-                ORDER BY created_at DESC
+                WHERE {page_where_sql}
+                ORDER BY {AUDIT_LOGS_KEYSET.order_by_sql()}
                 LIMIT :limit OFFSET :offset
             """)
             result = await self.db.execute(list_query, params)
-            rows = result.fetchall()
+            rows, next_cursor = AUDIT_LOGS_KEYSET.page_rows(
+                result.fetchall(), page_size, lambda row: (row.created_at, row.id)
+            )
             
             items = []
             for row in rows:
@@ -182,13 +199,7 @@ class AuditService:
                     "created_at": row.created_at.isoformat() if row.created_at else None
                 })
             
-            return {
-                "items": items,
-                "total": total,
-                "page": page,
-                "page_size": page_size,
-                "total_pages": (total + page_size - 1) // page_size
-            }
+            return page_response(items, total, page, page_size, next_cursor)
         except Exception as e:
             logger.error(f"Failed to list audit logs: {e}", exc_info=True)
             raise AuditServiceError(f"Failed to list audit logs: {e}") from e
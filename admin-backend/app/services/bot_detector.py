@@ -17,6 +17,8 @@ from app.config import get_settings
 if TYPE_CHECKING:
     from redis.asyncio import Redis
 
+    from app.services.response_time_stats import RollingTimingStats
+
 settings = get_settings()
 
 
@@ -360,44 +362,87 @@ class BotDetector:
             }
 
         try:
-            avg_time = statistics.mean(response_times)
-            std_dev = statistics.stdev(response_times) if len(response_times) > 1 else 0
-            min_time = min(response_times)
-            max_time = max(response_times)
-
-            is_suspicious = False
-            reasons = []
-
-            # 봇 의심 조건 (settings 기반)
-            if std_dev < settings.bot_std_dev_threshold and len(response_times) >= 15:
-                is_suspicious = True
-                reasons.append("very_consistent_timing")
-
-            if min_time < settings.bot_min_response_time_ms:
-                is_suspicious = True
-                reasons.append("superhuman_reaction")
-
-            if (max_time - min_time) < settings.bot_time_range_threshold and len(response_times) >= 15:
-                is_suspicious = True
-                reasons.append("narrow_time_range")
+            return self._evaluate_response_timing(
+                sample_size=len(response_times),
+                avg_time=statistics.mean(response_times),
+                std_dev=statistics.stdev(response_times) if len(response_times) > 1 else 0,
+                min_time=min(response_times),
+                max_time=max(response_times),
+            )
 
+        except Exception:
             return {
                 "sample_size": len(response_times),
-                "avg_response_time_ms": round(avg_time, 2),
-                "std_dev_ms": round(std_dev, 2),
-                "min_time_ms": min_time,
-                "max_time_ms": max_time,
-                "is_suspicious": is_suspicious,
-                "reasons": reasons
+                "is_suspicious": False,
+                "reason": "error"
             }
 
-        except Exception:
+    def analyze_timing_stats(self, stats: "RollingTimingStats") -> dict:
+        """
+        롤링 윈도우 통계 기반 응답 시간 분석 (O(1))
+
+        RollingTimingStats가 액션마다 갱신한 평균/표준편차/최소/최대를
+        그대로 사용하므로 세션 길이와 무관하게 상수 시간입니다.
+
+        Args:
+            stats: 사용자별 RollingTimingStats
+
+        Returns:
+            analyze_realtime_response_times와 동일한 형식의 분석 결과
+        """
+        if stats.sample_size < settings.bot_min_sample_size:
             return {
-                "sample_size": len(response_times),
+                "sample_size": stats.sample_size,
                 "is_suspicious": False,
-                "reason": "error"
+                "reason": "insufficient_data"
             }
 
+        result = self._evaluate_response_timing(
+            sample_size=stats.sample_size,
+            avg_time=stats.mean,
+            std_dev=stats.stdev,
+            min_time=stats.min,
+            max_time=stats.max,
+        )
+        result["histogram"] = stats.histogram
+        result["total_samples"] = stats.total_samples
+        return result
+
+    def _evaluate_response_timing(
+        self,
+        sample_size: int,
+        avg_time: float,
+        std_dev: float,
+        min_time: int,
+        max_time: int,
+    ) -> dict:
+        """응답 시간 요약 통계로 봇 의심 조건 판정."""
+        is_suspicious = False
+        reasons = []
+
+        # 봇 의심 조건 (settings 기반)
+        if std_dev < settings.bot_std_dev_threshold and sample_size >= 15:
+            is_suspicious = True
+            reasons.append("very_consistent_timing")
+
+        if min_time < settings.bot_min_response_time_ms:
+            is_suspicious = True
+            reasons.append("superhuman_reaction")
+
+        if (max_time - min_time) < settings.bot_time_range_threshold and sample_size >= 15:
+            is_suspicious = True
+            reasons.append("narrow_time_range")
+
+        return {
+            "sample_size": sample_size,
+            "avg_response_time_ms": round(avg_time, 2),
+            "std_dev_ms": round(std_dev, 2),
+            "min_time_ms": min_time,
+            "max_time_ms": max_time,
+            "is_suspicious": is_suspicious,
+            "reasons": reasons
+        }
+
     async def analyze_realtime_action_patterns(
         self,
         action_counts: dict[str, int],
@@ -484,6 +529,34 @@ class BotDetector:
         if action_counts:
             action_analysis = await self.analyze_realtime_action_patterns(action_counts)
 
+        return self._score_realtime(user_id, response_analysis, action_analysis)
+
+    async def run_streaming_bot_detection(
+        self,
+        user_id: str,
+        stats: "RollingTimingStats",
+    ) -> dict:
+        """
+        롤링 윈도우 통계 기반 실시간 봇 탐지 (O(1))
+
+        Args:
+            user_id: 대상 사용자 ID
+            stats: 사용자별 RollingTimingStats
+
+        Returns:
+            run_realtime_bot_detection과 동일한 형식의 종합 탐지 결과
+        """
+        response_analysis = self.analyze_timing_stats(stats)
+        action_analysis = await self.analyze_realtime_action_patterns(stats.action_counts())
+        return self._score_realtime(user_id, response_analysis, action_analysis)
+
+    def _score_realtime(
+        self,
+        user_id: str,
+        response_analysis: dict,
+        action_analysis: dict,
+    ) -> dict:
+        """실시간 분석 결과 종합 점수 계산."""
         # 종합 점수 계산
         suspicion_score = 0
         all_reasons = []
@@ -7,6 +7,10 @@ Provides comprehensive statistics including:
 - Trend detection
 
 Used by the admin dashboard for crypto monitoring.
+
+Daily/hourly/top-user/trend views read the hourly rollup
+(crypto_flow_hourly) maintained by StatsRollupService, plus a live
+aggregate of rows newer than the rollup watermark.
 """
 
 import logging
@@ -15,7 +19,7 @@ from decimal import Decimal
 from typing import Optional, List
 from dataclasses import dataclass
 
-from sqlalchemy import select, func, and_, text, extract
+from sqlalchemy import select, func, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.crypto import (
@@ -24,6 +28,12 @@ from app.models.crypto import (
     TransactionStatus,
     ExchangeRateHistory,
 )
+from app.services.stats_rollup import (
+    FlowTotals,
+    crypto_flow_by_hour,
+    hour_floor,
+    crypto_flow_by_user,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -237,74 +247,29 @@ class CryptoStatsService:
         """
         start_date = datetime.now(timezone.utc) - timedelta(days=days)
 
-        # 일별 입금 집계 (PostgreSQL DATE_TRUNC 사용)
-        deposit_query = text("""
-            SELECT
-                DATE_TRUNC('day', credited_at)::date as date,
-                COUNT(*) as count,
-                COALESCE(SUM(amount_usdt), 0) as amount_usdt,
-                COALESCE(SUM(amount_krw), 0) as amount_krw
-            FROM crypto_deposits
-            WHERE status = 'completed' AND credited_at >= :start_date
-            GROUP BY DATE_TRUNC('day', credited_at)::date
-            ORDER BY date
-        """)
-
-        deposit_result = await self.db.execute(
-            deposit_query, {"start_date": start_date}
-        )
-        deposit_rows = {
-            str(row[0]): {
-                "count": row[1],
-                "amount_usdt": float(row[2]),
-                "amount_krw": int(row[3]),
-            }
-            for row in deposit_result
-        }
-
-        # 일별 출금 집계
-        withdrawal_query = text("""
-            SELECT
-                DATE_TRUNC('day', processed_at)::date as date,
-                COUNT(*) as count,
-                COALESCE(SUM(amount_usdt), 0) as amount_usdt,
-                COALESCE(SUM(amount_krw), 0) as amount_krw
-            FROM crypto_withdrawals
-            WHERE status = 'completed' AND processed_at >= :start_date
-            GROUP BY DATE_TRUNC('day', processed_at)::date
-            ORDER BY date
-        """)
-
-        withdrawal_result = await self.db.execute(
-            withdrawal_query, {"start_date": start_date}
-        )
-        withdrawal_rows = {
-            str(row[0]): {
-                "count": row[1],
-                "amount_usdt": float(row[2]),
-                "amount_krw": int(row[3]),
-            }
-            for row in withdrawal_result
-        }
+        # 시간 버킷 롤업 → 일별 합산
+        by_day: dict[str, FlowTotals] = {}
+        for bucket, flow in (await crypto_flow_by_hour(self.db, start_date)).items():
+            by_day.setdefault(bucket.date().isoformat(), FlowTotals()).add(flow)
 
-        # 날짜별 통합
-        all_dates = set(deposit_rows.keys()) | set(withdrawal_rows.keys())
         result = []
-
-        for date_str in sorted(all_dates):
-            dep = deposit_rows.get(date_str, {"count": 0, "amount_usdt": 0.0, "amount_krw": 0})
-            wit = withdrawal_rows.get(date_str, {"count": 0, "amount_usdt": 0.0, "amount_krw": 0})
+        for date_str in sorted(by_day):
+            flow = by_day[date_str]
+            deposit_usdt = float(flow.deposit_amount_usdt)
+            withdrawal_usdt = float(flow.withdrawal_amount_usdt)
+            deposit_krw = int(flow.deposit_amount_krw)
+            withdrawal_krw = int(flow.withdrawal_amount_krw)
 
             result.append({
                 "date": date_str,
-                "deposit_count": dep["count"],
-                "deposit_amount_usdt": dep["amount_usdt"],
-                "deposit_amount_krw": dep["amount_krw"],
-                "withdrawal_count": wit["count"],
-                "withdrawal_amount_usdt": wit["amount_usdt"],
-                "withdrawal_amount_krw": wit["amount_krw"],
-                "net_flow_usdt": dep["amount_usdt"] - wit["amount_usdt"],
-                "net_flow_krw": dep["amount_krw"] - wit["amount_krw"],
+                "deposit_count": flow.deposit_count,
+                "deposit_amount_usdt": deposit_usdt,
+                "deposit_amount_krw": deposit_krw,
+                "withdrawal_count": flow.withdrawal_count,
+                "withdrawal_amount_usdt": withdrawal_usdt,
+                "withdrawal_amount_krw": withdrawal_krw,
+                "net_flow_usdt": deposit_usdt - withdrawal_usdt,
+                "net_flow_krw": deposit_krw - withdrawal_krw,
             })
 
         return result
@@ -317,6 +282,7 @@ class CryptoStatsService:
         """시간대별 패턴 분석.
 
         지난 N일간의 데이터를 시간대별로 집계합니다.
+        롤업 버킷은 완료 시각(credited_at / processed_at) 기준입니다.
 
         Args:
             days: 분석 기간 (일)
@@ -326,57 +292,22 @@ class CryptoStatsService:
         """
         start_date = datetime.now(timezone.utc) - timedelta(days=days)
 
-        # 입금 시간대별 집계
-        deposit_query = text("""
-            SELECT
-                EXTRACT(HOUR FROM detected_at) as hour,
-                COUNT(*) as count,
-                COALESCE(SUM(amount_usdt), 0) as amount_usdt
-            FROM crypto_deposits
-            WHERE status = 'completed' AND detected_at >= :start_date
-            GROUP BY EXTRACT(HOUR FROM detected_at)
-        """)
-
-        deposit_result = await self.db.execute(
-            deposit_query, {"start_date": start_date}
-        )
-        deposit_by_hour = {
-            int(row[0]): {"count": row[1], "amount_usdt": float(row[2])}
-            for row in deposit_result
-        }
+        by_hour = [FlowTotals() for _ in range(24)]
+        for bucket, flow in (await crypto_flow_by_hour(self.db, start_date)).items():
+            by_hour[bucket.hour].add(flow)
 
-        # 출금 시간대별 집계
-        withdrawal_query = text("""
-            SELECT
-                EXTRACT(HOUR FROM requested_at) as hour,
-                COUNT(*) as count,
-                COALESCE(SUM(amount_usdt), 0) as amount_usdt
-            FROM crypto_withdrawals
-            WHERE status = 'completed' AND requested_at >= :start_date
-            GROUP BY EXTRACT(HOUR FROM requested_at)
-        """)
-
-        withdrawal_result = await self.db.execute(
-            withdrawal_query, {"start_date": start_date}
-        )
-        withdrawal_by_hour = {
-            int(row[0]): {"count": row[1], "amount_usdt": float(row[2])}
-            for row in withdrawal_result
-        }
-
-        # 0-23시 통합
         result = []
-        for hour in range(24):
-            dep = deposit_by_hour.get(hour, {"count": 0, "amount_usdt": 0.0})
-            wit = withdrawal_by_hour.get(hour, {"count": 0, "amount_usdt": 0.0})
+        for hour, flow in enumerate(by_hour):
+            deposit_usdt = float(flow.deposit_amount_usdt)
+            withdrawal_usdt = float(flow.withdrawal_amount_usdt)
 
             result.append({
                 "hour": hour,
-                "deposit_count": dep["count"],
-                "deposit_amount_usdt": dep["amount_usdt"],
-                "withdrawal_count": wit["count"],
-                "withdrawal_amount_usdt": wit["amount_usdt"],
-                "total_volume_usdt": dep["amount_usdt"] + wit["amount_usdt"],
+                "deposit_count": flow.deposit_count,
+                "deposit_amount_usdt": deposit_usdt,
+                "withdrawal_count": flow.withdrawal_count,
+                "withdrawal_amount_usdt": withdrawal_usdt,
+                "total_volume_usdt": deposit_usdt + withdrawal_usdt,
             })
 
         return result
@@ -397,61 +328,19 @@ class CryptoStatsService:
         """
         start_date = datetime.now(timezone.utc) - timedelta(days=days)
 
-        # 사용자별 입금 집계
-        deposit_query = text("""
-            SELECT
-                user_id,
-                COUNT(*) as count,
-                COALESCE(SUM(amount_usdt), 0) as amount_usdt
-            FROM crypto_deposits
-            WHERE status = 'completed' AND credited_at >= :start_date
-            GROUP BY user_id
-        """)
-
-        deposit_result = await self.db.execute(
-            deposit_query, {"start_date": start_date}
-        )
-        deposit_by_user = {
-            row[0]: {"count": row[1], "amount_usdt": float(row[2])}
-            for row in deposit_result
-        }
-
-        # 사용자별 출금 집계
-        withdrawal_query = text("""
-            SELECT
-                user_id,
-                COUNT(*) as count,
-                COALESCE(SUM(amount_usdt), 0) as amount_usdt
-            FROM crypto_withdrawals
-            WHERE status = 'completed' AND processed_at >= :start_date
-            GROUP BY user_id
-        """)
-
-        withdrawal_result = await self.db.execute(
-            withdrawal_query, {"start_date": start_date}
-        )
-        withdrawal_by_user = {
-            row[0]: {"count": row[1], "amount_usdt": float(row[2])}
-            for row in withdrawal_result
-        }
-
-        # 사용자별 통합 및 정렬
-        all_users = set(deposit_by_user.keys()) | set(withdrawal_by_user.keys())
         user_stats = []
+        for user_id, flow in (await crypto_flow_by_user(self.db, start_date)).items():
+            deposit_usdt = float(flow.deposit_amount_usdt)
+            withdrawal_usdt = float(flow.withdrawal_amount_usdt)
 
-        for user_id in all_users:
-            dep = deposit_by_user.get(user_id, {"count": 0, "amount_usdt": 0.0})
-            wit = withdrawal_by_user.get(user_id, {"count": 0, "amount_usdt": 0.0})
-
-            total_volume = dep["amount_usdt"] + wit["amount_usdt"]
             user_stats.append({
                 "user_id": user_id,
-                "deposit_count": dep["count"],
-                "deposit_amount_usdt": dep["amount_usdt"],
-                "withdrawal_count": wit["count"],
-                "withdrawal_amount_usdt": wit["amount_usdt"],
-                "total_volume_usdt": total_volume,
-                "net_flow_usdt": dep["amount_usdt"] - wit["amount_usdt"],
+                "deposit_count": flow.deposit_count,
+                "deposit_amount_usdt": deposit_usdt,
+                "withdrawal_count": flow.withdrawal_count,
+                "withdrawal_amount_usdt": withdrawal_usdt,
+                "total_volume_usdt": deposit_usdt + withdrawal_usdt,
+                "net_flow_usdt": deposit_usdt - withdrawal_usdt,
             })
 
         # 볼륨 기준 정렬
@@ -512,47 +401,29 @@ class CryptoStatsService:
             dict with trend indicators
         """
         now = datetime.now(timezone.utc)
-        current_start = now - timedelta(days=days)
+        current_start = hour_floor(now - timedelta(days=days))
         previous_start = now - timedelta(days=days * 2)
-        previous_end = current_start
 
-        # 현재 기간 통계
-        current_deposits = await self._get_deposit_stats(current_start)
-        current_withdrawals = await self._get_withdrawal_stats(current_start)
+        # 두 기간을 한 번의 롤업 조회로 분리 집계
+        current, previous = FlowTotals(), FlowTotals()
+        for bucket, flow in (await crypto_flow_by_hour(self.db, previous_start, now)).items():
+            (current if bucket >= current_start else previous).add(flow)
 
-        # 이전 기간 통계 (임시로 start_date 변경)
-        deposit_query = select(
-            func.count(),
-            func.coalesce(func.sum(CryptoDeposit.amount_usdt), 0),
-        ).where(
-            and_(
-                CryptoDeposit.status == TransactionStatus.COMPLETED,
-                CryptoDeposit.credited_at >= previous_start,
-                CryptoDeposit.credited_at < previous_end,
-            )
-        )
-        result = await self.db.execute(deposit_query)
-        row = result.one()
+        current_deposits = {
+            "count": current.deposit_count,
+            "amount_usdt": float(current.deposit_amount_usdt),
+        }
+        current_withdrawals = {
+            "count": current.withdrawal_count,
+            "amount_usdt": float(current.withdrawal_amount_usdt),
+        }
         previous_deposits = {
-            "count": row[0] or 0,
-            "amount_usdt": float(row[1]) if row[1] else 0.0,
+            "count": previous.deposit_count,
+            "amount_usdt": float(previous.deposit_amount_usdt),
         }
-
-        withdrawal_query = select(
-            func.count(),
-            func.coalesce(func.sum(CryptoWithdrawal.amount_usdt), 0),
-        ).where(
-            and_(
-                CryptoWithdrawal.status == TransactionStatus.COMPLETED,
-                CryptoWithdrawal.processed_at >= previous_start,
-                CryptoWithdrawal.processed_at < previous_end,
-            )
-        )
-        result = await self.db.execute(withdrawal_query)
-        row = result.one()
         previous_withdrawals = {
-            "count": row[0] or 0,
-            "amount_usdt": float(row[1]) if row[1] else 0.0,
+            "count": previous.withdrawal_count,
+            "amount_usdt": float(previous.withdrawal_amount_usdt),
         }
 
         # 변화율 계산
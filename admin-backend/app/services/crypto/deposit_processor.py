@@ -22,6 +22,7 @@ from tenacity import (
 )
 
 from app.config import get_settings
+from app.utils.http_client import create_client
 from app.models.deposit_request import DepositRequest, DepositRequestStatus
 from app.models.audit_log import AuditLog
 
@@ -79,7 +80,7 @@ class DepositProcessor:
     async def _get_http_client(self) -> httpx.AsyncClient:
         """Get or create HTTP client."""
         if self._http_client is None or self._http_client.is_closed:
-            self._http_client = httpx.AsyncClient(
+            self._http_client = create_client(
                 timeout=30.0,
                 headers={"X-API-Key": self.main_api_key},
             )
@@ -26,12 +26,17 @@ from tenacity import (
 )
 
 from app.config import get_settings
+from app.utils.http_client import create_client
+from app.utils.pagination import Keyset, capped_count_query, page_offset, page_response
 from app.models.crypto import CryptoDeposit, TransactionStatus
 from app.models.audit_log import AuditLog
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# 목록 정렬 (최신순, id 타이브레이커)
+DEPOSITS_KEYSET = Keyset((CryptoDeposit.detected_at, CryptoDeposit.id))
+
 
 # ============================================================
 # Custom Exceptions
@@ -97,7 +102,7 @@ class DepositService:
     async def _get_http_client(self) -> httpx.AsyncClient:
         """Get or create HTTP client."""
         if self._http_client is None or self._http_client.is_closed:
-            self._http_client = httpx.AsyncClient(
+            self._http_client = create_client(
                 timeout=30.0,
                 headers={"X-API-Key": self.main_api_key},
             )
@@ -118,6 +123,7 @@ class DepositService:
         user_id: Optional[str] = None,
         page: int = 1,
         limit: int = 20,
+        cursor: Optional[str] = None,
     ) -> dict:
         """List deposit records with pagination and filters.
 
@@ -126,12 +132,15 @@ class DepositService:
             user_id: Filter by user ID
             page: Page number (1-indexed)
             limit: Items per page
+            cursor: next_cursor from the previous page (keyset, no OFFSET)
 
         Returns:
-            dict: {items, total, page, page_size, total_pages}
-        """
-        offset = (page - 1) * limit
+            dict: {items, total, page, page_size, total_pages,
+                   next_cursor, total_is_estimate}
 
+        Raises:
+            InvalidCursorError: cursor is malformed or from another sort
+        """
         # Build query conditions
         conditions = []
         if status:
@@ -139,37 +148,31 @@ class DepositService:
         if user_id:
             conditions.append(CryptoDeposit.user_id == user_id)
 
-        # Count query
-        count_query = select(func.count()).select_from(CryptoDeposit)
+        base_query = select(CryptoDeposit)
         if conditions:
-            count_query = count_query.where(and_(*conditions))
+            base_query = base_query.where(and_(*conditions))
+
+        # Count query (capped; estimated beyond COUNT_CAP)
+        count_query = capped_count_query(
+            base_query, estimate_table=None if conditions else "crypto_deposits"
+        )
+        list_query = (
+            DEPOSITS_KEYSET.apply(base_query, cursor)
+            .offset(page_offset(page, limit, cursor))
+            .limit(limit + 1)
+        )
 
         total_result = await self.db.execute(count_query)
         total = total_result.scalar() or 0
 
         # List query
-        list_query = (
-            select(CryptoDeposit)
-            .order_by(CryptoDeposit.detected_at.desc())
-            .offset(offset)
-            .limit(limit)
-        )
-        if conditions:
-            list_query = list_query.where(and_(*conditions))
-
         result = await self.db.execute(list_query)
-        deposits = result.scalars().all()
+        deposits, next_cursor = DEPOSITS_KEYSET.page_rows(
+            result.scalars().all(), limit, lambda r: (r.detected_at, r.id)
+        )
 
         items = [self._deposit_to_dict(d) for d in deposits]
-        total_pages = (total + limit - 1) // limit if total > 0 else 1
-
-        return {
-            "items": items,
-            "total": total,
-            "page": page,
-            "page_size": limit,
-            "total_pages": total_pages,
-        }
+        return page_response(items, total, page, limit, next_cursor)
 
     async def get_deposit_detail(self, deposit_id: UUID) -> Optional[dict]:
         """Get detailed information about a specific deposit.
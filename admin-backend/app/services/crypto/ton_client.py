@@ -13,6 +13,7 @@ from datetime import datetime
 import httpx
 
 from app.config import get_settings
+from app.utils.http_client import create_client
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -190,7 +191,7 @@ class TonClient:
             headers = {}
             if self.api_key:
                 headers["X-API-Key"] = self.api_key
-            self._http_client = httpx.AsyncClient(
+            self._http_client = create_client(
                 timeout=30.0,
                 headers=headers,
             )
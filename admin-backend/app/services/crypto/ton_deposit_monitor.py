@@ -2,13 +2,21 @@
 
 Polls the TON blockchain for incoming USDT transfers and matches
 them against pending deposit requests using memo matching.
+
+Each poll is processed as a batch:
+- transfers are pre-filtered against an in-memory index of pending memos
+  (refreshed incrementally by created_at watermark), so most unrelated
+  transfers never touch the DB
+- remaining memos are resolved with a single ``WHERE memo IN (...)`` query
+- all matched deposits are confirmed in one transaction
 """
 
 import asyncio
 import logging
+import time
 from decimal import Decimal
-from datetime import datetime, timezone
-from typing import Optional, Callable, Awaitable
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Callable, Awaitable, List
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -31,6 +39,12 @@ class TonDepositMonitor:
     # Default threshold for consecutive errors before alerting
     DEFAULT_CONSECUTIVE_ERROR_THRESHOLD = 5
     
+    # Pending memo index: incremental refresh re-reads this much before the
+    # watermark so requests committed late (clock skew, slow transactions)
+    # are not missed. A full rebuild drops requests cancelled elsewhere.
+    INDEX_REFRESH_OVERLAP = timedelta(minutes=2)
+    INDEX_FULL_REBUILD_SECONDS = 300
+    
     def __init__(
         self,
         db_session_factory: Callable[[], AsyncSession],
@@ -63,6 +77,11 @@ class TonDepositMonitor:
         self._on_deposit_confirmed: Optional[Callable[[DepositRequest, str], Awaitable[None]]] = None
         self._on_deposit_expired: Optional[Callable[[DepositRequest], Awaitable[None]]] = None
         self._on_polling_error_alert: Optional[Callable[[int, str], Awaitable[None]]] = None
+        
+        # In-memory index of pending deposit memos
+        self._pending_memos: set[str] = set()
+        self._index_watermark: Optional[datetime] = None  # Max created_at seen
+        self._index_rebuilt_at: Optional[float] = None  # monotonic
     
     def set_callbacks(
         self,
@@ -165,67 +184,162 @@ class TonDepositMonitor:
             if not transfers:
                 return
             
-            # Update last processed LT
+            await self._process_transfers(transfers)
+            
+            # Advance only after the batch is committed: a failed commit
+            # leaves the cursor so the same transfers are fetched again
             max_lt = max(t.lt for t in transfers)
             if self._last_lt is None or max_lt > self._last_lt:
                 self._last_lt = max_lt
-            
-            # Process each transfer
-            for transfer in transfers:
-                await self._process_transfer(transfer)
                 
         except Exception as e:
             logger.error(f"Error checking new deposits: {e}")
     
-    async def _process_transfer(self, transfer: JettonTransfer):
-        """Process a single transfer and try to match it.
+    async def _process_transfers(self, transfers: List[JettonTransfer]) -> int:
+        """Match a poll's transfers against pending requests as one batch.
+        
+        Transfers whose memo is not in the pending index are rejected without
+        a DB query. The rest are resolved with one IN query and every matched
+        deposit is confirmed in a single transaction. Callbacks run after the
+        commit succeeds.
         
         Args:
-            transfer: The Jetton transfer to process
+            transfers: Transfers returned by one poll
+            
+        Returns:
+            int: Number of confirmed deposits
         """
-        if not transfer.memo:
-            logger.debug(f"Transfer {transfer.tx_hash} has no memo, skipping")
-            return
+        with_memo = [t for t in transfers if t.memo]
+        if not with_memo:
+            return 0
         
         async with self.db_session_factory() as db:
-            # Find matching deposit request by memo
-            request = await self._find_request_by_memo(db, transfer.memo)
+            # Refresh after fetching transfers: a memo must exist before it
+            # can be paid, so this covers every transfer in the batch.
+            await self._refresh_pending_index(db)
             
-            if not request:
-                logger.debug(f"No matching request for memo: {transfer.memo}")
-                return
+            candidates = [t for t in with_memo if t.memo in self._pending_memos]
+            if not candidates:
+                logger.debug(
+                    f"No pending memo in {len(with_memo)} transfers, skipping DB lookup"
+                )
+                return 0
             
-            # Validate the transfer
-            match_result = self.match_deposit(request, transfer)
+            requests = await self._find_requests_by_memos(
+                db, {t.memo for t in candidates}
+            )
             
-            if match_result["matched"]:
-                await self._confirm_deposit(db, request, transfer)
-            else:
-                logger.warning(
-                    f"Transfer {transfer.tx_hash} did not match request {request.memo}: "
-                    f"{match_result['reason']}"
-                )
+            confirmed: list[tuple[DepositRequest, JettonTransfer]] = []
+            now = datetime.now(timezone.utc)
+            for transfer in candidates:
+                request = requests.get(transfer.memo)
+                if request is None:
+                    # Confirmed/cancelled by another path since indexed
+                    self._pending_memos.discard(transfer.memo)
+                    continue
+                
+                match_result = self.match_deposit(request, transfer)
+                if not match_result["matched"]:
+                    logger.warning(
+                        f"Transfer {transfer.tx_hash} did not match request {request.memo}: "
+                        f"{match_result['reason']}"
+                    )
+                    continue
+                
+                request.status = DepositRequestStatus.CONFIRMED
+                request.tx_hash = transfer.tx_hash
+                request.confirmed_at = now
+                # One request per memo: later transfers in the batch are ignored
+                del requests[transfer.memo]
+                confirmed.append((request, transfer))
+            
+            if not confirmed:
+                return 0
+            
+            await db.commit()
+        
+        for request, transfer in confirmed:
+            self._pending_memos.discard(request.memo)
+            logger.info(
+                f"Deposit confirmed: {request.memo} - "
+                f"{request.requested_krw} KRW ({transfer.amount} USDT) - "
+                f"tx: {transfer.tx_hash}"
+            )
+            if self._on_deposit_confirmed:
+                try:
+                    await self._on_deposit_confirmed(request, transfer.tx_hash)
+                except Exception as e:
+                    logger.error(f"Error in deposit confirmed callback: {e}")
+        
+        return len(confirmed)
     
-    async def _find_request_by_memo(
+    async def _refresh_pending_index(self, db: AsyncSession) -> None:
+        """Bring the pending memo index up to date.
+        
+        Loads only requests created since the watermark (minus an overlap);
+        rebuilds from scratch on first use and every INDEX_FULL_REBUILD_SECONDS.
+        
+        Args:
+            db: Database session
+        """
+        now = time.monotonic()
+        full = (
+            self._index_rebuilt_at is None
+            or now - self._index_rebuilt_at >= self.INDEX_FULL_REBUILD_SECONDS
+        )
+        
+        query = select(DepositRequest.memo, DepositRequest.created_at).where(
+            DepositRequest.status == DepositRequestStatus.PENDING
+        )
+        if not full and self._index_watermark is not None:
+            query = query.where(
+                DepositRequest.created_at
+                >= self._index_watermark - self.INDEX_REFRESH_OVERLAP
+            )
+        
+        result = await db.execute(query)
+        rows = result.all()
+        
+        if full:
+            self._pending_memos = {memo for memo, _ in rows}
+            self._index_rebuilt_at = now
+        else:
+            self._pending_memos.update(memo for memo, _ in rows)
+        
+        for _, created_at in rows:
+            if created_at and (
+                self._index_watermark is None or created_at > self._index_watermark
+            ):
+                self._index_watermark = created_at
+    
+    def invalidate_pending_index(self) -> None:
+        """Force a full index rebuild on the next poll."""
+        self._index_rebuilt_at = None
+    
+    async def _find_requests_by_memos(
         self,
         db: AsyncSession,
-        memo: str,
-    ) -> Optional[DepositRequest]:
-        """Find a pending deposit request by memo.
+        memos: set[str],
+    ) -> dict[str, DepositRequest]:
+        """Find pending deposit requests for several memos in one query.
+        
+        Rows are locked (SKIP LOCKED) so two monitor instances cannot
+        confirm the same request.
         
         Args:
             db: Database session
-            memo: Memo to search for
+            memos: Memos to search for
             
         Returns:
-            DepositRequest or None
+            dict: memo -> DepositRequest
         """
         result = await db.execute(
             select(DepositRequest)
-            .where(DepositRequest.memo == memo)
+            .where(DepositRequest.memo.in_(memos))
             .where(DepositRequest.status == DepositRequestStatus.PENDING)
+            .with_for_update(skip_locked=True)
         )
-        return result.scalar_one_or_none()
+        return {request.memo: request for request in result.scalars().all()}
     
     def match_deposit(
         self,
@@ -267,39 +381,6 @@ class TonDepositMonitor:
         
         return {"matched": True, "reason": "ok"}
     
-    async def _confirm_deposit(
-        self,
-        db: AsyncSession,
-        request: DepositRequest,
-        transfer: JettonTransfer,
-    ):
-        """Confirm a matched deposit.
-        
-        Args:
-            db: Database session
-            request: The deposit request
-            transfer: The matching transfer
-        """
-        request.status = DepositRequestStatus.CONFIRMED
-        request.tx_hash = transfer.tx_hash
-        request.confirmed_at = datetime.now(timezone.utc)
-        
-        await db.commit()
-        await db.refresh(request)
-        
-        logger.info(
-            f"Deposit confirmed: {request.memo} - "
-            f"{request.requested_krw} KRW ({transfer.amount} USDT) - "
-            f"tx: {transfer.tx_hash}"
-        )
-        
-        # Call callback if set
-        if self._on_deposit_confirmed:
-            try:
-                await self._on_deposit_confirmed(request, transfer.tx_hash)
-            except Exception as e:
-                logger.error(f"Error in deposit confirmed callback: {e}")
-    
     async def check_expired_requests(self):
         """Check for and mark expired deposit requests."""
         try:
@@ -314,6 +395,7 @@ class TonDepositMonitor:
                 
                 for request in expired_requests:
                     request.status = DepositRequestStatus.EXPIRED
+                    self._pending_memos.discard(request.memo)
                     
                     logger.info(f"Deposit request expired: {request.memo}")
                     
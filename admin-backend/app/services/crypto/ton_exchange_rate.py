@@ -5,6 +5,10 @@ USDT is pegged to USD, so we use USD/KRW rate as USDT/KRW rate (1:1).
 
 Primary: jsdelivr CDN
 Fallback: Cloudflare Pages
+
+Requests share the process-wide HTTP pool. Rates are also held in an
+in-process stale-while-revalidate cache, so concurrent callers share one
+fetch and an expired rate is served while a refresh runs in the background.
 """
 
 import logging
@@ -15,6 +19,7 @@ from typing import Optional
 import httpx
 
 from app.config import get_settings
+from app.utils.http_client import create_client, rate_cache
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -23,6 +28,9 @@ settings = get_settings()
 PRIMARY_API_URL = "https://cdn.jsdelivr.net/npm/@fawazahmed0/currency-api@latest/v1/currencies/usd.min.json"
 FALLBACK_API_URL = "https://latest.currency-api.pages.dev/v1/currencies/usd.min.json"
 
+# 캐시 만료 후에도 백그라운드 갱신 동안 이전 환율을 제공하는 시간 (초)
+RATE_STALE_SECONDS = 600
+
 
 class TonExchangeRateService:
     """Service for fetching and caching USDT/KRW exchange rates.
@@ -62,7 +70,7 @@ class TonExchangeRateService:
     async def _get_http_client(self) -> httpx.AsyncClient:
         """Get or create HTTP client."""
         if self._http_client is None or self._http_client.is_closed:
-            self._http_client = httpx.AsyncClient(timeout=10.0)
+            self._http_client = create_client(timeout=10.0)
         return self._http_client
 
     async def close(self):
@@ -74,7 +82,8 @@ class TonExchangeRateService:
     async def get_usdt_krw_rate(self) -> Decimal:
         """Get current USDT/KRW exchange rate.
 
-        Tries cache first, then primary API (jsdelivr), then fallback (Cloudflare).
+        Tries the in-process cache, then Redis, then primary API (jsdelivr),
+        then fallback (Cloudflare).
 
         Returns:
             Decimal: Current USDT/KRW rate (e.g., 1474.99)
@@ -82,6 +91,15 @@ class TonExchangeRateService:
         Raises:
             ExchangeRateError: If unable to fetch rate from any source
         """
+        return await rate_cache.get(
+            self.CACHE_KEY,
+            self._load_usdt_krw_rate,
+            ttl=self.cache_ttl,
+            stale_ttl=RATE_STALE_SECONDS,
+        )
+
+    async def _load_usdt_krw_rate(self) -> Decimal:
+        """Load rate from Redis or the rate APIs."""
         # Try cache first
         cached_rate = await self._get_cached_rate()
         if cached_rate is not None:
@@ -25,6 +25,7 @@ from enum import IntEnum
 import httpx
 
 from app.config import get_settings
+from app.utils.http_client import create_client
 from app.services.crypto.kms_service import (
     KeyManagementService,
     get_kms_service,
@@ -89,6 +90,19 @@ class JettonTransferParams:
     response_address: Optional[str] = None  # Where to return excess TON
 
 
+@dataclass(frozen=True)
+class SignedTransfer:
+    """Signed external message ready for broadcast.
+
+    Rebroadcasting the same BOC is idempotent: the wallet accepts a given
+    seqno once, so a retry after a lost response cannot double-send.
+    """
+    seqno: int
+    boc: bytes
+    tx_hash: str  # sha256(boc), used when the API does not return a hash
+    valid_until: int  # unix timestamp, message is rejected after this
+
+
 @dataclass
 class TransactionResult:
     """Result of a transaction operation."""
@@ -365,7 +379,7 @@ class TonSigner:
             headers = {}
             if self.api_key:
                 headers["X-API-Key"] = self.api_key
-            self._http_client = httpx.AsyncClient(
+            self._http_client = create_client(
                 timeout=30.0,
                 headers=headers,
             )
@@ -396,47 +410,15 @@ class TonSigner:
             TransactionResult with tx_hash on success
         """
         try:
-            # Validate parameters
-            if not params.to_address:
-                raise TonSignerBuildError("Recipient address is required")
-
-            if params.amount <= 0:
-                raise TonSignerBuildError("Amount must be positive")
-
-            # Get our Jetton wallet address
-            jetton_wallet = await self._get_jetton_wallet_address(
-                self.wallet_address,
-                jetton_master
-            )
-
-            if not jetton_wallet:
-                raise TonSignerBuildError(
-                    "Failed to get Jetton wallet address. "
-                    "Ensure hot wallet has USDT balance."
-                )
-
             # Check TON balance for gas
-            ton_balance = await self._get_ton_balance()
-            if ton_balance < MIN_TON_FOR_GAS:
-                raise InsufficientGasError(
-                    f"Insufficient TON for gas: {ton_balance / 1e9:.4f} TON, "
-                    f"need {MIN_TON_FOR_GAS / 1e9:.4f} TON"
-                )
+            await self.ensure_gas()
 
-            # Get current seqno
+            # Get current seqno and sign
             seqno = await self._get_seqno()
-
-            # Build transaction
-            body = self._build_jetton_transfer_body(params)
-            external_message = await self._build_external_message(
-                to_address=jetton_wallet,
-                amount=MIN_TON_FOR_GAS,
-                body=body,
-                seqno=seqno,
-            )
+            signed = await self.prepare_jetton_transfer(params, seqno, jetton_master)
 
             # Broadcast transaction
-            result = await self._broadcast_message(external_message)
+            result = await self.broadcast(signed)
 
             if result.success:
                 logger.info(
@@ -454,6 +436,90 @@ class TonSigner:
             logger.error(f"Jetton transfer error: {type(e).__name__}: {e}")
             raise TonSignerError(f"Transfer failed: {e}") from e
 
+    async def prepare_jetton_transfer(
+        self,
+        params: JettonTransferParams,
+        seqno: int,
+        jetton_master: str = USDT_JETTON_MASTER,
+    ) -> SignedTransfer:
+        """Build and sign a Jetton transfer for an explicit seqno.
+
+        Does not broadcast. Callers that send several transfers from the
+        same wallet allocate consecutive seqnos and broadcast in order.
+
+        Args:
+            params: Transfer parameters
+            seqno: Wallet seqno to sign with
+            jetton_master: Jetton master contract address
+
+        Returns:
+            SignedTransfer
+        """
+        if not params.to_address:
+            raise TonSignerBuildError("Recipient address is required")
+
+        if params.amount <= 0:
+            raise TonSignerBuildError("Amount must be positive")
+
+        # Get our Jetton wallet address
+        jetton_wallet = await self._get_jetton_wallet_address(
+            self.wallet_address,
+            jetton_master
+        )
+
+        if not jetton_wallet:
+            raise TonSignerBuildError(
+                "Failed to get Jetton wallet address. "
+                "Ensure hot wallet has USDT balance."
+            )
+
+        body = self._build_jetton_transfer_body(params)
+        valid_until = int(datetime.now(timezone.utc).timestamp()) + 1800
+        boc = await self._build_external_message(
+            to_address=jetton_wallet,
+            amount=MIN_TON_FOR_GAS,
+            body=body,
+            seqno=seqno,
+            valid_until=valid_until,
+        )
+
+        return SignedTransfer(
+            seqno=seqno,
+            boc=boc,
+            tx_hash=hashlib.sha256(boc).hexdigest(),
+            valid_until=valid_until,
+        )
+
+    async def broadcast(self, signed: SignedTransfer) -> TransactionResult:
+        """Broadcast a signed transfer."""
+        return await self._broadcast_message(signed.boc)
+
+    async def ensure_gas(self, transfers: int = 1) -> None:
+        """Raise InsufficientGasError unless the wallet can pay for N transfers."""
+        required = MIN_TON_FOR_GAS * transfers
+        ton_balance = await self._get_ton_balance()
+        if ton_balance < required:
+            raise InsufficientGasError(
+                f"Insufficient TON for gas: {ton_balance / 1e9:.4f} TON, "
+                f"need {required / 1e9:.4f} TON"
+            )
+
+    async def get_seqno(self, refresh: bool = False) -> int:
+        """Get current wallet seqno.
+
+        Unlike the internal lookup this never falls back to 0: callers
+        compare it with stored seqnos to decide whether a message landed.
+
+        Args:
+            refresh: Bypass the 10 second cache
+
+        Raises:
+            TonSignerError: seqno could not be read
+        """
+        if refresh:
+            self._seqno_cache.pop(self.wallet_address, None)
+        return await self._get_seqno(strict=True)
+
     async def get_balance(self, address: Optional[str] = None) -> Decimal:
         """Get USDT balance of an address.
 
@@ -576,6 +642,7 @@ class TonSigner:
         amount: int,
         body: CellBuilder,
         seqno: int,
+        valid_until: Optional[int] = None,
     ) -> bytes:
         """Build and sign external message.
 
@@ -598,7 +665,8 @@ class TonSigner:
         signing_cell.store_uint(698983191, 32)
 
         # Valid until (30 minutes from now)
-        valid_until = int(datetime.now(timezone.utc).timestamp()) + 1800
+        if valid_until is None:
+            valid_until = int(datetime.now(timezone.utc).timestamp()) + 1800
         signing_cell.store_uint(valid_until, 32)
 
         # Seqno
@@ -748,11 +816,14 @@ class TonSigner:
                 message=f"Broadcast error: {e}",
             )
 
-    async def _get_seqno(self) -> int:
+    async def _get_seqno(self, strict: bool = False) -> int:
         """Get current wallet seqno (sequence number).
 
         Seqno is incremented with each outgoing transaction.
         Cached for 10 seconds to reduce API calls.
+
+        Args:
+            strict: Raise TonSignerError instead of returning 0 on failure
         """
         cache_key = self.wallet_address
         now = datetime.now(timezone.utc)
@@ -785,12 +856,19 @@ class TonSigner:
                         self._seqno_cache[cache_key] = (seqno, now)
                         return seqno
 
+            if strict:
+                raise TonSignerError("Could not get seqno")
+
             # Default to 0 if cannot get seqno
             logger.warning(f"Could not get seqno, using 0")
             return 0
 
+        except TonSignerError:
+            raise
         except Exception as e:
             logger.error(f"Failed to get seqno: {e}")
+            if strict:
+                raise TonSignerError(f"Failed to get seqno: {e}") from e
             return 0
 
     async def _get_ton_balance(self) -> int:
@@ -865,3 +943,4 @@ def get_ton_signer(kms: Optional[KeyManagementService] = None) -> TonSigner:
         TonSigner instance
     """
     return TonSigner(kms=kms)
+
@@ -6,15 +6,34 @@ Processes approved withdrawals by:
 3. Recording transaction hashes
 4. Handling retries on failure
 
+Pipeline:
+- Transfers are signed concurrently (bounded by withdrawal_sign_concurrency)
+- Broadcasts go out in seqno order per hot wallet, rate limited
+  by withdrawal_broadcast_rps
+- The next message is broadcast only after the wallet seqno has moved past
+  the previous one (TON rejects seqno+1 until seqno is included); a sent
+  but unconfirmed message stays in the lane until then
+- A failed broadcast stops the lane; later withdrawals wait for the next batch.
+  A seqno mismatch is not the withdrawal's fault and is not counted as a retry
+
 Security Notes:
 - Only processes PROCESSING status withdrawals (admin-approved)
 - Uses KMS for transaction signing (no key exposure)
 - All operations are logged for audit trail
-- Automatic retry with exponential backoff
+- The signed message (seqno + BOC) is committed on the withdrawal row
+  before it is broadcast, and each send is committed on its own
+- The executor is the only sender on the hot wallet: once the wallet
+  seqno is past a stored message's seqno, that message has landed.
+  Otherwise the same BOC is rebroadcast until it expires, so neither a
+  lost response nor a crash can cause a double payout
 """
 
 import asyncio
+import base64
+import hashlib
 import logging
+import time
+from dataclasses import asdict, dataclass
 from datetime import datetime, timezone, timedelta
 from decimal import Decimal
 from typing import Optional, List
@@ -29,6 +48,8 @@ from app.models.audit_log import AuditLog
 from app.services.crypto.ton_signer import (
     TonSigner,
     JettonTransferParams,
+    SignedTransfer,
+    TransactionResult,
     TonSignerError,
     InsufficientGasError,
     get_ton_signer,
@@ -53,6 +74,88 @@ class WithdrawalExecutionFailed(WithdrawalExecutorError):
     pass
 
 
+# ============================================================
+# Pipeline State
+# ============================================================
+
+@dataclass
+class WithdrawalPipelineMetrics:
+    """Throughput and queue age of the withdrawal pipeline."""
+    batches: int = 0
+    sent_total: int = 0
+    failed_total: int = 0
+    retry_total: int = 0
+    deferred_total: int = 0
+    last_batch_size: int = 0
+    last_batch_sent: int = 0
+    last_batch_seconds: float = 0.0
+    last_throughput_per_sec: float = 0.0
+    oldest_queue_age_seconds: float = 0.0  # oldest pending at batch start
+    avg_send_age_seconds: float = 0.0  # approved_at -> broadcast, last batch
+
+    def to_dict(self) -> dict:
+        return {
+            key: round(value, 3) if isinstance(value, float) else value
+            for key, value in asdict(self).items()
+        }
+
+
+@dataclass
+class _WithdrawalJob:
+    """One withdrawal moving through the pipeline."""
+    withdrawal: CryptoWithdrawal
+    withdrawal_id: str
+    retry_count: int
+    outcome: str = "deferred"  # sent | failed | retry | deferred
+    signed: Optional[SignedTransfer] = None  # stored signature being rebroadcast
+    tx_hash: Optional[str] = None
+    error: Optional[str] = None
+
+
+def _queue_age(withdrawal: CryptoWithdrawal, now: datetime) -> float:
+    """Seconds since admin approval."""
+    approved_at = withdrawal.approved_at or withdrawal.requested_at
+    if approved_at is None:
+        return 0.0
+    if approved_at.tzinfo is None:
+        approved_at = approved_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (now - approved_at).total_seconds())
+
+
+def _stored_transfer(withdrawal: CryptoWithdrawal) -> Optional[SignedTransfer]:
+    """Signed message stored on the withdrawal row, if any."""
+    if not withdrawal.signed_boc or withdrawal.signed_seqno is None:
+        return None
+    boc = base64.b64decode(withdrawal.signed_boc)
+    valid_until = withdrawal.signed_valid_until
+    if valid_until is not None and valid_until.tzinfo is None:
+        valid_until = valid_until.replace(tzinfo=timezone.utc)
+    return SignedTransfer(
+        seqno=withdrawal.signed_seqno,
+        boc=boc,
+        tx_hash=hashlib.sha256(boc).hexdigest(),
+        valid_until=int(valid_until.timestamp()) if valid_until else 0,
+    )
+
+
+def _clear_landed(withdrawal: CryptoWithdrawal) -> None:
+    """Drop the signed message once its seqno has landed (seqno kept for audit)."""
+    withdrawal.signed_boc = None
+    withdrawal.signed_valid_until = None
+
+
+def _store_transfer(withdrawal: CryptoWithdrawal, signed: Optional[SignedTransfer]) -> None:
+    """Store (or clear) the signed message on the withdrawal row."""
+    if signed is None:
+        withdrawal.signed_seqno = None
+        withdrawal.signed_boc = None
+        withdrawal.signed_valid_until = None
+        return
+    withdrawal.signed_seqno = signed.seqno
+    withdrawal.signed_boc = base64.b64encode(signed.boc).decode()
+    withdrawal.signed_valid_until = datetime.fromtimestamp(signed.valid_until, timezone.utc)
+
+
 # ============================================================
 # Withdrawal Executor Service
 # ============================================================
@@ -71,6 +174,9 @@ class WithdrawalExecutor:
     - withdrawal_auto_enabled: Enable/disable auto execution
     - withdrawal_auto_threshold_usdt: Max amount for auto processing
     - withdrawal_max_retry: Maximum retry attempts
+    - withdrawal_batch_size: Withdrawals fetched per batch
+    - withdrawal_sign_concurrency: Concurrent KMS signing requests
+    - withdrawal_broadcast_rps: Max broadcasts per second
     """
 
     def __init__(
@@ -91,6 +197,10 @@ class WithdrawalExecutor:
         self._signer = signer or get_ton_signer(self._kms)
         self._running = False
         self._retry_counts: dict[str, int] = {}  # withdrawal_id -> retry count
+        # One lane per hot wallet: seqno allocation must not interleave
+        self._lane_lock = asyncio.Lock()
+        self._last_broadcast = 0.0
+        self.metrics = WithdrawalPipelineMetrics()
 
         logger.info(
             f"WithdrawalExecutor initialized, "
@@ -130,7 +240,12 @@ class WithdrawalExecutor:
             except Exception as e:
                 logger.error(f"Error in withdrawal processing loop: {e}")
 
-            # Wait before next iteration
+            # Drain a backlog without waiting; otherwise wait before next batch
+            if (
+                self.metrics.last_batch_size >= settings.withdrawal_batch_size
+                and self.metrics.last_batch_sent > 0
+            ):
+                continue
             await asyncio.sleep(10)  # 10 seconds between batches
 
     async def stop(self) -> None:
@@ -143,29 +258,31 @@ class WithdrawalExecutor:
     # ============================================================
 
     async def process_pending_withdrawals(self) -> List[CryptoWithdrawal]:
-        """Process all pending (PROCESSING status) withdrawals.
+        """Process one batch of pending (PROCESSING status) withdrawals.
 
         Returns:
-            List of processed withdrawals
+            List of withdrawals sent in this batch
         """
         async with self.session_factory() as session:
             # Get PROCESSING withdrawals without TX hash
-            withdrawals = await self._get_pending_withdrawals(session)
+            withdrawals = await self._get_pending_withdrawals(
+                session, limit=settings.withdrawal_batch_size
+            )
 
             if not withdrawals:
+                self.metrics.last_batch_size = 0
+                self.metrics.last_batch_sent = 0
+                self.metrics.oldest_queue_age_seconds = 0.0
                 return []
 
-            processed = []
-            for withdrawal in withdrawals:
-                try:
-                    result = await self._execute_withdrawal(session, withdrawal)
-                    if result:
-                        processed.append(withdrawal)
-                except Exception as e:
-                    logger.error(
-                        f"Failed to process withdrawal {withdrawal.id}: {e}"
-                    )
+            started = time.monotonic()
+            now = datetime.now(timezone.utc)
+            self.metrics.oldest_queue_age_seconds = _queue_age(withdrawals[0], now)
 
+            jobs = [self._new_job(withdrawal) for withdrawal in withdrawals]
+            processed = await self._run_pipeline(session, jobs)
+
+            self._record_batch(jobs, time.monotonic() - started)
             return processed
 
     async def execute_single(
@@ -175,7 +292,8 @@ class WithdrawalExecutor:
     ) -> bool:
         """Execute a single withdrawal by ID.
 
-        Called when admin triggers manual execution.
+        Called when admin triggers manual execution. Goes through the same
+        wallet lane as batch processing so seqnos never collide.
 
         Args:
             withdrawal_id: Withdrawal UUID
@@ -206,132 +324,367 @@ class WithdrawalExecutor:
                     f"Transaction already sent: {withdrawal.tx_hash}"
                 )
 
-            return await self._execute_withdrawal(session, withdrawal, admin_id)
+            # Check threshold for auto-processing
+            if float(withdrawal.amount_usdt) > settings.withdrawal_auto_threshold_usdt:
+                logger.info(
+                    f"Withdrawal {withdrawal.id} exceeds auto threshold "
+                    f"({withdrawal.amount_usdt} > {settings.withdrawal_auto_threshold_usdt}), "
+                    f"requires manual approval"
+                )
+                return False
+
+            job = self._new_job(withdrawal)
+            await self._run_pipeline(session, [job], admin_id)
+            return job.outcome == "sent"
+
+    # ============================================================
+    # Pipeline
+    # ============================================================
 
-    async def _execute_withdrawal(
+    def _new_job(self, withdrawal: CryptoWithdrawal) -> _WithdrawalJob:
+        withdrawal_id = str(withdrawal.id)
+        return _WithdrawalJob(
+            withdrawal=withdrawal,
+            withdrawal_id=withdrawal_id,
+            retry_count=self._retry_counts.get(withdrawal_id, 0),
+        )
+
+    async def _run_pipeline(
         self,
         session: AsyncSession,
-        withdrawal: CryptoWithdrawal,
+        jobs: List[_WithdrawalJob],
         admin_id: str = "system",
-    ) -> bool:
-        """Execute a single withdrawal.
+    ) -> List[CryptoWithdrawal]:
+        """Sign concurrently, broadcast in seqno order. Sets job.outcome.
 
-        Args:
-            session: Database session
-            withdrawal: Withdrawal record
-            admin_id: Admin ID for audit
+        Every withdrawal with a stored signed message joins the run, even
+        when it is outside this batch, so its seqno is settled before any
+        new message is signed.
 
         Returns:
-            True if successful
+            Withdrawals sent (or found on chain) in this run
         """
-        withdrawal_id = str(withdrawal.id)
+        async with self._lane_lock:
+            jobs[:0] = await self._get_inflight_jobs(session, jobs)
+            try:
+                seqno = await self._signer.get_seqno(refresh=True)
+            except TonSignerError as e:
+                logger.error(f"Could not read wallet seqno: {e}")
+                for job in jobs:
+                    job.outcome, job.error = "retry", str(e)
+                self._apply_retries(jobs)
+                return []
 
-        # Check retry count
-        retry_count = self._retry_counts.get(withdrawal_id, 0)
-        if retry_count >= settings.withdrawal_max_retry:
-            logger.warning(
-                f"Withdrawal {withdrawal_id} exceeded max retries ({retry_count}), marking failed"
-            )
-            await self._mark_failed(
-                session,
-                withdrawal,
-                f"최대 재시도 횟수 초과 ({retry_count}회)",
-                admin_id,
+            lane = self._resolve_stored_transfers(jobs, seqno)
+            for job in jobs:
+                if job.outcome == "sent":
+                    if job.withdrawal.tx_hash is None:
+                        self._set_sent(session, job, admin_id)
+                    _clear_landed(job.withdrawal)
+            # Landed/expired messages must be settled before their seqno is reused
+            await session.commit()
+
+            if lane:
+                try:
+                    await self._signer.ensure_gas()
+                except InsufficientGasError as e:
+                    # Not enough TON for gas - critical error
+                    logger.error(f"Insufficient gas for withdrawals: {e}")
+                    for job in lane:
+                        job.outcome, job.error = "failed", f"가스비 부족: {e}"
+                except TonSignerError as e:
+                    logger.error(f"Signer error before withdrawal batch: {e}")
+                    for job in lane:
+                        job.outcome, job.error = "retry", str(e)
+                else:
+                    await self._sign_and_broadcast(session, lane, seqno, admin_id)
+
+            await self._apply_failures(session, jobs, admin_id)
+            self._apply_retries(jobs)
+            return [job.withdrawal for job in jobs if job.outcome == "sent"]
+
+    async def _get_inflight_jobs(
+        self,
+        session: AsyncSession,
+        jobs: List[_WithdrawalJob],
+    ) -> List[_WithdrawalJob]:
+        """Withdrawals with a stored signed message not in `jobs`.
+
+        Includes messages already broadcast (tx_hash set) whose seqno has
+        not landed yet: the next seqno cannot be used until they do.
+        """
+        known = {job.withdrawal_id for job in jobs}
+        result = await session.execute(
+            select(CryptoWithdrawal).where(
+                and_(
+                    CryptoWithdrawal.status == TransactionStatus.PROCESSING,
+                    CryptoWithdrawal.signed_boc.isnot(None),
+                )
             )
-            return False
+        )
+        return [
+            self._new_job(withdrawal)
+            for withdrawal in result.scalars().all()
+            if str(withdrawal.id) not in known
+        ]
 
-        try:
-            # Check threshold for auto-processing
-            if float(withdrawal.amount_usdt) > settings.withdrawal_auto_threshold_usdt:
-                logger.info(
-                    f"Withdrawal {withdrawal_id} exceeds auto threshold "
-                    f"({withdrawal.amount_usdt} > {settings.withdrawal_auto_threshold_usdt}), "
-                    f"requires manual approval"
+    def _resolve_stored_transfers(
+        self,
+        jobs: List[_WithdrawalJob],
+        seqno: int,
+    ) -> List[_WithdrawalJob]:
+        """Settle previously signed messages and pick the broadcast lane.
+
+        - stored seqno below the wallet seqno: the message landed
+        - stored seqno equal and not expired: rebroadcast as is, first
+        - otherwise it can never land: clear it (and any tx hash recorded
+          for it) and sign again
+        """
+        now_ts = int(time.time())
+        head: Optional[_WithdrawalJob] = None
+        lane: List[_WithdrawalJob] = []
+
+        for job in jobs:
+            signed = _stored_transfer(job.withdrawal)
+            if signed is not None:
+                if signed.seqno < seqno:
+                    job.outcome, job.tx_hash = "sent", signed.tx_hash
+                    continue
+                if signed.seqno == seqno and signed.valid_until > now_ts and head is None:
+                    job.signed = signed
+                    head = job
+                    continue
+                if job.withdrawal.tx_hash is not None:
+                    logger.warning(
+                        f"Withdrawal {job.withdrawal_id} was broadcast "
+                        f"(tx_hash={job.withdrawal.tx_hash}) but seqno {signed.seqno} "
+                        f"never landed, signing again"
+                    )
+                    job.withdrawal.tx_hash = None
+                    job.withdrawal.processed_at = None
+                _store_transfer(job.withdrawal, None)
+
+            if job.retry_count >= settings.withdrawal_max_retry:
+                logger.warning(
+                    f"Withdrawal {job.withdrawal_id} exceeded max retries "
+                    f"({job.retry_count}), marking failed"
                 )
-                return False
+                job.outcome = "failed"
+                job.error = f"최대 재시도 횟수 초과 ({job.retry_count}회)"
+                continue
 
-            # Build transfer parameters
-            params = JettonTransferParams(
-                to_address=withdrawal.to_address,
-                amount=Decimal(str(withdrawal.amount_usdt)),
-                memo=f"Withdrawal:{withdrawal_id[:8]}",
-            )
+            lane.append(job)
 
-            # Execute transfer
-            logger.info(
-                f"Executing withdrawal {withdrawal_id}: "
-                f"{withdrawal.amount_usdt} USDT to {withdrawal.to_address[:10]}..."
-            )
+        return [head, *lane] if head else lane
 
-            result = await self._signer.transfer_jetton(params)
-
-            if result.success and result.tx_hash:
-                # Update withdrawal with TX hash
-                withdrawal.tx_hash = result.tx_hash
-                withdrawal.processed_at = datetime.now(timezone.utc)
-
-                # Create audit log
-                await self._create_audit_log(
-                    session,
-                    action="withdrawal_executed",
-                    target_id=withdrawal_id,
-                    admin_id=admin_id,
-                    details={
-                        "tx_hash": result.tx_hash,
-                        "amount_usdt": str(withdrawal.amount_usdt),
-                        "to_address": withdrawal.to_address,
-                        "retry_count": retry_count,
-                    },
+    async def _sign_and_broadcast(
+        self,
+        session: AsyncSession,
+        lane: List[_WithdrawalJob],
+        seqno: int,
+        admin_id: str,
+    ) -> None:
+        semaphore = asyncio.Semaphore(max(1, settings.withdrawal_sign_concurrency))
+
+        async def sign(job: _WithdrawalJob, job_seqno: int) -> SignedTransfer:
+            if job.signed is not None:
+                return job.signed
+            async with semaphore:
+                return await self._signer.prepare_jetton_transfer(
+                    self._transfer_params(job.withdrawal), job_seqno
                 )
 
-                await session.commit()
+        tasks = [
+            asyncio.create_task(sign(job, seqno + i))
+            for i, job in enumerate(lane)
+        ]
+
+        try:
+            for job, task in zip(lane, tasks):
+                try:
+                    signed = await task
+                except Exception as e:
+                    # A seqno gap invalidates every later signature
+                    job.outcome, job.error = "retry", f"Signing failed: {e}"
+                    logger.error(f"Signing failed for withdrawal {job.withdrawal_id}: {e}")
+                    break
 
-                # Clear retry count on success
-                self._retry_counts.pop(withdrawal_id, None)
+                if job.signed is None:
+                    # Durable before sending: after a crash the next run
+                    # settles this seqno instead of signing a second payout
+                    _store_transfer(job.withdrawal, signed)
+                    await session.commit()
+
+                await self._throttle_broadcast()
 
                 logger.info(
-                    f"Withdrawal {withdrawal_id} executed successfully, "
-                    f"tx_hash={result.tx_hash}"
+                    f"Executing withdrawal {job.withdrawal_id}: "
+                    f"{job.withdrawal.amount_usdt} USDT to {job.withdrawal.to_address[:10]}..., "
+                    f"seqno={signed.seqno}"
                 )
-                return True
+                try:
+                    result = await self._signer.broadcast(signed)
+                except Exception as e:
+                    result = TransactionResult(False, None, f"Broadcast error: {e}")
+
+                if not result.success:
+                    wallet_seqno = await self._read_seqno()
+                    if wallet_seqno is not None and wallet_seqno > signed.seqno:
+                        # Response lost, but the message is already on chain
+                        result = TransactionResult(True, signed.tx_hash, "Landed")
+                    elif wallet_seqno != signed.seqno:
+                        # Wallet is not at this seqno yet: not the withdrawal's fault
+                        job.error = result.message
+                        logger.warning(
+                            f"Withdrawal {job.withdrawal_id} deferred: {result.message} "
+                            f"(wallet seqno={wallet_seqno}, signed seqno={signed.seqno})"
+                        )
+                        break
+                    else:
+                        job.outcome, job.error = "retry", result.message
+                        logger.error(
+                            f"Withdrawal {job.withdrawal_id} failed: {result.message}, "
+                            f"retry {job.retry_count + 1}/{settings.withdrawal_max_retry}"
+                        )
+                        break
+
+                job.outcome = "sent"
+                job.tx_hash = result.tx_hash or signed.tx_hash
+                if job.withdrawal.tx_hash is None:
+                    self._set_sent(session, job, admin_id)
+                    await session.commit()
+
+                # TON rejects seqno+1 until this message is included
+                if not await self._wait_for_seqno(signed):
+                    logger.warning(
+                        f"Withdrawal {job.withdrawal_id} seqno {signed.seqno} not landed "
+                        f"after {settings.withdrawal_seqno_wait_seconds}s, "
+                        f"deferring the rest of the lane"
+                    )
+                    break
+                _clear_landed(job.withdrawal)
+                await session.commit()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
 
-            else:
-                # Transaction failed
-                self._retry_counts[withdrawal_id] = retry_count + 1
-                logger.error(
-                    f"Withdrawal {withdrawal_id} failed: {result.message}, "
-                    f"retry {retry_count + 1}/{settings.withdrawal_max_retry}"
-                )
+    async def _read_seqno(self) -> Optional[int]:
+        """Fresh wallet seqno, or None if it could not be read."""
+        try:
+            return await self._signer.get_seqno(refresh=True)
+        except TonSignerError as e:
+            logger.warning(f"Could not read wallet seqno: {e}")
+            return None
+
+    async def _wait_for_seqno(self, signed: SignedTransfer) -> bool:
+        """Poll until the wallet seqno passes the message.
+
+        Gives up after withdrawal_seqno_wait_seconds or once the message
+        has expired; the next run then rebroadcasts or re-signs it.
+
+        Returns:
+            True if the message landed
+        """
+        deadline = min(
+            time.time() + settings.withdrawal_seqno_wait_seconds,
+            signed.valid_until,
+        )
+        while True:
+            seqno = await self._read_seqno()
+            if seqno is not None and seqno > signed.seqno:
+                return True
+            if time.time() >= deadline:
                 return False
+            await asyncio.sleep(settings.withdrawal_seqno_poll_interval)
 
-        except InsufficientGasError as e:
-            # Not enough TON for gas - critical error
-            logger.error(f"Insufficient gas for withdrawal {withdrawal_id}: {e}")
-            await self._mark_failed(
-                session,
-                withdrawal,
-                f"가스비 부족: {e}",
-                admin_id,
-            )
-            return False
+    async def _throttle_broadcast(self) -> None:
+        rps = settings.withdrawal_broadcast_rps
+        if rps <= 0:
+            return
+        wait = self._last_broadcast + 1.0 / rps - time.monotonic()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        self._last_broadcast = time.monotonic()
+
+    def _transfer_params(self, withdrawal: CryptoWithdrawal) -> JettonTransferParams:
+        return JettonTransferParams(
+            to_address=withdrawal.to_address,
+            amount=Decimal(str(withdrawal.amount_usdt)),
+            memo=f"Withdrawal:{str(withdrawal.id)[:8]}",
+        )
 
-        except TonSignerError as e:
-            # Signer error - retry
-            self._retry_counts[withdrawal_id] = retry_count + 1
-            logger.error(
-                f"Signer error for withdrawal {withdrawal_id}: {e}, "
-                f"retry {retry_count + 1}/{settings.withdrawal_max_retry}"
+    def _set_sent(
+        self,
+        session: AsyncSession,
+        job: _WithdrawalJob,
+        admin_id: str,
+    ) -> None:
+        """Record the tx hash and audit log (caller commits)."""
+        withdrawal = job.withdrawal
+        withdrawal.tx_hash = job.tx_hash
+        withdrawal.processed_at = datetime.now(timezone.utc)
+        session.add(AuditLog(
+            action="withdrawal_executed",
+            target_type="crypto_withdrawal",
+            target_id=job.withdrawal_id,
+            admin_user_id=admin_id,
+            ip_address="system",
+            details={
+                "tx_hash": job.tx_hash,
+                "amount_usdt": str(withdrawal.amount_usdt),
+                "to_address": withdrawal.to_address,
+                "retry_count": job.retry_count,
+                "seqno": withdrawal.signed_seqno,
+            },
+        ))
+        self._retry_counts.pop(job.withdrawal_id, None)
+        logger.info(
+            f"Withdrawal {job.withdrawal_id} executed successfully, "
+            f"tx_hash={job.tx_hash}"
+        )
+
+    async def _apply_failures(
+        self,
+        session: AsyncSession,
+        jobs: List[_WithdrawalJob],
+        admin_id: str,
+    ) -> None:
+        """Mark failed jobs in one commit (none of them reached the chain)."""
+        failed = [job for job in jobs if job.outcome == "failed"]
+        if not failed:
+            return
+        for job in failed:
+            await self._mark_failed(session, job.withdrawal, job.error, admin_id)
+        await session.commit()
+        for job in failed:
+            self._retry_counts.pop(job.withdrawal_id, None)
+            logger.warning(
+                f"Withdrawal {job.withdrawal_id} marked as FAILED: {job.error}"
             )
-            return False
-
-        except Exception as e:
-            # Unexpected error
-            self._retry_counts[withdrawal_id] = retry_count + 1
-            logger.error(
-                f"Unexpected error for withdrawal {withdrawal_id}: {e}",
-                exc_info=True,
+
+    def _apply_retries(self, jobs: List[_WithdrawalJob]) -> None:
+        for job in jobs:
+            if job.outcome == "retry":
+                self._retry_counts[job.withdrawal_id] = job.retry_count + 1
+
+    def _record_batch(self, jobs: List[_WithdrawalJob], elapsed: float) -> None:
+        now = datetime.now(timezone.utc)
+        sent = [job for job in jobs if job.outcome == "sent"]
+        m = self.metrics
+        m.batches += 1
+        m.sent_total += len(sent)
+        m.failed_total += sum(1 for job in jobs if job.outcome == "failed")
+        m.retry_total += sum(1 for job in jobs if job.outcome == "retry")
+        m.deferred_total += sum(1 for job in jobs if job.outcome == "deferred")
+        m.last_batch_size = len(jobs)
+        m.last_batch_sent = len(sent)
+        m.last_batch_seconds = elapsed
+        m.last_throughput_per_sec = len(sent) / elapsed if elapsed > 0 else 0.0
+        if sent:
+            m.avg_send_age_seconds = (
+                sum(_queue_age(job.withdrawal, now) for job in sent) / len(sent)
             )
-            return False
 
     # ============================================================
     # Helper Methods
@@ -372,7 +725,7 @@ class WithdrawalExecutor:
         reason: str,
         admin_id: str,
     ) -> None:
-        """Mark withdrawal as failed.
+        """Mark withdrawal as failed (caller commits).
 
         Args:
             session: Database session
@@ -396,15 +749,6 @@ class WithdrawalExecutor:
             },
         )
 
-        await session.commit()
-
-        # Clear retry count
-        self._retry_counts.pop(str(withdrawal.id), None)
-
-        logger.warning(
-            f"Withdrawal {withdrawal.id} marked as FAILED: {reason}"
-        )
-
     async def _create_audit_log(
         self,
         session: AsyncSession,
@@ -435,15 +779,15 @@ class WithdrawalExecutor:
             dict with status information
         """
         async with self.session_factory() as session:
-            # Count pending withdrawals
-            pending_query = select(CryptoWithdrawal).where(
-                and_(
-                    CryptoWithdrawal.status == TransactionStatus.PROCESSING,
-                    CryptoWithdrawal.tx_hash.is_(None),
+            # Count pending (unsent) and awaiting (signed, seqno not landed)
+            result = await session.execute(
+                select(CryptoWithdrawal).where(
+                    CryptoWithdrawal.status == TransactionStatus.PROCESSING
                 )
             )
-            result = await session.execute(pending_query)
-            pending_count = len(result.scalars().all())
+            processing = result.scalars().all()
+            pending_count = sum(1 for withdrawal in processing if withdrawal.tx_hash is None)
+            awaiting = sum(1 for withdrawal in processing if withdrawal.signed_boc)
 
             # Get hot wallet USDT balance
             try:
@@ -456,6 +800,8 @@ class WithdrawalExecutor:
                 "running": self._running,
                 "pending_count": pending_count,
                 "retry_queue_size": len(self._retry_counts),
+                "awaiting_confirmation": awaiting,
+                "pipeline": self.metrics.to_dict(),
                 "auto_threshold_usdt": settings.withdrawal_auto_threshold_usdt,
                 "max_retry": settings.withdrawal_max_retry,
                 "hot_wallet_usdt": float(usdt_balance),
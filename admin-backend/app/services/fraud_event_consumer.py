@@ -1,10 +1,17 @@
 """Fraud Event Consumer - 부정 행위 이벤트 소비자 서비스.
 
-Redis Pub/Sub 채널을 구독하여 게임 서버에서 발행한 이벤트를 수신하고
+Redis Streams 컨슈머 그룹으로 게임 서버에서 발행한 이벤트를 수신하고
 기존 탐지 서비스들을 호출하여 부정 행위를 분석합니다.
 
-Channels:
-- fraud:hand_completed - 핸드 완료 이벤트 → ChipDumpingDetector
+- 채널 유형별 워커 태스크가 XREADGROUP으로 배치 수신 후 일괄 XACK
+  (처리 성공 또는 poison 메시지만 ACK, 일시적 오류는 pending으로 남겨 재처리)
+- 재시작 시 자신의 미처리(pending) 엔트리부터 다시 처리
+- 다른 인스턴스가 죽어 남긴 pending 엔트리는 XAUTOCLAIM으로 회수
+- 여러 admin 인스턴스가 같은 그룹으로 부하를 나눠 처리
+
+Streams:
+- fraud:hand_completed - 핸드 완료 이벤트 → RedisChipFlowDetector
+  (ChipDumpingDetector SQL 경로는 주기적 정합성 검증에만 사용)
 - fraud:player_action - 플레이어 액션 이벤트 → BotDetector
 - fraud:player_stats - 플레이어 세션 통계 이벤트 → AnomalyDetector
 """
@@ -14,25 +21,93 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import os
+import socket
+import time
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any, Callable
 
+from app.services.response_time_stats import RollingTimingStats, TimingStatsStore
+from app.services.streaming_chip_flow import RedisChipFlowDetector
+
 if TYPE_CHECKING:
     from redis.asyncio import Redis
     from sqlalchemy.ext.asyncio import AsyncSession
 
 logger = logging.getLogger(__name__)
 
-# Redis Pub/Sub 채널 이름
+# Redis Stream 키 (게임 서버 FraudEventPublisher와 동일)
 CHANNEL_HAND_COMPLETED = "fraud:hand_completed"
 CHANNEL_PLAYER_ACTION = "fraud:player_action"
 CHANNEL_PLAYER_STATS = "fraud:player_stats"
 
+STREAM_DATA_FIELD = "data"
+CONSUMER_GROUP = "fraud-detectors"
+
+# 채널 유형별 워커 수 (hand_completed는 쌍별 윈도우 순서 유지를 위해 1개)
+STREAM_WORKERS = {
+    CHANNEL_HAND_COMPLETED: 1,
+    CHANNEL_PLAYER_ACTION: 4,
+    CHANNEL_PLAYER_STATS: 2,
+}
+STREAM_BATCH_SIZE = 100
+STREAM_BLOCK_MS = 1000
+
+# 이 시간 이상 ACK되지 않은 엔트리는 죽은 컨슈머의 것으로 보고 회수
+RECLAIM_MIN_IDLE_MS = 60_000
+RECLAIM_INTERVAL_SECONDS = 30
+
+# 재시도해도 같은 결과인 오류 (잘못된 JSON / 이벤트 형식) → 기록 후 ACK
+POISON_ERRORS = (ValueError, TypeError, KeyError)
+
+RECONCILE_LOCK_KEY = "fraud:chip_dumping:reconcile_lock"
+
+# 칩 밀어주기 탐지 기준 (스트리밍 / SQL 정합성 검증 공통)
+CHIP_DUMPING_WINDOW_HOURS = 1
+CHIP_DUMPING_MIN_HANDS = 3
+CHIP_DUMPING_MIN_WIN_RATE = 0.9
+CHIP_DUMPING_RECONCILE_INTERVAL_SECONDS = 300
+
+
+@dataclass
+class StreamConsumerMetrics:
+    """스트림별 소비 지표."""
+
+    processed: int = 0
+    acked: int = 0
+    reclaimed: int = 0
+    batches: int = 0
+    errors: int = 0
+
+
+@dataclass
+class FraudConsumerMetrics:
+    """FraudEventConsumer 지표 (스트림별)."""
+
+    streams: dict[str, StreamConsumerMetrics] = field(
+        default_factory=lambda: {s: StreamConsumerMetrics() for s in STREAM_WORKERS}
+    )
+
+
+def _event_time(event: dict) -> float:
+    """이벤트 timestamp(ISO 8601) → epoch 초. 없거나 잘못되면 현재 시각."""
+    value = event.get("timestamp")
+    if value:
+        try:
+            ts = datetime.fromisoformat(value)
+            if ts.tzinfo is None:
+                ts = ts.replace(tzinfo=timezone.utc)
+            return ts.timestamp()
+        except (TypeError, ValueError):
+            pass
+    return time.time()
+
 
 class FraudEventConsumer:
     """부정 행위 이벤트 소비자 서비스.
     
-    Redis Pub/Sub 채널을 구독하여 게임 서버에서 발행한 이벤트를 수신하고
+    Redis Streams 컨슈머 그룹으로 게임 서버에서 발행한 이벤트를 수신하고
     기존 탐지 서비스들을 호출하여 부정 행위를 분석합니다.
     """
 
@@ -41,6 +116,7 @@ class FraudEventConsumer:
         redis_client: "Redis",
         main_db_factory: Callable[[], "AsyncSession"],
         admin_db_factory: Callable[[], "AsyncSession"],
+        consumer_name: str | None = None,
     ):
         """Initialize FraudEventConsumer.
         
@@ -48,101 +124,255 @@ class FraudEventConsumer:
             redis_client: Redis 클라이언트
             main_db_factory: 메인 DB 세션 팩토리
             admin_db_factory: Admin DB 세션 팩토리
+            consumer_name: 인스턴스 컨슈머 이름 (재시작 후에도 동일해야
+                자신의 pending 엔트리를 이어서 처리, 기본값 hostname:pid.
+                같은 호스트의 여러 워커 프로세스가 이름을 공유하지 않도록
+                PID를 붙이며, 재시작 전 pending은 XAUTOCLAIM으로 회수)
         """
         self.redis = redis_client
         self._main_db_factory = main_db_factory
         self._admin_db_factory = admin_db_factory
         self._running = False
         self._task: asyncio.Task | None = None
-        self._pubsub = None
+        self._workers: list[asyncio.Task] = []
+        self.consumer_name = consumer_name or f"{socket.gethostname()}:{os.getpid()}"
+        self._metrics = FraudConsumerMetrics()
         
-        # 플레이어별 액션 데이터 버퍼 (봇 탐지용)
-        self._action_buffer: dict[str, list[dict]] = {}
-        self._action_buffer_size = 20  # 버퍼 크기
+        # 플레이어별 롤링 응답 시간 통계 (봇 탐지용, Redis 저장)
+        self._action_buffer_size = 20  # 롤링 윈도우 크기
+        self._timing_store = TimingStatsStore(
+            redis_client, window=self._action_buffer_size
+        )
+
+        # 플레이어 쌍별 슬라이딩 윈도우 칩 흐름 (칩 밀어주기 탐지용)
+        # 핸드 이벤트가 인스턴스들에 나뉘므로 쌍 카운터/플래그는 Redis 공유
+        self._chip_flow = RedisChipFlowDetector(
+            redis_client,
+            window_seconds=CHIP_DUMPING_WINDOW_HOURS * 3600,
+            min_hands=CHIP_DUMPING_MIN_HANDS,
+            min_win_rate=CHIP_DUMPING_MIN_WIN_RATE,
+        )
+        self._reconcile_interval = CHIP_DUMPING_RECONCILE_INTERVAL_SECONDS
+        self._reconcile_task: asyncio.Task | None = None
 
     async def start(self) -> None:
-        """이벤트 구독 시작."""
+        """컨슈머 그룹 생성 및 스트림 워커 시작."""
         if self._running:
             logger.warning("FraudEventConsumer already running")
             return
 
+        for stream in STREAM_WORKERS:
+            await self._ensure_group(stream)
+
         self._running = True
-        self._pubsub = self.redis.pubsub()
-        
-        await self._pubsub.subscribe(
-            CHANNEL_HAND_COMPLETED,
-            CHANNEL_PLAYER_ACTION,
-            CHANNEL_PLAYER_STATS,
-        )
-        
+
+        for stream, count in STREAM_WORKERS.items():
+            for index in range(count):
+                self._workers.append(
+                    asyncio.create_task(self._stream_worker(stream, index))
+                )
+
         logger.info(
-            f"FraudEventConsumer subscribed to channels: "
-            f"{CHANNEL_HAND_COMPLETED}, {CHANNEL_PLAYER_ACTION}, {CHANNEL_PLAYER_STATS}"
+            f"FraudEventConsumer joined group {CONSUMER_GROUP} as {self.consumer_name}: "
+            + ", ".join(f"{s} x{c}" for s, c in STREAM_WORKERS.items())
         )
-        
-        self._task = asyncio.create_task(self._listen_loop())
+
+        self._task = asyncio.create_task(self._reclaim_loop())
+        self._reconcile_task = asyncio.create_task(self._reconcile_loop())
 
     async def stop(self) -> None:
-        """이벤트 구독 중지."""
+        """스트림 워커 중지 (처리 중인 배치는 ACK되지 않고 pending으로 남음)."""
         self._running = False
-        
-        if self._pubsub:
-            await self._pubsub.unsubscribe()
-            await self._pubsub.close()
-            self._pubsub = None
-        
-        if self._task:
-            self._task.cancel()
+
+        if self._reconcile_task:
+            self._reconcile_task.cancel()
             try:
-                await self._task
+                await self._reconcile_task
             except asyncio.CancelledError:
                 pass
-            self._task = None
+            self._reconcile_task = None
+
+        tasks = list(self._workers)
+        if self._task:
+            tasks.append(self._task)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._workers = []
+        self._task = None
         
         logger.info("FraudEventConsumer stopped")
 
-    async def _listen_loop(self) -> None:
-        """이벤트 수신 루프."""
-        logger.info("FraudEventConsumer listen loop started")
-        
+    async def _ensure_group(self, stream: str) -> None:
+        """컨슈머 그룹 생성 (이미 있으면 무시).
+
+        id="0": 그룹 생성 이전에 발행된 엔트리도 처리.
+        """
         try:
-            while self._running:
+            await self.redis.xgroup_create(
+                stream, CONSUMER_GROUP, id="0", mkstream=True
+            )
+        except Exception as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    def _worker_name(self, index: int, stream: str) -> str:
+        return f"{self.consumer_name}:{stream.split(':')[-1]}:{index}"
+
+    async def _stream_worker(self, stream: str, index: int) -> None:
+        """채널 유형별 워커: 배치 수신 → 처리 → 일괄 ACK.
+
+        시작 시 ID "0"으로 자신의 pending 엔트리(이전 실행에서 처리 중
+        종료된 엔트리)를 먼저 처리한 뒤 ">"로 새 엔트리를 수신합니다.
+        """
+        consumer = self._worker_name(index, stream)
+        read_id = "0"
+
+        while self._running:
+            try:
+                entries = await self.redis.xreadgroup(
+                    groupname=CONSUMER_GROUP,
+                    consumername=consumer,
+                    streams={stream: read_id},
+                    count=STREAM_BATCH_SIZE,
+                    block=STREAM_BLOCK_MS,
+                )
+
+                messages = entries[0][1] if entries else []
+                if not messages:
+                    read_id = ">"  # pending 소진
+                    continue
+
+                await self._process_batch(stream, messages)
+
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                self._metrics.streams[stream].errors += 1
+                logger.error(f"Error in {stream} worker {index}: {e}")
+                await asyncio.sleep(1)
+
+    async def _process_batch(
+        self,
+        stream: str,
+        messages: list[tuple[Any, dict]],
+    ) -> None:
+        """배치 처리 후 일괄 XACK.
+
+        처리에 성공했거나 poison 메시지(_handle_message가 기록 후 삼킴)인
+        엔트리만 ACK합니다. 그 밖의 오류(Redis/DB 장애 등)가 난 엔트리는
+        pending으로 남아 XAUTOCLAIM으로 재처리되며, 배치를 마친 뒤 첫 오류를
+        다시 던집니다.
+        """
+        metrics = self._metrics.streams[stream]
+        done = []
+        failure: Exception | None = None
+
+        for message_id, fields in messages:
+            data = fields.get(STREAM_DATA_FIELD) if fields else None
+            if data is not None:
+                if isinstance(data, bytes):
+                    data = data.decode("utf-8")
                 try:
-                    message = await self._pubsub.get_message(
-                        ignore_subscribe_messages=True,
-                        timeout=1.0,
-                    )
-                    
-                    if message is None:
-                        continue
-                    
-                    if message["type"] != "message":
-                        continue
-                    
-                    channel = message["channel"]
-                    if isinstance(channel, bytes):
-                        channel = channel.decode("utf-8")
-                    
-                    data = message["data"]
-                    if isinstance(data, bytes):
-                        data = data.decode("utf-8")
-                    
-                    await self._handle_message(channel, data)
-                    
-                except asyncio.CancelledError:
-                    break
+                    await self._handle_message(stream, data)
                 except Exception as e:
-                    logger.error(f"Error in listen loop: {e}")
-                    await asyncio.sleep(1)
-                    
-        except asyncio.CancelledError:
-            pass
-        finally:
-            logger.info("FraudEventConsumer listen loop ended")
+                    logger.error(f"Leaving {stream} entry {message_id} pending: {e}")
+                    failure = failure or e
+                    continue
+                metrics.processed += 1
+            done.append(message_id)
+
+        if done:
+            await self.redis.xack(stream, CONSUMER_GROUP, *done)
+        metrics.acked += len(done)
+        metrics.batches += 1
+
+        if failure is not None:
+            raise failure
+
+    async def _reclaim_loop(self) -> None:
+        """죽은 컨슈머의 pending 엔트리 주기적 회수."""
+        while self._running:
+            try:
+                await asyncio.sleep(RECLAIM_INTERVAL_SECONDS)
+                for stream in STREAM_WORKERS:
+                    await self.reclaim_pending(stream)
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Error in fraud reclaim loop: {e}")
+
+    async def reclaim_pending(self, stream: str) -> int:
+        """RECLAIM_MIN_IDLE_MS 이상 ACK되지 않은 엔트리를 회수하여 처리.
+
+        Returns:
+            회수하여 처리한 엔트리 수
+        """
+        consumer = self._worker_name(0, stream)
+        start_id = "0-0"
+        reclaimed = 0
+
+        while True:
+            result = await self.redis.xautoclaim(
+                stream,
+                CONSUMER_GROUP,
+                consumer,
+                min_idle_time=RECLAIM_MIN_IDLE_MS,
+                start_id=start_id,
+                count=STREAM_BATCH_SIZE,
+            )
+            # Redis 6.2: [next_id, messages], Redis 7: [next_id, messages, deleted_ids]
+            next_id, messages = result[0], result[1]
+            messages = [(mid, fields) for mid, fields in messages if fields]
+            if messages:
+                await self._process_batch(stream, messages)
+                reclaimed += len(messages)
+
+            if next_id in ("0-0", b"0-0"):
+                break
+            start_id = next_id
+
+        if reclaimed:
+            self._metrics.streams[stream].reclaimed += reclaimed
+            logger.warning(f"Reclaimed {reclaimed} pending entries from {stream}")
+        return reclaimed
+
+    async def get_lag_metrics(self) -> dict[str, dict[str, Any]]:
+        """스트림별 소비 지표 + 그룹 lag / pending 수.
+
+        Returns:
+            {stream: {"lag", "pending", "processed", "acked", "reclaimed", ...}}
+        """
+        result: dict[str, dict[str, Any]] = {}
+
+        for stream, metrics in self._metrics.streams.items():
+            info: dict[str, Any] = {
+                "lag": None,
+                "pending": None,
+                "processed": metrics.processed,
+                "acked": metrics.acked,
+                "reclaimed": metrics.reclaimed,
+                "batches": metrics.batches,
+                "errors": metrics.errors,
+            }
+            try:
+                for group in await self.redis.xinfo_groups(stream):
+                    if group.get("name") in (CONSUMER_GROUP, CONSUMER_GROUP.encode()):
+                        info["pending"] = group.get("pending")
+                        info["lag"] = group.get("lag")  # Redis 7+
+                        break
+            except Exception as e:
+                logger.debug(f"xinfo_groups failed for {stream}: {e}")
+            result[stream] = info
+
+        return result
 
     async def _handle_message(self, channel: str, data: str) -> None:
         """메시지 처리.
         
+        잘못된 JSON / 이벤트 형식(POISON_ERRORS)은 기록만 하고, 그 밖의
+        오류는 호출자로 전파합니다 (엔트리를 ACK하지 않고 재처리).
+        
         Args:
             channel: 채널 이름
             data: JSON 문자열 데이터
@@ -161,13 +391,14 @@ class FraudEventConsumer:
                 
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse message: {e}")
-        except Exception as e:
-            logger.error(f"Error handling message from {channel}: {e}")
+        except POISON_ERRORS as e:
+            logger.error(f"Dropping malformed message from {channel}: {e}")
 
     async def handle_hand_completed(self, event: dict) -> None:
         """핸드 완료 이벤트 처리.
         
-        ChipDumpingDetector를 호출하여 칩 밀어주기 패턴을 분석합니다.
+        이벤트의 participants로 플레이어 쌍별 슬라이딩 윈도우 카운터를
+        갱신하고, 임계값을 새로 넘은 쌍만 플래깅합니다 (DB 조회 없음).
         
         Args:
             event: 핸드 완료 이벤트 데이터
@@ -186,43 +417,88 @@ class FraudEventConsumer:
             return
         
         try:
-            # DB 세션 생성
-            main_db = self._main_db_factory()
-            admin_db = self._admin_db_factory()
-            
-            try:
-                from app.services.chip_dumping_detector import ChipDumpingDetector
-                
-                detector = ChipDumpingDetector(main_db, admin_db)
-                
-                # 일방적 칩 흐름 탐지 (최근 핸드 기반)
-                # Note: 실시간 분석을 위해 시간 범위를 짧게 설정
-                suspicious_patterns = await detector.detect_one_way_chip_flow(
-                    time_window_hours=1,
-                    min_hands=3,
-                    min_win_rate=0.9,
+            suspicious_patterns = await self._chip_flow.process_hand(
+                str(hand_id or f"{room_id}:{event.get('hand_number')}"),
+                participants,
+                _event_time(event),
+            )
+
+            if suspicious_patterns:
+                logger.warning(
+                    f"Chip dumping patterns detected: {len(suspicious_patterns)} patterns"
                 )
-                
-                if suspicious_patterns:
-                    logger.warning(
-                        f"Chip dumping patterns detected: {len(suspicious_patterns)} patterns"
-                    )
-                    
-                    # 의심 활동 플래깅
-                    for pattern in suspicious_patterns:
-                        await self._flag_suspicious_activity(
-                            detection_type="chip_dumping",
-                            user_ids=[pattern["loser_id"], pattern["winner_id"]],
-                            details=pattern,
-                            severity="high" if pattern["win_rate"] >= 0.95 else "medium",
-                        )
-                        
-            finally:
-                await main_db.close()
-                await admin_db.close()
-                
+
+                for pattern in suspicious_patterns:
+                    await self._flag_chip_dumping(pattern)
+
         except Exception as e:
             logger.error(f"Error in handle_hand_completed: {e}")
+            raise
+
+    async def _flag_chip_dumping(self, pattern: dict) -> None:
+        """칩 밀어주기 의심 쌍 플래깅."""
+        await self._flag_suspicious_activity(
+            detection_type="chip_dumping",
+            user_ids=[pattern["loser_id"], pattern["winner_id"]],
+            details=pattern,
+            severity="high" if pattern["win_rate"] >= 0.95 else "medium",
+        )
+
+    async def _reconcile_loop(self) -> None:
+        """주기적 SQL 정합성 검증 루프."""
+        while self._running:
+            try:
+                await asyncio.sleep(self._reconcile_interval)
+                # 여러 admin 인스턴스 중 주기당 하나만 실행
+                acquired = await self.redis.set(
+                    RECONCILE_LOCK_KEY,
+                    self.consumer_name,
+                    nx=True,
+                    ex=max(1, int(self._reconcile_interval) - 1),
+                )
+                if acquired:
+                    await self.reconcile_chip_dumping()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Error in chip dumping reconcile loop: {e}")
+
+    async def reconcile_chip_dumping(self) -> int:
+        """ChipDumpingDetector SQL 경로로 스트리밍 결과 보정.
+
+        다른 인스턴스가 처리했거나 재시작으로 유실된 핸드까지 포함하여
+        윈도우 전체를 재계산하고, 스트리밍 탐지기가 아직 플래그하지 않은
+        쌍만 플래깅합니다.
+
+        Returns:
+            새로 플래그된 쌍 수
+        """
+        main_db = self._main_db_factory()
+        admin_db = self._admin_db_factory()
+
+        try:
+            from app.services.chip_dumping_detector import ChipDumpingDetector
+
+            detector = ChipDumpingDetector(main_db, admin_db)
+            patterns = await detector.detect_one_way_chip_flow(
+                time_window_hours=CHIP_DUMPING_WINDOW_HOURS,
+                min_hands=CHIP_DUMPING_MIN_HANDS,
+                min_win_rate=CHIP_DUMPING_MIN_WIN_RATE,
+            )
+        finally:
+            await main_db.close()
+            await admin_db.close()
+
+        flagged = 0
+        for pattern in patterns:
+            if not await self._chip_flow.try_flag(pattern["loser_id"], pattern["winner_id"]):
+                continue
+            await self._flag_chip_dumping({**pattern, "detection_source": "reconcile"})
+            flagged += 1
+
+        if flagged:
+            logger.warning(f"Chip dumping reconcile flagged {flagged} additional pairs")
+        return flagged
 
     async def handle_player_action(self, event: dict) -> None:
         """플레이어 액션 이벤트 처리.
@@ -241,54 +517,41 @@ class FraudEventConsumer:
             f"action={action_type}, response_time={response_time_ms}ms"
         )
         
-        # 액션 데이터 버퍼에 추가
-        if user_id not in self._action_buffer:
-            self._action_buffer[user_id] = []
-        
-        self._action_buffer[user_id].append({
-            "action_type": action_type,
-            "response_time_ms": response_time_ms,
-            "timestamp": event.get("timestamp"),
-        })
-        
-        # 버퍼 크기 제한
-        if len(self._action_buffer[user_id]) > self._action_buffer_size:
-            self._action_buffer[user_id] = self._action_buffer[user_id][-self._action_buffer_size:]
-        
-        # 충분한 데이터가 모이면 분석
-        if len(self._action_buffer[user_id]) >= self._action_buffer_size:
-            await self._analyze_bot_behavior(user_id)
+        if not user_id:
+            return
+
+        # 롤링 통계 O(1) 갱신 (같은 사용자 이벤트가 여러 워커에서 동시에
+        # 처리될 수 있으므로 WATCH/MULTI 원자적 갱신)
+        stats = await self._timing_store.update(
+            user_id, lambda s: s.add(response_time_ms, action_type)
+        )
+
+        # 윈도우가 차면 분석 (탐지 시 윈도우 초기화)
+        if stats.action_total >= self._action_buffer_size:
+            if await self._analyze_bot_behavior(user_id, stats):
+                await self._timing_store.update(user_id, RollingTimingStats.reset)
 
-    async def _analyze_bot_behavior(self, user_id: str) -> None:
+    async def _analyze_bot_behavior(self, user_id: str, stats: RollingTimingStats) -> bool:
         """봇 행동 분석.
 
         Phase 2.2 Enhancement:
         - BotDetector의 실시간 분석 메서드 사용
         - 액션 패턴도 함께 분석
 
+        롤링 통계(평균/표준편차/최소/최대/액션 카운트)를 그대로 사용하므로
+        세션 길이와 무관하게 상수 시간입니다.
+
         Args:
             user_id: 사용자 ID
+            stats: 사용자별 롤링 응답 시간 통계
+
+        Returns:
+            봇으로 플래그했으면 True (호출자가 윈도우 초기화)
         """
-        actions = self._action_buffer.get(user_id, [])
-        if not actions:
-            return
+        if stats.sample_size < 10:
+            return False
 
         try:
-            # 응답 시간 추출
-            response_times = [a["response_time_ms"] for a in actions if a.get("response_time_ms")]
-
-            if len(response_times) < 10:
-                return
-
-            # 액션 패턴 집계
-            action_counts: dict[str, int] = {"total": 0}
-            for action in actions:
-                action_type = action.get("action_type")
-                if action_type:
-                    action_counts[action_type] = action_counts.get(action_type, 0) + 1
-                    action_counts["total"] += 1
-
-            # BotDetector를 사용하여 분석
             main_db = self._main_db_factory()
             admin_db = self._admin_db_factory()
 
@@ -298,10 +561,9 @@ class FraudEventConsumer:
                 detector = BotDetector(main_db, admin_db, self.redis)
 
                 # 실시간 봇 탐지 실행
-                result = await detector.run_realtime_bot_detection(
+                result = await detector.run_streaming_bot_detection(
                     user_id=user_id,
-                    response_times=response_times,
-                    action_counts=action_counts,
+                    stats=stats,
                 )
 
                 if result.get("is_likely_bot"):
@@ -323,9 +585,7 @@ class FraudEventConsumer:
                         },
                         severity=result.get("severity", "medium"),
                     )
-
-                    # 버퍼 초기화 (중복 탐지 방지)
-                    self._action_buffer[user_id] = []
+                    return True
 
             finally:
                 await main_db.close()
@@ -333,6 +593,8 @@ class FraudEventConsumer:
 
         except Exception as e:
             logger.error(f"Error in _analyze_bot_behavior: {e}")
+            raise
+        return False
 
     async def handle_player_stats(self, event: dict) -> None:
         """플레이어 세션 통계 이벤트 처리.
@@ -417,6 +679,7 @@ class FraudEventConsumer:
 
         except Exception as e:
             logger.error(f"Error in handle_player_stats: {e}")
+            raise
 
     async def _run_anomaly_detection(
         self,
@@ -490,6 +753,7 @@ class FraudEventConsumer:
 
         except Exception as e:
             logger.error(f"Error in _run_anomaly_detection: {e}")
+            raise
 
     async def _flag_suspicious_activity(
         self,
@@ -570,6 +834,7 @@ class FraudEventConsumer:
 
         except Exception as e:
             logger.error(f"Error in _flag_suspicious_activity: {e}")
+            raise
 
 
 # 싱글톤 인스턴스
@@ -585,6 +850,7 @@ def init_fraud_consumer(
     redis_client: "Redis",
     main_db_factory: Callable[[], "AsyncSession"],
     admin_db_factory: Callable[[], "AsyncSession"],
+    consumer_name: str | None = None,
 ) -> FraudEventConsumer:
     """Initialize the global FraudEventConsumer instance.
     
@@ -592,11 +858,14 @@ def init_fraud_consumer(
         redis_client: Redis 클라이언트
         main_db_factory: 메인 DB 세션 팩토리
         admin_db_factory: Admin DB 세션 팩토리
+        consumer_name: 인스턴스 컨슈머 이름 (기본값 hostname:pid)
         
     Returns:
         초기화된 FraudEventConsumer 인스턴스
     """
     global _fraud_consumer
-    _fraud_consumer = FraudEventConsumer(redis_client, main_db_factory, admin_db_factory)
+    _fraud_consumer = FraudEventConsumer(
+        redis_client, main_db_factory, admin_db_factory, consumer_name=consumer_name
+    )
     logger.info("FraudEventConsumer initialized")
     return _fraud_consumer
@@ -1,15 +1,44 @@
 """
 Metrics Service - CCU/DAU 및 서버 상태 집계
 메인 시스템의 Redis와 DB에서 실시간 데이터를 조회합니다.
+
+히스토리/요약 조회는 키마다 왕복하지 않고 파이프라인·MGET/HMGET으로
+한 번에 읽습니다. 시간별 CCU는 게임 서버가 단일 해시(ccu:hourly)에 기록하며,
+구버전 키(ccu_hourly:{hour})는 보관 기간 동안 폴백으로 함께 조회합니다.
 """
+import asyncio
+import time
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Any, Awaitable, Callable, Optional
 import redis.asyncio as redis
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
 
 from app.config import get_settings
 
+# 시간별 CCU 해시 (field: "%Y-%m-%d:%H", value: 해당 시간 최대 CCU)
+CCU_SERIES_KEY = "ccu:hourly"
+LEGACY_CCU_KEY_PREFIX = "ccu_hourly:"
+
+SERVER_HEALTH_KEYS = ("server:cpu_usage", "server:memory_usage", "server:avg_latency")
+ROOM_TYPES = ("cash", "tournament", "sit_n_go")
+
+# 대시보드 요약 캐시 TTL (초) - 동시 새로고침이 Redis로 몰리지 않도록
+SUMMARY_CACHE_TTL = 5.0
+
+
+def _to_int(value) -> int:
+    return int(value) if value else 0
+
+
+def _to_float(value) -> float:
+    return float(value) if value else 0
+
+
+def _ccu(online, ws_count) -> int:
+    """online_users 집합이 비어 있으면 (SCARD는 0을 반환) WS 연결 수로 대체"""
+    return _to_int(online) or _to_int(ws_count)
+
 
 class MetricsService:
     """실시간 메트릭 수집 서비스"""
@@ -18,6 +47,21 @@ class MetricsService:
         self.redis = redis_client
         self.main_db = main_db
         self.settings = get_settings()
+        self._cache: dict[str, tuple[float, Any]] = {}
+        self._cache_lock = asyncio.Lock()
+    
+    async def _cached(self, key: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """SUMMARY_CACHE_TTL 동안 결과 재사용 (동시 요청은 한 번만 조회)."""
+        entry = self._cache.get(key)
+        if entry and entry[0] > time.monotonic():
+            return entry[1]
+        async with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry and entry[0] > time.monotonic():
+                return entry[1]
+            value = await loader()
+            self._cache[key] = (time.monotonic() + SUMMARY_CACHE_TTL, value)
+            return value
     
     async def get_ccu(self) -> int:
         """현재 동시 접속자 수 (CCU) 조회"""
@@ -25,7 +69,7 @@ class MetricsService:
             # Redis에서 활성 세션 수 조회
             # 메인 시스템이 "active_sessions" 또는 "online_users" 키에 저장한다고 가정
             ccu = await self.redis.scard("online_users")
-            if ccu is None:
+            if not ccu:
                 # 대안: 활성 WebSocket 연결 수
                 ccu = await self.redis.get("ws_connections_count")
                 return int(ccu) if ccu else 0
@@ -48,44 +92,45 @@ class MetricsService:
             return 0
     
     async def get_ccu_history(self, hours: int = 24) -> list[dict]:
-        """CCU 히스토리 조회 (시간별)"""
-        history = []
+        """CCU 히스토리 조회 (시간별, 1회 왕복)"""
         now = datetime.now(timezone.utc)
+        timestamps = [now - timedelta(hours=i) for i in reversed(range(hours))]
+        fields = [ts.strftime("%Y-%m-%d:%H") for ts in timestamps]
         
         try:
-            for i in range(hours):
-                timestamp = now - timedelta(hours=i)
-                hour_key = timestamp.strftime("%Y-%m-%d:%H")
-                
-                # Redis에서 시간별 CCU 조회
-                ccu = await self.redis.get(f"ccu_hourly:{hour_key}")
-                history.append({
-                    "timestamp": timestamp.isoformat(),
-                    "hour": timestamp.strftime("%H:00"),
-                    "ccu": int(ccu) if ccu else 0
-                })
+            pipe = self.redis.pipeline(transaction=False)
+            pipe.hmget(CCU_SERIES_KEY, fields)
+            pipe.mget([LEGACY_CCU_KEY_PREFIX + field for field in fields])
+            series, legacy = await pipe.execute()
             
-            return list(reversed(history))
+            return [
+                {
+                    "timestamp": ts.isoformat(),
+                    "hour": ts.strftime("%H:00"),
+                    "ccu": _to_int(value if value is not None else old),
+                }
+                for ts, value, old in zip(timestamps, series, legacy)
+            ]
         except Exception:
             return []
     
     async def get_dau_history(self, days: int = 30) -> list[dict]:
-        """DAU 히스토리 조회 (일별)"""
-        history = []
+        """DAU 히스토리 조회 (일별, 파이프라인 PFCOUNT)"""
         now = datetime.now(timezone.utc)
+        date_keys = [
+            (now - timedelta(days=i)).strftime("%Y-%m-%d") for i in reversed(range(days))
+        ]
 
         try:
-            for i in range(days):
-                date = now - timedelta(days=i)
-                date_key = date.strftime("%Y-%m-%d")
+            pipe = self.redis.pipeline(transaction=False)
+            for date_key in date_keys:
+                pipe.pfcount(f"dau:{date_key}")
+            counts = await pipe.execute()
 
-                dau = await self.redis.pfcount(f"dau:{date_key}")
-                history.append({
-                    "date": date_key,
-                    "dau": dau if dau else 0
-                })
-
-            return list(reversed(history))
+            return [
+                {"date": date_key, "dau": _to_int(dau)}
+                for date_key, dau in zip(date_keys, counts)
+            ]
         except Exception:
             return []
 
@@ -108,7 +153,7 @@ class MetricsService:
             return 0
 
     async def get_mau_history(self, months: int = 12) -> list[dict]:
-        """MAU 히스토리 조회 (월별).
+        """MAU 히스토리 조회 (월별, 파이프라인 PFCOUNT).
 
         Args:
             months: 조회할 개월 수
@@ -116,26 +161,26 @@ class MetricsService:
         Returns:
             월별 MAU 목록
         """
-        history = []
         now = datetime.now(timezone.utc)
+        month_keys = []
+        for i in reversed(range(months)):
+            year = now.year
+            month = now.month - i
+            while month <= 0:
+                month += 12
+                year -= 1
+            month_keys.append(f"{year}-{month:02d}")
 
         try:
-            for i in range(months):
-                # 월 계산
-                year = now.year
-                month = now.month - i
-                while month <= 0:
-                    month += 12
-                    year -= 1
-
-                month_key = f"{year}-{month:02d}"
-                mau = await self.redis.pfcount(f"mau:{month_key}")
-                history.append({
-                    "month": month_key,
-                    "mau": mau if mau else 0
-                })
-
-            return list(reversed(history))
+            pipe = self.redis.pipeline(transaction=False)
+            for month_key in month_keys:
+                pipe.pfcount(f"mau:{month_key}")
+            counts = await pipe.execute()
+
+            return [
+                {"month": month_key, "mau": _to_int(mau)}
+                for month_key, mau in zip(month_keys, counts)
+            ]
         except Exception:
             return []
 
@@ -145,65 +190,39 @@ class MetricsService:
         Returns:
             사용자 통계 요약
         """
+        return await self._cached("user_statistics", self._load_user_statistics)
+
+    async def _load_user_statistics(self) -> dict:
         now = datetime.now(timezone.utc)
         today = now.strftime("%Y-%m-%d")
         month = now.strftime("%Y-%m")
+        # WAU: 여러 HyperLogLog에 대한 PFCOUNT는 합집합 카디널리티 (임시 키 불필요)
+        week_keys = [f"dau:{(now - timedelta(days=i)).strftime('%Y-%m-%d')}" for i in range(7)]
 
-        # CCU
-        ccu = await self.get_ccu()
-
-        # DAU
-        dau = await self.get_dau()
-
-        # WAU (7일간 활성 사용자)
-        wau = 0
         try:
-            # 지난 7일간의 DAU 키들을 PFMERGE로 합침
-            week_keys = []
-            for i in range(7):
-                date = now - timedelta(days=i)
-                week_keys.append(f"dau:{date.strftime('%Y-%m-%d')}")
-
-            # 임시 키에 합침
-            temp_key = f"wau_temp:{today}"
-            await self.redis.pfmerge(temp_key, *week_keys)
-            wau = await self.redis.pfcount(temp_key)
-            await self.redis.delete(temp_key)
+            pipe = self.redis.pipeline(transaction=False)
+            pipe.scard("online_users")
+            pipe.get("ws_connections_count")
+            pipe.pfcount(f"dau:{today}")
+            pipe.pfcount(*week_keys)
+            pipe.pfcount(f"mau:{month}")
+            online, ws_count, dau, wau, mau = await pipe.execute()
         except Exception:
-            pass
-
-        # MAU
-        mau = await self.get_mau(month)
+            online, ws_count, dau, wau, mau = 0, None, 0, 0, 0
 
         return {
-            "ccu": ccu,
-            "dau": dau,
-            "wau": wau,
-            "mau": mau,
+            "ccu": _ccu(online, ws_count),
+            "dau": _to_int(dau),
+            "wau": _to_int(wau),
+            "mau": _to_int(mau),
             "timestamp": now.isoformat()
         }
     
     async def get_active_rooms(self) -> dict:
         """활성 방 통계 조회"""
         try:
-            # Redis에서 활성 방 정보 조회
-            active_rooms = await self.redis.scard("active_rooms")
-            
-            # 방별 플레이어 수 집계
-            total_players = 0
             room_ids = await self.redis.smembers("active_rooms")
-            
-            for room_id in room_ids:
-                if isinstance(room_id, bytes):
-                    room_id = room_id.decode()
-                players = await self.redis.scard(f"room:{room_id}:players")
-                total_players += players if players else 0
-            
-            return {
-                "active_rooms": active_rooms if active_rooms else 0,
-                "total_players": total_players,
-                "avg_players_per_room": round(total_players / max(active_rooms, 1), 1)
-            }
+            return await self._room_stats(room_ids)
         except Exception:
             return {
                 "active_rooms": 0,
@@ -211,49 +230,45 @@ class MetricsService:
                 "avg_players_per_room": 0
             }
     
+    async def _room_stats(self, room_ids) -> dict:
+        """방별 플레이어 수 집계 (파이프라인 SCARD)"""
+        active_rooms = len(room_ids) if room_ids else 0
+        total_players = 0
+        
+        if room_ids:
+            pipe = self.redis.pipeline(transaction=False)
+            for room_id in room_ids:
+                if isinstance(room_id, bytes):
+                    room_id = room_id.decode()
+                pipe.scard(f"room:{room_id}:players")
+            total_players = sum(_to_int(players) for players in await pipe.execute())
+        
+        return {
+            "active_rooms": active_rooms,
+            "total_players": total_players,
+            "avg_players_per_room": round(total_players / max(active_rooms, 1), 1)
+        }
+    
     async def get_room_distribution(self) -> list[dict]:
         """방 유형별 분포 조회"""
         try:
-            distribution = []
-            room_types = ["cash", "tournament", "sit_n_go"]
-            
-            for room_type in room_types:
-                count = await self.redis.scard(f"rooms:{room_type}")
-                distribution.append({
-                    "type": room_type,
-                    "count": count if count else 0
-                })
+            pipe = self.redis.pipeline(transaction=False)
+            for room_type in ROOM_TYPES:
+                pipe.scard(f"rooms:{room_type}")
+            counts = await pipe.execute()
             
-            return distribution
+            return [
+                {"type": room_type, "count": _to_int(count)}
+                for room_type, count in zip(ROOM_TYPES, counts)
+            ]
         except Exception:
             return []
     
     async def get_server_health(self) -> dict:
         """서버 상태 조회"""
         try:
-            # Redis에서 서버 메트릭 조회
-            cpu = await self.redis.get("server:cpu_usage")
-            memory = await self.redis.get("server:memory_usage")
-            latency = await self.redis.get("server:avg_latency")
-            
-            cpu_val = float(cpu) if cpu else 0
-            memory_val = float(memory) if memory else 0
-            latency_val = float(latency) if latency else 0
-            
-            # 상태 판단
-            if cpu_val > 90 or memory_val > 90 or latency_val > 500:
-                status = "critical"
-            elif cpu_val > 70 or memory_val > 70 or latency_val > 200:
-                status = "warning"
-            else:
-                status = "healthy"
-            
-            return {
-                "cpu": cpu_val,
-                "memory": memory_val,
-                "latency": latency_val,
-                "status": status
-            }
+            values = await self.redis.mget(list(SERVER_HEALTH_KEYS))
+            return self._server_health(values)
         except Exception:
             return {
                 "cpu": 0,
@@ -262,24 +277,67 @@ class MetricsService:
                 "status": "unknown"
             }
     
+    @staticmethod
+    def _server_health(values) -> dict:
+        """MGET 결과 (cpu, memory, latency) → 상태 판단"""
+        cpu_val, memory_val, latency_val = (_to_float(v) for v in values)
+        
+        if cpu_val > 90 or memory_val > 90 or latency_val > 500:
+            status = "critical"
+        elif cpu_val > 70 or memory_val > 70 or latency_val > 200:
+            status = "warning"
+        else:
+            status = "healthy"
+        
+        return {
+            "cpu": cpu_val,
+            "memory": memory_val,
+            "latency": latency_val,
+            "status": status
+        }
+    
     async def get_dashboard_summary(self) -> dict:
-        """대시보드 요약 데이터"""
-        ccu = await self.get_ccu()
-        dau = await self.get_dau()
-        rooms = await self.get_active_rooms()
-        health = await self.get_server_health()
+        """대시보드 요약 데이터 (SUMMARY_CACHE_TTL 캐시)"""
+        return await self._cached("dashboard_summary", self._load_dashboard_summary)
+    
+    async def _load_dashboard_summary(self) -> dict:
+        """CCU/DAU/방 목록/서버 상태를 한 번의 파이프라인으로 조회"""
+        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            pipe.scard("online_users")
+            pipe.get("ws_connections_count")
+            pipe.pfcount(f"dau:{today}")
+            pipe.smembers("active_rooms")
+            pipe.mget(list(SERVER_HEALTH_KEYS))
+            online, ws_count, dau, room_ids, health_values = await pipe.execute()
+        except Exception:
+            return {
+                "ccu": 0,
+                "dau": 0,
+                "active_rooms": 0,
+                "total_players": 0,
+                "server_health": {"cpu": 0, "memory": 0, "latency": 0, "status": "unknown"},
+            }
+        
+        try:
+            rooms = await self._room_stats(room_ids)
+        except Exception:
+            rooms = {"active_rooms": len(room_ids or ()), "total_players": 0}
         
         return {
-            "ccu": ccu,
-            "dau": dau,
+            "ccu": _ccu(online, ws_count),
+            "dau": _to_int(dau),
             "active_rooms": rooms["active_rooms"],
             "total_players": rooms["total_players"],
-            "server_health": health
+            "server_health": self._server_health(health_values)
         }
 
 
 # Redis 클라이언트 싱글톤
 _redis_client: Optional[redis.Redis] = None
+_metrics_service: Optional[MetricsService] = None
 
 
 async def get_redis_client() -> redis.Redis:
@@ -292,6 +350,9 @@ async def get_redis_client() -> redis.Redis:
 
 
 async def get_metrics_service() -> MetricsService:
-    """MetricsService 인스턴스 가져오기"""
+    """MetricsService 인스턴스 가져오기 (요약 캐시 공유를 위해 재사용)"""
+    global _metrics_service
     redis_client = await get_redis_client()
-    return MetricsService(redis_client)
+    if _metrics_service is None or _metrics_service.redis is not redis_client:
+        _metrics_service = MetricsService(redis_client)
+    return _metrics_service
@@ -0,0 +1,351 @@
+"""Rolling Response Time Stats - 봇 탐지용 롤링 윈도우 응답 시간 통계.
+
+플레이어 액션마다 O(1)로 갱신되는 고정 윈도우 통계:
+- Welford 평균/분산 (윈도우에서 빠지는 값은 역연산으로 제거)
+- 단조 deque 기반 윈도우 최소/최대
+- 세션 누적 응답 시간 히스토그램 (고정 버킷)
+- 윈도우 내 액션 유형별 카운트
+
+BotDetector.analyze_realtime_response_times()처럼 버퍼 전체를
+매번 mean/stdev/min/max로 재계산하지 않으므로, 세션 길이와 무관하게
+봇 점수 계산이 상수 시간입니다.
+
+Redis에는 struct로 압축한 바이너리(base64)로 저장합니다.
+"""
+
+from __future__ import annotations
+
+import base64
+import math
+import struct
+from bisect import bisect_right
+from collections import deque
+from typing import TYPE_CHECKING, Callable
+
+from redis.exceptions import WatchError
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+# 히스토그램 버킷 상한 (ms). 마지막 버킷은 30초 초과
+HISTOGRAM_BOUNDS_MS = (
+    100, 200, 300, 500, 750, 1000, 1500, 2000,
+    3000, 5000, 7500, 10000, 15000, 20000, 30000,
+)
+HISTOGRAM_BUCKETS = len(HISTOGRAM_BOUNDS_MS) + 1
+
+# 액션 유형 코드 (바이너리 저장용)
+ACTION_CODES = {
+    "fold": 1,
+    "check": 2,
+    "call": 3,
+    "bet": 4,
+    "raise": 5,
+    "all_in": 6,
+}
+_ACTION_NAMES = {code: name for name, code in ACTION_CODES.items()}
+_OTHER_ACTION = 7
+
+# version, window, total_samples, mean, m2, timing_len, action_len
+_HEADER = struct.Struct("<BHIddHH")
+_FORMAT_VERSION = 1
+
+
+class RollingTimingStats:
+    """사용자별 고정 윈도우 응답 시간 / 액션 통계."""
+
+    __slots__ = (
+        "window",
+        "total_samples",
+        "_times",
+        "_mean",
+        "_m2",
+        "_seq",
+        "_min_q",
+        "_max_q",
+        "_actions",
+        "_action_counts",
+        "_histogram",
+    )
+
+    def __init__(self, window: int = 20):
+        self.window = window
+        self.total_samples = 0  # 세션 누적 응답 시간 샘플 수
+
+        self._times: deque[int] = deque()
+        self._mean = 0.0
+        self._m2 = 0.0
+
+        # (seq, value) 단조 deque
+        self._seq = 0
+        self._min_q: deque[tuple[int, int]] = deque()
+        self._max_q: deque[tuple[int, int]] = deque()
+
+        self._actions: deque[int] = deque()
+        self._action_counts = [0] * (_OTHER_ACTION + 1)
+        self._histogram = [0] * HISTOGRAM_BUCKETS
+
+    # ------------------------------------------------------------------
+    # Update
+    # ------------------------------------------------------------------
+
+    def add(self, response_time_ms: int | None, action_type: str | None = None) -> None:
+        """액션 하나 반영 (O(1))."""
+        if action_type:
+            self._add_action(ACTION_CODES.get(action_type, _OTHER_ACTION))
+        if response_time_ms and response_time_ms > 0:
+            self._add_time(int(response_time_ms))
+
+    def reset(self) -> None:
+        """윈도우 초기화 (탐지 후 중복 플래그 방지). 히스토그램은 유지."""
+        self._times.clear()
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._min_q.clear()
+        self._max_q.clear()
+        self._actions.clear()
+        self._action_counts = [0] * (_OTHER_ACTION + 1)
+
+    def _add_time(self, value: int) -> None:
+        if len(self._times) >= self.window:
+            self._remove_time(self._times.popleft())
+
+        self._times.append(value)
+        n = len(self._times)
+        delta = value - self._mean
+        self._mean += delta / n
+        self._m2 += delta * (value - self._mean)
+
+        self._seq += 1
+        seq = self._seq
+        while self._min_q and self._min_q[-1][1] >= value:
+            self._min_q.pop()
+        self._min_q.append((seq, value))
+        while self._max_q and self._max_q[-1][1] <= value:
+            self._max_q.pop()
+        self._max_q.append((seq, value))
+
+        oldest_seq = seq - len(self._times)
+        while self._min_q[0][0] <= oldest_seq:
+            self._min_q.popleft()
+        while self._max_q[0][0] <= oldest_seq:
+            self._max_q.popleft()
+
+        self.total_samples += 1
+        self._histogram[bisect_right(HISTOGRAM_BOUNDS_MS, value - 1)] += 1
+
+    def _remove_time(self, value: int) -> None:
+        """Welford 역연산 (popleft된 값 제거)."""
+        n = len(self._times)  # 제거 후 개수
+        if n == 0:
+            self._mean = 0.0
+            self._m2 = 0.0
+            return
+        old_mean = self._mean
+        self._mean = (old_mean * (n + 1) - value) / n
+        self._m2 = max(0.0, self._m2 - (value - old_mean) * (value - self._mean))
+
+    def _add_action(self, code: int) -> None:
+        if len(self._actions) >= self.window:
+            self._action_counts[self._actions.popleft()] -= 1
+        self._actions.append(code)
+        self._action_counts[code] += 1
+
+    # ------------------------------------------------------------------
+    # Read
+    # ------------------------------------------------------------------
+
+    @property
+    def sample_size(self) -> int:
+        """윈도우 내 응답 시간 샘플 수."""
+        return len(self._times)
+
+    @property
+    def action_total(self) -> int:
+        """윈도우 내 액션 수."""
+        return len(self._actions)
+
+    @property
+    def mean(self) -> float:
+        return self._mean
+
+    @property
+    def stdev(self) -> float:
+        """표본 표준편차 (statistics.stdev와 동일)."""
+        n = len(self._times)
+        return math.sqrt(self._m2 / (n - 1)) if n > 1 else 0.0
+
+    @property
+    def min(self) -> int | None:
+        return self._min_q[0][1] if self._min_q else None
+
+    @property
+    def max(self) -> int | None:
+        return self._max_q[0][1] if self._max_q else None
+
+    @property
+    def histogram(self) -> list[int]:
+        return list(self._histogram)
+
+    def action_counts(self) -> dict[str, int]:
+        """BotDetector.analyze_realtime_action_patterns 입력 형식."""
+        counts: dict[str, int] = {"total": len(self._actions)}
+        for code, count in enumerate(self._action_counts):
+            if count:
+                counts[_ACTION_NAMES.get(code, "other")] = count
+        return counts
+
+    # ------------------------------------------------------------------
+    # Binary encoding
+    # ------------------------------------------------------------------
+
+    def to_bytes(self) -> bytes:
+        times = list(self._times)
+        actions = bytes(self._actions)
+        return b"".join((
+            _HEADER.pack(
+                _FORMAT_VERSION,
+                self.window,
+                self.total_samples,
+                self._mean,
+                self._m2,
+                len(times),
+                len(actions),
+            ),
+            struct.pack(f"<{len(times)}I", *times),
+            actions,
+            struct.pack(f"<{HISTOGRAM_BUCKETS}I", *self._histogram),
+        ))
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "RollingTimingStats":
+        version, window, total, mean, m2, times_len, actions_len = _HEADER.unpack_from(data)
+        if version != _FORMAT_VERSION:
+            raise ValueError(f"Unsupported timing stats version: {version}")
+
+        stats = cls(window=window)
+        offset = _HEADER.size
+
+        times = struct.unpack_from(f"<{times_len}I", data, offset)
+        offset += 4 * times_len
+        actions = data[offset:offset + actions_len]
+        offset += actions_len
+        histogram = struct.unpack_from(f"<{HISTOGRAM_BUCKETS}I", data, offset)
+
+        # 윈도우(최대 window개)로 단조 deque 재구성 후 저장된 누적값 복원
+        for value in times:
+            stats._add_time(value)
+        for code in actions:
+            stats._add_action(code)
+        stats._mean = mean
+        stats._m2 = m2
+        stats.total_samples = total
+        stats._histogram = list(histogram)
+        return stats
+
+
+class TimingStatsStore:
+    """RollingTimingStats Redis 저장소.
+
+    player_action 이벤트는 컨슈머 그룹으로 여러 워커/인스턴스에 분산되므로
+    매번 Redis에서 읽고 쓴다 (사용자당 수백 바이트). 같은 사용자의 이벤트가
+    동시에 처리될 수 있으므로 갱신은 update()의 WATCH/MULTI로 합니다.
+    Redis를 사용할 수 없을 때만 로컬 캐시로 동작합니다.
+    """
+
+    KEY_PREFIX = "fraud:timing:"
+    MAX_LOCAL_USERS = 50_000
+    MAX_UPDATE_ATTEMPTS = 5
+
+    def __init__(
+        self,
+        redis_client: "Redis | None",
+        window: int = 20,
+        ttl_seconds: int = 24 * 3600,
+    ):
+        self.redis = redis_client
+        self.window = window
+        self.ttl_seconds = ttl_seconds
+        self._local: dict[str, RollingTimingStats] = {}
+
+    async def load(self, user_id: str) -> RollingTimingStats:
+        """Redis → 로컬 → 신규 순으로 통계 조회."""
+        if self.redis is not None:
+            try:
+                raw = await self.redis.get(self.KEY_PREFIX + user_id)
+                if raw:
+                    return RollingTimingStats.from_bytes(base64.b64decode(raw))
+            except Exception:
+                pass
+
+        stats = self._local.get(user_id)
+        return stats if stats is not None else RollingTimingStats(window=self.window)
+
+    async def update(
+        self,
+        user_id: str,
+        mutate: Callable[[RollingTimingStats], None],
+    ) -> RollingTimingStats:
+        """원자적 읽기-수정-쓰기 (WATCH/MULTI, 충돌 시 재시도).
+
+        mutate는 시도마다 새로 읽은 통계에 다시 적용되므로 부수 효과가
+        없어야 합니다.
+
+        Returns:
+            저장된 통계
+        """
+        if self.redis is not None:
+            key = self.KEY_PREFIX + user_id
+            try:
+                for _ in range(self.MAX_UPDATE_ATTEMPTS):
+                    async with self.redis.pipeline(transaction=True) as pipe:
+                        try:
+                            await pipe.watch(key)
+                            raw = await pipe.get(key)
+                            stats = (
+                                RollingTimingStats.from_bytes(base64.b64decode(raw))
+                                if raw else RollingTimingStats(window=self.window)
+                            )
+                            mutate(stats)
+                            pipe.multi()
+                            pipe.set(
+                                key,
+                                base64.b64encode(stats.to_bytes()),
+                                ex=self.ttl_seconds,
+                            )
+                            await pipe.execute()
+                        except WatchError:
+                            continue
+                    self._local.pop(user_id, None)
+                    return stats
+                raise WatchError(f"Timing stats for {user_id} kept changing")
+            except WatchError:
+                raise
+            except Exception:
+                pass
+
+        stats = self._local.get(user_id) or RollingTimingStats(window=self.window)
+        mutate(stats)
+        self._store_local(user_id, stats)
+        return stats
+
+    async def save(self, user_id: str, stats: RollingTimingStats) -> None:
+        """Redis에 저장 (decode_responses 클라이언트 호환을 위해 base64)."""
+        if self.redis is not None:
+            try:
+                await self.redis.set(
+                    self.KEY_PREFIX + user_id,
+                    base64.b64encode(stats.to_bytes()),
+                    ex=self.ttl_seconds,
+                )
+                self._local.pop(user_id, None)
+                return
+            except Exception:
+                pass
+
+        self._store_local(user_id, stats)
+
+    def _store_local(self, user_id: str, stats: RollingTimingStats) -> None:
+        if user_id not in self._local and len(self._local) >= self.MAX_LOCAL_USERS:
+            self._local.pop(next(iter(self._local)))
+        self._local[user_id] = stats
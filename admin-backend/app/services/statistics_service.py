@@ -1,6 +1,9 @@
 """
 Statistics Service - 매출 및 통계 집계
 메인 DB에서 레이크 수익, 거래 내역 등을 조회합니다.
+
+admin_db가 주어지면 일/주/월별 매출은 revenue_hourly 롤업
+(StatsRollupService)과 워터마크 이후 원본 집계를 합쳐 계산합니다.
 """
 import logging
 from datetime import datetime, timedelta, timezone
@@ -10,6 +13,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
 
 from app.config import get_settings
+from app.services.stats_rollup import RevenueTotals, revenue_by_hour
 
 logger = logging.getLogger(__name__)
 
@@ -22,10 +26,30 @@ class StatisticsError(Exception):
 class StatisticsService:
     """매출 및 통계 서비스"""
     
-    def __init__(self, main_db: AsyncSession):
+    def __init__(self, main_db: AsyncSession, admin_db: Optional[AsyncSession] = None):
         self.db = main_db
+        self.admin_db = admin_db  # 롤업 테이블 (없으면 hand_history 직접 집계)
         self.settings = get_settings()
     
+    async def _revenue_rollup(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        period_key,
+    ) -> list[tuple]:
+        """시간 버킷 롤업을 기간 키별로 합산 (최신 기간 먼저).
+        
+        Args:
+            start_date: 조회 시작
+            end_date: 조회 끝
+            period_key: bucket_start -> 기간 키 (date 등)
+        """
+        periods: dict = {}
+        buckets = await revenue_by_hour(self.admin_db, self.db, start_date, end_date)
+        for bucket, totals in buckets.items():
+            periods.setdefault(period_key(bucket), RevenueTotals()).add(totals)
+        return sorted(periods.items(), key=lambda item: item[0], reverse=True)
+    
     async def get_revenue_summary(
         self,
         start_date: Optional[datetime] = None,
@@ -84,6 +108,15 @@ class StatisticsService:
         start_date = end_date - timedelta(days=days)
         
         try:
+            if self.admin_db is not None:
+                rows = await self._revenue_rollup(
+                    start_date, end_date, lambda bucket: bucket.date()
+                )
+                return [
+                    {"date": str(day), "rake": float(totals.rake), "hands": totals.hands}
+                    for day, totals in rows
+                ]
+            
             query = text("""
                 SELECT 
                     DATE(created_at) as date,
@@ -119,6 +152,18 @@ class StatisticsService:
         start_date = end_date - timedelta(weeks=weeks)
         
         try:
+            if self.admin_db is not None:
+                # DATE_TRUNC('week')와 동일하게 월요일 시작
+                rows = await self._revenue_rollup(
+                    start_date,
+                    end_date,
+                    lambda bucket: bucket.date() - timedelta(days=bucket.weekday()),
+                )
+                return [
+                    {"week_start": str(week), "rake": float(totals.rake), "hands": totals.hands}
+                    for week, totals in rows
+                ]
+            
             query = text("""
                 SELECT 
                     DATE_TRUNC('week', created_at) as week_start,
@@ -154,6 +199,15 @@ class StatisticsService:
         start_date = end_date - timedelta(days=months * 30)
         
         try:
+            if self.admin_db is not None:
+                rows = await self._revenue_rollup(
+                    start_date, end_date, lambda bucket: bucket.strftime("%Y-%m")
+                )
+                return [
+                    {"month": month, "rake": float(totals.rake), "hands": totals.hands}
+                    for month, totals in rows
+                ]
+            
             query = text("""
                 SELECT 
                     DATE_TRUNC('month', created_at) as month_start,
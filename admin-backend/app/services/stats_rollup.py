@@ -0,0 +1,626 @@
+"""Stats Rollup Service - 대시보드 통계용 시간 단위 사전 집계.
+
+crypto_deposits / crypto_withdrawals (Admin DB)와 hand_history (Main DB)를
+시간 버킷 테이블(crypto_flow_hourly, revenue_hourly)로 증분 집계합니다.
+
+- 워터마크 이후의 원본 행만 읽고, 해당 시간 버킷을 통째로 재계산 후 교체
+  (멱등: 같은 구간을 다시 처리해도 중복 집계되지 않음)
+- 현재 진행 중인 버킷은 다음 실행에서 다시 교체
+- 조회 시에는 워터마크 이전은 롤업, 이후(최대 ~1시간)는 원본을 직접 집계해
+  합치므로 결과가 항상 최신
+
+백필/재구축:
+    python -m app.services.stats_rollup rebuild [--since YYYY-MM-DD] [--only crypto_flow|revenue]
+"""
+
+import argparse
+import asyncio
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Callable, Optional
+
+from sqlalchemy import (
+    DateTime,
+    Numeric,
+    and_,
+    column,
+    delete,
+    func,
+    select,
+    table,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.crypto import CryptoDeposit, CryptoWithdrawal, TransactionStatus
+from app.models.stats_rollup import CryptoFlowHourly, RevenueHourly, RollupWatermark
+
+logger = logging.getLogger(__name__)
+
+ROLLUP_CRYPTO_FLOW = "crypto_flow"
+ROLLUP_REVENUE = "revenue"
+ROLLUP_NAMES = (ROLLUP_CRYPTO_FLOW, ROLLUP_REVENUE)
+
+# 완료 시각이 커밋보다 약간 앞설 수 있으므로 최근 구간은 다음 실행으로 미룸
+SETTLE_DELAY = timedelta(minutes=1)
+# 백필 시 한 트랜잭션에서 처리할 구간
+CHUNK_SIZE = timedelta(days=1)
+
+# Main DB hand_history (StatisticsService와 동일한 원본)
+_hand_history = table(
+    "hand_history",
+    column("created_at", DateTime(timezone=True)),
+    column("rake_amount", Numeric),
+)
+
+
+# ============================================================
+# Data Classes
+# ============================================================
+
+@dataclass
+class FlowTotals:
+    """입출금 합계 (버킷 또는 사용자 단위)"""
+    deposit_count: int = 0
+    deposit_amount_usdt: Decimal = Decimal("0")
+    deposit_amount_krw: Decimal = Decimal("0")
+    withdrawal_count: int = 0
+    withdrawal_amount_usdt: Decimal = Decimal("0")
+    withdrawal_amount_krw: Decimal = Decimal("0")
+
+    def add(self, other: "FlowTotals") -> None:
+        self.deposit_count += other.deposit_count
+        self.deposit_amount_usdt += other.deposit_amount_usdt
+        self.deposit_amount_krw += other.deposit_amount_krw
+        self.withdrawal_count += other.withdrawal_count
+        self.withdrawal_amount_usdt += other.withdrawal_amount_usdt
+        self.withdrawal_amount_krw += other.withdrawal_amount_krw
+
+
+@dataclass
+class RevenueTotals:
+    """레이크 합계"""
+    rake: Decimal = Decimal("0")
+    hands: int = 0
+
+    def add(self, other: "RevenueTotals") -> None:
+        self.rake += other.rake
+        self.hands += other.hands
+
+
+# ============================================================
+# Helpers
+# ============================================================
+
+def hour_floor(dt: datetime) -> datetime:
+    """시간 버킷 시작 시각 (UTC)."""
+    return _as_utc(dt).replace(minute=0, second=0, microsecond=0)
+
+
+def _as_utc(value) -> Optional[datetime]:
+    """DB 반환값을 tz-aware UTC datetime으로 정규화 (SQLite는 문자열/naive)."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _hour_bucket(db: AsyncSession, col):
+    """시간 단위 truncate 식 (PostgreSQL DATE_TRUNC, 그 외 strftime)."""
+    if db.get_bind().dialect.name == "postgresql":
+        return func.date_trunc("hour", col)
+    return func.strftime("%Y-%m-%d %H:00:00", col)
+
+
+def _decimal(value) -> Decimal:
+    return Decimal(str(value)) if value is not None else Decimal("0")
+
+
+# ============================================================
+# Source Aggregation
+# ============================================================
+
+async def aggregate_crypto_flow(
+    db: AsyncSession,
+    start: datetime,
+    end: datetime,
+) -> dict[tuple[datetime, str], FlowTotals]:
+    """원본 입출금을 (버킷, 사용자) 단위로 집계.
+
+    Args:
+        db: Admin DB session
+        start: 구간 시작 (포함)
+        end: 구간 끝 (미포함)
+
+    Returns:
+        dict: (bucket_start, user_id) -> FlowTotals
+    """
+    totals: dict[tuple[datetime, str], FlowTotals] = {}
+
+    dep_bucket = _hour_bucket(db, CryptoDeposit.credited_at).label("bucket")
+    deposit_result = await db.execute(
+        select(
+            dep_bucket,
+            CryptoDeposit.user_id,
+            func.count(),
+            func.coalesce(func.sum(CryptoDeposit.amount_usdt), 0),
+            func.coalesce(func.sum(CryptoDeposit.amount_krw), 0),
+        )
+        .where(
+            and_(
+                CryptoDeposit.status == TransactionStatus.COMPLETED,
+                CryptoDeposit.credited_at >= start,
+                CryptoDeposit.credited_at < end,
+            )
+        )
+        .group_by(dep_bucket, CryptoDeposit.user_id)
+    )
+    for bucket, user_id, count, usdt, krw in deposit_result.all():
+        entry = totals.setdefault((_as_utc(bucket), user_id), FlowTotals())
+        entry.deposit_count += count
+        entry.deposit_amount_usdt += _decimal(usdt)
+        entry.deposit_amount_krw += _decimal(krw)
+
+    wd_bucket = _hour_bucket(db, CryptoWithdrawal.processed_at).label("bucket")
+    withdrawal_result = await db.execute(
+        select(
+            wd_bucket,
+            CryptoWithdrawal.user_id,
+            func.count(),
+            func.coalesce(func.sum(CryptoWithdrawal.amount_usdt), 0),
+            func.coalesce(func.sum(CryptoWithdrawal.amount_krw), 0),
+        )
+        .where(
+            and_(
+                CryptoWithdrawal.status == TransactionStatus.COMPLETED,
+                CryptoWithdrawal.processed_at >= start,
+                CryptoWithdrawal.processed_at < end,
+            )
+        )
+        .group_by(wd_bucket, CryptoWithdrawal.user_id)
+    )
+    for bucket, user_id, count, usdt, krw in withdrawal_result.all():
+        entry = totals.setdefault((_as_utc(bucket), user_id), FlowTotals())
+        entry.withdrawal_count += count
+        entry.withdrawal_amount_usdt += _decimal(usdt)
+        entry.withdrawal_amount_krw += _decimal(krw)
+
+    return totals
+
+
+async def aggregate_revenue(
+    main_db: AsyncSession,
+    start: datetime,
+    end: datetime,
+) -> dict[datetime, RevenueTotals]:
+    """hand_history 레이크를 시간 버킷 단위로 집계.
+
+    Args:
+        main_db: Main DB session
+        start: 구간 시작 (포함)
+        end: 구간 끝 (미포함)
+
+    Returns:
+        dict: bucket_start -> RevenueTotals
+    """
+    bucket = _hour_bucket(main_db, _hand_history.c.created_at).label("bucket")
+    result = await main_db.execute(
+        select(
+            bucket,
+            func.coalesce(func.sum(_hand_history.c.rake_amount), 0),
+            func.count(),
+        )
+        .where(
+            and_(
+                _hand_history.c.created_at >= start,
+                _hand_history.c.created_at < end,
+            )
+        )
+        .group_by(bucket)
+    )
+    return {
+        _as_utc(row[0]): RevenueTotals(rake=_decimal(row[1]), hands=row[2])
+        for row in result.all()
+    }
+
+
+# ============================================================
+# Rollup Reads (rollup + live tail)
+# ============================================================
+
+async def get_watermark(db: AsyncSession, name: str) -> Optional[datetime]:
+    """롤업 워터마크 조회 (없으면 None)."""
+    row = await db.get(RollupWatermark, name)
+    return _as_utc(row.watermark) if row else None
+
+
+async def _split_range(
+    db: AsyncSession,
+    name: str,
+    start: datetime,
+    end: datetime,
+) -> tuple[datetime, datetime]:
+    """[start, end)를 롤업 구간 [start, split)과 원본 구간 [split, end)로 분할.
+
+    워터마크가 속한 버킷은 부분 집계일 수 있으므로 원본에서 읽는다.
+    """
+    watermark = await get_watermark(db, name)
+    if watermark is None:
+        return start, start
+    split = min(max(hour_floor(watermark), start), end)
+    return start, split
+
+
+async def crypto_flow_by_hour(
+    db: AsyncSession,
+    start: datetime,
+    end: Optional[datetime] = None,
+) -> dict[datetime, FlowTotals]:
+    """버킷별 입출금 합계 (전체 사용자).
+
+    Args:
+        db: Admin DB session
+        start: 조회 시작 (시간 단위로 내림)
+        end: 조회 끝 (기본 현재)
+    """
+    end = end or datetime.now(timezone.utc)
+    start = hour_floor(start)
+    start, split = await _split_range(db, ROLLUP_CRYPTO_FLOW, start, end)
+
+    totals: dict[datetime, FlowTotals] = {}
+    if split > start:
+        result = await db.execute(
+            select(
+                CryptoFlowHourly.bucket_start,
+                func.sum(CryptoFlowHourly.deposit_count),
+                func.sum(CryptoFlowHourly.deposit_amount_usdt),
+                func.sum(CryptoFlowHourly.deposit_amount_krw),
+                func.sum(CryptoFlowHourly.withdrawal_count),
+                func.sum(CryptoFlowHourly.withdrawal_amount_usdt),
+                func.sum(CryptoFlowHourly.withdrawal_amount_krw),
+            )
+            .where(
+                and_(
+                    CryptoFlowHourly.bucket_start >= start,
+                    CryptoFlowHourly.bucket_start < split,
+                )
+            )
+            .group_by(CryptoFlowHourly.bucket_start)
+        )
+        for row in result.all():
+            totals[_as_utc(row[0])] = FlowTotals(
+                deposit_count=row[1] or 0,
+                deposit_amount_usdt=_decimal(row[2]),
+                deposit_amount_krw=_decimal(row[3]),
+                withdrawal_count=row[4] or 0,
+                withdrawal_amount_usdt=_decimal(row[5]),
+                withdrawal_amount_krw=_decimal(row[6]),
+            )
+
+    if end > split:
+        live = await aggregate_crypto_flow(db, split, end)
+        for (bucket, _), flow in live.items():
+            totals.setdefault(bucket, FlowTotals()).add(flow)
+
+    return totals
+
+
+async def crypto_flow_by_user(
+    db: AsyncSession,
+    start: datetime,
+    end: Optional[datetime] = None,
+) -> dict[str, FlowTotals]:
+    """사용자별 입출금 합계.
+
+    Args:
+        db: Admin DB session
+        start: 조회 시작 (시간 단위로 내림)
+        end: 조회 끝 (기본 현재)
+    """
+    end = end or datetime.now(timezone.utc)
+    start = hour_floor(start)
+    start, split = await _split_range(db, ROLLUP_CRYPTO_FLOW, start, end)
+
+    totals: dict[str, FlowTotals] = {}
+    if split > start:
+        result = await db.execute(
+            select(
+                CryptoFlowHourly.user_id,
+                func.sum(CryptoFlowHourly.deposit_count),
+                func.sum(CryptoFlowHourly.deposit_amount_usdt),
+                func.sum(CryptoFlowHourly.deposit_amount_krw),
+                func.sum(CryptoFlowHourly.withdrawal_count),
+                func.sum(CryptoFlowHourly.withdrawal_amount_usdt),
+                func.sum(CryptoFlowHourly.withdrawal_amount_krw),
+            )
+            .where(
+                and_(
+                    CryptoFlowHourly.bucket_start >= start,
+                    CryptoFlowHourly.bucket_start < split,
+                )
+            )
+            .group_by(CryptoFlowHourly.user_id)
+        )
+        for row in result.all():
+            totals[row[0]] = FlowTotals(
+                deposit_count=row[1] or 0,
+                deposit_amount_usdt=_decimal(row[2]),
+                deposit_amount_krw=_decimal(row[3]),
+                withdrawal_count=row[4] or 0,
+                withdrawal_amount_usdt=_decimal(row[5]),
+                withdrawal_amount_krw=_decimal(row[6]),
+            )
+
+    if end > split:
+        live = await aggregate_crypto_flow(db, split, end)
+        for (_, user_id), flow in live.items():
+            totals.setdefault(user_id, FlowTotals()).add(flow)
+
+    return totals
+
+
+async def revenue_by_hour(
+    admin_db: AsyncSession,
+    main_db: AsyncSession,
+    start: datetime,
+    end: Optional[datetime] = None,
+) -> dict[datetime, RevenueTotals]:
+    """버킷별 레이크 합계.
+
+    Args:
+        admin_db: Admin DB session (롤업)
+        main_db: Main DB session (워터마크 이후 원본)
+        start: 조회 시작 (시간 단위로 내림)
+        end: 조회 끝 (기본 현재)
+    """
+    end = end or datetime.now(timezone.utc)
+    start = hour_floor(start)
+    start, split = await _split_range(admin_db, ROLLUP_REVENUE, start, end)
+
+    totals: dict[datetime, RevenueTotals] = {}
+    if split > start:
+        result = await admin_db.execute(
+            select(
+                RevenueHourly.bucket_start,
+                RevenueHourly.rake,
+                RevenueHourly.hands,
+            ).where(
+                and_(
+                    RevenueHourly.bucket_start >= start,
+                    RevenueHourly.bucket_start < split,
+                )
+            )
+        )
+        for bucket, rake, hands in result.all():
+            totals[_as_utc(bucket)] = RevenueTotals(rake=_decimal(rake), hands=hands)
+
+    if end > split:
+        live = await aggregate_revenue(main_db, split, end)
+        for bucket, revenue in live.items():
+            totals.setdefault(bucket, RevenueTotals()).add(revenue)
+
+    return totals
+
+
+# ============================================================
+# Stats Rollup Service
+# ============================================================
+
+class StatsRollupService:
+    """시간 단위 롤업 테이블 유지 서비스.
+
+    refresh()는 워터마크가 속한 버킷부터 (현재 - SETTLE_DELAY)까지를
+    CHUNK_SIZE 단위로 재계산해 교체하고, 청크마다 워터마크를 커밋합니다.
+    """
+
+    def __init__(
+        self,
+        admin_session_factory: Callable[[], AsyncSession],
+        main_session_factory: Optional[Callable[[], AsyncSession]] = None,
+    ):
+        """Initialize rollup service.
+
+        Args:
+            admin_session_factory: Admin DB session factory (롤업 저장 + 입출금 원본)
+            main_session_factory: Main DB session factory (hand_history 원본)
+        """
+        self.admin_session_factory = admin_session_factory
+        self.main_session_factory = main_session_factory
+
+    async def refresh_all(self, now: Optional[datetime] = None) -> dict[str, int]:
+        """모든 롤업 증분 갱신.
+
+        Returns:
+            dict: rollup name -> 갱신한 버킷 수
+        """
+        results = {}
+        for name in ROLLUP_NAMES:
+            if name == ROLLUP_REVENUE and self.main_session_factory is None:
+                continue
+            results[name] = await self.refresh(name, now)
+        return results
+
+    async def refresh(self, name: str, now: Optional[datetime] = None) -> int:
+        """워터마크 이후 원본만 집계하여 롤업 갱신.
+
+        Args:
+            name: ROLLUP_CRYPTO_FLOW 또는 ROLLUP_REVENUE
+            now: 기준 시각 (기본 현재)
+
+        Returns:
+            int: 갱신한 버킷 행 수
+        """
+        upper = (now or datetime.now(timezone.utc)) - SETTLE_DELAY
+
+        async with self.admin_session_factory() as db:
+            watermark = await get_watermark(db, name)
+        if watermark is not None:
+            start = hour_floor(watermark)
+        else:
+            earliest = await self._earliest_source_time(name)
+            start = hour_floor(earliest) if earliest else hour_floor(upper)
+
+        written = 0
+        while start < upper:
+            chunk_end = min(start + CHUNK_SIZE, upper)
+            written += await self._process_chunk(name, start, chunk_end)
+            start = chunk_end
+
+        return written
+
+    async def rebuild(self, name: str, since: Optional[datetime] = None) -> int:
+        """롤업 재구축 (백필).
+
+        since 이후 버킷을 삭제하고 워터마크를 되돌린 뒤 refresh()로 재집계합니다.
+
+        Args:
+            name: 롤업 이름
+            since: 재구축 시작 시각 (None이면 전체)
+
+        Returns:
+            int: 갱신한 버킷 행 수
+        """
+        model = self._model(name)
+        async with self.admin_session_factory() as db:
+            query = delete(model)
+            if since is not None:
+                query = query.where(model.bucket_start >= hour_floor(since))
+            await db.execute(query)
+
+            row = await db.get(RollupWatermark, name)
+            if since is None:
+                if row is not None:
+                    await db.delete(row)
+            else:
+                current = _as_utc(row.watermark) if row else None
+                if current is None or current > hour_floor(since):
+                    await self._upsert_watermark(db, name, hour_floor(since))
+            await db.commit()
+
+        written = await self.refresh(name)
+        logger.info(f"Rollup {name} rebuilt since {since or 'beginning'}: {written} rows")
+        return written
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _model(name: str):
+        if name == ROLLUP_CRYPTO_FLOW:
+            return CryptoFlowHourly
+        if name == ROLLUP_REVENUE:
+            return RevenueHourly
+        raise ValueError(f"Unknown rollup: {name}")
+
+    async def _earliest_source_time(self, name: str) -> Optional[datetime]:
+        if name == ROLLUP_CRYPTO_FLOW:
+            async with self.admin_session_factory() as db:
+                dep = await db.execute(
+                    select(func.min(CryptoDeposit.credited_at)).where(
+                        CryptoDeposit.status == TransactionStatus.COMPLETED
+                    )
+                )
+                wd = await db.execute(
+                    select(func.min(CryptoWithdrawal.processed_at)).where(
+                        CryptoWithdrawal.status == TransactionStatus.COMPLETED
+                    )
+                )
+                candidates = [_as_utc(dep.scalar()), _as_utc(wd.scalar())]
+            candidates = [c for c in candidates if c is not None]
+            return min(candidates) if candidates else None
+
+        self._model(name)
+        async with self.main_session_factory() as main_db:
+            result = await main_db.execute(select(func.min(_hand_history.c.created_at)))
+            return _as_utc(result.scalar())
+
+    async def _process_chunk(self, name: str, start: datetime, end: datetime) -> int:
+        """[start, end) 버킷 재계산 + 교체 + 워터마크 갱신 (단일 트랜잭션)."""
+        if name == ROLLUP_REVENUE:
+            async with self.main_session_factory() as main_db:
+                revenue = await aggregate_revenue(main_db, start, end)
+
+        async with self.admin_session_factory() as db:
+            model = self._model(name)
+            await db.execute(
+                delete(model).where(
+                    and_(model.bucket_start >= start, model.bucket_start < end)
+                )
+            )
+
+            if name == ROLLUP_CRYPTO_FLOW:
+                flows = await aggregate_crypto_flow(db, start, end)
+                db.add_all(
+                    CryptoFlowHourly(
+                        bucket_start=bucket,
+                        user_id=user_id,
+                        deposit_count=flow.deposit_count,
+                        deposit_amount_usdt=flow.deposit_amount_usdt,
+                        deposit_amount_krw=flow.deposit_amount_krw,
+                        withdrawal_count=flow.withdrawal_count,
+                        withdrawal_amount_usdt=flow.withdrawal_amount_usdt,
+                        withdrawal_amount_krw=flow.withdrawal_amount_krw,
+                    )
+                    for (bucket, user_id), flow in flows.items()
+                )
+                written = len(flows)
+            else:
+                db.add_all(
+                    RevenueHourly(bucket_start=bucket, rake=totals.rake, hands=totals.hands)
+                    for bucket, totals in revenue.items()
+                )
+                written = len(revenue)
+
+            await self._upsert_watermark(db, name, end)
+            await db.commit()
+
+        return written
+
+    @staticmethod
+    async def _upsert_watermark(db: AsyncSession, name: str, watermark: datetime) -> None:
+        now = datetime.now(timezone.utc)
+        row = await db.get(RollupWatermark, name)
+        if row is None:
+            db.add(RollupWatermark(name=name, watermark=watermark, updated_at=now))
+        else:
+            row.watermark = watermark
+            row.updated_at = now
+
+
+# ============================================================
+# CLI (backfill)
+# ============================================================
+
+async def _run_rebuild(since: Optional[datetime], only: Optional[str]) -> None:
+    from app.database import AdminSessionLocal, MainSessionLocal
+
+    service = StatsRollupService(AdminSessionLocal, MainSessionLocal)
+    for name in ROLLUP_NAMES:
+        if only and name != only:
+            continue
+        written = await service.rebuild(name, since)
+        print(f"{name}: {written} bucket rows")
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Stats rollup maintenance")
+    sub = parser.add_subparsers(dest="command", required=True)
+    rebuild = sub.add_parser("rebuild", help="Rebuild rollup tables from source rows")
+    rebuild.add_argument("--since", help="Rebuild buckets from this date (YYYY-MM-DD)")
+    rebuild.add_argument("--only", choices=ROLLUP_NAMES, help="Rebuild a single rollup")
+    args = parser.parse_args(argv)
+
+    since = None
+    if args.since:
+        since = datetime.strptime(args.since, "%Y-%m-%d").replace(tzinfo=timezone.utc)
+
+    asyncio.run(_run_rebuild(since, args.only))
+
+
+if __name__ == "__main__":
+    main()
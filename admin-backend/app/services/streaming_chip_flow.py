@@ -0,0 +1,376 @@
+"""Streaming Chip Flow Detector - 스트리밍 칩 밀어주기 탐지.
+
+`fraud:hand_completed` 이벤트의 participants만으로 플레이어 쌍별
+슬라이딩 윈도우 카운터(동반 핸드 수, 승패, 칩 흐름)를 갱신합니다.
+
+ChipDumpingDetector.detect_one_way_chip_flow()는 최근 윈도우 전체를
+hand_participants self-join으로 재계산하므로 핸드마다 호출하면
+부하가 (초당 핸드 수 × 윈도우 내 핸드 수)로 증가합니다.
+이 탐지기는 핸드당 O(참가자²) 갱신만 수행하고, SQL 경로는
+주기적 정합성 검증(reconciliation)에만 사용합니다.
+
+윈도우 시각은 이벤트 timestamp(epoch 초) 기준입니다. 컨슈머 그룹이
+핸드 이벤트를 여러 admin 인스턴스에 나눠 주므로 운영에서는 쌍별
+카운터를 Redis에 두는 RedisChipFlowDetector를 사용합니다.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PairCounters:
+    """플레이어 쌍 (a < b) 윈도우 카운터."""
+
+    hands: int = 0
+    a_wins: int = 0  # b보다 a가 더 많이 가져간 핸드 수
+    b_wins: int = 0
+    a_to_b_chips: int = 0  # b가 이긴 핸드에서 a가 잃은 칩
+    b_to_a_chips: int = 0
+
+
+# 핸드 하나가 쌍에 기여한 값: (pair_key, a_won, b_won, a_to_b, b_to_a)
+_PairDelta = tuple[tuple[str, str], int, int, int, int]
+
+
+def pair_deltas(participants: list[dict[str, Any]]) -> list[_PairDelta]:
+    """핸드 참가자 정보 → 쌍(a < b)별 기여분."""
+    players = [
+        (
+            p["user_id"],
+            p.get("won_amount", 0) or 0,
+            p.get("bet_amount", 0) or 0,
+        )
+        for p in participants
+        if p.get("user_id")
+    ]
+    if len(players) < 2:
+        return []
+
+    players.sort(key=lambda p: p[0])
+    deltas: list[_PairDelta] = []
+
+    for i in range(len(players)):
+        a_id, a_won, a_bet = players[i]
+        a_lost = max(0, a_bet - a_won)
+        for j in range(i + 1, len(players)):
+            b_id, b_won, b_bet = players[j]
+            b_lost = max(0, b_bet - b_won)
+
+            a_win = 1 if a_won > b_won else 0
+            b_win = 1 if b_won > a_won else 0
+            deltas.append((
+                (a_id, b_id),
+                a_win,
+                b_win,
+                a_lost if b_win else 0,
+                b_lost if a_win else 0,
+            ))
+    return deltas
+
+
+def evaluate_pair(
+    key: tuple[str, str],
+    counters: PairCounters,
+    min_hands: int,
+    min_win_rate: float,
+) -> dict | None:
+    """쌍 카운터가 임계값을 넘으면 의심 패턴 반환 (플래그 여부는 호출자가 확인)."""
+    if counters.hands < min_hands:
+        return None
+
+    a_id, b_id = key
+    if counters.b_wins >= counters.a_wins:
+        loser_id, winner_id = a_id, b_id
+        winner_wins, chip_flow = counters.b_wins, counters.a_to_b_chips
+    else:
+        loser_id, winner_id = b_id, a_id
+        winner_wins, chip_flow = counters.a_wins, counters.b_to_a_chips
+
+    win_rate = winner_wins / counters.hands
+    if win_rate < min_win_rate:
+        return None
+
+    return {
+        "loser_id": loser_id,
+        "winner_id": winner_id,
+        "total_hands": counters.hands,
+        "winner_wins": winner_wins,
+        "win_rate": round(win_rate, 3),
+        "chip_flow": chip_flow,
+        "detection_type": "one_way_chip_flow",
+        "detection_source": "streaming",
+    }
+
+
+class StreamingChipFlowDetector:
+    """슬라이딩 윈도우 기반 일방적 칩 흐름 탐지기.
+
+    - 핸드 기여분을 시간순 deque에 보관하고 윈도우를 벗어나면 차감
+    - 임계값을 처음 넘는 시점에만 의심 쌍을 반환 (윈도우 내 중복 방지)
+    - 판정 기준은 SQL 경로(detect_one_way_chip_flow)와 동일:
+      동반 핸드 수 >= min_hands, 한쪽 승률 >= min_win_rate
+    """
+
+    def __init__(
+        self,
+        window_seconds: float = 3600,
+        min_hands: int = 3,
+        min_win_rate: float = 0.9,
+    ):
+        self.window_seconds = window_seconds
+        self.min_hands = min_hands
+        self.min_win_rate = min_win_rate
+
+        self._pairs: dict[tuple[str, str], PairCounters] = {}
+        self._window: deque[tuple[float, list[_PairDelta]]] = deque()
+        # (loser_id, winner_id) -> 플래그 시각
+        self._flagged: dict[tuple[str, str], float] = {}
+
+    @property
+    def pair_count(self) -> int:
+        """윈도우 내 추적 중인 플레이어 쌍 수."""
+        return len(self._pairs)
+
+    def process_hand(
+        self,
+        participants: list[dict[str, Any]],
+        now: float | None = None,
+    ) -> list[dict]:
+        """핸드 참가자 정보로 카운터를 갱신하고 새로 임계값을 넘은 쌍 반환.
+
+        Args:
+            participants: 이벤트의 participants (user_id, bet_amount, won_amount)
+            now: 이벤트 시각 (epoch 초, 기본 time.time())
+
+        Returns:
+            의심 패턴 목록 (detect_one_way_chip_flow와 동일한 키)
+        """
+        now = time.time() if now is None else now
+        self._expire(now)
+
+        deltas = pair_deltas(participants)
+        if not deltas:
+            return []
+        for delta in deltas:
+            self._apply(delta, 1)
+
+        self._window.append((now, deltas))
+
+        suspicious = []
+        for key, *_ in deltas:
+            pattern = self._evaluate(key, now)
+            if pattern:
+                suspicious.append(pattern)
+        return suspicious
+
+    def mark_flagged(self, loser_id: str, winner_id: str, now: float | None = None) -> None:
+        """외부 경로(SQL 정합성 검증)에서 플래그한 쌍을 기록하여 중복 방지."""
+        self._flagged[(loser_id, winner_id)] = time.time() if now is None else now
+
+    def is_flagged(self, loser_id: str, winner_id: str, now: float | None = None) -> bool:
+        """윈도우 내에 이미 플래그된 쌍인지 확인."""
+        now = time.time() if now is None else now
+        flagged_at = self._flagged.get((loser_id, winner_id))
+        return flagged_at is not None and now - flagged_at < self.window_seconds
+
+    def _apply(self, delta: _PairDelta, sign: int) -> None:
+        key, a_win, b_win, a_to_b, b_to_a = delta
+        counters = self._pairs.get(key)
+        if counters is None:
+            counters = self._pairs[key] = PairCounters()
+
+        counters.hands += sign
+        counters.a_wins += sign * a_win
+        counters.b_wins += sign * b_win
+        counters.a_to_b_chips += sign * a_to_b
+        counters.b_to_a_chips += sign * b_to_a
+
+        if counters.hands <= 0:
+            del self._pairs[key]
+
+    def _expire(self, now: float) -> None:
+        cutoff = now - self.window_seconds
+        while self._window and self._window[0][0] < cutoff:
+            _, deltas = self._window.popleft()
+            for delta in deltas:
+                self._apply(delta, -1)
+
+        if self._flagged:
+            expired = [k for k, t in self._flagged.items() if t < cutoff]
+            for key in expired:
+                del self._flagged[key]
+
+    def _evaluate(self, key: tuple[str, str], now: float) -> dict | None:
+        counters = self._pairs.get(key)
+        if counters is None:
+            return None
+        pattern = evaluate_pair(key, counters, self.min_hands, self.min_win_rate)
+        if pattern is None:
+            return None
+
+        loser_id, winner_id = pattern["loser_id"], pattern["winner_id"]
+        if self.is_flagged(loser_id, winner_id, now):
+            return None
+        self._flagged[(loser_id, winner_id)] = now
+        return pattern
+
+
+class RedisChipFlowDetector:
+    """Redis 공유 상태 기반 칩 흐름 탐지기 (여러 admin 인스턴스 공용).
+
+    - 핸드: ZSET (member=hand_id, score=이벤트 시각) + 해시 (hand_id → 기여분)
+      ZADD NX로 같은 핸드의 재전달(pending 회수)을 한 번만 반영
+    - 쌍 카운터: 쌍별 해시를 HINCRBY로 갱신 (TTL은 누수 방지용)
+    - 만료: ZREM에 성공한 인스턴스만 해당 핸드 기여분을 차감하고,
+      비워진 쌍 해시는 삭제
+    - 플래그: 쌍별 키 SET NX EX, 윈도우 동안 한 인스턴스만 플래그
+
+    두 단계 사이에 프로세스가 죽어 빠진 핸드는 SQL 정합성 검증이 보정합니다.
+    Redis를 사용할 수 없으면 로컬 StreamingChipFlowDetector로 동작합니다.
+    """
+
+    KEY_PREFIX = "fraud:chip_flow:"
+    EXPIRE_BATCH = 500  # 호출당 최대 만료 핸드 수
+
+    def __init__(
+        self,
+        redis_client: "Redis | None",
+        window_seconds: float = 3600,
+        min_hands: int = 3,
+        min_win_rate: float = 0.9,
+    ):
+        self.redis = redis_client
+        self.window_seconds = window_seconds
+        self.min_hands = min_hands
+        self.min_win_rate = min_win_rate
+        self._ttl = int(window_seconds) + 60
+        self._hands_key = self.KEY_PREFIX + "hands"
+        self._deltas_key = self.KEY_PREFIX + "hand_deltas"
+        self._local = StreamingChipFlowDetector(window_seconds, min_hands, min_win_rate)
+
+    async def process_hand(
+        self,
+        hand_id: str,
+        participants: list[dict[str, Any]],
+        now: float | None = None,
+    ) -> list[dict]:
+        """핸드 기여분을 반영하고 새로 임계값을 넘은 쌍 반환.
+
+        Args:
+            hand_id: 핸드 ID (중복 전달 제거용)
+            participants: 이벤트의 participants
+            now: 이벤트 시각 (epoch 초, 기본 time.time())
+        """
+        now = time.time() if now is None else now
+        if self.redis is not None:
+            try:
+                return await self._process_shared(hand_id, participants, now)
+            except Exception as e:
+                logger.warning(f"Chip flow Redis update failed, using local window: {e}")
+        return self._local.process_hand(participants, now=now)
+
+    async def try_flag(self, loser_id: str, winner_id: str) -> bool:
+        """윈도우 내 처음 플래그하는 쌍이면 기록하고 True."""
+        if self.redis is not None:
+            try:
+                return bool(await self.redis.set(
+                    self._flag_key(loser_id, winner_id), "1",
+                    nx=True, ex=int(self.window_seconds),
+                ))
+            except Exception as e:
+                logger.warning(f"Chip flow flag check failed, using local state: {e}")
+        if self._local.is_flagged(loser_id, winner_id):
+            return False
+        self._local.mark_flagged(loser_id, winner_id)
+        return True
+
+    async def _process_shared(
+        self,
+        hand_id: str,
+        participants: list[dict[str, Any]],
+        now: float,
+    ) -> list[dict]:
+        await self._expire(now - self.window_seconds)
+
+        deltas = pair_deltas(participants)
+        if not deltas:
+            return []
+
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.zadd(self._hands_key, {hand_id: now}, nx=True)
+        pipe.hset(self._deltas_key, hand_id, json.dumps(deltas))
+        added, _ = await pipe.execute()
+        if not added:
+            return []  # 이미 반영된 핸드
+
+        pipe = self.redis.pipeline(transaction=True)
+        for delta in deltas:
+            self._queue_delta(pipe, delta, 1)
+        results = await pipe.execute()
+
+        suspicious = []
+        for i, (key, *_) in enumerate(deltas):
+            hands, a_wins, b_wins, a_to_b, b_to_a = results[i * 6:i * 6 + 5]
+            counters = PairCounters(hands, a_wins, b_wins, a_to_b, b_to_a)
+            pattern = evaluate_pair(key, counters, self.min_hands, self.min_win_rate)
+            if pattern and await self.try_flag(pattern["loser_id"], pattern["winner_id"]):
+                suspicious.append(pattern)
+        return suspicious
+
+    async def _expire(self, cutoff: float) -> None:
+        expired = await self.redis.zrangebyscore(
+            self._hands_key, "-inf", f"({cutoff}", start=0, num=self.EXPIRE_BATCH
+        )
+        if not expired:
+            return
+
+        pipe = self.redis.pipeline(transaction=False)
+        for hand_id in expired:
+            pipe.zrem(self._hands_key, hand_id)
+        claimed = [h for h, removed in zip(expired, await pipe.execute()) if removed]
+        if not claimed:
+            return  # 다른 인스턴스가 차감
+
+        raw_deltas = await self.redis.hmget(self._deltas_key, claimed)
+        pair_keys = []
+        pipe = self.redis.pipeline(transaction=True)
+        for raw in raw_deltas:
+            for key, a_win, b_win, a_to_b, b_to_a in json.loads(raw) if raw else ():
+                pair_keys.append(self._pair_key(tuple(key)))
+                self._queue_delta(pipe, (tuple(key), a_win, b_win, a_to_b, b_to_a), -1)
+        pipe.hdel(self._deltas_key, *claimed)
+        results = await pipe.execute()
+
+        # 비워진 쌍(또는 TTL로 먼저 사라져 음수가 된 쌍) 정리
+        empty = [k for i, k in enumerate(pair_keys) if results[i * 6] <= 0]
+        if empty:
+            await self.redis.delete(*empty)
+
+    def _queue_delta(self, pipe, delta: _PairDelta, sign: int) -> None:
+        """쌍 해시 갱신 6개 명령 (hands, a_wins, b_wins, a_to_b, b_to_a, expire)."""
+        key, a_win, b_win, a_to_b, b_to_a = delta
+        pair_key = self._pair_key(key)
+        pipe.hincrby(pair_key, "hands", sign)
+        pipe.hincrby(pair_key, "a_wins", sign * a_win)
+        pipe.hincrby(pair_key, "b_wins", sign * b_win)
+        pipe.hincrby(pair_key, "a_to_b", sign * a_to_b)
+        pipe.hincrby(pair_key, "b_to_a", sign * b_to_a)
+        pipe.expire(pair_key, self._ttl)
+
+    def _pair_key(self, key: tuple[str, str]) -> str:
+        return f"{self.KEY_PREFIX}pair:{key[0]}:{key[1]}"
+
+    def _flag_key(self, loser_id: str, winner_id: str) -> str:
+        return f"{self.KEY_PREFIX}flagged:{loser_id}:{winner_id}"
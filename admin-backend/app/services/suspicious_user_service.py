@@ -12,6 +12,8 @@ from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
 
+from app.utils.pagination import Keyset, page_offset
+
 logger = logging.getLogger(__name__)
 
 
@@ -48,6 +50,7 @@ class SuspiciousUserService:
         min_score: Optional[float] = None,
         sort_by: str = "suspicion_score",
         sort_order: str = "desc",
+        cursor: Optional[str] = None,
     ) -> dict:
         """
         의심 사용자 목록 조회 (사용자 중심 통합 뷰)
@@ -61,15 +64,17 @@ class SuspiciousUserService:
             min_score: 최소 의심 점수
             sort_by: 정렬 기준 (suspicion_score, detection_count, last_detected)
             sort_order: 정렬 순서 (asc, desc)
+            cursor: 이전 응답의 next_cursor (있으면 OFFSET 없이 조회)
 
         Returns:
             의심 사용자 목록 (페이지네이션)
         """
-        offset = (page - 1) * page_size
-
         # 필터 조건 구성
         where_clauses = []
-        params = {"limit": page_size, "offset": offset}
+        params = {
+            "limit": page_size + 1,
+            "offset": page_offset(page, page_size, cursor),
+        }
 
         if detection_type:
             where_clauses.append("sa.detection_type = :detection_type")
@@ -89,7 +94,16 @@ class SuspiciousUserService:
         valid_sort_fields = ["suspicion_score", "detection_count", "last_detected"]
         if sort_by not in valid_sort_fields:
             sort_by = "suspicion_score"
-        sort_order = "DESC" if sort_order.lower() == "desc" else "ASC"
+        keyset = Keyset((sort_by, "user_id"), descending=sort_order.lower() == "desc")
+
+        # 집계 결과(user_scores)에 대한 조건: 최소 점수 + 커서 이후 행
+        score_clauses = []
+        if min_score:
+            score_clauses.append("suspicion_score >= :min_score")
+        cursor_sql = keyset.where_sql(cursor, params)
+        if cursor_sql:
+            score_clauses.append(cursor_sql)
+        score_where_sql = f"WHERE {' AND '.join(score_clauses)}" if score_clauses else ""
 
         try:
             # 사용자별 집계 쿼리
@@ -156,8 +170,8 @@ class SuspiciousUserService:
                         ELSE 'low'
                     END as max_severity
                 FROM user_scores
-                {"WHERE suspicion_score >= :min_score" if min_score else ""}
-                ORDER BY {sort_by} {sort_order}
+                {score_where_sql}
+                ORDER BY {keyset.order_by_sql()}
                 LIMIT :limit OFFSET :offset
             """)
 
@@ -165,7 +179,11 @@ class SuspiciousUserService:
                 params["min_score"] = min_score
 
             result = await self.admin_db.execute(aggregate_query, params)
-            rows = result.fetchall()
+            rows, next_cursor = keyset.page_rows(
+                result.fetchall(),
+                page_size,
+                lambda row: (getattr(row, sort_by), row.user_id),
+            )
 
             # 총 개수 조회
             count_query = text(f"""
@@ -235,6 +253,7 @@ class SuspiciousUserService:
                 "page": page,
                 "page_size": page_size,
                 "total_pages": (total + page_size - 1) // page_size if total > 0 else 0,
+                "next_cursor": next_cursor,
             }
 
         except Exception as e:
@@ -12,6 +12,7 @@ from enum import Enum
 import httpx
 
 from app.config import get_settings
+from app.utils.http_client import create_client
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -78,7 +79,7 @@ class TelegramAlertService:
     async def _get_client(self) -> httpx.AsyncClient:
         """HTTP 클라이언트 가져오기."""
         if self._client is None:
-            self._client = httpx.AsyncClient(timeout=30.0)
+            self._client = create_client(timeout=30.0)
         return self._client
 
     async def close(self) -> None:
@@ -11,12 +11,32 @@ from sqlalchemy import text
 from passlib.context import CryptContext
 
 from app.config import get_settings
+from app.utils.pagination import (
+    Keyset,
+    capped_count_sql,
+    page_offset,
+    page_response,
+)
 
 logger = logging.getLogger(__name__)
 
 # Password hashing
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# 사용자 목록 정렬 필드 → NOT NULL 정렬 표현식 (keyset 행 값 비교용)
+USER_SORT_EXPRESSIONS = {
+    "created_at": "created_at",
+    "nickname": "nickname",
+    "email": "COALESCE(email, '')",
+    "balance": "balance",
+    "updated_at": "COALESCE(updated_at, created_at)",
+}
+
+# 사용자별 이력 목록 (최신순, id 타이브레이커)
+TRANSACTIONS_KEYSET = Keyset(("created_at", "id"))
+LOGIN_HISTORY_KEYSET = Keyset(("created_at", "id"))
+USER_HANDS_KEYSET = Keyset(("hp.created_at", "hp.id"))
+
 
 class UserServiceError(Exception):
     """User Service 에러"""
@@ -57,14 +77,19 @@ class UserService:
         page_size: int = 20,
         is_banned: Optional[bool] = None,
         sort_by: str = "created_at",
-        sort_order: str = "desc"
+        sort_order: str = "desc",
+        cursor: Optional[str] = None,
     ) -> dict:
-        """사용자 검색 및 목록 조회"""
-        offset = (page - 1) * page_size
+        """사용자 검색 및 목록 조회
 
+        cursor: 이전 응답의 next_cursor (keyset 페이지네이션, OFFSET 없이 조회)
+        """
         # 기본 쿼리
         where_clauses = []
-        params = {"limit": page_size, "offset": offset}
+        params = {
+            "limit": page_size + 1,
+            "offset": page_offset(page, page_size, cursor),
+        }
 
         if search:
             where_clauses.append("""
@@ -91,15 +116,17 @@ class UserService:
             sort_by = "updated_at"
         if sort_by not in valid_sort_fields:
             sort_by = "created_at"
-        sort_order = "DESC" if sort_order.lower() == "desc" else "ASC"
+        sort_expr = USER_SORT_EXPRESSIONS[sort_by]
+        keyset = Keyset((sort_expr, "id"), descending=sort_order.lower() == "desc")
+        cursor_sql = keyset.where_sql(cursor, params)
+        page_where_sql = f"{where_sql} AND {cursor_sql}" if cursor_sql else where_sql
 
         try:
-            # 총 개수 조회
-            count_query = text(f"""
-                SELECT COUNT(*) as total
-                FROM users
-                WHERE {where_sql}
-            """)
+            # 총 개수 조회 (COUNT_CAP 초과 시 근사치)
+            count_query = text(capped_count_sql(
+                f"FROM users WHERE {where_sql}",
+                estimate_table=None if where_clauses else "users",
+            ))
             count_result = await self.db.execute(count_query, params)
             total = count_result.scalar() or 0
 
@@ -107,14 +134,17 @@ class UserService:
             list_query = text(f"""
                 SELECT
                     id, nickname, email, balance,
-                    created_at, updated_at, status
+                    created_at, updated_at, status,
+                    {sort_expr} AS sort_key
                 FROM users
-                WHERE {where_sql}
-                ORDER BY {sort_by} {sort_order}
+                WHERE {page_where_sql}
+                ORDER BY {keyset.order_by_sql()}
                 LIMIT :limit OFFSET :offset
             """)
             result = await self.db.execute(list_query, params)
-            rows = result.fetchall()
+            rows, next_cursor = keyset.page_rows(
+                result.fetchall(), page_size, lambda row: (row.sort_key, row.id)
+            )
 
             users = [
                 {
@@ -129,13 +159,7 @@ class UserService:
                 for row in rows
             ]
 
-            return {
-                "items": users,
-                "total": total,
-                "page": page,
-                "page_size": page_size,
-                "total_pages": (total + page_size - 1) // page_size
-            }
+            return page_response(users, total, page, page_size, next_cursor)
         except Exception as e:
             logger.error(f"사용자 검색 실패: search={search}, error={e}", exc_info=True)
             raise UserServiceError(f"사용자 검색 실패: {e}") from e
@@ -176,11 +200,15 @@ class UserService:
         user_id: str,
         page: int = 1,
         page_size: int = 20,
-        tx_type: Optional[str] = None
+        tx_type: Optional[str] = None,
+        cursor: Optional[str] = None,
     ) -> dict:
         """사용자 거래 내역 조회"""
-        offset = (page - 1) * page_size
-        params = {"user_id": user_id, "limit": page_size, "offset": offset}
+        params = {
+            "user_id": user_id,
+            "limit": page_size + 1,
+            "offset": page_offset(page, page_size, cursor),
+        }
         
         where_clauses = ["user_id = :user_id"]
         if tx_type:
@@ -188,11 +216,11 @@ class UserService:
             params["tx_type"] = tx_type
         
         where_sql = " AND ".join(where_clauses)
+        cursor_sql = TRANSACTIONS_KEYSET.where_sql(cursor, params)
+        page_where_sql = f"{where_sql} AND {cursor_sql}" if cursor_sql else where_sql
         
         try:
-            count_query = text(f"""
-                SELECT COUNT(*) FROM transactions WHERE {where_sql}
-            """)
+            count_query = text(capped_count_sql(f"FROM transactions WHERE {where_sql}"))
             count_result = await self.db.execute(count_query, params)
             total = count_result.scalar() or 0
             
@@ -200,12 +228,14 @@ class UserService:
                 SELECT id, type, amount, balance_before, balance_after, 
                        description, created_at
                 FROM transactions
-                WHERE {where_sql}
-                ORDER BY created_at DESC
+                WHERE {page_where_sql}
+                ORDER BY {TRANSACTIONS_KEYSET.order_by_sql()}
                 LIMIT :limit OFFSET :offset
             """)
             result = await self.db.execute(list_query, params)
-            rows = result.fetchall()
+            rows, next_cursor = TRANSACTIONS_KEYSET.page_rows(
+                result.fetchall(), page_size, lambda row: (row.created_at, row.id)
+            )
             
             items = [
                 {
@@ -220,7 +250,7 @@ class UserService:
                 for row in rows
             ]
             
-            return {"items": items, "total": total, "page": page, "page_size": page_size}
+            return page_response(items, total, page, page_size, next_cursor)
         except Exception as e:
             logger.error(f"거래 내역 조회 실패: user_id={user_id}, error={e}", exc_info=True)
             raise UserServiceError(f"거래 내역 조회 실패: {e}") from e
@@ -229,28 +259,36 @@ class UserService:
         self,
         user_id: str,
         page: int = 1,
-        page_size: int = 20
+        page_size: int = 20,
+        cursor: Optional[str] = None,
     ) -> dict:
         """사용자 로그인 기록 조회"""
-        offset = (page - 1) * page_size
-        params = {"user_id": user_id, "limit": page_size, "offset": offset}
+        params = {
+            "user_id": user_id,
+            "limit": page_size + 1,
+            "offset": page_offset(page, page_size, cursor),
+        }
+        cursor_sql = LOGIN_HISTORY_KEYSET.where_sql(cursor, params)
+        page_where_sql = "user_id = :user_id" + (f" AND {cursor_sql}" if cursor_sql else "")
         
         try:
-            count_query = text("""
-                SELECT COUNT(*) FROM login_history WHERE user_id = :user_id
-            """)
+            count_query = text(capped_count_sql(
+                "FROM login_history WHERE user_id = :user_id"
+            ))
             count_result = await self.db.execute(count_query, params)
             total = count_result.scalar() or 0
             
-            list_query = text("""
+            list_query = text(f"""
                 SELECT id, ip_address, user_agent, success, created_at
                 FROM login_history
-                WHERE user_id = :user_id
-                ORDER BY created_at DESC
+                WHERE {page_where_sql}
+                ORDER BY {LOGIN_HISTORY_KEYSET.order_by_sql()}
                 LIMIT :limit OFFSET :offset
             """)
             result = await self.db.execute(list_query, params)
-            rows = result.fetchall()
+            rows, next_cursor = LOGIN_HISTORY_KEYSET.page_rows(
+                result.fetchall(), page_size, lambda row: (row.created_at, row.id)
+            )
             
             items = [
                 {
@@ -263,7 +301,7 @@ class UserService:
                 for row in rows
             ]
             
-            return {"items": items, "total": total, "page": page, "page_size": page_size}
+            return page_response(items, total, page, page_size, next_cursor)
         except Exception as e:
             logger.error(f"로그인 기록 조회 실패: user_id={user_id}, error={e}", exc_info=True)
             raise UserServiceError(f"로그인 기록 조회 실패: {e}") from e
@@ -272,31 +310,39 @@ class UserService:
         self,
         user_id: str,
         page: int = 1,
-        page_size: int = 20
+        page_size: int = 20,
+        cursor: Optional[str] = None,
     ) -> dict:
         """사용자 핸드 기록 조회"""
-        offset = (page - 1) * page_size
-        params = {"user_id": user_id, "limit": page_size, "offset": offset}
+        params = {
+            "user_id": user_id,
+            "limit": page_size + 1,
+            "offset": page_offset(page, page_size, cursor),
+        }
+        cursor_sql = USER_HANDS_KEYSET.where_sql(cursor, params)
+        page_where_sql = "hp.user_id = :user_id" + (f" AND {cursor_sql}" if cursor_sql else "")
         
         try:
-            count_query = text("""
-                SELECT COUNT(*) FROM hand_participants WHERE user_id = :user_id
-            """)
+            count_query = text(capped_count_sql(
+                "FROM hand_participants WHERE user_id = :user_id"
+            ))
             count_result = await self.db.execute(count_query, params)
             total = count_result.scalar() or 0
             
-            list_query = text("""
+            list_query = text(f"""
                 SELECT hp.id, hp.hand_id, hp.position, hp.cards, 
                        hp.bet_amount, hp.won_amount, hp.created_at,
                        h.room_id, h.pot_size
                 FROM hand_participants hp
                 JOIN hand_history h ON hp.hand_id = h.id
-                WHERE hp.user_id = :user_id
-                ORDER BY hp.created_at DESC
+                WHERE {page_where_sql}
+                ORDER BY {USER_HANDS_KEYSET.order_by_sql()}
                 LIMIT :limit OFFSET :offset
             """)
             result = await self.db.execute(list_query, params)
-            rows = result.fetchall()
+            rows, next_cursor = USER_HANDS_KEYSET.page_rows(
+                result.fetchall(), page_size, lambda row: (row.created_at, row.id)
+            )
             
             items = [
                 {
@@ -313,7 +359,7 @@ class UserService:
                 for row in rows
             ]
 
-            return {"items": items, "total": total, "page": page, "page_size": page_size}
+            return page_response(items, total, page, page_size, next_cursor)
         except Exception as e:
             logger.error(f"핸드 기록 조회 실패: user_id={user_id}, error={e}", exc_info=True)
             raise UserServiceError(f"핸드 기록 조회 실패: {e}") from e
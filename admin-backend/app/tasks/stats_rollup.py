@@ -0,0 +1,125 @@
+"""Stats rollup refresh task.
+
+Background task that periodically folds new crypto deposit/withdrawal and
+hand_history rows into the hourly rollup tables used by the dashboard.
+
+With several admin instances, a Redis lock makes sure only one of them
+replaces rollup buckets at a time.
+"""
+
+import asyncio
+import logging
+import os
+import socket
+from typing import Callable, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.services.stats_rollup import StatsRollupService
+
+logger = logging.getLogger(__name__)
+
+ROLLUP_LOCK_KEY = "stats:rollup_lock"
+# Longer than a normal refresh; a crashed holder frees the lock after this
+ROLLUP_LOCK_TTL_SECONDS = 600
+
+# Delete the lock only if this instance still holds it
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("DEL", KEYS[1])
+end
+return 0
+"""
+
+
+class StatsRollupTask:
+    """Background task for incremental stats rollups.
+
+    Each run only reads source rows newer than the rollup watermark,
+    so the cost is proportional to new activity, not history size.
+    """
+
+    def __init__(
+        self,
+        admin_session_factory: Callable[[], AsyncSession],
+        main_session_factory: Optional[Callable[[], AsyncSession]] = None,
+        interval: int = 60,
+        redis=None,
+    ):
+        """Initialize stats rollup task.
+
+        Args:
+            admin_session_factory: Factory for admin DB sessions
+            main_session_factory: Factory for main DB sessions (revenue source)
+            interval: Seconds between refreshes (default: 60)
+            redis: Redis client for the cross-instance lock (None: no lock)
+        """
+        self.service = StatsRollupService(admin_session_factory, main_session_factory)
+        self.interval = interval
+        self.redis = redis
+        self._lock_owner = f"{socket.gethostname()}:{os.getpid()}"
+        self._running = False
+        self._consecutive_errors = 0
+
+    async def start(self):
+        """Start the refresh loop.
+
+        Runs continuously until stop() is called.
+        """
+        self._running = True
+        logger.info(f"Starting stats rollup task (interval: {self.interval}s)")
+
+        while self._running:
+            try:
+                written = await self.run_once()
+                self._consecutive_errors = 0
+                if written is not None:
+                    logger.debug(f"Stats rollup refreshed: {written}")
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                self._consecutive_errors += 1
+
+                # Log less frequently on repeated errors
+                if self._consecutive_errors <= 3 or self._consecutive_errors % 10 == 0:
+                    logger.error(
+                        f"Error refreshing stats rollup "
+                        f"(attempt {self._consecutive_errors}): {e}"
+                    )
+
+            await asyncio.sleep(self.interval)
+
+        logger.info("Stats rollup task stopped")
+
+    async def run_once(self) -> Optional[dict[str, int]]:
+        """Refresh all rollups while holding the Redis lock.
+
+        Returns:
+            Rows written per rollup, or None if another instance holds the lock
+        """
+        if self.redis is None:
+            return await self.service.refresh_all()
+
+        acquired = await self.redis.set(
+            ROLLUP_LOCK_KEY,
+            self._lock_owner,
+            nx=True,
+            ex=ROLLUP_LOCK_TTL_SECONDS,
+        )
+        if not acquired:
+            logger.debug("Stats rollup lock held by another instance, skipping")
+            return None
+
+        try:
+            return await self.service.refresh_all()
+        finally:
+            try:
+                await self.redis.eval(
+                    _RELEASE_LOCK_SCRIPT, 1, ROLLUP_LOCK_KEY, self._lock_owner
+                )
+            except Exception as e:
+                logger.warning(f"Failed to release stats rollup lock: {e}")
+
+    def stop(self):
+        """Stop the refresh loop."""
+        self._running = False
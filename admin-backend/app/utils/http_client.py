@@ -0,0 +1,230 @@
+"""공용 외부 HTTP 레이어.
+
+- 프로세스당 하나의 keep-alive 커넥션 풀 (httpx transport 공유)
+- 서비스별 클라이언트는 헤더/타임아웃만 다르고 풀은 공유
+- upstream(host)별 지연 시간 / 오류 지표
+- 환율 등 조회용 stale-while-revalidate 캐시 + 동시 요청 합치기(coalescing)
+
+backend/app/utils/http_client.py와 같은 구조입니다 (두 백엔드는 별도 배포).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Awaitable, Callable
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+POOL_MAX_CONNECTIONS = 100
+POOL_MAX_KEEPALIVE = 20
+POOL_KEEPALIVE_EXPIRY = 30.0  # seconds
+
+
+# ============================================================
+# Upstream Metrics
+# ============================================================
+
+@dataclass
+class UpstreamStats:
+    """upstream(host)별 누적 지표."""
+
+    requests: int = 0
+    errors: int = 0  # 네트워크 오류 + 5xx
+    total_latency_ms: float = 0.0
+    max_latency_ms: float = 0.0
+    last_error: str | None = None
+
+    def record(self, latency_ms: float, error: str | None) -> None:
+        self.requests += 1
+        self.total_latency_ms += latency_ms
+        self.max_latency_ms = max(self.max_latency_ms, latency_ms)
+        if error:
+            self.errors += 1
+            self.last_error = error
+
+    def to_dict(self) -> dict[str, Any]:
+        data = asdict(self)
+        data["avg_latency_ms"] = (
+            round(self.total_latency_ms / self.requests, 2) if self.requests else 0.0
+        )
+        data["total_latency_ms"] = round(self.total_latency_ms, 2)
+        data["max_latency_ms"] = round(self.max_latency_ms, 2)
+        return data
+
+
+_upstream_stats: dict[str, UpstreamStats] = {}
+
+
+def get_upstream_stats() -> dict[str, dict[str, Any]]:
+    """host -> 지표 스냅샷."""
+    return {host: stats.to_dict() for host, stats in _upstream_stats.items()}
+
+
+def _record(host: str, latency_ms: float, error: str | None) -> None:
+    stats = _upstream_stats.get(host)
+    if stats is None:
+        stats = _upstream_stats[host] = UpstreamStats()
+    stats.record(latency_ms, error)
+
+
+# ============================================================
+# Shared Connection Pool
+# ============================================================
+
+class _PooledTransport(httpx.AsyncBaseTransport):
+    """공유 풀을 감싸 지표를 기록하는 transport.
+
+    클라이언트가 닫혀도 풀은 유지됩니다 (close_http_pool()에서만 종료).
+    """
+
+    def __init__(self, pool: httpx.AsyncHTTPTransport):
+        self._pool = pool
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        started = time.perf_counter()
+        host = request.url.host
+        try:
+            response = await self._pool.handle_async_request(request)
+        except Exception as e:
+            _record(host, (time.perf_counter() - started) * 1000, type(e).__name__)
+            raise
+        error = f"HTTP {response.status_code}" if response.status_code >= 500 else None
+        _record(host, (time.perf_counter() - started) * 1000, error)
+        return response
+
+    async def aclose(self) -> None:
+        pass
+
+
+_pool: httpx.AsyncHTTPTransport | None = None
+_pool_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _get_pool() -> httpx.AsyncHTTPTransport:
+    """이벤트 루프당 하나의 커넥션 풀."""
+    global _pool, _pool_loop
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+
+    if _pool is None or (loop is not None and loop is not _pool_loop):
+        _pool = httpx.AsyncHTTPTransport(
+            limits=httpx.Limits(
+                max_connections=POOL_MAX_CONNECTIONS,
+                max_keepalive_connections=POOL_MAX_KEEPALIVE,
+                keepalive_expiry=POOL_KEEPALIVE_EXPIRY,
+            ),
+        )
+        _pool_loop = loop
+    return _pool
+
+
+def create_client(
+    timeout: float | httpx.Timeout = 10.0,
+    headers: dict[str, str] | None = None,
+    **kwargs: Any,
+) -> httpx.AsyncClient:
+    """공유 풀을 사용하는 httpx.AsyncClient 생성.
+
+    Args:
+        timeout: 요청 타임아웃
+        headers: 기본 헤더 (API 키 등)
+        **kwargs: httpx.AsyncClient 추가 인자
+    """
+    return httpx.AsyncClient(
+        timeout=timeout,
+        headers=headers,
+        transport=_PooledTransport(_get_pool()),
+        **kwargs,
+    )
+
+
+async def close_http_pool() -> None:
+    """공유 커넥션 풀 종료 (앱 종료 시)."""
+    global _pool, _pool_loop
+    if _pool is not None:
+        await _pool.aclose()
+        _pool = None
+        _pool_loop = None
+
+
+# ============================================================
+# Stale-While-Revalidate Cache
+# ============================================================
+
+class SWRCache:
+    """프로세스 내 stale-while-revalidate 캐시.
+
+    - ttl 이내: 캐시 값 반환
+    - ttl ~ ttl + stale_ttl: 캐시 값을 즉시 반환하고 백그라운드 갱신
+    - 그 이후 / 없음: 로드 완료까지 대기
+    같은 키의 동시 로드는 하나의 요청으로 합쳐집니다.
+    """
+
+    def __init__(self):
+        self._values: dict[str, tuple[Any, float]] = {}  # key -> (value, loaded_at)
+        self._inflight: dict[str, asyncio.Task] = {}
+
+    async def get(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: float,
+        stale_ttl: float = 0.0,
+    ) -> Any:
+        entry = self._values.get(key)
+        if entry is not None:
+            value, loaded_at = entry
+            age = time.monotonic() - loaded_at
+            if age < ttl:
+                return value
+            if age < ttl + stale_ttl:
+                self._refresh(key, loader, background=True)
+                return value
+
+        return await asyncio.shield(self._refresh(key, loader))
+
+    def invalidate(self, key: str) -> None:
+        self._values.pop(key, None)
+
+    def clear(self) -> None:
+        self._values.clear()
+        self._inflight.clear()
+
+    def _refresh(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        background: bool = False,
+    ) -> asyncio.Task:
+        task = self._inflight.get(key)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.create_task(self._load(key, loader))
+            self._inflight[key] = task
+            if background:
+                task.add_done_callback(_log_background_error)
+        return task
+
+    async def _load(self, key: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+        try:
+            value = await loader()
+            self._values[key] = (value, time.monotonic())
+            return value
+        finally:
+            if self._inflight.get(key) is asyncio.current_task():
+                del self._inflight[key]
+
+
+def _log_background_error(task: asyncio.Task) -> None:
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning(f"Background refresh failed, serving stale value: {task.exception()}")
+
+
+# 환율 조회 공용 캐시
+rate_cache = SWRCache()
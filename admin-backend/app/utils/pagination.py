@@ -0,0 +1,211 @@
+"""Keyset(커서) 페이지네이션 공용 레이어.
+
+OFFSET 페이지네이션은 깊은 페이지일수록 앞선 행을 모두 읽고 버리고,
+별도 COUNT(*)는 대형 테이블에서 전체 스캔이 됩니다.
+
+- 불투명 커서: 마지막 행의 정렬 키를 base64url로 인코딩 (정렬 스펙 포함)
+- 안정 정렬: 정렬 컬럼 + 유일 키(id) 타이브레이커, 행 값 비교로 다음 페이지 조회
+  (정렬 컬럼 인덱스만 있으면 몇 번째 페이지든 page 1과 같은 비용)
+- 근사 개수: COUNT_CAP까지만 정확히 세고, 넘으면 추정치 (total_is_estimate)
+
+기존 page/page_size 응답 형식은 유지하고 next_cursor / total_is_estimate를
+추가합니다. cursor 없이 page > 1을 요청하면 기존처럼 OFFSET으로 조회합니다.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Callable, Sequence
+from uuid import UUID
+
+from sqlalchemy import Select, case, func, literal, literal_column, select, tuple_
+
+# 정확히 세는 최대 행 수 (초과 시 근사치)
+COUNT_CAP = 10_000
+
+
+class InvalidCursorError(ValueError):
+    """디코딩할 수 없거나 다른 정렬 스펙으로 만든 커서"""
+    pass
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"$dt": value.isoformat()}
+    if isinstance(value, Decimal):
+        return {"$dec": str(value)}
+    if isinstance(value, UUID):
+        return {"$uuid": str(value)}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        if "$dt" in value:
+            return datetime.fromisoformat(value["$dt"])
+        if "$dec" in value:
+            return Decimal(value["$dec"])
+        if "$uuid" in value:
+            return UUID(value["$uuid"])
+    return value
+
+
+@dataclass(frozen=True)
+class Keyset:
+    """정렬 스펙.
+
+    columns: 정렬 컬럼 (raw SQL 표현식 문자열 또는 ORM 컬럼).
+             마지막 컬럼은 유일 키여야 하며, 모든 컬럼은 NOT NULL이어야 함
+             (nullable 컬럼은 COALESCE로 감싸서 전달)
+    descending: 모든 컬럼에 같은 방향 적용 (행 값 비교 조건)
+    """
+
+    columns: tuple[Any, ...]
+    descending: bool = True
+
+    @property
+    def _tag(self) -> str:
+        direction = "d" if self.descending else "a"
+        return ",".join(str(c) for c in self.columns) + ":" + direction
+
+    # ------------------------------------------------------------
+    # Cursor encoding
+    # ------------------------------------------------------------
+
+    def encode(self, values: Sequence[Any]) -> str:
+        payload = {"k": self._tag, "v": [_encode_value(v) for v in values]}
+        raw = json.dumps(payload, separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    def decode(self, cursor: str) -> list[Any]:
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            values = [_decode_value(v) for v in payload["v"]]
+            tag = payload["k"]
+        except (ValueError, KeyError, TypeError) as e:
+            raise InvalidCursorError("Invalid cursor") from e
+        if tag != self._tag or len(values) != len(self.columns):
+            raise InvalidCursorError("Cursor does not match the requested sort")
+        return values
+
+    # ------------------------------------------------------------
+    # Raw SQL (text) queries
+    # ------------------------------------------------------------
+
+    def order_by_sql(self) -> str:
+        direction = "DESC" if self.descending else "ASC"
+        return ", ".join(f"{c} {direction}" for c in self.columns)
+
+    def where_sql(self, cursor: str | None, params: dict) -> str | None:
+        """커서 이후 행 조건 (params에 :_k0.. 바인딩 추가). 커서 없으면 None."""
+        if not cursor:
+            return None
+        values = self.decode(cursor)
+        names = []
+        for i, value in enumerate(values):
+            params[f"_k{i}"] = value
+            names.append(f":_k{i}")
+        op = "<" if self.descending else ">"
+        return f"({', '.join(self.columns)}) {op} ({', '.join(names)})"
+
+    # ------------------------------------------------------------
+    # ORM (select) queries
+    # ------------------------------------------------------------
+
+    def apply(self, query: Select, cursor: str | None) -> Select:
+        """ORM 쿼리에 커서 조건과 정렬 적용."""
+        if cursor:
+            values = self.decode(cursor)
+            row = tuple_(*self.columns)
+            after = tuple_(*(literal(v, c.type) for c, v in zip(self.columns, values)))
+            query = query.where(row < after if self.descending else row > after)
+        return query.order_by(
+            *(c.desc() if self.descending else c.asc() for c in self.columns)
+        )
+
+    # ------------------------------------------------------------
+    # Page assembly
+    # ------------------------------------------------------------
+
+    def page_rows(
+        self,
+        rows: Sequence[Any],
+        page_size: int,
+        key: Callable[[Any], Sequence[Any]],
+    ) -> tuple[list[Any], str | None]:
+        """page_size + 1개 조회 결과에서 페이지와 다음 커서 분리."""
+        rows = list(rows)
+        if len(rows) <= page_size:
+            return rows, None
+        rows = rows[:page_size]
+        return rows, self.encode(key(rows[-1]))
+
+
+def page_offset(page: int, page_size: int, cursor: str | None) -> int:
+    """커서가 있으면 0, 없으면 기존 OFFSET (하위 호환)."""
+    return 0 if cursor else (page - 1) * page_size
+
+
+def capped_count_sql(from_where_sql: str, estimate_table: str | None = None) -> str:
+    """COUNT_CAP까지만 세는 COUNT 쿼리 (raw SQL).
+
+    from_where_sql: "FROM ... WHERE ..." 부분
+    estimate_table: 필터 없는 전체 목록일 때 상한 초과 시 pg_class.reltuples 추정치 사용
+    """
+    capped = (
+        f"SELECT COUNT(*) AS n FROM (SELECT 1 {from_where_sql} "
+        f"LIMIT {COUNT_CAP}) AS capped"
+    )
+    if estimate_table is None:
+        return f"SELECT c.n FROM ({capped}) AS c"
+    return (
+        f"SELECT CASE WHEN c.n < {COUNT_CAP} THEN c.n ELSE GREATEST(c.n, "
+        f"COALESCE((SELECT reltuples::bigint FROM pg_class "
+        f"WHERE oid = to_regclass('{estimate_table}')), 0)) END "
+        f"FROM ({capped}) AS c"
+    )
+
+
+def capped_count_query(query: Select, estimate_table: str | None = None) -> Select:
+    """COUNT_CAP까지만 세는 COUNT 쿼리 (ORM)."""
+    capped = (
+        select(func.count())
+        .select_from(query.order_by(None).limit(COUNT_CAP).subquery())
+        .scalar_subquery()
+    )
+    if estimate_table is None:
+        return select(capped)
+    estimate = literal_column(
+        f"(SELECT reltuples::bigint FROM pg_class "
+        f"WHERE oid = to_regclass('{estimate_table}'))"
+    )
+    return select(
+        case(
+            (capped < COUNT_CAP, capped),
+            else_=func.greatest(capped, func.coalesce(estimate, 0)),
+        )
+    )
+
+
+def page_response(
+    items: list,
+    total: int,
+    page: int,
+    page_size: int,
+    next_cursor: str | None,
+) -> dict:
+    """기존 페이지네이션 응답 + next_cursor / total_is_estimate."""
+    return {
+        "items": items,
+        "total": total,
+        "page": page,
+        "page_size": page_size,
+        "total_pages": (total + page_size - 1) // page_size if total > 0 else 1,
+        "next_cursor": next_cursor,
+        "total_is_estimate": total >= COUNT_CAP,
+    }
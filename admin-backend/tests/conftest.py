@@ -118,3 +118,13 @@ def unauthenticated_client():
 
     # Clear overrides after test
     app.dependency_overrides.clear()
+
+
+@pytest.fixture(autouse=True)
+def _reset_rate_cache():
+    """프로세스 공용 환율 캐시를 테스트마다 비움"""
+    from app.utils.http_client import rate_cache
+
+    rate_cache.clear()
+    yield
+    rate_cache.clear()
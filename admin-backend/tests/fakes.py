@@ -0,0 +1,365 @@
+"""
+테스트용 In-memory TON / KMS / Redis 구현
+
+네트워크나 키 저장소 없이 출금·입금 파이프라인과 Redis 공유 상태를
+검증하기 위한 fake들입니다.
+"""
+import asyncio
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, List, Optional
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+from redis.exceptions import WatchError
+
+from app.services.crypto.kms_service import KeyManagementService, SignatureResult
+from app.services.crypto.ton_client import JettonTransfer
+from app.services.crypto.ton_signer import (
+    MIN_TON_FOR_GAS,
+    TON_DECIMALS,
+    SignedTransfer,
+    TonSigner,
+    TransactionResult,
+)
+
+
+class FakeKmsProvider(KeyManagementService):
+    """In-memory KMS with a random Ed25519 key, for tests.
+
+    Optional sign_delay simulates remote signing latency.
+    """
+
+    def __init__(self, sign_delay: float = 0.0):
+        self._key = Ed25519PrivateKey.generate()
+        self.sign_delay = sign_delay
+        self.sign_calls = 0
+
+    async def get_public_key(self, key_id: str = "hot_wallet") -> bytes:
+        return self._key.public_key().public_bytes(
+            encoding=serialization.Encoding.Raw,
+            format=serialization.PublicFormat.Raw
+        )
+
+    async def sign(self, data: bytes, key_id: str = "hot_wallet") -> SignatureResult:
+        self.sign_calls += 1
+        if self.sign_delay:
+            await asyncio.sleep(self.sign_delay)
+        return SignatureResult(
+            signature=self._key.sign(data),
+            public_key=await self.get_public_key(key_id),
+        )
+
+    async def close(self) -> None:
+        pass
+
+
+class FakeTonSigner(TonSigner):
+    """In-memory TON wallet for tests.
+
+    Signs through the given KMS (FakeKmsProvider by default) but replaces
+    the network calls. The fake wallet enforces TON seqno rules: a message
+    is accepted only with the current seqno, and rebroadcasting an
+    accepted message is a no-op that returns the same hash. Like the real
+    chain, an accepted message is included (seqno advances) only after
+    inclusion_delay, and the next seqno is rejected until then.
+    """
+
+    def __init__(
+        self,
+        kms: Optional[KeyManagementService] = None,
+        wallet_address: str = "0:" + "11" * 32,
+        ton_balance: int = 100 * 10 ** TON_DECIMALS,
+        broadcast_delay: float = 0.0,
+        inclusion_delay: float = 0.01,
+    ):
+        super().__init__(
+            kms=kms or FakeKmsProvider(),
+            wallet_address=wallet_address,
+            network="testnet",
+        )
+        self.seqno = 0
+        self.ton_balance = ton_balance
+        self.broadcast_delay = broadcast_delay
+        self.inclusion_delay = inclusion_delay
+        self.sent: list[SignedTransfer] = []  # accepted, in seqno order
+        self.pending: Optional[SignedTransfer] = None  # accepted, not yet included
+        self.broadcast_calls = 0
+        self.fail_next = 0  # reject the next N broadcasts
+        self.lose_next_response = 0  # accept but report failure (lost response)
+
+    async def _get_jetton_wallet_address(
+        self,
+        owner_address: str,
+        jetton_master: str,
+    ) -> Optional[str]:
+        return "0:" + "22" * 32
+
+    async def _get_ton_balance(self) -> int:
+        return self.ton_balance
+
+    async def _get_seqno(self, strict: bool = False) -> int:
+        return self.seqno
+
+    async def broadcast(self, signed: SignedTransfer) -> TransactionResult:
+        self.broadcast_calls += 1
+        if self.broadcast_delay:
+            await asyncio.sleep(self.broadcast_delay)
+
+        if any(sent.tx_hash == signed.tx_hash for sent in self.sent):
+            return TransactionResult(True, signed.tx_hash, "Already accepted")
+
+        if self.fail_next:
+            self.fail_next -= 1
+            return TransactionResult(False, None, "HTTP error: 503")
+
+        if signed.seqno != self.seqno:
+            return TransactionResult(
+                False, None, f"seqno mismatch: expected {self.seqno}, got {signed.seqno}"
+            )
+
+        if self.pending is not None:
+            return TransactionResult(
+                False, None, f"seqno {signed.seqno} already used by a pending message"
+            )
+
+        self.sent.append(signed)
+        self.pending = signed
+        asyncio.get_running_loop().call_later(self.inclusion_delay, self._include)
+
+        if self.lose_next_response:
+            self.lose_next_response -= 1
+            return TransactionResult(False, None, "Broadcast error: timeout")
+
+        return TransactionResult(True, signed.tx_hash, "Transaction sent successfully")
+
+    def _include(self) -> None:
+        self.pending = None
+        self.seqno += 1
+        self.ton_balance -= MIN_TON_FOR_GAS
+
+    async def settle(self) -> None:
+        """Wait until the pending message (if any) is included."""
+        while self.pending is not None:
+            await asyncio.sleep(self.inclusion_delay)
+
+    async def get_balance(self, address: Optional[str] = None) -> Decimal:
+        return Decimal("1000000")
+
+
+class FakeTonClient:
+    """In-memory TON client for tests.
+    
+    Implements the subset of TonClient used by TonDepositMonitor.
+    Transfers are returned in logical-time order, honoring after_lt.
+    """
+    
+    def __init__(self, wallet_address: str = "EQ_FAKE_HOT_WALLET"):
+        self.wallet_address = wallet_address
+        self.transfers: List[JettonTransfer] = []
+        self.calls = 0  # get_jetton_transfers call count
+        self.closed = False
+        self._next_lt = 1
+    
+    def add_transfer(
+        self,
+        amount: Decimal,
+        memo: Optional[str] = None,
+        sender: str = "EQ_FAKE_SENDER",
+        tx_hash: Optional[str] = None,
+    ) -> JettonTransfer:
+        """Append a transfer to the fake wallet history."""
+        lt = self._next_lt
+        self._next_lt += 1
+        transfer = JettonTransfer(
+            tx_hash=tx_hash or f"fake_tx_{lt}",
+            sender=sender,
+            recipient=self.wallet_address,
+            amount=Decimal(amount),
+            memo=memo,
+            timestamp=datetime.now(),
+            lt=lt,
+        )
+        self.transfers.append(transfer)
+        return transfer
+    
+    async def get_jetton_transfers(
+        self,
+        wallet_address: Optional[str] = None,
+        limit: int = 100,
+        after_lt: Optional[int] = None,
+    ) -> List[JettonTransfer]:
+        self.calls += 1
+        result = [t for t in self.transfers if after_lt is None or t.lt > after_lt]
+        return result[:limit]
+    
+    async def close(self):
+        self.closed = True
+
+
+class FakeRedis:
+    """Subset of redis.asyncio.Redis used by the fraud consumer (strings,
+    hashes, sorted sets, pipelines with WATCH/MULTI). TTLs are recorded,
+    not enforced. Every write bumps the key version so WATCH can detect
+    concurrent modification.
+    """
+
+    def __init__(self):
+        self.data: dict[str, Any] = {}
+        self.ttls: dict[str, int] = {}
+        self.versions: dict[str, int] = {}
+
+    def _touch(self, key: str) -> None:
+        self.versions[key] = self.versions.get(key, 0) + 1
+
+    def pipeline(self, transaction: bool = True) -> "FakePipeline":
+        return FakePipeline(self)
+
+    async def get(self, key):
+        value = self.data.get(key)
+        await asyncio.sleep(0)  # round trip: concurrent callers may write meanwhile
+        return value
+
+    async def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        if ex:
+            self.ttls[key] = ex
+        self._touch(key)
+        return True
+
+    async def delete(self, *keys):
+        removed = 0
+        for key in keys:
+            if self.data.pop(key, None) is not None:
+                removed += 1
+                self._touch(key)
+        return removed
+
+    async def exists(self, key):
+        return int(key in self.data)
+
+    async def expire(self, key, seconds):
+        if key not in self.data:
+            return False
+        self.ttls[key] = seconds
+        return True
+
+    async def hincrby(self, key, field, amount=1):
+        h = self.data.setdefault(key, {})
+        h[field] = h.get(field, 0) + amount
+        self._touch(key)
+        return h[field]
+
+    async def hset(self, key, field, value):
+        h = self.data.setdefault(key, {})
+        new = field not in h
+        h[field] = value
+        self._touch(key)
+        return int(new)
+
+    async def hget(self, key, field):
+        return self.data.get(key, {}).get(field)
+
+    async def hmget(self, key, fields):
+        h = self.data.get(key, {})
+        return [h.get(f) for f in fields]
+
+    async def hdel(self, key, *fields):
+        h = self.data.get(key, {})
+        removed = sum(1 for f in fields if h.pop(f, None) is not None)
+        if not h:
+            self.data.pop(key, None)
+        self._touch(key)
+        return removed
+
+    async def zadd(self, key, mapping, nx=False):
+        z = self.data.setdefault(key, {})
+        added = 0
+        for member, score in mapping.items():
+            if member in z:
+                if nx:
+                    continue
+            else:
+                added += 1
+            z[member] = score
+        self._touch(key)
+        return added
+
+    async def zrangebyscore(self, key, min, max, start=None, num=None):
+        def bound(value, default):
+            if value in ("-inf", "+inf"):
+                return float(value), False
+            if isinstance(value, str) and value.startswith("("):
+                return float(value[1:]), True
+            return float(value), False
+
+        lo, lo_open = bound(min, None)
+        hi, hi_open = bound(max, None)
+        members = sorted(self.data.get(key, {}).items(), key=lambda item: item[1])
+        result = [
+            m for m, score in members
+            if (score > lo if lo_open else score >= lo)
+            and (score < hi if hi_open else score <= hi)
+        ]
+        if start is not None and num is not None:
+            result = result[start:start + num]
+        return result
+
+    async def zrem(self, key, *members):
+        z = self.data.get(key, {})
+        removed = sum(1 for m in members if z.pop(m, None) is not None)
+        self._touch(key)
+        return removed
+
+
+class FakePipeline:
+    """Queues commands until execute(); supports WATCH/MULTI semantics."""
+
+    def __init__(self, redis: FakeRedis):
+        self._redis = redis
+        self._commands: list[tuple[str, tuple, dict]] = []
+        self._watched: dict[str, int] = {}
+        self._immediate = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.reset()
+
+    async def watch(self, *keys):
+        self._immediate = True
+        for key in keys:
+            self._watched[key] = self._redis.versions.get(key, 0)
+
+    def multi(self):
+        self._immediate = False
+
+    async def reset(self):
+        self._commands.clear()
+        self._watched.clear()
+        self._immediate = False
+
+    async def execute(self):
+        for key, version in self._watched.items():
+            if self._redis.versions.get(key, 0) != version:
+                await self.reset()
+                raise WatchError("Watched variable changed.")
+        results = []
+        for name, args, kwargs in self._commands:
+            results.append(await getattr(self._redis, name)(*args, **kwargs))
+        await self.reset()
+        return results
+
+    def __getattr__(self, name):
+        command = getattr(self._redis, name)
+
+        def queue(*args, **kwargs):
+            if self._immediate:
+                return command(*args, **kwargs)
+            self._commands.append((name, args, kwargs))
+            return self
+
+        return queue
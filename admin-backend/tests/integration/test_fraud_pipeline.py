@@ -364,7 +364,7 @@ class TestConsumerLifecycle:
         
         # Just verify the consumer can be created
         assert consumer._running is False
-        assert consumer._pubsub is None
+        assert consumer._workers == []
 
     @pytest.mark.asyncio
     async def test_consumer_initial_state(
@@ -383,4 +383,4 @@ class TestConsumerLifecycle:
         # Verify initial state
         assert consumer._running is False
         assert consumer._task is None
-        assert consumer._action_buffer == {}
+        assert consumer._timing_store._local == {}
@@ -186,3 +186,36 @@ class TestRunBotDetection:
         assert "response_analysis" in detection_result
         assert "action_analysis" in detection_result
         assert "session_analysis" in detection_result
+
+
+class TestRunStreamingBotDetection:
+    """run_streaming_bot_detection 메서드 테스트"""
+
+    @pytest.fixture
+    def service(self):
+        return BotDetector(AsyncMock(), AsyncMock())
+
+    @pytest.mark.asyncio
+    async def test_matches_buffer_based_detection(self, service):
+        """롤링 통계 기반 결과가 버퍼 전체 재계산 결과와 동일"""
+        from app.services.response_time_stats import RollingTimingStats
+
+        response_times = [480 + (i * 7) % 40 for i in range(20)]
+        actions = ["fold"] * 17 + ["call"] * 3
+        stats = RollingTimingStats(window=20)
+        for rt, action in zip(response_times, actions):
+            stats.add(rt, action)
+
+        streaming = await service.run_streaming_bot_detection("user-1", stats)
+        buffered = await service.run_realtime_bot_detection(
+            "user-1",
+            response_times,
+            {"total": 20, "fold": 17, "call": 3},
+        )
+
+        assert streaming["suspicion_score"] == buffered["suspicion_score"]
+        assert streaming["reasons"] == buffered["reasons"]
+        assert streaming["is_likely_bot"] is True
+        assert streaming["response_analysis"]["std_dev_ms"] == (
+            buffered["response_analysis"]["std_dev_ms"]
+        )
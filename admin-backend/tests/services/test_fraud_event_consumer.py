@@ -17,10 +17,12 @@ from app.services.fraud_event_consumer import (
     CHANNEL_HAND_COMPLETED,
     CHANNEL_PLAYER_ACTION,
     CHANNEL_PLAYER_STATS,
+    STREAM_WORKERS,
     FraudEventConsumer,
     get_fraud_consumer,
     init_fraud_consumer,
 )
+from tests.fakes import FakeRedis
 
 
 class TestFraudEventConsumerInit:
@@ -42,6 +44,17 @@ class TestFraudEventConsumerInit:
         assert consumer._running is False
         assert consumer._task is None
 
+    def test_default_consumer_name_unique_per_process(self):
+        """같은 호스트의 워커 프로세스들이 컨슈머 이름을 공유하지 않음."""
+        import os
+        import socket
+
+        consumer = FraudEventConsumer(MagicMock(), MagicMock(), MagicMock())
+
+        assert consumer.consumer_name == f"{socket.gethostname()}:{os.getpid()}"
+        named = FraudEventConsumer(MagicMock(), MagicMock(), MagicMock(), consumer_name="a1")
+        assert named.consumer_name == "a1"
+
     def test_global_instance(self):
         """글로벌 인스턴스 초기화 테스트."""
         mock_redis = MagicMock()
@@ -57,54 +70,89 @@ class TestFraudEventConsumerInit:
         assert get_fraud_consumer() is consumer
 
 
+class StreamMockRedis:
+    """Redis Streams 컨슈머 그룹 명령을 흉내내는 mock."""
+
+    def __init__(self):
+        self.groups: list[tuple] = []
+        self.acked: list[tuple] = []
+        self.reads: list[tuple] = []
+        self.pending: dict[str, list] = {}
+        self.new: dict[str, list] = {}
+        self.claimable: dict[str, list] = {}
+        self.set = AsyncMock(return_value=True)
+
+    async def xgroup_create(self, stream, group, id="0", mkstream=False):
+        if (stream, group) in self.groups:
+            raise Exception("BUSYGROUP Consumer Group name already exists")
+        self.groups.append((stream, group))
+
+    async def xreadgroup(self, groupname, consumername, streams, count=None, block=None):
+        (stream, read_id), = streams.items()
+        self.reads.append((stream, consumername, read_id))
+        source = self.pending if read_id == "0" else self.new
+        messages = source.pop(stream, [])
+        if not messages:
+            await asyncio.sleep(0.01)
+            return []
+        return [(stream, messages)]
+
+    async def xack(self, stream, group, *ids):
+        self.acked.append((stream, ids))
+
+    async def xautoclaim(self, stream, group, consumer, min_idle_time, start_id="0-0", count=None):
+        return ["0-0", self.claimable.pop(stream, []), []]
+
+    async def xinfo_groups(self, stream):
+        return [{"name": "fraud-detectors", "pending": 3, "lag": 7}]
+
+
+def entry(message_id: str, event: dict) -> tuple:
+    return (message_id, {"data": json.dumps(event)})
+
+
 class TestStartStop:
     """시작/중지 테스트."""
 
     @pytest.mark.asyncio
     async def test_start(self):
-        """시작 테스트."""
-        mock_pubsub = AsyncMock()
-        mock_pubsub.subscribe = AsyncMock()
-        mock_pubsub.unsubscribe = AsyncMock()
-        mock_pubsub.close = AsyncMock()
-        mock_pubsub.get_message = AsyncMock(return_value=None)
-        
-        mock_redis = MagicMock()
-        mock_redis.pubsub = MagicMock(return_value=mock_pubsub)
-        
+        """시작 시 스트림별 컨슈머 그룹 생성 및 워커 시작."""
+        mock_redis = StreamMockRedis()
         consumer = FraudEventConsumer(
             mock_redis,
             MagicMock(),
             MagicMock(),
+            consumer_name="admin-1",
         )
         
         await consumer.start()
         
         assert consumer._running is True
-        assert consumer._pubsub is mock_pubsub
-        
-        mock_pubsub.subscribe.assert_called_once_with(
+        assert [s for s, _ in mock_redis.groups] == [
             CHANNEL_HAND_COMPLETED,
             CHANNEL_PLAYER_ACTION,
             CHANNEL_PLAYER_STATS,
-        )
+        ]
+        assert len(consumer._workers) == sum(STREAM_WORKERS.values())
         
         await consumer.stop()
 
+    @pytest.mark.asyncio
+    async def test_start_with_existing_group(self):
+        """그룹이 이미 있으면 BUSYGROUP 무시."""
+        mock_redis = StreamMockRedis()
+        mock_redis.groups.append((CHANNEL_PLAYER_ACTION, "fraud-detectors"))
+        consumer = FraudEventConsumer(mock_redis, MagicMock(), MagicMock())
+
+        await consumer.start()
+        assert consumer._running is True
+        await consumer.stop()
+
     @pytest.mark.asyncio
     async def test_stop(self):
         """중지 테스트."""
-        mock_pubsub = AsyncMock()
-        mock_pubsub.subscribe = AsyncMock()
-        mock_pubsub.unsubscribe = AsyncMock()
-        mock_pubsub.close = AsyncMock()
-        mock_pubsub.get_message = AsyncMock(return_value=None)
-        
-        mock_redis = MagicMock()
-        mock_redis.pubsub = MagicMock(return_value=mock_pubsub)
-        
         consumer = FraudEventConsumer(
-            mock_redis,
+            StreamMockRedis(),
             MagicMock(),
             MagicMock(),
         )
@@ -113,10 +161,139 @@ class TestStartStop:
         await consumer.stop()
         
         assert consumer._running is False
-        assert consumer._pubsub is None
+        assert consumer._workers == []
         assert consumer._task is None
 
 
+class TestStreamTransport:
+    """Redis Streams 컨슈머 그룹 전송 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_pending_entries_replayed_before_new(self):
+        """재시작 시 자신의 pending 엔트리를 먼저 처리하고 일괄 ACK."""
+        mock_redis = StreamMockRedis()
+        mock_redis.pending[CHANNEL_PLAYER_STATS] = [
+            entry("1-0", {"event_type": "player_stats", "user_id": "u1"}),
+        ]
+        mock_redis.new[CHANNEL_PLAYER_STATS] = [
+            entry("2-0", {"event_type": "player_stats", "user_id": "u2"}),
+            entry("3-0", {"event_type": "player_stats", "user_id": "u3"}),
+        ]
+        consumer = FraudEventConsumer(
+            mock_redis, MagicMock(), MagicMock(), consumer_name="admin-1"
+        )
+        handled = []
+
+        async def on_stats(event):
+            handled.append(event["user_id"])
+
+        consumer.handle_player_stats = on_stats
+
+        await consumer.start()
+        for _ in range(100):
+            if len(handled) == 3:
+                break
+            await asyncio.sleep(0.01)
+        await consumer.stop()
+
+        assert handled == ["u1", "u2", "u3"]
+        assert (CHANNEL_PLAYER_STATS, ("1-0",)) in mock_redis.acked
+        assert (CHANNEL_PLAYER_STATS, ("2-0", "3-0")) in mock_redis.acked
+        stats_reads = [r for r in mock_redis.reads if r[0] == CHANNEL_PLAYER_STATS]
+        assert stats_reads[0][2] == "0"
+        assert stats_reads[0][1].startswith("admin-1:")
+
+    @pytest.mark.asyncio
+    async def test_poison_message_acked(self):
+        """잘못된 JSON / 이벤트 형식은 기록 후 ACK (재시도해도 같은 결과)."""
+        mock_redis = StreamMockRedis()
+        consumer = FraudEventConsumer(mock_redis, MagicMock(), MagicMock())
+        consumer.handle_player_action = AsyncMock(side_effect=[TypeError("bad event"), None])
+
+        await consumer._process_batch(
+            CHANNEL_PLAYER_ACTION,
+            [
+                ("1-0", {"data": json.dumps({"user_id": "u1"})}),
+                ("2-0", {"data": "not-json"}),
+                ("3-0", {"data": json.dumps({"user_id": "u3"})}),
+            ],
+        )
+
+        assert mock_redis.acked == [(CHANNEL_PLAYER_ACTION, ("1-0", "2-0", "3-0"))]
+        assert consumer.handle_player_action.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_transient_failure_left_pending(self):
+        """일시적 오류 엔트리는 ACK하지 않고 (XAUTOCLAIM 재처리) 오류 전파."""
+        mock_redis = StreamMockRedis()
+        consumer = FraudEventConsumer(mock_redis, MagicMock(), MagicMock())
+        consumer.handle_player_action = AsyncMock(
+            side_effect=[ConnectionError("redis down"), None]
+        )
+
+        with pytest.raises(ConnectionError):
+            await consumer._process_batch(
+                CHANNEL_PLAYER_ACTION,
+                [
+                    ("1-0", {"data": json.dumps({"user_id": "u1"})}),
+                    ("2-0", {"data": json.dumps({"user_id": "u2"})}),
+                ],
+            )
+
+        assert mock_redis.acked == [(CHANNEL_PLAYER_ACTION, ("2-0",))]
+        metrics = consumer._metrics.streams[CHANNEL_PLAYER_ACTION]
+        assert (metrics.processed, metrics.acked) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_detector_failure_not_swallowed(self):
+        """탐지기 DB 오류가 핸들러에서 삼켜지지 않아 엔트리가 pending으로 남음."""
+        mock_redis = StreamMockRedis()
+        consumer = FraudEventConsumer(mock_redis, MagicMock(), MagicMock())
+        consumer._run_anomaly_detection = AsyncMock(side_effect=OSError("db down"))
+
+        with pytest.raises(OSError):
+            await consumer._process_batch(
+                CHANNEL_PLAYER_STATS,
+                [entry("1-0", {"user_id": "u1", "hands_played": 20})],
+            )
+
+        assert mock_redis.acked == []
+
+    @pytest.mark.asyncio
+    async def test_reclaim_processes_idle_pending(self):
+        """죽은 컨슈머의 pending 엔트리 회수."""
+        mock_redis = StreamMockRedis()
+        mock_redis.claimable[CHANNEL_HAND_COMPLETED] = [
+            entry("5-0", {"event_type": "hand_completed", "participants": []}),
+            ("6-0", None),  # 트리밍된 엔트리
+        ]
+        consumer = FraudEventConsumer(mock_redis, MagicMock(), MagicMock())
+        consumer.handle_hand_completed = AsyncMock()
+
+        reclaimed = await consumer.reclaim_pending(CHANNEL_HAND_COMPLETED)
+
+        assert reclaimed == 1
+        consumer.handle_hand_completed.assert_awaited_once()
+        assert mock_redis.acked == [(CHANNEL_HAND_COMPLETED, ("5-0",))]
+
+    @pytest.mark.asyncio
+    async def test_lag_metrics(self):
+        """스트림별 lag / pending / 처리 수."""
+        mock_redis = StreamMockRedis()
+        consumer = FraudEventConsumer(mock_redis, MagicMock(), MagicMock())
+        consumer.handle_player_action = AsyncMock()
+        await consumer._process_batch(
+            CHANNEL_PLAYER_ACTION, [entry("1-0", {"user_id": "u1"})]
+        )
+
+        metrics = await consumer.get_lag_metrics()
+
+        assert metrics[CHANNEL_PLAYER_ACTION]["lag"] == 7
+        assert metrics[CHANNEL_PLAYER_ACTION]["pending"] == 3
+        assert metrics[CHANNEL_PLAYER_ACTION]["processed"] == 1
+        assert metrics[CHANNEL_PLAYER_ACTION]["acked"] == 1
+
+
 class TestHandleHandCompleted:
     """Property 6: 이벤트 유형별 탐지기 호출 - hand_completed."""
 
@@ -135,8 +312,8 @@ class TestHandleHandCompleted:
         )
 
     @pytest.mark.asyncio
-    async def test_handle_hand_completed_calls_detector(self, consumer):
-        """핸드 완료 이벤트 시 ChipDumpingDetector 호출."""
+    async def test_handle_hand_completed_uses_streaming_detector(self, consumer):
+        """핸드 완료 이벤트는 SQL 재계산 없이 스트리밍 카운터만 갱신."""
         event = {
             "event_type": "hand_completed",
             "hand_id": "hand-123",
@@ -150,16 +327,54 @@ class TestHandleHandCompleted:
             ],
         }
         
-        mock_detector = MagicMock()
-        mock_detector.detect_one_way_chip_flow = AsyncMock(return_value=[])
-        
         import app.services.chip_dumping_detector as cdd_module
         original_class = cdd_module.ChipDumpingDetector
-        cdd_module.ChipDumpingDetector = MagicMock(return_value=mock_detector)
+        cdd_module.ChipDumpingDetector = MagicMock()
+        consumer._flag_suspicious_activity = AsyncMock()
         
         try:
             await consumer.handle_hand_completed(event)
-            mock_detector.detect_one_way_chip_flow.assert_called_once()
+            cdd_module.ChipDumpingDetector.assert_not_called()
+            assert consumer._chip_flow._local.pair_count == 1
+            consumer._flag_suspicious_activity.assert_not_called()
+
+            # 최소 핸드 수(3) 도달 시 플래깅
+            await consumer.handle_hand_completed(event)
+            await consumer.handle_hand_completed(event)
+            consumer._flag_suspicious_activity.assert_called_once()
+            kwargs = consumer._flag_suspicious_activity.call_args.kwargs
+            assert kwargs["detection_type"] == "chip_dumping"
+            assert kwargs["user_ids"] == ["user-2", "user-1"]
+            assert kwargs["severity"] == "high"
+        finally:
+            cdd_module.ChipDumpingDetector = original_class
+
+    @pytest.mark.asyncio
+    async def test_reconcile_flags_only_new_pairs(self, consumer):
+        """SQL 정합성 검증은 스트리밍에서 이미 플래그한 쌍을 건너뜀."""
+        await consumer._chip_flow.try_flag("user-2", "user-1")
+        consumer._flag_suspicious_activity = AsyncMock()
+
+        mock_detector = MagicMock()
+        mock_detector.detect_one_way_chip_flow = AsyncMock(return_value=[
+            {"loser_id": "user-2", "winner_id": "user-1", "total_hands": 5,
+             "winner_wins": 5, "win_rate": 1.0, "detection_type": "one_way_chip_flow"},
+            {"loser_id": "user-3", "winner_id": "user-4", "total_hands": 4,
+             "winner_wins": 4, "win_rate": 1.0, "detection_type": "one_way_chip_flow"},
+        ])
+
+        import app.services.chip_dumping_detector as cdd_module
+        original_class = cdd_module.ChipDumpingDetector
+        cdd_module.ChipDumpingDetector = MagicMock(return_value=mock_detector)
+
+        try:
+            assert await consumer.reconcile_chip_dumping() == 1
+            kwargs = consumer._flag_suspicious_activity.call_args.kwargs
+            assert kwargs["user_ids"] == ["user-3", "user-4"]
+            assert kwargs["details"]["detection_source"] == "reconcile"
+
+            # 다음 주기에는 재플래그하지 않음
+            assert await consumer.reconcile_chip_dumping() == 0
         finally:
             cdd_module.ChipDumpingDetector = original_class
 
@@ -208,8 +423,10 @@ class TestHandlePlayerAction:
         
         await consumer.handle_player_action(event)
         
-        assert "user-123" in consumer._action_buffer
-        assert len(consumer._action_buffer["user-123"]) == 1
+        stats = await consumer._timing_store.load("user-123")
+        assert stats.action_total == 1
+        assert stats.sample_size == 1
+        assert stats.mean == 2500
 
     @pytest.mark.asyncio
     async def test_handle_player_action_analyzes_when_buffer_full(self, consumer):
@@ -228,7 +445,69 @@ class TestHandlePlayerAction:
             }
             await consumer.handle_player_action(event)
         
-        assert len(consumer._action_buffer.get(user_id, [])) <= consumer._action_buffer_size
+        stats = await consumer._timing_store.load(user_id)
+        assert stats.action_total <= consumer._action_buffer_size
+
+    @pytest.mark.asyncio
+    async def test_bot_timing_flagged_and_window_reset(self, consumer):
+        """일정한 응답 시간이 윈도우를 채우면 봇으로 플래깅 후 윈도우 초기화."""
+        user_id = "user-bot"
+        consumer._flag_suspicious_activity = AsyncMock()
+
+        for i in range(consumer._action_buffer_size):
+            await consumer.handle_player_action({
+                "user_id": user_id,
+                "action_type": "fold" if i % 10 else "call",
+                "response_time_ms": 500 + (i % 3),
+            })
+
+        consumer._flag_suspicious_activity.assert_called_once()
+        kwargs = consumer._flag_suspicious_activity.call_args.kwargs
+        assert kwargs["detection_type"] == "bot_detection"
+        assert "very_consistent_timing" in kwargs["details"]["reasons"]
+
+        stats = await consumer._timing_store.load(user_id)
+        assert stats.action_total == 0
+        assert stats.total_samples == consumer._action_buffer_size
+
+    @pytest.mark.asyncio
+    async def test_stats_persisted_to_redis(self):
+        """롤링 통계는 Redis에 바이너리(base64)로 저장되어 재시작 후에도 유지."""
+        redis = FakeRedis()
+
+        first = FraudEventConsumer(redis, MagicMock(), MagicMock())
+        for rt in (900, 1100, 1000):
+            await first.handle_player_action(
+                {"user_id": "u1", "action_type": "call", "response_time_ms": rt}
+            )
+
+        assert len(redis.data["fraud:timing:u1"]) < 300
+
+        restarted = FraudEventConsumer(redis, MagicMock(), MagicMock())
+        stats = await restarted._timing_store.load("u1")
+        assert stats.sample_size == 3
+        assert stats.mean == 1000
+        assert stats.min == 900 and stats.max == 1100
+
+    @pytest.mark.asyncio
+    async def test_concurrent_actions_not_lost(self):
+        """여러 워커가 같은 사용자 이벤트를 동시에 처리해도 샘플이 유실되지 않음."""
+        redis = FakeRedis()
+        workers = [FraudEventConsumer(redis, MagicMock(), MagicMock()) for _ in range(3)]
+
+        for round_ in range(4):
+            await asyncio.gather(*(
+                worker.handle_player_action({
+                    "user_id": "u1",
+                    "action_type": "call",
+                    "response_time_ms": 1000 + round_ * 3 + i,
+                })
+                for i, worker in enumerate(workers)
+            ))
+
+        stats = await workers[0]._timing_store.load("u1")
+        assert stats.action_total == 12
+        assert stats.total_samples == 12
 
 
 class TestHandlePlayerStats:
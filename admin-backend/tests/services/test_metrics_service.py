@@ -5,6 +5,7 @@ from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from app.services.metrics_service import (
+    CCU_SERIES_KEY,
     MetricsService,
     get_metrics_service,
     get_redis_client,
@@ -13,8 +14,11 @@ from app.services.metrics_service import (
 
 @pytest.fixture
 def mock_redis():
-    """Create a mock Redis client."""
+    """Create a mock Redis client with a pipeline (``mock_redis.pipe``)."""
     redis = AsyncMock()
+    redis.pipe = MagicMock()
+    redis.pipe.execute = AsyncMock(return_value=[])
+    redis.pipeline = MagicMock(return_value=redis.pipe)
     return redis
 
 
@@ -48,6 +52,16 @@ class TestGetCCU:
         assert ccu == 200
         mock_redis.get.assert_called_once_with("ws_connections_count")
     
+    @pytest.mark.asyncio
+    async def test_get_ccu_fallback_when_online_users_empty(self, metrics_service, mock_redis):
+        """Test CCU falls back when SCARD reports an empty (missing) set."""
+        mock_redis.scard.return_value = 0
+        mock_redis.get.return_value = "42"
+        
+        ccu = await metrics_service.get_ccu()
+        
+        assert ccu == 42
+    
     @pytest.mark.asyncio
     async def test_get_ccu_returns_zero_on_error(self, metrics_service, mock_redis):
         """Test CCU returns 0 on Redis error."""
@@ -118,45 +132,52 @@ class TestGetCCUHistory:
     
     @pytest.mark.asyncio
     async def test_get_ccu_history_default_hours(self, metrics_service, mock_redis):
-        """Test CCU history retrieval for default 24 hours."""
-        # Mock Redis to return different values for each hour
-        mock_redis.get.side_effect = [str(100 + i) for i in range(24)]
+        """Test CCU history is read with one HMGET + legacy MGET round trip."""
+        mock_redis.pipe.execute.return_value = [
+            [str(100 + i) for i in range(24)],
+            [None] * 24,
+        ]
         
         history = await metrics_service.get_ccu_history()
         
         assert len(history) == 24
         assert all("timestamp" in item for item in history)
         assert all("hour" in item for item in history)
-        assert all("ccu" in item for item in history)
+        assert [item["ccu"] for item in history] == [100 + i for i in range(24)]
+        mock_redis.pipe.execute.assert_awaited_once()
+        assert mock_redis.pipe.hmget.call_args[0][0] == CCU_SERIES_KEY
+        mock_redis.get.assert_not_called()
     
     @pytest.mark.asyncio
     async def test_get_ccu_history_custom_hours(self, metrics_service, mock_redis):
         """Test CCU history retrieval for custom hours."""
-        mock_redis.get.side_effect = [str(50 + i) for i in range(12)]
+        mock_redis.pipe.execute.return_value = [[str(50 + i) for i in range(12)], [None] * 12]
         
         history = await metrics_service.get_ccu_history(hours=12)
         
         assert len(history) == 12
+        assert len(mock_redis.pipe.hmget.call_args[0][1]) == 12
     
     @pytest.mark.asyncio
     async def test_get_ccu_history_returns_empty_on_error(self, metrics_service, mock_redis):
         """Test CCU history returns empty list on error."""
-        mock_redis.get.side_effect = Exception("Redis error")
+        mock_redis.pipe.execute.side_effect = Exception("Redis error")
         
         history = await metrics_service.get_ccu_history()
         
         assert history == []
     
     @pytest.mark.asyncio
-    async def test_get_ccu_history_handles_none_values(self, metrics_service, mock_redis):
-        """Test CCU history handles None values gracefully."""
-        mock_redis.get.side_effect = [None, "100", None, "150"]
+    async def test_get_ccu_history_falls_back_to_legacy_keys(self, metrics_service, mock_redis):
+        """Test hours missing from the hash use legacy per-hour keys, else 0."""
+        mock_redis.pipe.execute.return_value = [
+            [None, "100", None, "150"],
+            ["80", None, None, "999"],
+        ]
         
         history = await metrics_service.get_ccu_history(hours=4)
         
-        assert len(history) == 4
-        # None values should be converted to 0
-        assert any(item["ccu"] == 0 for item in history)
+        assert [item["ccu"] for item in history] == [80, 100, 0, 150]
 
 
 class TestGetDAUHistory:
@@ -164,57 +185,99 @@ class TestGetDAUHistory:
     
     @pytest.mark.asyncio
     async def test_get_dau_history_default_days(self, metrics_service, mock_redis):
-        """Test DAU history retrieval for default 30 days."""
-        mock_redis.pfcount.side_effect = [1000 + i * 10 for i in range(30)]
+        """Test DAU history is fetched in one pipeline."""
+        mock_redis.pipe.execute.return_value = [1000 + i * 10 for i in range(30)]
         
         history = await metrics_service.get_dau_history()
         
         assert len(history) == 30
         assert all("date" in item for item in history)
-        assert all("dau" in item for item in history)
+        assert history[-1]["dau"] == 1290
+        assert mock_redis.pipe.pfcount.call_count == 30
+        mock_redis.pipe.execute.assert_awaited_once()
+        mock_redis.pfcount.assert_not_called()
     
     @pytest.mark.asyncio
     async def test_get_dau_history_custom_days(self, metrics_service, mock_redis):
         """Test DAU history retrieval for custom days."""
-        mock_redis.pfcount.side_effect = [2000 + i * 5 for i in range(7)]
+        mock_redis.pipe.execute.return_value = [2000 + i * 5 for i in range(7)]
         
         history = await metrics_service.get_dau_history(days=7)
         
         assert len(history) == 7
+        assert history == sorted(history, key=lambda item: item["date"])
     
     @pytest.mark.asyncio
     async def test_get_dau_history_returns_empty_on_error(self, metrics_service, mock_redis):
         """Test DAU history returns empty list on error."""
-        mock_redis.pfcount.side_effect = Exception("Redis error")
+        mock_redis.pipe.execute.side_effect = Exception("Redis error")
         
         history = await metrics_service.get_dau_history()
         
         assert history == []
 
 
+class TestGetMAUHistory:
+    """Tests for get_mau_history method."""
+    
+    @pytest.mark.asyncio
+    async def test_get_mau_history_pipelined(self, metrics_service, mock_redis):
+        """Test MAU history is fetched in one pipeline."""
+        mock_redis.pipe.execute.return_value = list(range(12))
+        
+        history = await metrics_service.get_mau_history()
+        
+        assert len(history) == 12
+        assert history == sorted(history, key=lambda item: item["month"])
+        mock_redis.pipe.execute.assert_awaited_once()
+
+
+class TestGetUserStatisticsSummary:
+    """Tests for get_user_statistics_summary method."""
+    
+    @pytest.mark.asyncio
+    async def test_summary_single_round_trip(self, metrics_service, mock_redis):
+        """Test CCU/DAU/WAU/MAU come from one pipeline without a temp key."""
+        mock_redis.pipe.execute.return_value = [150, None, 5000, 20000, 60000]
+        
+        summary = await metrics_service.get_user_statistics_summary()
+        
+        assert summary["ccu"] == 150
+        assert summary["wau"] == 20000
+        assert summary["mau"] == 60000
+        assert len(mock_redis.pipe.pfcount.call_args_list[1][0]) == 7
+        mock_redis.pfmerge.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_summary_ccu_falls_back_to_ws_count(self, metrics_service, mock_redis):
+        """Test SCARD 0 (no online_users set) uses ws_connections_count."""
+        mock_redis.pipe.execute.return_value = [0, "37", 5000, 20000, 60000]
+        
+        summary = await metrics_service.get_user_statistics_summary()
+        
+        assert summary["ccu"] == 37
+
+
 class TestGetActiveRooms:
     """Tests for get_active_rooms method."""
     
     @pytest.mark.asyncio
     async def test_get_active_rooms_success(self, metrics_service, mock_redis):
-        """Test active rooms retrieval."""
-        mock_redis.scard.side_effect = [10, 5, 6, 4, 3, 2]  # 10 rooms, then players per room
+        """Test active rooms retrieval with pipelined player counts."""
         mock_redis.smembers.return_value = {b"room1", b"room2", b"room3", b"room4", b"room5"}
-        
-        # Reset scard to return room count first, then player counts
-        mock_redis.scard.reset_mock()
-        mock_redis.scard.side_effect = [10, 5, 6, 4, 3, 2, 5, 4, 3, 2, 1]
+        mock_redis.pipe.execute.return_value = [5, 6, 4, 3, 2]
         
         stats = await metrics_service.get_active_rooms()
         
-        assert "active_rooms" in stats
-        assert "total_players" in stats
-        assert "avg_players_per_room" in stats
+        assert stats["active_rooms"] == 5
+        assert stats["total_players"] == 20
+        assert stats["avg_players_per_room"] == 4.0
+        mock_redis.scard.assert_not_called()
     
     @pytest.mark.asyncio
     async def test_get_active_rooms_returns_zeros_on_error(self, metrics_service, mock_redis):
         """Test active rooms returns zeros on error."""
-        mock_redis.scard.side_effect = Exception("Redis error")
+        mock_redis.smembers.side_effect = Exception("Redis error")
         
         stats = await metrics_service.get_active_rooms()
         
@@ -225,13 +288,13 @@ class TestGetActiveRooms:
     @pytest.mark.asyncio
     async def test_get_active_rooms_handles_empty_rooms(self, metrics_service, mock_redis):
         """Test active rooms handles empty room set."""
-        mock_redis.scard.return_value = 0
         mock_redis.smembers.return_value = set()
         
         stats = await metrics_service.get_active_rooms()
         
         assert stats["active_rooms"] == 0
         assert stats["total_players"] == 0
+        mock_redis.pipe.execute.assert_not_awaited()
 
 
 class TestGetRoomDistribution:
@@ -240,7 +303,7 @@ class TestGetRoomDistribution:
     @pytest.mark.asyncio
     async def test_get_room_distribution_success(self, metrics_service, mock_redis):
         """Test room distribution retrieval."""
-        mock_redis.scard.side_effect = [5, 2, 3]  # cash, tournament, sit_n_go
+        mock_redis.pipe.execute.return_value = [5, 2, 3]  # cash, tournament, sit_n_go
         
         distribution = await metrics_service.get_room_distribution()
         
@@ -255,7 +318,7 @@ class TestGetRoomDistribution:
     @pytest.mark.asyncio
     async def test_get_room_distribution_returns_empty_on_error(self, metrics_service, mock_redis):
         """Test room distribution returns empty list on error."""
-        mock_redis.scard.side_effect = Exception("Redis error")
+        mock_redis.pipe.execute.side_effect = Exception("Redis error")
         
         distribution = await metrics_service.get_room_distribution()
         
@@ -268,7 +331,7 @@ class TestGetServerHealth:
     @pytest.mark.asyncio
     async def test_get_server_health_healthy(self, metrics_service, mock_redis):
         """Test server health returns healthy status."""
-        mock_redis.get.side_effect = ["45.5", "60.0", "50"]  # cpu, memory, latency
+        mock_redis.mget.return_value = ["45.5", "60.0", "50"]  # cpu, memory, latency
         
         health = await metrics_service.get_server_health()
         
@@ -280,7 +343,7 @@ class TestGetServerHealth:
     @pytest.mark.asyncio
     async def test_get_server_health_warning(self, metrics_service, mock_redis):
         """Test server health returns warning status."""
-        mock_redis.get.side_effect = ["75.0", "65.0", "100"]  # cpu > 70
+        mock_redis.mget.return_value = ["75.0", "65.0", "100"]  # cpu > 70
         
         health = await metrics_service.get_server_health()
         
@@ -289,7 +352,7 @@ class TestGetServerHealth:
     @pytest.mark.asyncio
     async def test_get_server_health_critical(self, metrics_service, mock_redis):
         """Test server health returns critical status."""
-        mock_redis.get.side_effect = ["95.0", "85.0", "100"]  # cpu > 90
+        mock_redis.mget.return_value = ["95.0", "85.0", "100"]  # cpu > 90
         
         health = await metrics_service.get_server_health()
         
@@ -298,7 +361,7 @@ class TestGetServerHealth:
     @pytest.mark.asyncio
     async def test_get_server_health_critical_high_latency(self, metrics_service, mock_redis):
         """Test server health returns critical status on high latency."""
-        mock_redis.get.side_effect = ["50.0", "50.0", "600"]  # latency > 500
+        mock_redis.mget.return_value = ["50.0", "50.0", "600"]  # latency > 500
         
         health = await metrics_service.get_server_health()
         
@@ -307,7 +370,7 @@ class TestGetServerHealth:
     @pytest.mark.asyncio
     async def test_get_server_health_returns_unknown_on_error(self, metrics_service, mock_redis):
         """Test server health returns unknown status on error."""
-        mock_redis.get.side_effect = Exception("Redis error")
+        mock_redis.mget.side_effect = Exception("Redis error")
         
         health = await metrics_service.get_server_health()
         
@@ -322,20 +385,51 @@ class TestGetDashboardSummary:
     
     @pytest.mark.asyncio
     async def test_get_dashboard_summary_success(self, metrics_service, mock_redis):
-        """Test dashboard summary retrieval."""
-        # Setup mocks for all sub-methods
-        mock_redis.scard.side_effect = [150, 10, 5, 6, 4, 3]  # CCU, rooms, players
-        mock_redis.pfcount.return_value = 5000  # DAU
-        mock_redis.get.side_effect = ["50.0", "60.0", "100"]  # server health
-        mock_redis.smembers.return_value = set()
+        """Test dashboard summary is composed from two pipelines."""
+        mock_redis.pipe.execute.side_effect = [
+            [150, None, 5000, {"room1", "room2"}, ["50.0", "60.0", "100"]],
+            [6, 4],
+        ]
+        
+        summary = await metrics_service.get_dashboard_summary()
+        
+        assert summary["ccu"] == 150
+        assert summary["dau"] == 5000
+        assert summary["active_rooms"] == 2
+        assert summary["total_players"] == 10
+        assert summary["server_health"]["status"] == "healthy"
+        assert mock_redis.pipe.execute.await_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_get_dashboard_summary_ccu_fallback(self, metrics_service, mock_redis):
+        """Test dashboard CCU uses ws_connections_count when SCARD is 0."""
+        mock_redis.pipe.execute.return_value = [0, "12", 2, set(), [None, None, None]]
         
         summary = await metrics_service.get_dashboard_summary()
         
-        assert "ccu" in summary
-        assert "dau" in summary
-        assert "active_rooms" in summary
-        assert "total_players" in summary
-        assert "server_health" in summary
+        assert summary["ccu"] == 12
+    
+    @pytest.mark.asyncio
+    async def test_get_dashboard_summary_cached(self, metrics_service, mock_redis):
+        """Test repeated calls within the TTL reuse the cached summary."""
+        mock_redis.pipe.execute.return_value = [1, None, 2, set(), [None, None, None]]
+        
+        first = await metrics_service.get_dashboard_summary()
+        second = await metrics_service.get_dashboard_summary()
+        
+        assert first is second
+        assert mock_redis.pipe.execute.await_count == 1
+    
+    @pytest.mark.asyncio
+    async def test_get_dashboard_summary_cache_expires(self, metrics_service, mock_redis):
+        """Test the cache is refreshed after the TTL."""
+        mock_redis.pipe.execute.return_value = [1, None, 2, set(), [None, None, None]]
+        
+        with patch("app.services.metrics_service.SUMMARY_CACHE_TTL", 0):
+            await metrics_service.get_dashboard_summary()
+            await metrics_service.get_dashboard_summary()
+        
+        assert mock_redis.pipe.execute.await_count == 2
 
 
 class TestConvenienceFunctions:
@@ -385,17 +479,19 @@ class TestEdgeCases:
     @pytest.mark.asyncio
     async def test_active_rooms_with_bytes_room_ids(self, metrics_service, mock_redis):
         """Test active rooms handles bytes room IDs."""
-        mock_redis.scard.side_effect = [3, 5, 4, 3]  # 3 rooms, then players
         mock_redis.smembers.return_value = {b"room1", b"room2", b"room3"}
+        mock_redis.pipe.execute.return_value = [5, 4, 3]
         
         stats = await metrics_service.get_active_rooms()
         
         assert stats["active_rooms"] == 3
+        keys = sorted(c[0][0] for c in mock_redis.pipe.scard.call_args_list)
+        assert keys == ["room:room1:players", "room:room2:players", "room:room3:players"]
     
     @pytest.mark.asyncio
     async def test_server_health_with_none_values(self, metrics_service, mock_redis):
         """Test server health handles None values."""
-        mock_redis.get.side_effect = [None, None, None]
+        mock_redis.mget.return_value = [None, None, None]
         
         health = await metrics_service.get_server_health()
         
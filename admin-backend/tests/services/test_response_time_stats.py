@@ -0,0 +1,150 @@
+"""Tests for RollingTimingStats / TimingStatsStore.
+
+롤링 윈도우 통계가 전체 재계산(statistics.mean/stdev/min/max)과 일치하는지,
+바이너리 인코딩 왕복, 액션당 갱신 비용이 세션 길이와 무관한지 검증.
+"""
+
+import random
+import statistics
+import time
+
+import pytest
+
+from app.services.response_time_stats import (
+    HISTOGRAM_BUCKETS,
+    RollingTimingStats,
+    TimingStatsStore,
+)
+
+
+class TestRollingWindow:
+    """롤링 윈도우 통계 정확성."""
+
+    def test_matches_full_recompute(self):
+        rng = random.Random(3)
+        stats = RollingTimingStats(window=20)
+        values = []
+
+        for _ in range(500):
+            value = rng.randint(50, 8000)
+            values.append(value)
+            stats.add(value, "call")
+
+            window = values[-20:]
+            assert stats.sample_size == len(window)
+            assert stats.mean == pytest.approx(statistics.mean(window))
+            if len(window) > 1:
+                assert stats.stdev == pytest.approx(statistics.stdev(window), rel=1e-6)
+            assert stats.min == min(window)
+            assert stats.max == max(window)
+
+    def test_zero_response_time_counts_action_only(self):
+        stats = RollingTimingStats(window=5)
+
+        stats.add(0, "fold")
+        stats.add(None, "check")
+
+        assert stats.action_total == 2
+        assert stats.sample_size == 0
+        assert stats.min is None
+
+    def test_action_counts_slide_with_window(self):
+        stats = RollingTimingStats(window=3)
+
+        for action in ("fold", "fold", "raise", "call"):
+            stats.add(1000, action)
+
+        assert stats.action_counts() == {"total": 3, "fold": 1, "raise": 1, "call": 1}
+
+    def test_histogram_accumulates_beyond_window(self):
+        stats = RollingTimingStats(window=2)
+
+        for value in (50, 100, 101, 45000):
+            stats.add(value)
+
+        histogram = stats.histogram
+        assert len(histogram) == HISTOGRAM_BUCKETS
+        assert histogram[0] == 2
+        assert histogram[1] == 1
+        assert histogram[-1] == 1
+        assert stats.total_samples == 4
+
+    def test_reset_keeps_histogram(self):
+        stats = RollingTimingStats(window=5)
+        for value in (500, 600, 700):
+            stats.add(value, "call")
+
+        stats.reset()
+
+        assert stats.sample_size == 0
+        assert stats.action_total == 0
+        assert sum(stats.histogram) == 3
+        stats.add(800)
+        assert stats.mean == 800
+
+
+class TestBinaryEncoding:
+    """바이너리 인코딩 왕복."""
+
+    def test_round_trip(self):
+        rng = random.Random(5)
+        stats = RollingTimingStats(window=20)
+        for _ in range(57):
+            stats.add(rng.randint(100, 5000), rng.choice(["fold", "call", "raise", "x"]))
+
+        restored = RollingTimingStats.from_bytes(stats.to_bytes())
+
+        assert restored.sample_size == stats.sample_size
+        assert restored.mean == stats.mean
+        assert restored.stdev == stats.stdev
+        assert (restored.min, restored.max) == (stats.min, stats.max)
+        assert restored.action_counts() == stats.action_counts()
+        assert restored.histogram == stats.histogram
+        assert restored.total_samples == 57
+
+        # 복원 후에도 계속 갱신 가능
+        restored.add(1234, "call")
+        stats.add(1234, "call")
+        assert restored.mean == pytest.approx(stats.mean)
+        assert restored.min == stats.min
+
+    def test_encoded_size_is_compact(self):
+        stats = RollingTimingStats(window=20)
+        for i in range(1000):
+            stats.add(1000 + i, "call")
+
+        assert len(stats.to_bytes()) < 200
+
+
+class TestStore:
+    """Redis 저장소."""
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_local_without_redis(self):
+        store = TimingStatsStore(None, window=10)
+
+        stats = await store.load("u1")
+        stats.add(700, "call")
+        await store.save("u1", stats)
+
+        assert (await store.load("u1")).sample_size == 1
+
+
+class TestConstantTimeUpdates:
+    """세션 길이와 무관한 갱신 비용."""
+
+    def test_update_cost_independent_of_session_length(self):
+        def per_update_us(samples: int) -> float:
+            stats = RollingTimingStats(window=20)
+            rng = random.Random(9)
+            values = [rng.randint(100, 5000) for _ in range(samples)]
+            start = time.perf_counter()
+            for value in values:
+                stats.add(value, "call")
+            return (time.perf_counter() - start) / samples * 1e6
+
+        short = per_update_us(1_000)
+        long = per_update_us(100_000)
+        print(f"\n[TimingStats] per update: {short:.2f}us (1k) / {long:.2f}us (100k)")
+
+        assert long < short * 3
@@ -0,0 +1,269 @@
+"""Tests for StatsRollupService - 시간 단위 증분 롤업."""
+
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import func, select, text, update
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.models.base import Base
+from app.models.crypto import CryptoDeposit, CryptoWithdrawal, TransactionStatus
+from app.models.stats_rollup import CryptoFlowHourly, RevenueHourly, RollupWatermark
+from app.services.crypto.crypto_stats_service import CryptoStatsService
+from app.services.statistics_service import StatisticsService
+from app.services.stats_rollup import (
+    ROLLUP_CRYPTO_FLOW,
+    ROLLUP_REVENUE,
+    StatsRollupService,
+    crypto_flow_by_hour,
+    crypto_flow_by_user,
+    get_watermark,
+    hour_floor,
+)
+
+
+NOW = hour_floor(datetime.now(timezone.utc)) + timedelta(minutes=30)
+
+
+@pytest.fixture
+async def admin_factory():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            lambda sync_conn: Base.metadata.create_all(
+                sync_conn,
+                tables=[
+                    CryptoDeposit.__table__,
+                    CryptoWithdrawal.__table__,
+                    CryptoFlowHourly.__table__,
+                    RevenueHourly.__table__,
+                    RollupWatermark.__table__,
+                ],
+            )
+        )
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    await engine.dispose()
+
+
+@pytest.fixture
+async def main_factory():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.execute(text(
+            "CREATE TABLE hand_history ("
+            "id INTEGER PRIMARY KEY, created_at DATETIME, rake_amount NUMERIC)"
+        ))
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    await engine.dispose()
+
+
+async def add_deposit(factory, user_id, usdt, at):
+    async with factory() as db:
+        db.add(CryptoDeposit(
+            id=str(uuid4()),
+            user_id=user_id,
+            tx_hash=uuid4().hex,
+            from_address="TFrom",
+            to_address="TTo",
+            amount_usdt=Decimal(usdt),
+            amount_krw=Decimal(usdt) * 1400,
+            exchange_rate=Decimal("1400"),
+            status=TransactionStatus.COMPLETED,
+            detected_at=at,
+            credited_at=at,
+            created_at=at,
+            updated_at=at,
+        ))
+        await db.commit()
+
+
+async def add_withdrawal(factory, user_id, usdt, at):
+    async with factory() as db:
+        db.add(CryptoWithdrawal(
+            id=str(uuid4()),
+            user_id=user_id,
+            to_address="TTo",
+            amount_usdt=Decimal(usdt),
+            amount_krw=Decimal(usdt) * 1400,
+            exchange_rate=Decimal("1400"),
+            network_fee_usdt=Decimal("1"),
+            network_fee_krw=Decimal("1400"),
+            status=TransactionStatus.COMPLETED,
+            requested_at=at,
+            processed_at=at,
+            created_at=at,
+            updated_at=at,
+        ))
+        await db.commit()
+
+
+async def add_hand(factory, rake, at):
+    async with factory() as db:
+        await db.execute(
+            text("INSERT INTO hand_history (created_at, rake_amount) VALUES (:at, :rake)"),
+            {"at": at.strftime("%Y-%m-%d %H:%M:%S.%f"), "rake": rake},
+        )
+        await db.commit()
+
+
+async def rollup_rows(factory):
+    async with factory() as db:
+        result = await db.execute(select(func.count()).select_from(CryptoFlowHourly))
+        return result.scalar()
+
+
+class TestCryptoFlowRollup:
+    @pytest.mark.asyncio
+    async def test_refresh_builds_hourly_buckets(self, admin_factory):
+        await add_deposit(admin_factory, "u1", "100", NOW - timedelta(hours=5))
+        await add_deposit(admin_factory, "u1", "50", NOW - timedelta(hours=5, minutes=10))
+        await add_withdrawal(admin_factory, "u2", "30", NOW - timedelta(hours=2))
+
+        service = StatsRollupService(admin_factory)
+        written = await service.refresh(ROLLUP_CRYPTO_FLOW, now=NOW)
+
+        assert written == 2
+        async with admin_factory() as db:
+            assert await get_watermark(db, ROLLUP_CRYPTO_FLOW) == NOW - timedelta(minutes=1)
+            by_hour = await crypto_flow_by_hour(db, NOW - timedelta(days=1), NOW)
+
+        bucket = hour_floor(NOW - timedelta(hours=5))
+        assert by_hour[bucket].deposit_count == 2
+        assert by_hour[bucket].deposit_amount_usdt == Decimal("150")
+        assert by_hour[hour_floor(NOW - timedelta(hours=2))].withdrawal_count == 1
+
+    @pytest.mark.asyncio
+    async def test_refresh_is_incremental_and_idempotent(self, admin_factory):
+        await add_deposit(admin_factory, "u1", "100", NOW - timedelta(hours=30))
+        service = StatsRollupService(admin_factory)
+        await service.refresh(ROLLUP_CRYPTO_FLOW, now=NOW)
+
+        # 이미 집계된 구간 밖 데이터는 다시 읽지 않음
+        await add_deposit(admin_factory, "u2", "10", NOW)
+        later = NOW + timedelta(minutes=10)
+        written = await service.refresh(ROLLUP_CRYPTO_FLOW, now=later)
+        assert written == 1  # 현재 버킷만 재계산
+
+        written = await service.refresh(ROLLUP_CRYPTO_FLOW, now=later)
+        assert written == 1
+        assert await rollup_rows(admin_factory) == 2
+
+    @pytest.mark.asyncio
+    async def test_reads_include_rows_after_watermark(self, admin_factory):
+        await add_deposit(admin_factory, "u1", "100", NOW - timedelta(hours=3))
+        service = StatsRollupService(admin_factory)
+        await service.refresh(ROLLUP_CRYPTO_FLOW, now=NOW)
+
+        await add_deposit(admin_factory, "u1", "5", NOW + timedelta(minutes=5))
+        async with admin_factory() as db:
+            by_user = await crypto_flow_by_user(
+                db, NOW - timedelta(days=1), NOW + timedelta(minutes=10)
+            )
+
+        assert by_user["u1"].deposit_count == 2
+        assert by_user["u1"].deposit_amount_usdt == Decimal("105")
+
+    @pytest.mark.asyncio
+    async def test_rebuild_replaces_corrupted_buckets(self, admin_factory):
+        await add_deposit(admin_factory, "u1", "100", NOW - timedelta(days=2))
+        service = StatsRollupService(admin_factory)
+        await service.refresh(ROLLUP_CRYPTO_FLOW, now=NOW)
+
+        async with admin_factory() as db:
+            await db.execute(update(CryptoFlowHourly).values(deposit_count=99))
+            await db.commit()
+
+        await service.rebuild(ROLLUP_CRYPTO_FLOW, since=NOW - timedelta(days=3))
+
+        async with admin_factory() as db:
+            by_user = await crypto_flow_by_user(db, NOW - timedelta(days=3), NOW)
+        assert by_user["u1"].deposit_count == 1
+
+
+class TestRevenueRollup:
+    @pytest.mark.asyncio
+    async def test_statistics_service_reads_rollup(self, admin_factory, main_factory):
+        await add_hand(main_factory, 10, NOW - timedelta(days=1, hours=1))
+        await add_hand(main_factory, 15, NOW - timedelta(days=1))
+        await add_hand(main_factory, 5, NOW - timedelta(hours=1))
+
+        service = StatsRollupService(admin_factory, main_factory)
+        written = await service.refresh(ROLLUP_REVENUE, now=NOW)
+        assert written == 3
+
+        await add_hand(main_factory, 7, datetime.now(timezone.utc) - timedelta(seconds=1))
+
+        async with admin_factory() as admin_db, main_factory() as main_db:
+            stats = StatisticsService(main_db, admin_db=admin_db)
+            daily = await stats.get_daily_revenue(days=7)
+            weekly = await stats.get_weekly_revenue(weeks=2)
+            monthly = await stats.get_monthly_revenue(months=1)
+
+        assert sum(d["rake"] for d in daily) == 37.0
+        assert sum(d["hands"] for d in daily) == 4
+        assert daily == sorted(daily, key=lambda d: d["date"], reverse=True)
+        assert sum(w["hands"] for w in weekly) == 4
+        assert sum(m["rake"] for m in monthly) == 37.0
+
+
+class TestCryptoStatsServiceRollup:
+    @pytest.mark.asyncio
+    async def test_dashboard_views(self, admin_factory):
+        await add_deposit(admin_factory, "whale", "1000", NOW - timedelta(days=1))
+        await add_deposit(admin_factory, "small", "10", NOW - timedelta(hours=2))
+        await add_withdrawal(admin_factory, "whale", "400", NOW - timedelta(days=9))
+        await StatsRollupService(admin_factory).refresh(ROLLUP_CRYPTO_FLOW, now=NOW)
+
+        async with admin_factory() as db:
+            service = CryptoStatsService(db)
+            daily = await service.get_daily_stats(days=30)
+            hourly = await service.get_hourly_patterns(days=7)
+            top = await service.get_top_users(days=30, limit=1)
+            trend = await service.get_trend_analysis(days=7)
+
+        assert sum(d["deposit_count"] for d in daily) == 2
+        assert sum(d["withdrawal_amount_krw"] for d in daily) == 400 * 1400
+        assert len(hourly) == 24
+        assert sum(h["deposit_count"] for h in hourly) == 2
+        assert top[0]["user_id"] == "whale"
+        assert top[0]["net_flow_usdt"] == 600.0
+        assert trend["deposits"]["current_count"] == 2
+        assert trend["withdrawals"]["previous_count"] == 1
+
+
+class TestStatsRollupTaskLock:
+    @pytest.mark.asyncio
+    async def test_skips_when_lock_held(self, admin_factory):
+        from unittest.mock import AsyncMock
+
+        from app.tasks.stats_rollup import StatsRollupTask
+
+        await add_deposit(admin_factory, "u1", "10", NOW - timedelta(hours=2))
+        redis = AsyncMock()
+        redis.set.return_value = None  # another instance holds the lock
+        task = StatsRollupTask(admin_factory, redis=redis)
+
+        assert await task.run_once() is None
+        assert await rollup_rows(admin_factory) == 0
+        redis.eval.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_refreshes_and_releases_lock(self, admin_factory):
+        from unittest.mock import AsyncMock
+
+        from app.tasks.stats_rollup import ROLLUP_LOCK_KEY, StatsRollupTask
+
+        await add_deposit(admin_factory, "u1", "10", NOW - timedelta(hours=2))
+        redis = AsyncMock()
+        redis.set.return_value = True
+        task = StatsRollupTask(admin_factory, redis=redis)
+
+        written = await task.run_once()
+
+        assert written[ROLLUP_CRYPTO_FLOW] >= 1
+        assert redis.set.await_args.args[0] == ROLLUP_LOCK_KEY
+        assert redis.set.await_args.kwargs["nx"] is True
+        release_args = redis.eval.await_args.args
+        assert release_args[2:] == (ROLLUP_LOCK_KEY, task._lock_owner)
@@ -0,0 +1,189 @@
+"""Tests for StreamingChipFlowDetector.
+
+스트리밍 칩 흐름 탐지: 쌍별 카운터, 슬라이딩 윈도우 만료, 중복 플래그 방지,
+대량 핸드 처리 성능.
+"""
+
+import random
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.services.streaming_chip_flow import (
+    RedisChipFlowDetector,
+    StreamingChipFlowDetector,
+)
+from tests.fakes import FakeRedis
+
+
+def hand(winner: str, loser: str, amount: int = 500, extra: list[str] | None = None):
+    participants = [
+        {"user_id": winner, "seat": 0, "bet_amount": amount, "won_amount": amount * 2},
+        {"user_id": loser, "seat": 1, "bet_amount": amount, "won_amount": 0},
+    ]
+    for i, user_id in enumerate(extra or []):
+        participants.append(
+            {"user_id": user_id, "seat": i + 2, "bet_amount": 0, "won_amount": 0}
+        )
+    return participants
+
+
+class TestPairCounters:
+    """쌍별 카운터 테스트."""
+
+    def test_flags_when_threshold_crossed(self):
+        detector = StreamingChipFlowDetector(min_hands=3, min_win_rate=0.9)
+
+        assert detector.process_hand(hand("w", "l"), now=0) == []
+        assert detector.process_hand(hand("w", "l"), now=1) == []
+        patterns = detector.process_hand(hand("w", "l"), now=2)
+
+        assert len(patterns) == 1
+        pattern = patterns[0]
+        assert pattern["loser_id"] == "l"
+        assert pattern["winner_id"] == "w"
+        assert pattern["total_hands"] == 3
+        assert pattern["winner_wins"] == 3
+        assert pattern["win_rate"] == 1.0
+        assert pattern["chip_flow"] == 1500
+
+    def test_balanced_pair_not_flagged(self):
+        detector = StreamingChipFlowDetector(min_hands=3, min_win_rate=0.9)
+
+        for i in range(10):
+            a, b = ("x", "y") if i % 2 else ("y", "x")
+            assert detector.process_hand(hand(a, b), now=i) == []
+
+    def test_flagged_once_per_window(self):
+        detector = StreamingChipFlowDetector(min_hands=3, min_win_rate=0.9)
+
+        flagged = [
+            p for i in range(10) for p in detector.process_hand(hand("w", "l"), now=i)
+        ]
+
+        assert len(flagged) == 1
+
+    def test_multi_way_hand_updates_all_pairs(self):
+        detector = StreamingChipFlowDetector()
+
+        detector.process_hand(hand("w", "l", extra=["a", "b"]), now=0)
+
+        assert detector.pair_count == 6
+
+
+class TestSlidingWindow:
+    """윈도우 만료 테스트."""
+
+    def test_old_hands_expire(self):
+        detector = StreamingChipFlowDetector(
+            window_seconds=60, min_hands=3, min_win_rate=0.9
+        )
+
+        detector.process_hand(hand("w", "l"), now=0)
+        detector.process_hand(hand("w", "l"), now=10)
+        # 첫 두 핸드가 윈도우 밖 → 동반 핸드 1
+        assert detector.process_hand(hand("w", "l"), now=100) == []
+        assert detector.pair_count == 1
+
+    def test_flag_resets_after_window(self):
+        detector = StreamingChipFlowDetector(
+            window_seconds=60, min_hands=1, min_win_rate=0.9
+        )
+
+        assert len(detector.process_hand(hand("w", "l"), now=0)) == 1
+        assert detector.process_hand(hand("w", "l"), now=30) == []
+        assert len(detector.process_hand(hand("w", "l"), now=200)) == 1
+
+    def test_state_empties_when_idle(self):
+        detector = StreamingChipFlowDetector(window_seconds=60)
+
+        for i in range(50):
+            detector.process_hand(hand(f"u{i}", f"v{i}"), now=i)
+        detector.process_hand([], now=1000)
+
+        assert detector.pair_count == 0
+
+
+class TestRedisChipFlow:
+    """Redis 공유 카운터: 여러 인스턴스가 핸드를 나눠 받아도 한 윈도우로 집계."""
+
+    def detectors(self, redis, count=2, **kwargs):
+        kwargs.setdefault("min_hands", 3)
+        kwargs.setdefault("min_win_rate", 0.9)
+        return [RedisChipFlowDetector(redis, **kwargs) for _ in range(count)]
+
+    @pytest.mark.asyncio
+    async def test_hands_split_across_instances(self):
+        first, second = self.detectors(FakeRedis())
+
+        assert await first.process_hand("h1", hand("w", "l"), now=0) == []
+        assert await second.process_hand("h2", hand("w", "l"), now=1) == []
+        patterns = await first.process_hand("h3", hand("w", "l"), now=2)
+
+        assert [(p["loser_id"], p["winner_id"], p["total_hands"]) for p in patterns] == [
+            ("l", "w", 3)
+        ]
+        # 다른 인스턴스는 같은 윈도우에서 다시 플래그하지 않음
+        assert await second.process_hand("h4", hand("w", "l"), now=3) == []
+
+    @pytest.mark.asyncio
+    async def test_redelivered_hand_counted_once(self):
+        [detector] = self.detectors(FakeRedis(), count=1)
+
+        for _ in range(3):
+            assert await detector.process_hand("h1", hand("w", "l"), now=0) == []
+
+    @pytest.mark.asyncio
+    async def test_window_uses_event_time(self):
+        redis = FakeRedis()
+        first, second = self.detectors(redis, window_seconds=60)
+
+        await first.process_hand("h1", hand("w", "l"), now=1_000)
+        await second.process_hand("h2", hand("w", "l"), now=1_010)
+        # 첫 두 핸드가 윈도우 밖: 한 인스턴스만 차감하고 빈 쌍 해시는 삭제
+        assert await first.process_hand("h3", hand("w", "l"), now=1_100) == []
+
+        assert redis.data[first._pair_key(("l", "w"))]["hands"] == 1
+        assert set(redis.data[first._hands_key]) == {"h3"}
+
+        await second.process_hand("h4", [], now=2_000)
+        assert first._pair_key(("l", "w")) not in redis.data
+
+    @pytest.mark.asyncio
+    async def test_try_flag_shared(self):
+        first, second = self.detectors(FakeRedis())
+
+        assert await first.try_flag("l", "w") is True
+        assert await second.try_flag("l", "w") is False
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_local_without_redis(self):
+        [detector] = self.detectors(MagicMock(), count=1)
+
+        for i in range(2):
+            assert await detector.process_hand(f"h{i}", hand("w", "l"), now=i) == []
+        assert len(await detector.process_hand("h2", hand("w", "l"), now=2)) == 1
+        assert detector._local.pair_count == 1
+
+
+class TestThroughput:
+    """대량 핸드 처리 성능."""
+
+    def test_per_hand_cost_independent_of_window_size(self):
+        rng = random.Random(1)
+        users = [f"u{i}" for i in range(2000)]
+        detector = StreamingChipFlowDetector(window_seconds=3600)
+
+        start = time.perf_counter()
+        for i in range(50_000):
+            seated = rng.sample(users, 6)
+            participants = [
+                {"user_id": u, "bet_amount": 100, "won_amount": 600 if j == 0 else 0}
+                for j, u in enumerate(seated)
+            ]
+            detector.process_hand(participants, now=i * 0.05)
+        elapsed = time.perf_counter() - start
+
+        print(f"\n[ChipFlow] 50,000 hands in {elapsed:.2f}s")
+        assert elapsed < 10
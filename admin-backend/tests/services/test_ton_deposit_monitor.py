@@ -2,11 +2,12 @@
 
 import pytest
 from decimal import Decimal
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from app.services.crypto.ton_deposit_monitor import TonDepositMonitor
 from app.services.crypto.ton_client import JettonTransfer
+from tests.fakes import FakeTonClient
 from app.models.deposit_request import DepositRequest, DepositRequestStatus
 
 
@@ -243,6 +244,179 @@ class TestCheckNewDeposits:
         assert monitor._last_lt == 200
 
 
+class FakeResult:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def all(self):
+        return list(self._rows)
+
+    def scalars(self):
+        return self
+
+
+class FakeSession:
+    """DepositRequest 목록을 보관하는 최소 AsyncSession 대역."""
+
+    def __init__(self, requests):
+        self.requests = requests
+        self.queries = []
+        self.commits = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return None
+
+    async def execute(self, query):
+        self.queries.append(query)
+        pending = [r for r in self.requests if r.status == DepositRequestStatus.PENDING]
+        if query.column_descriptions[0]["name"] == "memo":
+            return FakeResult([(r.memo, r.created_at) for r in pending])
+        return FakeResult(pending)
+
+    async def commit(self):
+        self.commits += 1
+
+
+def make_request(memo, usdt="10", created_minutes_ago=1):
+    now = datetime.now(timezone.utc)
+    return DepositRequest(
+        user_id="u1",
+        requested_krw=14000,
+        calculated_usdt=Decimal(usdt),
+        exchange_rate=Decimal("1400"),
+        memo=memo,
+        qr_data="ton://",
+        status=DepositRequestStatus.PENDING,
+        expires_at=now + timedelta(minutes=30),
+        created_at=now - timedelta(minutes=created_minutes_ago),
+    )
+
+
+class TestBatchedDeposits:
+    """Batch memo matching with the pending memo index."""
+
+    @pytest.fixture
+    def requests(self):
+        return [make_request("memo_a"), make_request("memo_b", usdt="20")]
+
+    @pytest.fixture
+    def session(self, requests):
+        return FakeSession(requests)
+
+    @pytest.fixture
+    def client(self):
+        return FakeTonClient()
+
+    @pytest.fixture
+    def monitor(self, session, client):
+        return TonDepositMonitor(
+            db_session_factory=lambda: session,
+            ton_client=client,
+            amount_tolerance=0.005,
+        )
+
+    @pytest.mark.asyncio
+    async def test_matches_confirmed_in_one_transaction(self, monitor, session, client, requests):
+        confirmed = []
+
+        async def on_confirmed(request, tx_hash):
+            confirmed.append((request.memo, tx_hash))
+
+        monitor.set_callbacks(on_confirmed=on_confirmed)
+        tx_a = client.add_transfer(Decimal("10"), memo="memo_a")
+        client.add_transfer(Decimal("5"), memo="unrelated")
+        tx_b = client.add_transfer(Decimal("20"), memo="memo_b")
+
+        await monitor.check_new_deposits()
+
+        # index load + one IN query, one commit
+        assert len(session.queries) == 2
+        assert session.commits == 1
+        assert all(r.status == DepositRequestStatus.CONFIRMED for r in requests)
+        assert confirmed == [("memo_a", tx_a.tx_hash), ("memo_b", tx_b.tx_hash)]
+        assert monitor._pending_memos == set()
+        assert monitor._last_lt == tx_b.lt
+
+    @pytest.mark.asyncio
+    async def test_failed_commit_keeps_cursor(self, monitor, session, client, requests):
+        client.add_transfer(Decimal("10"), memo="memo_a")
+        session.commit = AsyncMock(side_effect=RuntimeError("db down"))
+
+        await monitor.check_new_deposits()
+        assert monitor._last_lt is None
+
+        del session.commit  # back to FakeSession.commit
+        requests[0].status = DepositRequestStatus.PENDING
+        await monitor.check_new_deposits()
+
+        assert client.calls == 2
+        assert requests[0].status == DepositRequestStatus.CONFIRMED
+        assert monitor._last_lt == 1
+
+    @pytest.mark.asyncio
+    async def test_unknown_memos_rejected_without_lookup(self, monitor, session, client):
+        for i in range(20):
+            client.add_transfer(Decimal("1"), memo=f"other_{i}")
+        client.add_transfer(Decimal("1"), memo=None)
+
+        await monitor.check_new_deposits()
+
+        assert len(session.queries) == 1  # index load only
+        assert session.commits == 0
+
+    @pytest.mark.asyncio
+    async def test_amount_mismatch_keeps_request_pending(self, monitor, session, client, requests):
+        client.add_transfer(Decimal("1"), memo="memo_a")
+
+        await monitor.check_new_deposits()
+
+        assert requests[0].status == DepositRequestStatus.PENDING
+        assert session.commits == 0
+        assert "memo_a" in monitor._pending_memos
+
+    @pytest.mark.asyncio
+    async def test_duplicate_memo_confirms_once(self, monitor, session, client, requests):
+        first = client.add_transfer(Decimal("10"), memo="memo_a")
+        client.add_transfer(Decimal("10"), memo="memo_a")
+
+        await monitor.check_new_deposits()
+
+        assert requests[0].tx_hash == first.tx_hash
+        assert session.commits == 1
+
+    @pytest.mark.asyncio
+    async def test_index_refreshed_incrementally(self, monitor, session, client, requests):
+        await monitor.check_new_deposits()  # no transfers, no DB
+        assert session.queries == []
+
+        client.add_transfer(Decimal("1"), memo="other")
+        await monitor.check_new_deposits()
+        assert "created_at" not in str(session.queries[-1].whereclause)
+
+        requests.append(make_request("memo_c", created_minutes_ago=0))
+        client.add_transfer(Decimal("10"), memo="memo_c")
+        await monitor.check_new_deposits()
+
+        assert "created_at >=" in str(session.queries[-2].whereclause)
+        assert requests[-1].status == DepositRequestStatus.CONFIRMED
+
+    @pytest.mark.asyncio
+    async def test_full_rebuild_drops_stale_memos(self, monitor, session, client, requests):
+        client.add_transfer(Decimal("1"), memo="other")
+        await monitor.check_new_deposits()
+        assert monitor._pending_memos == {"memo_a", "memo_b"}
+
+        requests[1].status = DepositRequestStatus.CANCELLED
+        monitor.invalidate_pending_index()
+        client.add_transfer(Decimal("1"), memo="other2")
+        await monitor.check_new_deposits()
+
+        assert monitor._pending_memos == {"memo_a"}
+
+
 class TestClose:
     """Test close method."""
 
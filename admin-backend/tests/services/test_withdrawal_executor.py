@@ -0,0 +1,423 @@
+"""Tests for WithdrawalExecutor pipeline - 동시 서명 / 순차 브로드캐스트."""
+
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.models.admin_user import AdminUser
+from app.models.audit_log import AuditLog
+from app.models.base import Base
+from app.models.crypto import CryptoWithdrawal, TransactionStatus
+from app.services.crypto import withdrawal_executor as executor_module
+from app.services.crypto.withdrawal_executor import WithdrawalExecutor
+from tests.fakes import FakeKmsProvider, FakeTonSigner
+
+
+TO_ADDRESS = "0:" + "ab" * 32
+
+
+@pytest.fixture(autouse=True)
+def pipeline_settings(monkeypatch):
+    settings = executor_module.settings
+    monkeypatch.setattr(settings, "withdrawal_auto_threshold_usdt", 100.0)
+    monkeypatch.setattr(settings, "withdrawal_max_retry", 3)
+    monkeypatch.setattr(settings, "withdrawal_batch_size", 50)
+    monkeypatch.setattr(settings, "withdrawal_sign_concurrency", 4)
+    monkeypatch.setattr(settings, "withdrawal_broadcast_rps", 0)
+    monkeypatch.setattr(settings, "withdrawal_seqno_poll_interval", 0.005)
+    monkeypatch.setattr(settings, "withdrawal_seqno_wait_seconds", 2.0)
+    return settings
+
+
+@pytest.fixture
+async def session_factory():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            lambda sync_conn: Base.metadata.create_all(
+                sync_conn,
+                tables=[
+                    AdminUser.__table__,
+                    AuditLog.__table__,
+                    CryptoWithdrawal.__table__,
+                ],
+            )
+        )
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    await engine.dispose()
+
+
+class TrackingKms(FakeKmsProvider):
+    """FakeKmsProvider that records peak signing concurrency."""
+
+    def __init__(self, sign_delay: float = 0.0):
+        super().__init__(sign_delay=sign_delay)
+        self.in_flight = 0
+        self.peak = 0
+
+    async def sign(self, data, key_id="hot_wallet"):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            return await super().sign(data, key_id)
+        finally:
+            self.in_flight -= 1
+
+
+async def add_withdrawals(factory, count, usdt="10"):
+    now = datetime.now(timezone.utc)
+    ids = []
+    async with factory() as db:
+        for i in range(count):
+            withdrawal_id = str(uuid4())
+            ids.append(withdrawal_id)
+            db.add(CryptoWithdrawal(
+                id=withdrawal_id,
+                user_id=f"user-{i}",
+                to_address=TO_ADDRESS,
+                amount_usdt=Decimal(usdt),
+                amount_krw=Decimal(usdt) * 1400,
+                exchange_rate=Decimal("1400"),
+                network_fee_usdt=Decimal("1"),
+                network_fee_krw=Decimal("1400"),
+                status=TransactionStatus.PROCESSING,
+                requested_at=now - timedelta(minutes=10),
+                approved_at=now - timedelta(minutes=count - i),
+            ))
+        await db.commit()
+    return ids
+
+
+async def load(factory):
+    async with factory() as db:
+        result = await db.execute(
+            select(CryptoWithdrawal).order_by(CryptoWithdrawal.approved_at)
+        )
+        return list(result.scalars().all())
+
+
+async def expire_signatures(factory):
+    async with factory() as db:
+        await db.execute(
+            update(CryptoWithdrawal)
+            .where(CryptoWithdrawal.signed_boc.isnot(None))
+            .values(signed_valid_until=datetime.now(timezone.utc) - timedelta(minutes=1))
+        )
+        await db.commit()
+
+
+async def audit_count(factory, action):
+    async with factory() as db:
+        result = await db.execute(
+            select(func.count()).select_from(AuditLog).where(AuditLog.action == action)
+        )
+        return result.scalar()
+
+
+class TestWithdrawalPipeline:
+    @pytest.mark.asyncio
+    async def test_batch_sent_in_seqno_order(self, session_factory):
+        await add_withdrawals(session_factory, 5)
+        signer = FakeTonSigner()
+        executor = WithdrawalExecutor(session_factory, signer=signer)
+
+        processed = await executor.process_pending_withdrawals()
+
+        assert len(processed) == 5
+        assert [t.seqno for t in signer.sent] == [0, 1, 2, 3, 4]
+        withdrawals = await load(session_factory)
+        assert [w.tx_hash for w in withdrawals] == [t.tx_hash for t in signer.sent]
+        assert all(w.processed_at for w in withdrawals)
+        assert await audit_count(session_factory, "withdrawal_executed") == 5
+        assert executor.metrics.sent_total == 5
+        assert executor.metrics.oldest_queue_age_seconds >= 299
+
+    @pytest.mark.asyncio
+    async def test_signing_is_concurrent_and_bounded(self, session_factory):
+        await add_withdrawals(session_factory, 8)
+        kms = TrackingKms(sign_delay=0.02)
+        signer = FakeTonSigner(kms=kms)
+        executor = WithdrawalExecutor(session_factory, signer=signer)
+
+        await executor.process_pending_withdrawals()
+
+        assert kms.peak == 4
+        assert len(signer.sent) == 8
+
+    @pytest.mark.asyncio
+    async def test_failed_broadcast_defers_rest_of_lane(self, session_factory):
+        await add_withdrawals(session_factory, 3)
+        signer = FakeTonSigner()
+        signer.fail_next = 1
+        executor = WithdrawalExecutor(session_factory, signer=signer)
+
+        assert await executor.process_pending_withdrawals() == []
+        # Only the head counts as a retry; the rest never hit the network
+        assert len(executor._retry_counts) == 1
+        assert executor.metrics.deferred_total == 2
+
+        processed = await executor.process_pending_withdrawals()
+        assert len(processed) == 3
+        assert [t.seqno for t in signer.sent] == [0, 1, 2]
+
+    @pytest.mark.asyncio
+    async def test_lost_response_is_not_sent_twice(self, session_factory):
+        await add_withdrawals(session_factory, 2)
+        signer = FakeTonSigner()
+        signer.lose_next_response = 1
+        executor = WithdrawalExecutor(session_factory, signer=signer)
+
+        await executor.process_pending_withdrawals()
+        assert len(signer.sent) == 1  # accepted on chain, response lost
+
+        processed = await executor.process_pending_withdrawals()
+
+        assert len(processed) == 2
+        assert len(signer.sent) == 2
+        withdrawals = await load(session_factory)
+        assert {w.tx_hash for w in withdrawals} == {t.tx_hash for t in signer.sent}
+
+    @pytest.mark.asyncio
+    async def test_retry_rebroadcasts_same_message(self, session_factory):
+        await add_withdrawals(session_factory, 1)
+        signer = FakeTonSigner()
+        signer.fail_next = 1
+        executor = WithdrawalExecutor(session_factory, signer=signer)
+
+        await executor.process_pending_withdrawals()
+        signs = signer.kms.sign_calls
+        await executor.process_pending_withdrawals()
+
+        assert signer.kms.sign_calls == signs
+        assert signer.broadcast_calls == 2
+        assert len(signer.sent) == 1
+
+    @pytest.mark.asyncio
+    async def test_signed_message_is_stored_before_broadcast(self, session_factory):
+        await add_withdrawals(session_factory, 1)
+        signer = FakeTonSigner()
+        signer.fail_next = 1
+        executor = WithdrawalExecutor(session_factory, signer=signer)
+
+        await executor.process_pending_withdrawals()
+
+        [withdrawal] = await load(session_factory)
+        assert withdrawal.tx_hash is None
+        assert withdrawal.signed_seqno == 0
+        assert withdrawal.signed_boc
+        assert withdrawal.signed_valid_until is not None
+
+    @pytest.mark.asyncio
+    async def test_restart_after_lost_response_settles_by_seqno(self, session_factory):
+        await add_withdrawals(session_factory, 1)
+        signer = FakeTonSigner()
+        signer.lose_next_response = 1
+        await WithdrawalExecutor(session_factory, signer=signer).process_pending_withdrawals()
+        await signer.settle()
+
+        # New process: no in-memory state, the row alone must prevent a resend
+        executor = WithdrawalExecutor(session_factory, signer=signer)
+        processed = await executor.process_pending_withdrawals()
+
+        assert len(processed) == 1
+        assert signer.broadcast_calls == 1
+        [withdrawal] = await load(session_factory)
+        assert withdrawal.tx_hash == signer.sent[0].tx_hash
+        assert await audit_count(session_factory, "withdrawal_executed") == 1
+
+    @pytest.mark.asyncio
+    async def test_inflight_outside_batch_is_settled_first(
+        self, session_factory, pipeline_settings
+    ):
+        await add_withdrawals(session_factory, 1)
+        signer = FakeTonSigner()
+        signer.lose_next_response = 1
+        executor = WithdrawalExecutor(session_factory, signer=signer)
+        await executor.process_pending_withdrawals()
+
+        # Newer withdrawals fill the batch; the stored message still settles
+        pipeline_settings.withdrawal_batch_size = 1
+        async with session_factory() as db:
+            [first] = (await db.execute(select(CryptoWithdrawal))).scalars().all()
+            first.approved_at = datetime.now(timezone.utc)
+            await db.commit()
+        await add_withdrawals(session_factory, 1)
+
+        await executor.process_pending_withdrawals()
+
+        assert [t.seqno for t in signer.sent] == [0, 1]
+        withdrawals = await load(session_factory)
+        assert all(w.tx_hash for w in withdrawals)
+
+    @pytest.mark.asyncio
+    async def test_next_seqno_waits_for_inclusion(self, session_factory):
+        await add_withdrawals(session_factory, 5)
+        signer = FakeTonSigner(inclusion_delay=0.03)
+        executor = WithdrawalExecutor(session_factory, signer=signer)
+
+        processed = await executor.process_pending_withdrawals()
+
+        assert len(processed) == 5
+        # Every broadcast was accepted first time: no seqno+1 before seqno landed
+        assert signer.broadcast_calls == 5
+        assert executor._retry_counts == {}
+        assert signer.seqno == 5
+        withdrawals = await load(session_factory)
+        assert all(w.signed_boc is None for w in withdrawals)
+        assert [w.signed_seqno for w in withdrawals] == [0, 1, 2, 3, 4]
+
+    @pytest.mark.asyncio
+    async def test_unconfirmed_send_stays_in_lane(
+        self, session_factory, pipeline_settings
+    ):
+        pipeline_settings.withdrawal_seqno_wait_seconds = 0
+        await add_withdrawals(session_factory, 2)
+        signer = FakeTonSigner(inclusion_delay=0.05)
+        executor = WithdrawalExecutor(session_factory, signer=signer)
+
+        await executor.process_pending_withdrawals()
+
+        first, second = await load(session_factory)
+        assert first.tx_hash == signer.sent[0].tx_hash
+        assert first.signed_boc  # sent, seqno not landed yet
+        assert second.tx_hash is None
+        assert (await executor.get_executor_status())["awaiting_confirmation"] >= 1
+
+        pipeline_settings.withdrawal_seqno_wait_seconds = 2.0
+        processed = await executor.process_pending_withdrawals()
+
+        assert [t.seqno for t in signer.sent] == [0, 1]
+        assert len(processed) == 2
+        assert executor._retry_counts == {}
+        assert await audit_count(session_factory, "withdrawal_executed") == 2
+        withdrawals = await load(session_factory)
+        assert all(w.tx_hash and w.signed_boc is None for w in withdrawals)
+
+    @pytest.mark.asyncio
+    async def test_backlog_does_not_fail_healthy_withdrawals(
+        self, session_factory, pipeline_settings
+    ):
+        pipeline_settings.withdrawal_max_retry = 1
+        pipeline_settings.withdrawal_seqno_wait_seconds = 0
+        await add_withdrawals(session_factory, 3)
+        signer = FakeTonSigner(inclusion_delay=0.2)
+        executor = WithdrawalExecutor(session_factory, signer=signer)
+
+        # Back-to-back runs while seqno 0 is still pending
+        for _ in range(3):
+            await executor.process_pending_withdrawals()
+
+        assert [t.seqno for t in signer.sent] == [0]
+        assert executor._retry_counts == {}
+        withdrawals = await load(session_factory)
+        assert all(w.status == TransactionStatus.PROCESSING for w in withdrawals)
+
+    @pytest.mark.asyncio
+    async def test_seqno_mismatch_is_not_a_retry(
+        self, session_factory, pipeline_settings, monkeypatch
+    ):
+        pipeline_settings.withdrawal_max_retry = 1
+        await add_withdrawals(session_factory, 1)
+        signer = FakeTonSigner()
+        signer.fail_next = 3
+        executor = WithdrawalExecutor(session_factory, signer=signer)
+
+        async def lagging_seqno():
+            return signer.seqno - 1  # node behind the signed seqno
+
+        monkeypatch.setattr(executor, "_read_seqno", lagging_seqno)
+        for _ in range(3):
+            assert await executor.process_pending_withdrawals() == []
+
+        assert executor._retry_counts == {}
+        assert executor.metrics.retry_total == 0
+        [withdrawal] = await load(session_factory)
+        assert withdrawal.status == TransactionStatus.PROCESSING
+
+        monkeypatch.delattr(executor, "_read_seqno")
+        assert len(await executor.process_pending_withdrawals()) == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_signature_is_signed_again(self, session_factory):
+        await add_withdrawals(session_factory, 1)
+        signer = FakeTonSigner()
+        signer.fail_next = 1
+        executor = WithdrawalExecutor(session_factory, signer=signer)
+
+        await executor.process_pending_withdrawals()
+        await expire_signatures(session_factory)
+        await executor.process_pending_withdrawals()
+
+        assert signer.kms.sign_calls == 2
+        assert [t.seqno for t in signer.sent] == [0]
+        [withdrawal] = await load(session_factory)
+        assert withdrawal.tx_hash == signer.sent[0].tx_hash
+
+    @pytest.mark.asyncio
+    async def test_max_retries_marks_failed(self, session_factory, pipeline_settings):
+        pipeline_settings.withdrawal_max_retry = 1
+        await add_withdrawals(session_factory, 1)
+        signer = FakeTonSigner()
+        signer.fail_next = 5
+        executor = WithdrawalExecutor(session_factory, signer=signer)
+
+        await executor.process_pending_withdrawals()
+        # The signature expired unsent, so the retry limit applies
+        await expire_signatures(session_factory)
+        await executor.process_pending_withdrawals()
+
+        [withdrawal] = await load(session_factory)
+        assert withdrawal.status == TransactionStatus.FAILED
+        assert withdrawal.signed_boc is None
+        assert await audit_count(session_factory, "withdrawal_failed") == 1
+
+    @pytest.mark.asyncio
+    async def test_insufficient_gas_marks_failed(self, session_factory):
+        await add_withdrawals(session_factory, 2)
+        signer = FakeTonSigner(ton_balance=0)
+        executor = WithdrawalExecutor(session_factory, signer=signer)
+
+        await executor.process_pending_withdrawals()
+
+        withdrawals = await load(session_factory)
+        assert all(w.status == TransactionStatus.FAILED for w in withdrawals)
+        assert signer.broadcast_calls == 0
+
+    @pytest.mark.asyncio
+    async def test_broadcast_rate_limit(self, session_factory, pipeline_settings):
+        pipeline_settings.withdrawal_broadcast_rps = 20
+        await add_withdrawals(session_factory, 4)
+        executor = WithdrawalExecutor(session_factory, signer=FakeTonSigner())
+
+        started = time.monotonic()
+        await executor.process_pending_withdrawals()
+
+        assert time.monotonic() - started >= 0.14
+
+    @pytest.mark.asyncio
+    async def test_execute_single_uses_lane(self, session_factory):
+        [withdrawal_id] = await add_withdrawals(session_factory, 1)
+        signer = FakeTonSigner()
+        signer.seqno = 7
+        executor = WithdrawalExecutor(session_factory, signer=signer)
+
+        assert await executor.execute_single(withdrawal_id) is True
+        assert signer.sent[0].seqno == 7
+
+    @pytest.mark.asyncio
+    async def test_status_includes_pipeline_metrics(self, session_factory):
+        await add_withdrawals(session_factory, 2)
+        executor = WithdrawalExecutor(session_factory, signer=FakeTonSigner())
+        await executor.process_pending_withdrawals()
+
+        status = await executor.get_executor_status()
+
+        assert status["pending_count"] == 0
+        assert status["pipeline"]["sent_total"] == 2
+        assert status["pipeline"]["last_batch_sent"] == 2
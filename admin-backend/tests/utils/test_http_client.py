@@ -0,0 +1,125 @@
+"""Tests for shared HTTP pool, upstream metrics and SWR cache."""
+
+import asyncio
+from decimal import Decimal
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from app.services.crypto.ton_exchange_rate import TonExchangeRateService
+from app.utils import http_client
+from app.utils.http_client import SWRCache, create_client, get_upstream_stats
+
+
+@pytest.fixture
+def mock_pool(monkeypatch):
+    """Replace the shared pool with a MockTransport."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/boom":
+            raise httpx.ConnectError("refused", request=request)
+        if request.url.path == "/fail":
+            return httpx.Response(503)
+        return httpx.Response(200, json={"usd": {"krw": 1470.5}})
+
+    pool = httpx.MockTransport(handler)
+    monkeypatch.setattr(http_client, "_pool", pool)
+    monkeypatch.setattr(http_client, "_pool_loop", None)
+    monkeypatch.setattr(http_client, "_get_pool", lambda: pool)
+    monkeypatch.setattr(http_client, "_upstream_stats", {})
+    return pool
+
+
+class TestSharedPool:
+    @pytest.mark.asyncio
+    async def test_upstream_metrics(self, mock_pool):
+        client = create_client()
+        await client.get("https://rates.example/ok")
+        await client.get("https://rates.example/fail")
+        with pytest.raises(httpx.ConnectError):
+            await client.get("https://ton.example/boom")
+
+        stats = get_upstream_stats()
+
+        assert stats["rates.example"]["requests"] == 2
+        assert stats["rates.example"]["errors"] == 1
+        assert stats["rates.example"]["last_error"] == "HTTP 503"
+        assert stats["ton.example"]["last_error"] == "ConnectError"
+
+    @pytest.mark.asyncio
+    async def test_clients_share_pool_and_close_leaves_it_open(self):
+        first = create_client(headers={"X-API-Key": "a"})
+        second = create_client(timeout=30.0)
+
+        assert first._transport._pool is second._transport._pool
+        await first.aclose()
+        assert http_client._pool is first._transport._pool
+        await http_client.close_http_pool()
+        assert http_client._pool is None
+
+
+class TestSWRCache:
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_load(self):
+        cache = SWRCache()
+        calls = 0
+
+        async def loader():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return calls
+
+        results = await asyncio.gather(*(cache.get("k", loader, ttl=60) for _ in range(10)))
+
+        assert results == [1] * 10
+        assert calls == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_value_served_while_refreshing(self):
+        cache = SWRCache()
+        values = iter([1, 2])
+        loader = AsyncMock(side_effect=lambda: next(values))
+
+        assert await cache.get("k", loader, ttl=0, stale_ttl=60) == 1
+        assert await cache.get("k", loader, ttl=0, stale_ttl=60) == 1  # stale
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert await cache.get("k", loader, ttl=60) == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_background_refresh_keeps_stale(self):
+        cache = SWRCache()
+        loader = AsyncMock(side_effect=[1, RuntimeError("down")])
+
+        await cache.get("k", loader, ttl=0, stale_ttl=60)
+        assert await cache.get("k", loader, ttl=0, stale_ttl=60) == 1
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert await cache.get("k", AsyncMock(), ttl=0, stale_ttl=60) == 1
+
+    @pytest.mark.asyncio
+    async def test_load_error_propagates_without_caching(self):
+        cache = SWRCache()
+        with pytest.raises(RuntimeError):
+            await cache.get("k", AsyncMock(side_effect=RuntimeError("down")), ttl=60)
+
+        assert await cache.get("k", AsyncMock(return_value=5), ttl=60) == 5
+
+
+class TestExchangeRateCoalescing:
+    @pytest.mark.asyncio
+    async def test_concurrent_rate_requests_fetch_once(self):
+        async def fetch():
+            await asyncio.sleep(0.01)
+            return Decimal("1470.5")
+
+        services = [TonExchangeRateService(redis_client=None) for _ in range(5)]
+        with patch.object(
+            TonExchangeRateService, "_fetch_from_jsdelivr", side_effect=fetch
+        ) as mock_fetch:
+            rates = await asyncio.gather(*(s.get_usdt_krw_rate() for s in services))
+
+        assert rates == [Decimal("1470.5")] * 5
+        assert mock_fetch.call_count == 1
@@ -0,0 +1,176 @@
+"""Tests for keyset pagination, opaque cursors and capped counts."""
+
+from datetime import datetime, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.models.crypto import CryptoDeposit
+from app.services.audit_service import AuditService
+from app.utils.pagination import (
+    COUNT_CAP,
+    InvalidCursorError,
+    Keyset,
+    capped_count_query,
+    capped_count_sql,
+    page_offset,
+    page_response,
+)
+
+
+class TestCursor:
+    def test_round_trip_typed_values(self):
+        keyset = Keyset(("created_at", "id"))
+        ts = datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+        uid = uuid4()
+
+        values = keyset.decode(keyset.encode([ts, uid]))
+        assert values == [ts, uid]
+
+        values = keyset.decode(keyset.encode([Decimal("12.50"), "u-1"]))
+        assert values == [Decimal("12.50"), "u-1"]
+
+    def test_cursor_is_url_safe(self):
+        cursor = Keyset(("created_at", "id")).encode(["a+b/c?", "id"])
+        assert all(c.isalnum() or c in "-_" for c in cursor)
+
+    def test_rejects_other_sort_spec(self):
+        cursor = Keyset(("created_at", "id")).encode(["x", "y"])
+
+        with pytest.raises(InvalidCursorError):
+            Keyset(("created_at", "id"), descending=False).decode(cursor)
+        with pytest.raises(InvalidCursorError):
+            Keyset(("nickname", "id")).decode(cursor)
+
+    @pytest.mark.parametrize("cursor", ["not-a-cursor", "e30", "!!!"])
+    def test_rejects_garbage(self, cursor):
+        with pytest.raises(InvalidCursorError):
+            Keyset(("created_at", "id")).decode(cursor)
+
+
+class TestKeysetSql:
+    def test_where_sql_binds_cursor_values(self):
+        keyset = Keyset(("created_at", "id"))
+        params = {}
+        cursor = keyset.encode(["2026-01-01", "u-9"])
+
+        assert keyset.where_sql(None, params) is None
+        assert keyset.where_sql(cursor, params) == "(created_at, id) < (:_k0, :_k1)"
+        assert params == {"_k0": "2026-01-01", "_k1": "u-9"}
+        assert keyset.order_by_sql() == "created_at DESC, id DESC"
+
+    def test_ascending(self):
+        keyset = Keyset(("nickname", "id"), descending=False)
+        params = {}
+        cursor = keyset.encode(["bob", "u-1"])
+
+        assert keyset.where_sql(cursor, params) == "(nickname, id) > (:_k0, :_k1)"
+        assert keyset.order_by_sql() == "nickname ASC, id ASC"
+
+    def test_apply_orm(self):
+        from sqlalchemy import select
+
+        keyset = Keyset((CryptoDeposit.detected_at, CryptoDeposit.id))
+        cursor = keyset.encode([datetime(2026, 1, 1, tzinfo=timezone.utc), uuid4()])
+        sql = str(
+            keyset.apply(select(CryptoDeposit), cursor).compile(dialect=postgresql.dialect())
+        )
+
+        assert "(crypto_deposits.detected_at, crypto_deposits.id) <" in sql
+        assert "ORDER BY crypto_deposits.detected_at DESC, crypto_deposits.id DESC" in sql
+
+    def test_page_rows(self):
+        keyset = Keyset(("created_at", "id"))
+        rows = [SimpleNamespace(created_at=f"t{i}", id=i) for i in range(4)]
+
+        page, cursor = keyset.page_rows(rows, 3, lambda r: (r.created_at, r.id))
+        assert [r.id for r in page] == [0, 1, 2]
+        assert keyset.decode(cursor) == ["t2", 2]
+
+        page, cursor = keyset.page_rows(rows[:3], 3, lambda r: (r.created_at, r.id))
+        assert len(page) == 3
+        assert cursor is None
+
+
+class TestCounts:
+    def test_page_offset(self):
+        assert page_offset(3, 20, None) == 40
+        assert page_offset(3, 20, "cursor") == 0
+
+    def test_capped_count_sql(self):
+        sql = capped_count_sql("FROM audit_logs WHERE 1=1")
+        assert f"LIMIT {COUNT_CAP}" in sql
+        assert "pg_class" not in sql
+
+        sql = capped_count_sql("FROM audit_logs WHERE 1=1", estimate_table="audit_logs")
+        assert "to_regclass('audit_logs')" in sql
+
+    def test_capped_count_query(self):
+        from sqlalchemy import select
+
+        sql = str(
+            capped_count_query(select(CryptoDeposit), estimate_table="crypto_deposits")
+            .compile(dialect=postgresql.dialect())
+        )
+        assert "LIMIT" in sql
+        assert "reltuples" in sql
+
+    def test_page_response(self):
+        result = page_response([], 0, 1, 20, None)
+        assert result["total_pages"] == 1
+        assert result["total_is_estimate"] is False
+
+        result = page_response([1], COUNT_CAP, 1, 20, "c")
+        assert result["total_pages"] == COUNT_CAP // 20
+        assert result["next_cursor"] == "c"
+        assert result["total_is_estimate"] is True
+
+
+class TestServiceAdoption:
+    @pytest.mark.asyncio
+    async def test_audit_list_uses_cursor_instead_of_offset(self):
+        db = MagicMock()
+        count_result = MagicMock()
+        count_result.scalar.return_value = 3
+        list_result = MagicMock()
+        ts = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        list_result.fetchall.return_value = [
+            SimpleNamespace(
+                id=f"log-{i}", admin_user_id="a", admin_username="admin",
+                action="login", target_type="user", target_id="u",
+                details={}, ip_address=None, created_at=ts,
+            )
+            for i in range(3)
+        ]
+        db.execute = AsyncMock(side_effect=[count_result, list_result])
+
+        result = await AuditService(db).list_logs(page_size=2)
+
+        assert len(result["items"]) == 2
+        assert result["next_cursor"] is not None
+        list_params = db.execute.call_args_list[1].args[1]
+        assert list_params["limit"] == 3
+
+        # 다음 페이지: 커서 조건 + OFFSET 0
+        db.execute = AsyncMock(side_effect=[count_result, list_result])
+        await AuditService(db).list_logs(page=5, page_size=2, cursor=result["next_cursor"])
+
+        list_sql = str(db.execute.call_args_list[1].args[0])
+        list_params = db.execute.call_args_list[1].args[1]
+        assert "(created_at, id) < (:_k0, :_k1)" in list_sql
+        assert list_params["offset"] == 0
+        assert list_params["_k0"] == ts
+        assert list_params["_k1"] == "log-1"
+
+    @pytest.mark.asyncio
+    async def test_invalid_cursor_is_not_wrapped(self):
+        db = MagicMock()
+        db.execute = AsyncMock()
+
+        with pytest.raises(InvalidCursorError):
+            await AuditService(db).list_logs(cursor="garbage")
+        db.execute.assert_not_called()
@@ -59,7 +59,8 @@ async def list_rooms(
 ):
     """List all available rooms.
 
-    Returns a paginated list of public rooms with their current status.
+    Returns a paginated list of public rooms with their current status,
+    served from the in-memory lobby index (sorted by blinds, then occupancy).
     """
     room_service = RoomService(db)
 
@@ -75,16 +76,16 @@ async def list_rooms(
     return RoomListResponse(
         rooms=[
             RoomSummaryResponse(
-                id=room.id,
+                id=room.room_id,
                 name=room.name,
                 blinds=f"{room.small_blind}/{room.big_blind}",
                 max_seats=room.max_seats,
-                player_count=room.current_players,
+                player_count=room.player_count,
                 status=room.status,
-                is_private=room.config.get("is_private", False),
-                buy_in_min=room.config.get("buy_in_min", 400),
-                buy_in_max=room.config.get("buy_in_max", 2000),
-                room_type=room.config.get("room_type", "cash"),
+                is_private=room.is_private,
+                buy_in_min=room.buy_in_min,
+                buy_in_max=room.buy_in_max,
+                room_type=room.room_type,
             )
             for room in rooms
         ],
@@ -139,38 +140,42 @@ async def quick_join(
         if existing_rooms:
             raise AlreadySeatedError(room_id=existing_rooms[0])
 
-        # Find best room
-        room = await room_matcher.find_best_room(
+        # 바이인은 지갑에서 차감되므로 지갑 잔액 기준으로 방/바이인 계산
+        wallet_balance = await room_service.get_available_balance(current_user.id)
+
+        # Find best room and hold a seat in it
+        reservation = await room_matcher.reserve_best_room(
             user_id=current_user.id,
-            user_balance=current_user.balance,
+            user_balance=wallet_balance,
             blind_level=blind_level,
             exclude_room_ids=existing_rooms,
         )
 
-        if not room:
+        if not reservation:
             raise NoAvailableRoomError(blind_level=blind_level)
 
-        # Find available seat
-        seat = room_matcher.get_available_seat(room)
-        if seat is None:
-            raise RoomFullError(room_id=room.id)
+        room = reservation.room
 
-        # Calculate buy-in
-        buy_in_min = room.config.get("buy_in_min", 400)
-        buy_in_max = room.config.get("buy_in_max", 2000)
-        buy_in = calculate_default_buy_in(buy_in_min, buy_in_max, current_user.balance)
+        try:
+            # Calculate buy-in
+            buy_in = calculate_default_buy_in(
+                room.buy_in_min, room.buy_in_max, wallet_balance
+            )
 
-        # Join room
-        result = await room_service.quick_join_room(
-            user_id=current_user.id,
-            room_id=room.id,
-            seat=seat,
-            buy_in=buy_in,
-        )
+            # Join room
+            result = await room_service.quick_join_room(
+                user_id=current_user.id,
+                room_id=room.room_id,
+                seat=reservation.seat,
+                buy_in=buy_in,
+            )
+        except Exception:
+            await room_matcher.release(reservation)
+            raise
 
         return QuickJoinResponse(
             success=True,
-            room_id=room.id,
+            room_id=room.room_id,
             table_id=result["table_id"],
             seat=result["position"],
             buy_in=buy_in,
@@ -139,6 +139,34 @@ class Settings(BaseSettings):
         default=1.2,
         description="Mode (most likely) bot thinking time for triangular distribution",
     )
+    bot_think_extra_probability: float = Field(
+        default=0.2,
+        description="Probability of an extra long think on top of the triangular time",
+    )
+    bot_think_extra_min: float = Field(
+        default=1.0,
+        description="Minimum extra long-think time in seconds",
+    )
+    bot_think_extra_max: float = Field(
+        default=2.0,
+        description="Maximum extra long-think time in seconds",
+    )
+
+    # Bot Decision Worker (봇 결정은 이벤트 루프 밖 워커 풀에서 배치 평가)
+    # process: 평가가 순수 Python이라 스레드 풀은 GIL을 이벤트 루프와 나눠 씀
+    # (thread는 프로세스 생성이 불가한 환경/테스트용)
+    bot_decision_executor: str = Field(
+        default="process",
+        description="Bot decision worker pool: process (default, GIL-free) | thread",
+    )
+    bot_decision_workers: int = Field(
+        default=1,
+        description="Bot decision worker processes/threads (1 process = 1 core off the event loop)",
+    )
+    bot_decision_max_batch: int = Field(
+        default=128,
+        description="Maximum bot decisions evaluated per worker batch",
+    )
 
     # WebSocket Connection Limits (300-500명 동시 접속 대응)
     ws_max_connections: int = Field(
@@ -160,6 +188,34 @@ class Settings(BaseSettings):
         description="API URL for bot authentication",
     )
 
+    # Wallet hot path (Redis 권위 잔액 + 비동기 Postgres 저널)
+    wallet_hot_path: bool = Field(
+        default=False,
+        description="Execute wallet debits/credits atomically in Redis (Lua) and journal to Postgres asynchronously",
+    )
+
+    # Sharded tournament execution (대형 MTT 테이블을 여러 인스턴스에 분할)
+    tournament_shard_enabled: bool = Field(
+        default=False,
+        description="Run tournament tables on shard workers and aggregate on a coordinator",
+    )
+    tournament_shard_worker_id: str = Field(
+        default="",
+        description="This instance's shard worker ID (기본: hostname)",
+    )
+    tournament_shard_workers: str = Field(
+        default="",
+        description="Comma-separated shard worker IDs shared by all instances",
+    )
+    tournament_shard_coordinator: bool = Field(
+        default=False,
+        description="Run shard coordinators (exactly one instance)",
+    )
+    tournament_shard_sync_interval: float = Field(
+        default=1.0,
+        description="Seconds between coordinator start checks / worker snapshot syncs",
+    )
+
     # Internal Admin API Settings (admin-backend 연동)
     internal_api_key: str = Field(
         default="dev_api_key_for_local",
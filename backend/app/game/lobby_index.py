@@ -0,0 +1,333 @@
+"""
+LobbyIndex - 로비 방 목록 인메모리 인덱스.
+
+GET /rooms 와 로비 WebSocket 스냅샷이 매 새로고침마다 Postgres 목록/COUNT
+쿼리를 실행하지 않도록, 방 목록을 정렬된 상태로 메모리에 유지합니다.
+
+- 정렬: 블라인드 오름차순 → 인원 내림차순 (같은 블라인드면 찬 방 먼저) → room_id
+- 인원/상태: GameManager 라이브 테이블 기준 (좌석/퇴장/핸드 종료 시 sync_table)
+- 변경 시 diff(upsert/remove)를 퍼블리셔로 push (stateVersion 단조 증가)
+- Redis 해시(lobby:rooms)에 미러링 → 재시작 시 DB 조회 없이 워밍업
+
+페이지 조회는 정렬된 키 리스트 슬라이스라 O(page)입니다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import json
+import logging
+from dataclasses import asdict, dataclass, replace
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Optional, Protocol
+
+from sqlalchemy import select
+
+from app.game.manager import game_manager
+from app.models.room import Room, RoomStatus
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from app.game.poker_table import PokerTable
+
+logger = logging.getLogger(__name__)
+
+LOBBY_ROOMS_KEY = "lobby:rooms"
+
+LobbyPublisher = Callable[[dict[str, Any]], Awaitable[None]]
+SortKey = tuple[int, int, str]
+
+
+class LobbyListener(Protocol):
+    """인덱스 변경을 동기적으로 따라가는 파생 인덱스 (예: QuickJoinIndex)."""
+
+    def room_added(self, entry: "LobbyRoom") -> None: ...
+
+    def room_removed(self, entry: "LobbyRoom") -> None: ...
+
+    def clear(self) -> None: ...
+
+
+@dataclass(frozen=True, slots=True)
+class LobbyRoom:
+    """로비에 표시되는 방 요약 (불변, 변경 시 교체)."""
+
+    room_id: str
+    name: str
+    small_blind: int
+    big_blind: int
+    max_seats: int
+    player_count: int
+    status: str
+    is_private: bool = False
+    buy_in_min: int = 400
+    buy_in_max: int = 2000
+    room_type: str = "cash"
+
+    @property
+    def sort_key(self) -> SortKey:
+        return (self.big_blind, -self.player_count, self.room_id)
+
+    @classmethod
+    def from_room(cls, room: Room) -> "LobbyRoom":
+        config = room.config or {}
+        return cls(
+            room_id=room.id,
+            name=room.name,
+            small_blind=room.small_blind,
+            big_blind=room.big_blind,
+            max_seats=room.max_seats,
+            player_count=room.current_players or 0,
+            status=room.status,
+            is_private=config.get("is_private", False),
+            buy_in_min=config.get("buy_in_min", 400),
+            buy_in_max=config.get("buy_in_max", 2000),
+            room_type=config.get("room_type", "cash"),
+        )
+
+    def with_live_table(self, table: "PokerTable") -> "LobbyRoom":
+        """라이브 테이블의 점유 좌석 수로 인원/상태 갱신."""
+        player_count = sum(1 for p in table.players.values() if p is not None)
+        status = self.status
+        if status != RoomStatus.CLOSED.value:
+            # RoomService.join_room/leave_room과 같은 규칙
+            status = (
+                RoomStatus.PLAYING.value if player_count >= 2 else RoomStatus.WAITING.value
+            )
+        return replace(self, player_count=player_count, status=status)
+
+    def to_payload(self) -> dict[str, Any]:
+        """로비 WebSocket payload (camelCase)."""
+        return {
+            "roomId": self.room_id,
+            "name": self.name,
+            "blinds": f"{self.small_blind}/{self.big_blind}",
+            "maxSeats": self.max_seats,
+            "playerCount": self.player_count,
+            "status": self.status,
+            "isPrivate": self.is_private,
+            "buyInMin": self.buy_in_min,
+            "buyInMax": self.buy_in_max,
+            "roomType": self.room_type,
+        }
+
+
+class LobbyIndex:
+    """정렬된 로비 방 목록 + diff push.
+
+    상태별 정렬 리스트(None = 전체)를 bisect로 유지하므로 갱신은 O(log n)
+    탐색 + 리스트 삽입, 페이지 조회는 슬라이스입니다.
+    """
+
+    def __init__(self):
+        self._rooms: dict[str, LobbyRoom] = {}
+        self._orders: dict[Optional[str], list[SortKey]] = {None: []}
+        self._version = 0
+        self._loaded = False
+        self._load_lock = asyncio.Lock()
+        self._redis: Optional["Redis"] = None
+        self._publisher: Optional[LobbyPublisher] = None
+        self._listeners: list[LobbyListener] = []
+
+    # =========================================================================
+    # Wiring
+    # =========================================================================
+
+    def attach_redis(self, redis: Optional["Redis"]) -> None:
+        """Redis 미러 연결 (None이면 메모리만 사용)."""
+        self._redis = redis
+
+    def set_publisher(self, publisher: Optional[LobbyPublisher]) -> None:
+        """diff push 콜백 등록 (로비 채널 브로드캐스트)."""
+        self._publisher = publisher
+
+    def add_listener(self, listener: LobbyListener) -> None:
+        """파생 인덱스 등록 (현재 방 목록을 먼저 재생)."""
+        self._listeners.append(listener)
+        for entry in self._rooms.values():
+            listener.room_added(entry)
+
+    @property
+    def state_version(self) -> int:
+        return self._version
+
+    def clear(self) -> None:
+        """인덱스 초기화 (테스트용, 다음 조회 시 다시 로드)."""
+        self._rooms.clear()
+        self._orders = {None: []}
+        self._loaded = False
+        for listener in self._listeners:
+            listener.clear()
+
+    # =========================================================================
+    # Loading
+    # =========================================================================
+
+    async def ensure_loaded(self, db: "AsyncSession") -> None:
+        """최초 1회 Redis 미러 또는 DB에서 방 목록 로드."""
+        if self._loaded:
+            return
+        async with self._load_lock:
+            if self._loaded:
+                return
+
+            rooms = await self._load_from_redis()
+            if rooms is None:
+                result = await db.execute(
+                    select(Room).where(Room.status != RoomStatus.CLOSED.value)
+                )
+                rooms = [LobbyRoom.from_room(r) for r in result.scalars().all()]
+                await self._mirror_many(rooms)
+
+            for room in rooms:
+                if room.room_id in self._rooms:
+                    # 로드 전에 upsert된 최신 값 유지
+                    continue
+                table = game_manager.get_table(room.room_id)
+                self._insert(room.with_live_table(table) if table else room)
+            self._loaded = True
+            logger.info(f"[LOBBY] Index loaded with {len(rooms)} rooms")
+
+    async def _load_from_redis(self) -> Optional[list[LobbyRoom]]:
+        if self._redis is None:
+            return None
+        try:
+            raw = await self._redis.hgetall(LOBBY_ROOMS_KEY)
+        except Exception as e:
+            logger.warning(f"[LOBBY] Redis load failed, falling back to DB: {e}")
+            return None
+        if not raw:
+            return None
+        try:
+            return [LobbyRoom(**json.loads(value)) for value in raw.values()]
+        except (TypeError, ValueError) as e:
+            logger.warning(f"[LOBBY] Redis mirror unreadable, reloading from DB: {e}")
+            return None
+
+    # =========================================================================
+    # Queries
+    # =========================================================================
+
+    def page(
+        self,
+        page: int,
+        page_size: int,
+        status: Optional[str] = None,
+        include_private: bool = True,
+    ) -> tuple[list[LobbyRoom], int]:
+        """정렬된 방 목록 한 페이지와 전체 개수."""
+        order = self._orders.get(status, [])
+        offset = (page - 1) * page_size
+
+        if include_private:
+            keys = order[offset:offset + page_size]
+            return [self._rooms[key[2]] for key in keys], len(order)
+
+        # 공개 방만: 필터가 필요하므로 선형 (공개 API는 include_private=True 사용)
+        public = [self._rooms[key[2]] for key in order if not self._rooms[key[2]].is_private]
+        return public[offset:offset + page_size], len(public)
+
+    def get(self, room_id: str) -> Optional[LobbyRoom]:
+        return self._rooms.get(room_id)
+
+    # =========================================================================
+    # Updates
+    # =========================================================================
+
+    async def upsert_room(self, room: Room) -> None:
+        """DB Room 기준 갱신 (생성/설정 변경/입퇴장/종료)."""
+        if room.status == RoomStatus.CLOSED.value:
+            await self.remove(room.id)
+            return
+        entry = LobbyRoom.from_room(room)
+        table = game_manager.get_table(room.id)
+        if table:
+            entry = entry.with_live_table(table)
+        await self._apply(entry)
+
+    async def sync_table(self, table: "PokerTable") -> None:
+        """라이브 테이블의 좌석 변경/핸드 종료 반영."""
+        current = self._rooms.get(table.room_id)
+        if current is None:
+            # 아직 로드 전이거나 인덱스에 없는 방 (로드 시 라이브 값으로 채워짐)
+            return
+        await self._apply(current.with_live_table(table))
+
+    async def remove(self, room_id: str) -> None:
+        current = self._rooms.get(room_id)
+        if current is None:
+            return
+        self._delete(current)
+        self._version += 1
+        if self._redis is not None:
+            try:
+                await self._redis.hdel(LOBBY_ROOMS_KEY, room_id)
+            except Exception as e:
+                logger.warning(f"[LOBBY] Redis mirror delete failed: {e}")
+        await self._publish({
+            "updateType": "room_removed",
+            "room": {"roomId": room_id},
+            "stateVersion": self._version,
+        })
+
+    async def _apply(self, entry: LobbyRoom) -> None:
+        current = self._rooms.get(entry.room_id)
+        if current == entry:
+            return
+        if current is not None:
+            self._delete(current)
+        self._insert(entry)
+        self._version += 1
+        await self._mirror_many([entry])
+        await self._publish({
+            "updateType": "room_updated" if current is not None else "room_created",
+            "room": entry.to_payload(),
+            "stateVersion": self._version,
+        })
+
+    # =========================================================================
+    # Internals
+    # =========================================================================
+
+    def _insert(self, entry: LobbyRoom) -> None:
+        self._rooms[entry.room_id] = entry
+        key = entry.sort_key
+        bisect.insort(self._orders[None], key)
+        bisect.insort(self._orders.setdefault(entry.status, []), key)
+        for listener in self._listeners:
+            listener.room_added(entry)
+
+    def _delete(self, entry: LobbyRoom) -> None:
+        del self._rooms[entry.room_id]
+        key = entry.sort_key
+        for order in (self._orders[None], self._orders.get(entry.status, [])):
+            i = bisect.bisect_left(order, key)
+            if i < len(order) and order[i] == key:
+                del order[i]
+        for listener in self._listeners:
+            listener.room_removed(entry)
+
+    async def _mirror_many(self, entries: list[LobbyRoom]) -> None:
+        if self._redis is None or not entries:
+            return
+        try:
+            await self._redis.hset(
+                LOBBY_ROOMS_KEY,
+                mapping={e.room_id: json.dumps(asdict(e)) for e in entries},
+            )
+        except Exception as e:
+            logger.warning(f"[LOBBY] Redis mirror write failed: {e}")
+
+    async def _publish(self, diff: dict[str, Any]) -> None:
+        if self._publisher is None:
+            return
+        try:
+            await self._publisher(diff)
+        except Exception as e:
+            logger.warning(f"[LOBBY] Diff publish failed: {e}")
+
+
+# Global singleton
+lobby_index = LobbyIndex()
@@ -0,0 +1,189 @@
+"""
+QuickJoinIndex - 빠른 입장(Quick Join) 매칭 인메모리 인덱스.
+
+RoomMatcher.find_best_room이 매 요청마다 빈 자리가 있는 방 전체를
+selectinload로 읽어 Python에서 필터/정렬하지 않도록, LobbyIndex의 변경을
+따라가는 파생 인덱스를 유지합니다.
+
+- 버킷: (small_blind, big_blind, buy_in_min) → 블라인드 레벨 + 입장 가능 여부
+- 버킷 내부: 점수 내림차순 정렬 리스트 (room_score, 인원/상태 기준)
+- 입장 가능한 방(WAITING/PLAYING, 빈 자리 있음)만 색인
+
+LobbyIndex가 GameManager 좌석 이벤트(sync_table)와 RoomService 변경을
+반영할 때마다 room_added/room_removed로 함께 갱신되므로 DB를 다시 읽지 않습니다.
+조회는 블라인드 범위를 bisect로 찾은 뒤 버킷마다 맨 앞 키만 봅니다.
+"""
+
+from __future__ import annotations
+
+import bisect
+from typing import TYPE_CHECKING, Iterable, NamedTuple, Optional
+
+from app.game.lobby_index import LobbyIndex, LobbyRoom, lobby_index
+from app.models.room import RoomStatus
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+BucketKey = tuple[int, int, int]  # (small_blind, big_blind, buy_in_min)
+MatchKey = tuple[int, str]  # (-score, room_id)
+
+_JOINABLE = frozenset({RoomStatus.WAITING.value, RoomStatus.PLAYING.value})
+
+
+class BlindFilter(NamedTuple):
+    """블라인드 조건 (small_blind 범위, big_blind는 정확히 일치할 때만)."""
+
+    min_sb: int
+    max_sb: int
+    big_blind: Optional[int] = None
+
+
+def room_score(status: str, player_count: int, max_seats: int) -> int:
+    """방 선택 우선순위 점수 (높을수록 우선).
+
+    - PLAYING +100 / WAITING +50 (진행 중인 게임 우선)
+    - 인원당 +10 (찬 방 우선)
+    - 점유율 × 20
+    """
+    score = 0
+    if status == RoomStatus.PLAYING.value:
+        score += 100
+    elif status == RoomStatus.WAITING.value:
+        score += 50
+
+    score += player_count * 10
+
+    occupied_ratio = player_count / max_seats if max_seats > 0 else 0
+    score += int(occupied_ratio * 20)
+    return score
+
+
+def _joinable(entry: LobbyRoom) -> bool:
+    return entry.status in _JOINABLE and entry.player_count < entry.max_seats
+
+
+class QuickJoinIndex:
+    """블라인드/바이인 버킷별 점수 정렬 인덱스.
+
+    갱신은 버킷 1개에 대한 bisect 삽입/삭제, 조회는 블라인드 범위 bisect +
+    버킷별 맨 앞 키이므로 방 수가 아닌 버킷 수에 비례합니다.
+    """
+
+    def __init__(self, lobby: LobbyIndex):
+        self._lobby = lobby
+        self._buckets: dict[BucketKey, list[MatchKey]] = {}
+        self._bucket_keys: list[BucketKey] = []
+        self._entries: dict[str, tuple[BucketKey, MatchKey, LobbyRoom]] = {}
+        lobby.add_listener(self)
+
+    async def ensure_loaded(self, db: "AsyncSession") -> None:
+        """LobbyIndex 최초 로드 (이후 변경은 리스너로 반영)."""
+        await self._lobby.ensure_loaded(db)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # =========================================================================
+    # LobbyListener
+    # =========================================================================
+
+    def room_added(self, entry: LobbyRoom) -> None:
+        if not _joinable(entry):
+            return
+        bucket_key = (entry.small_blind, entry.big_blind, entry.buy_in_min)
+        match_key = (
+            -room_score(entry.status, entry.player_count, entry.max_seats),
+            entry.room_id,
+        )
+        bucket = self._buckets.get(bucket_key)
+        if bucket is None:
+            bucket = self._buckets[bucket_key] = []
+            bisect.insort(self._bucket_keys, bucket_key)
+        bisect.insort(bucket, match_key)
+        self._entries[entry.room_id] = (bucket_key, match_key, entry)
+
+    def room_removed(self, entry: LobbyRoom) -> None:
+        indexed = self._entries.pop(entry.room_id, None)
+        if indexed is None:
+            return
+        bucket_key, match_key, _ = indexed
+        bucket = self._buckets[bucket_key]
+        i = bisect.bisect_left(bucket, match_key)
+        if i < len(bucket) and bucket[i] == match_key:
+            del bucket[i]
+        if not bucket:
+            del self._buckets[bucket_key]
+            i = bisect.bisect_left(self._bucket_keys, bucket_key)
+            del self._bucket_keys[i]
+
+    def clear(self) -> None:
+        self._buckets.clear()
+        self._bucket_keys.clear()
+        self._entries.clear()
+
+    # =========================================================================
+    # Queries
+    # =========================================================================
+
+    def best(
+        self,
+        balance: int,
+        blinds: Optional[BlindFilter] = None,
+        exclude: Iterable[str] = (),
+    ) -> list[LobbyRoom]:
+        """입장 가능한 최고 점수 방 목록 (동점 전부, 없으면 빈 리스트)."""
+        excluded = set(exclude)
+        best_key: Optional[int] = None
+        top: list[LobbyRoom] = []
+
+        for bucket_key in self._candidate_buckets(balance, blinds):
+            for neg_score, room_id in self._buckets[bucket_key]:
+                if best_key is not None and neg_score > best_key:
+                    break
+                if room_id in excluded:
+                    continue
+                if best_key is None or neg_score < best_key:
+                    best_key = neg_score
+                    top = []
+                top.append(self._entries[room_id][2])
+        return top
+
+    def ranked(
+        self,
+        balance: int,
+        blinds: Optional[BlindFilter] = None,
+        exclude: Iterable[str] = (),
+    ) -> list[LobbyRoom]:
+        """입장 가능한 방 전체 (점수 내림차순)."""
+        excluded = set(exclude)
+        keys = [
+            key
+            for bucket_key in self._candidate_buckets(balance, blinds)
+            for key in self._buckets[bucket_key]
+            if key[1] not in excluded
+        ]
+        keys.sort()
+        return [self._entries[room_id][2] for _, room_id in keys]
+
+    def _candidate_buckets(
+        self,
+        balance: int,
+        blinds: Optional[BlindFilter],
+    ) -> list[BucketKey]:
+        """블라인드 범위 안에서 바이인을 감당할 수 있는 버킷."""
+        if blinds is None:
+            lo, hi = 0, len(self._bucket_keys)
+        else:
+            lo = bisect.bisect_left(self._bucket_keys, (blinds.min_sb,))
+            hi = bisect.bisect_left(self._bucket_keys, (blinds.max_sb + 1,))
+        return [
+            key
+            for key in self._bucket_keys[lo:hi]
+            if key[2] <= balance
+            and (blinds is None or blinds.big_blind is None or key[1] == blinds.big_blind)
+        ]
+
+
+# Global singleton (lobby_index 변경을 따라감)
+quick_join_index = QuickJoinIndex(lobby_index)
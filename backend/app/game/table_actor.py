@@ -0,0 +1,273 @@
+"""Per-table actor - 테이블마다 명령을 순차 처리하는 단일 태스크.
+
+테이블 상태를 바꾸는 모든 명령(플레이어 액션, 턴 타임아웃, 봇 액션, 핸드 시작,
+리바이 등)은 해당 테이블 액터의 mailbox로 들어가 한 번에 하나씩 실행됩니다.
+명령은 I/O 없이 인메모리 상태만 바꾸는 동기 함수이고, 브로드캐스트·DB 저장·
+fraud 이벤트 같은 부수효과는 emit()으로 outbox에 넣어 별도 태스크가 순서대로
+실행합니다.
+
+- 테이블 락 없음: 상태 변경은 액터 태스크 안에서만 일어남
+- 부수효과 I/O 지연이 다음 명령 처리를 막지 않음 (outbox는 테이블별 순서만 보장)
+- 봇 생각 시간·애니메이션 대기·턴 타임아웃은 sleep 대신 schedule()로 명령 예약
+  (같은 key로 다시 예약하거나 cancel()하면 이전 예약은 취소)
+- 액터 밖(워커 풀)에서 계산 중인 결과는 schedule_after()로 delay와 완료를 함께 대기
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Iterable, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+Command = Callable[[], Any]
+Effect = Callable[[], Awaitable[Any]]
+
+
+class TableActor:
+    """테이블 1개의 mailbox + outbox."""
+
+    def __init__(self, room_id: str):
+        self.room_id = room_id
+        self._mailbox: asyncio.Queue[tuple[Command, asyncio.Future | None]] = asyncio.Queue()
+        self._outbox: asyncio.Queue[Effect] = asyncio.Queue()
+        self._timers: dict[str, asyncio.TimerHandle | _FutureWaiter] = {}
+        self._task: asyncio.Task | None = None
+        self._effects_task: asyncio.Task | None = None
+        self._closed = False
+        self.commands_processed = 0
+
+    # =========================================================================
+    # Lifecycle
+    # =========================================================================
+
+    def start(self) -> None:
+        if self._task is not None or self._closed:
+            return
+        self._task = asyncio.create_task(
+            self._run(), name=f"table_actor_{self.room_id}"
+        )
+        self._effects_task = asyncio.create_task(
+            self._run_effects(), name=f"table_effects_{self.room_id}"
+        )
+
+    async def stop(self) -> None:
+        """예약 명령 취소 후 태스크 종료 (대기 중인 call()은 취소됨)."""
+        self._closed = True
+        for handle in self._timers.values():
+            handle.cancel()
+        self._timers.clear()
+
+        for task in (self._task, self._effects_task):
+            if task is None:
+                continue
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+        self._effects_task = None
+
+        while not self._mailbox.empty():
+            _, future = self._mailbox.get_nowait()
+            if future is not None and not future.done():
+                future.cancel()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    # =========================================================================
+    # Commands
+    # =========================================================================
+
+    async def call(self, command: Callable[[], T]) -> T:
+        """명령을 mailbox에 넣고 실행 결과를 기다림 (예외도 그대로 전달)."""
+        future = asyncio.get_running_loop().create_future()
+        self._enqueue(command, future)
+        return await future
+
+    def post(self, command: Command) -> None:
+        """결과를 기다리지 않는 명령."""
+        self._enqueue(command, None)
+
+    def schedule(self, key: str, delay: float, command: Command) -> None:
+        """delay초 뒤 명령을 mailbox에 넣음. 같은 key의 이전 예약은 취소."""
+        self.cancel(key)
+        if self._closed:
+            return
+        loop = asyncio.get_running_loop()
+        self._timers[key] = loop.call_later(
+            max(0.0, delay), self._fire, key, command
+        )
+
+    def schedule_after(
+        self,
+        key: str,
+        delay: float,
+        future: asyncio.Future,
+        command: Command,
+    ) -> None:
+        """delay초가 지나고 future도 완료되면 명령 실행 (둘 중 늦은 시점).
+
+        future 결과는 명령이 직접 확인합니다. 같은 key로 다시 예약하거나
+        cancel()하면 future가 나중에 완료돼도 실행되지 않음.
+        """
+        self.cancel(key)
+        if self._closed:
+            return
+        loop = asyncio.get_running_loop()
+        self._timers[key] = loop.call_later(
+            max(0.0, delay), self._wait_future, key, future, command
+        )
+
+    def cancel(self, key: str) -> bool:
+        handle = self._timers.pop(key, None)
+        if handle is None:
+            return False
+        handle.cancel()
+        return True
+
+    def is_scheduled(self, key: str) -> bool:
+        return key in self._timers
+
+    def emit(self, effect: Effect) -> None:
+        """부수효과 등록 - 명령 실행과 분리되어 outbox 태스크에서 순서대로 실행."""
+        if self._closed:
+            return
+        self._outbox.put_nowait(effect)
+
+    async def drain(self) -> None:
+        """mailbox와 outbox가 모두 빌 때까지 대기 (테스트/종료용)."""
+        while True:
+            await self._mailbox.join()
+            await self._outbox.join()
+            if self._mailbox.empty() and self._outbox.empty():
+                return
+
+    def _enqueue(self, command: Command, future: asyncio.Future | None) -> None:
+        if self._closed:
+            if future is not None:
+                future.set_exception(RuntimeError(f"Table actor {self.room_id} is closed"))
+            return
+        self.start()
+        self._mailbox.put_nowait((command, future))
+
+    def _wait_future(self, key: str, future: asyncio.Future, command: Command) -> None:
+        if future.done():
+            self._fire(key, command)
+            return
+        waiter = _FutureWaiter(self, key, future, command)
+        self._timers[key] = waiter
+        future.add_done_callback(waiter)
+
+    def _fire(self, key: str, command: Command) -> None:
+        self._timers.pop(key, None)
+        self._enqueue(command, None)
+
+    # =========================================================================
+    # Loops
+    # =========================================================================
+
+    async def _run(self) -> None:
+        while True:
+            command, future = await self._mailbox.get()
+            try:
+                result = command()
+            except Exception as e:
+                if future is not None and not future.done():
+                    future.set_exception(e)
+                else:
+                    logger.error(
+                        f"Table actor {self.room_id} command failed: {e}",
+                        exc_info=e,
+                    )
+            else:
+                if future is not None and not future.done():
+                    future.set_result(result)
+            finally:
+                self.commands_processed += 1
+                self._mailbox.task_done()
+
+    async def _run_effects(self) -> None:
+        while True:
+            effect = await self._outbox.get()
+            try:
+                await effect()
+            except Exception as e:
+                logger.error(
+                    f"Table actor {self.room_id} side effect failed: {e}",
+                    exc_info=e,
+                )
+            finally:
+                self._outbox.task_done()
+
+
+class _FutureWaiter:
+    """schedule_after()의 delay 이후 future 완료 대기 (TimerHandle처럼 cancel 가능)."""
+
+    __slots__ = ("_actor", "_key", "_future", "_command")
+
+    def __init__(self, actor: TableActor, key: str, future: asyncio.Future, command: Command):
+        self._actor = actor
+        self._key = key
+        self._future = future
+        self._command = command
+
+    def __call__(self, future: asyncio.Future) -> None:
+        if self._actor._timers.get(self._key) is self:
+            self._actor._fire(self._key, self._command)
+
+    def cancel(self) -> None:
+        self._future.remove_done_callback(self)
+
+
+class TableActorRegistry:
+    """room_id → TableActor (프로세스당 1개)."""
+
+    def __init__(self):
+        self._actors: dict[str, TableActor] = {}
+
+    def get(self, room_id: str) -> TableActor:
+        """테이블 액터 조회 (없으면 생성)."""
+        actor = self._actors.get(room_id)
+        if actor is None or actor.closed:
+            actor = TableActor(room_id)
+            self._actors[room_id] = actor
+        return actor
+
+    def peek(self, room_id: str) -> TableActor | None:
+        return self._actors.get(room_id)
+
+    async def remove(self, room_id: str) -> bool:
+        actor = self._actors.pop(room_id, None)
+        if actor is None:
+            return False
+        await actor.stop()
+        return True
+
+    async def prune(self, active_room_ids: Iterable[str]) -> int:
+        """더 이상 존재하지 않는 테이블의 액터 정리."""
+        active = set(active_room_ids)
+        stale = [room_id for room_id in self._actors if room_id not in active]
+        for room_id in stale:
+            await self.remove(room_id)
+        return len(stale)
+
+    async def close_all(self) -> None:
+        for room_id in list(self._actors):
+            await self.remove(room_id)
+
+    def __contains__(self, room_id: str) -> bool:
+        return room_id in self._actors
+
+    def __len__(self) -> int:
+        return len(self._actors)
+
+
+# Global singleton
+table_actors = TableActorRegistry()
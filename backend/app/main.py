@@ -7,6 +7,7 @@ Phase 11: Sentry error tracking, structlog, orjson
 """
 
 import logging
+import socket
 import uuid
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
@@ -28,9 +29,12 @@ from app.middleware.maintenance import MaintenanceMiddleware
 from app.middleware.security_headers import SecurityHeadersMiddleware
 from app.middleware.sentry import init_sentry
 from app.services.auth import AuthError
+from app.services.bot_decision import shutdown_bot_decision_service
+from app.services.exchange_rate import close_exchange_rate_service
 from app.services.room import RoomError
 from app.services.user import UserError
 from app.utils.db import close_db, engine, init_db, async_session_factory
+from app.utils.http_client import close_http_pool, get_upstream_stats
 from app.utils.redis_client import close_redis, init_redis, get_redis
 from app.utils.json_utils import ORJSONResponse
 from app.utils.secrets_validator import validate_startup_secrets
@@ -39,6 +43,9 @@ from app.logging_config import configure_logging, get_logger
 from app.services.fraud_event_publisher import init_fraud_publisher
 from app.services.player_session_tracker import init_session_tracker
 from app.game.manager import game_manager
+from app.game.lobby_index import lobby_index
+from app.services.rake import rake_config_cache
+from app.services.wallet_journal import WalletJournalWriter
 
 settings = get_settings()
 
@@ -97,6 +104,18 @@ async def lifespan(_app: FastAPI):
         logger.info("Initializing Redis connection...")
         redis_instance = await init_redis()
         logger.info("Redis connection established")
+        lobby_index.attach_redis(redis_instance)
+
+        # Rake config cache (핸드 종료 시 DB 조회 없이 레이크 설정 사용)
+        await rake_config_cache.start(redis_instance, async_session_factory)
+
+        # Wallet hot path: Redis 권위 잔액 → Postgres 저널 기록기
+        if settings.wallet_hot_path:
+            wallet_journal_writer = WalletJournalWriter(
+                redis_instance, async_session_factory
+            )
+            await wallet_journal_writer.start()
+            _app.state.wallet_journal_writer = wallet_journal_writer
 
         # Initialize Fraud Event Publisher (Phase 2.3)
         logger.info("Initializing FraudEventPublisher...")
@@ -123,10 +142,15 @@ async def lifespan(_app: FastAPI):
         # === P0: Tournament Engine Auto-Recovery (Production Critical) ===
         logger.info("Initializing Tournament Engine with auto-recovery...")
         try:
+            from app.tournament.bridge import TournamentHandBridge
             from app.tournament.engine import TournamentEngine
             from app.tournament.models import TournamentStatus
 
             tournament_engine = TournamentEngine(redis_instance)
+            # Shotgun start: 카운트다운 중 PokerKit 첫 핸드 사전 생성
+            TournamentHandBridge(
+                tournament_engine.snapshot, tournament_engine.event_bus
+            ).attach(tournament_engine)
             await tournament_engine.initialize()
 
             # Auto-recover active tournaments from Redis snapshots
@@ -168,6 +192,30 @@ async def lifespan(_app: FastAPI):
             else:
                 logger.info("No active tournaments to recover")
 
+            if settings.tournament_shard_enabled:
+                from app.tournament.sharding import TournamentShardRuntime
+
+                worker_id = settings.tournament_shard_worker_id or socket.gethostname()
+                worker_ids = [
+                    w.strip()
+                    for w in settings.tournament_shard_workers.split(",")
+                    if w.strip()
+                ] or [worker_id]
+                shard_runtime = TournamentShardRuntime(
+                    tournament_engine,
+                    worker_id,
+                    worker_ids,
+                    coordinator=settings.tournament_shard_coordinator,
+                    sync_interval=settings.tournament_shard_sync_interval,
+                )
+                await shard_runtime.start()
+                _app.state.tournament_shard_runtime = shard_runtime
+                logger.info(
+                    f"Tournament sharding enabled: worker={worker_id}, "
+                    f"workers={len(worker_ids)}, "
+                    f"coordinator={settings.tournament_shard_coordinator}"
+                )
+
             # Store in app state for global access
             _app.state.tournament_engine = tournament_engine
             logger.info("Tournament Engine initialized successfully")
@@ -192,6 +240,18 @@ async def lifespan(_app: FastAPI):
         await shutdown_manager()
         logger.info("WebSocket gateway shutdown complete")
 
+        shutdown_bot_decision_service()
+
+        await rake_config_cache.stop()
+
+        shard_runtime = getattr(_app.state, "tournament_shard_runtime", None)
+        if shard_runtime is not None:
+            await shard_runtime.stop()
+
+        wallet_journal_writer = getattr(_app.state, "wallet_journal_writer", None)
+        if wallet_journal_writer is not None:
+            await wallet_journal_writer.stop()
+
         # Close database connection
         logger.info("Closing database connection...")
         await close_db()
@@ -202,6 +262,10 @@ async def lifespan(_app: FastAPI):
         await close_redis()
         logger.info("Redis connection closed")
 
+        # Close outbound HTTP pool
+        await close_exchange_rate_service()
+        await close_http_pool()
+
         logger.info("Application shutdown complete")
     except Exception as e:
         logger.error(f"Shutdown error: {e}")
@@ -522,6 +586,22 @@ async def health_check() -> dict[str, Any]:
     return health_status
 
 
+@app.get(
+    "/health/upstreams",
+    tags=["Health"],
+    summary="Outbound API metrics",
+)
+async def upstream_metrics() -> dict[str, Any]:
+    """Per-upstream request, error and latency counters.
+
+    Covers requests made through the shared HTTP pool since process start.
+
+    Returns:
+        Mapping of host to metrics.
+    """
+    return get_upstream_stats()
+
+
 @app.get(
     "/health/live",
     tags=["Health"],
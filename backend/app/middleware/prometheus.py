@@ -46,6 +46,31 @@ WS_MESSAGES_RECEIVED = Counter(
     ["message_type"],
 )
 
+WS_BROADCAST_BURST = Histogram(
+    "pokerkit_ws_broadcast_burst_seconds",
+    "First-to-last delivery time of a fan-out broadcast",
+    ["message_type"],
+    buckets=[0.01, 0.05, 0.1, 0.25, 0.5, 1, 2, 5],
+)
+
+# Bot decision metrics
+BOT_DECISION_LATENCY = Histogram(
+    "pokerkit_bot_decision_latency_seconds",
+    "Bot decision latency from request to result (queue wait + worker evaluation)",
+    buckets=[0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1],
+)
+
+BOT_DECISION_QUEUE_DEPTH = Gauge(
+    "pokerkit_bot_decision_queue_depth",
+    "Bot decisions waiting for a result (queued + being evaluated)",
+)
+
+BOT_DECISION_BATCH_SIZE = Histogram(
+    "pokerkit_bot_decision_batch_size",
+    "Bot decisions evaluated per worker batch",
+    buckets=[1, 2, 4, 8, 16, 32, 64, 128, 256],
+)
+
 # Game metrics
 ACTIVE_TABLES = Gauge(
     "pokerkit_active_tables",
@@ -217,6 +242,33 @@ def record_ws_message(direction: str, message_type: str) -> None:
         WS_MESSAGES_RECEIVED.labels(message_type=message_type).inc()
 
 
+def record_ws_broadcast_burst(message_type: str, burst_seconds: float) -> None:
+    """Record fan-out broadcast burst latency.
+
+    Args:
+        message_type: Broadcast message type (e.g., "TOURNAMENT_BLIND_CHANGE")
+        burst_seconds: Time between first and last successful delivery
+    """
+    WS_BROADCAST_BURST.labels(message_type=message_type).observe(burst_seconds)
+
+
+def record_bot_decision_batch(batch_size: int, latencies_seconds: list[float]) -> None:
+    """Record a completed bot decision batch.
+
+    Args:
+        batch_size: Number of decisions evaluated in the batch
+        latencies_seconds: Request-to-result latency of each decision
+    """
+    BOT_DECISION_BATCH_SIZE.observe(batch_size)
+    for latency in latencies_seconds:
+        BOT_DECISION_LATENCY.observe(latency)
+
+
+def set_bot_decision_queue_depth(depth: int) -> None:
+    """Set number of bot decisions waiting for a result."""
+    BOT_DECISION_QUEUE_DEPTH.set(depth)
+
+
 def record_hand_completed(table_type: str, duration_seconds: float) -> None:
     """Record completed hand.
 
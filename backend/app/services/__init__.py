@@ -16,6 +16,7 @@ from app.services.exchange_rate import (
 )
 from app.services.rake import RakeConfig, RakeResult, RakeService
 from app.services.room import RoomError, RoomService
+from app.services.settlement import HandSettlementService, LedgerEntry
 from app.services.user import UserError, UserService
 from app.services.vip import (
     RakebackResult,
@@ -44,6 +45,9 @@ __all__ = [
     "WalletService",
     "WalletError",
     "InsufficientBalanceError",
+    # Hand Settlement
+    "HandSettlementService",
+    "LedgerEntry",
     # Crypto Deposit
     "CryptoDepositService",
     "DepositError",
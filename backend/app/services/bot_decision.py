@@ -0,0 +1,429 @@
+"""Bot Decision Service - 봇 의사결정을 이벤트 루프 밖 워커에서 배치 처리.
+
+봇 턴마다 핸드 강도 평가 + 결정 로직을 이벤트 루프에서 바로 실행하면
+봇 좌석이 많을 때 휴먼 액션 처리와 CPU를 다툽니다. 이 서비스는:
+
+- 같은 루프 tick 동안 여러 테이블에서 들어온 결정 요청을 모아 (max_batch 단위)
+- 프로세스 풀(기본) 또는 스레드 풀 워커에서 한 번에 평가하고
+- 결과를 asyncio.Future로 돌려줍니다.
+
+평가는 순수 Python이라 스레드 풀 워커는 GIL을 이벤트 루프와 나눠 씁니다.
+기본값인 프로세스 풀이 루프와 CPU를 실제로 분리합니다.
+
+결정 결과를 언제 적용할지는 호출 측(테이블 액터)이 정합니다.
+봇 생각 시간(think_delay, 사람 같은 지연 분포)과 워커 계산이 동시에 진행되므로
+결과는 "생각 시간과 계산 시간 중 늦은 쪽"에 적용됩니다.
+
+Metrics:
+- pokerkit_bot_decision_latency_seconds: 요청 → 결과 (대기열 + 워커 평가)
+- pokerkit_bot_decision_queue_depth: 결과를 기다리는 요청 수 (대기 + 평가 중)
+- pokerkit_bot_decision_batch_size: 워커 1회 실행당 요청 수
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import random
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, Sequence
+
+from app.game.hand_evaluator import evaluate_hand_for_bot
+from app.middleware.prometheus import (
+    record_bot_decision_batch,
+    set_bot_decision_queue_depth,
+)
+
+logger = logging.getLogger(__name__)
+
+EXECUTOR_THREAD = "thread"
+EXECUTOR_PROCESS = "process"
+
+
+# =============================================================================
+# Decision Logic (pure, picklable)
+# =============================================================================
+
+
+@dataclass(frozen=True, slots=True)
+class BotDecisionRequest:
+    """봇 결정 입력 스냅샷 (워커 프로세스로 pickle 가능)."""
+    actions: tuple[str, ...]
+    call_amount: int
+    stack: int
+    available: dict[str, Any]
+    hole_cards: tuple[str, ...] = ()
+    community_cards: tuple[str, ...] = ()
+    pot: int = 0
+
+
+def decide_bot_action(
+    actions: Sequence[str],
+    call_amount: int,
+    stack: int,
+    available: dict[str, Any],
+    hole_cards: Sequence[str] | None = None,
+    community_cards: Sequence[str] | None = None,
+    pot: int = 0,
+) -> tuple[str, int]:
+    """핸드 강도 기반 봇 결정 로직.
+
+    실제 홀덤 플레이어처럼 행동:
+    - 핸드 강도에 따라 베팅/레이즈/콜/폴드 결정
+    - 팟 오즈 고려
+    - 드로우 가능성 고려
+    - 약간의 무작위성 추가 (예측 불가능하게)
+    """
+    hole_cards = list(hole_cards or [])
+    community_cards = list(community_cards or [])
+
+    # 핸드 강도 평가
+    eval_result = evaluate_hand_for_bot(
+        hole_cards=hole_cards,
+        community_cards=community_cards,
+        pot=pot,
+        to_call=call_amount,
+    )
+
+    strength = eval_result["strength"]
+    has_draw = eval_result["has_draw"]
+    recommendation = eval_result["recommendation"]
+
+    # 결정마다 호출되므로 debug 레벨 (봇 좌석이 많으면 info 로그만으로도 부하)
+    logger.debug(
+        f"[BOT] Hand eval: strength={strength:.2f}, "
+        f"phase={eval_result['phase']}, draw={has_draw}, "
+        f"rec={recommendation}, desc={eval_result['description']}"
+    )
+
+    # 무작위성 추가 (5% 확률로 예상 밖 행동)
+    roll = random.random()
+
+    # ========================================
+    # 강한 핸드 (strength >= 0.70): 공격적
+    # ========================================
+    if strength >= 0.70:
+        # 레이즈/베팅 우선
+        if "raise" in actions and roll < 0.85:
+            min_raise = available.get("min_raise", call_amount * 2)
+            max_raise = available.get("max_raise", stack)
+            # 강도에 따라 레이즈 크기 조절
+            if strength >= 0.90:
+                # 매우 강함: 큰 레이즈 (50-100% pot)
+                raise_amount = min(max_raise, max(min_raise, int(pot * random.uniform(0.5, 1.0))))
+            else:
+                # 강함: 중간 레이즈 (30-60% pot)
+                raise_amount = min(max_raise, max(min_raise, int(pot * random.uniform(0.3, 0.6))))
+            return "raise", raise_amount
+
+        if "bet" in actions:
+            min_raise = available.get("min_raise", 0)
+            max_raise = available.get("max_raise", stack)
+            bet_amount = min(max_raise, max(min_raise, int(pot * random.uniform(0.4, 0.75))))
+            return "bet", bet_amount
+
+        # 레이즈/베팅 불가시 콜
+        if "call" in actions:
+            return "call", call_amount
+
+        if "check" in actions:
+            return "check", 0
+
+    # ========================================
+    # 중간 핸드 (0.45 <= strength < 0.70): 밸런스
+    # ========================================
+    elif strength >= 0.45:
+        # 가끔 베팅/레이즈 (40% 확률)
+        if roll < 0.40:
+            if "bet" in actions:
+                min_raise = available.get("min_raise", 0)
+                max_raise = available.get("max_raise", stack)
+                bet_amount = min(max_raise, max(min_raise, int(pot * random.uniform(0.3, 0.5))))
+                return "bet", bet_amount
+
+            if "raise" in actions and call_amount < stack * 0.15:
+                min_raise = available.get("min_raise", call_amount * 2)
+                return "raise", min_raise
+
+        # 체크 가능하면 체크
+        if "check" in actions:
+            return "check", 0
+
+        # 콜 금액이 적당하면 콜 (스택의 20% 이하)
+        if "call" in actions:
+            if call_amount <= stack * 0.20:
+                return "call", call_amount
+            # 드로우가 있으면 좀 더 콜
+            if has_draw and call_amount <= stack * 0.30:
+                return "call", call_amount
+            # 아니면 폴드
+            return "fold", 0
+
+    # ========================================
+    # 약한 핸드 + 드로우 (0.30 <= strength < 0.45)
+    # ========================================
+    elif strength >= 0.30 and has_draw:
+        if "check" in actions:
+            return "check", 0
+
+        # 팟 오즈가 좋으면 콜 (콜 금액이 팟의 25% 이하)
+        if "call" in actions:
+            pot_odds_ok = call_amount <= pot * 0.25
+            stack_ok = call_amount <= stack * 0.15
+            if pot_odds_ok and stack_ok:
+                return "call", call_amount
+
+        return "fold", 0
+
+    # ========================================
+    # 약한 핸드 (strength < 0.30): 수비적
+    # ========================================
+    else:
+        if "check" in actions:
+            # 가끔 블러프 (10% 확률, 프리플롭 제외)
+            if roll < 0.10 and community_cards and "bet" in actions:
+                min_raise = available.get("min_raise", 0)
+                return "bet", min_raise
+            return "check", 0
+
+        # 매우 적은 금액만 콜 (스택의 5% 이하)
+        if "call" in actions and call_amount <= stack * 0.05:
+            # 그래도 30% 확률로만 콜
+            if roll < 0.30:
+                return "call", call_amount
+
+        return "fold", 0
+
+    return fallback_bot_action(actions, call_amount)
+
+
+def fallback_bot_action(actions: Sequence[str], call_amount: int) -> tuple[str, int]:
+    """평가 없이 안전한 기본 액션 (체크 > 폴드 > 첫 번째 가능 액션)."""
+    if "check" in actions:
+        return "check", 0
+    if "fold" in actions:
+        return "fold", 0
+    if actions:
+        return actions[0], call_amount if actions[0] == "call" else 0
+
+    return "fold", 0
+
+
+def decide_batch(requests: Sequence[BotDecisionRequest]) -> list[tuple[str, int]]:
+    """워커에서 실행되는 배치 평가 - 요청 하나가 실패해도 나머지는 계속."""
+    results = []
+    for request in requests:
+        try:
+            results.append(decide_bot_action(
+                actions=request.actions,
+                call_amount=request.call_amount,
+                stack=request.stack,
+                available=request.available,
+                hole_cards=request.hole_cards,
+                community_cards=request.community_cards,
+                pot=request.pot,
+            ))
+        except Exception as e:
+            logger.error(f"[BOT] Decision failed, using fallback: {e}")
+            results.append(fallback_bot_action(request.actions, request.call_amount))
+    return results
+
+
+def _seed_worker() -> None:
+    # fork된 프로세스들이 같은 난수열을 쓰지 않도록
+    random.seed()
+
+
+# =============================================================================
+# Humanlike Delay
+# =============================================================================
+
+
+@dataclass(frozen=True, slots=True)
+class ThinkTimeDistribution:
+    """봇 생각 시간 분포 (삼각분포 + 일정 확률로 긴 고민 추가)."""
+    minimum: float = 0.8
+    maximum: float = 2.5
+    mode: float = 1.2
+    extra_probability: float = 0.2
+    extra_min: float = 1.0
+    extra_max: float = 2.0
+
+    def sample(self) -> float:
+        delay = random.triangular(self.minimum, self.maximum, self.mode)
+        if random.random() < self.extra_probability:
+            delay += random.uniform(self.extra_min, self.extra_max)
+        return delay
+
+
+# =============================================================================
+# Service
+# =============================================================================
+
+
+@dataclass(slots=True)
+class _PendingDecision:
+    request: BotDecisionRequest
+    future: asyncio.Future
+    submitted_at: float = field(default_factory=time.perf_counter)
+
+
+class BotDecisionService:
+    """봇 결정 요청을 모아 워커 풀에서 배치 평가."""
+
+    def __init__(
+        self,
+        *,
+        executor: str = EXECUTOR_PROCESS,
+        max_workers: int = 1,
+        max_batch: int = 128,
+        think_time: ThinkTimeDistribution | None = None,
+    ):
+        if executor not in (EXECUTOR_THREAD, EXECUTOR_PROCESS):
+            raise ValueError(f"Unknown bot decision executor: {executor}")
+        self.executor_kind = executor
+        self.max_workers = max(1, max_workers)
+        self.max_batch = max(1, max_batch)
+        self.think_time = think_time or ThinkTimeDistribution()
+
+        self._executor: Executor | None = None
+        self._pending: list[_PendingDecision] = []
+        self._flush_scheduled = False
+        self._in_flight = 0
+
+        # 통계 (테스트/디버그용)
+        self.decisions = 0
+        self.batches = 0
+
+    @property
+    def queue_depth(self) -> int:
+        """결과를 기다리는 요청 수 (대기 중 + 워커 평가 중)."""
+        return len(self._pending) + self._in_flight
+
+    def think_delay(self) -> float:
+        """사람 같은 생각 시간 샘플 (초)."""
+        return self.think_time.sample()
+
+    def submit(self, request: BotDecisionRequest) -> asyncio.Future[tuple[str, int]]:
+        """결정 요청 등록 - 이번 루프 tick이 끝나면 모인 요청과 함께 워커로 전달."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append(_PendingDecision(request, future))
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            loop.call_soon(self._flush)
+        set_bot_decision_queue_depth(self.queue_depth)
+        return future
+
+    def _flush(self) -> None:
+        self._flush_scheduled = False
+        pending, self._pending = self._pending, []
+        # 대기 중 취소된 요청은 평가하지 않음
+        pending = [p for p in pending if not p.future.done()]
+        if not pending:
+            set_bot_decision_queue_depth(self.queue_depth)
+            return
+
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        for start in range(0, len(pending), self.max_batch):
+            batch = pending[start:start + self.max_batch]
+            self._in_flight += len(batch)
+            worker = loop.run_in_executor(
+                executor, decide_batch, [p.request for p in batch]
+            )
+            worker.add_done_callback(partial(self._complete, batch))
+        set_bot_decision_queue_depth(self.queue_depth)
+
+    def _complete(self, batch: list[_PendingDecision], worker: asyncio.Future) -> None:
+        self._in_flight -= len(batch)
+        self.batches += 1
+        completed_at = time.perf_counter()
+
+        if worker.cancelled() or worker.exception() is not None:
+            error = worker.exception() if not worker.cancelled() else None
+            logger.error(f"[BOT] Decision batch failed: {error}")
+            results = [
+                fallback_bot_action(p.request.actions, p.request.call_amount)
+                for p in batch
+            ]
+        else:
+            results = worker.result()
+
+        for pending, result in zip(batch, results):
+            if not pending.future.done():
+                pending.future.set_result(result)
+        self.decisions += len(batch)
+
+        record_bot_decision_batch(
+            len(batch),
+            [completed_at - p.submitted_at for p in batch],
+        )
+        set_bot_decision_queue_depth(self.queue_depth)
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.executor_kind == EXECUTOR_PROCESS:
+                # 이벤트 루프/Redis 스레드가 있는 프로세스를 fork하지 않도록 spawn
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_seed_worker,
+                )
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="bot-decision"
+                )
+        return self._executor
+
+    def shutdown(self) -> None:
+        """대기 중 요청 취소 + 워커 풀 종료 (다음 submit 시 다시 생성)."""
+        for pending in self._pending:
+            pending.future.cancel()
+        self._pending.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        set_bot_decision_queue_depth(self.queue_depth)
+
+
+# =============================================================================
+# Global Instance
+# =============================================================================
+
+_bot_decision_service: BotDecisionService | None = None
+
+
+def get_bot_decision_service() -> BotDecisionService:
+    """Get the global BotDecisionService (설정값으로 최초 1회 생성)."""
+    global _bot_decision_service
+    if _bot_decision_service is None:
+        from app.config import get_settings
+
+        settings = get_settings()
+        _bot_decision_service = BotDecisionService(
+            executor=settings.bot_decision_executor,
+            max_workers=settings.bot_decision_workers,
+            max_batch=settings.bot_decision_max_batch,
+            think_time=ThinkTimeDistribution(
+                minimum=settings.bot_think_time_min,
+                maximum=settings.bot_think_time_max,
+                mode=settings.bot_think_time_mode,
+                extra_probability=settings.bot_think_extra_probability,
+                extra_min=settings.bot_think_extra_min,
+                extra_max=settings.bot_think_extra_max,
+            ),
+        )
+    return _bot_decision_service
+
+
+def shutdown_bot_decision_service() -> None:
+    """Shutdown the global BotDecisionService (앱 종료 시)."""
+    global _bot_decision_service
+    if _bot_decision_service is not None:
+        _bot_decision_service.shutdown()
+        _bot_decision_service = None
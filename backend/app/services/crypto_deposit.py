@@ -11,9 +11,9 @@ Features:
 
 import hashlib
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any
-from uuid import uuid4
+from uuid import NAMESPACE_URL, uuid4, uuid5
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -30,6 +30,7 @@ from app.services.exchange_rate import (
     ExchangeRateService,
     get_exchange_rate_service,
 )
+from app.services.wallet import WalletService
 from app.utils.redis_client import get_redis
 
 logger = logging.getLogger(__name__)
@@ -48,8 +49,16 @@ class CryptoDepositService:
     - Deposit address generation/lookup
     - Deposit webhook processing
     - KRW conversion and balance credit
+
+    Hot-path 모드 (settings.wallet_hot_path):
+    - 입금 지급은 WalletService.journal_transfer (krw_transfer.lua)로 Redis
+      권위 잔액에 반영, 거래 행은 저널 기록기가 저장
+    - 거래 행이 비동기로 기록되므로 중복 웹훅은 tx_hash별 Redis 마커(SET NX)로 차단
     """
 
+    DEPOSIT_MARKER_PREFIX = "wallet:deposit:"
+    DEPOSIT_MARKER_TTL = 7 * 24 * 3600  # 7 days
+
     # Minimum confirmations required for each crypto
     # 빠른 송금 코인들은 확인 수가 적음
     MIN_CONFIRMATIONS = {
@@ -72,6 +81,7 @@ class CryptoDepositService:
         self.session = session
         self._redis = get_redis()
         self._exchange = get_exchange_rate_service()
+        self._wallet = WalletService(session)
 
     async def get_deposit_address(
         self,
@@ -193,6 +203,12 @@ class CryptoDepositService:
             crypto_type, amount
         )
 
+        if self._wallet.hot_path:
+            return await self._credit_deposit_hot(
+                crypto_addr, crypto_type, tx_hash, address, amount,
+                krw_amount, exchange_rate,
+            )
+
         # Update user balance
         balance_before = user.krw_balance
         user.krw_balance += krw_amount
@@ -244,6 +260,64 @@ class CryptoDepositService:
 
         return tx
 
+    async def _credit_deposit_hot(
+        self,
+        crypto_addr: CryptoAddress,
+        crypto_type: CryptoType,
+        tx_hash: str,
+        address: str,
+        amount: str,
+        krw_amount: int,
+        exchange_rate: int,
+    ) -> WalletTransaction | None:
+        """Hot-path 입금 지급: tx_hash 마커 선점 후 Redis 권위 잔액에 지급."""
+        user_id = crypto_addr.user_id
+        marker_key = f"{self.DEPOSIT_MARKER_PREFIX}{crypto_type.value}:{tx_hash}"
+        claimed = await self._redis.set(
+            marker_key, user_id, nx=True, ex=self.DEPOSIT_MARKER_TTL
+        )
+        if not claimed:
+            # 저널 기록기가 아직 거래 행을 저장하지 않았으면 None
+            logger.warning(f"Duplicate deposit webhook: {tx_hash}")
+            return await self._check_processed(tx_hash)
+
+        tx = WalletTransaction(
+            # tx_hash 기반 id → 저널 재처리 시에도 거래 행은 하나
+            id=str(uuid5(NAMESPACE_URL, f"crypto_deposit:{crypto_type.value}:{tx_hash}")),
+            user_id=user_id,
+            tx_type=TransactionType.CRYPTO_DEPOSIT,
+            status=TransactionStatus.COMPLETED,
+            krw_amount=krw_amount,
+            crypto_type=crypto_type,
+            crypto_amount=amount,
+            crypto_tx_hash=tx_hash,
+            crypto_address=address,
+            exchange_rate_krw=exchange_rate,
+            description=(
+                f"Crypto deposit: {amount} {crypto_type.value.upper()} "
+                f"@ {exchange_rate:,} KRW"
+            ),
+            created_at=datetime.now(timezone.utc),
+        )
+        try:
+            await self._wallet.journal_transfer(tx)
+        except Exception:
+            # 지급 실패 → 마커 해제 (웹훅 재전송 시 다시 처리)
+            await self._redis.delete(marker_key)
+            raise
+
+        crypto_addr.total_deposits += 1
+        crypto_addr.last_deposit_at = datetime.utcnow()
+        await self.session.flush()
+
+        logger.info(
+            f"Deposit processed: user={user_id[:8]}... "
+            f"crypto={amount} {crypto_type.value.upper()} "
+            f"krw={krw_amount:,} rate={exchange_rate:,} hot_path"
+        )
+
+        return tx
+
     async def _check_processed(self, tx_hash: str) -> WalletTransaction | None:
         """Check if transaction was already processed."""
         query = select(WalletTransaction).where(
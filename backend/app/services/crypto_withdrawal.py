@@ -11,7 +11,7 @@ Features:
 
 import hashlib
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from uuid import uuid4
 
 from sqlalchemy import select
@@ -24,6 +24,7 @@ from app.models.wallet import (
     TransactionType,
     WalletTransaction,
 )
+from app.services import wallet
 from app.services.exchange_rate import get_exchange_rate_service
 from app.utils.redis_client import get_redis
 from app.utils.crypto_validator import CryptoAddressValidator, ValidationResult
@@ -63,6 +64,11 @@ class CryptoWithdrawalService:
     - Minimum/maximum withdrawal limits
     - Automatic crypto conversion
     - Cancellation support
+
+    Hot-path 모드 (settings.wallet_hot_path):
+    - 출금 보류/취소 환급은 WalletService.journal_transfer (krw_transfer.lua)
+      로 Redis 권위 잔액에 반영 (Postgres krw_balance는 저널 기록기가 갱신)
+    - 출금 거래 행도 저널 기록기가 저장
     """
 
     PENDING_HOURS = 24  # Withdrawal pending period
@@ -79,6 +85,7 @@ class CryptoWithdrawalService:
         self._redis = get_redis()
         self._exchange = get_exchange_rate_service()
         self._address_validator = CryptoAddressValidator()
+        self._wallet = wallet.WalletService(session)
 
     async def request_withdrawal(
         self,
@@ -122,12 +129,14 @@ class CryptoWithdrawalService:
         if not user:
             raise WithdrawalError(f"User not found: {user_id}")
 
-        available = user.krw_balance - user.pending_withdrawal_krw
-        if available < krw_amount:
-            raise InsufficientBalanceError(
-                f"Insufficient balance: available ₩{available:,}, "
-                f"requested ₩{krw_amount:,}"
-            )
+        # Hot-path: 잔액 확인은 차감과 함께 Lua에서 원자적으로
+        if not self._wallet.hot_path:
+            available = user.krw_balance - user.pending_withdrawal_krw
+            if available < krw_amount:
+                raise InsufficientBalanceError(
+                    f"Insufficient balance: available ₩{available:,}, "
+                    f"requested ₩{krw_amount:,}"
+                )
 
         # Check daily limit
         daily_total = await self._get_daily_withdrawal_total(user_id)
@@ -142,6 +151,12 @@ class CryptoWithdrawalService:
             crypto_type, krw_amount
         )
 
+        if self._wallet.hot_path:
+            return await self._hold_withdrawal_hot(
+                user, krw_amount, crypto_type, crypto_address,
+                crypto_amount, exchange_rate,
+            )
+
         # Lock the amount (move to pending)
         balance_before = user.krw_balance
         user.krw_balance -= krw_amount
@@ -219,17 +234,27 @@ class CryptoWithdrawalService:
         # Restore the balance
         user = await self.session.get(User, user_id)
         amount = abs(tx.krw_amount)
-        user.krw_balance += amount
         user.pending_withdrawal_krw -= amount
 
         # Update transaction status
         tx.status = TransactionStatus.CANCELLED
         tx.description = f"{tx.description} [CANCELLED by user]"
 
-        await self.session.flush()
+        if self._wallet.hot_path:
+            await self.session.flush()
+            # 권위 잔액(Redis)에 환급 - 환급 거래는 저널 기록기가 저장
+            await self._wallet.transfer_krw(
+                user_id,
+                amount,
+                TransactionType.CRYPTO_WITHDRAWAL,
+                description=f"Withdrawal cancelled: refund for {transaction_id}",
+            )
+        else:
+            user.krw_balance += amount
+            await self.session.flush()
 
-        # Invalidate balance cache
-        await self._redis.delete(f"wallet:balance:{user_id}")
+            # Invalidate balance cache
+            await self._redis.delete(f"wallet:balance:{user_id}")
 
         logger.info(
             f"Withdrawal cancelled: user={user_id[:8]}... "
@@ -238,6 +263,56 @@ class CryptoWithdrawalService:
 
         return tx
 
+    async def _hold_withdrawal_hot(
+        self,
+        user: User,
+        krw_amount: int,
+        crypto_type: CryptoType,
+        crypto_address: str,
+        crypto_amount,
+        exchange_rate: int,
+    ) -> WalletTransaction:
+        """Hot-path 출금 보류: Redis 권위 잔액 차감 + 저널 기록 (krw_transfer.lua).
+
+        pending_withdrawal_krw는 먼저 flush하므로 Lua 차감이 실패하면 호출자의
+        롤백으로 함께 취소됩니다.
+        """
+        user.pending_withdrawal_krw += krw_amount
+        await self.session.flush()
+
+        tx = WalletTransaction(
+            id=str(uuid4()),
+            user_id=user.id,
+            tx_type=TransactionType.CRYPTO_WITHDRAWAL,
+            status=TransactionStatus.PENDING,
+            krw_amount=-krw_amount,
+            crypto_type=crypto_type,
+            crypto_amount=str(crypto_amount),
+            crypto_address=crypto_address,
+            exchange_rate_krw=exchange_rate,
+            withdrawal_requested_at=datetime.utcnow(),
+            description=(
+                f"Withdrawal request: ₩{krw_amount:,} → "
+                f"{crypto_amount:.8f} {crypto_type.value.upper()}"
+            ),
+            created_at=datetime.now(timezone.utc),
+        )
+        try:
+            await self._wallet.journal_transfer(tx)
+        except wallet.InsufficientBalanceError as e:
+            raise InsufficientBalanceError(
+                f"Insufficient balance: available ₩{e.current:,}, "
+                f"requested ₩{krw_amount:,}"
+            ) from e
+
+        logger.info(
+            f"Withdrawal requested: user={user.id[:8]}... "
+            f"krw={krw_amount:,} crypto={crypto_amount:.8f} {crypto_type.value} "
+            f"hot_path"
+        )
+
+        return tx
+
     async def process_pending_withdrawals(self) -> list[WalletTransaction]:
         """Process pending withdrawals past the security period.
 
@@ -303,6 +378,7 @@ class CryptoWithdrawalService:
         query = select(WalletTransaction).where(
             WalletTransaction.user_id == user_id,
             WalletTransaction.tx_type == TransactionType.CRYPTO_WITHDRAWAL,
+            WalletTransaction.krw_amount < 0,  # 취소 환급 거래 제외
             WalletTransaction.status.in_(
                 [
                     TransactionStatus.PENDING,
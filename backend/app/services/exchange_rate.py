@@ -4,6 +4,8 @@ Phase 5.5: Real-time exchange rate API integration.
 - Primary: jsdelivr CDN (fawazahmed0/currency-api)
 - Fallback: Cloudflare Pages
 - Redis caching with 60-second TTL
+- In-process stale-while-revalidate cache: concurrent callers share one
+  fetch, and an expired rate is served while it refreshes in background
 
 지원 코인:
 - USDT: USD/KRW 환율 사용 (1:1 페깅)
@@ -17,6 +19,7 @@ from decimal import Decimal
 import httpx
 
 from app.models.wallet import CryptoType
+from app.utils.http_client import create_client, rate_cache
 from app.utils.redis_client import get_redis
 
 logger = logging.getLogger(__name__)
@@ -25,6 +28,9 @@ logger = logging.getLogger(__name__)
 PRIMARY_API_URL = "https://cdn.jsdelivr.net/npm/@fawazahmed0/currency-api@latest/v1/currencies/usd.min.json"
 FALLBACK_API_URL = "https://latest.currency-api.pages.dev/v1/currencies/usd.min.json"
 
+# Serve the previous rate for this long while a background refresh runs
+RATE_STALE_SECONDS = 600
+
 
 class ExchangeRateError(Exception):
     """Exchange rate fetch error."""
@@ -38,6 +44,8 @@ class ExchangeRateService:
     Features:
     - Real-time rate fetching from fawazahmed0/currency-api
     - Redis caching with 60-second TTL
+    - Shared in-process rate cache (single fetch per expiry, stale rate
+      served during background refresh)
     - Fallback to cached rate on API failure
     - Support for USDT only (uses USD/KRW rate with 1:1 peg assumption)
     """
@@ -47,10 +55,7 @@ class ExchangeRateService:
 
     def __init__(self) -> None:
         """Initialize exchange rate service."""
-        self._client = httpx.AsyncClient(
-            timeout=httpx.Timeout(10.0, connect=5.0),
-            limits=httpx.Limits(max_connections=20),
-        )
+        self._client = create_client(timeout=httpx.Timeout(10.0, connect=5.0))
 
     async def close(self) -> None:
         """Close HTTP client."""
@@ -75,7 +80,15 @@ class ExchangeRateService:
             )
 
         cache_key = f"{self.CACHE_KEY_PREFIX}{crypto_type.value}"
+        return await rate_cache.get(
+            cache_key,
+            lambda: self._load_rate(crypto_type, cache_key),
+            ttl=self.CACHE_TTL,
+            stale_ttl=RATE_STALE_SECONDS,
+        )
 
+    async def _load_rate(self, crypto_type: CryptoType, cache_key: str) -> int:
+        """Load rate from Redis or the rate APIs."""
         # Try cache first
         redis = get_redis()
         cached_rate = await redis.get(cache_key)
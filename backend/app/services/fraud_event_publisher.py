@@ -1,8 +1,10 @@
 """Fraud Event Publisher - 부정 행위 탐지용 이벤트 발행 서비스.
 
-게임 서버에서 발생하는 이벤트를 Redis Pub/Sub을 통해 admin-backend로 전달합니다.
+게임 서버에서 발생하는 이벤트를 Redis Streams를 통해 admin-backend로 전달합니다.
+Pub/Sub과 달리 admin-backend가 재시작되어도 이벤트가 스트림에 남아
+컨슈머 그룹이 이어서 처리합니다.
 
-Channels:
+Streams (엔트리 필드 "data"에 JSON 이벤트):
 - fraud:hand_completed - 핸드 완료 이벤트
 - fraud:player_action - 플레이어 액션 이벤트
 - fraud:player_stats - 플레이어 세션 통계 이벤트
@@ -22,11 +24,15 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
-# Redis Pub/Sub 채널 이름
+# Redis Stream 키 (채널 유형별 스트림)
 CHANNEL_HAND_COMPLETED = "fraud:hand_completed"
 CHANNEL_PLAYER_ACTION = "fraud:player_action"
 CHANNEL_PLAYER_STATS = "fraud:player_stats"
 
+# 스트림 최대 길이 (근사 트리밍). 컨슈머 장애 시 보존 가능한 이벤트 수
+STREAM_MAX_LEN = 100_000
+STREAM_DATA_FIELD = "data"
+
 
 class HandParticipant(BaseModel):
     """핸드 참가자 정보."""
@@ -80,7 +86,7 @@ class PlayerStatsEvent(BaseModel):
 class FraudEventPublisher:
     """부정 행위 탐지용 이벤트 발행 서비스.
     
-    게임 서버에서 발생하는 이벤트를 Redis Pub/Sub을 통해 admin-backend로 전달합니다.
+    게임 서버에서 발생하는 이벤트를 Redis Streams(XADD)를 통해 admin-backend로 전달합니다.
     모든 발행은 비동기로 처리되어 게임 응답 시간에 영향을 주지 않습니다.
     """
 
@@ -98,6 +104,15 @@ class FraudEventPublisher:
         """이벤트 발행 활성화 여부."""
         return self._enabled
 
+    async def _append(self, stream: str, payload: str) -> None:
+        """스트림에 이벤트 추가."""
+        await self.redis.xadd(
+            stream,
+            {STREAM_DATA_FIELD: payload},
+            maxlen=STREAM_MAX_LEN,
+            approximate=True,
+        )
+
     async def publish_hand_completed(
         self,
         hand_id: str,
@@ -147,10 +162,7 @@ class FraudEventPublisher:
                 participants=participant_models,
             )
 
-            await self.redis.publish(
-                CHANNEL_HAND_COMPLETED,
-                event.model_dump_json(),
-            )
+            await self._append(CHANNEL_HAND_COMPLETED, event.model_dump_json())
 
             logger.info(
                 f"Published hand_completed event: hand_id={hand_id}, "
@@ -201,10 +213,7 @@ class FraudEventPublisher:
                 turn_start_time=turn_start_time,
             )
 
-            await self.redis.publish(
-                CHANNEL_PLAYER_ACTION,
-                event.model_dump_json(),
-            )
+            await self._append(CHANNEL_PLAYER_ACTION, event.model_dump_json())
 
             logger.debug(
                 f"Published player_action event: user_id={user_id}, "
@@ -258,10 +267,7 @@ class FraudEventPublisher:
                 leave_time=leave_time,
             )
 
-            await self.redis.publish(
-                CHANNEL_PLAYER_STATS,
-                event.model_dump_json(),
-            )
+            await self._append(CHANNEL_PLAYER_STATS, event.model_dump_json())
 
             logger.info(
                 f"Published player_stats event: user_id={user_id}, "
@@ -26,6 +26,7 @@ from app.engine.state import (
     TableState,
 )
 from app.models.table import Table, TableStatus
+from app.ws.channels import table_channel
 from app.ws.events import EventType
 from app.ws.messages import MessageEnvelope
 
@@ -284,7 +285,7 @@ class GameService:
         countdown_seconds: int,
     ) -> None:
         """Broadcast GAME_STARTING event with countdown."""
-        channel = f"table:{table.room_id}"
+        channel = table_channel(table.room_id)
 
         message = MessageEnvelope.create(
             event_type=EventType.GAME_STARTING,
@@ -406,7 +407,7 @@ class GameService:
             return
 
         # Use room_id for channel since clients subscribe with room_id
-        channel = f"table:{table.room_id}"
+        channel = table_channel(table.room_id)
         logger.info(f"Broadcasting HAND_START to channel: {channel}")
 
         # Get all connections in this channel
@@ -533,7 +534,7 @@ class GameService:
 
         # Broadcast to all subscribers (everyone needs to know whose turn it is)
         # Use room_id for channel since clients subscribe with room_id
-        channel = f"table:{table.room_id}"
+        channel = table_channel(table.room_id)
         await manager.broadcast_to_channel(channel, message.to_dict())
 
         # Check if current player is a bot
@@ -745,7 +746,7 @@ class GameService:
             },
         )
 
-        channel = f"table:{table.room_id}"
+        channel = table_channel(table.room_id)
         await manager.broadcast_to_channel(channel, message.to_dict())
 
     async def _broadcast_showdown(
@@ -785,7 +786,7 @@ class GameService:
             },
         )
 
-        channel = f"table:{table.room_id}"
+        channel = table_channel(table.room_id)
         await manager.broadcast_to_channel(channel, message.to_dict())
 
     async def _broadcast_hand_result(
@@ -818,5 +819,5 @@ class GameService:
             },
         )
 
-        channel = f"table:{table.room_id}"
+        channel = table_channel(table.room_id)
         await manager.broadcast_to_channel(channel, message.to_dict())
@@ -11,19 +11,23 @@ Features:
 - Admin API for managing rake configs (P1-1)
 """
 
+import asyncio
 import logging
 from dataclasses import dataclass
 from decimal import Decimal
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Callable
 
-from sqlalchemy import select
+from sqlalchemy import event, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
 from app.models.rake import RakeConfig
 from app.models.wallet import TransactionType
-from app.services.wallet import WalletService
+from app.services.settlement import HandSettlementService, LedgerEntry
 
 if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
     from app.engine.state import GamePhase, HandResult
 
 logger = logging.getLogger(__name__)
@@ -98,7 +102,7 @@ class RakeService:
             session: Database session for wallet operations
         """
         self.session = session
-        self._wallet_service = WalletService(session)
+        self._settlement = HandSettlementService(session)
     
     def get_rake_config(
         self,
@@ -169,6 +173,22 @@ class RakeService:
         # DB에 없으면 하드코딩 기본값 사용
         return self.get_rake_config(small_blind, big_blind)
     
+    async def get_rake_config_cached(
+        self,
+        small_blind: int,
+        big_blind: int,
+    ) -> RakeConfigData:
+        """캐시된 DB 레이크 설정 조회, 없으면 하드코딩 기본값 사용.
+
+        캐시가 로드된 뒤에는 I/O 없이 dict 조회만 수행합니다.
+        설정 변경은 RakeConfigService 커밋 시 버전 bump로 반영됩니다.
+        """
+        await rake_config_cache.ensure_loaded(self.session)
+        config = rake_config_cache.get(small_blind, big_blind)
+        if config:
+            return config
+        return self.get_rake_config(small_blind, big_blind)
+
     def calculate_rake(
         self,
         pot_total: int,
@@ -312,39 +332,46 @@ class RakeService:
         if rake_result.total_rake <= 0:
             return []
         
-        transactions = []
-        
+        entries = []
+        positions = []
         for position, rake_amount in rake_result.rake_per_winner.items():
+            # settle_hand는 0원 항목의 행을 만들지 않음 → 행과 좌석 순서를 맞추기 위해 제외
+            if rake_amount == 0:
+                continue
             user_id = position_to_user_id.get(position)
             if not user_id:
                 logger.warning(
                     f"No user_id for position {position}, skipping rake"
                 )
                 continue
-            
-            try:
-                tx = await self._wallet_service.deduct_rake(
-                    user_id=user_id,
-                    amount=rake_amount,
-                    table_id=table_id,
-                    hand_id=hand_id,
-                )
-                if tx:
-                    transactions.append({
-                        "user_id": user_id,
-                        "position": position,
-                        "amount": rake_amount,
-                        "transaction_id": tx.id,
-                    })
-                    logger.info(
-                        f"Rake collected: user={user_id[:8]}... "
-                        f"amount={rake_amount:,} KRW"
-                    )
-            except Exception as e:
-                logger.error(
-                    f"Failed to collect rake from user {user_id}: {e}"
-                )
+            entries.append(LedgerEntry(
+                user_id=user_id,
+                amount=-rake_amount,
+                tx_type=TransactionType.RAKE,
+            ))
+            positions.append(position)
+        
+        # 핸드 전체 레이크를 하나의 배치로 정산 (사용자별 transfer 대신)
+        try:
+            rows = await self._settlement.settle_hand(table_id, hand_id, entries)
+        except Exception as e:
+            logger.error(f"Failed to collect rake for hand {hand_id}: {e}")
+            return []
         
+        transactions = [
+            {
+                "user_id": row["user_id"],
+                "position": position,
+                "amount": -row["krw_amount"],
+                "transaction_id": row["id"],
+            }
+            for position, row in zip(positions, rows, strict=True)
+        ]
+        if transactions:
+            logger.info(
+                f"Rake collected: hand={hand_id} users={len(transactions)} "
+                f"total={sum(t['amount'] for t in transactions):,} KRW"
+            )
         return transactions
     
     async def process_hand_rake(
@@ -376,8 +403,8 @@ class RakeService:
         Returns:
             RakeResult with collection details
         """
-        # DB에서 레이크 설정 조회 (없으면 하드코딩 기본값)
-        config = await self.get_rake_config_from_db(small_blind, big_blind)
+        # 캐시된 DB 설정 조회 (없으면 하드코딩 기본값)
+        config = await self.get_rake_config_cached(small_blind, big_blind)
 
         # Calculate rake
         rake_result = self.calculate_rake(
@@ -415,6 +442,20 @@ class RakeConfigService:
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
 
+    def _mark_changed(self) -> None:
+        """커밋 후 레이크 설정 캐시 버전 bump 예약.
+
+        커밋 전에 알리면 다른 인스턴스가 이전 값을 다시 읽을 수 있으므로
+        after_commit 훅에서 발행합니다 (롤백 시 다음 커밋까지 보류).
+        """
+        sync_session = getattr(self.session, "sync_session", None)
+        if not isinstance(sync_session, Session):
+            return
+        if sync_session.info.get(_CONFIG_CHANGED):
+            return
+        sync_session.info[_CONFIG_CHANGED] = True
+        event.listen(sync_session, "after_commit", _on_config_commit, once=True)
+
     async def list_configs(
         self,
         include_inactive: bool = False,
@@ -467,6 +508,7 @@ class RakeConfigService:
         )
         self.session.add(config)
         await self.session.flush()
+        self._mark_changed()
         return config
 
     async def update_config(
@@ -489,6 +531,7 @@ class RakeConfigService:
             config.is_active = is_active
 
         await self.session.flush()
+        self._mark_changed()
         return config
 
     async def delete_config(self, config_id: str) -> bool:
@@ -499,4 +542,193 @@ class RakeConfigService:
 
         await self.session.delete(config)
         await self.session.flush()
+        self._mark_changed()
         return True
+
+
+# ============================================================================
+# Rake Config Cache
+# ============================================================================
+
+RAKE_CONFIG_VERSION_KEY = "rake:config:version"
+RAKE_CONFIG_CHANNEL = "rake:config:changed"
+
+
+class RakeConfigCache:
+    """블라인드 레벨별 레이크 설정 인프로세스 캐시.
+
+    핸드 종료마다 실행되는 process_hand_rake가 DB를 조회하지 않도록
+    활성 설정 전체(수십 행)를 메모리에 유지합니다.
+
+    - 조회: dict 조회만 수행 (I/O 없음)
+    - 무효화: RakeConfigService 변경 커밋 후 Redis 버전 INCR + PUBLISH
+    - 구독: 버전 메시지 수신 시 전체 재로드 (1초 주기 버전 확인으로 유실 보완)
+    """
+
+    def __init__(self) -> None:
+        self._configs: dict[tuple[int, int], RakeConfigData] = {}
+        self._version = 0
+        self._loaded = False
+        self._lock = asyncio.Lock()
+        self._redis: "Redis | None" = None
+        self._session_factory: "Callable[[], Any] | None" = None
+        self._listener_task: asyncio.Task | None = None
+        self._pending: set[asyncio.Task] = set()
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    def get(self, small_blind: int, big_blind: int) -> RakeConfigData | None:
+        """캐시된 활성 설정 (없으면 None → 하드코딩 기본값 사용)."""
+        return self._configs.get((small_blind, big_blind))
+
+    def clear(self) -> None:
+        """캐시 초기화 (테스트용, 다음 조회 시 다시 로드)."""
+        self._configs = {}
+        self._version = 0
+        self._loaded = False
+
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+
+    async def ensure_loaded(self, session: AsyncSession) -> None:
+        """최초 1회 DB 로드 (start() 전에 사용될 때)."""
+        if self._loaded:
+            return
+        async with self._lock:
+            if not self._loaded:
+                await self._load(session, self._version)
+
+    async def reload(self, version: int | None = None) -> None:
+        """새 세션으로 전체 재로드."""
+        if self._session_factory is None:
+            # 세션 팩토리 없음: 다음 ensure_loaded에서 다시 로드
+            self._loaded = False
+            return
+        async with self._lock:
+            if version is not None and self._loaded and version <= self._version:
+                return
+            async with self._session_factory() as session:
+                await self._load(session, version if version is not None else self._version)
+
+    async def _load(self, session: AsyncSession, version: int) -> None:
+        result = await session.execute(
+            select(RakeConfig).where(RakeConfig.is_active == True)  # noqa: E712
+        )
+        # 새 dict로 교체 (조회 중인 핸드는 이전 스냅샷을 그대로 사용)
+        self._configs = {
+            (c.small_blind, c.big_blind): RakeConfigData(
+                percentage=c.percentage,
+                cap_bb=c.cap_bb,
+            )
+            for c in result.scalars().all()
+        }
+        self._version = max(self._version, version)
+        self._loaded = True
+        logger.info(
+            f"Rake config cache loaded: {len(self._configs)} levels "
+            f"(version={self._version})"
+        )
+
+    # ------------------------------------------------------------------
+    # Invalidation
+    # ------------------------------------------------------------------
+
+    async def start(
+        self,
+        redis: "Redis | None",
+        session_factory: "Callable[[], Any]",
+    ) -> None:
+        """초기 로드 + 버전 채널 구독."""
+        self._redis = redis
+        self._session_factory = session_factory
+        try:
+            version = await self._remote_version()
+            await self.reload(version)
+        except Exception as e:
+            # DB 미준비: 첫 핸드에서 ensure_loaded로 로드
+            logger.warning(f"Rake config cache initial load failed: {e}")
+        if redis is not None and self._listener_task is None:
+            self._listener_task = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._listener_task:
+            self._listener_task.cancel()
+            try:
+                await self._listener_task
+            except asyncio.CancelledError:
+                pass
+            self._listener_task = None
+        self._redis = None
+
+    async def publish_change(self) -> None:
+        """버전 bump 후 모든 인스턴스에 알림 (Redis 없으면 로컬만 재로드)."""
+        if self._redis is None:
+            await self.reload()
+            return
+        try:
+            version = await self._redis.incr(RAKE_CONFIG_VERSION_KEY)
+            await self._redis.publish(RAKE_CONFIG_CHANNEL, str(version))
+        except Exception as e:
+            logger.error(f"Rake config version bump failed: {e}")
+            await self.reload()
+
+    def schedule_change(self) -> None:
+        """커밋 훅에서 호출 (동기 컨텍스트 → 백그라운드 태스크)."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._loaded = False
+            return
+        task = loop.create_task(self.publish_change())
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def _remote_version(self) -> int:
+        if self._redis is None:
+            return self._version
+        raw = await self._redis.get(RAKE_CONFIG_VERSION_KEY)
+        return int(raw) if raw else 0
+
+    async def _listen(self) -> None:
+        pubsub = self._redis.pubsub()
+        await pubsub.subscribe(RAKE_CONFIG_CHANNEL)
+        try:
+            while True:
+                try:
+                    message = await pubsub.get_message(
+                        ignore_subscribe_messages=True,
+                        timeout=1.0,
+                    )
+                    if message and message["type"] == "message":
+                        version = int(message["data"])
+                    else:
+                        # 메시지 유실(재연결 등) 보완: 1초마다 버전 확인
+                        version = await self._remote_version()
+                    if version > self._version or not self._loaded:
+                        await self.reload(version)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.error(f"Rake config listener error: {e}")
+                    await asyncio.sleep(1)
+        finally:
+            await pubsub.unsubscribe(RAKE_CONFIG_CHANNEL)
+            await pubsub.close()
+
+
+# Global singleton
+rake_config_cache = RakeConfigCache()
+
+_CONFIG_CHANGED = "rake_config_changed"
+
+
+def _on_config_commit(session: Session) -> None:
+    session.info.pop(_CONFIG_CHANGED, None)
+    rake_config_cache.schedule_change()
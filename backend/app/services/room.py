@@ -8,9 +8,12 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import attributes, selectinload
 
 from app.config import get_settings
+from app.game.lobby_index import LobbyRoom, lobby_index
+from app.game.quick_join_index import quick_join_index
 from app.models.room import Room, RoomStatus
 from app.models.table import Table
 from app.models.user import User
+from app.services.wallet import InsufficientBalanceError, WalletError, WalletService
 from app.utils.security import hash_password, verify_password
 
 settings = get_settings()
@@ -31,6 +34,27 @@ class RoomService:
 
     def __init__(self, db: AsyncSession):
         self.db = db
+        self.wallet = WalletService(db)
+
+    async def get_available_balance(self, user_id: str) -> int:
+        """지갑 잔액 조회 (hot-path 모드에서는 Redis 권위 잔액)."""
+        try:
+            return await self.wallet.get_balance(user_id)
+        except WalletError as e:
+            raise RoomError(e.code, e.message) from e
+
+    async def _debit_buy_in(self, user_id: str, buy_in: int, table_id: str) -> None:
+        """바이인 차감. 잔액 확인과 차감은 WalletService에서 원자적으로 수행."""
+        try:
+            await self.wallet.buy_in(user_id, buy_in, table_id)
+        except InsufficientBalanceError as e:
+            raise RoomError(
+                "INSUFFICIENT_BALANCE",
+                f"Insufficient balance. Required: {buy_in}, Available: {e.current}",
+                {"required": buy_in, "available": e.current},
+            ) from e
+        except WalletError as e:
+            raise RoomError(e.code, e.message) from e
 
     async def create_room(
         self,
@@ -106,6 +130,7 @@ class RoomService:
             seats={},
         )
         self.db.add(table)
+        await lobby_index.upsert_room(room)
 
         return room
 
@@ -147,9 +172,12 @@ class RoomService:
         page_size: int = 20,
         status: str | None = None,
         include_private: bool = True,
-    ) -> tuple[list[Room], int]:
+    ) -> tuple[list[LobbyRoom], int]:
         """List rooms with pagination.
 
+        로비 인덱스(블라인드 → 인원 순 정렬)에서 조회합니다.
+        DB는 인덱스 최초 로드 시에만 조회합니다.
+
         Args:
             page: Page number (1-indexed)
             page_size: Items per page
@@ -157,40 +185,10 @@ class RoomService:
             include_private: Include private rooms
 
         Returns:
-            Tuple of (rooms list, total count)
+            Tuple of (lobby room list, total count)
         """
-        # Base query
-        query = select(Room).options(selectinload(Room.owner))
-
-        # Apply filters
-        conditions = [Room.status != RoomStatus.CLOSED.value]
-
-        if status:
-            conditions.append(Room.status == status)
-
-        if not include_private:
-            conditions.append(
-                Room.config["is_private"].astext.cast(bool) == False  # noqa: E712
-            )
-
-        for condition in conditions:
-            query = query.where(condition)
-
-        # Count total
-        count_query = select(func.count()).select_from(Room)
-        for condition in conditions:
-            count_query = count_query.where(condition)
-        total_result = await self.db.execute(count_query)
-        total = total_result.scalar() or 0
-
-        # Apply pagination and ordering
-        offset = (page - 1) * page_size
-        query = query.order_by(Room.created_at.desc()).offset(offset).limit(page_size)
-
-        result = await self.db.execute(query)
-        rooms = list(result.scalars().all())
-
-        return rooms, total
+        await lobby_index.ensure_loaded(self.db)
+        return lobby_index.page(page, page_size, status, include_private)
 
     async def join_room(
         self,
@@ -275,20 +273,13 @@ class RoomService:
         if position is None:
             raise RoomError("TABLE_FULL", "No seats available")
 
-        # Now verify user and balance (after all room validations pass)
+        # Now verify user (after all room validations pass)
         user = await self.db.get(User, user_id)
         if not user:
             raise RoomError("USER_NOT_FOUND", "User not found")
 
-        if user.balance < buy_in:
-            raise RoomError(
-                "INSUFFICIENT_BALANCE",
-                f"Insufficient balance. Required: {buy_in}, Available: {user.balance}",
-                {"required": buy_in, "available": user.balance},
-            )
-
-        # Deduct buy-in from user balance (LAST, after all validations pass)
-        user.balance -= buy_in
+        # Deduct buy-in from wallet (LAST, after all validations pass)
+        await self._debit_buy_in(user_id, buy_in, table.id)
 
         # Add player to seat
         seats[str(position)] = {
@@ -307,6 +298,8 @@ class RoomService:
         if room.current_players >= 2 and room.status == RoomStatus.WAITING.value:
             room.status = RoomStatus.PLAYING.value
 
+        await lobby_index.upsert_room(room)
+
         return {
             "table_id": table.id,
             "position": position,
@@ -348,13 +341,13 @@ class RoomService:
         if user_position is None:
             raise RoomError("TABLE_NOT_SEATED", "Not seated in this room")
 
-        # Return stack to user's balance
+        # Return stack to user's wallet
         seat_data = seats[user_position]
         stack = seat_data.get("stack", 0)
         if stack > 0:
             user = await self.db.get(User, user_id)
             if user:
-                user.balance += stack
+                await self.wallet.cash_out(user_id, stack, table.id)
 
         # Remove player from seat
         del seats[user_position]
@@ -367,6 +360,7 @@ class RoomService:
         if room.current_players < 2 and room.status == RoomStatus.PLAYING.value:
             room.status = RoomStatus.WAITING.value
 
+        await lobby_index.upsert_room(room)
         return True
 
     async def update_room(
@@ -418,6 +412,7 @@ class RoomService:
                 config["password_hash"] = None
             room.config = config
 
+        await lobby_index.upsert_room(room)
         return room
 
     async def close_room(self, room_id: str, owner_id: str) -> bool:
@@ -442,6 +437,7 @@ class RoomService:
             raise RoomError("ROOM_NOT_OWNER", "Only owner can close room")
 
         room.status = RoomStatus.CLOSED.value
+        await lobby_index.remove(room_id)
         return True
 
     async def force_close_room(
@@ -503,7 +499,9 @@ class RoomService:
                     # 환불 처리
                     user = await self.db.get(User, player.user_id)
                     if user and player.stack > 0:
-                        user.balance += player.stack
+                        await self.wallet.cash_out(
+                            player.user_id, player.stack, table.id
+                        )
                         refunds.append({
                             "user_id": player.user_id,
                             "nickname": player.username,
@@ -522,7 +520,7 @@ class RoomService:
                 if user_id and stack > 0:
                     user = await self.db.get(User, user_id)
                     if user:
-                        user.balance += stack
+                        await self.wallet.cash_out(user_id, stack, table.id)
                         refunds.append({
                             "user_id": user_id,
                             "nickname": seat_data.get("nickname", "Unknown"),
@@ -538,6 +536,7 @@ class RoomService:
 
         room.status = RoomStatus.CLOSED.value
         room.current_players = 0
+        await lobby_index.remove(room_id)
 
         return {
             "room_id": room_id,
@@ -620,42 +619,34 @@ class RoomService:
         Returns:
             List of available rooms sorted by priority
         """
-        from app.services.room_matcher import RoomMatcher, calculate_room_score
+        from app.services.room_matcher import parse_blind_level
 
         # Get rooms user is already in
         exclude_room_ids = []
         if exclude_user_id:
             exclude_room_ids = await self.get_user_rooms(exclude_user_id)
 
-        # Query available rooms
-        query = select(Room).options(
-            selectinload(Room.tables)
-        ).where(
-            Room.status.in_([RoomStatus.WAITING.value, RoomStatus.PLAYING.value]),
-            Room.current_players < Room.max_seats,
+        # Rank from the in-memory index (affordable, joinable, by priority score)
+        await quick_join_index.ensure_loaded(self.db)
+        ranked = quick_join_index.ranked(
+            user_balance,
+            parse_blind_level(blind_level),
+            exclude_room_ids,
         )
+        if not ranked:
+            return []
 
-        if exclude_room_ids:
-            query = query.where(Room.id.notin_(exclude_room_ids))
-
-        result = await self.db.execute(query)
-        rooms = list(result.scalars().all())
-
-        # Filter by user balance (must afford min buy-in)
-        affordable_rooms = [
-            room for room in rooms
-            if room.config.get("buy_in_min", 400) <= user_balance
-        ]
-
-        # Filter by blind level if specified
-        if blind_level and affordable_rooms:
-            matcher = RoomMatcher(self.db)
-            affordable_rooms = matcher._filter_by_blind_level(affordable_rooms, blind_level)
-
-        # Sort by priority score
-        affordable_rooms.sort(key=lambda r: calculate_room_score(r), reverse=True)
+        # Load only the matched rooms, keeping the ranking order
+        order = {entry.room_id: i for i, entry in enumerate(ranked)}
+        result = await self.db.execute(
+            select(Room)
+            .options(selectinload(Room.tables))
+            .where(Room.id.in_(list(order)))
+        )
+        rooms = [room for room in result.scalars().all() if room.id in order]
+        rooms.sort(key=lambda r: order[r.id])
 
-        return affordable_rooms
+        return rooms
 
     async def quick_join_room(
         self,
@@ -726,20 +717,13 @@ class RoomService:
                     "already_seated": True,
                 }
 
-        # Verify user and balance
+        # Verify user
         user = await self.db.get(User, user_id)
         if not user:
             raise RoomError("USER_NOT_FOUND", "User not found")
 
-        if user.balance < buy_in:
-            raise RoomError(
-                "INSUFFICIENT_BALANCE",
-                f"Insufficient balance. Required: {buy_in}, Available: {user.balance}",
-                {"required": buy_in, "available": user.balance},
-            )
-
-        # Deduct buy-in from user balance
-        user.balance -= buy_in
+        # Deduct buy-in from wallet
+        await self._debit_buy_in(user_id, buy_in, table.id)
 
         # Add player to seat
         seats[seat_key] = {
@@ -757,6 +741,8 @@ class RoomService:
         if room.current_players >= 2 and room.status == RoomStatus.WAITING.value:
             room.status = RoomStatus.PLAYING.value
 
+        await lobby_index.upsert_room(room)
+
         return {
             "table_id": table.id,
             "position": seat,
@@ -813,11 +799,12 @@ class RoomService:
         if not user:
             raise RoomError("USER_NOT_FOUND", "User not found")
 
-        if user.balance < buy_in:
+        balance = await self.get_available_balance(user_id)
+        if balance < buy_in:
             raise RoomError(
                 "INSUFFICIENT_BALANCE",
-                f"Insufficient balance. Required: {buy_in}, Available: {user.balance}",
-                {"required": buy_in, "available": user.balance},
+                f"Insufficient balance. Required: {buy_in}, Available: {balance}",
+                {"required": buy_in, "available": balance},
             )
 
         # 이미 착석 중인지 확인
@@ -1109,6 +1096,7 @@ class RoomService:
             seats={},
         )
         self.db.add(table)
+        await lobby_index.upsert_room(room)
 
         return room
 
@@ -1206,6 +1194,7 @@ class RoomService:
             room.config = config
             attributes.flag_modified(room, "config")
 
+        await lobby_index.upsert_room(room)
         return room
 
     async def close_room_admin(self, room_id: str) -> bool:
@@ -1245,4 +1234,5 @@ class RoomService:
         for table in room.tables:
             table.status = "closed"
 
+        await lobby_index.remove(room_id)
         return True
@@ -1,19 +1,27 @@
 """Room matching service for Quick Join functionality.
 
 Provides intelligent room matching based on user preferences and room availability.
+
+Matching reads the in-memory QuickJoinIndex (no DB query per request) and
+reserves a seat in Redis so that concurrent quick joins on different
+instances do not pick the same seat.
 """
 
 from __future__ import annotations
 
-import random
 import logging
+import random
+from dataclasses import dataclass
+from pathlib import Path
 from typing import TYPE_CHECKING
 
-from sqlalchemy import select, and_, or_
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
-from app.models.room import Room, RoomStatus
+from app.game.lobby_index import LobbyRoom
+from app.game.manager import game_manager
+from app.game.quick_join_index import BlindFilter, quick_join_index, room_score
+from app.models.room import Room
 from app.models.table import Table
 from app.utils.errors import (
     NoAvailableRoomError,
@@ -21,7 +29,7 @@ from app.utils.errors import (
 )
 
 if TYPE_CHECKING:
-    pass
+    from redis.asyncio import Redis
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +41,21 @@ BLIND_LEVELS = {
     "high": {"min_sb": 100, "max_sb": 1000},  # 100/200+
 }
 
+SEAT_RESERVATION_PREFIX = "quickjoin:seat:"
+SEAT_RESERVATION_TTL_MS = 10_000
+
+_SEAT_RESERVE_LUA: str | None = None
+
+
+def _load_seat_reserve_script() -> str:
+    """Load seat reservation Lua script from file."""
+    global _SEAT_RESERVE_LUA
+    if _SEAT_RESERVE_LUA is None:
+        script_path = Path(__file__).parent.parent / "utils" / "lua_scripts" / "seat_reserve.lua"
+        with open(script_path) as f:
+            _SEAT_RESERVE_LUA = f.read()
+    return _SEAT_RESERVE_LUA
+
 
 def calculate_room_score(room: Room) -> int:
     """Calculate priority score for room selection.
@@ -50,23 +73,56 @@ def calculate_room_score(room: Room) -> int:
     Returns:
         Priority score (higher is better)
     """
-    score = 0
-    
-    # 1. Prefer rooms with active games (+100)
-    if room.status == RoomStatus.PLAYING.value:
-        score += 100
-    elif room.status == RoomStatus.WAITING.value:
-        score += 50
-    
-    # 2. Prefer rooms with more players (+10 per player)
-    score += room.current_players * 10
-    
-    # 3. Prefer rooms with fewer empty seats (more active)
-    max_seats = room.config.get("max_seats", 6)
-    occupied_ratio = room.current_players / max_seats if max_seats > 0 else 0
-    score += int(occupied_ratio * 20)
-    
-    return score
+    return room_score(
+        room.status,
+        room.current_players,
+        room.config.get("max_seats", 6),
+    )
+
+
+def parse_blind_level(blind_level: str | None) -> BlindFilter | None:
+    """Convert a blind level preference into an index filter.
+
+    Args:
+        blind_level: 'low', 'medium', 'high', or specific like '10/20'
+
+    Returns:
+        BlindFilter, or None when no (or an unrecognized) level is given
+    """
+    if not blind_level:
+        return None
+
+    if "/" in blind_level:
+        # Specific blind level like "10/20"
+        parts = blind_level.split("/")
+        try:
+            target_sb = int(parts[0])
+            target_bb = int(parts[1])
+        except (ValueError, IndexError):
+            return None
+        return BlindFilter(target_sb, target_sb, target_bb)
+
+    # Named level
+    level_config = BLIND_LEVELS.get(blind_level.lower())
+    if not level_config:
+        return None
+    return BlindFilter(level_config["min_sb"], level_config["max_sb"])
+
+
+@dataclass(frozen=True, slots=True)
+class SeatReservation:
+    """A room picked by quick join with a seat held for the user.
+
+    Attributes:
+        room: Matched room (index entry)
+        seat: Reserved seat number
+        user_id: User holding the reservation
+        key: Redis reservation key (None if Redis was unavailable)
+    """
+    room: LobbyRoom
+    seat: int
+    user_id: str
+    key: str | None = None
 
 
 def calculate_default_buy_in(
@@ -116,8 +172,11 @@ class RoomMatcher:
     Provides intelligent room selection for Quick Join functionality.
     """
     
-    def __init__(self, db: AsyncSession):
+    MAX_RESERVE_ATTEMPTS = 5
+
+    def __init__(self, db: AsyncSession, redis: Redis | None = None):
         self.db = db
+        self._redis = redis
     
     async def find_best_room(
         self,
@@ -125,9 +184,12 @@ class RoomMatcher:
         user_balance: int,
         blind_level: str | None = None,
         exclude_room_ids: list[str] | None = None,
-    ) -> Room | None:
+    ) -> LobbyRoom | None:
         """Find the best available room for the user.
         
+        Answered from the in-memory QuickJoinIndex; the DB is only read
+        once, when the lobby index is first loaded.
+
         Args:
             user_id: User ID (to exclude rooms they're already in)
             user_balance: User's current balance
@@ -135,123 +197,115 @@ class RoomMatcher:
             exclude_room_ids: Room IDs to exclude (e.g., rooms user is already in)
             
         Returns:
-            Best matching Room or None if no suitable room found
+            Best matching room or None if no suitable room found
         """
-        # Build query for available rooms
-        query = select(Room).options(
-            selectinload(Room.tables)
-        ).where(
-            and_(
-                Room.status.in_([RoomStatus.WAITING.value, RoomStatus.PLAYING.value]),
-                Room.current_players < Room.max_seats,  # Has empty seats
-            )
+        await quick_join_index.ensure_loaded(self.db)
+
+        top_rooms = quick_join_index.best(
+            user_balance,
+            parse_blind_level(blind_level),
+            exclude_room_ids or (),
         )
-        
-        # Exclude rooms user is already in
-        if exclude_room_ids:
-            query = query.where(Room.id.notin_(exclude_room_ids))
-        
-        result = await self.db.execute(query)
-        rooms = list(result.scalars().all())
-        
-        if not rooms:
+        if not top_rooms:
             return None
-        
-        # Filter by user balance (must afford min buy-in)
-        affordable_rooms = [
-            room for room in rooms
-            if room.config.get("buy_in_min", 400) <= user_balance
-        ]
-        
-        if not affordable_rooms:
-            return None
-        
-        # Filter by blind level if specified
-        if blind_level:
-            affordable_rooms = self._filter_by_blind_level(affordable_rooms, blind_level)
-            if not affordable_rooms:
-                return None
-        
-        # Score and sort rooms
-        scored_rooms = [
-            (room, calculate_room_score(room))
-            for room in affordable_rooms
-        ]
-        scored_rooms.sort(key=lambda x: x[1], reverse=True)
-        
-        # Get rooms with the highest score
-        if not scored_rooms:
-            return None
-        
-        max_score = scored_rooms[0][1]
-        top_rooms = [room for room, score in scored_rooms if score == max_score]
-        
+
         # Random selection among top rooms (for fairness)
         return random.choice(top_rooms)
-    
-    def _filter_by_blind_level(
+
+    async def reserve_best_room(
         self,
-        rooms: list[Room],
-        blind_level: str,
-    ) -> list[Room]:
-        """Filter rooms by blind level.
-        
-        Args:
-            rooms: List of rooms to filter
-            blind_level: 'low', 'medium', 'high', or specific like '10/20'
-            
+        user_id: str,
+        user_balance: int,
+        blind_level: str | None = None,
+        exclude_room_ids: list[str] | None = None,
+    ) -> SeatReservation | None:
+        """Find the best room and hold a free seat in it for the user.
+
+        Rooms whose free seats are all reserved by other users are skipped
+        and the next best room is tried.
+
         Returns:
-            Filtered list of rooms
+            SeatReservation, or None if no room could be reserved
         """
-        if "/" in blind_level:
-            # Specific blind level like "10/20"
-            parts = blind_level.split("/")
-            try:
-                target_sb = int(parts[0])
-                target_bb = int(parts[1])
-                return [
-                    room for room in rooms
-                    if room.small_blind == target_sb and room.big_blind == target_bb
-                ]
-            except (ValueError, IndexError):
-                return rooms
-        
-        # Named level
-        level_config = BLIND_LEVELS.get(blind_level.lower())
-        if not level_config:
-            return rooms
-        
-        min_sb = level_config["min_sb"]
-        max_sb = level_config["max_sb"]
-        
-        return [
-            room for room in rooms
-            if min_sb <= room.small_blind <= max_sb
-        ]
-    
-    def get_available_seat(self, room: Room) -> int | None:
-        """Find an available seat in the room.
-        
-        Args:
-            room: Room to check
-            
+        excluded = list(exclude_room_ids or [])
+        for _ in range(self.MAX_RESERVE_ATTEMPTS):
+            room = await self.find_best_room(user_id, user_balance, blind_level, excluded)
+            if room is None:
+                return None
+
+            reservation = await self.reserve_seat(room, user_id)
+            if reservation is not None:
+                return reservation
+            excluded.append(room.room_id)
+        return None
+
+    async def reserve_seat(self, room: LobbyRoom, user_id: str) -> SeatReservation | None:
+        """Reserve the first free seat of a room (one Redis round trip).
+
         Returns:
-            Available seat number or None if full
+            SeatReservation, or None if every free seat is reserved
         """
-        if not room.tables:
+        seats = self.get_available_seats(room)
+        if not seats:
             return None
-        
-        table = room.tables[0]  # Assume one table per room
-        seats = table.seats or {}
-        max_seats = room.config.get("max_seats", 6)
-        
-        # Find first empty seat
-        for seat_num in range(max_seats):
-            seat_key = str(seat_num)
-            if seat_key not in seats or seats[seat_key] is None:
-                return seat_num
-        
-        return None
+
+        redis = self._get_redis()
+        if redis is None:
+            return SeatReservation(room=room, seat=seats[0], user_id=user_id)
+
+        keys = [f"{SEAT_RESERVATION_PREFIX}{room.room_id}:{seat}" for seat in seats]
+        try:
+            script = redis.register_script(_load_seat_reserve_script())
+            index = int(await script(keys=keys, args=[user_id, SEAT_RESERVATION_TTL_MS]))
+        except Exception as e:
+            # 예약 없이 진행 (quick_join_room이 좌석 충돌 시 다른 좌석 배정)
+            logger.warning(f"Seat reservation failed, joining unreserved: {e}")
+            return SeatReservation(room=room, seat=seats[0], user_id=user_id)
+
+        if index == 0:
+            return None
+        return SeatReservation(
+            room=room,
+            seat=seats[index - 1],
+            user_id=user_id,
+            key=keys[index - 1],
+        )
+
+    async def release(self, reservation: SeatReservation) -> None:
+        """Release a reservation held by the user (e.g., after a failed join)."""
+        redis = self._get_redis()
+        if reservation.key is None or redis is None:
+            return
+        try:
+            # Release only our own reservation
+            current = await redis.get(reservation.key)
+            if current is not None:
+                holder = current.decode() if isinstance(current, bytes) else current
+                if holder == reservation.user_id:
+                    await redis.delete(reservation.key)
+        except Exception as e:
+            logger.warning(f"Seat reservation release failed: {e}")
+
+    def get_available_seats(self, room: LobbyRoom) -> list[int]:
+        """Free seat numbers in preference order.
+
+        Uses the live game table when one exists; otherwise every seat is a
+        candidate and quick_join_room moves the user if the seat is taken.
+        """
+        table = game_manager.get_table(room.room_id)
+        if table is None:
+            return list(range(room.max_seats))
+        return [
+            seat for seat in range(table.max_players)
+            if table.players.get(seat) is None
+        ]
+
+    def _get_redis(self) -> Redis | None:
+        if self._redis is None:
+            from app.utils.redis_client import get_redis
+
+            self._redis = get_redis()
+        return self._redis
     
     async def get_user_room_ids(self, user_id: str) -> list[str]:
         """Get room IDs where user is currently seated.
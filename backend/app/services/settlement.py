@@ -0,0 +1,304 @@
+"""Hand Settlement Service - 핸드 단위 원장 정산.
+
+핸드 종료 시 발생하는 모든 잔액 변동(레이크, 승리금, 바이인 조정)을
+사용자별 transfer_krw 호출 대신 하나의 배치로 적용합니다.
+
+transfer_krw 경로 (사용자당 약 5 round trip):
+    SET NX 락 → session.get(User) → INSERT 1건 flush → GET + DEL 락 해제
+
+정산 경로 (핸드당):
+    SELECT ... FOR UPDATE (user_id 정렬 순서로 잠금, 데드락 방지)
+    → 다건 INSERT (integrity_hash 포함) → flush
+    → 잔액 캐시 무효화 1회 (multi-key DEL)
+
+모든 변경은 호출자의 DB 트랜잭션 안에서 적용됩니다 (commit은 호출자).
+검증(사용자 존재, 잔액 부족)은 쓰기 전에 끝나므로 실패 시 부분 반영이 없습니다.
+
+Hot-path 모드 (settings.wallet_hot_path):
+    wallet_settle.lua 1회 (권위 Redis 잔액 검증 + 변경 + 저널 XADD, 원자적)
+    → Postgres 기록은 저널 기록기가 비동기로 수행
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any
+from uuid import uuid4
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.models.user import User
+from app.models.wallet import TransactionStatus, TransactionType, WalletTransaction
+from app.services.wallet import InsufficientBalanceError, WalletError, WalletService
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class LedgerEntry:
+    """핸드 정산의 잔액 변동 1건.
+
+    Attributes:
+        user_id: 사용자 ID
+        amount: 변동액 (+credit / -debit)
+        tx_type: 거래 유형 (RAKE, WIN, BUY_IN, CASH_OUT 등)
+        description: 거래 설명 (없으면 유형별 기본값)
+    """
+    user_id: str
+    amount: int
+    tx_type: TransactionType
+    description: str | None = None
+
+
+_DEFAULT_DESCRIPTIONS = {
+    TransactionType.RAKE: "Rake deducted: {amount:,} KRW",
+    TransactionType.WIN: "Pot won: {amount:,} KRW",
+    TransactionType.BUY_IN: "Table buy-in: {amount:,} KRW",
+    TransactionType.CASH_OUT: "Table cash-out: {amount:,} KRW",
+}
+
+
+class HandSettlementService:
+    """핸드 단위 원장 정산.
+
+    WalletService와 같은 잔액 캐시 키와 integrity_hash를 사용하므로
+    기존 거래 내역 검증(verify_integrity)과 호환됩니다.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        redis: Redis | None = None,
+        hot_path: bool | None = None,
+    ) -> None:
+        self.session = session
+        self._redis = redis
+        self.hot_path = (
+            get_settings().wallet_hot_path if hot_path is None else hot_path
+        )
+
+    async def settle_hand(
+        self,
+        table_id: str | None,
+        hand_id: str | None,
+        entries: Sequence[LedgerEntry],
+    ) -> list[dict[str, Any]]:
+        """핸드의 잔액 변동을 한 번에 적용.
+
+        Args:
+            table_id: Table ID (게임 외 일괄 지급은 None)
+            hand_id: Hand ID (게임 외 일괄 지급은 None)
+            entries: 잔액 변동 목록 (같은 사용자 여러 건 가능, 순서대로 적용)
+
+        Returns:
+            생성된 거래 행 목록 (WalletTransaction 컬럼 dict)
+
+        Raises:
+            WalletError: 사용자 없음 (USER_NOT_FOUND)
+            InsufficientBalanceError: 차감 후 잔액이 음수
+        """
+        # 0원 항목은 거래 기록 없이 건너뜀
+        entries = [e for e in entries if e.amount != 0]
+        if not entries:
+            return []
+
+        if self.hot_path:
+            return await self._settle_hot(table_id, hand_id, entries)
+
+        users = await self._lock_users({e.user_id for e in entries})
+
+        # 1) 검증 + 행 생성: 잔액은 로컬 사본으로만 계산 (어느 항목이 실패해도
+        #    세션의 User 객체는 변경되지 않음)
+        balances = {uid: user.krw_balance for uid, user in users.items()}
+        rake_paid: dict[str, int] = {}
+        rows: list[dict[str, Any]] = []
+        for entry in entries:
+            balance_before = balances[entry.user_id]
+            balance_after = balance_before + entry.amount
+            if balance_after < 0:
+                raise InsufficientBalanceError(
+                    current=balance_before,
+                    required=-entry.amount,
+                )
+            rows.append({
+                "id": str(uuid4()),
+                "user_id": entry.user_id,
+                "tx_type": entry.tx_type,
+                "status": TransactionStatus.COMPLETED,
+                "krw_amount": entry.amount,
+                "krw_balance_before": balance_before,
+                "krw_balance_after": balance_after,
+                "table_id": table_id,
+                "hand_id": hand_id,
+                "description": self._describe(entry),
+                "integrity_hash": WalletService._compute_integrity_hash(
+                    user_id=entry.user_id,
+                    tx_type=entry.tx_type,
+                    amount=entry.amount,
+                    balance_before=balance_before,
+                    balance_after=balance_after,
+                ),
+            })
+            # 다음 항목은 갱신된 잔액 기준
+            balances[entry.user_id] = balance_after
+            if entry.tx_type == TransactionType.RAKE:
+                rake_paid[entry.user_id] = rake_paid.get(entry.user_id, 0) - entry.amount
+
+        # 2) 다건 INSERT (insertmanyvalues 배치) - 실패 시 잔액 미반영
+        await self.session.execute(insert(WalletTransaction), rows)
+
+        # 3) 모든 항목이 유효하고 기록된 뒤에만 잔액 반영
+        for user_id, balance in balances.items():
+            users[user_id].krw_balance = balance
+        for user_id, amount in rake_paid.items():
+            users[user_id].total_rake_paid_krw += amount
+        await self.session.flush()
+
+        await self._invalidate_balances(users.keys())
+
+        logger.info(
+            "hand_settled",
+            extra={
+                "hand_id": hand_id,
+                "table_id": table_id,
+                "entries": len(rows),
+                "users": len(users),
+            },
+        )
+        return rows
+
+    async def _settle_hot(
+        self,
+        table_id: str | None,
+        hand_id: str | None,
+        entries: list[LedgerEntry],
+    ) -> list[dict[str, Any]]:
+        """Redis 권위 잔액에 배치 적용 + 저널 (DB I/O 없음)."""
+        redis = await self._get_redis()
+        wallet = WalletService(self.session, hot_path=True)
+        user_ids = sorted({e.user_id for e in entries})
+        key_index = {uid: i + 1 for i, uid in enumerate(user_ids)}
+
+        now = datetime.now(timezone.utc)
+        txs = [
+            WalletTransaction(
+                id=str(uuid4()),
+                user_id=entry.user_id,
+                tx_type=entry.tx_type,
+                status=TransactionStatus.COMPLETED,
+                krw_amount=entry.amount,
+                table_id=table_id,
+                hand_id=hand_id,
+                description=self._describe(entry),
+                created_at=now,
+            )
+            for entry in entries
+        ]
+        args: list[Any] = [len(entries)]
+        for entry, tx in zip(entries, txs):
+            args += [key_index[entry.user_id], entry.amount, entry.user_id, wallet.journal_payload(tx)]
+        keys = [
+            WalletService.JOURNAL_STREAM_KEY,
+            WalletService.PENDING_DELTA_KEY,
+            *(f"{WalletService.BALANCE_KEY_PREFIX}{uid}" for uid in user_ids),
+        ]
+        script = redis.register_script(WalletService._load_settle_lua_script())
+
+        for attempt in range(2):
+            result = await script(keys=keys, args=args)
+            if int(result[0]) == 1:
+                break
+            reason = result[1].decode() if isinstance(result[1], bytes) else result[1]
+            if reason == "COLD_BALANCE" and attempt == 0:
+                cold = [user_ids[int(i) - 1] for i in result[2:]]
+                await wallet.load_hot_balances(redis, cold)
+                continue
+            if reason == "INSUFFICIENT_BALANCE":
+                raise InsufficientBalanceError(
+                    current=int(result[3]),
+                    required=int(result[4]),
+                )
+            raise WalletError(f"Hot-path settlement failed: {reason}")
+
+        rows = []
+        for tx, balance_after in zip(txs, result[1:]):
+            balance_after = int(balance_after)
+            balance_before = balance_after - tx.krw_amount
+            rows.append({
+                "id": tx.id,
+                "user_id": tx.user_id,
+                "tx_type": tx.tx_type,
+                "status": tx.status,
+                "krw_amount": tx.krw_amount,
+                "krw_balance_before": balance_before,
+                "krw_balance_after": balance_after,
+                "table_id": table_id,
+                "hand_id": hand_id,
+                "description": tx.description,
+                "integrity_hash": WalletService._compute_integrity_hash(
+                    user_id=tx.user_id,
+                    tx_type=tx.tx_type,
+                    amount=tx.krw_amount,
+                    balance_before=balance_before,
+                    balance_after=balance_after,
+                ),
+            })
+
+        logger.info(
+            "hand_settled",
+            extra={
+                "hand_id": hand_id,
+                "table_id": table_id,
+                "entries": len(rows),
+                "users": len(user_ids),
+                "hot_path": True,
+            },
+        )
+        return rows
+
+    @staticmethod
+    def _describe(entry: LedgerEntry) -> str:
+        return entry.description or _DEFAULT_DESCRIPTIONS.get(
+            entry.tx_type, "{amount:,} KRW"
+        ).format(amount=abs(entry.amount))
+
+    async def _lock_users(self, user_ids: set[str]) -> dict[str, User]:
+        """user_id 정렬 순서로 행 잠금 (동시 정산 간 데드락 방지)."""
+        ordered = sorted(user_ids)
+        result = await self.session.execute(
+            select(User)
+            .where(User.id.in_(ordered))
+            .order_by(User.id)
+            .with_for_update()
+        )
+        users = {user.id: user for user in result.scalars().all()}
+
+        missing = [uid for uid in ordered if uid not in users]
+        if missing:
+            raise WalletError(f"User not found: {missing[0]}", code="USER_NOT_FOUND")
+        return users
+
+    async def _invalidate_balances(self, user_ids) -> None:
+        """잔액 캐시 일괄 삭제 (1 round trip)."""
+        keys = [f"{WalletService.BALANCE_KEY_PREFIX}{uid}" for uid in user_ids]
+        try:
+            redis = await self._get_redis()
+            await redis.delete(*keys)
+        except Exception as e:
+            # 캐시 TTL(5분) 내 자연 만료 - 정산 자체는 커밋 대상
+            logger.warning(f"Balance cache invalidation failed for {len(keys)} users: {e}")
+
+    async def _get_redis(self) -> Redis:
+        if self._redis is None:
+            from app.utils.redis_client import get_redis_client
+
+            self._redis = await get_redis_client()
+        return self._redis
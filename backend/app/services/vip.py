@@ -5,25 +5,27 @@ Phase 6.2: VIP & Rakeback System
 Features:
 - VIP level calculation based on total rake paid
 - Rakeback percentage per VIP level
-- Weekly rakeback settlement
+- Weekly rakeback settlement (set-based, chunked, resumable)
 - VIP level caching for performance
 """
 
+import bisect
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import datetime, timedelta
 from decimal import Decimal
 from enum import Enum
 from typing import TYPE_CHECKING
 from uuid import uuid4
 
-from sqlalchemy import select, update
+from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.user import User
 from app.models.wallet import TransactionStatus, TransactionType, WalletTransaction
+from app.services.settlement import HandSettlementService, LedgerEntry
 from app.services.wallet import WalletService
-from app.utils.redis_client import get_redis
+from app.utils.redis_client import get_redis, get_redis_client
 
 if TYPE_CHECKING:
     pass
@@ -95,6 +97,14 @@ VIP_TIER_MAP: dict[VIPLevel, VIPTierConfig] = {
     tier.level: tier for tier in VIP_TIERS
 }
 
+# Tier thresholds for bisect lookup (bulk tier calculation)
+_TIER_THRESHOLDS: list[int] = [tier.min_rake_krw for tier in VIP_TIERS]
+
+
+def _rakeback_tag(week_start: datetime) -> str:
+    """주간 레이크백 거래 설명 접두사 (주차별 중복 지급 확인용)."""
+    return f"Weekly rakeback {week_start:%Y-%m-%d}"
+
 
 @dataclass
 class VIPStatus:
@@ -151,6 +161,9 @@ class VIPService:
     
     VIP_CACHE_PREFIX = "vip:level:"
     VIP_CACHE_TTL = 3600  # 1 hour cache
+    RAKEBACK_CHECKPOINT_PREFIX = "rakeback:checkpoint:"
+    RAKEBACK_CHECKPOINT_TTL = 14 * 24 * 3600  # 2 weeks
+    RAKEBACK_PAID_PREFIX = "rakeback:paid:"
     
     def __init__(self, session: AsyncSession) -> None:
         """Initialize VIP service.
@@ -171,16 +184,9 @@ class VIPService:
         Returns:
             VIPTierConfig for the user's level
         """
-        # Find highest tier user qualifies for
-        current_tier = VIP_TIERS[0]  # Default to Bronze
-        
-        for tier in VIP_TIERS:
-            if total_rake_paid >= tier.min_rake_krw:
-                current_tier = tier
-            else:
-                break
-        
-        return current_tier
+        # Find highest tier user qualifies for (Bronze if below all thresholds)
+        idx = bisect.bisect_right(_TIER_THRESHOLDS, total_rake_paid) - 1
+        return VIP_TIERS[max(idx, 0)]
     
     async def get_vip_status(self, user_id: str) -> VIPStatus:
         """Get full VIP status for a user.
@@ -346,10 +352,7 @@ class VIPService:
             user_id=rakeback.user_id,
             amount=rakeback.rakeback_amount,
             tx_type=TransactionType.RAKEBACK,
-            description=(
-                f"Weekly rakeback ({rakeback.vip_level.value}): "
-                f"{rakeback.rakeback_pct*100:.0f}% of {rakeback.rake_paid:,} KRW"
-            ),
+            description=self._rakeback_description(rakeback),
         )
         
         logger.info(
@@ -369,21 +372,35 @@ class VIPService:
             transaction_id=tx.id,
         )
     
+    @staticmethod
+    def _rakeback_description(rakeback: RakebackResult) -> str:
+        return (
+            f"{_rakeback_tag(rakeback.period_start)} ({rakeback.vip_level.value}): "
+            f"{rakeback.rakeback_pct*100:.0f}% of {rakeback.rake_paid:,} KRW"
+        )
+    
     async def process_weekly_rakeback_all(
         self,
         week_start: datetime | None = None,
-        batch_size: int = 100,
+        batch_size: int = 1000,
     ) -> list[RakebackResult]:
         """Process weekly rakeback for all eligible users.
         
         This is the main entry point for the weekly settlement job.
         
+        1. 주간 레이크를 GROUP BY 1회로 집계 (사용자별 조회 없음)
+        2. VIP 등급/레이크백을 메모리에서 일괄 계산
+        3. batch_size 단위로 지급 + 커밋, 청크마다 체크포인트 저장
+        
+        중단 후 재실행하면 체크포인트(마지막 지급 user_id) 이후부터 재개하며,
+        체크포인트 저장 전에 커밋된 청크는 주차 태그로 중복 지급을 막습니다.
+        
         Args:
             week_start: Start of the week to process
-            batch_size: Number of users to process per batch
+            batch_size: Number of users to credit per transaction
             
         Returns:
-            List of RakebackResults for all processed users
+            List of RakebackResults for users processed in this run
         """
         # Determine week boundaries
         if week_start is None:
@@ -400,44 +417,31 @@ class VIPService:
             f"Processing weekly rakeback: {week_start.date()} to {week_end.date()}"
         )
         
-        # Find all users who paid rake in the period
-        query = (
-            select(WalletTransaction.user_id)
-            .where(WalletTransaction.tx_type == TransactionType.RAKE)
-            .where(WalletTransaction.status == TransactionStatus.COMPLETED)
-            .where(WalletTransaction.created_at >= week_start)
-            .where(WalletTransaction.created_at < week_end)
-            .distinct()
-        )
+        rakebacks = await self._aggregate_weekly_rakeback(week_start, week_end)
+        logger.info(f"Found {len(rakebacks)} users with rake in period")
         
-        result = await self.session.execute(query)
-        user_ids = [row[0] for row in result.fetchall()]
-        
-        logger.info(f"Found {len(user_ids)} users with rake in period")
+        # Resume after checkpoint
+        checkpoint_key = f"{self.RAKEBACK_CHECKPOINT_PREFIX}{week_start.date().isoformat()}"
+        redis = await self._checkpoint_redis()
+        last_user_id = await self._load_checkpoint(redis, checkpoint_key)
+        if last_user_id is not None:
+            pending = [r for r in rakebacks if r.user_id > last_user_id]
+            logger.info(
+                f"Resuming weekly rakeback after checkpoint: "
+                f"{len(rakebacks) - len(pending)} users already processed"
+            )
+        else:
+            pending = rakebacks
         
+        settlement = HandSettlementService(self.session)
         results = []
         
-        for user_id in user_ids:
-            try:
-                # Calculate rakeback
-                rakeback = await self.calculate_weekly_rakeback(
-                    user_id=user_id,
-                    week_start=week_start,
-                )
-                
-                # Settle if there's rakeback to pay
-                if rakeback.rakeback_amount > 0:
-                    rakeback = await self.settle_rakeback(rakeback)
-                
-                results.append(rakeback)
-                
-            except Exception as e:
-                logger.error(
-                    f"Failed to process rakeback for user {user_id}: {e}"
-                )
-        
-        # Commit all transactions
-        await self.session.commit()
+        for start in range(0, len(pending), batch_size):
+            chunk = pending[start:start + batch_size]
+            results.extend(
+                await self._settle_rakeback_chunk(settlement, chunk, week_start, redis)
+            )
+            await self._save_checkpoint(redis, checkpoint_key, chunk[-1].user_id)
         
         total_rakeback = sum(r.rakeback_amount for r in results)
         logger.info(
@@ -446,3 +450,206 @@ class VIPService:
         )
         
         return results
+    
+    async def _aggregate_weekly_rakeback(
+        self,
+        week_start: datetime,
+        week_end: datetime,
+    ) -> list[RakebackResult]:
+        """주간 레이크 집계 + 등급별 레이크백 계산 (user_id 순 정렬)."""
+        query = (
+            select(
+                WalletTransaction.user_id,
+                func.sum(func.abs(WalletTransaction.krw_amount)),
+                User.total_rake_paid_krw,
+            )
+            .join(User, User.id == WalletTransaction.user_id)
+            .where(WalletTransaction.tx_type == TransactionType.RAKE)
+            .where(WalletTransaction.status == TransactionStatus.COMPLETED)
+            .where(WalletTransaction.created_at >= week_start)
+            .where(WalletTransaction.created_at < week_end)
+            .group_by(WalletTransaction.user_id, User.total_rake_paid_krw)
+        )
+        result = await self.session.execute(query)
+        
+        rakebacks = []
+        for user_id, rake_paid, total_rake in result.all():
+            rake_paid = int(rake_paid or 0)
+            tier = self.calculate_vip_level(total_rake or 0)
+            rakebacks.append(RakebackResult(
+                user_id=str(user_id),
+                period_start=week_start,
+                period_end=week_end,
+                rake_paid=rake_paid,
+                vip_level=tier.level,
+                rakeback_pct=tier.rakeback_pct,
+                rakeback_amount=int(Decimal(rake_paid) * tier.rakeback_pct),
+            ))
+        
+        # 체크포인트 비교와 같은 순서 (DB 정렬 규칙과 무관)
+        rakebacks.sort(key=lambda r: r.user_id)
+        return rakebacks
+    
+    async def _settle_rakeback_chunk(
+        self,
+        settlement: HandSettlementService,
+        chunk: list[RakebackResult],
+        week_start: datetime,
+        redis=None,
+    ) -> list[RakebackResult]:
+        """청크 1개 지급 + 커밋. 실패 시 사용자별로 재시도.
+        
+        Hot-path 모드에서는 원장 기록이 비동기라 `_already_paid`만으로는
+        재실행 시 중복 지급을 막을 수 없음 → 지급 전에 주차별 지급 마커를
+        HSETNX로 선점하고, 지급에 실패한 사용자만 마커를 해제.
+        """
+        payable = [r for r in chunk if r.rakeback_amount > 0]
+        already_paid = await self._already_paid(payable, week_start)
+        paid_key = f"{self.RAKEBACK_PAID_PREFIX}{week_start.date().isoformat()}"
+        claimed = await self._claim_payouts(
+            redis,
+            paid_key,
+            [r.user_id for r in payable if r.user_id not in already_paid],
+            required=settlement.hot_path,
+        )
+        already_paid.update(r.user_id for r in payable if r.user_id not in claimed)
+        to_pay = [r for r in payable if r.user_id not in already_paid]
+        entries = [
+            LedgerEntry(
+                user_id=r.user_id,
+                amount=r.rakeback_amount,
+                tx_type=TransactionType.RAKEBACK,
+                description=self._rakeback_description(r),
+            )
+            for r in to_pay
+        ]
+        
+        failed: set[str] = set()
+        try:
+            rows = await settlement.settle_hand(None, None, entries)
+            await self.session.commit()
+        except Exception as e:
+            await self.session.rollback()
+            logger.error(f"Rakeback chunk failed, retrying per user: {e}")
+            rows = []
+            for entry in entries:
+                try:
+                    rows.extend(await settlement.settle_hand(None, None, [entry]))
+                    await self.session.commit()
+                except Exception as user_error:
+                    await self.session.rollback()
+                    failed.add(entry.user_id)
+                    logger.error(
+                        f"Failed to process rakeback for user {entry.user_id}: "
+                        f"{user_error}"
+                    )
+        await self._release_payouts(redis, paid_key, failed)
+        
+        tx_ids = {row["user_id"]: row["id"] for row in rows}
+        return [
+            replace(r, transaction_id=tx_ids.get(r.user_id))
+            for r in chunk
+            if r.user_id not in failed and r.user_id not in already_paid
+        ]
+    
+    async def _already_paid(
+        self,
+        rakebacks: list[RakebackResult],
+        week_start: datetime,
+    ) -> set[str]:
+        """이미 이번 주차 레이크백을 받은 사용자 (체크포인트 유실 대비)."""
+        if not rakebacks:
+            return set()
+        result = await self.session.execute(
+            select(WalletTransaction.user_id)
+            .where(WalletTransaction.user_id.in_([r.user_id for r in rakebacks]))
+            .where(WalletTransaction.tx_type == TransactionType.RAKEBACK)
+            .where(WalletTransaction.description.like(f"{_rakeback_tag(week_start)} %"))
+        )
+        return {str(row[0]) for row in result.all()}
+    
+    async def _claim_payouts(
+        self,
+        redis,
+        key: str,
+        user_ids: list[str],
+        *,
+        required: bool,
+    ) -> set[str]:
+        """주차별 지급 마커 선점. 선점에 성공한 사용자만 반환.
+        
+        마커가 이미 있으면 지급 완료 또는 진행 중 → 건너뜀 (선점 후 지급 전
+        중단된 사용자는 재실행에서 누락되므로 로그로 대사).
+        """
+        if not user_ids:
+            return set()
+        try:
+            if redis is None:
+                raise RuntimeError("redis unavailable")
+            pipe = redis.pipeline(transaction=False)
+            for user_id in user_ids:
+                pipe.hsetnx(key, user_id, datetime.utcnow().isoformat())
+            pipe.expire(key, self.RAKEBACK_CHECKPOINT_TTL)
+            results = await pipe.execute()
+        except Exception as e:
+            if required:
+                raise
+            # 원장 동기 기록 모드: 주차 태그 조회만으로 중복 방지
+            logger.warning(f"Rakeback paid marker unavailable: {e}")
+            return set(user_ids)
+        
+        claimed = {uid for uid, ok in zip(user_ids, results) if ok}
+        skipped = len(user_ids) - len(claimed)
+        if skipped:
+            logger.warning(
+                f"Rakeback paid marker already set for {skipped} users, skipping"
+            )
+        return claimed
+    
+    async def _release_payouts(self, redis, key: str, user_ids: set[str]) -> None:
+        """지급 실패 사용자의 마커 해제 (다음 실행에서 재지급)."""
+        if redis is None or not user_ids:
+            return
+        try:
+            await redis.hdel(key, *user_ids)
+        except Exception as e:
+            logger.error(
+                f"Failed to release rakeback paid marker for {sorted(user_ids)}: {e}"
+            )
+    
+    async def _checkpoint_redis(self):
+        redis = self._redis
+        if redis is None:
+            try:
+                redis = await get_redis_client()
+            except Exception as e:
+                # 체크포인트 없이 진행 (재실행 시 주차 태그로 중복 방지)
+                logger.warning(f"Rakeback checkpoint unavailable: {e}")
+        return redis
+    
+    async def _load_checkpoint(self, redis, key: str) -> str | None:
+        if redis is None:
+            return None
+        try:
+            raw = await redis.hget(key, "last_user_id")
+        except Exception as e:
+            logger.warning(f"Rakeback checkpoint read failed: {e}")
+            return None
+        if raw is None:
+            return None
+        return raw.decode() if isinstance(raw, bytes) else raw
+    
+    async def _save_checkpoint(self, redis, key: str, last_user_id: str) -> None:
+        if redis is None:
+            return
+        try:
+            await redis.hset(
+                key,
+                mapping={
+                    "last_user_id": last_user_id,
+                    "updated_at": datetime.utcnow().isoformat(),
+                },
+            )
+            await redis.expire(key, self.RAKEBACK_CHECKPOINT_TTL)
+        except Exception as e:
+            logger.warning(f"Rakeback checkpoint write failed: {e}")
@@ -7,24 +7,33 @@ Features:
 - Distributed locking for concurrent safety
 - Full transaction logging with integrity hash
 - Redis caching for balance lookups
+- Hot-path mode: Redis 잔액이 권위 값, Lua로 원자적 차감/지급 + 비동기 저널
+  (wallet_journal.WalletJournalWriter가 Postgres에 기록)
 """
 
 from __future__ import annotations
 
 import hashlib
 import logging
+import re
+import time
+from collections.abc import Iterable
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import TYPE_CHECKING
 from uuid import uuid4
 
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import get_settings
 from app.models.user import User
 from app.models.wallet import (
     TransactionStatus,
     TransactionType,
     WalletTransaction,
 )
+from app.utils.json_utils import json_dumps
 
 if TYPE_CHECKING:
     from redis.asyncio import Redis
@@ -53,6 +62,9 @@ class InsufficientBalanceError(WalletError):
         self.required = required
 
 
+_INSUFFICIENT_RE = re.compile(r"Current=(-?\d+)")
+
+
 class WalletService:
     """Wallet service for KRW balance operations.
 
@@ -60,15 +72,24 @@ class WalletService:
     - Thread-safe balance operations using Redis distributed locks
     - Transaction logging with SHA-256 integrity hashes
     - Automatic cache invalidation on balance changes
+
+    Hot-path mode (settings.wallet_hot_path):
+    - wallet:balance:{uid} 가 TTL 없는 권위 잔액 (write-through)
+    - 차감/지급은 krw_transfer.lua 1회 호출 (잔액 확인 + 변경 + 저널 XADD 원자적)
+    - Postgres 기록은 저널 기록기가 비동기로 수행 (DB 행 잠금 대기 없음)
+    - 키가 없으면 DB 잔액 + 미반영 pending 델타로 적재 후 재시도
     """
 
     LOCK_TTL = 10  # Lock timeout in seconds
     BALANCE_CACHE_TTL = 300  # 5 minute cache for balances
     BALANCE_KEY_PREFIX = "wallet:balance:"
     LOCK_KEY_PREFIX = "wallet:lock:"
+    JOURNAL_STREAM_KEY = "wallet:journal"
+    PENDING_DELTA_KEY = "wallet:pending"
 
     # Load Lua script
     LUA_SCRIPT: str | None = None
+    SETTLE_LUA_SCRIPT: str | None = None
 
     @classmethod
     def _load_lua_script(cls) -> str:
@@ -79,10 +100,22 @@ class WalletService:
                 cls.LUA_SCRIPT = f.read()
         return cls.LUA_SCRIPT
 
-    def __init__(self, session: AsyncSession) -> None:
+    @classmethod
+    def _load_settle_lua_script(cls) -> str:
+        """Load batch settle Lua script from file."""
+        if cls.SETTLE_LUA_SCRIPT is None:
+            script_path = Path(__file__).parent.parent / "utils" / "lua_scripts" / "wallet_settle.lua"
+            with open(script_path) as f:
+                cls.SETTLE_LUA_SCRIPT = f.read()
+        return cls.SETTLE_LUA_SCRIPT
+
+    def __init__(self, session: AsyncSession, hot_path: bool | None = None) -> None:
         """Initialize wallet service."""
         self.session = session
         self._redis: Redis | None = None
+        self.hot_path = (
+            get_settings().wallet_hot_path if hot_path is None else hot_path
+        )
 
     async def _get_redis(self) -> Redis:
         """Get Redis client, initializing if needed.
@@ -135,6 +168,11 @@ class WalletService:
         except Exception as e:
             logger.warning(f"Cache read failed for user {user_id[:8]}...: {e}")
 
+        if self.hot_path:
+            # 권위 잔액 적재 (DB + pending 델타, TTL 없음)
+            loaded = await self.load_hot_balances(redis, [user_id])
+            return loaded[user_id]
+
         # Fetch from database
         user = await self.session.get(User, user_id)
         if not user:
@@ -185,6 +223,16 @@ class WalletService:
         if amount == 0:
             raise WalletError("Amount cannot be zero", code="INVALID_AMOUNT")
 
+        if self.hot_path:
+            return await self._transfer_hot(
+                user_id,
+                amount,
+                tx_type,
+                table_id=table_id,
+                hand_id=hand_id,
+                description=description,
+            )
+
         redis = await self._get_redis()
         lock_key = f"{self.LOCK_KEY_PREFIX}{user_id}"
         lock_token = str(uuid4())
@@ -282,6 +330,176 @@ class WalletService:
             except Exception as e:
                 logger.error(f"Lock release failed for user {user_id[:8]}...: {e}")
 
+    # =========================================================================
+    # Hot-path mode
+    # =========================================================================
+
+    async def _transfer_hot(
+        self,
+        user_id: str,
+        amount: int,
+        tx_type: TransactionType,
+        *,
+        table_id: str | None,
+        hand_id: str | None,
+        description: str | None,
+    ) -> WalletTransaction:
+        """Redis 권위 잔액에 원자적 차감/지급 + 저널 기록 (DB I/O 없음).
+
+        Returns:
+            저널에 기록된 거래 (세션에 추가되지 않음, 저널 기록기가 저장)
+        """
+        tx = WalletTransaction(
+            id=str(uuid4()),
+            user_id=user_id,
+            tx_type=tx_type,
+            status=TransactionStatus.COMPLETED,
+            krw_amount=amount,
+            table_id=table_id,
+            hand_id=hand_id,
+            description=description,
+            created_at=datetime.now(timezone.utc),
+        )
+        return await self.journal_transfer(tx)
+
+    async def journal_transfer(self, tx: WalletTransaction) -> WalletTransaction:
+        """미리 만든 거래를 krw_transfer.lua로 반영 (hot-path 전용).
+
+        입출금처럼 거래 행에 상태/암호화폐 필드가 필요한 경우 사용합니다.
+        거래 행은 저널 기록기가 저장하므로 세션에 추가하지 않습니다.
+
+        Raises:
+            InsufficientBalanceError: 차감액이 권위 잔액보다 큰 경우
+            WalletError: 락 경합 등 기타 오류
+        """
+        user_id = tx.user_id
+        amount = tx.krw_amount
+        tx_type = tx.tx_type
+        redis = await self._get_redis()
+        script = redis.register_script(self._load_lua_script())
+        keys = [
+            f"{self.LOCK_KEY_PREFIX}{user_id}",
+            f"{self.BALANCE_KEY_PREFIX}{user_id}",
+            "",
+            self.JOURNAL_STREAM_KEY,
+            self.PENDING_DELTA_KEY,
+        ]
+        args = [
+            str(uuid4()),
+            self.LOCK_TTL,
+            abs(amount),
+            "debit" if amount < 0 else "credit",
+            int(time.time()),
+            self.journal_payload(tx),
+            user_id,
+        ]
+
+        for attempt in range(2):
+            status, balance_after, _, message = await script(keys=keys, args=args)
+            if int(status) == 1:
+                break
+            message = message.decode() if isinstance(message, bytes) else str(message)
+            if message.startswith("COLD_BALANCE") and attempt == 0:
+                await self.load_hot_balances(redis, [user_id])
+                continue
+            if message.startswith("INSUFFICIENT_BALANCE"):
+                match = _INSUFFICIENT_RE.search(message)
+                raise InsufficientBalanceError(
+                    current=int(match.group(1)) if match else 0,
+                    required=abs(amount),
+                )
+            if message.startswith("LOCK_FAILED"):
+                raise WalletError(
+                    "Could not acquire wallet lock, try again",
+                    code="LOCK_CONTENTION",
+                )
+            raise WalletError(message)
+
+        tx.krw_balance_after = int(balance_after)
+        tx.krw_balance_before = tx.krw_balance_after - amount
+        tx.integrity_hash = self._compute_integrity_hash(
+            user_id=user_id,
+            tx_type=tx_type,
+            amount=amount,
+            balance_before=tx.krw_balance_before,
+            balance_after=tx.krw_balance_after,
+        )
+
+        logger.info(
+            "wallet_transfer",
+            extra={
+                "user_id": user_id[:8],
+                "tx_type": tx_type.value,
+                "amount": amount,
+                "balance_before": tx.krw_balance_before,
+                "balance_after": tx.krw_balance_after,
+                "hot_path": True,
+            },
+        )
+        return tx
+
+    async def load_hot_balances(
+        self,
+        redis: Redis,
+        user_ids: Iterable[str],
+    ) -> dict[str, int]:
+        """권위 잔액 키 적재 (없는 키만, DB 잔액 + 미반영 pending 델타).
+
+        저널 기록기가 아직 DB에 반영하지 않은 변동은 pending 해시에 남아
+        있으므로, 키가 유실돼도 DB + pending으로 정확한 잔액을 복원합니다.
+
+        Returns:
+            user_id → 현재 권위 잔액
+        """
+        ids = sorted(set(user_ids))
+        result = await self.session.execute(
+            select(User.id, User.krw_balance).where(User.id.in_(ids))
+        )
+        db_balances = {str(uid): balance for uid, balance in result.all()}
+        missing = [uid for uid in ids if uid not in db_balances]
+        if missing:
+            raise WalletError(f"User not found: {missing[0]}", code="USER_NOT_FOUND")
+
+        pending = await redis.hmget(self.PENDING_DELTA_KEY, ids)
+        pipe = redis.pipeline(transaction=False)
+        for uid, delta in zip(ids, pending):
+            balance = db_balances[uid] + int(delta or 0)
+            pipe.set(f"{self.BALANCE_KEY_PREFIX}{uid}", balance, nx=True)
+        for uid in ids:
+            pipe.get(f"{self.BALANCE_KEY_PREFIX}{uid}")
+        results = await pipe.execute()
+        return {uid: int(value) for uid, value in zip(ids, results[len(ids):])}
+
+    @staticmethod
+    def journal_payload(tx: WalletTransaction) -> str:
+        """저널 엔트리 본문 (잔액 전/후는 Lua가 별도 필드로 추가).
+
+        입출금 거래는 상태/암호화폐 필드도 함께 기록 (게임 거래는 생략).
+        """
+        payload = {
+            "id": tx.id,
+            "user_id": tx.user_id,
+            "tx_type": tx.tx_type.value,
+            "amount": tx.krw_amount,
+            "table_id": tx.table_id,
+            "hand_id": tx.hand_id,
+            "description": tx.description,
+            "created_at": tx.created_at.isoformat(),
+        }
+        if tx.status is not None and tx.status != TransactionStatus.COMPLETED:
+            payload["status"] = tx.status.value
+        if tx.crypto_type is not None:
+            payload.update({
+                "crypto_type": tx.crypto_type.value,
+                "crypto_amount": tx.crypto_amount,
+                "crypto_tx_hash": tx.crypto_tx_hash,
+                "crypto_address": tx.crypto_address,
+                "exchange_rate_krw": tx.exchange_rate_krw,
+            })
+        if tx.withdrawal_requested_at is not None:
+            payload["withdrawal_requested_at"] = tx.withdrawal_requested_at.isoformat()
+        return json_dumps(payload)
+
     async def buy_in(
         self,
         user_id: str,
@@ -385,9 +603,11 @@ class WalletService:
             return None  # No rake to deduct
 
         # Also update total_rake_paid for VIP calculation
-        user = await self.session.get(User, user_id)
-        if user:
-            user.total_rake_paid_krw += amount
+        # (hot-path 모드에서는 저널 기록기가 RAKE 엔트리로 반영)
+        if not self.hot_path:
+            user = await self.session.get(User, user_id)
+            if user:
+                user.total_rake_paid_krw += amount
 
         return await self.transfer_krw(
             user_id=user_id,
@@ -0,0 +1,326 @@
+"""Wallet Journal - hot-path 지갑 모드의 비동기 Postgres 기록 + 정합성 검사.
+
+hot-path 모드(settings.wallet_hot_path)에서는 Redis 잔액이 권위 값이고,
+krw_transfer.lua / wallet_settle.lua가 잔액 변경과 함께 저널 스트림
+(wallet:journal)에 엔트리를 추가하고 사용자별 미반영 델타(wallet:pending)를
+올립니다.
+
+저널 기록기 (WalletJournalWriter):
+    XREADGROUP (소비자 그룹) → wallet_transactions INSERT ON CONFLICT DO NOTHING
+    → 새로 기록된 엔트리만 users 잔액/누적 레이크 반영 → COMMIT
+    → MULTI { pending 델타 차감, XACK, XDEL }
+
+    DB 기록은 거래 id로 멱등이고, pending 차감과 ACK는 한 트랜잭션이므로
+    커밋 직후 중단돼도 재처리 시 잔액이 두 번 반영되지 않습니다.
+    다른 인스턴스가 중단되며 남긴 미ACK 엔트리는 XAUTOCLAIM으로 가져옵니다.
+
+정합성 검사 (reconcile_balances):
+    Redis 잔액 == DB 잔액 + pending 델타
+    기록기 커밋과 pending 차감 사이 순간 불일치를 제외하려고 두 번 연속
+    어긋난 사용자만 드리프트로 보고합니다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Callable
+from uuid import uuid4
+
+from sqlalchemy import bindparam, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.models.user import User
+from app.models.wallet import (
+    CryptoType,
+    TransactionStatus,
+    TransactionType,
+    WalletTransaction,
+)
+from app.services.wallet import WalletService
+from app.utils.json_utils import json_loads
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_GROUP = "wallet-journal-writers"
+
+
+def _text(value: Any) -> str:
+    return value.decode() if isinstance(value, bytes) else value
+
+
+def _field(fields: dict, name: str) -> str:
+    value = fields.get(name)
+    if value is None:
+        value = fields.get(name.encode())
+    return _text(value)
+
+
+class WalletJournalWriter:
+    """저널 스트림 → Postgres 기록기 (인스턴스마다 1개 소비자)."""
+
+    CLAIM_IDLE_MS = 60_000  # 이 시간 이상 ACK 안 된 엔트리는 중단된 소비자로 간주
+
+    def __init__(
+        self,
+        redis: "Redis",
+        session_factory: Callable[[], Any],
+        *,
+        batch_size: int = 500,
+        block_ms: int = 1000,
+        consumer: str | None = None,
+    ) -> None:
+        self._redis = redis
+        self._session_factory = session_factory
+        self._batch_size = batch_size
+        self._block_ms = block_ms
+        self._consumer = consumer or f"writer-{uuid4().hex[:8]}"
+        self._task: asyncio.Task | None = None
+        self._running = False
+
+    async def start(self) -> None:
+        await self._ensure_group()
+        self._running = True
+        self._task = asyncio.create_task(self._run())
+        logger.info(f"Wallet journal writer started (consumer={self._consumer})")
+
+    async def stop(self) -> None:
+        self._running = False
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        # 남은 엔트리 기록 시도 (실패 시 다른 인스턴스가 XAUTOCLAIM)
+        try:
+            while await self.drain_once(block_ms=None):
+                pass
+        except Exception as e:
+            logger.warning(f"Wallet journal final drain failed: {e}")
+
+    async def _ensure_group(self) -> None:
+        try:
+            await self._redis.xgroup_create(
+                WalletService.JOURNAL_STREAM_KEY, JOURNAL_GROUP, id="0", mkstream=True
+            )
+        except Exception as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    async def _run(self) -> None:
+        while self._running:
+            try:
+                await self.drain_once(block_ms=self._block_ms)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Wallet journal writer error: {e}")
+                await asyncio.sleep(1)
+
+    async def drain_once(self, block_ms: int | None = None) -> int:
+        """엔트리 1배치 기록. 처리한 엔트리 수 반환."""
+        entries = await self._claim_stale()
+        if not entries:
+            response = await self._redis.xreadgroup(
+                JOURNAL_GROUP,
+                self._consumer,
+                {WalletService.JOURNAL_STREAM_KEY: ">"},
+                count=self._batch_size,
+                block=block_ms,
+            )
+            entries = response[0][1] if response else []
+        if not entries:
+            return 0
+        await self.apply(entries)
+        return len(entries)
+
+    async def _claim_stale(self) -> list:
+        result = await self._redis.xautoclaim(
+            WalletService.JOURNAL_STREAM_KEY,
+            JOURNAL_GROUP,
+            self._consumer,
+            min_idle_time=self.CLAIM_IDLE_MS,
+            start_id="0-0",
+            count=self._batch_size,
+        )
+        return [entry for entry in result[1] if entry[1]]
+
+    async def apply(self, entries: list[tuple[Any, dict]]) -> None:
+        """엔트리 기록 + 잔액 반영 후 pending 차감/ACK."""
+        rows = []
+        for _, fields in entries:
+            tx = json_loads(_field(fields, "tx"))
+            tx_type = TransactionType(tx["tx_type"])
+            before = int(_field(fields, "before"))
+            after = int(_field(fields, "after"))
+            crypto_type = tx.get("crypto_type")
+            requested_at = tx.get("withdrawal_requested_at")
+            rows.append({
+                "id": tx["id"],
+                "user_id": tx["user_id"],
+                "tx_type": tx_type,
+                "status": TransactionStatus(tx.get("status", "completed")),
+                "krw_amount": tx["amount"],
+                "krw_balance_before": before,
+                "krw_balance_after": after,
+                "table_id": tx.get("table_id"),
+                "hand_id": tx.get("hand_id"),
+                "description": tx.get("description"),
+                "crypto_type": CryptoType(crypto_type) if crypto_type else None,
+                "crypto_amount": tx.get("crypto_amount"),
+                "crypto_tx_hash": tx.get("crypto_tx_hash"),
+                "crypto_address": tx.get("crypto_address"),
+                "exchange_rate_krw": tx.get("exchange_rate_krw"),
+                "withdrawal_requested_at": (
+                    datetime.fromisoformat(requested_at) if requested_at else None
+                ),
+                "created_at": datetime.fromisoformat(tx["created_at"]),
+                "integrity_hash": WalletService._compute_integrity_hash(
+                    user_id=tx["user_id"],
+                    tx_type=tx_type,
+                    amount=tx["amount"],
+                    balance_before=before,
+                    balance_after=after,
+                ),
+            })
+
+        async with self._session_factory() as session:
+            result = await session.execute(
+                pg_insert(WalletTransaction)
+                .values(rows)
+                .on_conflict_do_nothing(index_elements=["id"])
+                .returning(WalletTransaction.id)
+            )
+            inserted = {str(tx_id) for tx_id in result.scalars().all()}
+
+            deltas: dict[str, int] = defaultdict(int)
+            rake: dict[str, int] = defaultdict(int)
+            for row in rows:
+                if row["id"] not in inserted:
+                    continue  # 이전 시도에서 이미 기록됨
+                deltas[row["user_id"]] += row["krw_amount"]
+                if row["tx_type"] == TransactionType.RAKE:
+                    rake[row["user_id"]] += -row["krw_amount"]
+            if deltas:
+                users = User.__table__
+                await session.execute(
+                    update(users)
+                    .where(users.c.id == bindparam("b_id"))
+                    .values(
+                        krw_balance=users.c.krw_balance + bindparam("b_delta"),
+                        total_rake_paid_krw=users.c.total_rake_paid_krw + bindparam("b_rake"),
+                    ),
+                    [
+                        {"b_id": uid, "b_delta": delta, "b_rake": rake[uid]}
+                        for uid, delta in sorted(deltas.items())
+                    ],
+                )
+            await session.commit()
+
+        # pending 차감과 ACK는 원자적으로 (ACK된 엔트리 = 차감된 엔트리)
+        pipe = self._redis.pipeline(transaction=True)
+        for row in rows:
+            pipe.hincrby(WalletService.PENDING_DELTA_KEY, row["user_id"], -row["krw_amount"])
+        ids = [entry_id for entry_id, _ in entries]
+        pipe.xack(WalletService.JOURNAL_STREAM_KEY, JOURNAL_GROUP, *ids)
+        pipe.xdel(WalletService.JOURNAL_STREAM_KEY, *ids)
+        await pipe.execute()
+
+
+# ============================================================================
+# Reconciliation
+# ============================================================================
+
+
+@dataclass(frozen=True)
+class BalanceDrift:
+    """권위 Redis 잔액과 DB(+미반영 델타)의 불일치."""
+
+    user_id: str
+    redis_balance: int
+    db_balance: int
+    pending: int
+
+    @property
+    def drift(self) -> int:
+        return self.redis_balance - (self.db_balance + self.pending)
+
+
+async def _check_balances(
+    redis: "Redis",
+    session: "AsyncSession",
+    user_ids: list[str],
+) -> list[BalanceDrift]:
+    pipe = redis.pipeline(transaction=True)
+    pipe.mget([f"{WalletService.BALANCE_KEY_PREFIX}{uid}" for uid in user_ids])
+    pipe.hmget(WalletService.PENDING_DELTA_KEY, user_ids)
+    balances, pending = await pipe.execute()
+
+    result = await session.execute(
+        select(User.id, User.krw_balance).where(User.id.in_(user_ids))
+    )
+    db_balances = {str(uid): balance for uid, balance in result.all()}
+
+    drifts = []
+    for uid, balance, delta in zip(user_ids, balances, pending):
+        if balance is None:
+            continue  # 적재 전 (다음 사용 시 DB + pending으로 적재)
+        drift = BalanceDrift(
+            user_id=uid,
+            redis_balance=int(balance),
+            db_balance=db_balances.get(uid, 0),
+            pending=int(delta or 0),
+        )
+        if drift.drift != 0:
+            drifts.append(drift)
+    return drifts
+
+
+async def reconcile_balances(
+    redis: "Redis",
+    session: "AsyncSession",
+    *,
+    batch_size: int = 500,
+    confirm_delay: float = 0.5,
+) -> list[BalanceDrift]:
+    """권위 잔액 키 전체를 DB + pending 델타와 비교.
+
+    Returns:
+        두 번 연속 불일치한 사용자 목록 (자동 보정하지 않음)
+    """
+    suspects: list[str] = []
+    batch: list[str] = []
+    async for key in redis.scan_iter(
+        match=f"{WalletService.BALANCE_KEY_PREFIX}*", count=batch_size
+    ):
+        batch.append(_text(key)[len(WalletService.BALANCE_KEY_PREFIX):])
+        if len(batch) >= batch_size:
+            suspects += [d.user_id for d in await _check_balances(redis, session, batch)]
+            batch = []
+    if batch:
+        suspects += [d.user_id for d in await _check_balances(redis, session, batch)]
+
+    if not suspects:
+        return []
+
+    await asyncio.sleep(confirm_delay)
+    drifts = []
+    for start in range(0, len(suspects), batch_size):
+        drifts += await _check_balances(redis, session, suspects[start:start + batch_size])
+
+    for drift in drifts:
+        logger.error(
+            f"Wallet balance drift: user={drift.user_id[:8]}... "
+            f"redis={drift.redis_balance:,} db={drift.db_balance:,} "
+            f"pending={drift.pending:,} drift={drift.drift:,}"
+        )
+    return drifts
@@ -60,24 +60,11 @@ async def _process_weekly_rakeback(week_start: datetime | None = None) -> dict:
     Returns:
         Summary dict with results
     """
-    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-    from sqlalchemy.orm import sessionmaker
-    
-    from app.config import get_settings
     from app.services.vip import VIPService
-    
-    settings = get_settings()
-    
-    # Create async engine and session
-    engine = create_async_engine(settings.database_url)
-    async_session = sessionmaker(
-        engine,
-        class_=AsyncSession,
-        expire_on_commit=False,
-    )
+    from app.utils.db import async_session_factory
     
     try:
-        async with async_session() as session:
+        async with async_session_factory() as session:
             vip_service = VIPService(session)
             
             results = await vip_service.process_weekly_rakeback_all(
@@ -108,14 +95,9 @@ async def _process_weekly_rakeback(week_start: datetime | None = None) -> dict:
             }
             
     except Exception as e:
+        # 재시도(autoretry)는 체크포인트 이후부터 재개
         logger.error(f"Weekly rakeback settlement failed: {e}")
-        return {
-            "status": "error",
-            "error": str(e),
-            "processed_at": datetime.utcnow().isoformat(),
-        }
-    finally:
-        await engine.dispose()
+        raise
 
 
 @celery_app.task(
@@ -149,23 +131,11 @@ async def _process_user_rakeback(
     week_start: datetime | None = None,
 ) -> dict:
     """Process rakeback for a single user (async implementation)."""
-    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-    from sqlalchemy.orm import sessionmaker
-    
-    from app.config import get_settings
     from app.services.vip import VIPService
-    
-    settings = get_settings()
-    
-    engine = create_async_engine(settings.database_url)
-    async_session = sessionmaker(
-        engine,
-        class_=AsyncSession,
-        expire_on_commit=False,
-    )
+    from app.utils.db import async_session_factory
     
     try:
-        async with async_session() as session:
+        async with async_session_factory() as session:
             vip_service = VIPService(session)
             
             # Calculate rakeback
@@ -195,5 +165,3 @@ async def _process_user_rakeback(
             "user_id": user_id,
             "error": str(e),
         }
-    finally:
-        await engine.dispose()
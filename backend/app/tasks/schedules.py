@@ -25,6 +25,13 @@ CELERY_BEAT_SCHEDULE = {
         "options": {"queue": "fraud"},
     },
 
+    # Wallet hot-path reconciliation (Redis vs Postgres + journal)
+    "wallet-reconcile-10min": {
+        "task": "app.tasks.wallet.reconcile_wallet_balances_task",
+        "schedule": crontab(minute="*/10"),
+        "options": {"queue": "settlement"},
+    },
+
     # ==========================================================================
     # Hourly Tasks
     # ==========================================================================
@@ -0,0 +1,66 @@
+"""Wallet maintenance tasks.
+
+Hot-path 지갑 모드(settings.wallet_hot_path)의 Redis 권위 잔액과
+Postgres 잔액(+ 저널 미반영 델타) 간 드리프트를 주기적으로 검사합니다.
+
+Tasks:
+- reconcile_wallet_balances_task: 10분마다 정합성 검사
+"""
+
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any
+
+from app.tasks.celery_app import celery_app
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task(
+    name="app.tasks.wallet.reconcile_wallet_balances_task",
+    bind=True,
+    max_retries=3,
+    default_retry_delay=60,
+)
+def reconcile_wallet_balances_task(self) -> dict[str, Any]:
+    """Redis 권위 잔액 정합성 검사 태스크 (10분마다).
+
+    Returns:
+        검사 결과 요약 (드리프트 사용자 목록 포함)
+    """
+    try:
+        return asyncio.run(_run_reconciliation())
+    except Exception as exc:
+        logger.error(f"Wallet reconciliation failed: {exc}")
+        raise self.retry(exc=exc)
+
+
+async def _run_reconciliation() -> dict[str, Any]:
+    from app.config import get_settings
+    from app.services.wallet_journal import reconcile_balances
+    from app.utils.db import async_session_factory
+    from app.utils.redis_client import get_redis_client
+
+    if not get_settings().wallet_hot_path:
+        return {"status": "skipped", "reason": "hot_path_disabled"}
+
+    redis = await get_redis_client()
+    async with async_session_factory() as session:
+        drifts = await reconcile_balances(redis, session)
+
+    return {
+        "status": "drift" if drifts else "ok",
+        "drift_count": len(drifts),
+        "drifts": [
+            {
+                "user_id": d.user_id,
+                "redis_balance": d.redis_balance,
+                "db_balance": d.db_balance,
+                "pending": d.pending,
+                "drift": d.drift,
+            }
+            for d in drifts
+        ],
+        "checked_at": datetime.utcnow().isoformat(),
+    }
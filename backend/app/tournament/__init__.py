@@ -25,6 +25,13 @@ from .ranking import RankingEngine
 from .event_bus import TournamentEventBus
 from .snapshot import SnapshotManager
 from .admin import TournamentAdminController
+from .sharding import (
+    ShardAssignment,
+    TableShardWorker,
+    TournamentShardCoordinator,
+    TournamentShardRuntime,
+    TableNotOwnedError,
+)
 from .blind_scheduler import (
     BlindScheduler,
     BlindSchedule,
@@ -48,6 +55,12 @@ __all__ = [
     "TournamentEventBus",
     "SnapshotManager",
     "TournamentAdminController",
+    # Sharded execution
+    "ShardAssignment",
+    "TableShardWorker",
+    "TournamentShardCoordinator",
+    "TournamentShardRuntime",
+    "TableNotOwnedError",
     # Blind Scheduler
     "BlindScheduler",
     "BlindSchedule",
@@ -135,6 +135,7 @@ class HandCompleteRequest(BaseModel):
     winners: List[str] = Field(default_factory=list)
     chip_changes: Dict[str, int] = Field(default_factory=dict)
     eliminated: List[str] = Field(default_factory=list)
+    button_position: Optional[int] = None  # 이번 핸드의 딜러 버튼 좌석
 
 
 # =============================================================================
@@ -407,6 +408,7 @@ async def complete_hand(
             request.winners,
             request.chip_changes,
             request.eliminated,
+            button_position=request.button_position,
         )
         return TournamentResponse(**state.to_dict())
     except ValueError as e:
@@ -11,7 +11,7 @@ Table Balancing Algorithm.
 4. Breaking Table 우선 (큰 테이블보다 작은 테이블 해체)
 """
 
-import asyncio
+import heapq
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -26,6 +26,9 @@ from .models import (
     TournamentEventType,
 )
 
+# (table_id, player_count, button_position, hand_in_progress) per table
+TableSignature = Tuple[Tuple[str, int, Optional[int], bool], ...]
+
 
 class BalancingPriority(Enum):
     """Balancing urgency levels."""
@@ -125,9 +128,9 @@ class TableBalancer:
     ─────────────────────────────────────────────────────────────────
 
     최적화:
-    - O(n log n) 정렬 기반 알고리즘
-    - 최소 이동 계산 (그리디 접근)
-    - 연속 이동 배치 처리
+    - O(T log T) 정렬 한 번으로 목표 인원 배정 (T = 테이블 수)
+    - 과잉/부족 테이블 단일 패스 매칭 (최소 이동 보장)
+    - 테이블 인원 구성이 바뀐 토너먼트만 재계산 (get_plan 캐시)
     """
 
     def __init__(
@@ -143,6 +146,42 @@ class TableBalancer:
         # Pending moves (waiting for hand completion)
         self._pending_moves: Dict[str, List[PlayerMove]] = {}  # table_id -> moves
 
+        # Last plan per tournament, keyed by table signature
+        self._plan_cache: Dict[str, Tuple[TableSignature, BalancingPlan]] = {}
+
+    def get_plan(self, state: TournamentState) -> BalancingPlan:
+        """
+        Return the balancing plan, recomputing only when the tables changed.
+
+        밸런싱 루프는 매 틱마다 모든 토너먼트를 검사하지만, 테이블별 인원·
+        버튼 위치·핸드 진행 여부가 직전 계획과 같다면 캐시된 계획을 그대로
+        반환한다. (이동/탈락/테이블 생성·해체/핸드 종료 시 재계산)
+        """
+        signature = self._table_signature(state)
+        cached = self._plan_cache.get(state.tournament_id)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        plan = self.calculate_balancing_plan(state)
+        self._plan_cache[state.tournament_id] = (signature, plan)
+        return plan
+
+    def invalidate(self, tournament_id: str) -> None:
+        """Drop the cached plan for a tournament."""
+        self._plan_cache.pop(tournament_id, None)
+
+    @staticmethod
+    def _table_signature(state: TournamentState) -> TableSignature:
+        return tuple(
+            (
+                table_id,
+                table.player_count,
+                table.button_position,
+                table.hand_in_progress,
+            )
+            for table_id, table in state.tables.items()
+        )
+
     def calculate_balancing_plan(
         self,
         state: TournamentState,
@@ -158,14 +197,15 @@ class TableBalancer:
         - 전체 활성 플레이어 수 확인
         - 이상적인 테이블 수 계산
 
-        Step 2: 필요한 이동 계산
-        - 평균 인원에서 ±1 범위를 타겟으로 설정
-        - 과잉 테이블에서 부족 테이블로 이동
-        - 테이블 해체가 필요한 경우 처리
+        Step 2: 목표 인원 배정 (O(T log T))
+        - 목표 인원은 평균 또는 평균+1
+        - +1 슬롯은 현재 인원이 많은 테이블부터 배정
+          (동률이면 핸드 진행 중인 테이블 우선 → 진행 중 테이블 이동 최소화)
+        - 이 배정에서 Σ max(0, 현재 - 목표)가 최소 이동 수
 
-        Step 3: 이동 순서 결정
-        - 핸드 진행 중인 테이블은 나중에 처리
-        - 해체 테이블의 플레이어는 먼저 이동
+        Step 3: 이동 매칭
+        - 과잉/부족 테이블을 한 번씩 순회하며 1:1 매칭
+        - 블라인드 공정성을 고려하여 이동 대상/좌석 선택
 
         ─────────────────────────────────────────────────────────────
 
@@ -199,18 +239,6 @@ class TableBalancer:
             plan.priority = BalancingPriority.CRITICAL
             return self._plan_final_table(state, plan)
 
-        # Calculate ideal distribution
-        # 목표: 모든 테이블이 ±1 범위 내의 플레이어 수 유지
-        num_tables = len(tables)
-        ideal_per_table = total_players // num_tables
-        remainder = total_players % num_tables
-
-        # Ideal counts: some tables have +1
-        ideal_counts = {
-            table.table_id: ideal_per_table + (1 if i < remainder else 0)
-            for i, table in enumerate(tables)
-        }
-
         # Check if any table needs breaking (too few players)
         tables_to_break = [
             t.table_id
@@ -241,11 +269,26 @@ class TableBalancer:
         else:
             plan.priority = BalancingPriority.LOW
 
-        # Calculate moves needed
-        # 그리디 알고리즘: 가장 많은 테이블 -> 가장 적은 테이블로 이동
-        moves = self._calculate_minimum_moves(state, table_counts, ideal_counts)
-        plan.moves = moves
+        # Calculate ideal distribution
+        # 목표: 모든 테이블이 ±1 범위 내의 플레이어 수 유지
+        num_tables = len(tables)
+        ideal_per_table = total_players // num_tables
+        remainder = total_players % num_tables
 
+        ranked = sorted(
+            tables,
+            key=lambda t: (
+                -table_counts[t.table_id],
+                not t.hand_in_progress,
+                t.table_number,
+            ),
+        )
+        ideal_counts = {
+            table.table_id: ideal_per_table + (1 if i < remainder else 0)
+            for i, table in enumerate(ranked)
+        }
+
+        plan.moves = self._calculate_minimum_moves(state, table_counts, ideal_counts)
         return plan
 
     def _calculate_minimum_moves(
@@ -257,22 +300,22 @@ class TableBalancer:
         """
         Calculate minimum number of moves to balance tables.
 
-        그리디 알고리즘:
+        단일 패스 매칭:
         ─────────────────────────────────────────────────────────────
 
-        1. 과잉/부족 테이블 분류
+        1. 과잉/부족 테이블 분류 (테이블당 1회)
            - surplus: 현재 > 목표 (플레이어 내보내야 함)
            - deficit: 현재 < 목표 (플레이어 받아야 함)
+           - 핸드가 없는 과잉 테이블을 앞에 두어 즉시 실행 가능한
+             이동이 먼저 나오도록 정렬
 
-        2. 매칭
-           - surplus 테이블에서 플레이어 선택
-           - deficit 테이블의 빈 좌석으로 배치
-           - 양쪽이 균형에 도달할 때까지 반복
+        2. 두 포인터 매칭
+           - Σ surplus == Σ deficit 이므로 각 이동이 정확히
+             과잉 1명을 해소하고 부족 1석을 채움 → 이동 수 최소
 
-        3. 플레이어 선택 기준:
-           - Big Blind 직후 위치 우선 (포지션 손실 최소화)
-           - 최근 이동하지 않은 플레이어 우선
-           - 동일 조건 시 랜덤 선택
+        3. 플레이어/좌석 선택 기준:
+           - 다음 핸드 빅블라인드 플레이어부터 이동
+           - 도착 테이블에서는 빅블라인드를 가장 빨리 내는 좌석 배정
 
         ─────────────────────────────────────────────────────────────
 
@@ -281,65 +324,120 @@ class TableBalancer:
         """
         moves: List[PlayerMove] = []
 
-        # Make mutable copies
-        counts = current_counts.copy()
+        surplus: List[Tuple[TournamentTable, int]] = []
+        deficit: List[Tuple[TournamentTable, int]] = []
+        for table_id, count in current_counts.items():
+            table = state.tables.get(table_id)
+            if table is None:
+                continue
+            diff = count - ideal_counts[table_id]
+            if diff > 0:
+                surplus.append((table, diff))
+            elif diff < 0:
+                deficit.append((table, -diff))
+
+        surplus.sort(key=lambda item: (item[0].hand_in_progress, -item[1]))
+
+        dest_iter = iter(deficit)
+        to_table: Optional[TournamentTable] = None
+        dest_seats: List[int] = []
+        to_remaining = 0
+
+        for from_table, excess in surplus:
+            candidates = self._players_in_move_order(state, from_table)
+            for player in candidates[:excess]:
+                if to_remaining == 0:
+                    next_deficit = next(dest_iter, None)
+                    if next_deficit is None:
+                        return moves
+                    to_table, to_remaining = next_deficit
+                    dest_seats = self._seats_in_fill_order(to_table)
+
+                if not dest_seats or to_table is None:
+                    return moves
+
+                moves.append(
+                    PlayerMove(
+                        user_id=player.user_id,
+                        from_table_id=from_table.table_id,
+                        from_seat=player.seat_position or 0,
+                        to_table_id=to_table.table_id,
+                        to_seat=dest_seats.pop(0),
+                        execute_after_hand=from_table.hand_in_progress,
+                    )
+                )
+                to_remaining -= 1
 
-        # Identify surplus and deficit tables
-        surplus_tables = [
-            tid for tid, count in counts.items() if count > ideal_counts[tid]
-        ]
-        deficit_tables = [
-            tid for tid, count in counts.items() if count < ideal_counts[tid]
-        ]
+        return moves
 
-        while surplus_tables and deficit_tables:
-            # Sort by surplus/deficit amount
-            surplus_tables.sort(key=lambda t: counts[t], reverse=True)
-            deficit_tables.sort(key=lambda t: counts[t])
+    @staticmethod
+    def _clockwise(start: int, size: int) -> List[int]:
+        """Seat indices clockwise from ``start`` (inclusive)."""
+        return [(start + i) % size for i in range(size)]
 
-            from_table_id = surplus_tables[0]
-            to_table_id = deficit_tables[0]
+    def _players_in_move_order(
+        self,
+        state: TournamentState,
+        table: TournamentTable,
+    ) -> List[TournamentPlayer]:
+        """
+        Order a table's players by who should be moved first.
 
-            from_table = state.tables.get(from_table_id)
-            to_table = state.tables.get(to_table_id)
+        선택 기준 (우선순위):
+        ─────────────────────────────────────────────────────────────
 
-            if not from_table or not to_table:
-                break
+        1. 다음 핸드에서 빅블라인드를 낼 플레이어
+           - 버튼 다음 좌석부터: [다음 버튼, SB, BB, UTG, ...]
+           - BB 플레이어부터 이동 → 블라인드 회피/중복 부담 방지
 
-            # Select player to move
-            player_to_move = self._select_player_to_move(state, from_table)
-            if not player_to_move:
-                surplus_tables.remove(from_table_id)
-                continue
+        2. 버튼 정보가 없으면 높은 좌석 번호부터 (기존 동작)
 
-            # Select destination seat
-            dest_seat = self._select_destination_seat(to_table)
-            if dest_seat is None:
-                deficit_tables.remove(to_table_id)
+        ─────────────────────────────────────────────────────────────
+        """
+        size = len(table.seats)
+        if table.button_position is None or size == 0:
+            order = range(size - 1, -1, -1)
+        else:
+            occupied = [
+                s
+                for s in self._clockwise(table.button_position + 1, size)
+                if table.seats[s] is not None
+            ]
+            order = occupied[2:] + occupied[:2]
+
+        players: List[TournamentPlayer] = []
+        for seat in order:
+            user_id = table.seats[seat]
+            if not user_id:
                 continue
+            player = state.players.get(user_id)
+            if player and player.is_active:
+                players.append(player)
+        return players
 
-            # Create move
-            move = PlayerMove(
-                user_id=player_to_move.user_id,
-                from_table_id=from_table_id,
-                from_seat=player_to_move.seat_position or 0,
-                to_table_id=to_table_id,
-                to_seat=dest_seat,
-                execute_after_hand=from_table.hand_in_progress,
-            )
-            moves.append(move)
-
-            # Update counts
-            counts[from_table_id] -= 1
-            counts[to_table_id] += 1
-
-            # Check if tables are now balanced
-            if counts[from_table_id] <= ideal_counts[from_table_id]:
-                surplus_tables.remove(from_table_id)
-            if counts[to_table_id] >= ideal_counts[to_table_id]:
-                deficit_tables.remove(to_table_id)
+    def _seats_in_fill_order(self, table: TournamentTable) -> List[int]:
+        """
+        Order a table's empty seats by which should be filled first.
 
-        return moves
+        - 버튼 정보가 있으면 다음 핸드 SB 바로 뒤 좌석부터 시계 방향
+          (빅블라인드를 가장 먼저 내는 좌석 → 블라인드 없이 참여 방지)
+        - 없으면 가장 낮은 번호부터 (일관성)
+        """
+        size = min(len(table.seats), self.max_players)
+        empty = [s for s in table.empty_seats if s < size]
+        if table.button_position is None or not empty:
+            return empty
+
+        occupied = [
+            s
+            for s in self._clockwise(table.button_position + 1, len(table.seats))
+            if table.seats[s] is not None
+        ]
+        start = occupied[1] + 1 if len(occupied) >= 2 else table.button_position + 1
+        empty_set = set(empty)
+        return [
+            s for s in self._clockwise(start, len(table.seats)) if s in empty_set
+        ]
 
     def _select_player_to_move(
         self,
@@ -349,39 +447,11 @@ class TableBalancer:
         """
         Select best player to move from table.
 
-        선택 기준 (우선순위):
-        ─────────────────────────────────────────────────────────────
-
-        1. 빅블라인드 직후 위치 (다음 핸드 손실 최소)
-           - BB 위치 다음 시트의 플레이어 선택
-           - "스몰 블라인드 건너뛰기" 방지
-
-        2. 스택 크기 고려 (선택적)
-           - 중간 스택 플레이어 우선 (빅/숏스택 보호)
-
-        3. 최근 이동 이력 확인
-           - 연속 이동 방지 (플레이어 경험 고려)
-
-        ─────────────────────────────────────────────────────────────
-
         Returns:
             TournamentPlayer to move, or None if no suitable player
         """
-        seated_players: List[TournamentPlayer] = []
-
-        for seat_idx, user_id in enumerate(table.seats):
-            if user_id:
-                player = state.players.get(user_id)
-                if player and player.is_active:
-                    seated_players.append(player)
-
-        if not seated_players:
-            return None
-
-        # For now, select the player in the highest seat position
-        # (simplified - in production, would use button position)
-        seated_players.sort(key=lambda p: p.seat_position or 0, reverse=True)
-        return seated_players[0]
+        players = self._players_in_move_order(state, table)
+        return players[0] if players else None
 
     def _select_destination_seat(
         self,
@@ -390,17 +460,11 @@ class TableBalancer:
         """
         Select best seat for incoming player.
 
-        선택 기준:
-        - 빈 좌석 중 가장 낮은 번호 (일관성)
-        - 향후: 딜러 버튼 위치 고려하여 공정한 포지션 배정
-
         Returns:
             Seat position, or None if no empty seats
         """
-        empty = table.empty_seats
-        if not empty:
-            return None
-        return min(empty)
+        seats = self._seats_in_fill_order(table)
+        return seats[0] if seats else None
 
     def _plan_table_break(
         self,
@@ -415,13 +479,14 @@ class TableBalancer:
         ─────────────────────────────────────────────────────────────
 
         1. 해체 테이블의 모든 플레이어 목록화
-        2. 다른 테이블들의 빈 좌석 목록화
-        3. 플레이어를 균등하게 분배
-        4. 불가능한 경우 (빈 좌석 부족) 에러 반환
+        2. 남은 테이블을 (인원, 테이블 번호) 최소 힙으로 관리
+        3. 플레이어마다 가장 적은 테이블에 배치 후 인원 갱신 (O(P log T))
+        4. 빈 좌석이 없는 테이블은 힙에서 제외
 
         ─────────────────────────────────────────────────────────────
         """
         moves: List[PlayerMove] = []
+        breaking = set(tables_to_break)
 
         # Get all players from tables to break
         players_to_move: List[Tuple[str, TournamentPlayer]] = []
@@ -429,51 +494,41 @@ class TableBalancer:
             table = state.tables.get(table_id)
             if not table:
                 continue
+            for player in self._players_in_move_order(state, table):
+                players_to_move.append((table_id, player))
+
+        # Fill smaller tables first
+        heap: List[Tuple[int, int, str]] = []
+        free_seats: Dict[str, List[int]] = {}
+        for table in state.tables.values():
+            if table.table_id in breaking:
+                continue
+            seats = self._seats_in_fill_order(table)
+            if seats and table.player_count < self.max_players:
+                free_seats[table.table_id] = seats
+                heap.append((table.player_count, table.table_number, table.table_id))
+        heapq.heapify(heap)
 
-            for user_id in table.seats:
-                if user_id:
-                    player = state.players.get(user_id)
-                    if player and player.is_active:
-                        players_to_move.append((table_id, player))
-
-        # Get available tables and their empty seats
-        available_tables = [
-            t for t in state.tables.values() if t.table_id not in tables_to_break
-        ]
-
-        # Sort by player count ascending (fill smaller tables first)
-        available_tables.sort(key=lambda t: t.player_count)
-
-        # Distribute players
-        table_idx = 0
         for source_table_id, player in players_to_move:
-            # Find next table with available seat
-            attempts = 0
-            while attempts < len(available_tables):
-                target_table = available_tables[table_idx % len(available_tables)]
-                empty_seats = target_table.empty_seats
-
-                if empty_seats and target_table.player_count < self.max_players:
-                    dest_seat = min(empty_seats)
-
-                    move = PlayerMove(
-                        user_id=player.user_id,
-                        from_table_id=source_table_id,
-                        from_seat=player.seat_position or 0,
-                        to_table_id=target_table.table_id,
-                        to_seat=dest_seat,
-                        priority=BalancingPriority.HIGH,
-                    )
-                    moves.append(move)
-                    break
-
-                table_idx += 1
-                attempts += 1
-            else:
-                # No available seat found - should not happen with proper table management
-                pass
+            if not heap:
+                # No available seat - should not happen with proper table management
+                break
+            count, number, target_id = heapq.heappop(heap)
+            seats = free_seats[target_id]
+
+            moves.append(
+                PlayerMove(
+                    user_id=player.user_id,
+                    from_table_id=source_table_id,
+                    from_seat=player.seat_position or 0,
+                    to_table_id=target_id,
+                    to_seat=seats.pop(0),
+                    priority=BalancingPriority.HIGH,
+                )
+            )
 
-            table_idx += 1
+            if seats and count + 1 < self.max_players:
+                heapq.heappush(heap, (count + 1, number, target_id))
 
         plan.moves = moves
         return plan
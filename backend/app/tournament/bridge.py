@@ -5,17 +5,29 @@ Tournament Engine Integration with PokerKit.
 토너먼트 핸드를 처리하는 브릿지 모듈.
 """
 
+import asyncio
 import logging
 from datetime import datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any, Iterable
 from uuid import uuid4
 
 from ..engine.core import PokerKitWrapper
-from ..schemas.game import ActionRequest, ActionType
+from ..engine.state import (
+    ActionRequest,
+    ActionType,
+    Player,
+    SeatState,
+    SeatStatus,
+    TableConfig,
+    TableState,
+)
 from .models import TournamentState, BlindLevel
 from .snapshot import SnapshotManager
 from .event_bus import TournamentEventBus
 
+if TYPE_CHECKING:
+    from .engine import TournamentEngine
+
 logger = logging.getLogger(__name__)
 
 
@@ -35,21 +47,31 @@ class TournamentHandBridge:
         self.snapshot = snapshot_manager
         self.event_bus = event_bus
         self._active_hands: dict[str, Any] = {}
+        self._prepared_hands: dict[str, tuple[Any, str, dict[str, int], tuple]] = {}
 
-    async def start_hand(
+    def attach(self, engine: "TournamentEngine") -> None:
+        """Shotgun start 사전 준비/폐기 콜백을 엔진에 등록."""
+        engine.set_hand_prepare_callback(
+            self.prepare_hand, discard=self.discard_prepared
+        )
+
+    def discard_prepared(self, table_ids: Iterable[str]) -> None:
+        """사용되지 않은 사전 생성 핸드 폐기 (시작 완료/중단 시)."""
+        for table_id in table_ids:
+            self._prepared_hands.pop(table_id, None)
+
+    def _build_hand(
         self,
         tournament_state: TournamentState,
         table_id: str,
-    ) -> tuple[Any, str]:
-        """토너먼트 테이블에서 새 핸드 시작."""
+    ) -> tuple[Any, str, dict[str, int], tuple]:
+        """PokerKit 초기 핸드 상태 생성 (I/O 없음)."""
         table = tournament_state.tables.get(table_id)
         if not table:
             raise ValueError(f"Table {table_id} not found")
 
         blind = tournament_state.current_blind or BlindLevel(1, 25, 50, 0, 15)
 
-        from ..schemas.game import TableConfig, TableState, SeatState
-
         seated_players = []
         starting_stacks: dict[str, int] = {}
 
@@ -64,7 +86,6 @@ class TournamentHandBridge:
             raise ValueError("Not enough players to start hand")
 
         config = TableConfig(
-            table_id=table_id,
             max_seats=table.max_seats,
             small_blind=blind.small_blind,
             big_blind=blind.big_blind,
@@ -73,25 +94,35 @@ class TournamentHandBridge:
             max_buy_in=999999999,
         )
 
+        by_seat = {seat_idx: (user_id, chips) for seat_idx, user_id, chips in seated_players}
         seats = []
         for i in range(table.max_seats):
-            seat_data = None
-            for seat_idx, user_id, chips in seated_players:
-                if seat_idx == i:
-                    seat_data = SeatState(
+            if i in by_seat:
+                user_id, chips = by_seat[i]
+                seats.append(
+                    SeatState(
                         position=i,
-                        user_id=user_id,
-                        nickname=tournament_state.players[user_id].nickname,
+                        player=Player(
+                            user_id=user_id,
+                            nickname=tournament_state.players[user_id].nickname,
+                        ),
                         stack=chips,
-                        is_sitting_out=False,
+                        status=SeatStatus.ACTIVE,
                     )
-                    break
-            seats.append(seat_data if seat_data else SeatState(position=i))
+                )
+            else:
+                seats.append(SeatState(i, None, 0, SeatStatus.EMPTY))
 
         table_state = TableState(
             table_id=table_id,
             config=config,
             seats=tuple(seats),
+            hand=None,
+            dealer_position=self._next_button(
+                table.button_position, [s[0] for s in seated_players]
+            ),
+            state_version=0,
+            updated_at=datetime.utcnow(),
         )
 
         hand_id = str(uuid4())
@@ -99,6 +130,54 @@ class TournamentHandBridge:
             table_state, hand_id=hand_id
         )
 
+        # 사전 생성 상태 재사용 여부 판단용 (좌석/스택/블라인드)
+        signature = (tuple(seated_players), blind.small_blind, blind.big_blind, blind.ante)
+        return table_state, hand_id, starting_stacks, signature
+
+    @staticmethod
+    def _next_button(previous: int | None, occupied: list[int]) -> int:
+        """직전 버튼 다음의 점유 좌석 (직전 버튼이 없으면 첫 좌석)."""
+        if previous is None:
+            return occupied[0]
+        for seat_idx in occupied:
+            if seat_idx > previous:
+                return seat_idx
+        return occupied[0]
+
+    async def prepare_hand(
+        self,
+        tournament_state: TournamentState,
+        table_id: str,
+    ) -> None:
+        """
+        Shotgun start 카운트다운 중 첫 핸드 상태를 미리 생성.
+
+        start_hand()는 좌석/스택/블라인드가 동일하면 이 상태를 그대로
+        사용하므로, 시작 시각에는 스냅샷 저장과 이벤트만 남는다.
+        PokerKit 상태 생성은 CPU 작업이므로 이벤트 루프 밖에서 실행한다.
+        """
+        try:
+            self._prepared_hands[table_id] = await asyncio.to_thread(
+                self._build_hand, tournament_state, table_id
+            )
+        except ValueError:
+            self._prepared_hands.pop(table_id, None)
+
+    async def start_hand(
+        self,
+        tournament_state: TournamentState,
+        table_id: str,
+    ) -> tuple[Any, str]:
+        """토너먼트 테이블에서 새 핸드 시작."""
+        # 사전 생성 이후 좌석/스택/블라인드가 바뀌었으면 다시 생성
+        built = self._prepared_hands.pop(table_id, None)
+        if built is None or built[3] != self._hand_signature(
+            tournament_state, table_id
+        ):
+            built = self._build_hand(tournament_state, table_id)
+
+        table_state, hand_id, starting_stacks, _signature = built
+
         self._active_hands[table_id] = table_state
 
         await self.snapshot.save_hand_snapshot(
@@ -111,11 +190,28 @@ class TournamentHandBridge:
 
         logger.info(
             f"Tournament hand started: table={table_id}, hand={hand_id}, "
-            f"players={len(seated_players)}"
+            f"players={len(starting_stacks)}"
         )
 
         return table_state, hand_id
 
+    @staticmethod
+    def _hand_signature(
+        tournament_state: TournamentState,
+        table_id: str,
+    ) -> tuple | None:
+        table = tournament_state.tables.get(table_id)
+        if not table:
+            return None
+        blind = tournament_state.current_blind or BlindLevel(1, 25, 50, 0, 15)
+        seated = []
+        for seat_idx, user_id in enumerate(table.seats):
+            if user_id:
+                player = tournament_state.players.get(user_id)
+                if player and player.is_active and player.chip_count > 0:
+                    seated.append((seat_idx, user_id, player.chip_count))
+        return (tuple(seated), blind.small_blind, blind.big_blind, blind.ante)
+
     async def apply_action(
         self,
         tournament_id: str,
@@ -130,7 +226,7 @@ class TournamentHandBridge:
 
         position = None
         for seat in table_state.seats:
-            if seat.user_id == user_id:
+            if seat.player and seat.player.user_id == user_id:
                 position = seat.position
                 break
 
@@ -148,7 +244,7 @@ class TournamentHandBridge:
             table_id,
             {
                 "user_id": user_id,
-                "action": action.action.value,
+                "action": action.action_type.value,
                 "amount": action.amount,
                 "timestamp": datetime.utcnow().isoformat(),
             },
@@ -156,13 +252,13 @@ class TournamentHandBridge:
 
         if self.poker_engine.is_hand_finished(new_state):
             return new_state, {
-                "action": executed_action.action.value if executed_action else None,
+                "action": executed_action.action_type.value if executed_action else None,
                 "amount": executed_action.amount if executed_action else 0,
                 "hand_complete": True,
             }
 
         return new_state, {
-            "action": executed_action.action.value if executed_action else None,
+            "action": executed_action.action_type.value if executed_action else None,
             "amount": executed_action.amount if executed_action else 0,
             "hand_complete": False,
         }
@@ -187,15 +283,15 @@ class TournamentHandBridge:
         eliminated: list[str] = []
 
         for seat in table_state.seats:
-            if seat.user_id:
-                chip_changes[seat.user_id] = seat.stack
+            if seat.player:
+                chip_changes[seat.player.user_id] = seat.stack
                 if seat.stack <= 0:
-                    eliminated.append(seat.user_id)
+                    eliminated.append(seat.player.user_id)
 
-        if result.winners:
-            for winner in result.winners:
-                if winner.user_id:
-                    winners.append(winner.user_id)
+        for winner in result.winners:
+            seat = table_state.get_seat(winner.position)
+            if seat and seat.player and seat.player.user_id not in winners:
+                winners.append(seat.player.user_id)
 
         del self._active_hands[table_id]
         await self.snapshot.complete_hand(tournament_id, table_id)
@@ -209,6 +305,7 @@ class TournamentHandBridge:
             "winners": winners,
             "chip_changes": chip_changes,
             "eliminated": eliminated,
+            "button_position": table_state.dealer_position,
         }
 
     def get_valid_actions(
@@ -223,7 +320,7 @@ class TournamentHandBridge:
 
         position = None
         for seat in table_state.seats:
-            if seat.user_id == user_id:
+            if seat.player and seat.player.user_id == user_id:
                 position = seat.position
                 break
 
@@ -234,7 +331,7 @@ class TournamentHandBridge:
 
         return [
             {
-                "action": va.action.value,
+                "action": va.action_type.value,
                 "min_amount": va.min_amount,
                 "max_amount": va.max_amount,
             }
@@ -262,7 +359,7 @@ class TournamentHandBridge:
 
         position = None
         for seat in table_state.seats:
-            if seat.user_id == user_id:
+            if seat.player and seat.player.user_id == user_id:
                 position = seat.position
                 break
 
@@ -270,7 +367,9 @@ class TournamentHandBridge:
             return None
 
         try:
-            fold_action = ActionRequest(action=ActionType.FOLD)
+            fold_action = ActionRequest(
+                request_id=str(uuid4()), action_type=ActionType.FOLD
+            )
             new_state, _ = self.poker_engine.apply_action(
                 table_state, position, fold_action
             )
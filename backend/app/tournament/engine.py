@@ -7,6 +7,7 @@ Enterprise Tournament Engine - Core Implementation.
 
 import asyncio
 import random
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Tuple, Callable
@@ -31,6 +32,35 @@ from .ranking import RankingEngine
 from .snapshot import SnapshotManager
 
 
+# Shotgun start admission control
+SHOTGUN_PREPARE_CONCURRENCY = 50  # 카운트다운 중 동시 사전 준비 테이블 수
+SHOTGUN_START_CONCURRENCY = 200  # 시작 시각에 동시 시작 테이블 수
+
+
+@dataclass
+class ShotgunStartMetrics:
+    """Shotgun start timing metrics."""
+
+    table_count: int = 0
+    tables_prepared: int = 0
+    tables_started: int = 0
+    tables_failed: int = 0
+    prepare_duration_ms: float = 0.0
+    first_start_delay_ms: float = 0.0  # 목표 시각 ~ 첫 테이블 시작
+    start_skew_ms: float = 0.0  # 첫 테이블 ~ 마지막 테이블 시작
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "table_count": self.table_count,
+            "tables_prepared": self.tables_prepared,
+            "tables_started": self.tables_started,
+            "tables_failed": self.tables_failed,
+            "prepare_duration_ms": round(self.prepare_duration_ms, 2),
+            "first_start_delay_ms": round(self.first_start_delay_ms, 2),
+            "start_skew_ms": round(self.start_skew_ms, 2),
+        }
+
+
 @dataclass
 class ShotgunStartState:
     """Shotgun start synchronization state."""
@@ -41,6 +71,7 @@ class ShotgunStartState:
     registered_players: int
     ready_players: set = field(default_factory=set)
     started: bool = False
+    metrics: ShotgunStartMetrics = field(default_factory=ShotgunStartMetrics)
 
 
 class TournamentEngine:
@@ -108,6 +139,15 @@ class TournamentEngine:
         self._hand_started_callback: Optional[Callable] = None
         self._hand_completed_callback: Optional[Callable] = None
 
+        # Shotgun start: prebuild hand state during countdown (e.g. PokerKit)
+        self._hand_prepare_callback: Optional[Callable] = None
+        self._hand_discard_callback: Optional[Callable] = None
+
+        # Sharded mode: only start hands on tables this instance owns
+        self._table_filter: Optional[Callable[[str], bool]] = None
+        # Sharded mode: forward hand results to the coordinator instead of applying
+        self._hand_result_forwarder: Optional[Callable] = None
+
     async def initialize(self) -> None:
         """Initialize tournament engine.
 
@@ -127,6 +167,33 @@ class TournamentEngine:
         self._blind_task = asyncio.create_task(self._blind_level_loop())
         self._balance_task = asyncio.create_task(self._balancing_loop())
 
+    def set_table_filter(self, predicate: Optional[Callable[[str], bool]]) -> None:
+        """샤드 모드: 이 인스턴스가 소유한 테이블만 핸드를 시작하도록 제한."""
+        self._table_filter = predicate
+
+    def set_hand_result_forwarder(self, forwarder: Optional[Callable]) -> None:
+        """샤드 모드: 핸드 결과를 로컬 적용 대신 코디네이터로 전달.
+
+        forwarder(tournament_id, table_id, winners, chip_changes, eliminated,
+        button_position) — 예: TableShardWorker.complete_hand
+        """
+        self._hand_result_forwarder = forwarder
+
+    def set_hand_prepare_callback(
+        self,
+        callback: Optional[Callable],
+        discard: Optional[Callable] = None,
+    ) -> None:
+        """
+        Shotgun start 카운트다운 중 호출될 핸드 사전 준비 콜백 등록.
+
+        callback(state, table_id) — 예: TournamentHandBridge.prepare_hand
+        discard(table_ids) — 시작 단계가 끝나면(시작/중단 모두) 사용되지
+        않은 사전 생성 상태를 폐기. 예: TournamentHandBridge.discard_prepared
+        """
+        self._hand_prepare_callback = callback
+        self._hand_discard_callback = discard
+
     async def _recover_crashed_tournaments(self) -> int:
         """크래시된 토너먼트 자동 복구.
 
@@ -153,6 +220,8 @@ class TournamentEngine:
                         if state.status in (TournamentStatus.COMPLETED, TournamentStatus.CANCELLED):
                             # 종료된 토너먼트 스냅샷 정리
                             await self.snapshot.delete_snapshot(tid)
+                            self.balancer.invalidate(tid)
+                            await self.event_bus.retire_stream(tid)
                             logger.info(f"[RECOVERY] 종료된 토너먼트 {tid} 스냅샷 정리")
                         else:
                             recovered += 1
@@ -408,29 +477,27 @@ class TournamentEngine:
         max_per_table = state.config.players_per_table
         num_tables = (len(players) + max_per_table - 1) // max_per_table
 
-        tables: Dict[str, TournamentTable] = {}
+        # Distribute players (round-robin) into plain seat lists first,
+        # then build each immutable table once
+        seat_lists: List[List[Optional[str]]] = [
+            [None] * max_per_table for _ in range(num_tables)
+        ]
+        for idx, player in enumerate(players):
+            table_idx = idx % num_tables
+            seat = idx // num_tables
+            if seat < max_per_table:
+                seat_lists[table_idx][seat] = player.user_id
 
-        # Create empty tables
-        for i in range(num_tables):
+        tables: Dict[str, TournamentTable] = {}
+        for i, seats in enumerate(seat_lists):
             table_id = str(uuid4())
             tables[table_id] = TournamentTable(
                 table_id=table_id,
                 table_number=i + 1,
+                seats=tuple(seats),
                 max_seats=max_per_table,
             )
 
-        # Distribute players (round-robin)
-        table_list = list(tables.values())
-        for idx, player in enumerate(players):
-            table_idx = idx % num_tables
-            table = table_list[table_idx]
-
-            # Find empty seat
-            seat = table.player_count
-            if seat < max_per_table:
-                tables[table.table_id] = table.with_player_seated(player.user_id, seat)
-                table_list[table_idx] = tables[table.table_id]
-
         return tables
 
     async def _execute_shotgun_start(
@@ -441,9 +508,45 @@ class TournamentEngine:
         """
         Shotgun Start 실행.
 
-        정확한 시각에 모든 테이블 동시 시작.
+        파이프라인:
+        ─────────────────────────────────────────────────────────────
+
+        1. 카운트다운 중 사전 준비 (SHOTGUN_PREPARE_CONCURRENCY 제한)
+           - _hand_prepare_callback으로 테이블별 핸드 상태 미리 생성
+        2. 목표 시각까지 대기 (고정 sleep이 아닌 남은 시간 기준)
+        3. 목표 시각에 모든 테이블 첫 핸드 시작
+           - SHOTGUN_START_CONCURRENCY 제한으로 동시 시작
+           - 토너먼트 락을 보유한 상태이며 진행 중인 핸드가 없으므로
+             테이블별 분산 락 생략
+        4. 테이블 간 시작 편차(start skew) 기록
+
+        ─────────────────────────────────────────────────────────────
         """
-        await asyncio.sleep(countdown)
+        shotgun = self._shotgun_states.get(tournament_id)
+        target_time = (
+            shotgun.target_start_time
+            if shotgun
+            else datetime.utcnow() + timedelta(seconds=countdown)
+        )
+        metrics = shotgun.metrics if shotgun else ShotgunStartMetrics()
+
+        prepared_tables = await self._prepare_shotgun_tables(tournament_id, metrics)
+        try:
+            await self._run_shotgun_start(tournament_id, target_time, metrics)
+        finally:
+            # 시작에 사용되지 않은 사전 생성 상태는 시작/취소 여부와 무관하게 폐기
+            if prepared_tables and self._hand_discard_callback:
+                self._hand_discard_callback(prepared_tables)
+
+    async def _run_shotgun_start(
+        self,
+        tournament_id: str,
+        target_time: datetime,
+        metrics: ShotgunStartMetrics,
+    ) -> None:
+        remaining = (target_time - datetime.utcnow()).total_seconds()
+        if remaining > 0:
+            await asyncio.sleep(remaining)
 
         async with self.lock_manager.lock(tournament_id, LockType.TOURNAMENT):
             state = self._tournaments.get(tournament_id)
@@ -469,48 +572,115 @@ class TournamentEngine:
 
             self._tournaments[tournament_id] = new_state
 
-            # Start all tables simultaneously
-            start_tasks = []
-            for table_id in new_state.tables:
-                task = asyncio.create_task(
-                    self._start_table_hand(tournament_id, table_id)
-                )
-                start_tasks.append(task)
+            # Start all tables with bounded concurrency
+            semaphore = asyncio.Semaphore(SHOTGUN_START_CONCURRENCY)
+            start_times: List[float] = []
+            release_at = time.monotonic()
+
+            async def start_one(table_id: str) -> None:
+                async with semaphore:
+                    await self._start_table_hand(
+                        tournament_id, table_id, acquire_lock=False
+                    )
+                    start_times.append(time.monotonic())
+
+            results = await asyncio.gather(
+                *(start_one(table_id) for table_id in new_state.tables),
+                return_exceptions=True,
+            )
 
-            # Wait for all to start
-            await asyncio.gather(*start_tasks, return_exceptions=True)
+            metrics.table_count = len(new_state.tables)
+            metrics.tables_failed = sum(
+                1 for r in results if isinstance(r, BaseException)
+            )
+            metrics.tables_started = len(start_times)
+            if start_times:
+                metrics.first_start_delay_ms = (min(start_times) - release_at) * 1000
+                metrics.start_skew_ms = (max(start_times) - min(start_times)) * 1000
 
             # Mark shotgun start complete
             if tournament_id in self._shotgun_states:
                 self._shotgun_states[tournament_id].started = True
 
+    async def _prepare_shotgun_tables(
+        self,
+        tournament_id: str,
+        metrics: ShotgunStartMetrics,
+    ) -> List[str]:
+        """카운트다운 중 테이블별 첫 핸드 상태 사전 생성.
+
+        Returns:
+            사전 준비를 요청한 테이블 ID 목록 (폐기 대상)
+        """
+        state = self._tournaments.get(tournament_id)
+        if not state or not self._hand_prepare_callback:
+            return []
+
+        prepare = self._hand_prepare_callback
+        semaphore = asyncio.Semaphore(SHOTGUN_PREPARE_CONCURRENCY)
+        started = time.monotonic()
+
+        async def prepare_one(table_id: str) -> bool:
+            async with semaphore:
+                await prepare(state, table_id)
+                return True
+
+        results = await asyncio.gather(
+            *(prepare_one(table_id) for table_id in state.tables),
+            return_exceptions=True,
+        )
+
+        metrics.tables_prepared = sum(1 for r in results if r is True)
+        metrics.prepare_duration_ms = (time.monotonic() - started) * 1000
+        return list(state.tables)
+
+    def get_shotgun_metrics(self, tournament_id: str) -> Optional[ShotgunStartMetrics]:
+        """Shotgun start timing metrics (start skew across tables)."""
+        shotgun = self._shotgun_states.get(tournament_id)
+        return shotgun.metrics if shotgun else None
+
     async def _start_table_hand(
         self,
         tournament_id: str,
         table_id: str,
+        acquire_lock: bool = True,
     ) -> None:
         """개별 테이블 핸드 시작."""
+        if self._table_filter and not self._table_filter(table_id):
+            return
+
+        if not acquire_lock:
+            await self._start_table_hand_unlocked(tournament_id, table_id)
+            return
+
         async with self.lock_manager.lock(tournament_id, LockType.TABLE, table_id):
-            state = self._tournaments.get(tournament_id)
-            if not state:
-                return
+            await self._start_table_hand_unlocked(tournament_id, table_id)
 
-            table = state.tables.get(table_id)
-            if not table or table.player_count < 2:
-                return
+    async def _start_table_hand_unlocked(
+        self,
+        tournament_id: str,
+        table_id: str,
+    ) -> None:
+        state = self._tournaments.get(tournament_id)
+        if not state:
+            return
 
-            # Emit table hand started event
-            await self.event_bus.publish(
-                TournamentEvent(
-                    event_type=TournamentEventType.TABLE_HAND_STARTED,
-                    tournament_id=tournament_id,
-                    table_id=table_id,
-                    data={"player_count": table.player_count},
-                )
+        table = state.tables.get(table_id)
+        if not table or table.player_count < 2:
+            return
+
+        # Emit table hand started event
+        await self.event_bus.publish(
+            TournamentEvent(
+                event_type=TournamentEventType.TABLE_HAND_STARTED,
+                tournament_id=tournament_id,
+                table_id=table_id,
+                data={"player_count": table.player_count},
             )
+        )
 
-            if self._hand_started_callback:
-                await self._hand_started_callback(tournament_id, table_id)
+        if self._hand_started_callback:
+            await self._hand_started_callback(tournament_id, table_id)
 
     # =========================================================================
     # Hand Completion & Player Elimination
@@ -523,115 +693,192 @@ class TournamentEngine:
         winners: List[str],
         chip_changes: Dict[str, int],
         eliminated: List[str],
+        button_position: Optional[int] = None,
     ) -> TournamentState:
         """
         핸드 완료 처리.
 
+        button_position: 이번 핸드의 딜러 버튼 좌석 (밸런싱 시 블라인드
+        공정성 계산에 사용, 미지정 시 기존 값 유지)
+
         처리 순서:
         1. 칩 변경 적용
         2. 탈락자 처리
         3. 랭킹 업데이트
         4. 테이블 밸런싱 체크
         5. 다음 핸드 시작 또는 토너먼트 종료
+
+        샤드 모드에서는 결과를 코디네이터로 전달만 하고 현재 상태를 반환
+        (집계는 코디네이터가 적용 후 스냅샷으로 전파).
         """
+        if self._hand_result_forwarder is not None:
+            state = self._tournaments.get(tournament_id)
+            if not state:
+                raise ValueError("Tournament not found")
+            await self._hand_result_forwarder(
+                tournament_id,
+                table_id,
+                winners,
+                chip_changes,
+                eliminated,
+                button_position=button_position,
+            )
+            return state
+
         async with self.lock_manager.lock(tournament_id, LockType.TABLE, table_id):
             state = self._tournaments.get(tournament_id)
             if not state:
                 raise ValueError("Tournament not found")
 
-            new_players = dict(state.players)
-            active_count = state.active_player_count
+            new_state, eliminations = self.apply_hand_result(
+                state,
+                table_id,
+                chip_changes,
+                eliminated,
+                button_position=button_position,
+            )
+            self._tournaments[tournament_id] = new_state
 
-            # Apply chip changes
-            for user_id, new_chips in chip_changes.items():
-                if user_id in new_players:
-                    new_players[user_id] = new_players[user_id].with_chips(new_chips)
+            await self.publish_hand_result(
+                new_state, table_id, winners, chip_changes, eliminated, eliminations
+            )
 
-            # Process eliminations
-            for user_id in eliminated:
-                if user_id in new_players:
-                    active_count -= 1
-                    new_players[user_id] = new_players[user_id].eliminated(
-                        rank=active_count + 1
-                    )
+            return new_state
 
-                    await self.event_bus.emit_player_eliminated(
-                        tournament_id,
-                        user_id,
-                        active_count + 1,
-                        eliminated_by=winners[0] if winners else None,
-                        table_id=table_id,
-                    )
+    def apply_hand_result(
+        self,
+        state: TournamentState,
+        table_id: str,
+        chip_changes: Dict[str, int],
+        eliminated: List[str],
+        button_position: Optional[int] = None,
+    ) -> Tuple[TournamentState, List[Tuple[str, int]]]:
+        """
+        핸드 결과를 적용한 새 상태 계산 (I/O 없음).
 
-            # Update table state (hand complete)
-            new_tables = dict(state.tables)
-            table = new_tables.get(table_id)
-            if table:
-                # Remove eliminated players from table
-                for user_id in eliminated:
-                    if user_id:
-                        table = table.with_player_removed(user_id)
-                new_tables[table_id] = TournamentTable(
-                    table_id=table.table_id,
-                    table_number=table.table_number,
-                    seats=table.seats,
-                    max_seats=table.max_seats,
-                    hand_in_progress=False,
-                    current_hand_id=None,
-                )
+        complete_hand와 샤드 코디네이터가 공유하는 순수 상태 전이.
 
-            # Check for tournament completion
-            new_status = state.status
-            if active_count <= 1:
-                new_status = TournamentStatus.COMPLETED
-            elif active_count <= 2:
-                new_status = TournamentStatus.HEADS_UP
-            elif active_count <= state.config.players_per_table:
-                new_status = TournamentStatus.FINAL_TABLE
+        Returns:
+            (new_state, [(탈락 user_id, 순위), ...])
+        """
+        new_players = dict(state.players)
+        active_count = state.active_player_count
+        eliminations: List[Tuple[str, int]] = []
+
+        # Apply chip changes
+        for user_id, new_chips in chip_changes.items():
+            if user_id in new_players:
+                new_players[user_id] = new_players[user_id].with_chips(new_chips)
+
+        # Process eliminations
+        for user_id in eliminated:
+            if user_id in new_players:
+                active_count -= 1
+                new_players[user_id] = new_players[user_id].eliminated(
+                    rank=active_count + 1
+                )
+                eliminations.append((user_id, active_count + 1))
 
-            new_state = TournamentState(
-                tournament_id=state.tournament_id,
-                config=state.config,
-                status=new_status,
-                created_at=state.created_at,
-                started_at=state.started_at,
-                ended_at=datetime.utcnow()
-                if new_status == TournamentStatus.COMPLETED
-                else None,
-                current_blind_level=state.current_blind_level,
-                level_started_at=state.level_started_at,
-                next_level_at=state.next_level_at,
-                players=new_players,
-                tables=new_tables,
-                ranking=state.ranking,
-                total_prize_pool=state.total_prize_pool,
-                itm_threshold=state.itm_threshold,
+        # Update table state (hand complete)
+        new_tables = dict(state.tables)
+        table = new_tables.get(table_id)
+        if table:
+            # Remove eliminated players from table
+            for user_id in eliminated:
+                if user_id:
+                    table = table.with_player_removed(user_id)
+            new_tables[table_id] = TournamentTable(
+                table_id=table.table_id,
+                table_number=table.table_number,
+                seats=table.seats,
+                max_seats=table.max_seats,
+                hand_in_progress=False,
+                current_hand_id=None,
+                button_position=(
+                    button_position
+                    if button_position is not None
+                    else table.button_position
+                ),
             )
 
-            self._tournaments[tournament_id] = new_state
+        # Check for tournament completion
+        new_status = state.status
+        if active_count <= 1:
+            new_status = TournamentStatus.COMPLETED
+        elif active_count <= 2:
+            new_status = TournamentStatus.HEADS_UP
+        elif active_count <= state.config.players_per_table:
+            new_status = TournamentStatus.FINAL_TABLE
+
+        new_state = TournamentState(
+            tournament_id=state.tournament_id,
+            config=state.config,
+            status=new_status,
+            created_at=state.created_at,
+            started_at=state.started_at,
+            ended_at=datetime.utcnow()
+            if new_status == TournamentStatus.COMPLETED
+            else None,
+            current_blind_level=state.current_blind_level,
+            level_started_at=state.level_started_at,
+            next_level_at=state.next_level_at,
+            players=new_players,
+            tables=new_tables,
+            ranking=state.ranking,
+            total_prize_pool=state.total_prize_pool,
+            itm_threshold=state.itm_threshold,
+        )
 
-            # Update ranking
-            ranking_updates = [
-                (uid, new_players[uid].chip_count)
-                for uid in chip_changes.keys()
-                if uid in new_players
-            ]
-            await self.ranking.update_batch(tournament_id, ranking_updates)
+        return new_state, eliminations
 
-            # Clear hand snapshot
-            await self.snapshot.complete_hand(tournament_id, table_id)
+    async def publish_hand_result(
+        self,
+        state: TournamentState,
+        table_id: str,
+        winners: List[str],
+        chip_changes: Dict[str, int],
+        eliminated: List[str],
+        eliminations: List[Tuple[str, int]],
+    ) -> None:
+        """핸드 결과 후속 처리: 탈락 이벤트, 랭킹, 스냅샷, 완료 이벤트."""
+        tournament_id = state.tournament_id
 
-            # Emit hand complete event
-            await self.event_bus.publish(
-                TournamentEvent(
-                    event_type=TournamentEventType.TABLE_HAND_COMPLETED,
-                    tournament_id=tournament_id,
-                    table_id=table_id,
-                    data={"winners": winners, "eliminated": eliminated},
-                )
+        if state.status == TournamentStatus.COMPLETED:
+            # 종료된 토너먼트는 더 이상 밸런싱하지 않음
+            self.balancer.invalidate(tournament_id)
+
+        for user_id, rank in eliminations:
+            await self.event_bus.emit_player_eliminated(
+                tournament_id,
+                user_id,
+                rank,
+                eliminated_by=winners[0] if winners else None,
+                table_id=table_id,
             )
 
-            return new_state
+        # Update ranking
+        ranking_updates = [
+            (uid, state.players[uid].chip_count)
+            for uid in chip_changes.keys()
+            if uid in state.players
+        ]
+        await self.ranking.update_batch(tournament_id, ranking_updates)
+
+        # Clear hand snapshot
+        await self.snapshot.complete_hand(tournament_id, table_id)
+
+        # Emit hand complete event
+        await self.event_bus.publish(
+            TournamentEvent(
+                event_type=TournamentEventType.TABLE_HAND_COMPLETED,
+                tournament_id=tournament_id,
+                table_id=table_id,
+                data={"winners": winners, "eliminated": eliminated},
+            )
+        )
+
+        if state.status == TournamentStatus.COMPLETED:
+            await self.event_bus.retire_stream(tournament_id)
 
     # =========================================================================
     # Blind Level Management
@@ -748,7 +995,8 @@ class TournamentEngine:
         if not state:
             return
 
-        plan = self.balancer.calculate_balancing_plan(state)
+        # 테이블 인원 구성이 바뀐 경우에만 재계산 (그 외에는 캐시된 계획)
+        plan = self.balancer.get_plan(state)
 
         if not plan.moves:
             return
@@ -836,6 +1084,13 @@ class TournamentEngine:
     def get_state(self, tournament_id: str) -> Optional[TournamentState]:
         return self._tournaments.get(tournament_id)
 
+    def set_state(self, tournament_id: str, state: TournamentState) -> None:
+        """외부에서 적용한 상태로 교체 (샤드 코디네이터 집계 / 워커 스냅샷 동기화)."""
+        self._tournaments[tournament_id] = state
+
+    def tournament_ids(self) -> List[str]:
+        return list(self._tournaments)
+
     async def get_ranking(self, tournament_id: str, top_n: int = 100):
         return await self.ranking.get_top_players(tournament_id, top_n)
 
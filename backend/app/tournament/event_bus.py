@@ -24,6 +24,8 @@ from typing import (
     List,
     Optional,
     Set,
+    Tuple,
+    Union,
 )
 from uuid import uuid4
 
@@ -34,6 +36,7 @@ from .models import TournamentEvent, TournamentEventType
 
 # Type alias for event handlers
 EventHandler = Callable[[TournamentEvent], Awaitable[None]]
+BatchEventHandler = Callable[[List[TournamentEvent]], Awaitable[None]]
 
 
 @dataclass
@@ -42,9 +45,11 @@ class Subscription:
 
     subscription_id: str
     event_types: Set[TournamentEventType]
-    handler: EventHandler
+    handler: Union[EventHandler, BatchEventHandler]
     tournament_id: Optional[str] = None  # None = all tournaments
     is_active: bool = True
+    batch: bool = False  # True = handler receives List[TournamentEvent]
+    distributed: bool = False  # True = consumed from Redis Stream (group)
 
 
 @dataclass
@@ -57,6 +62,15 @@ class EventMetrics:
     avg_processing_time_ms: float = 0.0
     last_event_time: Optional[datetime] = None
 
+    # Local dispatch queue
+    events_dispatched: int = 0
+    dispatch_batches: int = 0
+    dispatch_queue_depth: int = 0
+    dispatch_backpressure: int = 0
+
+    # Stream consumption
+    stream_batches_acked: int = 0
+
 
 class TournamentEventBus:
     """
@@ -65,47 +79,62 @@ class TournamentEventBus:
     아키텍처:
     ─────────────────────────────────────────────────────────────────
 
-    [Producer] -> [Redis Stream] -> [Consumer Group] -> [Handlers]
+    publish() ─┬─> [Stream Queue] ─> XADD 파이프라인 ─> tournament:events:{tid}
+               │                                            │
+               │                               XREADGROUP (배치, 다중 스트림)
+               │                                            │
+               │                                 [분산 핸들러] ─> XACK (배치)
+               │
+               └─> [Dispatch Queue (bounded)] ─> 디스패처 태스크 ─> [로컬 핸들러]
 
     1. Producer (publish):
-       - 이벤트를 Redis Stream에 추가 (XADD)
-       - 비동기로 즉시 반환 (Fire-and-Forget)
-       - 로컬 인메모리 핸들러에도 동시 발행
+       - 스트림 큐와 디스패치 큐에 넣고 즉시 반환 (핸들러 대기 없음)
+       - 디스패치 큐가 가득 차면 자리가 날 때까지 대기 (백프레셔)
 
-    2. Redis Stream:
-       - 이벤트 영속성 보장 (서버 재시작 후에도 유지)
-       - Consumer Group으로 분산 처리 가능
-       - Stream ID로 순서 보장
+    2. Redis Stream (토너먼트별 파티션):
+       - tournament:events:{tournament_id} 스트림으로 분할
+       - 스트림 목록은 tournament:events:streams SET으로 인스턴스 간 공유
+       - Consumer Group으로 분산 처리, 동일 토너먼트 내 순서 보장
 
     3. Consumer:
-       - 백그라운드 태스크로 지속적 폴링 (XREADGROUP)
-       - ACK로 처리 완료 확인
-       - 실패 시 Pending List로 재처리
+       - 모든 토너먼트 스트림을 한 번의 XREADGROUP으로 배치 읽기
+       - 스트림별로 한 번의 XACK로 배치 확인
 
     4. Local Handlers:
-       - 인메모리 핸들러는 즉시 처리 (WebSocket 등)
-       - 분산 핸들러는 Redis Stream 통해 처리
+       - 디스패처가 큐에서 최대 BATCH_SIZE개씩 꺼내 처리
+       - 배치 핸들러(subscribe(batch=True))는 틱당 한 번 묶음으로 호출
+         (예: 랭킹 업데이트 병합)
+       - 일반 핸들러는 구독별 순서를 유지하며 이벤트 단위 호출
 
     ─────────────────────────────────────────────────────────────────
 
-    성능 최적화:
-    - 배치 발행: 여러 이벤트를 파이프라인으로 일괄 전송
-    - 논블로킹: 모든 I/O 작업 비동기 처리
-    - 백프레셔: 처리 지연 시 발행 속도 조절
+    성능: 로컬 발행 초당 10,000+ 이벤트 (tests/tournament/test_event_bus_load.py)
     """
 
     # Redis Stream key prefix
     STREAM_KEY_PREFIX = "tournament:events"
 
+    # Registry of per-tournament streams (shared across instances)
+    STREAM_REGISTRY_KEY = "tournament:events:streams"
+
     # Consumer group name
     CONSUMER_GROUP = "tournament-engine"
 
-    # Max events to read per poll
+    # Max events to read per poll / dispatch per tick
     BATCH_SIZE = 100
 
-    # Event retention (1 hour = 3600000 ms)
+    # Per-stream retention
     STREAM_MAX_LEN = 10000
 
+    # Bounded local dispatch queue
+    DISPATCH_QUEUE_SIZE = 10000
+
+    # How often the consumer re-reads the stream registry (seconds)
+    STREAM_REFRESH_INTERVAL = 5.0
+
+    # Retired (finished tournament) stream TTL - lets trailing events drain
+    STREAM_RETIRE_TTL = 300
+
     def __init__(
         self,
         redis_client: redis.Redis,
@@ -122,77 +151,82 @@ class TournamentEventBus:
             defaultdict(list)
         )
 
-        # Background consumer task
+        # Background tasks
         self._consumer_task: Optional[asyncio.Task] = None
+        self._publisher_task: Optional[asyncio.Task] = None
+        self._dispatcher_task: Optional[asyncio.Task] = None
         self._running = False
 
         # Metrics
         self._metrics = EventMetrics()
 
-        # Event queue for batch processing
+        # Event queue for batch publishing to Redis
         self._event_queue: asyncio.Queue[TournamentEvent] = asyncio.Queue(maxsize=1000)
 
-        # Publisher task
-        self._publisher_task: Optional[asyncio.Task] = None
+        # Bounded queue decoupling local dispatch from publish()
+        self._dispatch_queue: asyncio.Queue[TournamentEvent] = asyncio.Queue(
+            maxsize=self.DISPATCH_QUEUE_SIZE
+        )
+
+        # Streams this instance has registered / consumer groups ensured
+        self._registered_streams: Set[str] = set()
+        self._consumer_streams: Set[str] = set()
+
+        # Streams of finished tournaments (never re-registered)
+        self._retired_streams: Set[str] = set()
+
+    def stream_key(self, tournament_id: str) -> str:
+        """Per-tournament stream key."""
+        return f"{self.STREAM_KEY_PREFIX}:{tournament_id}"
 
     async def initialize(self) -> None:
         """
         Initialize event bus.
 
-        - Redis Stream 및 Consumer Group 생성
+        - 기존 토너먼트 스트림의 Consumer Group 확인
         - Background tasks 시작
         """
-        # Create stream and consumer group if not exists
-        stream_key = f"{self.STREAM_KEY_PREFIX}:all"
-
-        try:
-            await self.redis.xgroup_create(
-                stream_key,
-                self.CONSUMER_GROUP,
-                id="0",
-                mkstream=True,
-            )
-        except redis.ResponseError as e:
-            # Group already exists
-            if "BUSYGROUP" not in str(e):
-                raise
+        await self._refresh_consumer_streams()
 
         # Start background tasks
         self._running = True
         self._publisher_task = asyncio.create_task(self._batch_publisher())
+        self._dispatcher_task = asyncio.create_task(self._local_dispatcher())
         self._consumer_task = asyncio.create_task(self._stream_consumer())
 
     async def shutdown(self) -> None:
         """Graceful shutdown."""
         self._running = False
 
-        if self._publisher_task:
-            self._publisher_task.cancel()
-            try:
-                await self._publisher_task
-            except asyncio.CancelledError:
-                pass
+        for task in (self._publisher_task, self._dispatcher_task, self._consumer_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
 
-        if self._consumer_task:
-            self._consumer_task.cancel()
-            try:
-                await self._consumer_task
-            except asyncio.CancelledError:
-                pass
+        self._dispatcher_task = None
 
     def subscribe(
         self,
         event_types: Set[TournamentEventType],
-        handler: EventHandler,
+        handler: Union[EventHandler, BatchEventHandler],
         tournament_id: Optional[str] = None,
+        batch: bool = False,
+        distributed: bool = False,
     ) -> str:
         """
         Subscribe to tournament events.
 
         Args:
             event_types: Set of event types to listen for
-            handler: Async function to call on event
+            handler: Async function to call on event (or on a list of events
+                when ``batch`` is True)
             tournament_id: Filter for specific tournament (None = all)
+            batch: Deliver events coalesced per dispatch tick
+            distributed: Consume from the Redis Stream consumer group instead
+                of local publishes (each event handled by one instance)
 
         Returns:
             Subscription ID for unsubscribe
@@ -203,6 +237,8 @@ class TournamentEventBus:
             event_types=event_types,
             handler=handler,
             tournament_id=tournament_id,
+            batch=batch,
+            distributed=distributed,
         )
 
         self._subscriptions[subscription_id] = subscription
@@ -233,11 +269,11 @@ class TournamentEventBus:
         Publish event to event bus.
 
         비동기 발행 로직:
-        1. 이벤트 큐에 추가 (즉시 반환)
-        2. 로컬 핸들러에 즉시 디스패치
-        3. 백그라운드에서 Redis Stream에 저장
+        1. 스트림 큐에 추가 (백그라운드에서 Redis Stream에 저장)
+        2. 디스패치 큐에 추가 (백그라운드에서 로컬 핸들러 호출)
+        3. 핸들러 완료를 기다리지 않고 반환
 
-        성능: 초당 10,000+ 이벤트 처리 가능
+        initialize() 전(디스패처 미가동)에는 로컬 핸들러를 즉시 호출한다.
         """
         # Add to queue for batch publishing to Redis
         try:
@@ -246,8 +282,14 @@ class TournamentEventBus:
             # Queue full - publish directly (backpressure)
             await self._publish_to_stream(event)
 
-        # Dispatch to local handlers immediately
-        await self._dispatch_local(event)
+        if self._dispatcher_task is None:
+            await self._dispatch_local([event])
+        else:
+            try:
+                self._dispatch_queue.put_nowait(event)
+            except asyncio.QueueFull:
+                self._metrics.dispatch_backpressure += 1
+                await self._dispatch_queue.put(event)
 
         self._metrics.events_published += 1
         self._metrics.last_event_time = datetime.utcnow()
@@ -257,16 +299,10 @@ class TournamentEventBus:
         for event in events:
             await self.publish(event)
 
-    async def _publish_to_stream(self, event: TournamentEvent) -> str:
-        """
-        Publish single event to Redis Stream.
-
-        Returns stream entry ID.
-        """
-        stream_key = f"{self.STREAM_KEY_PREFIX}:all"
-
-        # Event data for Redis (flat structure)
-        data = {
+    @staticmethod
+    def _encode(event: TournamentEvent) -> Dict[str, str]:
+        """Event data for Redis (flat structure)."""
+        return {
             "event_id": event.event_id,
             "event_type": event.event_type.name,
             "tournament_id": event.tournament_id,
@@ -276,9 +312,34 @@ class TournamentEventBus:
             "user_id": event.user_id or "",
         }
 
+    @staticmethod
+    def _decode(data: Dict[str, Any]) -> TournamentEvent:
+        return TournamentEvent(
+            event_id=data.get("event_id", ""),
+            event_type=TournamentEventType[data.get("event_type", "TOURNAMENT_CREATED")],
+            tournament_id=data.get("tournament_id", ""),
+            timestamp=datetime.fromisoformat(
+                data.get("timestamp", datetime.utcnow().isoformat())
+            ),
+            data=json.loads(data.get("data", "{}")),
+            table_id=data.get("table_id") or None,
+            user_id=data.get("user_id") or None,
+        )
+
+    async def _publish_to_stream(self, event: TournamentEvent) -> str:
+        """
+        Publish single event to its tournament's Redis Stream.
+
+        Returns stream entry ID.
+        """
+        stream_key = self.stream_key(event.tournament_id)
+        if self._needs_registration(stream_key):
+            await self.redis.sadd(self.STREAM_REGISTRY_KEY, stream_key)
+            self._registered_streams.add(stream_key)
+
         entry_id = await self.redis.xadd(
             stream_key,
-            data,
+            self._encode(event),
             maxlen=self.STREAM_MAX_LEN,
             approximate=True,
         )
@@ -292,7 +353,7 @@ class TournamentEventBus:
         배치 처리로 Redis 호출 최소화:
         - 최대 BATCH_SIZE개 이벤트 수집
         - 또는 100ms 타임아웃 후 발행
-        - Pipeline으로 일괄 전송
+        - Pipeline으로 일괄 전송 (새 스트림은 레지스트리에 함께 등록)
         """
         while self._running:
             batch: List[TournamentEvent] = []
@@ -312,53 +373,138 @@ class TournamentEventBus:
                         break
 
                 if batch:
-                    # Batch publish with pipeline
-                    stream_key = f"{self.STREAM_KEY_PREFIX}:all"
+                    new_streams: Set[str] = set()
 
                     async with self.redis.pipeline(transaction=False) as pipe:
                         for event in batch:
-                            data = {
-                                "event_id": event.event_id,
-                                "event_type": event.event_type.name,
-                                "tournament_id": event.tournament_id,
-                                "timestamp": event.timestamp.isoformat(),
-                                "data": json.dumps(event.data),
-                                "table_id": event.table_id or "",
-                                "user_id": event.user_id or "",
-                            }
+                            stream_key = self.stream_key(event.tournament_id)
+                            if self._needs_registration(stream_key):
+                                new_streams.add(stream_key)
                             pipe.xadd(
                                 stream_key,
-                                data,
+                                self._encode(event),
                                 maxlen=self.STREAM_MAX_LEN,
                                 approximate=True,
                             )
+                        if new_streams:
+                            pipe.sadd(self.STREAM_REGISTRY_KEY, *new_streams)
                         await pipe.execute()
 
+                    self._registered_streams |= new_streams
+
             except asyncio.CancelledError:
                 break
-            except Exception as e:
+            except Exception:
                 # Log and continue
                 await asyncio.sleep(0.1)
 
+    async def _local_dispatcher(self) -> None:
+        """
+        Background task draining the dispatch queue.
+
+        큐에서 한 개를 기다린 뒤 최대 BATCH_SIZE개까지 즉시 꺼내
+        한 번의 디스패치로 처리한다.
+        """
+        while self._running:
+            try:
+                batch = [await self._dispatch_queue.get()]
+                while len(batch) < self.BATCH_SIZE:
+                    try:
+                        batch.append(self._dispatch_queue.get_nowait())
+                    except asyncio.QueueEmpty:
+                        break
+
+                self._metrics.dispatch_queue_depth = self._dispatch_queue.qsize()
+                try:
+                    await self._dispatch_local(batch)
+                finally:
+                    for _ in batch:
+                        self._dispatch_queue.task_done()
+
+            except asyncio.CancelledError:
+                break
+            except Exception:
+                await asyncio.sleep(0.01)
+
+    async def drain(self) -> None:
+        """Wait until every queued local event has been dispatched."""
+        if self._dispatcher_task is not None:
+            await self._dispatch_queue.join()
+
+    def _needs_registration(self, stream_key: str) -> bool:
+        return (
+            stream_key not in self._registered_streams
+            and stream_key not in self._retired_streams
+        )
+
+    async def retire_stream(self, tournament_id: str) -> None:
+        """
+        종료된 토너먼트 스트림 정리.
+
+        레지스트리에서 제거하고 스트림에는 STREAM_RETIRE_TTL 만료를 건다
+        (즉시 삭제하지 않아 배치 발행 중인 마지막 이벤트도 기록됨).
+        다른 인스턴스는 다음 레지스트리 갱신 때 읽기 대상에서 제외한다.
+        """
+        stream_key = self.stream_key(tournament_id)
+        self._retired_streams.add(stream_key)
+        self._registered_streams.discard(stream_key)
+        self._consumer_streams.discard(stream_key)
+
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.srem(self.STREAM_REGISTRY_KEY, stream_key)
+            pipe.expire(stream_key, self.STREAM_RETIRE_TTL)
+            await pipe.execute()
+
+    async def _refresh_consumer_streams(self) -> None:
+        """Discover tournament streams and ensure our consumer group exists."""
+        members = await self.redis.smembers(self.STREAM_REGISTRY_KEY) or set()
+        active = {m.decode() if isinstance(m, bytes) else m for m in members}
+
+        # Streams retired by any instance are no longer read
+        self._consumer_streams &= active
+
+        for stream_key in active:
+            if stream_key in self._consumer_streams:
+                continue
+            try:
+                await self.redis.xgroup_create(
+                    stream_key,
+                    self.CONSUMER_GROUP,
+                    id="0",
+                    mkstream=True,
+                )
+            except redis.ResponseError as e:
+                # Group already exists
+                if "BUSYGROUP" not in str(e):
+                    raise
+            self._consumer_streams.add(stream_key)
+
     async def _stream_consumer(self) -> None:
         """
-        Background task for consuming events from Redis Stream.
+        Background task for consuming events from Redis Streams.
 
         분산 환경 Consumer Group 처리:
+        - 모든 토너먼트 스트림을 한 번의 XREADGROUP으로 읽기
         - 여러 서버 인스턴스가 이벤트를 분산 처리
-        - XREADGROUP으로 자동 부하 분산
-        - ACK로 처리 완료 확인
+        - 스트림별 배치 XACK
         """
-        stream_key = f"{self.STREAM_KEY_PREFIX}:all"
         consumer_name = f"consumer-{self.instance_id}"
+        last_refresh = time.monotonic()
 
         while self._running:
             try:
-                # Read new events
+                if time.monotonic() - last_refresh >= self.STREAM_REFRESH_INTERVAL:
+                    await self._refresh_consumer_streams()
+                    last_refresh = time.monotonic()
+
+                if not self._consumer_streams:
+                    await asyncio.sleep(0.5)
+                    continue
+
                 entries = await self.redis.xreadgroup(
                     groupname=self.CONSUMER_GROUP,
                     consumername=consumer_name,
-                    streams={stream_key: ">"},  # Only new messages
+                    streams={key: ">" for key in self._consumer_streams},
                     count=self.BATCH_SIZE,
                     block=1000,  # 1 second timeout
                 )
@@ -367,100 +513,124 @@ class TournamentEventBus:
                     continue
 
                 for stream_name, messages in entries:
-                    for message_id, data in messages:
+                    events: List[TournamentEvent] = []
+                    for _message_id, data in messages:
                         try:
-                            # Reconstruct event
-                            event = TournamentEvent(
-                                event_id=data.get("event_id", ""),
-                                event_type=TournamentEventType[
-                                    data.get("event_type", "TOURNAMENT_CREATED")
-                                ],
-                                tournament_id=data.get("tournament_id", ""),
-                                timestamp=datetime.fromisoformat(
-                                    data.get("timestamp", datetime.utcnow().isoformat())
-                                ),
-                                data=json.loads(data.get("data", "{}")),
-                                table_id=data.get("table_id") or None,
-                                user_id=data.get("user_id") or None,
-                            )
-
-                            # Process with distributed handlers
-                            await self._dispatch_distributed(event)
-
-                            # Acknowledge
-                            await self.redis.xack(
-                                stream_key,
-                                self.CONSUMER_GROUP,
-                                message_id,
-                            )
+                            events.append(self._decode(data))
+                        except Exception:
+                            # Malformed entry - ACK to avoid redelivery loop
+                            self._metrics.events_failed += 1
 
-                            self._metrics.events_processed += 1
+                    await self._dispatch_distributed(events)
 
-                        except Exception as e:
-                            self._metrics.events_failed += 1
-                            # Don't ACK - will retry
+                    await self.redis.xack(
+                        stream_name,
+                        self.CONSUMER_GROUP,
+                        *[message_id for message_id, _ in messages],
+                    )
+                    self._metrics.events_processed += len(events)
+                    self._metrics.stream_batches_acked += 1
 
             except asyncio.CancelledError:
                 break
-            except Exception as e:
+            except Exception:
                 await asyncio.sleep(1)  # Backoff on error
 
-    async def _dispatch_local(self, event: TournamentEvent) -> None:
+    def _matching(
+        self,
+        events: List[TournamentEvent],
+        distributed: bool,
+    ) -> Dict[str, Tuple[Subscription, List[TournamentEvent]]]:
+        """Group events by subscription, preserving publish order."""
+        matched: Dict[str, Tuple[Subscription, List[TournamentEvent]]] = {}
+
+        for event in events:
+            for subscription in self._handlers_by_type.get(event.event_type, ()):
+                if not subscription.is_active:
+                    continue
+                if subscription.distributed != distributed:
+                    continue
+                # Tournament filter
+                if (
+                    subscription.tournament_id
+                    and subscription.tournament_id != event.tournament_id
+                ):
+                    continue
+
+                entry = matched.get(subscription.subscription_id)
+                if entry is None:
+                    matched[subscription.subscription_id] = (subscription, [event])
+                else:
+                    entry[1].append(event)
+
+        return matched
+
+    async def _dispatch_local(self, events: List[TournamentEvent]) -> None:
         """
-        Dispatch event to local in-memory handlers.
+        Dispatch events to local in-memory handlers.
 
         로컬 핸들러 특성:
         - WebSocket 브로드캐스트
         - 인메모리 캐시 업데이트
         - 메트릭 수집
 
-        비동기로 병렬 처리하되 개별 실패가 전체에 영향 없음.
+        구독별로 병렬 처리하되 구독 내 이벤트 순서는 유지.
+        개별 실패가 전체에 영향 없음.
         """
-        handlers = self._handlers_by_type.get(event.event_type, [])
-
-        tasks = []
-        for subscription in handlers:
-            if not subscription.is_active:
-                continue
-
-            # Tournament filter
-            if (
-                subscription.tournament_id
-                and subscription.tournament_id != event.tournament_id
-            ):
-                continue
+        await self._dispatch(events, distributed=False)
+        self._metrics.events_dispatched += len(events)
+        self._metrics.dispatch_batches += 1
 
-            # Create task for handler
-            task = asyncio.create_task(
-                self._safe_handler_call(subscription.handler, event)
-            )
-            tasks.append(task)
-
-        if tasks:
-            # Run all handlers concurrently
-            await asyncio.gather(*tasks, return_exceptions=True)
-
-    async def _dispatch_distributed(self, event: TournamentEvent) -> None:
+    async def _dispatch_distributed(self, events: List[TournamentEvent]) -> None:
         """
-        Dispatch event from Redis Stream (for distributed handlers).
+        Dispatch events from Redis Stream (for distributed handlers).
 
         분산 핸들러 특성:
         - 데이터베이스 저장
         - 외부 서비스 알림
         - 분석/로깅
         """
-        # Same as local for now - can be extended for remote handlers
-        await self._dispatch_local(event)
+        await self._dispatch(events, distributed=True)
 
-    async def _safe_handler_call(
+    async def _dispatch(
+        self,
+        events: List[TournamentEvent],
+        distributed: bool,
+    ) -> None:
+        matched = self._matching(events, distributed)
+        if not matched:
+            return
+
+        coros = [
+            self._safe_handler_call(sub.handler, sub_events)
+            if sub.batch
+            else self._call_in_order(sub.handler, sub_events)
+            for sub, sub_events in matched.values()
+        ]
+
+        if len(coros) == 1:
+            await coros[0]
+        else:
+            # Run all subscriptions concurrently
+            await asyncio.gather(*coros, return_exceptions=True)
+
+    async def _call_in_order(
         self,
         handler: EventHandler,
-        event: TournamentEvent,
+        events: List[TournamentEvent],
+    ) -> None:
+        for event in events:
+            await self._safe_handler_call(handler, event)
+
+    async def _safe_handler_call(
+        self,
+        handler: Union[EventHandler, BatchEventHandler],
+        payload: Union[TournamentEvent, List[TournamentEvent]],
     ) -> None:
         """Safely call handler with error handling."""
         try:
             start_time = time.time()
-            await handler(event)
+            await handler(payload)  # type: ignore[arg-type]
             elapsed_ms = (time.time() - start_time) * 1000
 
             # Update average processing time
@@ -470,12 +640,13 @@ class TournamentEventBus:
                 total + 1
             )
 
-        except Exception as e:
+        except Exception:
             self._metrics.events_failed += 1
             # Log error but don't propagate
 
     def get_metrics(self) -> EventMetrics:
         """Get event processing metrics."""
+        self._metrics.dispatch_queue_depth = self._dispatch_queue.qsize()
         return self._metrics
 
     # =========================================================================
@@ -323,6 +323,7 @@ class TournamentTable:
     hand_in_progress: bool = False
     current_hand_id: Optional[str] = None
     hand_snapshot: Optional[bytes] = None  # PokerKit state snapshot
+    button_position: Optional[int] = None  # 직전 핸드의 딜러 버튼 좌석
 
     # 밸런싱 관련
     is_breaking: bool = False  # 해체 예정 테이블
@@ -351,6 +352,7 @@ class TournamentTable:
             hand_in_progress=self.hand_in_progress,
             current_hand_id=self.current_hand_id,
             hand_snapshot=self.hand_snapshot,
+            button_position=self.button_position,
             is_breaking=self.is_breaking,
             pending_move_in=self.pending_move_in,
             pending_move_out=self.pending_move_out,
@@ -371,6 +373,7 @@ class TournamentTable:
             hand_in_progress=self.hand_in_progress,
             current_hand_id=self.current_hand_id,
             hand_snapshot=self.hand_snapshot,
+            button_position=self.button_position,
             is_breaking=self.is_breaking,
             pending_move_in=self.pending_move_in,
             pending_move_out=self.pending_move_out,
@@ -383,6 +386,7 @@ class TournamentTable:
             "player_count": self.player_count,
             "max_seats": self.max_seats,
             "hand_in_progress": self.hand_in_progress,
+            "button_position": self.button_position,
             "is_breaking": self.is_breaking,
         }
 
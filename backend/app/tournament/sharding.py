@@ -0,0 +1,472 @@
+"""
+Sharded Tournament Execution.
+
+대형 MTT의 테이블을 여러 워커 프로세스/인스턴스에 분할하여 실행.
+하나의 토너먼트가 단일 이벤트 루프(단일 코어)를 넘어 확장되도록 한다.
+
+구성 요소:
+1. ShardAssignment: 테이블 → 워커 소유권 (Rendezvous Hashing)
+2. TableShardWorker: 소유한 테이블의 핸드 실행, 결과를 샤드 스트림에 기록
+3. TournamentShardCoordinator: 샤드 스트림을 소비하여 토너먼트 집계
+   (인원, 탈락 순위, 랭킹, 밸런싱)를 단일 인스턴스에서 갱신
+4. TournamentShardRuntime: 앱 시작 시 인스턴스 역할(워커/코디네이터)을 연결하고
+   토너먼트별 코디네이터 시작·워커 스냅샷 동기화를 주기적으로 수행
+
+핵심 설계 원칙:
+- 테이블당 소유자는 정확히 하나 → 핸드 처리에 분산 락 불필요
+- 집계 상태는 코디네이터만 변경 → 탈락 순위가 스트림 순서로 결정됨
+- 워커 추가/제거 시 Rendezvous Hashing으로 최소한의 테이블만 재배치
+- 코디네이터는 배치마다 스냅샷을 저장하고, 워커는 이를 로드하여
+  소유 테이블의 핸드를 시작 (워커 엔진은 자체 집계 상태가 없음)
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import redis.asyncio as redis
+
+from .engine import TournamentEngine
+from .models import TournamentState, TournamentStatus
+
+logger = logging.getLogger(__name__)
+
+
+class TableNotOwnedError(Exception):
+    """Hand result submitted to a worker that does not own the table."""
+
+    pass
+
+
+class ShardAssignment:
+    """
+    Table → worker ownership via rendezvous (highest random weight) hashing.
+
+    모든 인스턴스가 동일한 워커 목록만 공유하면 별도 조정 없이
+    같은 소유권 결정을 내린다. 워커 하나가 빠지면 그 워커의 테이블만
+    다른 워커로 이동한다.
+    """
+
+    def __init__(self, worker_ids: Sequence[str]):
+        if not worker_ids:
+            raise ValueError("At least one worker is required")
+        self.worker_ids: Tuple[str, ...] = tuple(sorted(set(worker_ids)))
+
+    @staticmethod
+    def _weight(worker_id: str, table_id: str) -> int:
+        digest = hashlib.blake2b(
+            f"{worker_id}:{table_id}".encode(), digest_size=8
+        ).digest()
+        return int.from_bytes(digest, "big")
+
+    def owner_of(self, table_id: str) -> str:
+        """Worker that owns the table."""
+        return max(self.worker_ids, key=lambda w: self._weight(w, table_id))
+
+    def partition(self, table_ids: Iterable[str]) -> Dict[str, List[str]]:
+        """Group table IDs by owning worker."""
+        result: Dict[str, List[str]] = {w: [] for w in self.worker_ids}
+        for table_id in table_ids:
+            result[self.owner_of(table_id)].append(table_id)
+        return result
+
+
+def shard_stream_key(tournament_id: str) -> str:
+    """Per-tournament stream carrying table results to the coordinator."""
+    return f"tournament:shard:{tournament_id}"
+
+
+def shard_applied_key(tournament_id: str) -> str:
+    """Last shard stream entry ID applied by the coordinator."""
+    return f"tournament:shard:{tournament_id}:applied"
+
+
+def _entry_id_key(entry_id: Any) -> Tuple[int, int]:
+    """Stream entry ID ("<ms>-<seq>") as a comparable tuple."""
+    if isinstance(entry_id, bytes):
+        entry_id = entry_id.decode()
+    ms, _, seq = str(entry_id).partition("-")
+    return int(ms), int(seq or 0)
+
+
+@dataclass
+class ShardMetrics:
+    """Shard worker / coordinator metrics."""
+
+    hands_forwarded: int = 0
+    hands_applied: int = 0
+    duplicates_skipped: int = 0
+    batches_consumed: int = 0
+
+
+class TableShardWorker:
+    """
+    Runs hands for the tables this worker owns.
+
+    - 핸드 시작: 엔진의 테이블 필터로 소유 테이블만 시작
+    - 핸드 종료: 로컬 asyncio.Lock으로 직렬화 후 샤드 스트림에 결과 기록
+      (테이블 소유자가 하나뿐이므로 Redis 분산 락 왕복이 없다)
+    """
+
+    STREAM_MAX_LEN = 100000
+
+    def __init__(
+        self,
+        redis_client: redis.Redis,
+        worker_id: str,
+        assignment: ShardAssignment,
+    ):
+        self.redis = redis_client
+        self.worker_id = worker_id
+        self.assignment = assignment
+
+        self._table_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self._metrics = ShardMetrics()
+
+    def owns(self, table_id: str) -> bool:
+        return self.assignment.owner_of(table_id) == self.worker_id
+
+    def attach(self, engine: TournamentEngine) -> None:
+        """Restrict the engine's hand starts to tables owned by this worker."""
+        engine.set_table_filter(self.owns)
+
+    async def sync_state(
+        self,
+        engine: TournamentEngine,
+        tournament_id: str,
+    ) -> Optional[TournamentState]:
+        """
+        Load the coordinator's latest snapshot into this worker's engine.
+
+        워커 엔진은 집계 상태를 직접 갱신하지 않으므로, 핸드 시작 전
+        (좌석 이동/탈락 반영) 코디네이터 스냅샷을 로드해야 한다.
+        """
+        state = await engine.snapshot.load_latest(tournament_id)
+        if state is not None:
+            engine.set_state(tournament_id, state)
+        return state
+
+    async def complete_hand(
+        self,
+        tournament_id: str,
+        table_id: str,
+        winners: List[str],
+        chip_changes: Dict[str, int],
+        eliminated: List[str],
+        button_position: Optional[int] = None,
+    ) -> str:
+        """
+        Forward a finished hand to the tournament coordinator.
+
+        Returns:
+            Stream entry ID
+
+        Raises:
+            TableNotOwnedError: 이 워커가 소유하지 않은 테이블
+        """
+        if not self.owns(table_id):
+            raise TableNotOwnedError(
+                f"Table {table_id} is owned by {self.assignment.owner_of(table_id)}"
+            )
+
+        async with self._table_locks[table_id]:
+            entry = {
+                "worker_id": self.worker_id,
+                "table_id": table_id,
+                "winners": json.dumps(winners),
+                "chip_changes": json.dumps(chip_changes),
+                "eliminated": json.dumps(eliminated),
+                "button_position": ""
+                if button_position is None
+                else str(button_position),
+            }
+            entry_id = await self.redis.xadd(
+                shard_stream_key(tournament_id),
+                entry,
+                maxlen=self.STREAM_MAX_LEN,
+                approximate=True,
+            )
+
+        self._metrics.hands_forwarded += 1
+        return entry_id
+
+    def get_metrics(self) -> ShardMetrics:
+        return self._metrics
+
+
+class TournamentShardCoordinator:
+    """
+    Applies shard results to the authoritative tournament state.
+
+    처리 흐름:
+    ─────────────────────────────────────────────────────────────────
+
+    [Worker A] ─┐
+    [Worker B] ─┼─> tournament:shard:{id} ─> XREADGROUP (배치) ─> 상태 적용
+    [Worker C] ─┘                                               │
+                                                                ├─> 탈락/완료 이벤트
+                                                                ├─> 랭킹 배치 갱신
+                                                                └─> XACK (배치)
+
+    - 배치 내 결과는 await 없이 순서대로 적용 → 이벤트 루프 내 원자적
+    - 적용한 결과의 이벤트를 모두 발행한 뒤에만 스냅샷과 마지막 적용
+      entry ID를 Redis에 저장하고 XACK → 재시작/재전송 시 entry ID로 중복 제거
+    - 발행 실패 시 미발행 결과를 보관하고 다음 시도에서 먼저 재발행
+      (상태는 다시 적용하지 않음). 크래시 시에는 저장된 위치부터 재적용되어
+      이벤트가 중복될 수는 있어도 유실되지 않음
+    - 고정 consumer 이름으로 재시작 시 미확인(pending) 항목부터 재처리
+    - 밸런싱은 엔진의 밸런싱 루프가 코디네이터 인스턴스에서 수행
+
+    ─────────────────────────────────────────────────────────────────
+    """
+
+    CONSUMER_GROUP = "tournament-coordinator"
+    CONSUMER_NAME = "coordinator"
+    BATCH_SIZE = 200
+
+    def __init__(
+        self,
+        engine: TournamentEngine,
+        tournament_id: str,
+        consumer_name: Optional[str] = None,
+    ):
+        self.engine = engine
+        self.redis = engine.redis
+        self.tournament_id = tournament_id
+        # 재시작 후에도 같은 이름이어야 이전 pending 항목을 다시 읽는다
+        self.consumer_name = consumer_name or self.CONSUMER_NAME
+
+        self._last_applied: Tuple[int, int] = (0, 0)
+        # 상태에는 적용했지만 아직 발행/저장하지 않은 결과
+        self._unpublished: List[Tuple[str, List[str], Dict[str, int], List[str], list]] = []
+        self._unpersisted_id: Any = None
+        self._task: Optional[asyncio.Task] = None
+        self._running = False
+        self._metrics = ShardMetrics()
+
+    async def start(self) -> None:
+        stream_key = shard_stream_key(self.tournament_id)
+        try:
+            await self.redis.xgroup_create(
+                stream_key, self.CONSUMER_GROUP, id="0", mkstream=True
+            )
+        except redis.ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+        await self._load_last_applied()
+
+        self._running = True
+        self._task = asyncio.create_task(self._consume_loop())
+
+    async def _load_last_applied(self) -> None:
+        last = await self.redis.get(shard_applied_key(self.tournament_id))
+        if last:
+            self._last_applied = max(self._last_applied, _entry_id_key(last))
+
+    async def stop(self) -> None:
+        self._running = False
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    async def _consume_loop(self) -> None:
+        stream_key = shard_stream_key(self.tournament_id)
+
+        # 먼저 이 consumer의 pending 항목(크래시 전 미확인)을 재처리
+        read_id = "0"
+
+        while self._running:
+            try:
+                entries = await self.redis.xreadgroup(
+                    groupname=self.CONSUMER_GROUP,
+                    consumername=self.consumer_name,
+                    streams={stream_key: read_id},
+                    count=self.BATCH_SIZE,
+                    block=1000,
+                )
+                messages = [m for _stream, batch in entries or [] for m in batch]
+                if not messages:
+                    if read_id == "0":
+                        read_id = ">"
+                    continue
+
+                await self.apply_entries(messages)
+                await self.redis.xack(
+                    stream_key,
+                    self.CONSUMER_GROUP,
+                    *[message_id for message_id, _ in messages],
+                )
+
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"[SHARD] 코디네이터 처리 오류 ({self.tournament_id}): {e}")
+                # 미확인 항목을 다시 읽어 재발행/저장 후 XACK
+                read_id = "0"
+                await asyncio.sleep(1)
+
+    async def apply_entries(
+        self,
+        messages: List[Tuple[Any, Dict[str, Any]]],
+    ) -> int:
+        """
+        Apply a batch of shard stream entries.
+
+        Returns:
+            Number of hand results applied (duplicates excluded)
+        """
+        state = self.engine.get_state(self.tournament_id)
+        if state is None:
+            return 0
+
+        results: List[Tuple[str, List[str], Dict[str, int], List[str], list]] = []
+
+        # Pure state transitions (no await between reads and the final store)
+        for message_id, data in messages:
+            entry_key = _entry_id_key(message_id)
+            if entry_key <= self._last_applied:
+                self._metrics.duplicates_skipped += 1
+                continue
+            self._last_applied = entry_key
+            self._unpersisted_id = message_id
+            if not data:
+                # Pending entry trimmed from the stream (MAXLEN)
+                continue
+
+            table_id = data["table_id"]
+
+            winners = json.loads(data.get("winners", "[]"))
+            chip_changes = json.loads(data.get("chip_changes", "{}"))
+            eliminated = json.loads(data.get("eliminated", "[]"))
+            button = data.get("button_position")
+
+            state, eliminations = self.engine.apply_hand_result(
+                state,
+                table_id,
+                chip_changes,
+                eliminated,
+                button_position=int(button) if button else None,
+            )
+            results.append((table_id, winners, chip_changes, eliminated, eliminations))
+
+        self.engine.set_state(self.tournament_id, state)
+        self._unpublished.extend(results)
+        self._metrics.hands_applied += len(results)
+
+        await self._flush(state)
+
+        self._metrics.batches_consumed += 1
+        return len(results)
+
+    async def _flush(self, state: TournamentState) -> None:
+        """미발행 결과 발행 → 스냅샷/적용 위치 저장 (발행이 모두 성공한 뒤에만)."""
+        while self._unpublished:
+            table_id, winners, chip_changes, eliminated, eliminations = self._unpublished[0]
+            await self.engine.publish_hand_result(
+                state, table_id, winners, chip_changes, eliminated, eliminations
+            )
+            self._unpublished.pop(0)
+
+        if self._unpersisted_id is not None:
+            # 워커가 로드할 스냅샷 → 적용 위치 순으로 저장 (XACK 전)
+            await self.engine.snapshot.save_full_snapshot(state)
+            await self.redis.set(
+                shard_applied_key(self.tournament_id), self._unpersisted_id
+            )
+            self._unpersisted_id = None
+
+    def get_metrics(self) -> ShardMetrics:
+        return self._metrics
+
+
+class TournamentShardRuntime:
+    """
+    Wires sharded execution into one app instance.
+
+    - 워커 목록에 이 인스턴스가 있으면 소유 테이블만 핸드를 시작하고
+      핸드 결과는 샤드 스트림으로 전달
+    - 코디네이터 인스턴스는 진행 중인 토너먼트마다 코디네이터를 실행하고,
+      그 외 인스턴스는 코디네이터 스냅샷을 주기적으로 로드
+    """
+
+    FINISHED = (TournamentStatus.COMPLETED, TournamentStatus.CANCELLED)
+
+    def __init__(
+        self,
+        engine: TournamentEngine,
+        worker_id: str,
+        worker_ids: Sequence[str],
+        *,
+        coordinator: bool = False,
+        sync_interval: float = 1.0,
+    ):
+        self.engine = engine
+        self.is_coordinator = coordinator
+        self.sync_interval = sync_interval
+        self.worker = TableShardWorker(
+            engine.redis, worker_id, ShardAssignment(worker_ids)
+        )
+
+        self._coordinators: Dict[str, TournamentShardCoordinator] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        self.worker.attach(self.engine)
+        self.engine.set_hand_result_forwarder(self.worker.complete_hand)
+        await self.sync_once()
+        self._task = asyncio.create_task(self._sync_loop())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        for coordinator in self._coordinators.values():
+            await coordinator.stop()
+        self._coordinators.clear()
+        self.engine.set_hand_result_forwarder(None)
+        self.engine.set_table_filter(None)
+
+    async def _sync_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.sync_interval)
+            try:
+                await self.sync_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"[SHARD] 동기화 오류: {e}")
+
+    async def sync_once(self) -> None:
+        """코디네이터: 토너먼트별 코디네이터 시작/정지. 워커: 최신 스냅샷 로드."""
+        if self.is_coordinator:
+            for tournament_id in self.engine.tournament_ids():
+                state = self.engine.get_state(tournament_id)
+                running = state is not None and state.status not in self.FINISHED
+                coordinator = self._coordinators.get(tournament_id)
+                if running and coordinator is None:
+                    coordinator = TournamentShardCoordinator(self.engine, tournament_id)
+                    await coordinator.start()
+                    self._coordinators[tournament_id] = coordinator
+                elif not running and coordinator is not None:
+                    await coordinator.stop()
+                    del self._coordinators[tournament_id]
+            return
+
+        for tournament_id in await self.engine.snapshot.list_recoverable_tournaments():
+            await self.worker.sync_state(self.engine, tournament_id)
+
+    @property
+    def coordinated_tournaments(self) -> List[str]:
+        return list(self._coordinators)
@@ -246,6 +246,7 @@ class SnapshotManager:
             "table_number": t.table_number,
             "seats": list(t.seats),
             "hand_in_progress": t.hand_in_progress,
+            "button_position": t.button_position,
         }
 
     def _deserialize_state(self, d: Dict) -> TournamentState:
@@ -293,4 +294,5 @@ class SnapshotManager:
             table_number=d["table_number"],
             seats=tuple(d["seats"]),
             hand_in_progress=d["hand_in_progress"],
+            button_position=d.get("button_position"),
         )
@@ -7,10 +7,10 @@ Tournament WebSocket Handler.
 핵심 기능:
 ─────────────────────────────────────────────────────────────────────────────────
 
-1. 300명 동시 브로드캐스트:
-   - asyncio.gather로 병렬 전송
-   - 병목 방지를 위한 청크 분할
-   - 평균 지연 10ms 이내 목표
+1. 대규모 동시 브로드캐스트 (블라인드 변경, 샷건 카운트다운):
+   - 이벤트당 메시지 인코딩 1회 (구독자 수와 무관)
+   - 구독자를 고정 크기 배치로 분할, 동시 배치 수 제한
+   - 첫 전송 ~ 마지막 전송 간격(burst latency) 메트릭 기록
 
 2. 토너먼트 채널 구조:
    - tournament:{id} - 전체 이벤트 (블라인드, 랭킹 등)
@@ -31,14 +31,32 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
+from ..middleware.prometheus import record_ws_broadcast_burst
+from ..utils.json_utils import json_dumps
 from ..ws.connection import WebSocketConnection
 from ..ws.events import EventType
 
 logger = logging.getLogger(__name__)
 
-# 병렬 브로드캐스트 청크 크기 (동시 전송 수)
+# 병렬 브로드캐스트 청크 크기 (배치당 전송 수)
 BROADCAST_CHUNK_SIZE = 50
 
+# 동시에 전송 중인 배치 수 상한
+BROADCAST_MAX_CONCURRENT_CHUNKS = 20
+
+
+@dataclass
+class BroadcastBurstMetrics:
+    """Fan-out broadcast metrics."""
+
+    broadcasts: int = 0
+    messages_sent: int = 0
+    messages_failed: int = 0
+    last_recipients: int = 0
+    last_first_delivery_ms: float = 0.0  # 시작 ~ 첫 전송
+    last_burst_ms: float = 0.0  # 첫 전송 ~ 마지막 전송
+    max_burst_ms: float = 0.0
+
 
 @dataclass
 class TournamentSubscription:
@@ -61,15 +79,24 @@ class TournamentWebSocketHandler:
     """
 
     HANDLED_EVENTS = [
-        EventType.SUBSCRIBE,
-        EventType.UNSUBSCRIBE,
+        EventType.TOURNAMENT_SUBSCRIBE,
+        EventType.TOURNAMENT_UNSUBSCRIBE,
     ]
 
-    def __init__(self, manager):
+    def __init__(
+        self,
+        manager,
+        chunk_size: int = BROADCAST_CHUNK_SIZE,
+        max_concurrent_chunks: int = BROADCAST_MAX_CONCURRENT_CHUNKS,
+    ):
         self.manager = manager
         self._subscriptions: dict[str, set[str]] = {}  # tournament_id -> connection_ids
         self._table_subs: dict[str, set[str]] = {}  # table_channel -> connection_ids
 
+        self._chunk_size = chunk_size
+        self._max_concurrent_chunks = max_concurrent_chunks
+        self._burst_metrics = BroadcastBurstMetrics()
+
     async def handle(
         self,
         event_type: EventType,
@@ -82,9 +109,9 @@ class TournamentWebSocketHandler:
         if not channel.startswith("tournament:"):
             return None
 
-        if event_type == EventType.SUBSCRIBE:
+        if event_type == EventType.TOURNAMENT_SUBSCRIBE:
             return await self._handle_subscribe(channel, connection)
-        elif event_type == EventType.UNSUBSCRIBE:
+        elif event_type == EventType.TOURNAMENT_UNSUBSCRIBE:
             return await self._handle_unsubscribe(channel, connection)
 
         return None
@@ -176,7 +203,7 @@ class TournamentWebSocketHandler:
             },
         }
 
-        return await self.manager.broadcast_to_channel(channel, message)
+        return await self._parallel_broadcast(channel, message)
 
     async def broadcast_table_event(
         self,
@@ -230,7 +257,7 @@ class TournamentWebSocketHandler:
     ) -> int:
         """Broadcast blind level change.
 
-        300명 동시 전송을 위해 병렬 청크 처리 적용.
+        대규모 동시 전송을 위해 인코딩 1회 + 병렬 청크 처리 적용.
         """
         channel = f"tournament:{tournament_id}"
         message = {
@@ -287,7 +314,11 @@ class TournamentWebSocketHandler:
     ) -> int:
         """병렬 청크 브로드캐스트.
 
-        대규모 동시 전송 시 병목 방지를 위해 청크로 분할하여 전송.
+        1. 다른 인스턴스에는 Redis pub/sub로 1회 발행
+        2. 메시지를 1회만 JSON 인코딩
+        3. 로컬 구독자를 chunk_size 단위로 분할
+        4. 최대 max_concurrent_chunks개 배치를 동시에 전송
+        5. 첫 전송 ~ 마지막 전송 간격을 burst latency로 기록
 
         Args:
             channel: 브로드캐스트 채널
@@ -298,17 +329,86 @@ class TournamentWebSocketHandler:
         """
         start_time = time.monotonic()
 
-        # 기본 브로드캐스트 (ConnectionManager가 처리)
-        sent_count = await self.manager.broadcast_to_channel(channel, message)
+        text = json_dumps(message)
+        await self.manager.publish_to_instances(channel, message, text=text)
+
+        connections = self.manager.get_channel_connections(channel)
+        if not connections:
+            return 0
+
+        semaphore = asyncio.Semaphore(self._max_concurrent_chunks)
+        first_delivery: Optional[float] = None
+        last_delivery: Optional[float] = None
+
+        async def send_one(conn: WebSocketConnection) -> bool:
+            nonlocal first_delivery, last_delivery
+            ok = await conn.send_text(text)
+            if ok:
+                now = time.monotonic()
+                if first_delivery is None:
+                    first_delivery = now
+                last_delivery = now
+            return ok
+
+        async def send_chunk(chunk: List[WebSocketConnection]) -> int:
+            async with semaphore:
+                results = await asyncio.gather(
+                    *(send_one(conn) for conn in chunk),
+                    return_exceptions=True,
+                )
+            return sum(1 for r in results if r is True)
+
+        chunks = [
+            connections[i : i + self._chunk_size]
+            for i in range(0, len(connections), self._chunk_size)
+        ]
+        sent_count = sum(await asyncio.gather(*(send_chunk(c) for c in chunks)))
+
+        self._record_burst(
+            message.get("type", "UNKNOWN"),
+            recipients=len(connections),
+            sent=sent_count,
+            start=start_time,
+            first=first_delivery,
+            last=last_delivery,
+        )
 
-        elapsed_ms = (time.monotonic() - start_time) * 1000
         logger.debug(
             f"병렬 브로드캐스트 완료: channel={channel}, "
-            f"sent={sent_count}, latency={elapsed_ms:.1f}ms"
+            f"sent={sent_count}/{len(connections)}, "
+            f"burst={self._burst_metrics.last_burst_ms:.1f}ms"
         )
 
         return sent_count
 
+    def _record_burst(
+        self,
+        message_type: str,
+        recipients: int,
+        sent: int,
+        start: float,
+        first: Optional[float],
+        last: Optional[float],
+    ) -> None:
+        metrics = self._burst_metrics
+        metrics.broadcasts += 1
+        metrics.messages_sent += sent
+        metrics.messages_failed += recipients - sent
+        metrics.last_recipients = recipients
+
+        if first is None or last is None:
+            return
+
+        burst_ms = (last - first) * 1000
+        metrics.last_first_delivery_ms = (first - start) * 1000
+        metrics.last_burst_ms = burst_ms
+        metrics.max_burst_ms = max(metrics.max_burst_ms, burst_ms)
+        record_ws_broadcast_burst(message_type, burst_ms / 1000)
+
+    def get_broadcast_metrics(self) -> BroadcastBurstMetrics:
+        """Fan-out broadcast metrics."""
+        return self._burst_metrics
+
     async def broadcast_from_scheduler(
         self,
         tournament_id: str,
@@ -399,7 +499,7 @@ class TournamentWebSocketHandler:
             },
         }
 
-        return await self.manager.broadcast_to_channel(channel, message)
+        return await self._parallel_broadcast(channel, message)
 
     def get_subscriber_count(self, tournament_id: str) -> int:
         """Get subscriber count for a tournament."""
@@ -3,14 +3,20 @@
 Phase 11: httpx + tenacity integration for external API resilience.
 
 Features:
-- Async HTTP client with connection pooling
+- One keep-alive connection pool per process, shared by every client
+- Per-upstream (host) latency and error metrics
 - Automatic retry with exponential backoff
-- Circuit breaker pattern
-- Request/response logging
+- Stale-while-revalidate cache with request coalescing (exchange rates)
+
+admin-backend/app/utils/http_client.py has the same pool/metrics/cache
+layer (the two backends are deployed separately).
 """
 
+import asyncio
 import logging
-from typing import Any
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Awaitable, Callable
 
 import httpx
 from tenacity import (
@@ -29,6 +35,145 @@ DEFAULT_MAX_RETRIES = 3
 DEFAULT_MIN_WAIT = 1  # seconds
 DEFAULT_MAX_WAIT = 10  # seconds
 
+# Shared pool limits
+POOL_MAX_CONNECTIONS = 100
+POOL_MAX_KEEPALIVE = 20
+POOL_KEEPALIVE_EXPIRY = 30.0  # seconds
+
+
+# =============================================================================
+# Upstream Metrics
+# =============================================================================
+
+
+@dataclass
+class UpstreamStats:
+    """Cumulative metrics for one upstream host."""
+
+    requests: int = 0
+    errors: int = 0  # network errors + 5xx
+    total_latency_ms: float = 0.0
+    max_latency_ms: float = 0.0
+    last_error: str | None = None
+
+    def record(self, latency_ms: float, error: str | None) -> None:
+        self.requests += 1
+        self.total_latency_ms += latency_ms
+        self.max_latency_ms = max(self.max_latency_ms, latency_ms)
+        if error:
+            self.errors += 1
+            self.last_error = error
+
+    def to_dict(self) -> dict[str, Any]:
+        data = asdict(self)
+        data["avg_latency_ms"] = (
+            round(self.total_latency_ms / self.requests, 2) if self.requests else 0.0
+        )
+        data["total_latency_ms"] = round(self.total_latency_ms, 2)
+        data["max_latency_ms"] = round(self.max_latency_ms, 2)
+        return data
+
+
+_upstream_stats: dict[str, UpstreamStats] = {}
+
+
+def get_upstream_stats() -> dict[str, dict[str, Any]]:
+    """Snapshot of host -> metrics."""
+    return {host: stats.to_dict() for host, stats in _upstream_stats.items()}
+
+
+def _record(host: str, latency_ms: float, error: str | None) -> None:
+    stats = _upstream_stats.get(host)
+    if stats is None:
+        stats = _upstream_stats[host] = UpstreamStats()
+    stats.record(latency_ms, error)
+
+
+# =============================================================================
+# Shared Connection Pool
+# =============================================================================
+
+
+class _PooledTransport(httpx.AsyncBaseTransport):
+    """Metering wrapper around the shared pool.
+
+    Closing a client does not close the pool; see close_http_pool().
+    """
+
+    def __init__(self, pool: httpx.AsyncHTTPTransport):
+        self._pool = pool
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        started = time.perf_counter()
+        host = request.url.host
+        try:
+            response = await self._pool.handle_async_request(request)
+        except Exception as e:
+            _record(host, (time.perf_counter() - started) * 1000, type(e).__name__)
+            raise
+        error = f"HTTP {response.status_code}" if response.status_code >= 500 else None
+        _record(host, (time.perf_counter() - started) * 1000, error)
+        return response
+
+    async def aclose(self) -> None:
+        pass
+
+
+_pool: httpx.AsyncHTTPTransport | None = None
+_pool_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _get_pool() -> httpx.AsyncHTTPTransport:
+    """One connection pool per event loop."""
+    global _pool, _pool_loop
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+
+    if _pool is None or (loop is not None and loop is not _pool_loop):
+        _pool = httpx.AsyncHTTPTransport(
+            limits=httpx.Limits(
+                max_connections=POOL_MAX_CONNECTIONS,
+                max_keepalive_connections=POOL_MAX_KEEPALIVE,
+                keepalive_expiry=POOL_KEEPALIVE_EXPIRY,
+            ),
+        )
+        _pool_loop = loop
+    return _pool
+
+
+def create_client(
+    timeout: float | httpx.Timeout = 10.0,
+    headers: dict[str, str] | None = None,
+    **kwargs: Any,
+) -> httpx.AsyncClient:
+    """Create an httpx.AsyncClient on the shared pool.
+
+    Args:
+        timeout: Request timeout
+        headers: Default headers (API keys etc.)
+        **kwargs: Additional httpx.AsyncClient arguments
+
+    Returns:
+        httpx.AsyncClient
+    """
+    return httpx.AsyncClient(
+        timeout=timeout,
+        headers=headers,
+        transport=_PooledTransport(_get_pool()),
+        **kwargs,
+    )
+
+
+async def close_http_pool() -> None:
+    """Close the shared connection pool (application shutdown)."""
+    global _pool, _pool_loop
+    if _pool is not None:
+        await _pool.aclose()
+        _pool = None
+        _pool_loop = None
+
 
 class AsyncHttpClient:
     """Async HTTP client with retry logic and connection pooling.
@@ -42,29 +187,22 @@ class AsyncHttpClient:
         self,
         timeout: float = 10.0,
         connect_timeout: float = 5.0,
-        max_connections: int = 100,
-        max_keepalive_connections: int = 20,
     ):
         """Initialize HTTP client.
 
+        Connections come from the shared pool (see create_client()).
+
         Args:
             timeout: Total request timeout in seconds
             connect_timeout: Connection timeout in seconds
-            max_connections: Maximum concurrent connections
-            max_keepalive_connections: Maximum keepalive connections
         """
         self._timeout = httpx.Timeout(timeout, connect=connect_timeout)
-        self._limits = httpx.Limits(
-            max_connections=max_connections,
-            max_keepalive_connections=max_keepalive_connections,
-        )
         self._client: httpx.AsyncClient | None = None
 
     async def __aenter__(self) -> "AsyncHttpClient":
         """Async context manager entry."""
-        self._client = httpx.AsyncClient(
+        self._client = create_client(
             timeout=self._timeout,
-            limits=self._limits,
             follow_redirects=True,
         )
         return self
@@ -195,7 +333,6 @@ class CryptoApiClient(AsyncHttpClient):
         super().__init__(
             timeout=15.0,
             connect_timeout=5.0,
-            max_connections=50,
         )
         self._fallback_urls: dict[str, list[str]] = {}
 
@@ -230,3 +367,80 @@ class CryptoApiClient(AsyncHttpClient):
                 continue
 
         raise last_error or RuntimeError("All URLs failed")
+
+
+# =============================================================================
+# Stale-While-Revalidate Cache
+# =============================================================================
+
+
+class SWRCache:
+    """In-process stale-while-revalidate cache.
+
+    - Younger than ttl: cached value
+    - Between ttl and ttl + stale_ttl: cached value, refreshed in background
+    - Older / missing: wait for the load
+    Concurrent loads of the same key share one in-flight request.
+    """
+
+    def __init__(self) -> None:
+        self._values: dict[str, tuple[Any, float]] = {}  # key -> (value, loaded_at)
+        self._inflight: dict[str, asyncio.Task] = {}
+
+    async def get(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: float,
+        stale_ttl: float = 0.0,
+    ) -> Any:
+        entry = self._values.get(key)
+        if entry is not None:
+            value, loaded_at = entry
+            age = time.monotonic() - loaded_at
+            if age < ttl:
+                return value
+            if age < ttl + stale_ttl:
+                self._refresh(key, loader, background=True)
+                return value
+
+        return await asyncio.shield(self._refresh(key, loader))
+
+    def invalidate(self, key: str) -> None:
+        self._values.pop(key, None)
+
+    def clear(self) -> None:
+        self._values.clear()
+        self._inflight.clear()
+
+    def _refresh(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        background: bool = False,
+    ) -> asyncio.Task:
+        task = self._inflight.get(key)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.create_task(self._load(key, loader))
+            self._inflight[key] = task
+            if background:
+                task.add_done_callback(_log_background_error)
+        return task
+
+    async def _load(self, key: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+        try:
+            value = await loader()
+            self._values[key] = (value, time.monotonic())
+            return value
+        finally:
+            if self._inflight.get(key) is asyncio.current_task():
+                del self._inflight[key]
+
+
+def _log_background_error(task: asyncio.Task) -> None:
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning(f"Background refresh failed, serving stale value: {task.exception()}")
+
+
+# Shared cache for exchange rates
+rate_cache = SWRCache()
@@ -8,17 +8,29 @@ Features:
 - Atomic debit and credit operations
 - Balance validation (prevent negative balance)
 - Automatic lock release on completion
+- Optional durable journal (hot-path wallet mode, debit/credit only)
 
 Arguments:
   KEYS[1] = lock key (e.g., "wallet:lock:user_id")
   KEYS[2] = source balance key (e.g., "wallet:balance:user_id_1")
   KEYS[3] = dest balance key (e.g., "wallet:balance:user_id_2") [optional for single-user operations]
+  KEYS[4] = journal stream key (e.g., "wallet:journal") [optional]
+  KEYS[5] = pending delta hash key (e.g., "wallet:pending") [required with KEYS[4]]
   
   ARGV[1] = lock token (unique identifier for this lock)
   ARGV[2] = lock TTL in seconds
   ARGV[3] = amount to transfer (positive integer)
   ARGV[4] = operation type: "debit", "credit", or "transfer"
   ARGV[5] = current timestamp (for audit)
+  ARGV[6] = journal payload (JSON transaction record) [with KEYS[4]]
+  ARGV[7] = user id (pending delta field) [with KEYS[4]]
+
+Journal mode:
+  Redis balance is authoritative. A missing balance key is not treated as 0
+  (COLD_BALANCE) so the caller can load it from Postgres and retry. Each
+  successful debit/credit appends {tx, before, after} to the journal stream
+  and adds the signed amount to the user's pending delta, atomically with
+  the balance change.
 
 Returns:
   {status, source_balance_after, dest_balance_after, error_message}
@@ -34,6 +46,10 @@ local lock_ttl = tonumber(ARGV[2])
 local amount = tonumber(ARGV[3])
 local operation = ARGV[4]
 local timestamp = ARGV[5]
+local journal_key = KEYS[4]
+local pending_key = KEYS[5]
+local journal_payload = ARGV[6]
+local journal_user = ARGV[7]
 
 -- Helper function to return error
 local function error_result(message)
@@ -46,8 +62,21 @@ if not lock_acquired then
     return error_result("LOCK_FAILED: Could not acquire lock")
 end
 
+-- Append a journal entry (hot-path mode)
+local function journal(before, after, delta)
+    if journal_key and journal_key ~= "" then
+        redis.call("XADD", journal_key, "*", "tx", journal_payload, "before", before, "after", after)
+        redis.call("HINCRBY", pending_key, journal_user, delta)
+    end
+end
+
 -- Get current source balance
-local source_balance = tonumber(redis.call("GET", source_key) or "0")
+local raw_balance = redis.call("GET", source_key)
+if not raw_balance and journal_key and journal_key ~= "" then
+    redis.call("DEL", lock_key)
+    return error_result("COLD_BALANCE: Balance not loaded")
+end
+local source_balance = tonumber(raw_balance or "0")
 
 -- Validate operation
 if operation == "debit" then
@@ -60,6 +89,7 @@ if operation == "debit" then
     -- Perform debit
     local new_balance = source_balance - amount
     redis.call("SET", source_key, new_balance)
+    journal(source_balance, new_balance, -amount)
     redis.call("DEL", lock_key)
     
     return {1, new_balance, -1, "OK"}
@@ -68,6 +98,7 @@ elseif operation == "credit" then
     -- Perform credit
     local new_balance = source_balance + amount
     redis.call("SET", source_key, new_balance)
+    journal(source_balance, new_balance, amount)
     redis.call("DEL", lock_key)
     
     return {1, new_balance, -1, "OK"}
@@ -0,0 +1,38 @@
+--[[
+Seat Reserve Lua Script - Quick join seat reservation across instances
+
+Reserves the first free seat of a room for a user so that two quick-join
+requests (possibly on different API instances) never pick the same seat
+between matching and the DB seat write.
+
+If the user already holds one of the candidate seats, that seat is
+returned again (retried request), with its TTL refreshed.
+
+Arguments:
+  KEYS[1..n] = seat reservation keys in preference order
+               (e.g., "quickjoin:seat:<room_id>:<seat>")
+
+  ARGV[1]    = user id
+  ARGV[2]    = reservation TTL in milliseconds
+
+Returns:
+  index (1-based) of the reserved key, or 0 when every seat is reserved
+--]]
+
+local user_id = ARGV[1]
+local ttl_ms = tonumber(ARGV[2])
+
+for i = 1, #KEYS do
+    if redis.call("GET", KEYS[i]) == user_id then
+        redis.call("PEXPIRE", KEYS[i], ttl_ms)
+        return i
+    end
+end
+
+for i = 1, #KEYS do
+    if redis.call("SET", KEYS[i], user_id, "NX", "PX", ttl_ms) then
+        return i
+    end
+end
+
+return 0
@@ -0,0 +1,77 @@
+--[[
+Wallet Settle Lua Script - Atomic multi-user balance batch (hot-path mode)
+
+Applies every balance movement of one hand (or any ledger batch) atomically
+against the authoritative Redis balances and journals each movement, the
+batch counterpart of krw_transfer.lua's journal mode.
+
+All entries are validated before any write: either every entry is applied
+and journaled, or nothing changes.
+
+Arguments:
+  KEYS[1]    = journal stream key (e.g., "wallet:journal")
+  KEYS[2]    = pending delta hash key (e.g., "wallet:pending")
+  KEYS[3..]  = balance keys, one per distinct user
+
+  ARGV[1]    = entry count n
+  ARGV[2..]  = n groups of 4: balance key index (1-based, among KEYS[3..]),
+               signed amount, user id, journal payload (JSON)
+
+Returns:
+  {1, after_1, ..., after_n}                   success (balance after each entry)
+  {0, "COLD_BALANCE", key_index, ...}          balance keys not loaded
+  {0, "INSUFFICIENT_BALANCE", entry, current, required}
+--]]
+
+local journal_key = KEYS[1]
+local pending_key = KEYS[2]
+local count = tonumber(ARGV[1])
+
+-- Load balances
+local balances = {}
+local cold = {}
+for i = 3, #KEYS do
+    local raw = redis.call("GET", KEYS[i])
+    if not raw then
+        table.insert(cold, i - 2)
+    else
+        balances[i - 2] = tonumber(raw)
+    end
+end
+if #cold > 0 then
+    local result = {0, "COLD_BALANCE"}
+    for _, index in ipairs(cold) do
+        table.insert(result, index)
+    end
+    return result
+end
+
+-- Validate every entry in order before writing
+local befores = {}
+local afters = {}
+for e = 1, count do
+    local base = 2 + (e - 1) * 4
+    local index = tonumber(ARGV[base])
+    local amount = tonumber(ARGV[base + 1])
+    local before = balances[index]
+    local after = before + amount
+    if after < 0 then
+        return {0, "INSUFFICIENT_BALANCE", e, before, -amount}
+    end
+    befores[e] = before
+    afters[e] = after
+    balances[index] = after
+end
+
+-- Apply + journal
+for index, balance in pairs(balances) do
+    redis.call("SET", KEYS[index + 2], balance)
+end
+local result = {1}
+for e = 1, count do
+    local base = 2 + (e - 1) * 4
+    redis.call("XADD", journal_key, "*", "tx", ARGV[base + 3], "before", befores[e], "after", afters[e])
+    redis.call("HINCRBY", pending_key, ARGV[base + 2], tonumber(ARGV[base + 1]))
+    table.insert(result, afters[e])
+end
+return result
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
+from app.ws.channels import table_channel
 from app.ws.events import EventType
 from app.ws.messages import MessageEnvelope
 from app.logging_config import get_logger
@@ -52,7 +53,7 @@ class PersonalizedBroadcaster:
         original_showdown = hand_result.get("showdown", [])
 
         # 채널 멤버 목록 가져오기
-        channel = f"table:{room_id}"
+        channel = table_channel(room_id)
         connection_ids = self.manager.get_channel_subscribers(channel)
 
         if not connection_ids:
@@ -0,0 +1,43 @@
+"""Channel name helpers.
+
+테이블 채널 이름(table:{room_id}, :players, :spectators)을 방마다 한 번만
+만들어 intern해 두고 재사용합니다. 구독/브로드캐스트마다 f-string으로 새 문자열을
+만들지 않으므로 연결별 구독 집합과 채널 멤버 dict가 같은 문자열 객체를 공유합니다.
+"""
+
+from __future__ import annotations
+
+import sys
+from functools import lru_cache
+from typing import NamedTuple
+
+TABLE_CHANNEL_CACHE_SIZE = 8192
+
+
+class TableChannels(NamedTuple):
+    """한 테이블의 채널 이름 (모두 intern된 문자열)."""
+
+    main: str
+    players: str
+    spectators: str
+
+
+@lru_cache(maxsize=TABLE_CHANNEL_CACHE_SIZE)
+def table_channels(room_id: str) -> TableChannels:
+    """테이블 채널 이름 3종 (방마다 1회 생성)."""
+    main = sys.intern(f"table:{room_id}")
+    return TableChannels(
+        main=main,
+        players=sys.intern(f"{main}:players"),
+        spectators=sys.intern(f"{main}:spectators"),
+    )
+
+
+def table_channel(room_id: str) -> str:
+    """테이블 메인 채널 이름 (table:{room_id})."""
+    return table_channels(room_id).main
+
+
+def intern_channel(channel: str) -> str:
+    """임의 채널 이름 intern (lobby, tournament:{id} 등)."""
+    return sys.intern(channel)
@@ -3,13 +3,15 @@
 from __future__ import annotations
 
 import logging
+import time
 from dataclasses import dataclass, field
-from datetime import datetime
 from enum import Enum
 from typing import Any
 
 from fastapi import WebSocket
 
+from app.ws.serializer import MessageSerializer
+
 logger = logging.getLogger(__name__)
 
 
@@ -22,32 +24,64 @@ class ConnectionState(str, Enum):
     DISCONNECTED = "disconnected"
 
 
-@dataclass
+@dataclass(slots=True)
 class WebSocketConnection:
-    """Represents a single WebSocket connection."""
+    """Represents a single WebSocket connection.
+
+    연결 수만큼 생성되므로 __slots__로 인스턴스 dict를 없애고, 시각은
+    datetime 대신 time.monotonic() float로 보관합니다 (벽시계 시각이 필요한
+    곳은 사용 시점에 만듭니다).
+    """
 
     websocket: WebSocket
     user_id: str
     session_id: str
     connection_id: str
-    connected_at: datetime
+    connected_at: float = field(default_factory=time.monotonic)
     state: ConnectionState = ConnectionState.CONNECTED
 
-    # Channel subscriptions
+    # Local registry handle (assigned by ConnectionManager.connect)
+    handle: int = 0
+
+    # Channel subscriptions (interned channel names)
     subscribed_channels: set[str] = field(default_factory=set)
 
-    # Heartbeat tracking
-    last_ping_at: datetime | None = None
-    last_pong_at: datetime | None = None
+    # Heartbeat tracking (time.monotonic() seconds)
+    last_ping_at: float | None = None
+    last_pong_at: float | None = None
     missed_pongs: int = 0
 
+    # Access token expiry (JWT exp, epoch seconds) - checked by ConnectionSweeper
+    token_expires_at: float | None = None
+
     # State recovery - track last seen stateVersion per channel
     last_seen_versions: dict[str, int] = field(default_factory=dict)
 
+    # Negotiated wire serializer (AUTH handshake). None = JSON text frames.
+    serializer: MessageSerializer | None = None
+
     async def send(self, message: dict[str, Any]) -> bool:
         """Send message to client. Returns False if failed."""
         try:
-            await self.websocket.send_json(message)
+            if self.serializer is None:
+                await self.websocket.send_json(message)
+            else:
+                await self.websocket.send_bytes(self.serializer.encode(message))
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to send message to {self.connection_id}: {e}")
+            return False
+
+    async def send_text(self, text: str) -> bool:
+        """Send a pre-encoded JSON message (encode-once broadcast fan-out).
+
+        Binary 연결에는 serializer.encode_text로 변환해 보냅니다 (메시지당 1회).
+        """
+        try:
+            if self.serializer is None:
+                await self.websocket.send_text(text)
+            else:
+                await self.websocket.send_bytes(self.serializer.encode_text(text))
             return True
         except Exception as e:
             logger.warning(f"Failed to send message to {self.connection_id}: {e}")
@@ -63,7 +97,7 @@ class WebSocketConnection:
 
     def update_ping(self) -> None:
         """Update last ping timestamp."""
-        self.last_ping_at = datetime.utcnow()
+        self.last_ping_at = time.monotonic()
         self.missed_pongs = 0
 
     def update_state_version(self, channel: str, version: int) -> None:
@@ -6,8 +6,11 @@ Security Enhancement:
 - Token is no longer passed via query parameter (visible in logs/history)
 - Client sends AUTH message as first message after connection
 - Server validates token within 5 seconds or closes connection
-- Periodic token validation (every 5 minutes) to detect expired tokens
+- Token expiry precomputed from the JWT exp at auth time and enforced by
+  the shared ConnectionSweeper (no per-connection validation task)
 - Automatic disconnection when token expires with re-auth request
+- Wire protocol (JSON text / MessagePack binary, optional gzip) negotiated
+  in the AUTH payload (see app.ws.serializer)
 """
 
 from __future__ import annotations
@@ -15,6 +18,7 @@ from __future__ import annotations
 import asyncio
 import logging
 from datetime import datetime
+from functools import partial
 from typing import Any
 from uuid import uuid4
 
@@ -22,18 +26,21 @@ from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.utils.db import get_db
+from app.utils.json_utils import json_loads
 from app.utils.redis_client import get_redis
 from app.utils.security import verify_access_token, TokenError
 from app.ws.connection import WebSocketConnection, ConnectionState
 from app.ws.events import EventType, CLIENT_TO_SERVER_EVENTS
 from app.ws.manager import ConnectionManager
 from app.ws.messages import MessageEnvelope, create_error_message
+from app.ws.serializer import MessageSerializer, SerializationProtocol
 from app.ws.handlers.system import SystemHandler, create_connection_state_message
-from app.ws.handlers.lobby import LobbyHandler
+from app.ws.handlers.lobby import LobbyHandler, publish_lobby_diff
 from app.ws.handlers.table import TableHandler
 from app.ws.handlers.action import ActionHandler
 from app.ws.handlers.chat import ChatHandler
 from app.services.room import RoomService
+from app.game.lobby_index import lobby_index
 from app.middleware.maintenance import check_maintenance_mode_for_websocket
 
 logger = logging.getLogger(__name__)
@@ -53,6 +60,8 @@ async def get_manager() -> ConnectionManager:
             raise RuntimeError("Redis client not initialized")
         _manager = ConnectionManager(current_redis_client)
         await _manager.start()
+        # 로비 인덱스 변경 → LOBBY_UPDATE diff push
+        lobby_index.set_publisher(partial(publish_lobby_diff, _manager))
     return _manager
 
 
@@ -60,6 +69,7 @@ async def shutdown_manager() -> None:
     """Shutdown the connection manager."""
     global _manager
     if _manager:
+        lobby_index.set_publisher(None)
         await _manager.stop()
         _manager = None
 
@@ -110,203 +120,31 @@ class HandlerRegistry:
 # Authentication timeout in seconds
 AUTH_TIMEOUT_SECONDS = 5.0
 
-# Token validation interval in seconds (5 minutes)
-TOKEN_VALIDATION_INTERVAL_SECONDS = 300.0
+_MSGPACK_DECODER = MessageSerializer.negotiate_protocol(accept_binary=True)
 
 
-def create_reauth_required_message() -> dict[str, Any]:
-    """Create a REAUTH_REQUIRED message to notify client of token expiration."""
-    return {
-        "type": "REAUTH_REQUIRED",
-        "payload": {
-            "reason": "token_expired",
-            "message": "Your session has expired. Please re-authenticate.",
-        },
-        "timestamp": datetime.utcnow().isoformat(),
-    }
+def negotiate_serializer(auth_payload: dict[str, Any]) -> MessageSerializer | None:
+    """AUTH payload의 protocol/compression으로 연결 serializer 결정.
 
-
-# Heartbeat configuration
-HEARTBEAT_INTERVAL_SECONDS = 30.0  # 서버 → 클라이언트 PING 전송 주기
-HEARTBEAT_TIMEOUT_SECONDS = 60.0   # PONG 응답 대기 시간
-MAX_MISSED_PONGS = 2               # 최대 허용 미응답 횟수
-
-
-class HeartbeatManager:
-    """서버 → 클라이언트 하트비트 관리.
-
-    - 30초마다 PING 전송
-    - 60초 내에 PONG 응답 확인
-    - 2회 연속 미응답 시 연결 종료
+    None이면 기존 JSON text frame을 그대로 사용합니다.
     """
+    if auth_payload.get("protocol") != SerializationProtocol.MSGPACK.value:
+        return None
+    return MessageSerializer.negotiate_protocol(
+        accept_binary=True,
+        compression=auth_payload.get("compression") == "gzip",
+    )
 
-    def __init__(self, connection: WebSocketConnection):
-        self.connection = connection
-        self._task: asyncio.Task | None = None
-        self._running = False
-
-    async def start(self) -> None:
-        """하트비트 루프 시작."""
-        self._running = True
-        self._task = asyncio.create_task(self._heartbeat_loop())
-
-    async def stop(self) -> None:
-        """하트비트 루프 중지."""
-        self._running = False
-        if self._task:
-            self._task.cancel()
-            try:
-                await self._task
-            except asyncio.CancelledError:
-                pass
-            self._task = None
-
-    def record_pong(self) -> None:
-        """클라이언트로부터 PONG 수신 시 호출."""
-        self.connection.last_pong_at = datetime.utcnow()
-        self.connection.missed_pongs = 0
-
-    async def _heartbeat_loop(self) -> None:
-        """주기적으로 PING 전송하고 응답 확인."""
-        while self._running:
-            try:
-                await asyncio.sleep(HEARTBEAT_INTERVAL_SECONDS)
-
-                if not self._running:
-                    break
-
-                # PING 전송 전에 이전 PONG 응답 확인
-                if self.connection.last_ping_at is not None:
-                    # 마지막 PING 이후 PONG이 없으면 미응답 카운트 증가
-                    if (self.connection.last_pong_at is None or
-                        self.connection.last_pong_at < self.connection.last_ping_at):
-                        self.connection.missed_pongs += 1
-                        logger.warning(
-                            f"하트비트 미응답: user={self.connection.user_id}, "
-                            f"conn={self.connection.connection_id}, "
-                            f"missed={self.connection.missed_pongs}/{MAX_MISSED_PONGS}"
-                        )
-
-                        # 최대 미응답 횟수 초과 시 연결 종료
-                        if self.connection.missed_pongs >= MAX_MISSED_PONGS:
-                            logger.info(
-                                f"하트비트 타임아웃으로 연결 종료: "
-                                f"user={self.connection.user_id}, "
-                                f"conn={self.connection.connection_id}"
-                            )
-                            try:
-                                await self.connection.websocket.close(
-                                    4003, "Heartbeat timeout - connection closed"
-                                )
-                            except Exception as e:
-                                logger.warning(f"연결 종료 실패: {e}")
-                            self._running = False
-                            break
-
-                # PING 전송
-                ping_message = {
-                    "type": "PING",
-                    "payload": {},
-                    "timestamp": datetime.utcnow().isoformat(),
-                }
-
-                try:
-                    sent = await self.connection.send(ping_message)
-                    if sent:
-                        self.connection.last_ping_at = datetime.utcnow()
-                    else:
-                        logger.warning(
-                            f"PING 전송 실패: user={self.connection.user_id}"
-                        )
-                except Exception as e:
-                    logger.warning(f"PING 전송 에러: {e}")
-
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                logger.warning(f"하트비트 루프 에러: {e}")
-
-
-class TokenValidator:
-    """Handles periodic token validation for WebSocket connections."""
 
-    def __init__(self, token: str, connection: WebSocketConnection):
-        self.token = token
-        self.connection = connection
-        self._task: asyncio.Task | None = None
-        self._running = False
-
-    async def start(self) -> None:
-        """Start periodic token validation."""
-        self._running = True
-        self._task = asyncio.create_task(self._validation_loop())
-
-    async def stop(self) -> None:
-        """Stop periodic token validation."""
-        self._running = False
-        if self._task:
-            self._task.cancel()
-            try:
-                await self._task
-            except asyncio.CancelledError:
-                pass
-            self._task = None
-
-    async def _validation_loop(self) -> None:
-        """Periodically validate the token."""
-        while self._running:
-            try:
-                await asyncio.sleep(TOKEN_VALIDATION_INTERVAL_SECONDS)
-                
-                if not self._running:
-                    break
-
-                # Validate token
-                is_valid = await self._validate_token()
-                
-                if not is_valid:
-                    logger.info(
-                        f"Token expired for user={self.connection.user_id}, "
-                        f"conn={self.connection.connection_id}"
-                    )
-                    # Send re-auth required message
-                    try:
-                        await self.connection.send(create_reauth_required_message())
-                    except Exception as e:
-                        logger.warning(f"Failed to send reauth message: {e}")
-                    
-                    # Close connection with specific code
-                    try:
-                        await self.connection.websocket.close(
-                            4002, "Token expired - re-authentication required"
-                        )
-                    except Exception as e:
-                        logger.warning(f"Failed to close websocket: {e}")
-                    
-                    self._running = False
-                    break
-
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                logger.warning(f"Token validation error: {e}")
-                # Continue validation loop on non-fatal errors
-
-    async def _validate_token(self) -> bool:
-        """Validate the stored token.
-        
-        Returns:
-            True if token is still valid, False otherwise
-        """
-        try:
-            payload = verify_access_token(self.token)
-            return payload is not None
-        except TokenError:
-            # Token has expired
-            return False
-        except Exception as e:
-            logger.warning(f"Unexpected token validation error: {e}")
-            return False
+async def receive_message(websocket: WebSocket) -> dict[str, Any]:
+    """Receive one client message (binary frame: MessagePack, text: JSON)."""
+    message = await websocket.receive()
+    if message["type"] == "websocket.disconnect":
+        raise WebSocketDisconnect(message.get("code", 1000), message.get("reason"))
+    data = message.get("bytes")
+    if data is not None:
+        return _MSGPACK_DECODER.decode(data)
+    return json_loads(message["text"])
 
 
 @router.websocket("/ws")
@@ -345,7 +183,7 @@ async def websocket_endpoint(websocket: WebSocket):
     # 2. Wait for AUTH message (5 second timeout)
     try:
         auth_data = await asyncio.wait_for(
-            websocket.receive_json(),
+            receive_message(websocket),
             timeout=AUTH_TIMEOUT_SECONDS,
         )
     except asyncio.TimeoutError:
@@ -363,7 +201,8 @@ async def websocket_endpoint(websocket: WebSocket):
         await websocket.close(4001, "Expected AUTH message")
         return
 
-    token = auth_data.get("payload", {}).get("token") or auth_data.get("token")
+    auth_payload = auth_data.get("payload") or {}
+    token = auth_payload.get("token") or auth_data.get("token")
     if not token:
         logger.warning("WebSocket auth message missing token")
         await websocket.close(4001, "Missing token in AUTH message")
@@ -398,41 +237,38 @@ async def websocket_endpoint(websocket: WebSocket):
         user_id=user_id,
         session_id=session_id,
         connection_id=connection_id,
-        connected_at=datetime.utcnow(),
+        token_expires_at=float(payload["exp"]),
+        serializer=negotiate_serializer(auth_payload),
     )
 
-    # 6. Register connection
+    # 6. Register connection (하트비트/토큰 만료는 ConnectionSweeper가 처리)
     await manager.connect(conn)
 
-    # 7. Start periodic token validation
-    token_validator = TokenValidator(token, conn)
-    await token_validator.start()
-
-    # 7.5. Start heartbeat manager (서버 → 클라이언트 PING)
-    heartbeat_manager = HeartbeatManager(conn)
-    await heartbeat_manager.start()
-
-    # 8. Send CONNECTION_STATE(connected)
+    # 7. Send CONNECTION_STATE(connected)
     welcome_message = create_connection_state_message(
         state=ConnectionState.CONNECTED,
         user_id=user_id,
         session_id=session_id,
+        serializer=conn.serializer,
     )
     await conn.send(welcome_message.to_dict())
 
-    logger.info(f"WebSocket connected: user={user_id}, conn={connection_id}")
+    logger.info(
+        f"WebSocket connected: user={user_id}, conn={connection_id}, "
+        f"protocol={conn.serializer.protocol.value if conn.serializer else 'json'}"
+    )
 
-    # 9. Get database session for handlers
+    # 8. Get database session for handlers
     from app.utils.db import async_session_factory
 
     async with async_session_factory() as db:
-        # 10. Initialize handler registry
+        # 9. Initialize handler registry
         registry = HandlerRegistry(manager, db)
 
-        # 11. Message loop
+        # 10. Message loop
         try:
             while True:
-                data = await websocket.receive_json()
+                data = await receive_message(websocket)
 
                 try:
                     # Parse message
@@ -495,10 +331,6 @@ async def websocket_endpoint(websocket: WebSocket):
             logger.exception(f"WebSocket error: {e}")
 
         finally:
-            # Stop token validation and heartbeat
-            await token_validator.stop()
-            await heartbeat_manager.stop()
-
             # Store state for potential reconnection
             await manager.store_user_state(
                 user_id,
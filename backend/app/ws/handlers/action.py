@@ -11,14 +11,20 @@ Phase 5 Enhancement:
 - Safe async task management with error handling
 - Resource tracking with automatic cleanup
 - Memory leak prevention
+
+Table actor:
+- 테이블 상태 변경은 테이블별 액터(app.game.table_actor)에서 순차 처리 (락 없음)
+- 상태 전이는 동기 인메모리 처리, 브로드캐스트/fraud 이벤트/DB 저장은 outbox로 분리
+- 봇 생각 시간, 딜링/페이즈 애니메이션 대기, 턴 타임아웃은 액터 예약 명령
+- 봇 결정(핸드 평가)은 생각 시간 동안 BotDecisionService 워커 풀에서 배치 평가
 """
 
 from __future__ import annotations
 
 import asyncio
-import random
 import time
 from datetime import datetime, timedelta
+from functools import partial
 from typing import TYPE_CHECKING, Any
 
 from app.utils.json_utils import json_dumps, json_loads
@@ -26,19 +32,26 @@ from app.utils.json_utils import json_dumps, json_loads
 from pydantic import ValidationError
 from redis.asyncio import Redis
 
-from app.game import game_manager, Player
+from app.game import game_manager, GamePhase, Player
+from app.game.lobby_index import lobby_index
+from app.game.table_actor import TableActor, table_actors
 from app.ws.broadcast import PersonalizedBroadcaster
-from app.game.hand_evaluator import evaluate_hand_for_bot
 from app.game.poker_table import PokerTable
 from app.game.types import ActionResult, AvailableActions, HandResult
-from app.utils.async_utils import ResourceTracker, create_safe_task, cancel_task_safe
+from app.utils.async_utils import create_safe_task, cancel_task_safe
 from app.utils.redis_client import RedisService
+from app.ws.channels import table_channel
 from app.ws.connection import WebSocketConnection
 from app.ws.events import EventType
 from app.ws.handlers.base import BaseHandler
 from app.ws.messages import MessageEnvelope
 from app.ws.schemas import ActionRequestPayload
 from app.logging_config import get_logger
+from app.services.bot_decision import (
+    BotDecisionRequest,
+    decide_bot_action,
+    get_bot_decision_service,
+)
 from app.services.fraud_event_publisher import FraudEventPublisher, get_fraud_publisher
 from app.services.hand_history import HandHistoryService
 from app.services.player_session_tracker import get_session_tracker
@@ -50,10 +63,16 @@ if TYPE_CHECKING:
 logger = get_logger(__name__)
 
 # Constants for resource management
-LOCK_MAX_AGE_SECONDS = 3600  # 1 hour
 CLEANUP_INTERVAL_SECONDS = 300  # 5 minutes
 TURN_TIMEOUT_MAX_AGE_SECONDS = 120  # 2 minutes
 
+# Table actor 예약 명령 key (key당 1개, 다시 예약하면 이전 예약 취소)
+TURN_TIMER = "turn"            # 휴먼 턴 타임아웃 / 봇 액션 / 딜링·페이즈 대기
+NEXT_HAND_TIMER = "next_hand"  # 핸드 결과 표시 후 다음 핸드 시작
+
+MAX_TURN_RETRIES = 5     # current seat None / 가능한 액션 없음 / should_refresh 재시도 한도
+TURN_RETRY_DELAY = 0.3   # 재시도 대기 시간 (초)
+
 
 def is_bot_player(player) -> bool:
     """Check if player is a bot.
@@ -73,6 +92,16 @@ def is_bot_player(player) -> bool:
     return False
 
 
+class _ActionRejected(Exception):
+    """테이블 명령 거부 - 액터에서 발생해 ACTION_RESULT 에러로 변환."""
+
+    def __init__(self, error_code: str, error_message: str, *, should_refresh: bool = False):
+        super().__init__(error_message)
+        self.error_code = error_code
+        self.error_message = error_message
+        self.should_refresh = should_refresh
+
+
 class ActionHandler(BaseHandler):
     """Handles game action requests using in-memory game state.
 
@@ -88,8 +117,8 @@ class ActionHandler(BaseHandler):
     - COMMUNITY_CARDS: New community cards
     
     Resource Management:
-    - Uses ResourceTracker for automatic cleanup of locks and timeout tasks
-    - Prevents memory leaks from orphaned resources
+    - 테이블별 TableActor가 상태 변경을 직렬화 (락/타임아웃 태스크 없음)
+    - 삭제된 테이블의 액터는 주기적으로 정리
     """
 
     def __init__(
@@ -103,15 +132,11 @@ class ActionHandler(BaseHandler):
         # FraudEventPublisher for fraud detection events
         self._fraud_publisher = FraudEventPublisher(redis)
         
-        # Resource tracking with automatic cleanup (prevents memory leaks)
-        self._lock_tracker: ResourceTracker[asyncio.Lock] = ResourceTracker(
-            max_age_seconds=LOCK_MAX_AGE_SECONDS,
-            cleanup_interval_seconds=CLEANUP_INTERVAL_SECONDS,
-        )
-        
-        # 테이블별 타임아웃 태스크 관리 (with tracking)
-        self._timeout_tasks: dict[str, asyncio.Task] = {}
-        
+        # 테이블별 액터 (프로세스 공유 레지스트리 - 핸들러 인스턴스가 여러 개여도 테이블당 1개)
+        self._actors = table_actors
+        # 봇 결정 워커 풀 (프로세스 공유)
+        self._bot_decisions = get_bot_decision_service()
+
         # 테이블별 턴 시작 시간 추적 (응답 시간 측정용)
         self._turn_start_times: dict[str, datetime] = {}
         
@@ -127,21 +152,17 @@ class ActionHandler(BaseHandler):
 
     def _start_resource_cleanup(self) -> None:
         """Start background cleanup for resources."""
-        def get_active_tables() -> set[str]:
-            """Get set of currently active table IDs."""
-            return set(game_manager.list_tables())
-        
-        # Start lock tracker auto-cleanup
-        self._lock_tracker.start_auto_cleanup(get_active_keys=get_active_tables)
-        
-        # Start turn start times cleanup
-        async def cleanup_turn_times():
+        async def cleanup_loop():
             while True:
                 await asyncio.sleep(CLEANUP_INTERVAL_SECONDS)
                 await self._cleanup_stale_turn_times()
-        
+                # 삭제된 테이블의 액터 정리
+                await self._actors.prune(
+                    table.room_id for table in game_manager.get_all_tables()
+                )
+
         self._cleanup_task = create_safe_task(
-            cleanup_turn_times(),
+            cleanup_loop(),
             name="turn_times_cleanup",
         )
 
@@ -158,9 +179,9 @@ class ActionHandler(BaseHandler):
         if stale_keys:
             logger.debug(f"Cleaned up {len(stale_keys)} stale turn start times")
 
-    def _get_table_lock(self, room_id: str) -> asyncio.Lock:
-        """Get or create lock for a table (with automatic cleanup)."""
-        return self._lock_tracker.get_or_create(room_id, asyncio.Lock)
+    def _get_actor(self, room_id: str) -> TableActor:
+        """Get or create the actor that serializes state changes for a table."""
+        return self._actors.get(room_id)
 
     @property
     def handled_events(self) -> tuple[EventType, ...]:
@@ -226,248 +247,246 @@ class ActionHandler(BaseHandler):
             trace_id=event.trace_id,
         )
 
-        # Lock per table to prevent concurrent action processing
-        table_lock = self._get_table_lock(room_id)
-        async with table_lock:
-            # 1. Idempotency check (optional)
-            if request_id and self.redis_service:
-                is_new = await self.redis_service.check_and_set_idempotency(
-                    table_id=room_id,
-                    user_id=conn.user_id,
-                    request_id=request_id,
+        # 1. Idempotency check (optional) - Redis I/O는 액터 밖에서 처리
+        if request_id and self.redis_service:
+            is_new = await self.redis_service.check_and_set_idempotency(
+                table_id=room_id,
+                user_id=conn.user_id,
+                request_id=request_id,
+            )
+            if not is_new:
+                cached = await self.redis_service.get_idempotency_result(
+                    room_id, conn.user_id, request_id
                 )
-                if not is_new:
-                    cached = await self.redis_service.get_idempotency_result(
-                        room_id, conn.user_id, request_id
+                if cached:
+                    cached_payload = json_loads(cached)
+                    return MessageEnvelope.create(
+                        event_type=EventType.ACTION_RESULT,
+                        payload=cached_payload,
+                        request_id=request_id,
+                        trace_id=event.trace_id,
                     )
-                    if cached:
-                        cached_payload = json_loads(cached)
-                        return MessageEnvelope.create(
-                            event_type=EventType.ACTION_RESULT,
-                            payload=cached_payload,
-                            request_id=request_id,
-                            trace_id=event.trace_id,
-                        )
-
-            # 2. Get table from memory
-            table = game_manager.get_table(room_id)
-            if not table:
-                return self._create_error_result(
-                    room_id, "TABLE_NOT_FOUND", "테이블을 찾을 수 없습니다",
-                    request_id, event.trace_id
-                )
 
-            # 3. Check if game is in progress
-            if table.phase.value == "waiting":
-                return self._create_error_result(
-                    room_id, "NO_ACTIVE_HAND", "진행 중인 핸드가 없습니다",
-                    request_id, event.trace_id
-                )
+        # 2. Get table from memory (없는 방에는 액터를 만들지 않음)
+        if game_manager.get_table(room_id) is None:
+            return self._create_error_result(
+                room_id, "TABLE_NOT_FOUND", "테이블을 찾을 수 없습니다",
+                request_id, event.trace_id
+            )
 
-            # 4. Validate it's player's turn
-            player_seat = self._get_player_seat(table, conn.user_id)
-            if player_seat is None:
-                return self._create_error_result(
-                    room_id, "NOT_A_PLAYER", "테이블에 앉아있지 않습니다",
-                    request_id, event.trace_id
+        # 3. State transition on the table actor (sequential per table, no lock)
+        try:
+            action_result = await self._get_actor(room_id).call(
+                partial(
+                    self._apply_player_action,
+                    room_id,
+                    conn.user_id,
+                    action_type,
+                    amount,
+                    started_at=start_time,
+                    trace_id=event.trace_id,
                 )
+            )
+        except _ActionRejected as e:
+            return self._create_error_result(
+                room_id, e.error_code, e.error_message,
+                request_id, event.trace_id,
+                should_refresh=e.should_refresh,
+            )
 
-            if table.current_player_seat != player_seat:
-                return self._create_error_result(
-                    room_id, "NOT_YOUR_TURN", "당신의 차례가 아닙니다",
-                    request_id, event.trace_id
-                )
+        # 4. Cache result for idempotency
+        if request_id and self.redis_service:
+            await self.redis_service.set_idempotency_result(
+                room_id, conn.user_id, request_id, json_dumps(action_result)
+            )
 
-            # 4.5. Cancel timeout
-            await self._cancel_turn_timeout(room_id)
+        return MessageEnvelope.create(
+            event_type=EventType.ACTION_RESULT,
+            payload=action_result,
+            request_id=request_id,
+            trace_id=event.trace_id,
+        )
 
-            # 5. Process action
-            result = table.process_action(conn.user_id, action_type, amount)
-            
-            # Structured logging for action result
-            processing_time = (time.time() - start_time) * 1000  # ms
-            logger.info(
-                "action_processed",
-                user_id=conn.user_id,
-                table_id=room_id,
-                action=action_type,
-                amount=amount,
-                success=result.get("success", False),
-                pot=result.get("pot", 0),
-                phase=result.get("phase"),
-                hand_complete=result.get("hand_complete", False),
-                processing_time_ms=round(processing_time, 2),
-                trace_id=event.trace_id,
-            )
+    def _apply_player_action(
+        self,
+        room_id: str,
+        user_id: str,
+        action_type: str,
+        amount: int,
+        *,
+        started_at: float,
+        trace_id: str,
+    ) -> dict[str, Any]:
+        """[actor] ACTION_REQUEST 상태 전이.
 
-            if not result.get("success"):
-                return self._create_error_result(
-                    room_id, "INVALID_ACTION", result.get("error", "액션 처리 실패"),
-                    request_id, event.trace_id,
-                    should_refresh=result.get("should_refresh", False)
-                )
+        검증 → 액션 처리 → 부수효과(fraud 이벤트, 브로드캐스트) 등록 → 다음 턴 진행.
+        거부 시 _ActionRejected를 발생시킵니다.
+        """
+        table = game_manager.get_table(room_id)
+        if not table:
+            raise _ActionRejected("TABLE_NOT_FOUND", "테이블을 찾을 수 없습니다")
 
-            # 5.5. Publish fraud detection event (player action)
-            # 봇이 아닌 인간 플레이어의 액션만 발행
-            player = table.players.get(player_seat)
-            is_bot = is_bot_player(player) if player else False
-            await self._publish_player_action_event(
-                user_id=conn.user_id,
-                room_id=room_id,
-                action_type=action_type,
-                amount=result.get("amount", amount),
-                is_bot=is_bot,
-            )
+        # Check if game is in progress
+        if table.phase.value == "waiting":
+            raise _ActionRejected("NO_ACTIVE_HAND", "진행 중인 핸드가 없습니다")
 
-            # 6. Build success response
-            action_result = {
-                "success": True,
-                "tableId": room_id,
-                "action": {
-                    "type": result.get("action", action_type),
-                    "amount": result.get("amount", 0),
-                    "position": result.get("seat", player_seat),
-                },
-                "pot": result.get("pot", 0),
-                "phase": result.get("phase"),
-            }
-
-            # Cache result for idempotency
-            if request_id and self.redis_service:
-                await self.redis_service.set_idempotency_result(
-                    room_id, conn.user_id, request_id, json_dumps(action_result)
-                )
+        # Validate it's player's turn
+        player_seat = self._get_player_seat(table, user_id)
+        if player_seat is None:
+            raise _ActionRejected("NOT_A_PLAYER", "테이블에 앉아있지 않습니다")
 
-            # 7. Handle hand completion first (브로드캐스트 순서 중요!)
-            if result.get("hand_complete"):
-                # 핸드 결과 먼저 전송 (리셋 전 상태)
-                await self._broadcast_hand_result(room_id, result.get("hand_result"))
-                # 그 다음 액션 브로드캐스트 (리셋 후 상태)
-                await self._broadcast_action(room_id, result)
-                # Send updated states to all players
-                await self._broadcast_personalized_states(room_id, table)
-                # Auto-start next hand after delay (락 밖에서 실행)
-                create_safe_task(
-                    self._auto_start_next_hand(room_id, table),
-                    name=f"auto_start_{room_id}",
-                )
-            else:
-                # 8. Broadcast state update
-                await self._broadcast_action(room_id, result)
+        if table.current_player_seat != player_seat:
+            raise _ActionRejected("NOT_YOUR_TURN", "당신의 차례가 아닙니다")
 
-                # 9. Handle phase change (community cards) - 핸드 완료 시에는 전송 안 함
-                if result.get("phase_changed"):
-                    await self._broadcast_community_cards(room_id, table)
+        # Process action
+        result = table.process_action(user_id, action_type, amount)
 
-                # 10. Process next turn (with bot loop)
-                await self._process_next_turn(room_id, table)
+        # Structured logging for action result (mailbox 대기 시간 포함)
+        processing_time = (time.time() - started_at) * 1000  # ms
+        logger.info(
+            "action_processed",
+            user_id=user_id,
+            table_id=room_id,
+            action=action_type,
+            amount=amount,
+            success=result.get("success", False),
+            pot=result.get("pot", 0),
+            phase=result.get("phase"),
+            hand_complete=result.get("hand_complete", False),
+            processing_time_ms=round(processing_time, 2),
+            trace_id=trace_id,
+        )
 
-            return MessageEnvelope.create(
-                event_type=EventType.ACTION_RESULT,
-                payload=action_result,
-                request_id=request_id,
-                trace_id=event.trace_id,
+        if not result.get("success"):
+            # 턴은 그대로이므로 타임아웃도 유지
+            raise _ActionRejected(
+                "INVALID_ACTION",
+                result.get("error", "액션 처리 실패"),
+                should_refresh=result.get("should_refresh", False),
             )
 
+        # 턴 종료 - 타임아웃 취소
+        self._cancel_turn_timeout(room_id)
+
+        # Publish fraud detection event (player action)
+        # 봇이 아닌 인간 플레이어의 액션만 발행
+        player = table.players.get(player_seat)
+        self._get_actor(room_id).emit(partial(
+            self._publish_player_action_event,
+            user_id=user_id,
+            room_id=room_id,
+            action_type=action_type,
+            amount=result.get("amount", amount),
+            is_bot=is_bot_player(player) if player else False,
+        ))
+
+        self._after_action(room_id, table, result)
+
+        return {
+            "success": True,
+            "tableId": room_id,
+            "action": {
+                "type": result.get("action", action_type),
+                "amount": result.get("amount", 0),
+                "position": result.get("seat", player_seat),
+            },
+            "pot": result.get("pot", 0),
+            "phase": result.get("phase"),
+        }
+
     async def _handle_start_game(
         self,
         conn: WebSocketConnection,
         event: MessageEnvelope,
     ) -> MessageEnvelope:
         """Handle START_GAME event.
-        
+
         동시에 여러 START_GAME 요청이 들어올 때 첫 번째만 처리하고 나머지는 거부합니다.
-        레이스 컨디션 방지를 위해 락 내부에서 phase 체크를 수행합니다.
+        phase 체크와 핸드 시작이 테이블 액터에서 순차 실행되므로 레이스가 없습니다.
+        첫 턴은 딜링 애니메이션 후 액터에 예약되며 응답은 바로 반환합니다.
         """
         payload = event.payload
         room_id = payload.get("tableId")
 
         logger.info(f"[GAME] START_GAME request from {conn.user_id} for room {room_id}")
 
-        # Lock per table to prevent concurrent starts (레이스 컨디션 방지)
-        table_lock = self._get_table_lock(room_id)
-        async with table_lock:
-            table = game_manager.get_table(room_id)
-            if not table:
-                logger.warning(f"[GAME] START_GAME rejected: table {room_id} not found")
-                return self._create_error_result(
-                    room_id, "TABLE_NOT_FOUND", "테이블을 찾을 수 없습니다",
-                    event.request_id, event.trace_id
-                )
-
-            # 락 내부에서 phase 체크 - 이미 게임이 진행 중인지 확인
-            from app.game.poker_table import GamePhase
-            if table.phase != GamePhase.WAITING:
-                logger.warning(
-                    f"[GAME] START_GAME rejected: game already in progress "
-                    f"(room={room_id}, phase={table.phase.value}, requester={conn.user_id})"
-                )
-                return self._create_error_result(
-                    room_id, "GAME_ALREADY_IN_PROGRESS", 
-                    f"게임이 이미 진행 중입니다 (현재 단계: {table.phase.value})",
-                    event.request_id, event.trace_id
-                )
+        if not room_id or game_manager.get_table(room_id) is None:
+            logger.warning(f"[GAME] START_GAME rejected: table {room_id} not found")
+            return self._create_error_result(
+                room_id, "TABLE_NOT_FOUND", "테이블을 찾을 수 없습니다",
+                event.request_id, event.trace_id
+            )
 
-            # 플레이어 수 체크
-            active_players = table.get_active_players()
-            if len(active_players) < 2:
-                logger.warning(
-                    f"[GAME] START_GAME rejected: not enough players "
-                    f"(room={room_id}, players={len(active_players)}, requester={conn.user_id})"
-                )
-                return self._create_error_result(
-                    room_id, "NOT_ENOUGH_PLAYERS", 
-                    f"게임을 시작할 수 없습니다 (최소 2명 필요, 현재 {len(active_players)}명)",
-                    event.request_id, event.trace_id
-                )
+        try:
+            result = await self._get_actor(room_id).call(
+                partial(self._start_game, room_id, conn.user_id)
+            )
+        except _ActionRejected as e:
+            return self._create_error_result(
+                room_id, e.error_code, e.error_message,
+                event.request_id, event.trace_id
+            )
 
-            # 이제 게임 시작 (start_new_hand 내부에서도 phase를 즉시 변경하여 이중 보호)
-            result = table.start_new_hand()
-            logger.info(f"[GAME] start_new_hand result: {result}, requester={conn.user_id}")
+        return MessageEnvelope.create(
+            event_type=EventType.ACTION_RESULT,
+            payload={
+                "success": True,
+                "tableId": room_id,
+                "handNumber": result.get("hand_number"),
+                "dealer": result.get("dealer"),
+            },
+            request_id=event.request_id,
+            trace_id=event.trace_id,
+        )
 
-            if not result.get("success"):
-                error_msg = result.get("error", "핸드 시작 실패")
-                logger.error(
-                    f"[GAME] START_GAME failed: {error_msg} "
-                    f"(room={room_id}, requester={conn.user_id})"
-                )
-                return self._create_error_result(
-                    room_id, "START_FAILED", error_msg,
-                    event.request_id, event.trace_id
-                )
+    def _start_game(self, room_id: str, requester: str) -> dict[str, Any]:
+        """[actor] START_GAME 상태 전이 - phase/인원 체크 후 핸드 시작."""
+        table = game_manager.get_table(room_id)
+        if not table:
+            logger.warning(f"[GAME] START_GAME rejected: table {room_id} not found")
+            raise _ActionRejected("TABLE_NOT_FOUND", "테이블을 찾을 수 없습니다")
 
-            logger.info(
-                f"[GAME] Game started successfully: hand #{result.get('hand_number')} "
-                f"(room={room_id}, dealer={result.get('dealer')}, requester={conn.user_id})"
+        # 이미 게임이 진행 중인지 확인
+        if table.phase != GamePhase.WAITING:
+            logger.warning(
+                f"[GAME] START_GAME rejected: game already in progress "
+                f"(room={room_id}, phase={table.phase.value}, requester={requester})"
+            )
+            raise _ActionRejected(
+                "GAME_ALREADY_IN_PROGRESS",
+                f"게임이 이미 진행 중입니다 (현재 단계: {table.phase.value})",
             )
 
-            # Broadcast hand started (with seats/blinds data)
-            await self._broadcast_hand_started(room_id, result, table)
+        # 플레이어 수 체크
+        active_players = table.get_active_players()
+        if len(active_players) < 2:
+            logger.warning(
+                f"[GAME] START_GAME rejected: not enough players "
+                f"(room={room_id}, players={len(active_players)}, requester={requester})"
+            )
+            raise _ActionRejected(
+                "NOT_ENOUGH_PLAYERS",
+                f"게임을 시작할 수 없습니다 (최소 2명 필요, 현재 {len(active_players)}명)",
+            )
 
-            # Send personalized states (with hole cards)
-            await self._broadcast_personalized_states(room_id, table)
+        result = table.start_new_hand()
+        logger.info(f"[GAME] start_new_hand result: {result}, requester={requester}")
 
-            # 카드 딜링 애니메이션 대기 (플레이어 수 × 2장 × 0.15초 + 여유)
-            # 프론트엔드: 150ms 시작지연 + (카드수 × 150ms) + 400ms 완료지연 + 네트워크/렌더링 여유
-            active_player_count = len([p for p in table.players.values() if p and p.status == "active"])
-            dealing_delay = (active_player_count * 2 * 0.15) + 2.5  # 딜링 + 블라인드 표시(0.5s) + 딜링 시작 전(0.5s) + 여유(1.5s)
-            logger.info(f"[GAME] Waiting {dealing_delay:.1f}s for dealing animation ({active_player_count} players)")
-            await asyncio.sleep(dealing_delay)
+        if not result.get("success"):
+            error_msg = result.get("error", "핸드 시작 실패")
+            logger.error(
+                f"[GAME] START_GAME failed: {error_msg} "
+                f"(room={room_id}, requester={requester})"
+            )
+            raise _ActionRejected("START_FAILED", error_msg)
 
-            # Start first turn (with bot loop)
-            await self._process_next_turn(room_id, table)
+        logger.info(
+            f"[GAME] Game started successfully: hand #{result.get('hand_number')} "
+            f"(room={room_id}, dealer={result.get('dealer')}, requester={requester})"
+        )
 
-            return MessageEnvelope.create(
-                event_type=EventType.ACTION_RESULT,
-                payload={
-                    "success": True,
-                    "tableId": room_id,
-                    "handNumber": result.get("hand_number"),
-                    "dealer": result.get("dealer"),
-                },
-                request_id=event.request_id,
-                trace_id=event.trace_id,
-            )
+        self._deal_hand(room_id, table, result)
+        return result
 
     def _get_player_seat(self, table: PokerTable, user_id: str) -> int | None:
         """Get player's seat at the table."""
@@ -513,235 +532,271 @@ class ActionHandler(BaseHandler):
             trace_id=trace_id,
         )
 
-    async def _process_next_turn(self, room_id: str, table: PokerTable) -> None:
-        """Process next turn - with bot loop (poker style).
+    # =========================================================================
+    # Turn Progression (table actor commands)
+    # =========================================================================
 
-        Uses iteration instead of recursion to prevent stack overflow.
-        Includes retry logic for phase transitions where actor may be temporarily None.
-        
-        Safety features:
-        - MAX_ITERATIONS: Prevents infinite loops
-        - Table existence check: Handles table deletion during loop
-        - Hand completion check: Exits when hand is complete (phase=waiting or hand_in_progress=False)
-        - Current player re-validation: Ensures bot is still the current player before action
-        - Retry logic: Handles temporary None states during phase transitions
-        """
-        MAX_ITERATIONS = 50  # Safety limit
-        MAX_RETRY_FOR_NONE_SEAT = 5  # current_player_seat가 None일 때 재시도 횟수
-        RETRY_DELAY = 0.3  # 재시도 대기 시간 (초)
+    def _after_action(
+        self,
+        room_id: str,
+        table: PokerTable,
+        result: ActionResult,
+        *,
+        by_bot: bool = False,
+    ) -> None:
+        """[actor] 액션 처리 후 브로드캐스트 등록 + 다음 진행 예약.
 
-        none_seat_retry_count = 0
-        no_actions_retry_count = 0
+        핸드 완료 시 순서: HAND_RESULT(리셋 전) → TABLE_STATE_UPDATE(리셋 후)
+        → TABLE_SNAPSHOT, 이후 결과 표시 시간 뒤 다음 핸드 예약.
+        """
+        actor = self._get_actor(room_id)
+
+        if result.get("hand_complete"):
+            self._emit_hand_result(actor, room_id, table, result.get("hand_result"))
+            actor.emit(partial(self._broadcast_action, room_id, result))
+            self._emit_personalized_states(actor, room_id, table)
+            actor.schedule(
+                NEXT_HAND_TIMER,
+                self._next_hand_delay(),
+                partial(self._auto_start_next_hand, room_id),
+            )
+            return
 
-        try:
-            for iteration in range(MAX_ITERATIONS):
-                # ========================================
-                # Safety Check 1: 테이블 존재 여부 확인
-                # ========================================
-                current_table = game_manager.get_table(room_id)
-                if current_table is None:
-                    logger.warning(f"[TURN] Table {room_id} no longer exists, exiting bot loop")
-                    return
-                
-                # 테이블 참조 갱신 (삭제 후 재생성된 경우 대비)
-                if current_table is not table:
-                    logger.warning(f"[TURN] Table reference changed for {room_id}, updating reference")
-                    table = current_table
-
-                logger.info(f"[TURN] iter={iteration}, current_seat={table.current_player_seat}, phase={table.phase}")
-
-                # ========================================
-                # Safety Check 2: 핸드 완료 상태 체크 강화
-                # ========================================
-                if table.phase.value == "waiting":
-                    logger.info("[TURN] Hand complete, phase is waiting")
-                    return
-                
-                # hand_in_progress 속성이 있으면 추가 체크
-                if hasattr(table, 'hand_in_progress') and not table.hand_in_progress:
-                    logger.info("[TURN] Hand complete, hand_in_progress is False")
-                    return
+        actor.emit(partial(self._broadcast_action, room_id, result))
+
+        # Phase change (community cards) - 핸드 완료 시에는 전송 안 함
+        if result.get("phase_changed"):
+            actor.emit(partial(
+                self._broadcast, room_id, self._community_cards_message(room_id, table)
+            ))
+            if by_bot:
+                # 봇 연속 진행 시 커뮤니티 카드 애니메이션 후 다음 턴
+                actor.schedule(
+                    TURN_TIMER,
+                    self._phase_transition_delay(),
+                    partial(self._resume_after_phase_change, room_id),
+                )
+                return
 
-                if table.current_player_seat is None:
-                    none_seat_retry_count += 1
-                    if none_seat_retry_count <= MAX_RETRY_FOR_NONE_SEAT:
-                        logger.info(f"[TURN] No current player seat, retry {none_seat_retry_count}/{MAX_RETRY_FOR_NONE_SEAT}")
-                        await asyncio.sleep(RETRY_DELAY)
-                        # 테이블 상태 갱신 시도
-                        table._update_current_player()
-                        continue
-                    else:
-                        logger.warning("[TURN] No current player seat after max retries - hand may be complete")
-                        return
+        if by_bot:
+            actor.emit(partial(
+                self._broadcast, room_id, self._turn_changed_message(room_id, table)
+            ))
+        self._advance_turn(room_id)
 
-                # 유효한 seat을 찾았으면 재시도 카운터 리셋
-                none_seat_retry_count = 0
+    def _advance_turn(self, room_id: str, retries: int = 0) -> None:
+        """[actor] 다음 턴 진행 - 휴먼은 TURN_PROMPT, 봇은 생각 시간 후 액션 예약.
 
-                current_player = table.players.get(table.current_player_seat)
-                if not current_player:
-                    logger.info(f"[TURN] No player at seat {table.current_player_seat}")
-                    return
+        봇 루프(sleep + 반복)를 예약 명령으로 나눈 것이라 봇이 생각하는 동안에도
+        같은 테이블의 다른 명령이 처리됩니다.
 
-                # Check if current player is a bot
-                is_bot = is_bot_player(current_player)
-                logger.info(f"[TURN] Player {current_player.username} is_bot={is_bot}, user_id={current_player.user_id}")
+        Safety:
+        - 테이블 삭제 / 핸드 완료 시 중단
+        - current_player_seat가 None이면 잠시 후 상태 갱신하여 재시도 (MAX_TURN_RETRIES)
+        """
+        table = game_manager.get_table(room_id)
+        if table is None:
+            logger.warning(f"[TURN] Table {room_id} no longer exists")
+            return
 
-                if not is_bot:
-                    # Human player - send TURN_PROMPT and exit loop
-                    logger.info(f"[TURN] Human player at seat {table.current_player_seat}, sending TURN_PROMPT")
-                    await self._send_turn_prompt(room_id, table)
-                    return
+        logger.debug(f"[TURN] room={room_id}, current_seat={table.current_player_seat}, phase={table.phase}")
 
-                # 봇 액션 처리 전 현재 플레이어 좌석 저장 (재확인용)
-                expected_seat = table.current_player_seat
+        if not self._hand_in_progress(table):
+            logger.debug("[TURN] Hand complete")
+            return
 
-                # Bot auto-play with human-like thinking delay
-                delay = random.triangular(
-                    self._settings.bot_think_time_min,
-                    self._settings.bot_think_time_max,
-                    self._settings.bot_think_time_mode
+        actor = self._get_actor(room_id)
+        if table.current_player_seat is None:
+            if retries < MAX_TURN_RETRIES:
+                logger.info(f"[TURN] No current player seat, retry {retries + 1}/{MAX_TURN_RETRIES}")
+                actor.schedule(
+                    TURN_TIMER,
+                    TURN_RETRY_DELAY,
+                    partial(self._retry_turn, room_id, retries + 1),
                 )
-                if random.random() < 0.2:  # 20% 확률로 추가 시간
-                    delay += random.uniform(1.0, 2.0)
-                logger.debug(f"[BOT] {current_player.username} thinking for {delay:.1f}s...")
-                await asyncio.sleep(delay)
-
-                # ========================================
-                # Safety Check 3: 봇 액션 처리 전 재확인
-                # ========================================
-                # 딜레이 후 테이블 상태가 변경되었을 수 있음
-                current_table = game_manager.get_table(room_id)
-                if current_table is None:
-                    logger.warning(f"[BOT] Table {room_id} deleted during bot thinking, exiting")
-                    return
-                
-                if current_table is not table:
-                    logger.warning(f"[BOT] Table reference changed during bot thinking, updating")
-                    table = current_table
-                
-                # 핸드 완료 상태 재확인
-                if table.phase.value == "waiting":
-                    logger.info("[BOT] Hand completed during bot thinking, exiting")
-                    return
-                
-                if hasattr(table, 'hand_in_progress') and not table.hand_in_progress:
-                    logger.info("[BOT] Hand completed during bot thinking (hand_in_progress=False), exiting")
-                    return
-                
-                # 현재 플레이어가 변경되었는지 확인
-                if table.current_player_seat != expected_seat:
-                    logger.warning(
-                        f"[BOT] Current player changed during thinking: "
-                        f"expected={expected_seat}, actual={table.current_player_seat}, refreshing..."
-                    )
-                    continue
-                
-                # 현재 플레이어가 여전히 봇인지 확인
-                current_player = table.players.get(table.current_player_seat)
-                if not current_player:
-                    logger.warning(f"[BOT] Player at seat {table.current_player_seat} no longer exists")
-                    return
-                
-                if not is_bot_player(current_player):
-                    logger.warning(f"[BOT] Player at seat {table.current_player_seat} is no longer a bot")
-                    await self._send_turn_prompt(room_id, table)
-                    return
+            else:
+                logger.warning("[TURN] No current player seat after max retries - hand may be complete")
+            return
 
-                available = table.get_available_actions(current_player.user_id)
-                actions = available.get("actions", [])
-                call_amount = available.get("call_amount", 0)
+        current_player = table.players.get(table.current_player_seat)
+        if not current_player:
+            logger.info(f"[TURN] No player at seat {table.current_player_seat}")
+            return
 
-                logger.info(f"[BOT] {current_player.username} actions: {actions}, call={call_amount}")
+        if not is_bot_player(current_player):
+            logger.debug(f"[TURN] Human player at seat {table.current_player_seat}, sending TURN_PROMPT")
+            self._send_turn_prompt(room_id, table)
+            return
 
-                if not actions:
-                    no_actions_retry_count += 1
-                    if no_actions_retry_count <= 3:
-                        logger.info(f"[BOT] No actions available, retry {no_actions_retry_count}/3")
-                        await asyncio.sleep(RETRY_DELAY)
-                        table._update_current_player()
-                        continue
-                    else:
-                        logger.warning("[BOT] No actions available after retries")
-                        return
-
-                # 유효한 actions를 찾았으면 재시도 카운터 리셋
-                no_actions_retry_count = 0
-
-                # Bot decision logic with hand strength evaluation
-                action, amount = self._decide_bot_action(
-                    actions=actions,
-                    call_amount=call_amount,
-                    stack=current_player.stack,
-                    available=available,
-                    hole_cards=current_player.hole_cards or [],
-                    community_cards=table.community_cards or [],
-                    pot=table.pot,
+        # 생각 시간 동안 워커에서 결정 → 생각 시간과 평가 중 늦은 쪽에 적용
+        available = table.get_available_actions(current_player.user_id)
+        decision = self._bot_decisions.submit(BotDecisionRequest(
+            actions=tuple(available.get("actions", [])),
+            call_amount=available.get("call_amount", 0),
+            stack=current_player.stack,
+            available=dict(available),
+            hole_cards=tuple(current_player.hole_cards or ()),
+            community_cards=tuple(table.community_cards or ()),
+            pot=table.pot,
+        ))
+        delay = self._bot_think_delay()
+        logger.debug(f"[BOT] {current_player.username} thinking for {delay:.1f}s...")
+        actor.schedule_after(
+            TURN_TIMER,
+            delay,
+            decision,
+            partial(
+                self._bot_move,
+                room_id,
+                table.current_player_seat,
+                table.hand_number,
+                decision,
+                retries,
+            ),
+        )
+
+    def _retry_turn(self, room_id: str, retries: int) -> None:
+        """[actor] 테이블 상태 갱신 후 턴 재시도."""
+        table = game_manager.get_table(room_id)
+        if table is None:
+            return
+        table._update_current_player()
+        self._advance_turn(room_id, retries)
+
+    def _resume_after_phase_change(self, room_id: str) -> None:
+        """[actor] 페이즈 전환 애니메이션 후 다음 턴."""
+        table = game_manager.get_table(room_id)
+        if table is None:
+            return
+        table._update_current_player()
+
+        if table.phase == GamePhase.WAITING:
+            logger.info("[BOT] Hand completed after phase change")
+            return
+
+        self._get_actor(room_id).emit(partial(
+            self._broadcast, room_id, self._turn_changed_message(room_id, table)
+        ))
+        self._advance_turn(room_id)
+
+    def _bot_move(
+        self,
+        room_id: str,
+        expected_seat: int,
+        hand_number: int,
+        decision: asyncio.Future[tuple[str, int]],
+        retries: int = 0,
+    ) -> None:
+        """[actor] 봇 액션 - 생각 시간 동안 바뀌었을 수 있는 상태를 재확인 후 실행.
+
+        decision은 _advance_turn에서 요청한 워커 결정 (이 시점엔 완료 상태).
+        """
+        table = game_manager.get_table(room_id)
+        if table is None:
+            logger.warning(f"[BOT] Table {room_id} deleted during bot thinking")
+            return
+
+        if not self._hand_in_progress(table):
+            logger.info("[BOT] Hand completed during bot thinking")
+            return
+
+        # 현재 플레이어/핸드가 변경되었는지 확인
+        if table.current_player_seat != expected_seat or table.hand_number != hand_number:
+            logger.warning(
+                f"[BOT] Current player changed during thinking: "
+                f"expected={expected_seat}, actual={table.current_player_seat}, refreshing..."
+            )
+            self._advance_turn(room_id, retries)
+            return
+
+        current_player = table.players.get(expected_seat)
+        if not current_player:
+            logger.warning(f"[BOT] Player at seat {expected_seat} no longer exists")
+            return
+
+        if not is_bot_player(current_player):
+            logger.warning(f"[BOT] Player at seat {expected_seat} is no longer a bot")
+            self._send_turn_prompt(room_id, table)
+            return
+
+        available = table.get_available_actions(current_player.user_id)
+        actions = available.get("actions", [])
+        call_amount = available.get("call_amount", 0)
+
+        logger.debug(f"[BOT] {current_player.username} actions: {actions}, call={call_amount}")
+
+        if not actions:
+            if retries < MAX_TURN_RETRIES:
+                logger.info(f"[BOT] No actions available, retry {retries + 1}/{MAX_TURN_RETRIES}")
+                self._get_actor(room_id).schedule(
+                    TURN_TIMER,
+                    TURN_RETRY_DELAY,
+                    partial(self._retry_turn, room_id, retries + 1),
                 )
+            else:
+                logger.warning("[BOT] No actions available after retries")
+            return
 
-                logger.info(f"[BOT] {current_player.username} chose: {action} {amount}")
+        action, amount = (None, 0) if decision.cancelled() else decision.result()
+        if action not in actions:
+            # 워커 결과를 쓸 수 없으면 (종료로 취소 / 요청 후 상태 변경) 현재 상태로 결정
+            action, amount = self._decide_bot_action(
+                actions=actions,
+                call_amount=call_amount,
+                stack=current_player.stack,
+                available=available,
+                hole_cards=current_player.hole_cards or [],
+                community_cards=table.community_cards or [],
+                pot=table.pot,
+            )
 
-                # Process bot action
-                result = table.process_action(current_player.user_id, action, amount)
+        logger.debug(f"[BOT] {current_player.username} chose: {action} {amount}")
 
-                if not result.get("success"):
-                    error_msg = result.get('error', 'Unknown error')
-                    logger.error(f"[BOT] Action failed: {error_msg}")
-                    # should_refresh가 있으면 상태 갱신 후 재시도
-                    if result.get("should_refresh"):
-                        logger.info("[BOT] Refreshing state and retrying...")
-                        table._update_current_player()
-                        continue
-                    return
+        result = table.process_action(current_player.user_id, action, amount)
 
-                # ========================================
-                # Safety Check 4: 액션 처리 후 핸드 완료 상태 체크
-                # ========================================
-                # Hand complete - 결과 먼저 전송
-                if result.get("hand_complete"):
-                    logger.info("[BOT] Hand complete after action, broadcasting results")
-                    await self._broadcast_hand_result(room_id, result.get("hand_result"))
-                    await self._broadcast_action(room_id, result)
-                    await self._broadcast_personalized_states(room_id, table)
-                    # Auto-start next hand
-                    create_safe_task(
-                        self._auto_start_next_hand(room_id, table),
-                        name=f"auto_start_bot_{room_id}",
-                    )
-                    return
+        if not result.get("success"):
+            logger.error(f"[BOT] Action failed: {result.get('error', 'Unknown error')}")
+            # should_refresh가 있으면 상태 갱신 후 재시도
+            if result.get("should_refresh") and retries < MAX_TURN_RETRIES:
+                logger.info("[BOT] Refreshing state and retrying...")
+                self._retry_turn(room_id, retries + 1)
+            return
 
-                # Broadcast action
-                await self._broadcast_action(room_id, result)
-
-                # Phase changed - broadcast community cards (핸드 완료 시에는 전송 안 함)
-                if result.get("phase_changed"):
-                    await self._broadcast_community_cards(room_id, table)
-                    # 페이즈 전환 후 커뮤니티 카드 애니메이션 대기
-                    # 프론트엔드 애니메이션: 칩 수집(700ms) + 대기(400ms) + 카드 공개(3장×300ms) + 마무리(300ms) ≈ 2.3초
-                    await asyncio.sleep(self._settings.phase_transition_delay_seconds + 2.5)
-                    table._update_current_player()
-
-                    # 페이즈 전환 후 핸드 완료 상태 재확인
-                    if table.phase.value == "waiting":
-                        logger.info("[BOT] Hand completed after phase change, exiting")
-                        return
-
-                    # 페이즈 전환 후 현재 플레이어가 휴먼이면 즉시 TURN_PROMPT 전송
-                    current_player = table.players.get(table.current_player_seat)
-                    if current_player and not is_bot_player(current_player):
-                        logger.info(f"[BOT] Phase changed, human player at seat {table.current_player_seat}, sending TURN_PROMPT")
-                        await self._broadcast_turn_changed(room_id, table)
-                        await self._send_turn_prompt(room_id, table)
-                        return
-
-                # Broadcast turn changed
-                await self._broadcast_turn_changed(room_id, table)
-                # Loop continues to handle next player
-
-            logger.warning(f"[BOT] Max iterations ({MAX_ITERATIONS}) reached!")
-        except Exception as e:
-            logger.error(f"[BOT] Exception in _process_next_turn: {e}", exc_info=True)
-            import traceback
-            traceback.print_exc()
+        self._after_action(room_id, table, result, by_bot=True)
+
+    @staticmethod
+    def _hand_in_progress(table: PokerTable) -> bool:
+        if table.phase == GamePhase.WAITING:
+            return False
+        return getattr(table, "hand_in_progress", True)
+
+    # =========================================================================
+    # Animation Timing
+    # =========================================================================
+
+    def _bot_think_delay(self) -> float:
+        """봇 생각 시간 (삼각분포 + 일정 확률로 긴 고민, bot_think_* 설정)."""
+        return self._bot_decisions.think_delay()
+
+    def _dealing_delay(self, table: PokerTable) -> float:
+        """카드 딜링 애니메이션 대기 (플레이어 수 × 2장 × 0.15초 + 여유).
+
+        프론트엔드: 150ms 시작지연 + (카드수 × 150ms) + 400ms 완료지연 + 네트워크/렌더링 여유
+        """
+        active_player_count = len([p for p in table.players.values() if p and p.status == "active"])
+        # 딜링 + 블라인드 표시(0.5s) + 딜링 시작 전(0.5s) + 여유(1.5s)
+        return (active_player_count * 2 * 0.15) + 2.5
+
+    def _phase_transition_delay(self) -> float:
+        """페이즈 전환 후 커뮤니티 카드 애니메이션 대기.
+
+        칩 수집(700ms) + 대기(400ms) + 카드 공개(3장×300ms) + 마무리(300ms) ≈ 2.3초
+        """
+        return self._settings.phase_transition_delay_seconds + 2.5
+
+    def _next_hand_delay(self) -> float:
+        """WIN 표시가 충분히 보이도록 다음 핸드 시작 전 대기."""
+        return self._settings.hand_result_display_seconds + 2.0
 
     def _decide_bot_action(
         self,
@@ -753,244 +808,95 @@ class ActionHandler(BaseHandler):
         community_cards: list[str] | None = None,
         pot: int = 0,
     ) -> tuple[str, int]:
-        """핸드 강도 기반 봇 결정 로직.
+        """핸드 강도 기반 봇 결정 (이벤트 루프에서 바로 실행하는 폴백 경로).
 
-        실제 홀덤 플레이어처럼 행동:
-        - 핸드 강도에 따라 베팅/레이즈/콜/폴드 결정
-        - 팟 오즈 고려
-        - 드로우 가능성 고려
-        - 약간의 무작위성 추가 (예측 불가능하게)
+        보통은 BotDecisionService 워커 결과를 사용합니다.
         """
-        hole_cards = hole_cards or []
-        community_cards = community_cards or []
-
-        # 핸드 강도 평가
-        eval_result = evaluate_hand_for_bot(
+        return decide_bot_action(
+            actions=actions,
+            call_amount=call_amount,
+            stack=stack,
+            available=available,
             hole_cards=hole_cards,
             community_cards=community_cards,
             pot=pot,
-            to_call=call_amount,
         )
 
-        strength = eval_result["strength"]
-        has_draw = eval_result["has_draw"]
-        recommendation = eval_result["recommendation"]
-
-        logger.info(
-            f"[BOT] Hand eval: strength={strength:.2f}, "
-            f"phase={eval_result['phase']}, draw={has_draw}, "
-            f"rec={recommendation}, desc={eval_result['description']}"
-        )
-
-        # 무작위성 추가 (5% 확률로 예상 밖 행동)
-        roll = random.random()
-
-        # ========================================
-        # 강한 핸드 (strength >= 0.70): 공격적
-        # ========================================
-        if strength >= 0.70:
-            # 레이즈/베팅 우선
-            if "raise" in actions and roll < 0.85:
-                min_raise = available.get("min_raise", call_amount * 2)
-                max_raise = available.get("max_raise", stack)
-                # 강도에 따라 레이즈 크기 조절
-                if strength >= 0.90:
-                    # 매우 강함: 큰 레이즈 (50-100% pot)
-                    raise_amount = min(max_raise, max(min_raise, int(pot * random.uniform(0.5, 1.0))))
-                else:
-                    # 강함: 중간 레이즈 (30-60% pot)
-                    raise_amount = min(max_raise, max(min_raise, int(pot * random.uniform(0.3, 0.6))))
-                return "raise", raise_amount
-
-            if "bet" in actions:
-                min_raise = available.get("min_raise", 0)
-                max_raise = available.get("max_raise", stack)
-                bet_amount = min(max_raise, max(min_raise, int(pot * random.uniform(0.4, 0.75))))
-                return "bet", bet_amount
-
-            # 레이즈/베팅 불가시 콜
-            if "call" in actions:
-                return "call", call_amount
-
-            if "check" in actions:
-                return "check", 0
-
-        # ========================================
-        # 중간 핸드 (0.45 <= strength < 0.70): 밸런스
-        # ========================================
-        elif strength >= 0.45:
-            # 가끔 베팅/레이즈 (40% 확률)
-            if roll < 0.40:
-                if "bet" in actions:
-                    min_raise = available.get("min_raise", 0)
-                    max_raise = available.get("max_raise", stack)
-                    bet_amount = min(max_raise, max(min_raise, int(pot * random.uniform(0.3, 0.5))))
-                    return "bet", bet_amount
-
-                if "raise" in actions and call_amount < stack * 0.15:
-                    min_raise = available.get("min_raise", call_amount * 2)
-                    return "raise", min_raise
-
-            # 체크 가능하면 체크
-            if "check" in actions:
-                return "check", 0
-
-            # 콜 금액이 적당하면 콜 (스택의 20% 이하)
-            if "call" in actions:
-                if call_amount <= stack * 0.20:
-                    return "call", call_amount
-                # 드로우가 있으면 좀 더 콜
-                if has_draw and call_amount <= stack * 0.30:
-                    return "call", call_amount
-                # 아니면 폴드
-                return "fold", 0
-
-        # ========================================
-        # 약한 핸드 + 드로우 (0.30 <= strength < 0.45)
-        # ========================================
-        elif strength >= 0.30 and has_draw:
-            if "check" in actions:
-                return "check", 0
-
-            # 팟 오즈가 좋으면 콜 (콜 금액이 팟의 25% 이하)
-            if "call" in actions:
-                pot_odds_ok = call_amount <= pot * 0.25
-                stack_ok = call_amount <= stack * 0.15
-                if pot_odds_ok and stack_ok:
-                    return "call", call_amount
-
-            return "fold", 0
-
-        # ========================================
-        # 약한 핸드 (strength < 0.30): 수비적
-        # ========================================
-        else:
-            if "check" in actions:
-                # 가끔 블러프 (10% 확률, 프리플롭 제외)
-                if roll < 0.10 and community_cards and "bet" in actions:
-                    min_raise = available.get("min_raise", 0)
-                    return "bet", min_raise
-                return "check", 0
-
-            # 매우 적은 금액만 콜 (스택의 5% 이하)
-            if "call" in actions and call_amount <= stack * 0.05:
-                # 그래도 30% 확률로만 콜
-                if roll < 0.30:
-                    return "call", call_amount
-
-            return "fold", 0
-
-        # ========================================
-        # Fallback
-        # ========================================
-        if "check" in actions:
-            return "check", 0
-        if "fold" in actions:
-            return "fold", 0
-        if actions:
-            return actions[0], call_amount if actions[0] == "call" else 0
-
-        return "fold", 0
-
-    async def _start_turn_timeout(self, room_id: str, table: PokerTable, position: int, turn_time: int = 15) -> None:
+    def _start_turn_timeout(self, room_id: str, table: PokerTable, position: int, turn_time: int = 15) -> None:
         """서버 측 턴 타임아웃 시작.
 
-        지정된 시간(초) 후 자동 폴드.
+        지정된 시간(초) 후 자동 폴드 명령을 테이블 액터에 예약합니다.
         """
         # 기존 타임아웃 취소
-        await self._cancel_turn_timeout(room_id)
+        self._cancel_turn_timeout(room_id)
 
         player = table.players.get(position)
         if not player:
             return
 
-        # 봇은 타임아웃 처리 안 함 (봇 루프에서 별도 처리)
+        # 봇은 타임아웃 처리 안 함 (봇 액션은 별도 예약)
         if is_bot_player(player):
             return
 
-        async def timeout_handler():
-            try:
-                await asyncio.sleep(turn_time)
-
-                # 아직 이 플레이어 턴인지 확인 후 자동 폴드
-                if table.current_player_seat == position:
-                    await self._execute_timeout_fold(room_id, table, position)
-
-            except asyncio.CancelledError:
-                pass  # 정상적으로 취소됨 (액션 수행)
-
-        self._timeout_tasks[room_id] = create_safe_task(
-            timeout_handler(),
-            name=f"turn_timeout_{room_id}",
+        self._get_actor(room_id).schedule(
+            TURN_TIMER,
+            turn_time,
+            partial(self._execute_timeout_fold, room_id, position),
         )
-        logger.info(f"[TIMEOUT] Started for room={room_id}, seat={position}, time={turn_time}s")
+        logger.debug(f"[TIMEOUT] Started for room={room_id}, seat={position}, time={turn_time}s")
 
-    async def _cancel_turn_timeout(self, room_id: str) -> None:
-        """진행 중인 타임아웃 태스크 취소."""
-        if room_id in self._timeout_tasks:
-            self._timeout_tasks[room_id].cancel()
-            try:
-                await self._timeout_tasks[room_id]
-            except asyncio.CancelledError:
-                pass
-            del self._timeout_tasks[room_id]
+    def _cancel_turn_timeout(self, room_id: str) -> None:
+        """예약된 턴 타임아웃 취소."""
+        actor = self._actors.peek(room_id)
+        if actor is not None and actor.cancel(TURN_TIMER):
             logger.debug(f"[TIMEOUT] Cancelled for room={room_id}")
 
-    async def _execute_timeout_fold(self, room_id: str, table: PokerTable, position: int) -> None:
-        """타임아웃으로 인한 자동 액션 실행.
+    def _execute_timeout_fold(self, room_id: str, position: int) -> None:
+        """[actor] 타임아웃으로 인한 자동 액션 실행.
 
         - 체크 가능하면 자동 체크
         - 콜해야 하면 자동 폴드
         """
-        table_lock = self._get_table_lock(room_id)
-        async with table_lock:
-            player = table.players.get(position)
-            if not player or table.current_player_seat != position:
-                return
+        table = game_manager.get_table(room_id)
+        if table is None:
+            return
 
-            # 체크 가능한지 확인 (현재 베팅이 내 베팅과 같으면 체크 가능)
-            can_check = player.current_bet >= table.current_bet
+        player = table.players.get(position)
+        if not player or table.current_player_seat != position:
+            return
 
-            # 체크 가능하면 자동 체크, 아니면 자동 폴드
-            action_type = "check" if can_check else "fold"
-            result = table.process_action(player.user_id, action_type, 0)
+        # 체크 가능한지 확인 (현재 베팅이 내 베팅과 같으면 체크 가능)
+        can_check = player.current_bet >= table.current_bet
 
-            if result.get("success"):
-                result["timeout"] = True
-                result["timed_out_position"] = position
+        # 체크 가능하면 자동 체크, 아니면 자동 폴드
+        action_type = "check" if can_check else "fold"
+        result = table.process_action(player.user_id, action_type, 0)
 
-                logger.warning(f"[TIMEOUT_{action_type.upper()}] room={room_id}, seat={position}")
+        if not result.get("success"):
+            # 둘 다 실패하면 로그 (일반적으로 발생하지 않아야 함)
+            logger.error(f"[TIMEOUT] Failed to execute {action_type}: {result.get('error')}")
+            return
 
-                # TIMEOUT_FOLD 이벤트 브로드캐스트 (체크든 폴드든 타임아웃 이벤트 전송)
-                timeout_message = MessageEnvelope.create(
-                    event_type=EventType.TIMEOUT_FOLD,
-                    payload={
-                        "tableId": room_id,
-                        "position": position,
-                        "action": action_type,
-                    },
-                )
-                channel = f"table:{room_id}"
-                await self.manager.broadcast_to_channel(channel, timeout_message.to_dict())
-
-                # 핸드 완료 여부에 따라 처리
-                if result.get("hand_complete"):
-                    await self._broadcast_hand_result(room_id, result.get("hand_result"))
-                    await self._broadcast_action(room_id, result)
-                    await self._broadcast_personalized_states(room_id, table)
-                    create_safe_task(
-                        self._auto_start_next_hand(room_id, table),
-                        name=f"auto_start_timeout_{room_id}",
-                    )
-                else:
-                    await self._broadcast_action(room_id, result)
-                    await self._process_next_turn(room_id, table)
-            else:
-                # 둘 다 실패하면 로그 (일반적으로 발생하지 않아야 함)
-                logger.error(f"[TIMEOUT] Failed to execute {action_type}: {result.get('error')}")
+        result["timeout"] = True
+        result["timed_out_position"] = position
+
+        logger.warning(f"[TIMEOUT_{action_type.upper()}] room={room_id}, seat={position}")
+
+        # TIMEOUT_FOLD 이벤트 브로드캐스트 (체크든 폴드든 타임아웃 이벤트 전송)
+        timeout_message = MessageEnvelope.create(
+            event_type=EventType.TIMEOUT_FOLD,
+            payload={
+                "tableId": room_id,
+                "position": position,
+                "action": action_type,
+            },
+        )
+        self._get_actor(room_id).emit(partial(self._broadcast, room_id, timeout_message.to_dict()))
 
-    async def _send_turn_prompt(self, room_id: str, table: PokerTable) -> None:
-        """Send TURN_PROMPT to current player. UTG gets 20s, others get 15s."""
+        self._after_action(room_id, table, result)
+
+    def _send_turn_prompt(self, room_id: str, table: PokerTable) -> None:
+        """[actor] Send TURN_PROMPT to current player. UTG gets 20s, others get 15s."""
         if table.current_player_seat is None:
             return
 
@@ -999,7 +905,7 @@ class ActionHandler(BaseHandler):
             return
 
         available = table.get_available_actions(current_player.user_id)
-        logger.info(f"[TURN_PROMPT] available_actions for {current_player.user_id}: {available}")
+        logger.debug(f"[TURN_PROMPT] available_actions for {current_player.user_id}: {available}")
 
         # Format allowed actions for frontend
         allowed = []
@@ -1017,7 +923,6 @@ class ActionHandler(BaseHandler):
             allowed.append(action_dict)
 
         # 타이머 설정: 프리플랍 UTG는 20초, 나머지는 15초
-        from app.game.poker_table import GamePhase
         is_utg = table.phase == GamePhase.PREFLOP and getattr(table, '_is_preflop_first_turn', False)
         turn_time = 20 if is_utg else 15
 
@@ -1049,13 +954,22 @@ class ActionHandler(BaseHandler):
             },
         )
 
-        channel = f"table:{room_id}"
-        await self.manager.broadcast_to_channel(channel, message.to_dict())
-        logger.info(f"[TURN_PROMPT] seat={table.current_player_seat}, time={turn_time}s, utg={is_utg}")
+        self._get_actor(room_id).emit(partial(self._broadcast, room_id, message.to_dict()))
+        logger.debug(f"[TURN_PROMPT] seat={table.current_player_seat}, time={turn_time}s, utg={is_utg}")
 
         # 서버 타임아웃 시작 (휴먼 플레이어만)
         if not is_bot_player(current_player):
-            await self._start_turn_timeout(room_id, table, table.current_player_seat, turn_time)
+            self._start_turn_timeout(room_id, table, table.current_player_seat, turn_time)
+
+    # =========================================================================
+    # Broadcasts (table actor side effects)
+    # =========================================================================
+    # 메시지 내용은 명령 실행 시점에 만들고 전송만 outbox에서 실행합니다
+    # (전송 시점에는 테이블이 이미 다음 상태로 진행했을 수 있음).
+
+    async def _broadcast(self, room_id: str, message: dict[str, Any]) -> None:
+        """Broadcast a prebuilt message to the table channel."""
+        await self.manager.broadcast_to_channel(table_channel(room_id), message)
 
     async def _broadcast_action(self, room_id: str, result: ActionResult) -> None:
         """Broadcast action result to all players."""
@@ -1078,24 +992,57 @@ class ActionHandler(BaseHandler):
             },
         )
 
-        channel = f"table:{room_id}"
+        channel = table_channel(room_id)
         await self.manager.broadcast_to_channel(channel, message.to_dict())
 
-    async def _broadcast_community_cards(self, room_id: str, table: PokerTable) -> None:
-        """Broadcast community cards."""
-        message = MessageEnvelope.create(
+    def _community_cards_message(self, room_id: str, table: PokerTable) -> dict[str, Any]:
+        """Build COMMUNITY_CARDS message."""
+        return MessageEnvelope.create(
             event_type=EventType.COMMUNITY_CARDS,
             payload={
                 "tableId": room_id,
                 "phase": table.phase.value,
-                "cards": table.community_cards,
+                "cards": list(table.community_cards),
             },
-        )
+        ).to_dict()
 
-        channel = f"table:{room_id}"
-        await self.manager.broadcast_to_channel(channel, message.to_dict())
+    def _emit_hand_result(
+        self,
+        actor: TableActor,
+        room_id: str,
+        table: PokerTable,
+        hand_result: HandResult | None,
+    ) -> None:
+        """[actor] HAND_RESULT 전송 등록 (좌석/참가자 정보는 지금 스냅샷)."""
+        if not hand_result:
+            return
 
-    async def _broadcast_hand_result(self, room_id: str, hand_result: HandResult | None) -> None:
+        # player_seats 매핑 생성 (user_id -> seat)
+        player_seats = {
+            player.user_id: seat
+            for seat, player in table.players.items()
+            if player
+        }
+        hand_snapshot = (
+            self._hand_completed_snapshot(room_id, table, hand_result)
+            if self._fraud_publisher.enabled
+            else None
+        )
+        actor.emit(partial(
+            self._broadcast_hand_result,
+            room_id,
+            hand_result,
+            player_seats,
+            hand_snapshot,
+        ))
+
+    async def _broadcast_hand_result(
+        self,
+        room_id: str,
+        hand_result: HandResult | None,
+        player_seats: dict[str, int],
+        hand_snapshot: dict[str, Any] | None = None,
+    ) -> None:
         """Broadcast hand result with personalized showdown data.
 
         보안: 각 플레이어에게 자신의 카드와 승자 카드만 표시,
@@ -1104,14 +1051,6 @@ class ActionHandler(BaseHandler):
         if not hand_result:
             return
 
-        # 테이블에서 player_seats 매핑 생성 (user_id -> seat)
-        table = game_manager.get_table(room_id)
-        player_seats: dict[str, int] = {}
-        if table:
-            for seat, player in table.players.items():
-                if player:
-                    player_seats[player.user_id] = seat
-
         # PersonalizedBroadcaster를 사용하여 개인화된 HAND_RESULT 전송
         broadcaster = PersonalizedBroadcaster(self.manager)
         await broadcaster.broadcast_hand_result(
@@ -1120,6 +1059,11 @@ class ActionHandler(BaseHandler):
             player_seats=player_seats,
         )
 
+        # 핸드 종료 후 인원 변화(버스트 등)를 로비에 반영
+        table = game_manager.get_table(room_id)
+        if table:
+            await lobby_index.sync_table(table)
+
         # 환불 (Uncalled Bet) 이벤트 발송
         refund_info = hand_result.get("refund")
         if refund_info:
@@ -1132,11 +1076,11 @@ class ActionHandler(BaseHandler):
                     "amount": refund_info.get("amount"),
                 },
             )
-            await self.manager.broadcast_to_channel(channel, refund_message.to_dict())
+            await self._broadcast(room_id, refund_message.to_dict())
             logger.info(f"[REFUND] Broadcast: seat={refund_info.get('seat')}, amount={refund_info.get('amount')}")
 
         # Publish fraud detection event (hand completed)
-        await self._publish_hand_completed_event(room_id, hand_result)
+        await self._publish_hand_completed_event(room_id, hand_result, hand_snapshot)
 
         # 스택이 0인 플레이어에게 STACK_ZERO 이벤트 전송 (리바이 모달용)
         zero_stack_players = hand_result.get("zeroStackPlayers", [])
@@ -1224,35 +1168,40 @@ class ActionHandler(BaseHandler):
             )
             return None
 
-        # DB transaction: deduct balance and update table seats
+        # DB transaction: deduct balance (WalletService) and update table seats
         try:
             from app.models.user import User
             from app.models.table import Table as DBTable
+            from app.services.wallet import InsufficientBalanceError, WalletService
             from sqlalchemy import select
             from sqlalchemy.orm import attributes
 
             async with get_db_session() as db:
-                # Get user and check balance
                 user = await db.get(User, user_id)
                 if not user:
                     logger.warning(f"[REBUY] User not found in DB: {user_id}")
                     await send_rebuy_error("USER_NOT_FOUND", "사용자를 찾을 수 없습니다.")
                     return None
 
-                if user.balance < amount:
-                    logger.warning(f"[REBUY] Insufficient balance: {user.balance} < {amount}")
-                    await send_rebuy_error(
-                        "INSUFFICIENT_BALANCE",
-                        f"잔액이 부족합니다. 필요: {amount:,}, 보유: {user.balance:,}",
-                    )
-                    return None
-
                 # Get DB table to update seats
                 result = await db.execute(
                     select(DBTable).where(DBTable.room_id == room_id)
                 )
                 db_table = result.scalar_one_or_none()
 
+                # 잔액 확인 + 차감 (hot-path 모드에서는 krw_transfer.lua 1회 호출)
+                try:
+                    await WalletService(db).buy_in(
+                        user_id, amount, db_table.id if db_table else room_id
+                    )
+                except InsufficientBalanceError as e:
+                    logger.warning(f"[REBUY] Insufficient balance: {e.current} < {amount}")
+                    await send_rebuy_error(
+                        "INSUFFICIENT_BALANCE",
+                        f"잔액이 부족합니다. 필요: {amount:,}, 보유: {e.current:,}",
+                    )
+                    return None
+
                 if db_table:
                     # Update seats in DB
                     seats = db_table.seats or {}
@@ -1262,9 +1211,6 @@ class ActionHandler(BaseHandler):
                         db_table.seats = seats
                         attributes.flag_modified(db_table, "seats")
 
-                # Deduct from user balance
-                user.balance -= amount
-
                 await db.commit()
                 logger.info(f"[REBUY] DB updated: user {user_id} balance deducted {amount}")
 
@@ -1273,9 +1219,8 @@ class ActionHandler(BaseHandler):
             await send_rebuy_error("DB_ERROR", "리바이 처리 중 오류가 발생했습니다.")
             return None
 
-        # Update player stack in GameManager (after DB success)
-        player.stack = amount
-        player.status = "active"  # sitting_out → active
+        # Update player stack in GameManager (after DB success, on the table actor)
+        await self._get_actor(room_id).call(partial(self._apply_rebuy, player, amount))
 
         logger.info(f"[REBUY] Player {user_id} rebuyed {amount} at seat {player_seat}")
 
@@ -1294,7 +1239,7 @@ class ActionHandler(BaseHandler):
                 },
             },
         )
-        channel = f"table:{room_id}"
+        channel = table_channel(room_id)
         await self.manager.broadcast_to_channel(channel, update_message.to_dict())
 
         # Send rebuy result to the player
@@ -1311,8 +1256,13 @@ class ActionHandler(BaseHandler):
 
         return None
 
-    async def _broadcast_hand_started(self, room_id: str, result: dict[str, Any], table: PokerTable) -> None:
-        """Broadcast hand started with seats data (including blinds)."""
+    def _apply_rebuy(self, player: Player, amount: int) -> None:
+        """[actor] 리바이 스택 반영 (DB 처리 성공 후)."""
+        player.stack = amount
+        player.status = "active"  # sitting_out → active
+
+    def _hand_started_message(self, room_id: str, result: dict[str, Any], table: PokerTable) -> dict[str, Any]:
+        """Build HAND_STARTED message with seats data (including blinds)."""
         # seats 데이터 구성 (블라인드 칩 포함)
         seats_data = []
         for seat in range(table.max_players):
@@ -1332,7 +1282,7 @@ class ActionHandler(BaseHandler):
         # SB/BB 좌석 계산
         sb_seat, bb_seat = table.get_blind_seats()
 
-        message = MessageEnvelope.create(
+        return MessageEnvelope.create(
             event_type=EventType.HAND_STARTED,
             payload={
                 "tableId": room_id,
@@ -1344,70 +1294,82 @@ class ActionHandler(BaseHandler):
                 "phase": "preflop",
                 "pot": table.pot,
             },
-        )
-
-        channel = f"table:{room_id}"
-        await self.manager.broadcast_to_channel(channel, message.to_dict())
+        ).to_dict()
 
-    async def _broadcast_turn_changed(self, room_id: str, table: PokerTable) -> None:
-        """Broadcast turn changed."""
-        message = MessageEnvelope.create(
+    def _turn_changed_message(self, room_id: str, table: PokerTable) -> dict[str, Any]:
+        """Build TURN_CHANGED message."""
+        return MessageEnvelope.create(
             event_type=EventType.TURN_CHANGED,
             payload={
                 "tableId": room_id,
                 "currentPlayer": table.current_player_seat,
                 "currentBet": table.current_bet,
             },
-        )
+        ).to_dict()
 
-        channel = f"table:{room_id}"
-        await self.manager.broadcast_to_channel(channel, message.to_dict())
+    def _emit_personalized_states(self, actor: TableActor, room_id: str, table: PokerTable) -> None:
+        """[actor] 플레이어별 TABLE_SNAPSHOT 전송 등록 (상태는 지금 스냅샷)."""
+        actor.emit(partial(self._send_to_users, self._personalized_state_messages(room_id, table)))
 
-    async def _broadcast_personalized_states(self, room_id: str, table: PokerTable) -> None:
-        """Send personalized game state to each player."""
-        for seat, player in table.players.items():
-            if player:
-                state = table.get_state_for_player(player.user_id)
-                message = MessageEnvelope.create(
+    def _personalized_state_messages(
+        self,
+        room_id: str,
+        table: PokerTable,
+    ) -> list[tuple[str, dict[str, Any]]]:
+        """Build (user_id, TABLE_SNAPSHOT) pairs with each player's own hole cards."""
+        return [
+            (
+                player.user_id,
+                MessageEnvelope.create(
                     event_type=EventType.TABLE_SNAPSHOT,
                     payload={
                         "tableId": room_id,
-                        "state": state,
+                        "state": table.get_state_for_player(player.user_id),
                     },
-                )
-                # Send to specific user
-                await self.manager.send_to_user(player.user_id, message.to_dict())
-
-    async def _auto_start_next_hand(self, room_id: str, table: PokerTable) -> None:
-        """Auto-start next hand after delay."""
-        # WIN 표시가 충분히 보이도록 대기
-        await asyncio.sleep(self._settings.hand_result_display_seconds + 2.0)
-
-        # Lock per table to prevent concurrent operations
-        table_lock = self._get_table_lock(room_id)
-        async with table_lock:
-            if not table.can_start_hand():
-                logger.info(f"[GAME] Cannot auto-start next hand (not enough players)")
-                return
+                ).to_dict(),
+            )
+            for player in table.players.values()
+            if player
+        ]
 
-            result = table.start_new_hand()
-            if not result.get("success"):
-                logger.error(f"[GAME] Auto-start failed: {result.get('error')}")
-                return
+    async def _send_to_users(self, messages: list[tuple[str, dict[str, Any]]]) -> None:
+        """Send prebuilt messages to specific users."""
+        for user_id, message in messages:
+            await self.manager.send_to_user(user_id, message)
 
-            logger.info(f"[GAME] Auto-started hand #{result.get('hand_number')}")
+    def _deal_hand(self, room_id: str, table: PokerTable, result: dict[str, Any]) -> None:
+        """[actor] 새 핸드 브로드캐스트 등록 + 딜링 애니메이션 후 첫 턴 예약."""
+        actor = self._get_actor(room_id)
 
-            await self._broadcast_hand_started(room_id, result, table)
-            await self._broadcast_personalized_states(room_id, table)
+        # Broadcast hand started (with seats/blinds data)
+        actor.emit(partial(
+            self._broadcast, room_id, self._hand_started_message(room_id, result, table)
+        ))
+        # Send personalized states (with hole cards)
+        self._emit_personalized_states(actor, room_id, table)
 
-            # 카드 딜링 애니메이션 대기 (플레이어 수 × 2장 × 0.15초 + 여유)
-            # 프론트엔드: 150ms 시작지연 + (카드수 × 150ms) + 400ms 완료지연 + 네트워크/렌더링 여유
-            active_player_count = len([p for p in table.players.values() if p and p.status == "active"])
-            dealing_delay = (active_player_count * 2 * 0.15) + 2.5  # 딜링 + 블라인드 표시(0.5s) + 딜링 시작 전(0.5s) + 여유(1.5s)
-            logger.info(f"[GAME] Waiting {dealing_delay:.1f}s for dealing animation ({active_player_count} players)")
-            await asyncio.sleep(dealing_delay)
+        dealing_delay = self._dealing_delay(table)
+        logger.debug(f"[GAME] First turn in {dealing_delay:.1f}s (dealing animation)")
+        actor.schedule(TURN_TIMER, dealing_delay, partial(self._advance_turn, room_id))
 
-            await self._process_next_turn(room_id, table)
+    def _auto_start_next_hand(self, room_id: str) -> None:
+        """[actor] Auto-start next hand (핸드 결과 표시 후 예약 실행)."""
+        table = game_manager.get_table(room_id)
+        if table is None:
+            return
+
+        if not table.can_start_hand():
+            logger.info(f"[GAME] Cannot auto-start next hand (not enough players)")
+            return
+
+        result = table.start_new_hand()
+        if not result.get("success"):
+            logger.error(f"[GAME] Auto-start failed: {result.get('error')}")
+            return
+
+        logger.info(f"[GAME] Auto-started hand #{result.get('hand_number')}")
+
+        self._deal_hand(room_id, table, result)
 
     # ========================================
     # Resource Cleanup Methods
@@ -1417,18 +1379,15 @@ class ActionHandler(BaseHandler):
         """Clean up all resources associated with a table.
 
         Called when a table is removed or reset.
-        Prevents memory leaks by removing locks and cancelling timeout tasks.
+        Stops the table actor, which also cancels its scheduled commands
+        (turn timeout, pending bot move, next hand).
 
         Args:
             room_id: The table/room identifier to clean up
         """
-        # Cancel and remove timeout task
-        await self._cancel_turn_timeout(room_id)
-
-        # Remove table lock from tracker
-        removed = self._lock_tracker.remove(room_id)
+        removed = await self._actors.remove(room_id)
         if removed:
-            logger.info(f"[CLEANUP] Removed lock for room {room_id}")
+            logger.info(f"[CLEANUP] Stopped actor for room {room_id}")
 
         # Clean up turn start times for this room
         stale_keys = [k for k in self._turn_start_times if k.startswith(f"{room_id}:")]
@@ -1440,30 +1399,21 @@ class ActionHandler(BaseHandler):
     async def cleanup_all_resources(self) -> None:
         """Clean up all resources. Called on shutdown.
 
-        Cancels all pending timeout tasks, clears all table locks,
-        and stops background cleanup tasks.
+        Stops every table actor (cancelling scheduled timeouts and bot moves)
+        and the background cleanup task.
         Should be called during graceful server shutdown.
         """
-        # Stop auto-cleanup tasks
-        await self._lock_tracker.stop_auto_cleanup()
+        # Stop auto-cleanup task
         await cancel_task_safe(self._cleanup_task)
         self._cleanup_task = None
 
-        # Cancel all timeout tasks
-        for room_id in list(self._timeout_tasks.keys()):
-            await self._cancel_turn_timeout(room_id)
-
-        # Clear timeout tasks dict (should already be empty after cancellation)
-        self._timeout_tasks.clear()
+        # Stop all table actors
+        await self._actors.close_all()
 
         # Clear turn start times
         self._turn_start_times.clear()
 
-        logger.info(
-            f"[CLEANUP] All resources cleaned up: "
-            f"locks={len(self._lock_tracker)}, "
-            f"timeouts={len(self._timeout_tasks)}"
-        )
+        logger.info(f"[CLEANUP] All resources cleaned up: actors={len(self._actors)}")
 
     async def _handle_reveal_cards(
         self,
@@ -1524,68 +1474,88 @@ class ActionHandler(BaseHandler):
     # Fraud Detection Event Publishing
     # =========================================================================
 
+    def _hand_completed_snapshot(
+        self,
+        room_id: str,
+        table: PokerTable,
+        hand_result: HandResult,
+    ) -> dict[str, Any]:
+        """핸드 완료 이벤트용 참가자/보드 스냅샷 (다음 핸드 시작 전 상태)."""
+        # 참가자 정보 수집
+        participants = []
+        showdown_data = hand_result.get("showdown", [])
+        winners = hand_result.get("winners", [])
+
+        for seat, player in table.players.items():
+            if player is None:
+                continue
+
+            # 핸드에 참여한 플레이어만 (folded 포함)
+            if player.status in ("active", "folded", "all_in"):
+                # showdown 데이터에서 홀카드 찾기
+                hole_cards = None
+                for sd in showdown_data:
+                    if sd.get("userId") == player.user_id:
+                        hole_cards = sd.get("cards")
+                        break
+
+                # 승리 금액 계산
+                won_amount = 0
+                for w in winners:
+                    if w.get("userId") == player.user_id:
+                        won_amount = w.get("amount", 0)
+                        break
+
+                participants.append({
+                    "user_id": player.user_id,
+                    "seat": seat,
+                    "hole_cards": hole_cards or player.hole_cards,
+                    "bet_amount": player.total_bet_this_hand,
+                    "won_amount": won_amount,
+                    "final_action": player.status,
+                })
+
+        return {
+            # 핸드 ID 생성 (room_id + hand_number)
+            "hand_id": f"{room_id}_{table.hand_number}",
+            "hand_number": table.hand_number,
+            "community_cards": list(table.community_cards or []),
+            "participants": participants,
+        }
+
     async def _publish_hand_completed_event(
         self,
         room_id: str,
         hand_result: HandResult,
+        snapshot: dict[str, Any] | None = None,
     ) -> None:
         """Publish hand completed event for fraud detection.
         
         핸드 완료 시 fraud:hand_completed 채널로 이벤트를 발행합니다.
         칩 밀어주기 탐지에 사용됩니다.
+        snapshot이 없으면 현재 테이블 상태로 만듭니다.
         """
         if not self._fraud_publisher.enabled:
             return
 
         try:
-            table = game_manager.get_table(room_id)
-            if not table:
-                return
-
-            # 참가자 정보 수집
-            participants = []
-            showdown_data = hand_result.get("showdown", [])
-            winners = hand_result.get("winners", [])
-            winner_ids = {w.get("userId") for w in winners}
-
-            for seat, player in table.players.items():
-                if player is None:
-                    continue
-                
-                # 핸드에 참여한 플레이어만 (folded 포함)
-                if player.status in ("active", "folded", "all_in"):
-                    # showdown 데이터에서 홀카드 찾기
-                    hole_cards = None
-                    for sd in showdown_data:
-                        if sd.get("userId") == player.user_id:
-                            hole_cards = sd.get("cards")
-                            break
-                    
-                    # 승리 금액 계산
-                    won_amount = 0
-                    for w in winners:
-                        if w.get("userId") == player.user_id:
-                            won_amount = w.get("amount", 0)
-                            break
-
-                    participants.append({
-                        "user_id": player.user_id,
-                        "seat": seat,
-                        "hole_cards": hole_cards or player.hole_cards,
-                        "bet_amount": player.total_bet_this_hand,
-                        "won_amount": won_amount,
-                        "final_action": player.status,
-                    })
+            if snapshot is None:
+                table = game_manager.get_table(room_id)
+                if not table:
+                    return
+                snapshot = self._hand_completed_snapshot(room_id, table, hand_result)
 
-            # 핸드 ID 생성 (room_id + hand_number)
-            hand_id = f"{room_id}_{table.hand_number}"
+            hand_id = snapshot["hand_id"]
+            hand_number = snapshot["hand_number"]
+            community_cards = snapshot["community_cards"]
+            participants = snapshot["participants"]
 
             await self._fraud_publisher.publish_hand_completed(
                 hand_id=hand_id,
                 room_id=room_id,
-                hand_number=table.hand_number,
+                hand_number=hand_number,
                 pot_size=hand_result.get("pot", 0),
-                community_cards=table.community_cards or [],
+                community_cards=community_cards,
                 participants=participants,
             )
 
@@ -1611,9 +1581,9 @@ class ActionHandler(BaseHandler):
                     await hand_history_service.save_hand_result({
                         "hand_id": hand_id,
                         "table_id": room_id,
-                        "hand_number": table.hand_number,
+                        "hand_number": hand_number,
                         "pot_size": hand_result.get("pot", 0),
-                        "community_cards": table.community_cards or [],
+                        "community_cards": community_cards,
                         "participants": participants,
                     })
                     logger.info(f"핸드 히스토리 저장 완료: hand_id={hand_id}")
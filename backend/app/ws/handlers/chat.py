@@ -17,6 +17,7 @@ from uuid import uuid4
 from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.ws.channels import table_channel, table_channels
 from app.ws.connection import WebSocketConnection
 from app.ws.events import EventType
 from app.ws.handlers.base import BaseHandler
@@ -169,7 +170,7 @@ class ChatHandler(BaseHandler):
 
         # 테이블에 브로드캐스트
         if table_id:
-            channel = f"table:{table_id}"
+            channel = table_channel(table_id)
             broadcast_message = MessageEnvelope.create(
                 event_type=EventType.EMOTICON_RECEIVED,
                 payload=emoticon_message,
@@ -308,11 +309,11 @@ class ChatHandler(BaseHandler):
         
         if chat_type == ChatType.PUBLIC:
             # 전체 채팅: 모든 구독자에게 전송
-            channel = f"table:{table_id}"
+            channel = table_channel(table_id)
             await self.manager.broadcast_to_channel(channel, broadcast_message.to_dict())
         else:
             # 플레이어 전용: 플레이어 채널에만 전송
-            players_channel = f"table:{table_id}:players"
+            players_channel = table_channels(table_id).players
             await self.manager.broadcast_to_channel(
                 players_channel, 
                 broadcast_message.to_dict()
@@ -326,7 +327,7 @@ class ChatHandler(BaseHandler):
                 event_type=EventType.CHAT_MESSAGE,
                 payload=masked_message,
             )
-            spectator_channel = f"table:{table_id}:spectators"
+            spectator_channel = table_channels(table_id).spectators
             await self.manager.broadcast_to_channel(
                 spectator_channel, 
                 masked_broadcast.to_dict()
@@ -1,14 +1,17 @@
-"""Lobby event handlers."""
+"""Lobby event handlers.
+
+방 목록은 LobbyIndex에서 제공하며, 방 변경(생성/입퇴장/좌석/핸드 종료/종료)은
+인덱스가 LOBBY_UPDATE diff로 로비 채널에 push합니다 (클라이언트 폴링 불필요).
+"""
 
 from __future__ import annotations
 
 import logging
 from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.room import Room, RoomStatus
+from app.game.lobby_index import lobby_index
 from app.services.room import RoomService, RoomError
 from app.ws.connection import WebSocketConnection
 from app.ws.events import EventType
@@ -21,6 +24,21 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 LOBBY_CHANNEL = "lobby"
+LOBBY_SNAPSHOT_LIMIT = 100
+
+
+async def publish_lobby_diff(manager: "ConnectionManager", diff: dict[str, Any]) -> None:
+    """LobbyIndex diff를 로비 채널에 LOBBY_UPDATE로 브로드캐스트.
+
+    payload: {"updateType": room_created|room_updated|room_removed,
+              "room": {...}, "stateVersion": n}
+    stateVersion이 건너뛰면 클라이언트는 SUBSCRIBE_LOBBY로 스냅샷을 다시 받습니다.
+    """
+    message = MessageEnvelope.create(
+        event_type=EventType.LOBBY_UPDATE,
+        payload=diff,
+    )
+    await manager.broadcast_to_channel(LOBBY_CHANNEL, message.to_dict())
 
 
 class LobbyHandler(BaseHandler):
@@ -115,9 +133,6 @@ class LobbyHandler(BaseHandler):
             )
             await self.db.commit()
 
-            # Broadcast lobby update
-            await self._broadcast_lobby_update("room_created", room)
-
             return MessageEnvelope.create(
                 event_type=EventType.ROOM_CREATE_RESULT,
                 payload={
@@ -161,11 +176,6 @@ class LobbyHandler(BaseHandler):
             )
             await self.db.commit()
 
-            # Broadcast lobby update
-            room = await self.db.get(Room, room_id)
-            if room:
-                await self._broadcast_lobby_update("player_joined", room)
-
             return MessageEnvelope.create(
                 event_type=EventType.ROOM_JOIN_RESULT,
                 payload={
@@ -193,46 +203,11 @@ class LobbyHandler(BaseHandler):
 
     async def _build_lobby_snapshot(self) -> dict[str, Any]:
         """Build LOBBY_SNAPSHOT payload."""
-        # Query active rooms
-        stmt = (
-            select(Room)
-            .where(Room.status.in_([RoomStatus.WAITING.value, RoomStatus.PLAYING.value]))
-            .order_by(Room.created_at.desc())
-            .limit(100)
-        )
-        result = await self.db.execute(stmt)
-        rooms = result.scalars().all()
+        await lobby_index.ensure_loaded(self.db)
+        rooms, _ = lobby_index.page(1, LOBBY_SNAPSHOT_LIMIT)
 
         return {
-            "rooms": [self._serialize_room(r) for r in rooms],
+            "rooms": [room.to_payload() for room in rooms],
             "announcements": [],
-            "stateVersion": 1,
-        }
-
-    def _serialize_room(self, room: Room) -> dict[str, Any]:
-        """Serialize room for lobby display."""
-        config = room.config or {}
-        return {
-            "roomId": room.id,
-            "name": room.name,
-            "blinds": f"{config.get('small_blind', 10)}/{config.get('big_blind', 20)}",
-            "maxSeats": config.get("max_seats", 6),
-            "playerCount": room.current_players,
-            "status": room.status,
-            "isPrivate": config.get("is_private", False),
+            "stateVersion": lobby_index.state_version,
         }
-
-    async def _broadcast_lobby_update(
-        self,
-        update_type: str,
-        room: Room,
-    ) -> None:
-        """Broadcast lobby update to all subscribers."""
-        message = MessageEnvelope.create(
-            event_type=EventType.LOBBY_UPDATE,
-            payload={
-                "updateType": update_type,
-                "room": self._serialize_room(room),
-            },
-        )
-        await self.manager.broadcast_to_channel(LOBBY_CHANNEL, message.to_dict())
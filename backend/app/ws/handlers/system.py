@@ -1,12 +1,13 @@
 """System event handlers (PING/PONG, CONNECTION_STATE, RECOVERY)."""
 
-from datetime import datetime
+import time
 import logging
 
 from app.ws.connection import WebSocketConnection, ConnectionState
 from app.ws.events import EventType
 from app.ws.handlers.base import BaseHandler
 from app.ws.messages import MessageEnvelope
+from app.ws.serializer import MessageSerializer
 
 logger = logging.getLogger(__name__)
 
@@ -63,7 +64,7 @@ class SystemHandler(BaseHandler):
         클라이언트가 서버 PING에 응답한 PONG 처리.
         missed_pongs 카운터를 리셋하여 연결 유지.
         """
-        conn.last_pong_at = datetime.utcnow()
+        conn.last_pong_at = time.monotonic()
         conn.missed_pongs = 0
 
         logger.debug(
@@ -174,14 +175,17 @@ def create_connection_state_message(
     user_id: str,
     session_id: str,
     trace_id: str | None = None,
+    serializer: MessageSerializer | None = None,
 ) -> MessageEnvelope:
-    """Create a CONNECTION_STATE message."""
+    """Create a CONNECTION_STATE message (협상된 wire protocol 포함)."""
     return MessageEnvelope.create(
         event_type=EventType.CONNECTION_STATE,
         payload={
             "state": state.value,
             "userId": user_id,
             "sessionId": session_id,
+            "protocol": serializer.protocol.value if serializer else "json",
+            "compression": "gzip" if serializer and serializer.compresses else None,
         },
         trace_id=trace_id,
     )
@@ -14,10 +14,12 @@ from sqlalchemy import select
 from sqlalchemy.orm import joinedload, attributes
 
 from app.game import game_manager, Player
+from app.game.lobby_index import lobby_index
 from app.models.room import Room
 from app.models.table import Table
 from app.services.room import RoomService, RoomError
 from app.services.player_session_tracker import get_session_tracker
+from app.ws.channels import table_channel
 from app.ws.connection import WebSocketConnection
 from app.ws.events import EventType
 from app.ws.handlers.base import BaseHandler
@@ -915,201 +917,6 @@ class TableHandler(BaseHandler):
             "isStateRestore": True,  # 상태 복원 플래그
         }
 
-    async def _try_auto_start_game(self, room_id: str, game_table) -> None:
-        """Try to auto-start game if enough players (2+)."""
-        if not game_table.can_start_hand():
-            logger.debug(f"[AUTO-START] Cannot start - not enough players or game in progress")
-            return
-
-        logger.info(f"[AUTO-START] Starting game for room {room_id}")
-
-        result = game_table.start_new_hand()
-        if not result.get("success"):
-            logger.error(f"[AUTO-START] Failed: {result.get('error')}")
-            return
-
-        # Broadcast hand started (with seats/blinds data)
-        # seats 데이터 구성 (블라인드 칩 포함)
-        seats_data = []
-        for seat in range(game_table.max_players):
-            player = game_table.players.get(seat)
-            if player:
-                seats_data.append({
-                    "position": seat,
-                    "userId": player.user_id,
-                    "nickname": player.username,
-                    "stack": player.stack,
-                    "status": player.status,
-                    "betAmount": player.current_bet,  # 블라인드 칩
-                })
-            else:
-                seats_data.append(None)
-
-        # SB/BB 좌석 계산
-        sb_seat, bb_seat = game_table.get_blind_seats()
-
-        message = MessageEnvelope.create(
-            event_type=EventType.HAND_STARTED,
-            payload={
-                "tableId": room_id,
-                "handNumber": result.get("hand_number"),
-                "dealer": result.get("dealer"),
-                "smallBlindSeat": sb_seat,
-                "bigBlindSeat": bb_seat,
-                "seats": seats_data,  # 블라인드 칩 포함된 seats
-                "phase": "preflop",
-                "pot": game_table.pot,
-            },
-        )
-        channel = f"table:{room_id}"
-        await self.manager.broadcast_to_channel(channel, message.to_dict())
-
-        # Send personalized states to all players
-        for seat, player in game_table.players.items():
-            if player:
-                state = game_table.get_state_for_player(player.user_id)
-                state_msg = MessageEnvelope.create(
-                    event_type=EventType.TABLE_SNAPSHOT,
-                    payload={"tableId": room_id, "state": state},
-                )
-                await self.manager.send_to_user(player.user_id, state_msg.to_dict())
-
-        # Process first turn (with bot loop)
-        await self._process_next_turn(room_id, game_table)
-
-    async def _process_next_turn(self, room_id: str, game_table) -> None:
-        """Process next turn - with bot loop."""
-        import asyncio
-        import random
-        from datetime import datetime, timedelta
-
-        MAX_ITERATIONS = 50
-
-        for iteration in range(MAX_ITERATIONS):
-            if game_table.current_player_seat is None:
-                return
-
-            current_player = game_table.players.get(game_table.current_player_seat)
-            if not current_player:
-                return
-
-            # Check if bot
-            is_bot = current_player.user_id.startswith("bot_")
-
-            if not is_bot:
-                # Human player - send TURN_PROMPT and exit
-                available = game_table.get_available_actions(current_player.user_id)
-                allowed = []
-                for action in available.get("actions", []):
-                    action_dict = {"type": action}
-                    if action == "call":
-                        action_dict["amount"] = available.get("call_amount", 0)
-                    if action == "raise":
-                        action_dict["minAmount"] = available.get("min_raise", 0)
-                        action_dict["maxAmount"] = available.get("max_raise", 0)
-                    if action == "bet":
-                        # bet도 min_raise/max_raise 사용 (같은 값)
-                        action_dict["minAmount"] = available.get("min_raise", 0)
-                        action_dict["maxAmount"] = available.get("max_raise", 0)
-                    allowed.append(action_dict)
-
-                deadline = datetime.utcnow() + timedelta(seconds=30)
-                message = MessageEnvelope.create(
-                    event_type=EventType.TURN_PROMPT,
-                    payload={
-                        "tableId": room_id,
-                        "position": game_table.current_player_seat,
-                        "allowedActions": allowed,
-                        "deadlineAt": deadline.isoformat(),
-                        "pot": game_table.pot,
-                        "currentBet": game_table.current_bet,
-                    },
-                )
-                channel = f"table:{room_id}"
-                await self.manager.broadcast_to_channel(channel, message.to_dict())
-                return
-
-            # Bot auto-play
-            await asyncio.sleep(0.5)
-
-            available = game_table.get_available_actions(current_player.user_id)
-            actions = available.get("actions", [])
-            call_amount = available.get("call_amount", 0)
-
-            logger.info(f"[BOT] {current_player.username} actions: {actions}")
-
-            if not actions:
-                return
-
-            # Bot decision (conservative)
-            roll = random.random()
-            if "check" in actions:
-                action, amount = "check", 0
-            elif "call" in actions and (call_amount <= current_player.stack * 0.3 or roll < 0.8):
-                action, amount = "call", call_amount
-            elif "fold" in actions:
-                action, amount = "fold", 0
-            else:
-                action, amount = actions[0], call_amount if actions[0] == "call" else 0
-
-            logger.info(f"[BOT] {current_player.username} chose: {action} {amount}")
-
-            result = game_table.process_action(current_player.user_id, action, amount)
-
-            if not result.get("success"):
-                logger.error(f"[BOT] Action failed: {result.get('error')}")
-                return
-
-            # Broadcast action
-            action_msg = MessageEnvelope.create(
-                event_type=EventType.TABLE_STATE_UPDATE,
-                payload={
-                    "tableId": room_id,
-                    "changes": {
-                        "lastAction": {
-                            "type": result.get("action"),
-                            "amount": result.get("amount", 0),
-                            "position": result.get("seat"),
-                        },
-                        "pot": result.get("pot", 0),
-                        "phase": result.get("phase"),
-                    },
-                },
-            )
-            channel = f"table:{room_id}"
-            await self.manager.broadcast_to_channel(channel, action_msg.to_dict())
-
-            # Phase changed
-            if result.get("phase_changed"):
-                cards_msg = MessageEnvelope.create(
-                    event_type=EventType.COMMUNITY_CARDS,
-                    payload={
-                        "tableId": room_id,
-                        "phase": game_table.phase.value,
-                        "cards": game_table.community_cards,
-                    },
-                )
-                await self.manager.broadcast_to_channel(channel, cards_msg.to_dict())
-
-            # Hand complete
-            if result.get("hand_complete"):
-                hand_result = result.get("hand_result")
-                result_msg = MessageEnvelope.create(
-                    event_type=EventType.HAND_RESULT,
-                    payload={
-                        "tableId": room_id,
-                        "winners": hand_result.get("winners", []) if hand_result else [],
-                        "pot": hand_result.get("pot", 0) if hand_result else 0,
-                        "showdown": hand_result.get("showdown", []) if hand_result else [],
-                    },
-                )
-                await self.manager.broadcast_to_channel(channel, result_msg.to_dict())
-
-                # Auto-start next hand after delay
-                await asyncio.sleep(3.0)
-                await self._try_auto_start_game(room_id, game_table)
-                return
-
     async def _handle_sit_out(
         self,
         conn: WebSocketConnection,
@@ -1510,7 +1317,11 @@ class TableHandler(BaseHandler):
         update_type: str,
         changes: dict[str, Any],
     ) -> None:
-        """Broadcast table update to all subscribers."""
+        """Broadcast table update to all subscribers.
+
+        좌석 변경(착석/퇴장/봇 추가)은 로비 인덱스에도 반영합니다
+        (인원이 바뀐 경우에만 LOBBY_UPDATE diff가 push됨).
+        """
         message = MessageEnvelope.create(
             event_type=EventType.TABLE_STATE_UPDATE,
             payload={
@@ -1520,9 +1331,13 @@ class TableHandler(BaseHandler):
             },
         )
 
-        channel = f"table:{room_id}"
+        channel = table_channel(room_id)
         await self.manager.broadcast_to_channel(channel, message.to_dict())
 
+        game_table = game_manager.get_table(room_id)
+        if game_table:
+            await lobby_index.sync_table(game_table)
+
 
 async def broadcast_turn_prompt(
     manager: "ConnectionManager",
@@ -1544,5 +1359,5 @@ async def broadcast_turn_prompt(
         },
     )
 
-    channel = f"table:{table_id}"
+    channel = table_channel(table_id)
     await manager.broadcast_to_channel(channel, message.to_dict())
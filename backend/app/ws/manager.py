@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import itertools
 import json
 import logging
 from datetime import datetime, timedelta
@@ -12,9 +13,12 @@ from uuid import uuid4
 from redis.asyncio import Redis
 
 from app.config import get_settings
+from app.utils.json_utils import json_dumps
+from app.ws.channels import intern_channel, table_channels
 from app.ws.connection import WebSocketConnection, ConnectionState
 from app.ws.events import EventType
 from app.ws.messages import MessageEnvelope
+from app.ws.sweeper import ConnectionSweeper
 from app.ws.worker_health import WorkerHealthManager
 
 logger = logging.getLogger(__name__)
@@ -22,12 +26,9 @@ logger = logging.getLogger(__name__)
 # CCU/DAU 트래킹 상수
 CCU_SNAPSHOT_INTERVAL = 60  # 매 분마다 CCU 스냅샷 저장
 CCU_HISTORY_TTL = 86400 * 7  # 7일 보관
+CCU_SERIES_KEY = "ccu:hourly"  # 시간별 최대 CCU 해시 (field: "%Y-%m-%d:%H")
 DAU_TTL = 86400 * 31  # 31일 보관 (월간 집계용)
 
-# Constants per spec section 2.3
-HEARTBEAT_CHECK_INTERVAL = 5  # Check every 5 seconds
-SERVER_TIMEOUT = 60  # Close connection if no PING for 60 seconds
-
 # 재접속 상태 TTL (기존 300초 → 1800초로 연장)
 USER_STATE_TTL_SECONDS = 1800  # 30분 (재접속 시 상태 복구용)
 
@@ -46,10 +47,15 @@ class ConnectionManager:
 
         # Local connection registry (per instance)
         self._connections: dict[str, WebSocketConnection] = {}  # connection_id -> Connection
-        self._user_connections: dict[str, set[str]] = {}  # user_id -> set[connection_id]
 
-        # Channel subscriptions (local tracking)
-        self._channel_members: dict[str, set[str]] = {}  # channel -> set[connection_id]
+        # Integer handles for user/channel membership (사용자당 연결 수는
+        # ws_max_connections_per_user 이하라 set 대신 작은 list로 보관)
+        self._handle_seq = itertools.count(1)
+        self._by_handle: dict[int, WebSocketConnection] = {}  # handle -> Connection
+        self._user_connections: dict[str, list[int]] = {}  # user_id -> [handle]
+
+        # Channel subscriptions (local tracking, interned channel names)
+        self._channel_members: dict[str, set[int]] = {}  # channel -> set[handle]
 
         # Connection limits (Phase 2.5)
         self._max_connections = self._settings.ws_max_connections
@@ -57,7 +63,6 @@ class ConnectionManager:
 
         # Background tasks
         self._pubsub_task: asyncio.Task | None = None
-        self._heartbeat_task: asyncio.Task | None = None
         self._ccu_snapshot_task: asyncio.Task | None = None  # Phase 5.1: CCU 스냅샷
         self._running = False
         self._instance_id = str(uuid4())[:8]
@@ -65,6 +70,9 @@ class ConnectionManager:
         # Worker health management (Phase 2.7)
         self._worker_health = WorkerHealthManager(redis, self._instance_id)
 
+        # 하트비트 / 토큰 만료 / 유휴 연결 검사 (프로세스당 1개 태스크)
+        self._sweeper = ConnectionSweeper(self)
+
     # =========================================================================
     # Lifecycle
     # =========================================================================
@@ -75,7 +83,7 @@ class ConnectionManager:
             return
         self._running = True
         await self._start_pubsub_listener()
-        await self._start_heartbeat_monitor()
+        await self._sweeper.start()
         await self._start_ccu_snapshot_task()  # Phase 5.1: CCU 스냅샷
 
         # Start worker health management (Phase 2.7)
@@ -103,12 +111,7 @@ class ConnectionManager:
             except asyncio.CancelledError:
                 pass
 
-        if self._heartbeat_task:
-            self._heartbeat_task.cancel()
-            try:
-                await self._heartbeat_task
-            except asyncio.CancelledError:
-                pass
+        await self._sweeper.stop()
 
         if self._ccu_snapshot_task:
             self._ccu_snapshot_task.cancel()
@@ -150,8 +153,8 @@ class ConnectionManager:
             )
 
         # Check per-user connection limit and close oldest if exceeded
-        user_conn_ids = self._user_connections.get(conn.user_id, set())
-        if len(user_conn_ids) >= self._max_connections_per_user:
+        user_handles = self._user_connections.get(conn.user_id, ())
+        if len(user_handles) >= self._max_connections_per_user:
             # Find and close the oldest connection for this user
             oldest_conn_id = await self._get_oldest_user_connection(conn.user_id)
             if oldest_conn_id:
@@ -164,11 +167,12 @@ class ConnectionManager:
                     await old_conn.close(4001, "New connection opened, closing old session")
                 await self.disconnect(oldest_conn_id)
 
+        conn.handle = next(self._handle_seq)
         self._connections[conn.connection_id] = conn
+        self._by_handle[conn.handle] = conn
+        self._sweeper.add(conn)
 
-        if conn.user_id not in self._user_connections:
-            self._user_connections[conn.user_id] = set()
-        self._user_connections[conn.user_id].add(conn.connection_id)
+        self._user_connections.setdefault(conn.user_id, []).append(conn.handle)
 
         # Store in Redis for cross-instance awareness
         await self.redis.hset(
@@ -176,7 +180,7 @@ class ConnectionManager:
             conn.connection_id,
             json.dumps({
                 "instance": self._instance_id,
-                "connected_at": conn.connected_at.isoformat(),
+                "connected_at": datetime.utcnow().isoformat(),
                 "session_id": conn.session_id,
             }),
         )
@@ -187,26 +191,17 @@ class ConnectionManager:
         logger.info(
             f"Connection {conn.connection_id} registered for user {conn.user_id} "
             f"(total: {len(self._connections)}/{self._max_connections}, "
-            f"user: {len(self._user_connections.get(conn.user_id, set()))}/{self._max_connections_per_user})"
+            f"user: {len(self._user_connections.get(conn.user_id, ()))}/{self._max_connections_per_user})"
         )
 
     async def _get_oldest_user_connection(self, user_id: str) -> str | None:
         """Get the oldest connection ID for a user."""
-        conn_ids = self._user_connections.get(user_id, set())
-        if not conn_ids:
-            return None
-
-        oldest_id = None
-        oldest_time = None
-
-        for conn_id in conn_ids:
-            conn = self._connections.get(conn_id)
-            if conn:
-                if oldest_time is None or conn.connected_at < oldest_time:
-                    oldest_time = conn.connected_at
-                    oldest_id = conn_id
-
-        return oldest_id
+        oldest = min(
+            self.get_user_connections(user_id),
+            key=lambda conn: conn.connected_at,
+            default=None,
+        )
+        return oldest.connection_id if oldest else None
 
     async def disconnect(self, connection_id: str, save_state: bool = True) -> None:
         """Unregister a connection and cleanup all associated resources.
@@ -257,15 +252,19 @@ class ConnectionManager:
         # Step 3: Remove from local connections registry
         try:
             self._connections.pop(connection_id, None)
+            self._by_handle.pop(conn.handle, None)
+            self._sweeper.remove(connection_id)
         except Exception as e:
             logger.error(f"Failed to remove connection {connection_id} from registry: {e}")
 
         # Step 4: Remove from user connections
         is_last_connection = False
         try:
-            if user_id in self._user_connections:
-                self._user_connections[user_id].discard(connection_id)
-                if not self._user_connections[user_id]:
+            user_handles = self._user_connections.get(user_id)
+            if user_handles is not None:
+                if conn.handle in user_handles:
+                    user_handles.remove(conn.handle)
+                if not user_handles:
                     del self._user_connections[user_id]
                     is_last_connection = True
                     # Phase 5.1: 마지막 연결 해제 시 offline 트래킹
@@ -325,8 +324,12 @@ class ConnectionManager:
 
     def get_user_connections(self, user_id: str) -> list[WebSocketConnection]:
         """Get all connections for a user."""
-        conn_ids = self._user_connections.get(user_id, set())
-        return [self._connections[cid] for cid in conn_ids if cid in self._connections]
+        by_handle = self._by_handle
+        return [
+            by_handle[handle]
+            for handle in self._user_connections.get(user_id, ())
+            if handle in by_handle
+        ]
 
     @property
     def connection_count(self) -> int:
@@ -343,10 +346,12 @@ class ConnectionManager:
         if not conn:
             return False
 
-        if channel not in self._channel_members:
-            self._channel_members[channel] = set()
+        channel = intern_channel(channel)
+        members = self._channel_members.get(channel)
+        if members is None:
+            members = self._channel_members[channel] = set()
 
-        self._channel_members[channel].add(connection_id)
+        members.add(conn.handle)
         conn.subscribed_channels.add(channel)
 
         # Track in Redis for cross-instance broadcast
@@ -374,9 +379,10 @@ class ConnectionManager:
         if not conn:
             return False
 
-        if channel in self._channel_members:
-            self._channel_members[channel].discard(connection_id)
-            if not self._channel_members[channel]:
+        members = self._channel_members.get(channel)
+        if members is not None:
+            members.discard(conn.handle)
+            if not members:
                 del self._channel_members[channel]
 
         conn.subscribed_channels.discard(channel)
@@ -385,15 +391,15 @@ class ConnectionManager:
 
     def get_channel_subscribers(self, channel: str) -> list[str]:
         """Get local connection IDs subscribed to a channel."""
-        return list(self._channel_members.get(channel, set()))
+        return [conn.connection_id for conn in self.get_channel_connections(channel)]
 
     def get_channel_connections(self, channel: str) -> list[WebSocketConnection]:
         """Get local WebSocketConnection objects subscribed to a channel."""
-        conn_ids = self._channel_members.get(channel, set())
+        by_handle = self._by_handle
         return [
-            self._connections[cid]
-            for cid in conn_ids
-            if cid in self._connections
+            by_handle[handle]
+            for handle in self._channel_members.get(channel, ())
+            if handle in by_handle
         ]
 
     # =========================================================================
@@ -411,18 +417,33 @@ class ConnectionManager:
         Returns count of messages sent to local subscribers.
         """
         # Publish to Redis for other instances
+        await self.publish_to_instances(channel, message, exclude_connection)
+
+        # Also send to local subscribers
+        return await self._send_to_local_channel(channel, message, exclude_connection)
+
+    async def publish_to_instances(
+        self,
+        channel: str,
+        message: dict[str, Any],
+        exclude_connection: str | None = None,
+        text: str | None = None,
+    ) -> None:
+        """Publish a channel message to other instances only (no local send).
+
+        The message is sent pre-encoded ("text") so receiving instances fan it
+        out with send_text instead of re-encoding it per subscriber. Pass
+        ``text`` when the caller has already encoded the message.
+        """
         await self.redis.publish(
             f"ws:pubsub:{channel}",
             json.dumps({
                 "source_instance": self._instance_id,
                 "exclude_connection": exclude_connection,
-                "message": message,
+                "text": text if text is not None else json_dumps(message),
             }),
         )
 
-        # Also send to local subscribers
-        return await self._send_to_local_channel(channel, message, exclude_connection)
-
     async def send_to_user(
         self,
         user_id: str,
@@ -430,11 +451,9 @@ class ConnectionManager:
     ) -> int:
         """Send message to all connections of a user. Returns count sent."""
         count = 0
-        connection_ids = self._user_connections.get(user_id, set())
 
-        for conn_id in connection_ids:
-            conn = self._connections.get(conn_id)
-            if conn and await conn.send(message):
+        for conn in self.get_user_connections(user_id):
+            if await conn.send(message):
                 count += 1
 
         return count
@@ -453,18 +472,24 @@ class ConnectionManager:
     async def _send_to_local_channel(
         self,
         channel: str,
-        message: dict[str, Any],
+        message: dict[str, Any] | None,
         exclude_connection: str | None = None,
+        text: str | None = None,
     ) -> int:
-        """Send to local channel subscribers only."""
-        connection_ids = self._channel_members.get(channel, set())
+        """Send to local channel subscribers only.
+
+        If ``text`` is given, the pre-encoded message is sent as-is.
+        """
         count = 0
 
-        for conn_id in list(connection_ids):
-            if conn_id == exclude_connection:
+        for conn in self.get_channel_connections(channel):
+            if exclude_connection is not None and conn.connection_id == exclude_connection:
                 continue
-            conn = self._connections.get(conn_id)
-            if conn and await conn.send(message):
+            if text is not None:
+                sent = await conn.send_text(text)
+            else:
+                sent = await conn.send(message)
+            if sent:
                 count += 1
 
         return count
@@ -483,7 +508,7 @@ class ConnectionManager:
 
         Uses the table:{room_id}:players subchannel.
         """
-        channel = f"table:{room_id}:players"
+        channel = table_channels(room_id).players
         return await self.broadcast_to_channel(channel, message, exclude_connection)
 
     async def broadcast_to_spectators(
@@ -496,7 +521,7 @@ class ConnectionManager:
 
         Uses the table:{room_id}:spectators subchannel.
         """
-        channel = f"table:{room_id}:spectators"
+        channel = table_channels(room_id).spectators
         return await self.broadcast_to_channel(channel, message, exclude_connection)
 
     async def broadcast_to_table(
@@ -509,7 +534,7 @@ class ConnectionManager:
 
         Uses the main table:{room_id} channel.
         """
-        channel = f"table:{room_id}"
+        channel = table_channels(room_id).main
         return await self.broadcast_to_channel(channel, message, exclude_connection)
 
     async def subscribe_as_player(
@@ -521,17 +546,16 @@ class ConnectionManager:
 
         Subscribes to both main channel and players subchannel.
         """
-        main_channel = f"table:{room_id}"
-        players_channel = f"table:{room_id}:players"
+        channels = table_channels(room_id)
 
         # Subscribe to main channel
-        result1 = await self.subscribe(connection_id, main_channel)
+        result1 = await self.subscribe(connection_id, channels.main)
 
         # Subscribe to players subchannel
-        result2 = await self.subscribe(connection_id, players_channel)
+        result2 = await self.subscribe(connection_id, channels.players)
 
         # Unsubscribe from spectators if previously subscribed
-        spectators_channel = f"table:{room_id}:spectators"
+        spectators_channel = channels.spectators
         if spectators_channel in self._channel_members:
             conn = self._connections.get(connection_id)
             if conn and spectators_channel in conn.subscribed_channels:
@@ -549,14 +573,13 @@ class ConnectionManager:
 
         Subscribes to both main channel and spectators subchannel.
         """
-        main_channel = f"table:{room_id}"
-        spectators_channel = f"table:{room_id}:spectators"
+        channels = table_channels(room_id)
 
         # Subscribe to main channel
-        result1 = await self.subscribe(connection_id, main_channel)
+        result1 = await self.subscribe(connection_id, channels.main)
 
         # Subscribe to spectators subchannel
-        result2 = await self.subscribe(connection_id, spectators_channel)
+        result2 = await self.subscribe(connection_id, channels.spectators)
 
         logger.debug(f"Connection {connection_id} subscribed as spectator to {room_id}")
         return result1 and result2
@@ -570,14 +593,13 @@ class ConnectionManager:
 
         Moves from spectators subchannel to players subchannel.
         """
-        spectators_channel = f"table:{room_id}:spectators"
-        players_channel = f"table:{room_id}:players"
+        channels = table_channels(room_id)
 
         # Unsubscribe from spectators
-        await self.unsubscribe(connection_id, spectators_channel)
+        await self.unsubscribe(connection_id, channels.spectators)
 
         # Subscribe to players
-        result = await self.subscribe(connection_id, players_channel)
+        result = await self.subscribe(connection_id, channels.players)
 
         logger.debug(f"Connection {connection_id} upgraded to player in {room_id}")
         return result
@@ -591,14 +613,13 @@ class ConnectionManager:
 
         Moves from players subchannel to spectators subchannel.
         """
-        players_channel = f"table:{room_id}:players"
-        spectators_channel = f"table:{room_id}:spectators"
+        channels = table_channels(room_id)
 
         # Unsubscribe from players
-        await self.unsubscribe(connection_id, players_channel)
+        await self.unsubscribe(connection_id, channels.players)
 
         # Subscribe to spectators
-        result = await self.subscribe(connection_id, spectators_channel)
+        result = await self.subscribe(connection_id, channels.spectators)
 
         logger.debug(f"Connection {connection_id} downgraded to spectator in {room_id}")
         return result
@@ -612,27 +633,23 @@ class ConnectionManager:
 
         Removes from main channel and any subchannels.
         """
-        main_channel = f"table:{room_id}"
-        players_channel = f"table:{room_id}:players"
-        spectators_channel = f"table:{room_id}:spectators"
+        channels = table_channels(room_id)
 
         # Unsubscribe from all
-        await self.unsubscribe(connection_id, main_channel)
-        await self.unsubscribe(connection_id, players_channel)
-        await self.unsubscribe(connection_id, spectators_channel)
+        await self.unsubscribe(connection_id, channels.main)
+        await self.unsubscribe(connection_id, channels.players)
+        await self.unsubscribe(connection_id, channels.spectators)
 
         logger.debug(f"Connection {connection_id} unsubscribed from table {room_id}")
         return True
 
     def get_player_count(self, room_id: str) -> int:
         """Get count of players subscribed to a table."""
-        players_channel = f"table:{room_id}:players"
-        return len(self._channel_members.get(players_channel, set()))
+        return len(self._channel_members.get(table_channels(room_id).players, ()))
 
     def get_spectator_count(self, room_id: str) -> int:
         """Get count of spectators subscribed to a table."""
-        spectators_channel = f"table:{room_id}:spectators"
-        return len(self._channel_members.get(spectators_channel, set()))
+        return len(self._channel_members.get(table_channels(room_id).spectators, ()))
 
     # =========================================================================
     # Redis Pub/Sub Listener
@@ -683,54 +700,17 @@ class ConnectionManager:
                 return
 
             exclude = data.get("exclude_connection")
-            await self._send_to_local_channel(channel, data["message"], exclude)
+            if "text" in data:
+                await self._send_to_local_channel(
+                    channel, None, exclude, text=data["text"]
+                )
+            else:
+                # 이전 버전 인스턴스가 발행한 메시지
+                await self._send_to_local_channel(channel, data["message"], exclude)
 
         except Exception as e:
             logger.error(f"Error handling pub/sub message: {e}")
 
-    # =========================================================================
-    # Heartbeat Management
-    # =========================================================================
-
-    async def _start_heartbeat_monitor(self) -> None:
-        """Start heartbeat monitoring task."""
-        async def monitor() -> None:
-            while self._running:
-                try:
-                    await asyncio.sleep(HEARTBEAT_CHECK_INTERVAL)
-                    await self._check_heartbeats()
-                except asyncio.CancelledError:
-                    break
-                except Exception as e:
-                    logger.error(f"Heartbeat monitor error: {e}")
-
-        self._heartbeat_task = asyncio.create_task(monitor())
-
-    async def _check_heartbeats(self) -> None:
-        """Check for stale connections (no PING for 60s per spec)."""
-        now = datetime.utcnow()
-        stale_timeout = timedelta(seconds=SERVER_TIMEOUT)
-
-        stale_connections = []
-        for conn_id, conn in self._connections.items():
-            if conn.last_ping_at is None:
-                # Use connected_at if no ping received yet
-                if (now - conn.connected_at) > stale_timeout:
-                    stale_connections.append(conn_id)
-            elif (now - conn.last_ping_at) > stale_timeout:
-                stale_connections.append(conn_id)
-
-        for conn_id in stale_connections:
-            logger.warning(f"Connection {conn_id} timed out (no PING for {SERVER_TIMEOUT}s)")
-            conn = self._connections.get(conn_id)
-            if conn:
-                try:
-                    await conn.close(4000, "Connection timeout")
-                except Exception as e:
-                    logger.debug(f"Error closing timed out connection {conn_id}: {e}")
-            # Save state for reconnection on timeout (user might reconnect)
-            await self.disconnect(conn_id, save_state=True)
-
     # =========================================================================
     # State Recovery (for reconnection)
     # =========================================================================
@@ -826,7 +806,7 @@ class ConnectionManager:
         logger.info("CCU snapshot task started")
 
     async def _save_ccu_snapshot(self) -> None:
-        """현재 CCU를 시간별 키에 저장."""
+        """현재 CCU를 시간별 CCU 해시에 저장."""
         try:
             now = datetime.utcnow()
             hour_key = now.strftime("%Y-%m-%d:%H")
@@ -834,12 +814,15 @@ class ConnectionManager:
             # 현재 CCU 조회
             ccu = await self.redis.scard("online_users")
 
-            # 시간별 CCU 저장 (더 높은 값 유지)
-            ccu_key = f"ccu_hourly:{hour_key}"
-            current = await self.redis.get(ccu_key)
+            # 시간별 CCU 저장 (더 높은 값 유지) - 시간당 키 대신 단일 해시 필드
+            current = await self.redis.hget(CCU_SERIES_KEY, hour_key)
+
+            if current is None:
+                # 새 시간의 첫 스냅샷: 보관 기간이 지난 필드 정리
+                await self._prune_ccu_series(now)
 
             if current is None or int(ccu) > int(current):
-                await self.redis.setex(ccu_key, CCU_HISTORY_TTL, str(ccu))
+                await self.redis.hset(CCU_SERIES_KEY, hour_key, str(ccu))
 
             # 분별 세부 CCU도 저장 (선택적)
             minute_key = now.strftime("%Y-%m-%d:%H:%M")
@@ -853,6 +836,18 @@ class ConnectionManager:
         except Exception as e:
             logger.warning(f"Failed to save CCU snapshot: {e}")
 
+    async def _prune_ccu_series(self, now: datetime) -> None:
+        """CCU_HISTORY_TTL보다 오래된 시간별 CCU 필드 삭제."""
+        cutoff = (now - timedelta(seconds=CCU_HISTORY_TTL)).strftime("%Y-%m-%d:%H")
+        fields = await self.redis.hkeys(CCU_SERIES_KEY)
+        stale = [
+            field
+            for field in (f.decode() if isinstance(f, bytes) else f for f in fields)
+            if field < cutoff
+        ]
+        if stale:
+            await self.redis.hdel(CCU_SERIES_KEY, *stale)
+
     async def get_current_ccu(self) -> int:
         """현재 CCU 조회."""
         try:
@@ -7,12 +7,24 @@ Features:
 - JSON fallback for clients without binary support
 - Protocol negotiation
 - Compression for large messages
+
+/ws 협상 (AUTH payload):
+    {"type": "AUTH", "payload": {"token": "...", "protocol": "msgpack",
+                                 "compression": "gzip"}}
+- protocol=msgpack: 이후 서버 → 클라이언트 메시지는 전부 binary frame
+  (MessagePack). 클라이언트 → 서버는 binary(MessagePack)/text(JSON) 모두 허용.
+- compression=gzip: COMPRESSION_THRESHOLD를 넘는 메시지(주로 TABLE_SNAPSHOT)만
+  gzip (frame이 1f 8b로 시작). 작은 메시지는 permessage-deflate(uvicorn 기본)에
+  맡기므로 명시적으로 요청한 클라이언트에만 적용.
+- CONNECTION_STATE(connected) payload의 protocol/compression으로 결과 통지.
+  JSON 클라이언트는 기존과 동일하게 text frame.
 """
 
 import gzip
-from datetime import datetime, date
+from datetime import datetime, date, timedelta
 from decimal import Decimal
 from enum import Enum
+from functools import lru_cache
 from typing import Any
 from uuid import UUID
 
@@ -48,6 +60,28 @@ def _msgpack_encoder(obj: Any) -> Any:
     return obj
 
 
+def _wire_encoder(obj: Any) -> Any:
+    """Encoder for client-facing MessagePack (JSON과 같은 값 표현).
+
+    클라이언트는 타입 태그를 모르므로 json_dumps(orjson)와 같은 형태로 변환합니다.
+    """
+    if isinstance(obj, datetime):
+        if obj.tzinfo is not None and obj.utcoffset() == timedelta(0):
+            return obj.replace(tzinfo=None).isoformat() + "Z"
+        return obj.isoformat()
+    if isinstance(obj, date):
+        return obj.isoformat()
+    if isinstance(obj, (Decimal, UUID)):
+        return str(obj)
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if hasattr(obj, "__dict__"):
+        return obj.__dict__
+    raise TypeError(f"Object of type {type(obj).__name__} is not serializable")
+
+
 def _msgpack_decoder(obj: Any) -> Any:
     """Custom decoder for MessagePack deserialization."""
     if isinstance(obj, dict):
@@ -75,13 +109,24 @@ class MessageSerializer:
         message = serializer.decode(raw_data)
     """
 
-    def __init__(self, protocol: SerializationProtocol = SerializationProtocol.JSON):
+    def __init__(
+        self,
+        protocol: SerializationProtocol = SerializationProtocol.JSON,
+        *,
+        compress: bool = True,
+        tag_types: bool = True,
+    ):
         """Initialize serializer.
 
         Args:
             protocol: Serialization protocol to use
+            compress: Default for encode(compress=...)
+            tag_types: Tag datetime/Decimal/UUID for Python round-trip.
+                False for client wire format (JSON-equivalent values).
         """
         self._protocol = protocol
+        self._compress = compress
+        self._default = _msgpack_encoder if tag_types else _wire_encoder
 
     @property
     def protocol(self) -> SerializationProtocol:
@@ -93,21 +138,29 @@ class MessageSerializer:
         """Check if using binary protocol."""
         return self._protocol == SerializationProtocol.MSGPACK
 
-    def encode(self, data: dict, *, compress: bool = True) -> bytes:
+    @property
+    def compresses(self) -> bool:
+        """Check if large messages are gzip-compressed by default."""
+        return self._compress
+
+    def encode(self, data: dict, *, compress: bool | None = None) -> bytes:
         """Encode data to bytes.
 
         Args:
             data: Data to encode
-            compress: Whether to compress large messages
+            compress: Whether to compress large messages (None: serializer default)
 
         Returns:
             Encoded bytes
         """
         if self._protocol == SerializationProtocol.MSGPACK:
-            encoded = msgpack.packb(data, default=_msgpack_encoder, use_bin_type=True)
+            encoded = msgpack.packb(data, default=self._default, use_bin_type=True)
         else:
             encoded = json_dumps_bytes(data)
 
+        if compress is None:
+            compress = self._compress
+
         # Compress if enabled and message is large
         if compress and len(encoded) > COMPRESSION_THRESHOLD:
             compressed = gzip.compress(encoded, compresslevel=6)
@@ -144,19 +197,50 @@ class MessageSerializer:
         else:
             return json_loads(data)
 
+    def encode_text(self, text: str) -> bytes:
+        """Re-encode a pre-encoded JSON message into this protocol.
+
+        브로드캐스트는 메시지를 JSON 텍스트로 1회 인코딩해 모든 구독자에게
+        같은 str 객체를 넘기므로, 변환 결과를 캐시해 binary 연결이 여러 개여도
+        변환은 메시지당 1회입니다 (str 해시는 객체에 캐시됨).
+        """
+        return _transcode(text, self)
+
     @staticmethod
-    def negotiate_protocol(accept_binary: bool = False) -> "MessageSerializer":
+    def negotiate_protocol(
+        accept_binary: bool = False,
+        compression: bool = False,
+    ) -> "MessageSerializer":
         """Negotiate serialization protocol based on client capabilities.
 
+        Returns a shared client-wire serializer (JSON-equivalent values, no
+        type tags); instances are stateless so connections share them.
+
         Args:
             accept_binary: Whether client accepts binary messages
+            compression: Whether client accepts gzip-compressed large messages
 
         Returns:
             Configured MessageSerializer instance
         """
-        if accept_binary:
-            return MessageSerializer(SerializationProtocol.MSGPACK)
-        return MessageSerializer(SerializationProtocol.JSON)
+        protocol = (
+            SerializationProtocol.MSGPACK if accept_binary else SerializationProtocol.JSON
+        )
+        return _WIRE_SERIALIZERS[(protocol, compression)]
+
+
+_WIRE_SERIALIZERS: dict[tuple[SerializationProtocol, bool], MessageSerializer] = {
+    (protocol, compression): MessageSerializer(
+        protocol, compress=compression, tag_types=False
+    )
+    for protocol in SerializationProtocol
+    for compression in (False, True)
+}
+
+
+@lru_cache(maxsize=256)
+def _transcode(text: str, serializer: MessageSerializer) -> bytes:
+    return serializer.encode(json_loads(text))
 
 
 # =============================================================================
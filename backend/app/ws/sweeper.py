@@ -0,0 +1,240 @@
+"""Connection sweeper - 프로세스당 1개의 하트비트/토큰 만료 검사 태스크.
+
+연결마다 HeartbeatManager(30초 PING 루프)와 TokenValidator(5분 토큰 검사
+루프) 태스크를 띄우고 ConnectionManager가 5초마다 전체 연결을 훑던 구조를
+하나의 스위퍼로 대체합니다. 연결 수와 무관하게 태스크는 1개입니다.
+
+- 하트비트: 30칸 타이밍 휠 (1초 tick). 연결은 등록 시 한 칸에 배정되고
+  해당 칸 차례(30초마다)에 PONG 확인 → PING 전송. 같은 tick의 PING은
+  한 번 인코딩해 일괄 전송하므로 PING 부하가 30초에 고르게 분산됩니다.
+- 토큰 만료: 인증 시 JWT exp로 만료 시각을 미리 계산해 힙에 넣고,
+  tick마다 만료된 항목만 꺼냅니다 (토큰 재검증 없음, 최대 1초 지연).
+- 유휴 연결: 휠 방문 시 SERVER_TIMEOUT(60초) 동안 PING이 없으면 종료.
+  (하트비트 시각은 time.monotonic(), 토큰 만료만 epoch 기준)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import logging
+import time
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from app.utils.json_utils import json_dumps
+
+if TYPE_CHECKING:
+    from app.ws.connection import WebSocketConnection
+    from app.ws.manager import ConnectionManager
+
+logger = logging.getLogger(__name__)
+
+# Heartbeat configuration
+HEARTBEAT_INTERVAL_SECONDS = 30.0  # 서버 → 클라이언트 PING 전송 주기
+HEARTBEAT_TIMEOUT_SECONDS = 60.0   # PONG 응답 대기 시간
+MAX_MISSED_PONGS = 2               # 최대 허용 미응답 횟수
+
+# Constants per spec section 2.3
+SERVER_TIMEOUT = 60  # Close connection if no PING for 60 seconds
+
+SWEEP_TICK_SECONDS = 1.0
+WHEEL_SLOTS = int(HEARTBEAT_INTERVAL_SECONDS / SWEEP_TICK_SECONDS)
+
+
+def create_reauth_required_message() -> dict[str, Any]:
+    """Create a REAUTH_REQUIRED message to notify client of token expiration."""
+    return {
+        "type": "REAUTH_REQUIRED",
+        "payload": {
+            "reason": "token_expired",
+            "message": "Your session has expired. Please re-authenticate.",
+        },
+        "timestamp": datetime.utcnow().isoformat(),
+    }
+
+
+class ConnectionSweeper:
+    """모든 연결의 하트비트와 토큰 만료를 1개 태스크로 처리."""
+
+    def __init__(self, manager: "ConnectionManager"):
+        self._manager = manager
+        self._wheel: list[set[str]] = [set() for _ in range(WHEEL_SLOTS)]
+        self._slot_of: dict[str, int] = {}
+        self._expiries: list[tuple[float, str]] = []  # (exp epoch, connection_id)
+        self._cursor = 0
+        self._task: asyncio.Task | None = None
+        self._running = False
+
+    # =========================================================================
+    # Lifecycle
+    # =========================================================================
+
+    async def start(self) -> None:
+        if self._running:
+            return
+        self._running = True
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        self._running = False
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time() + SWEEP_TICK_SECONDS
+        while self._running:
+            try:
+                await asyncio.sleep(max(0.0, next_tick - loop.time()))
+                await self.sweep_once()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Connection sweep error: {e}")
+            # 스윕이 tick보다 오래 걸리면 밀린 만큼 건너뜀 (칸 순서는 유지)
+            next_tick = max(next_tick + SWEEP_TICK_SECONDS, loop.time())
+
+    # =========================================================================
+    # Registration
+    # =========================================================================
+
+    def add(self, conn: "WebSocketConnection") -> None:
+        """연결 등록 - 첫 PING은 한 바퀴(30초) 뒤."""
+        slot = (self._cursor - 1) % WHEEL_SLOTS
+        self._wheel[slot].add(conn.connection_id)
+        self._slot_of[conn.connection_id] = slot
+        if conn.token_expires_at is not None:
+            heapq.heappush(self._expiries, (conn.token_expires_at, conn.connection_id))
+
+    def remove(self, connection_id: str) -> None:
+        """연결 해제 (만료 힙 항목은 꺼낼 때 무시)."""
+        slot = self._slot_of.pop(connection_id, None)
+        if slot is not None:
+            self._wheel[slot].discard(connection_id)
+
+    def __len__(self) -> int:
+        return len(self._slot_of)
+
+    # =========================================================================
+    # Sweeping
+    # =========================================================================
+
+    async def sweep_once(self, now: float | None = None) -> None:
+        """1 tick: 만료 토큰 처리 + 휠 한 칸의 하트비트."""
+        now = time.time() if now is None else now
+        expired = self._pop_expired(now)
+
+        slot = self._wheel[self._cursor]
+        self._cursor = (self._cursor + 1) % WHEEL_SLOTS
+        expired_ids = {conn.connection_id for conn in expired}
+        due = [
+            conn
+            for conn in map(self._manager.get_connection, list(slot))
+            if conn is not None and conn.connection_id not in expired_ids
+        ]
+
+        await asyncio.gather(
+            *(self._expire_token(conn) for conn in expired),
+            self._heartbeat(due),
+        )
+
+    def _pop_expired(self, now: float) -> list["WebSocketConnection"]:
+        expired = []
+        while self._expiries and self._expiries[0][0] <= now:
+            exp, connection_id = heapq.heappop(self._expiries)
+            conn = self._manager.get_connection(connection_id)
+            # 이미 끊겼거나 재인증으로 만료 시각이 바뀐 연결은 무시
+            if conn is not None and conn.token_expires_at == exp:
+                expired.append(conn)
+        return expired
+
+    async def _expire_token(self, conn: "WebSocketConnection") -> None:
+        logger.info(
+            f"Token expired for user={conn.user_id}, "
+            f"conn={conn.connection_id}"
+        )
+        self.remove(conn.connection_id)
+        try:
+            await conn.send(create_reauth_required_message())
+        except Exception as e:
+            logger.warning(f"Failed to send reauth message: {e}")
+        try:
+            await conn.websocket.close(
+                4002, "Token expired - re-authentication required"
+            )
+        except Exception as e:
+            logger.warning(f"Failed to close websocket: {e}")
+
+    async def _heartbeat(self, conns: list["WebSocketConnection"]) -> None:
+        """PONG 미응답/유휴 연결 종료 후 나머지에 PING 일괄 전송."""
+        if not conns:
+            return
+        now = time.monotonic()
+
+        to_ping = []
+        closing = []
+        for conn in conns:
+            last_seen = conn.last_ping_at or conn.connected_at
+            if now - last_seen > SERVER_TIMEOUT:
+                closing.append(self._close_idle(conn))
+                continue
+
+            # PING 전송 전에 이전 PING에 대한 PONG 확인
+            if conn.last_ping_at is not None and (
+                conn.last_pong_at is None or conn.last_pong_at < conn.last_ping_at
+            ):
+                conn.missed_pongs += 1
+                logger.warning(
+                    f"하트비트 미응답: user={conn.user_id}, "
+                    f"conn={conn.connection_id}, "
+                    f"missed={conn.missed_pongs}/{MAX_MISSED_PONGS}"
+                )
+                if conn.missed_pongs >= MAX_MISSED_PONGS:
+                    closing.append(self._close_unresponsive(conn))
+                    continue
+            to_ping.append(conn)
+
+        ping_text = json_dumps({
+            "type": "PING",
+            "payload": {},
+            "timestamp": datetime.utcnow().isoformat(),
+        })
+        results = await asyncio.gather(
+            *(conn.send_text(ping_text) for conn in to_ping),
+            *closing,
+            return_exceptions=True,
+        )
+        sent_at = time.monotonic()
+        for conn, sent in zip(to_ping, results):
+            if sent is True:
+                conn.last_ping_at = sent_at
+            else:
+                logger.warning(f"PING 전송 실패: user={conn.user_id}")
+
+    async def _close_unresponsive(self, conn: "WebSocketConnection") -> None:
+        logger.info(
+            f"하트비트 타임아웃으로 연결 종료: "
+            f"user={conn.user_id}, conn={conn.connection_id}"
+        )
+        self.remove(conn.connection_id)
+        try:
+            await conn.websocket.close(4003, "Heartbeat timeout - connection closed")
+        except Exception as e:
+            logger.warning(f"연결 종료 실패: {e}")
+
+    async def _close_idle(self, conn: "WebSocketConnection") -> None:
+        logger.warning(
+            f"Connection {conn.connection_id} timed out (no PING for {SERVER_TIMEOUT}s)"
+        )
+        try:
+            await conn.close(4000, "Connection timeout")
+        except Exception as e:
+            logger.debug(f"Error closing timed out connection {conn.connection_id}: {e}")
+        # Save state for reconnection on timeout (user might reconnect)
+        await self._manager.disconnect(conn.connection_id, save_state=True)
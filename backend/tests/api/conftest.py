@@ -128,9 +128,15 @@ async def test_app(test_db: AsyncSession):
     from app.api.rooms import router as rooms_router
     from app.api.users import router as users_router
     from app.config import get_settings
+    from app.game.lobby_index import lobby_index
+    from app.services.rake import rake_config_cache
 
     app = FastAPI(title="Test App")
 
+    # 로비 인덱스 / 레이크 설정 캐시는 프로세스 전역 - 테스트 DB마다 다시 로드
+    lobby_index.clear()
+    rake_config_cache.clear()
+
     # Override settings
     app.dependency_overrides[get_settings] = get_test_settings
 
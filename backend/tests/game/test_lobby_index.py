@@ -0,0 +1,196 @@
+"""LobbyIndex 테스트.
+
+- 블라인드 → 인원 순 정렬과 O(page) 페이지 조회
+- 라이브 테이블 좌석 변경 반영 + LOBBY_UPDATE diff push
+- Redis 미러 워밍업
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from app.game.lobby_index import LOBBY_ROOMS_KEY, LobbyIndex
+from app.game.manager import game_manager
+from app.game.poker_table import Player
+from app.models.room import Room, RoomStatus
+
+
+class HashRedis:
+    """hset/hgetall/hdel만 지원하는 최소 Redis."""
+
+    def __init__(self):
+        self.hashes: dict[str, dict[str, str]] = {}
+
+    async def hset(self, key, mapping):
+        self.hashes.setdefault(key, {}).update(mapping)
+
+    async def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+    async def hdel(self, key, *fields):
+        for field in fields:
+            self.hashes.get(key, {}).pop(field, None)
+
+
+def make_room(big_blind: int, players: int = 0, **config) -> Room:
+    return Room(
+        id=str(uuid4()),
+        name=f"Room {big_blind}",
+        config={"small_blind": big_blind // 2, "big_blind": big_blind, "max_seats": 6, **config},
+        status=RoomStatus.PLAYING.value if players >= 2 else RoomStatus.WAITING.value,
+        current_players=players,
+    )
+
+
+def mock_db(rooms: list[Room]) -> MagicMock:
+    db = MagicMock()
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = rooms
+    db.execute = AsyncMock(return_value=result)
+    return db
+
+
+@pytest.fixture(autouse=True)
+def clean_tables():
+    game_manager.clear_all()
+    yield
+    game_manager.clear_all()
+
+
+class TestOrdering:
+    @pytest.mark.asyncio
+    async def test_sorted_by_blind_then_occupancy(self):
+        low_empty = make_room(20, players=0)
+        low_busy = make_room(20, players=4)
+        high = make_room(200, players=5)
+        index = LobbyIndex()
+
+        await index.ensure_loaded(mock_db([high, low_empty, low_busy]))
+        rooms, total = index.page(1, 10)
+
+        assert total == 3
+        assert [r.room_id for r in rooms] == [low_busy.id, low_empty.id, high.id]
+
+    @pytest.mark.asyncio
+    async def test_page_and_status_filter(self):
+        rooms = [make_room(10 * (i + 1), players=i % 3) for i in range(7)]
+        index = LobbyIndex()
+        await index.ensure_loaded(mock_db(rooms))
+
+        page2, total = index.page(2, 3)
+        assert total == 7
+        assert [r.big_blind for r in page2] == [40, 50, 60]
+
+        playing, total = index.page(1, 10, status=RoomStatus.PLAYING.value)
+        assert total == 2
+        assert all(r.player_count >= 2 for r in playing)
+
+    @pytest.mark.asyncio
+    async def test_db_loaded_once(self):
+        db = mock_db([make_room(20)])
+        index = LobbyIndex()
+
+        await index.ensure_loaded(db)
+        await index.ensure_loaded(db)
+        index.page(1, 20)
+
+        assert db.execute.await_count == 1
+
+
+class TestLiveUpdates:
+    @pytest.mark.asyncio
+    async def test_sync_table_pushes_diff_on_seat_change(self):
+        room = make_room(20)
+        index = LobbyIndex()
+        publisher = AsyncMock()
+        index.set_publisher(publisher)
+        await index.ensure_loaded(mock_db([room]))
+
+        table = game_manager.create_table_sync(room.id, room.name, 10, 20, 400, 2000, 6)
+        table.seat_player(0, Player(user_id="u1", username="a", seat=0, stack=1000))
+        table.seat_player(1, Player(user_id="u2", username="b", seat=1, stack=1000))
+        await index.sync_table(table)
+
+        entry = index.get(room.id)
+        assert entry.player_count == 2
+        assert entry.status == RoomStatus.PLAYING.value
+        diff = publisher.await_args.args[0]
+        assert diff["updateType"] == "room_updated"
+        assert diff["room"]["playerCount"] == 2
+        assert diff["stateVersion"] == index.state_version
+
+        # 변화 없으면 push 없음
+        publisher.reset_mock()
+        await index.sync_table(table)
+        publisher.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_live_table_overrides_db_count_and_reorders(self):
+        busy = make_room(20, players=3)
+        quiet = make_room(20, players=0)
+        index = LobbyIndex()
+        await index.ensure_loaded(mock_db([busy, quiet]))
+
+        table = game_manager.create_table_sync(quiet.id, quiet.name, 10, 20, 400, 2000, 6)
+        for seat in range(5):
+            table.seat_player(seat, Player(user_id=f"u{seat}", username="p", seat=seat, stack=500))
+        await index.sync_table(table)
+
+        rooms, _ = index.page(1, 10)
+        assert [r.room_id for r in rooms] == [quiet.id, busy.id]
+
+    @pytest.mark.asyncio
+    async def test_create_and_close(self):
+        index = LobbyIndex()
+        publisher = AsyncMock()
+        index.set_publisher(publisher)
+        await index.ensure_loaded(mock_db([]))
+
+        room = make_room(50)
+        await index.upsert_room(room)
+        assert publisher.await_args.args[0]["updateType"] == "room_created"
+        assert index.page(1, 10)[1] == 1
+
+        room.status = RoomStatus.CLOSED.value
+        await index.upsert_room(room)
+        diff = publisher.await_args.args[0]
+        assert diff == {
+            "updateType": "room_removed",
+            "room": {"roomId": room.id},
+            "stateVersion": index.state_version,
+        }
+        assert index.page(1, 10) == ([], 0)
+
+
+class TestRedisMirror:
+    @pytest.mark.asyncio
+    async def test_warm_start_skips_db(self):
+        redis = HashRedis()
+        first = LobbyIndex()
+        first.attach_redis(redis)
+        rooms = [make_room(20, players=1), make_room(100, is_private=True)]
+        await first.ensure_loaded(mock_db(rooms))
+        assert set(redis.hashes[LOBBY_ROOMS_KEY]) == {r.id for r in rooms}
+
+        second = LobbyIndex()
+        second.attach_redis(redis)
+        db = mock_db([])
+        await second.ensure_loaded(db)
+
+        db.execute.assert_not_awaited()
+        assert second.page(1, 10) == first.page(1, 10)
+        public, total = second.page(1, 10, include_private=False)
+        assert total == 1 and public[0].room_id == rooms[0].id
+
+    @pytest.mark.asyncio
+    async def test_remove_deletes_mirror(self):
+        redis = HashRedis()
+        index = LobbyIndex()
+        index.attach_redis(redis)
+        room = make_room(20)
+        await index.ensure_loaded(mock_db([room]))
+
+        await index.remove(room.id)
+
+        assert redis.hashes[LOBBY_ROOMS_KEY] == {}
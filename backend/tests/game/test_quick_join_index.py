@@ -0,0 +1,230 @@
+"""QuickJoinIndex / RoomMatcher 테스트.
+
+- 블라인드/바이인 버킷 + 점수 순 매칭 (DB 조회 없음)
+- LobbyIndex 갱신(좌석 변경, 만석, 종료) 반영
+- Redis 좌석 예약: 다른 사용자가 잡은 좌석/방 건너뜀
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from app.game.lobby_index import LobbyIndex
+from app.game.manager import game_manager
+from app.game.poker_table import Player
+from app.game.quick_join_index import BlindFilter, QuickJoinIndex
+from app.models.room import Room, RoomStatus
+from app.services.room_matcher import (
+    RoomMatcher,
+    SeatReservation,
+    calculate_room_score,
+    parse_blind_level,
+)
+
+
+def make_room(small_blind: int, players: int = 0, buy_in_min: int = 400, **config) -> Room:
+    return Room(
+        id=str(uuid4()),
+        name=f"Room {small_blind}",
+        config={
+            "small_blind": small_blind,
+            "big_blind": small_blind * 2,
+            "max_seats": 6,
+            "buy_in_min": buy_in_min,
+            "buy_in_max": buy_in_min * 5,
+            **config,
+        },
+        status=RoomStatus.PLAYING.value if players >= 2 else RoomStatus.WAITING.value,
+        current_players=players,
+    )
+
+
+def mock_db(rooms: list[Room]) -> MagicMock:
+    db = MagicMock()
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = rooms
+    db.execute = AsyncMock(return_value=result)
+    return db
+
+
+async def loaded_index(rooms: list[Room]) -> tuple[LobbyIndex, QuickJoinIndex]:
+    lobby = LobbyIndex()
+    index = QuickJoinIndex(lobby)
+    await index.ensure_loaded(mock_db(rooms))
+    return lobby, index
+
+
+class SeatRedis:
+    """seat_reserve.lua 동작만 흉내내는 최소 Redis."""
+
+    def __init__(self):
+        self.values: dict[str, str] = {}
+
+    def register_script(self, source):
+        async def run(keys, args):
+            user_id = args[0]
+            for i, key in enumerate(keys, 1):
+                if self.values.get(key) == user_id:
+                    return i
+            for i, key in enumerate(keys, 1):
+                if key not in self.values:
+                    self.values[key] = user_id
+                    return i
+            return 0
+        return run
+
+    async def get(self, key):
+        value = self.values.get(key)
+        return None if value is None else value.encode()
+
+    async def delete(self, key):
+        self.values.pop(key, None)
+
+
+@pytest.fixture(autouse=True)
+def clean_tables():
+    game_manager.clear_all()
+    yield
+    game_manager.clear_all()
+
+
+class TestIndex:
+    @pytest.mark.asyncio
+    async def test_best_by_score_within_affordable_buckets(self):
+        cheap_quiet = make_room(10, players=1)
+        cheap_busy = make_room(10, players=4)
+        expensive_busy = make_room(10, players=5, buy_in_min=5000)
+        _, index = await loaded_index([cheap_quiet, cheap_busy, expensive_busy])
+
+        assert [r.room_id for r in index.best(1000)] == [cheap_busy.id]
+        assert [r.room_id for r in index.best(10_000)] == [expensive_busy.id]
+        assert index.best(100) == []
+
+    @pytest.mark.asyncio
+    async def test_blind_filter_and_exclude(self):
+        low = make_room(10, players=2)
+        medium = make_room(50, players=3)
+        high = make_room(200, players=4)
+        _, index = await loaded_index([low, medium, high])
+
+        assert [r.room_id for r in index.best(10_000, parse_blind_level("low"))] == [low.id]
+        assert [r.room_id for r in index.best(10_000, BlindFilter(50, 50, 100))] == [medium.id]
+        assert index.best(10_000, BlindFilter(50, 50, 200)) == []
+        assert [r.room_id for r in index.best(10_000, exclude=[high.id])] == [medium.id]
+        assert [r.room_id for r in index.ranked(10_000)] == [high.id, medium.id, low.id]
+
+    @pytest.mark.asyncio
+    async def test_ties_returned_together(self):
+        a = make_room(10, players=3)
+        b = make_room(10, players=3)
+        _, index = await loaded_index([a, b, make_room(10, players=1)])
+
+        assert {r.room_id for r in index.best(1000)} == {a.id, b.id}
+
+    @pytest.mark.asyncio
+    async def test_follows_seat_changes_full_and_closed_rooms(self):
+        room = make_room(10, players=0)
+        other = make_room(10, players=1)
+        lobby, index = await loaded_index([room, other])
+
+        table = game_manager.create_table_sync(room.id, room.name, 10, 20, 400, 2000, 6)
+        for seat in range(6):
+            table.seat_player(seat, Player(user_id=f"u{seat}", username="p", seat=seat, stack=500))
+        await lobby.sync_table(table)
+
+        # 만석 방은 색인에서 빠짐
+        assert [r.room_id for r in index.best(1000)] == [other.id]
+
+        table.players[0] = None
+        await lobby.sync_table(table)
+        assert [r.room_id for r in index.best(1000)] == [room.id]
+
+        await lobby.remove(room.id)
+        assert [r.room_id for r in index.best(1000)] == [other.id]
+        assert len(index) == 1
+
+    @pytest.mark.asyncio
+    async def test_listener_replays_existing_rooms(self):
+        lobby = LobbyIndex()
+        room = make_room(10, players=2)
+        await lobby.ensure_loaded(mock_db([room]))
+
+        index = QuickJoinIndex(lobby)
+
+        assert [r.room_id for r in index.best(1000)] == [room.id]
+        lobby.clear()
+        assert len(index) == 0
+
+    def test_score_matches_room_matcher(self):
+        room = make_room(10, players=4)
+        room.status = RoomStatus.PLAYING.value
+
+        # 100 + 4 * 10 + int(4 / 6 * 20)
+        assert calculate_room_score(room) == 153
+
+
+class TestSeatReservation:
+    @pytest.mark.asyncio
+    async def test_concurrent_users_get_different_seats(self):
+        room = make_room(10, players=1)
+        lobby, index = await loaded_index([room])
+        table = game_manager.create_table_sync(room.id, room.name, 10, 20, 400, 2000, 6)
+        table.seat_player(0, Player(user_id="seated", username="s", seat=0, stack=500))
+        await lobby.sync_table(table)
+        redis = SeatRedis()
+
+        with patch("app.services.room_matcher.quick_join_index", index):
+            first = await RoomMatcher(MagicMock(), redis).reserve_best_room("u-1", 1000)
+            second = await RoomMatcher(MagicMock(), redis).reserve_best_room("u-2", 1000)
+            again = await RoomMatcher(MagicMock(), redis).reserve_best_room("u-1", 1000)
+
+        assert (first.room.room_id, first.seat) == (room.id, 1)
+        assert (second.room.room_id, second.seat) == (room.id, 2)
+        assert again.seat == 1  # 재시도 요청은 같은 좌석
+        assert redis.values[first.key] == "u-1"
+
+    @pytest.mark.asyncio
+    async def test_fully_reserved_room_skipped(self):
+        best = make_room(10, players=5)
+        fallback = make_room(10, players=1)
+        lobby, index = await loaded_index([best, fallback])
+        table = game_manager.create_table_sync(best.id, best.name, 10, 20, 400, 2000, 6)
+        for seat in range(5):
+            table.seat_player(seat, Player(user_id=f"u{seat}", username="p", seat=seat, stack=500))
+        await lobby.sync_table(table)
+        redis = SeatRedis()
+        redis.values[f"quickjoin:seat:{best.id}:5"] = "someone-else"
+
+        with patch("app.services.room_matcher.quick_join_index", index):
+            reservation = await RoomMatcher(MagicMock(), redis).reserve_best_room("u-1", 1000)
+
+        assert reservation.room.room_id == fallback.id
+
+    @pytest.mark.asyncio
+    async def test_release_only_own_reservation(self):
+        redis = SeatRedis()
+        redis.values["quickjoin:seat:r:0"] = "other"
+        matcher = RoomMatcher(MagicMock(), redis)
+
+        room = MagicMock(room_id="r")
+        await matcher.release(SeatReservation(room, 0, "u-1", "quickjoin:seat:r:0"))
+        assert redis.values["quickjoin:seat:r:0"] == "other"
+
+        await matcher.release(SeatReservation(room, 0, "other", "quickjoin:seat:r:0"))
+        assert "quickjoin:seat:r:0" not in redis.values
+
+    @pytest.mark.asyncio
+    async def test_no_db_query_after_load(self):
+        db = mock_db([make_room(10, players=2)])
+        lobby = LobbyIndex()
+        index = QuickJoinIndex(lobby)
+        matcher = RoomMatcher(db, SeatRedis())
+
+        with patch("app.services.room_matcher.quick_join_index", index):
+            seats = [(await matcher.reserve_best_room(f"u-{i}", 1000)).seat for i in range(6)]
+            # 6석이 모두 예약됨
+            assert await matcher.reserve_best_room("u-6", 1000) is None
+
+        assert seats == list(range(6))
+        assert db.execute.await_count == 1
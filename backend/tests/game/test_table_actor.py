@@ -0,0 +1,241 @@
+"""Tests for TableActor / TableActorRegistry.
+
+- 명령은 mailbox 순서대로 하나씩 실행
+- 부수효과(outbox)는 다음 명령 처리를 막지 않고 순서대로 실행
+- 예약 명령은 key당 1개, stop/cancel 시 실행되지 않음
+- schedule_after: delay와 외부 future 완료 중 늦은 시점에 실행
+"""
+
+import asyncio
+
+import pytest
+
+from app.game.table_actor import TableActor, TableActorRegistry
+
+
+@pytest.fixture
+async def actor():
+    actor = TableActor("room-1")
+    yield actor
+    await actor.stop()
+
+
+class TestCommands:
+    @pytest.mark.asyncio
+    async def test_call_returns_result(self, actor):
+        assert await actor.call(lambda: 42) == 42
+
+    @pytest.mark.asyncio
+    async def test_call_propagates_exception(self, actor):
+        def fail():
+            raise ValueError("rejected")
+
+        with pytest.raises(ValueError, match="rejected"):
+            await actor.call(fail)
+
+        # 실패한 명령 이후에도 계속 처리
+        assert await actor.call(lambda: "ok") == "ok"
+
+    @pytest.mark.asyncio
+    async def test_commands_run_in_order(self, actor):
+        order = []
+        for i in range(5):
+            actor.post(lambda i=i: order.append(i))
+        await actor.call(lambda: None)
+
+        assert order == [0, 1, 2, 3, 4]
+        assert actor.commands_processed == 6
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_are_serialized(self, actor):
+        state = {"value": 0}
+
+        def increment():
+            current = state["value"]
+            state["value"] = current + 1
+            return current
+
+        results = await asyncio.gather(*(actor.call(increment) for _ in range(50)))
+
+        assert sorted(results) == list(range(50))
+        assert state["value"] == 50
+
+    @pytest.mark.asyncio
+    async def test_closed_actor_rejects_calls(self, actor):
+        await actor.stop()
+
+        with pytest.raises(RuntimeError):
+            await actor.call(lambda: None)
+
+
+class TestEffects:
+    @pytest.mark.asyncio
+    async def test_slow_effect_does_not_block_commands(self, actor):
+        release = asyncio.Event()
+        sent = []
+
+        async def slow_broadcast():
+            await release.wait()
+            sent.append("slow")
+
+        actor.emit(slow_broadcast)
+        # 이전 부수효과가 끝나지 않아도 다음 명령은 바로 처리
+        assert await asyncio.wait_for(actor.call(lambda: "next"), timeout=1.0) == "next"
+        assert sent == []
+
+        release.set()
+        await actor.drain()
+        assert sent == ["slow"]
+
+    @pytest.mark.asyncio
+    async def test_effects_run_in_emit_order(self, actor):
+        sent = []
+
+        def command(i):
+            async def effect():
+                await asyncio.sleep(0.001 * (5 - i))
+                sent.append(i)
+            actor.emit(effect)
+
+        for i in range(5):
+            actor.post(lambda i=i: command(i))
+        await actor.drain()
+
+        assert sent == [0, 1, 2, 3, 4]
+
+    @pytest.mark.asyncio
+    async def test_failing_effect_does_not_stop_outbox(self, actor):
+        sent = []
+
+        async def broken():
+            raise ConnectionError("socket closed")
+
+        async def ok():
+            sent.append("ok")
+
+        actor.post(lambda: (actor.emit(broken), actor.emit(ok)))
+        await actor.drain()
+
+        assert sent == ["ok"]
+
+
+class TestSchedule:
+    @pytest.mark.asyncio
+    async def test_scheduled_command_runs(self, actor):
+        fired = asyncio.Event()
+        actor.schedule("turn", 0.01, fired.set)
+
+        await asyncio.wait_for(fired.wait(), timeout=1.0)
+        assert not actor.is_scheduled("turn")
+
+    @pytest.mark.asyncio
+    async def test_reschedule_replaces_previous(self, actor):
+        fired = []
+        actor.schedule("turn", 0.01, lambda: fired.append("first"))
+        actor.schedule("turn", 0.02, lambda: fired.append("second"))
+
+        await asyncio.sleep(0.05)
+        await actor.drain()
+        assert fired == ["second"]
+
+    @pytest.mark.asyncio
+    async def test_cancel(self, actor):
+        fired = []
+        actor.schedule("turn", 0.01, lambda: fired.append("turn"))
+
+        assert actor.cancel("turn") is True
+        assert actor.cancel("turn") is False
+        await asyncio.sleep(0.03)
+        assert fired == []
+
+    @pytest.mark.asyncio
+    async def test_stop_cancels_scheduled(self, actor):
+        fired = []
+        actor.schedule("turn", 0.01, lambda: fired.append("turn"))
+        actor.schedule("next_hand", 0.01, lambda: fired.append("next_hand"))
+
+        await actor.stop()
+        await asyncio.sleep(0.03)
+        assert fired == []
+
+
+class TestScheduleAfter:
+    @pytest.mark.asyncio
+    async def test_waits_for_delay_when_future_done(self, actor):
+        future = asyncio.get_running_loop().create_future()
+        future.set_result("decision")
+        fired = asyncio.Event()
+        actor.schedule_after("turn", 0.02, future, fired.set)
+
+        await asyncio.sleep(0)
+        assert not fired.is_set()
+        await asyncio.wait_for(fired.wait(), timeout=1.0)
+
+    @pytest.mark.asyncio
+    async def test_waits_for_future_after_delay(self, actor):
+        future = asyncio.get_running_loop().create_future()
+        fired = []
+        actor.schedule_after("turn", 0.0, future, lambda: fired.append(future.result()))
+
+        await asyncio.sleep(0.02)
+        await actor.drain()
+        assert fired == []
+        assert actor.is_scheduled("turn")
+
+        future.set_result("decision")
+        await asyncio.sleep(0)
+        await actor.drain()
+        assert fired == ["decision"]
+        assert not actor.is_scheduled("turn")
+
+    @pytest.mark.asyncio
+    async def test_cancel_while_waiting_for_future(self, actor):
+        future = asyncio.get_running_loop().create_future()
+        fired = []
+        actor.schedule_after("turn", 0.0, future, lambda: fired.append("late"))
+        await asyncio.sleep(0.01)
+
+        # 같은 key 재예약 → 이전 대기 취소
+        actor.schedule("turn", 0.0, lambda: fired.append("new"))
+        future.set_result("decision")
+        await asyncio.sleep(0.01)
+        await actor.drain()
+
+        assert fired == ["new"]
+
+
+class TestRegistry:
+    @pytest.mark.asyncio
+    async def test_get_or_create(self):
+        registry = TableActorRegistry()
+        actor = registry.get("room-1")
+
+        assert registry.get("room-1") is actor
+        assert registry.peek("room-2") is None
+        assert len(registry) == 1
+        await registry.close_all()
+
+    @pytest.mark.asyncio
+    async def test_remove_stops_actor(self):
+        registry = TableActorRegistry()
+        actor = registry.get("room-1")
+
+        assert await registry.remove("room-1") is True
+        assert await registry.remove("room-1") is False
+        assert actor.closed
+        # 제거 후 다시 요청하면 새 액터
+        assert registry.get("room-1") is not actor
+        await registry.close_all()
+
+    @pytest.mark.asyncio
+    async def test_prune_inactive(self):
+        registry = TableActorRegistry()
+        for room_id in ("room-1", "room-2", "room-3"):
+            registry.get(room_id)
+
+        removed = await registry.prune(["room-2"])
+
+        assert removed == 2
+        assert "room-2" in registry
+        assert len(registry) == 1
+        await registry.close_all()
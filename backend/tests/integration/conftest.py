@@ -125,10 +125,16 @@ async def integration_app(integration_db: AsyncSession):
     """Create full FastAPI application for integration tests."""
     from app.main import app
     from app.config import get_settings
+    from app.game.lobby_index import lobby_index
+    from app.services.rake import rake_config_cache
 
     # Override settings
     app.dependency_overrides[get_settings] = get_integration_test_settings
 
+    # 로비 인덱스 / 레이크 설정 캐시는 프로세스 전역 - 테스트 DB마다 다시 로드
+    lobby_index.clear()
+    rake_config_cache.clear()
+
     # Override database
     async def override_get_db():
         yield integration_db
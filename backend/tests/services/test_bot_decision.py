@@ -0,0 +1,205 @@
+"""Tests for BotDecisionService.
+
+- 같은 루프 tick의 요청은 한 배치로 워커에서 평가 (max_batch 단위 분할)
+- 평가는 이벤트 루프 스레드 밖에서 실행
+- 대기열 깊이 / 결정 지연 메트릭
+- 생각 시간 분포 설정
+"""
+
+import asyncio
+import threading
+from unittest.mock import patch
+
+import pytest
+from prometheus_client import REGISTRY
+
+from app.services import bot_decision
+from app.services.bot_decision import (
+    EXECUTOR_PROCESS,
+    EXECUTOR_THREAD,
+    BotDecisionRequest,
+    BotDecisionService,
+    ThinkTimeDistribution,
+    decide_batch,
+)
+
+
+def make_request(**overrides) -> BotDecisionRequest:
+    fields = dict(
+        actions=("fold", "call", "raise"),
+        call_amount=20,
+        stack=1000,
+        available={"min_raise": 40, "max_raise": 1000},
+        hole_cards=("As", "Ah"),
+        community_cards=("Ad", "Ks", "Qh"),
+        pot=100,
+    )
+    fields.update(overrides)
+    return BotDecisionRequest(**fields)
+
+
+@pytest.fixture
+def service():
+    service = BotDecisionService(executor=EXECUTOR_THREAD, max_batch=4)
+    yield service
+    service.shutdown()
+
+
+class TestDecideBatch:
+    def test_one_result_per_request(self):
+        requests = [
+            make_request(),
+            make_request(actions=("check", "bet"), call_amount=0, hole_cards=("7h", "2c")),
+        ]
+
+        results = decide_batch(requests)
+
+        assert len(results) == 2
+        assert results[0][0] in ("raise", "call")
+        assert results[1][0] in ("check", "bet")
+
+    def test_failed_request_falls_back(self):
+        with patch.object(bot_decision, "evaluate_hand_for_bot", side_effect=ValueError("bad card")):
+            results = decide_batch([
+                make_request(actions=("check", "bet")),
+                make_request(actions=("fold", "call")),
+            ])
+
+        assert results == [("check", 0), ("fold", 0)]
+
+
+class TestBatching:
+    @pytest.mark.asyncio
+    async def test_same_tick_requests_share_batch(self, service):
+        futures = [service.submit(make_request()) for _ in range(3)]
+        results = await asyncio.gather(*futures)
+
+        assert len(results) == 3
+        assert service.batches == 1
+        assert service.decisions == 3
+
+    @pytest.mark.asyncio
+    async def test_large_burst_split_by_max_batch(self, service):
+        sizes = []
+        original = bot_decision.decide_batch
+
+        def recording_batch(requests):
+            sizes.append(len(requests))
+            return original(requests)
+
+        with patch.object(bot_decision, "decide_batch", recording_batch):
+            await asyncio.gather(*(service.submit(make_request()) for _ in range(10)))
+
+        assert sorted(sizes) == [2, 4, 4]
+        assert service.batches == 3
+
+    @pytest.mark.asyncio
+    async def test_evaluates_off_event_loop(self, service):
+        threads = []
+        original = bot_decision.decide_batch
+
+        def recording_batch(requests):
+            threads.append(threading.current_thread())
+            return original(requests)
+
+        with patch.object(bot_decision, "decide_batch", recording_batch):
+            await service.submit(make_request())
+
+        assert threads and threads[0] is not threading.main_thread()
+
+    @pytest.mark.asyncio
+    async def test_process_pool(self):
+        service = BotDecisionService(executor=EXECUTOR_PROCESS, max_workers=1)
+        try:
+            action, amount = await asyncio.wait_for(
+                service.submit(make_request(actions=("fold",))), timeout=30
+            )
+        finally:
+            service.shutdown()
+
+        assert (action, amount) == ("fold", 0)
+
+    def test_process_pool_is_default(self):
+        assert BotDecisionService().executor_kind == EXECUTOR_PROCESS
+
+    def test_unknown_executor_rejected(self):
+        with pytest.raises(ValueError):
+            BotDecisionService(executor="gpu")
+
+    @pytest.mark.asyncio
+    async def test_shutdown_cancels_pending(self, service):
+        future = service.submit(make_request())
+        service.shutdown()
+        await asyncio.sleep(0)
+
+        assert future.cancelled()
+        assert service.queue_depth == 0
+
+
+class TestMetrics:
+    @pytest.mark.asyncio
+    async def test_queue_depth_tracks_pending(self, service):
+        release = threading.Event()
+        original = bot_decision.decide_batch
+
+        def blocking_batch(requests):
+            release.wait(timeout=5)
+            return original(requests)
+
+        with patch.object(bot_decision, "decide_batch", blocking_batch):
+            futures = [service.submit(make_request()) for _ in range(3)]
+            assert service.queue_depth == 3
+            await asyncio.sleep(0.01)
+            # 워커에서 평가 중인 요청도 포함
+            assert service.queue_depth == 3
+            assert REGISTRY.get_sample_value("pokerkit_bot_decision_queue_depth") == 3
+
+            release.set()
+            await asyncio.gather(*futures)
+
+        assert service.queue_depth == 0
+        assert REGISTRY.get_sample_value("pokerkit_bot_decision_queue_depth") == 0
+
+    @pytest.mark.asyncio
+    async def test_latency_and_batch_size_recorded(self, service):
+        latency_before = REGISTRY.get_sample_value(
+            "pokerkit_bot_decision_latency_seconds_count"
+        ) or 0
+        batches_before = REGISTRY.get_sample_value(
+            "pokerkit_bot_decision_batch_size_count"
+        ) or 0
+
+        await asyncio.gather(*(service.submit(make_request()) for _ in range(3)))
+
+        assert REGISTRY.get_sample_value(
+            "pokerkit_bot_decision_latency_seconds_count"
+        ) == latency_before + 3
+        assert REGISTRY.get_sample_value(
+            "pokerkit_bot_decision_batch_size_count"
+        ) == batches_before + 1
+
+
+class TestThinkTime:
+    def test_triangular_within_bounds(self):
+        distribution = ThinkTimeDistribution(
+            minimum=0.5, maximum=1.5, mode=0.8, extra_probability=0.0
+        )
+        samples = [distribution.sample() for _ in range(500)]
+
+        assert all(0.5 <= s <= 1.5 for s in samples)
+
+    def test_extra_long_think(self):
+        distribution = ThinkTimeDistribution(
+            minimum=0.5, maximum=1.5, mode=0.8,
+            extra_probability=1.0, extra_min=2.0, extra_max=3.0,
+        )
+        samples = [distribution.sample() for _ in range(500)]
+
+        assert all(2.5 <= s <= 4.5 for s in samples)
+
+    def test_service_uses_distribution(self):
+        service = BotDecisionService(
+            think_time=ThinkTimeDistribution(minimum=0.1, maximum=0.1, mode=0.1, extra_probability=0.0)
+        )
+
+        assert service.think_delay() == pytest.approx(0.1)
@@ -122,13 +122,13 @@ class TestHandCompletedEvent:
         )
 
         assert result is True
-        mock_redis.publish.assert_called_once()
+        mock_redis.xadd.assert_called_once()
         
         # 발행된 메시지 검증
-        call_args = mock_redis.publish.call_args
+        call_args = mock_redis.xadd.call_args
         assert call_args[0][0] == CHANNEL_HAND_COMPLETED
         
-        event_data = json.loads(call_args[0][1])
+        event_data = json.loads(call_args[0][1]["data"])
         assert event_data["event_type"] == "hand_completed"
         assert event_data["hand_id"] == "hand-123"
         assert event_data["room_id"] == "room-456"
@@ -158,7 +158,7 @@ class TestHandCompletedEvent:
     async def test_publish_hand_completed_redis_error(self):
         """Redis 에러 시 False 반환."""
         mock_redis = AsyncMock()
-        mock_redis.publish.side_effect = Exception("Redis connection error")
+        mock_redis.xadd.side_effect = Exception("Redis connection error")
         publisher = FraudEventPublisher(mock_redis)
 
         result = await publisher.publish_hand_completed(
@@ -193,12 +193,12 @@ class TestPlayerActionEvent:
         )
 
         assert result is True
-        mock_redis.publish.assert_called_once()
+        mock_redis.xadd.assert_called_once()
         
-        call_args = mock_redis.publish.call_args
+        call_args = mock_redis.xadd.call_args
         assert call_args[0][0] == CHANNEL_PLAYER_ACTION
         
-        event_data = json.loads(call_args[0][1])
+        event_data = json.loads(call_args[0][1]["data"])
         assert event_data["event_type"] == "player_action"
         assert event_data["user_id"] == "user-123"
         assert event_data["room_id"] == "room-456"
@@ -248,12 +248,12 @@ class TestPlayerStatsEvent:
         )
 
         assert result is True
-        mock_redis.publish.assert_called_once()
+        mock_redis.xadd.assert_called_once()
         
-        call_args = mock_redis.publish.call_args
+        call_args = mock_redis.xadd.call_args
         assert call_args[0][0] == CHANNEL_PLAYER_STATS
         
-        event_data = json.loads(call_args[0][1])
+        event_data = json.loads(call_args[0][1]["data"])
         assert event_data["event_type"] == "player_stats"
         assert event_data["user_id"] == "user-123"
         assert event_data["room_id"] == "room-456"
@@ -333,8 +333,8 @@ class TestHandCompletedEventSchema:
         assert result is True
         
         # 발행된 이벤트 검증
-        call_args = mock_redis.publish.call_args
-        event_data = json.loads(call_args[0][1])
+        call_args = mock_redis.xadd.call_args
+        event_data = json.loads(call_args[0][1]["data"])
         
         # 필수 필드 존재 확인
         assert "event_type" in event_data
@@ -404,8 +404,8 @@ class TestPlayerActionEventSchema:
         assert result is True
         
         # 발행된 이벤트 검증
-        call_args = mock_redis.publish.call_args
-        event_data = json.loads(call_args[0][1])
+        call_args = mock_redis.xadd.call_args
+        event_data = json.loads(call_args[0][1]["data"])
         
         # 필수 필드 존재 확인
         assert "event_type" in event_data
@@ -478,8 +478,8 @@ class TestPlayerStatsEventSchema:
         assert result is True
         
         # 발행된 이벤트 검증
-        call_args = mock_redis.publish.call_args
-        event_data = json.loads(call_args[0][1])
+        call_args = mock_redis.xadd.call_args
+        event_data = json.loads(call_args[0][1]["data"])
         
         # 필수 필드 존재 확인
         assert "event_type" in event_data
@@ -3,6 +3,7 @@
 Phase P1-1: 관리자 레이크 설정 UI
 """
 
+import asyncio
 from decimal import Decimal
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -287,3 +288,97 @@ class TestRakeServiceDBIntegration:
         # 3% = 3000원, 캡 2BB = 2000원 → 캡 적용
         assert result.total_rake == 2000
         assert result.applied_nfnd is False
+
+
+class TestRakeConfigCache:
+    """Tests for the in-process rake config cache."""
+
+    @pytest.fixture(autouse=True)
+    def clean_cache(self):
+        from app.services.rake import rake_config_cache
+
+        rake_config_cache.clear()
+        yield
+        rake_config_cache.clear()
+
+    @staticmethod
+    def db_with_configs(*configs):
+        session = AsyncMock()
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = [
+            MagicMock(small_blind=sb, big_blind=bb, percentage=Decimal(pct), cap_bb=cap)
+            for sb, bb, pct, cap in configs
+        ]
+        session.execute = AsyncMock(return_value=result)
+        return session
+
+    async def test_hot_path_queries_db_once(self):
+        """첫 조회에서만 DB 로드, 이후 조회는 I/O 없음."""
+        from app.services.rake import RAKE_CONFIGS, RakeService
+
+        session = self.db_with_configs((500, 1000, "0.06", 5))
+        service = RakeService(session)
+
+        for _ in range(3):
+            config = await service.get_rake_config_cached(500, 1000)
+            assert config == RakeConfigData(Decimal("0.06"), 5)
+
+        # DB에 없는 레벨은 하드코딩 기본값
+        assert await service.get_rake_config_cached(1000, 2000) == RAKE_CONFIGS[(1000, 2000)]
+        session.execute.assert_awaited_once()
+
+    async def test_version_bump_publishes_and_reloads(self):
+        from app.services.rake import (
+            RAKE_CONFIG_CHANNEL,
+            RAKE_CONFIG_VERSION_KEY,
+            RakeConfigCache,
+        )
+
+        cache = RakeConfigCache()
+        redis = AsyncMock()
+        redis.incr.return_value = 4
+        cache._redis = redis
+
+        await cache.publish_change()
+
+        redis.incr.assert_awaited_once_with(RAKE_CONFIG_VERSION_KEY)
+        redis.publish.assert_awaited_once_with(RAKE_CONFIG_CHANNEL, "4")
+
+        # 수신 측: 새 세션으로 재로드, 같은/이전 버전은 무시
+        session = self.db_with_configs((500, 1000, "0.03", 2))
+        factory = MagicMock()
+        factory.return_value.__aenter__ = AsyncMock(return_value=session)
+        factory.return_value.__aexit__ = AsyncMock(return_value=False)
+        cache._session_factory = factory
+
+        await cache.reload(4)
+        await cache.reload(4)
+        await cache.reload(3)
+
+        assert cache.version == 4
+        assert cache.get(500, 1000) == RakeConfigData(Decimal("0.03"), 2)
+        session.execute.assert_awaited_once()
+
+    async def test_bump_is_sent_after_commit(self):
+        """변경은 커밋 후에만 알림 (롤백/미커밋 시 알림 없음)."""
+        from sqlalchemy.ext.asyncio import AsyncSession
+
+        from app.services.rake import rake_config_cache
+
+        session = AsyncSession()
+        service = RakeConfigService(session)
+
+        with patch.object(rake_config_cache, "publish_change", AsyncMock()) as publish:
+            service._mark_changed()
+            service._mark_changed()
+            publish.assert_not_awaited()
+
+            await session.commit()
+            await asyncio.sleep(0)
+
+            publish.assert_awaited_once()
+
+            # 훅은 1회용
+            await session.commit()
+            await asyncio.sleep(0)
+            publish.assert_awaited_once()
@@ -9,7 +9,9 @@ import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
+from app.game.lobby_index import lobby_index
 from app.services.room import RoomService, RoomError
+from app.services.wallet import InsufficientBalanceError
 from app.models.room import RoomStatus
 
 
@@ -17,6 +19,14 @@ from app.models.room import RoomStatus
 # Fixtures
 # =============================================================================
 
+@pytest.fixture(autouse=True)
+def clean_lobby_index():
+    """Reset the in-memory lobby/quick-join index between tests."""
+    lobby_index.clear()
+    yield
+    lobby_index.clear()
+
+
 @pytest.fixture
 def mock_db():
     """Create a mock database session."""
@@ -24,10 +34,32 @@ def mock_db():
     return db
 
 
+class FakeWallet:
+    """mock_db.get 사용자의 krw_balance로 동작하는 WalletService 대역."""
+
+    def __init__(self, db):
+        self.db = db
+
+    async def get_balance(self, user_id):
+        return (await self.db.get(None, user_id)).krw_balance
+
+    async def buy_in(self, user_id, amount, table_id):
+        user = await self.db.get(None, user_id)
+        if user.krw_balance < amount:
+            raise InsufficientBalanceError(current=user.krw_balance, required=amount)
+        user.krw_balance -= amount
+
+    async def cash_out(self, user_id, amount, table_id):
+        user = await self.db.get(None, user_id)
+        user.krw_balance += amount
+
+
 @pytest.fixture
 def room_service(mock_db):
     """Create RoomService with mock db."""
-    return RoomService(mock_db)
+    service = RoomService(mock_db)
+    service.wallet = FakeWallet(mock_db)
+    return service
 
 
 def create_mock_room(
@@ -82,6 +114,7 @@ def create_mock_user(
     user.id = user_id or str(uuid4())
     user.nickname = nickname
     user.balance = balance
+    user.krw_balance = balance
     return user
 
 
@@ -188,7 +221,8 @@ class TestQuickJoinRoom:
         assert result["table_id"] == table.id
         assert result["position"] == 0
         assert result["stack"] == 1000
-        assert user.balance == 9000  # Deducted
+        assert user.krw_balance == 9000  # Deducted from wallet
+        assert user.balance == 10000  # Legacy balance untouched
 
     @pytest.mark.asyncio
     async def test_room_not_found(self, room_service, mock_db):
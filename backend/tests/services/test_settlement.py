@@ -0,0 +1,247 @@
+"""Tests for HandSettlementService.
+
+- 정렬된 FOR UPDATE 잠금 + 다건 INSERT 1회
+- integrity_hash / 잔액 체인 (같은 사용자 여러 항목)
+- 검증 실패 시 쓰기 없음
+- 캐시 무효화 1 round trip
+- 핸드당 정산 시간 벤치마크
+"""
+
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.models.wallet import TransactionType
+from app.services.rake import RakeResult, RakeService
+from app.services.settlement import HandSettlementService, LedgerEntry
+from app.services.wallet import InsufficientBalanceError, WalletError, WalletService
+
+
+def make_user(user_id: str, balance: int) -> SimpleNamespace:
+    return SimpleNamespace(id=user_id, krw_balance=balance, total_rake_paid_krw=0)
+
+
+def mock_session(users: list[SimpleNamespace]) -> MagicMock:
+    session = MagicMock()
+    select_result = MagicMock()
+    select_result.scalars.return_value.all.return_value = sorted(users, key=lambda u: u.id)
+    session.execute = AsyncMock(return_value=select_result)
+    session.flush = AsyncMock()
+    return session
+
+
+def make_service(users: list[SimpleNamespace]) -> HandSettlementService:
+    return HandSettlementService(mock_session(users), redis=AsyncMock())
+
+
+class TestSettleHand:
+    @pytest.mark.asyncio
+    async def test_locks_users_in_sorted_order_and_inserts_once(self):
+        users = [make_user("u-c", 1000), make_user("u-a", 1000), make_user("u-b", 1000)]
+        service = make_service(users)
+
+        rows = await service.settle_hand("t-1", "h-1", [
+            LedgerEntry("u-c", -10, TransactionType.RAKE),
+            LedgerEntry("u-a", 500, TransactionType.WIN),
+            LedgerEntry("u-b", -10, TransactionType.RAKE),
+        ])
+
+        # SELECT 1회 + INSERT 1회
+        assert service.session.execute.await_count == 2
+        lock_sql = str(
+            service.session.execute.call_args_list[0].args[0]
+            .compile(dialect=postgresql.dialect())
+        )
+        assert "FOR UPDATE" in lock_sql
+        assert "ORDER BY users.id" in lock_sql
+
+        insert_call = service.session.execute.call_args_list[1]
+        assert insert_call.args[1] is rows
+        assert [r["user_id"] for r in rows] == ["u-c", "u-a", "u-b"]
+        service.session.flush.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_balance_chain_and_integrity_hash(self):
+        user = make_user("u-1", 1000)
+        service = make_service([user])
+
+        rows = await service.settle_hand("t-1", "h-1", [
+            LedgerEntry("u-1", 300, TransactionType.WIN),
+            LedgerEntry("u-1", -15, TransactionType.RAKE),
+        ])
+
+        assert [(r["krw_balance_before"], r["krw_balance_after"]) for r in rows] == [
+            (1000, 1300),
+            (1300, 1285),
+        ]
+        assert user.krw_balance == 1285
+        assert user.total_rake_paid_krw == 15
+        for row in rows:
+            assert row["integrity_hash"] == WalletService._compute_integrity_hash(
+                user_id=row["user_id"],
+                tx_type=row["tx_type"],
+                amount=row["krw_amount"],
+                balance_before=row["krw_balance_before"],
+                balance_after=row["krw_balance_after"],
+            )
+            assert row["hand_id"] == "h-1" and row["table_id"] == "t-1"
+        assert rows[1]["description"] == "Rake deducted: 15 KRW"
+
+    @pytest.mark.asyncio
+    async def test_invalidates_all_balances_in_one_call(self):
+        users = [make_user(f"u-{i}", 1000) for i in range(3)]
+        service = make_service(users)
+
+        await service.settle_hand("t-1", "h-1", [
+            LedgerEntry(u.id, -5, TransactionType.RAKE) for u in users
+        ])
+
+        service._redis.delete.assert_awaited_once()
+        assert set(service._redis.delete.await_args.args) == {
+            f"wallet:balance:u-{i}" for i in range(3)
+        }
+
+    @pytest.mark.asyncio
+    async def test_insufficient_balance_writes_nothing(self):
+        rich = make_user("u-a", 1000)
+        poor = make_user("u-b", 5)
+        service = make_service([rich, poor])
+
+        with pytest.raises(InsufficientBalanceError):
+            await service.settle_hand("t-1", "h-1", [
+                LedgerEntry("u-a", -10, TransactionType.RAKE),
+                LedgerEntry("u-b", -10, TransactionType.RAKE),
+            ])
+
+        # 잠금 SELECT만 실행, INSERT / 캐시 삭제 없음
+        assert service.session.execute.await_count == 1
+        service._redis.delete.assert_not_awaited()
+        # 앞선 항목의 잔액도 세션 객체에 반영되지 않음
+        assert rich.krw_balance == 1000
+        assert rich.total_rake_paid_krw == 0
+
+    @pytest.mark.asyncio
+    async def test_insert_failure_leaves_balances_unchanged(self):
+        user = make_user("u-a", 1000)
+        service = make_service([user])
+        select_result = service.session.execute.return_value
+        service.session.execute = AsyncMock(
+            side_effect=[select_result, RuntimeError("db down")]
+        )
+
+        with pytest.raises(RuntimeError):
+            await service.settle_hand("t-1", "h-1", [
+                LedgerEntry("u-a", -10, TransactionType.RAKE),
+            ])
+
+        assert user.krw_balance == 1000
+        service.session.flush.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_missing_user(self):
+        service = make_service([make_user("u-a", 1000)])
+
+        with pytest.raises(WalletError) as exc_info:
+            await service.settle_hand("t-1", "h-1", [
+                LedgerEntry("u-a", -10, TransactionType.RAKE),
+                LedgerEntry("u-x", -10, TransactionType.RAKE),
+            ])
+
+        assert exc_info.value.code == "USER_NOT_FOUND"
+
+    @pytest.mark.asyncio
+    async def test_empty_and_zero_entries(self):
+        service = make_service([])
+
+        assert await service.settle_hand("t-1", "h-1", []) == []
+        assert await service.settle_hand("t-1", "h-1", [
+            LedgerEntry("u-a", 0, TransactionType.WIN),
+        ]) == []
+        service.session.execute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_cache_failure_does_not_fail_settlement(self):
+        service = make_service([make_user("u-a", 1000)])
+        service._redis.delete.side_effect = ConnectionError("redis down")
+
+        rows = await service.settle_hand("t-1", "h-1", [
+            LedgerEntry("u-a", -10, TransactionType.RAKE),
+        ])
+
+        assert len(rows) == 1
+
+
+class TestRakeCollection:
+    @pytest.mark.asyncio
+    async def test_collect_rake_settles_once(self):
+        users = [make_user("u-a", 1000), make_user("u-b", 1000)]
+        service = RakeService(mock_session(users))
+        service._settlement._redis = AsyncMock()
+        rake_result = RakeResult(
+            total_rake=30,
+            rake_per_winner={0: 20, 3: 10},
+            pot_after_rake=570,
+            applied_nfnd=False,
+        )
+
+        transactions = await service.collect_rake(
+            "t-1", "h-1", rake_result, {0: "u-a", 3: "u-b"}
+        )
+
+        assert [(t["user_id"], t["position"], t["amount"]) for t in transactions] == [
+            ("u-a", 0, 20),
+            ("u-b", 3, 10),
+        ]
+        assert service.session.execute.await_count == 2
+        assert users[0].krw_balance == 980
+        assert users[1].total_rake_paid_krw == 10
+
+
+    @pytest.mark.asyncio
+    async def test_zero_rake_position_keeps_rows_aligned(self):
+        users = [make_user("u-a", 1000), make_user("u-b", 1000)]
+        service = RakeService(mock_session(users))
+        service._settlement._redis = AsyncMock()
+        rake_result = RakeResult(
+            total_rake=10,
+            rake_per_winner={0: 0, 3: 10},
+            pot_after_rake=590,
+            applied_nfnd=False,
+        )
+
+        transactions = await service.collect_rake(
+            "t-1", "h-1", rake_result, {0: "u-a", 3: "u-b"}
+        )
+
+        assert [(t["user_id"], t["position"], t["amount"]) for t in transactions] == [
+            ("u-b", 3, 10),
+        ]
+
+
+class TestSettlementBenchmark:
+    @pytest.mark.asyncio
+    async def test_settlement_time_per_hand(self):
+        """9인 핸드 (승리 1 + 레이크 1 + 패배 8) 정산 시간."""
+        hands = 2000
+        users = [make_user(f"u-{i}", 10_000_000) for i in range(9)]
+        service = make_service(users)
+        entries = [
+            LedgerEntry("u-0", 5000, TransactionType.WIN),
+            LedgerEntry("u-0", -250, TransactionType.RAKE),
+            *(LedgerEntry(u.id, -625, TransactionType.LOSE) for u in users[1:]),
+        ]
+
+        start = time.perf_counter()
+        for i in range(hands):
+            await service.settle_hand("t-1", f"h-{i}", entries)
+        elapsed = time.perf_counter() - start
+
+        per_hand_us = elapsed / hands * 1_000_000
+        print(f"\n[settlement] {hands} hands, {per_hand_us:.1f} us/hand (excl. DB I/O)")
+        # 핸드당 DB 2회 (SELECT FOR UPDATE + INSERT) + Redis 1회
+        assert service.session.execute.await_count == hands * 2
+        assert service._redis.delete.await_count == hands
+        assert per_hand_us < 5_000
@@ -3,11 +3,14 @@
 Phase 6.2: VIP & Rakeback System tests.
 """
 
+import time
 from datetime import datetime, timedelta
 from decimal import Decimal
-from unittest.mock import AsyncMock, MagicMock
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from sqlalchemy.sql.dml import Insert
 
 from app.services.vip import (
     VIP_TIERS,
@@ -208,3 +211,224 @@ class TestVIPStatusProgress:
         
         # Should not have queried database
         vip_service.session.get.assert_not_called()
+
+
+class LedgerSession:
+    """주간 레이크백 정산용 최소 세션 (집계/잠금/INSERT/중복 확인 구분)."""
+
+    def __init__(self, weekly_rake: dict[str, int], total_rake: dict[str, int], paid=()):
+        self.users = {
+            uid: SimpleNamespace(id=uid, krw_balance=0, total_rake_paid_krw=total_rake[uid])
+            for uid in weekly_rake
+        }
+        self.weekly_rake = weekly_rake
+        self.paid = set(paid)
+        self.inserted: list[dict] = []
+        self.pending: list[dict] = []
+        self.aggregate_queries = 0
+        self.lock_queries = 0
+        self.commits = 0
+        self.fail_users: set[str] = set()
+        self.flush = AsyncMock()
+
+    async def execute(self, stmt, params=None):
+        result = MagicMock()
+        if isinstance(stmt, Insert):
+            self.pending.extend(params)
+        elif stmt._group_by_clauses:
+            self.aggregate_queries += 1
+            result.all.return_value = [
+                (uid, rake, self.users[uid].total_rake_paid_krw)
+                for uid, rake in self.weekly_rake.items()
+            ]
+        elif stmt._for_update_arg is not None:
+            self.lock_queries += 1
+            ids = stmt.whereclause.right.value
+            if self.fail_users & set(ids):
+                raise RuntimeError("lock timeout")
+            result.scalars.return_value.all.return_value = [self.users[i] for i in ids]
+        else:
+            ids = stmt.whereclause.clauses[0].right.value
+            result.all.return_value = [(uid,) for uid in ids if uid in self.paid]
+        return result
+
+    async def commit(self):
+        self.commits += 1
+        self.inserted.extend(self.pending)
+        self.paid.update(row["user_id"] for row in self.pending)
+        self.pending = []
+
+    async def rollback(self):
+        self.pending = []
+
+
+def make_rakeback_service(session: LedgerSession, redis=None) -> VIPService:
+    service = VIPService(session)
+    service._redis = redis if redis is not None else CheckpointRedis()
+    return service
+
+
+class CheckpointRedis:
+    """hget/hset/hsetnx/hdel/expire/delete + 파이프라인만 지원하는 최소 Redis."""
+
+    def __init__(self):
+        self.hashes: dict[str, dict[str, str]] = {}
+
+    async def hget(self, key, field):
+        return self.hashes.get(key, {}).get(field)
+
+    async def hset(self, key, mapping):
+        self.hashes.setdefault(key, {}).update(mapping)
+
+    async def hdel(self, key, *fields):
+        for field in fields:
+            self.hashes.get(key, {}).pop(field, None)
+
+    def pipeline(self, transaction=True):
+        return CheckpointPipeline(self)
+
+    async def expire(self, key, ttl):
+        pass
+
+    async def delete(self, *keys):
+        pass
+
+
+class CheckpointPipeline:
+    def __init__(self, redis: CheckpointRedis):
+        self.redis = redis
+        self.commands = []
+
+    def hsetnx(self, key, field, value):
+        self.commands.append(("hsetnx", key, field, value))
+
+    def expire(self, key, ttl):
+        self.commands.append(("expire", key, ttl))
+
+    async def execute(self):
+        results = []
+        for command in self.commands:
+            if command[0] == "hsetnx":
+                _, key, field, value = command
+                fields = self.redis.hashes.setdefault(key, {})
+                results.append(field not in fields)
+                fields.setdefault(field, value)
+            else:
+                results.append(True)
+        return results
+
+
+WEEK = datetime(2026, 10, 5)
+PAID_KEY = "rakeback:paid:2026-10-05"
+
+
+class TestWeeklyRakebackSettlement:
+    """Set-based weekly rakeback settlement."""
+
+    @pytest.mark.asyncio
+    async def test_single_aggregate_and_chunked_commits(self):
+        weekly = {f"u-{i:02d}": 10_000 for i in range(5)}
+        totals = {"u-00": 0, "u-01": 100_000, "u-02": 500_000, "u-03": 2_000_000, "u-04": 5_000_000}
+        session = LedgerSession(weekly, totals)
+        service = make_rakeback_service(session)
+
+        results = await service.process_weekly_rakeback_all(week_start=WEEK, batch_size=2)
+
+        assert session.aggregate_queries == 1
+        assert session.lock_queries == 3
+        assert session.commits == 3
+        assert [r.rakeback_amount for r in results] == [2000, 2500, 3000, 3500, 4000]
+        assert all(r.transaction_id for r in results)
+        assert session.users["u-04"].krw_balance == 4000
+        assert session.inserted[0]["description"].startswith("Weekly rakeback 2026-10-05 (bronze)")
+        checkpoint = service._redis.hashes["rakeback:checkpoint:2026-10-05"]
+        assert checkpoint["last_user_id"] == "u-04"
+
+    @pytest.mark.asyncio
+    async def test_resumes_after_checkpoint(self):
+        weekly = {f"u-{i:02d}": 10_000 for i in range(6)}
+        session = LedgerSession(weekly, dict.fromkeys(weekly, 0))
+        redis = CheckpointRedis()
+        redis.hashes["rakeback:checkpoint:2026-10-05"] = {"last_user_id": "u-03"}
+        service = make_rakeback_service(session, redis)
+
+        results = await service.process_weekly_rakeback_all(week_start=WEEK, batch_size=10)
+
+        assert [r.user_id for r in results] == ["u-04", "u-05"]
+        assert {row["user_id"] for row in session.inserted} == {"u-04", "u-05"}
+
+    @pytest.mark.asyncio
+    async def test_committed_chunk_without_checkpoint_is_not_paid_twice(self):
+        """체크포인트 저장 전 중단: 주차 태그로 기지급 사용자 제외."""
+        weekly = {"u-a": 10_000, "u-b": 10_000}
+        session = LedgerSession(weekly, dict.fromkeys(weekly, 0), paid={"u-a"})
+        service = make_rakeback_service(session)
+
+        results = await service.process_weekly_rakeback_all(week_start=WEEK)
+
+        assert [r.user_id for r in results] == ["u-b"]
+        assert [row["user_id"] for row in session.inserted] == ["u-b"]
+
+    @pytest.mark.asyncio
+    async def test_paid_marker_blocks_repay_before_journal_lands(self):
+        """Hot-path: 원장 비동기 기록 전 재실행해도 지급 마커로 중복 지급 차단."""
+        weekly = {"u-a": 10_000, "u-b": 10_000}
+        session = LedgerSession(weekly, dict.fromkeys(weekly, 0))
+        redis = CheckpointRedis()
+        redis.hashes[PAID_KEY] = {"u-a": "2026-10-12T00:00:00"}
+        service = make_rakeback_service(session, redis)
+
+        results = await service.process_weekly_rakeback_all(week_start=WEEK)
+
+        assert [r.user_id for r in results] == ["u-b"]
+        assert [row["user_id"] for row in session.inserted] == ["u-b"]
+        assert set(redis.hashes[PAID_KEY]) == {"u-a", "u-b"}
+
+    @pytest.mark.asyncio
+    async def test_hot_path_without_marker_store_pays_nobody(self):
+        weekly = {"u-a": 10_000}
+        session = LedgerSession(weekly, dict.fromkeys(weekly, 0))
+        service = make_rakeback_service(session, CheckpointRedis())
+        service._redis = None
+
+        with patch("app.services.vip.get_redis_client", AsyncMock(side_effect=ConnectionError("down"))), \
+                patch("app.services.settlement.get_settings") as settings:
+            settings.return_value.wallet_hot_path = True
+            with pytest.raises(RuntimeError):
+                await service.process_weekly_rakeback_all(week_start=WEEK)
+
+        assert session.inserted == []
+
+    @pytest.mark.asyncio
+    async def test_failed_chunk_retries_per_user(self):
+        weekly = {"u-a": 10_000, "u-b": 10_000, "u-c": 10_000}
+        session = LedgerSession(weekly, dict.fromkeys(weekly, 0))
+        session.fail_users = {"u-b"}
+        service = make_rakeback_service(session)
+
+        results = await service.process_weekly_rakeback_all(week_start=WEEK)
+
+        assert [r.user_id for r in results] == ["u-a", "u-c"]
+        assert {row["user_id"] for row in session.inserted} == {"u-a", "u-c"}
+        # 실패 사용자 마커는 해제 → 다음 실행에서 재지급
+        assert set(service._redis.hashes[PAID_KEY]) == {"u-a", "u-c"}
+
+    @pytest.mark.asyncio
+    async def test_runtime_at_100k_users(self):
+        """10만 명 정산 시간 (DB I/O 제외)."""
+        users = 100_000
+        weekly = {f"u-{i:06d}": 1_000 + i % 50_000 for i in range(users)}
+        totals = {uid: (i * 97) % 6_000_000 for i, uid in enumerate(weekly)}
+        session = LedgerSession(weekly, totals)
+        service = make_rakeback_service(session)
+
+        start = time.perf_counter()
+        results = await service.process_weekly_rakeback_all(week_start=WEEK, batch_size=1000)
+        elapsed = time.perf_counter() - start
+
+        print(f"\n[rakeback] {users} users in {elapsed:.2f}s ({session.commits} chunks)")
+        assert len(results) == users
+        assert session.aggregate_queries == 1
+        assert session.commits == users // 1000
+        assert len(session.inserted) == users
+        assert elapsed < 60
@@ -28,10 +28,22 @@ def mock_db():
     return db
 
 
+class FakeWallet:
+    """mock_db.get 사용자의 krw_balance로 동작하는 WalletService 대역."""
+
+    def __init__(self, db):
+        self.db = db
+
+    async def get_balance(self, user_id):
+        return (await self.db.get(None, user_id)).krw_balance
+
+
 @pytest.fixture
 def room_service(mock_db):
     """Create RoomService with mock db."""
-    return RoomService(mock_db)
+    service = RoomService(mock_db)
+    service.wallet = FakeWallet(mock_db)
+    return service
 
 
 def create_mock_room(
@@ -82,6 +94,7 @@ def create_mock_user(
     user.id = user_id or str(uuid4())
     user.nickname = nickname
     user.balance = balance
+    user.krw_balance = balance
     return user
 
 
@@ -0,0 +1,448 @@
+"""Hot-path 지갑 모드 테스트.
+
+- krw_transfer.lua 1회 호출로 차감 (DB I/O 없음), COLD_BALANCE 적재 후 재시도
+- wallet_settle.lua 배치 정산
+- 저널 기록기: 멱등 INSERT + 잔액 반영 + pending 차감/ACK
+- 암호화폐 입출금: krw_transfer.lua 경유 (캐시 DEL / DB krw_balance 직접 변경 없음)
+- 정합성 검사: 두 번 연속 불일치만 드리프트
+"""
+
+import json
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.models.wallet import CryptoType, TransactionStatus, TransactionType
+from app.services import crypto_withdrawal
+from app.services.crypto_deposit import CryptoDepositService
+from app.services.settlement import HandSettlementService, LedgerEntry
+from app.services.wallet import InsufficientBalanceError, WalletError, WalletService
+from app.services.wallet_journal import (
+    JOURNAL_GROUP,
+    WalletJournalWriter,
+    reconcile_balances,
+)
+
+
+class FakePipeline:
+    """명령을 모았다가 execute()에서 FakeRedis에 적용."""
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.ops = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.ops.append((name, args, kwargs))
+            return self
+        return queue
+
+    async def execute(self):
+        return [await getattr(self.redis, name)(*args, **kwargs) for name, args, kwargs in self.ops]
+
+
+class FakeRedis:
+    """지갑 hot-path에 필요한 명령만 지원하는 최소 Redis."""
+
+    def __init__(self):
+        self.values: dict[str, int] = {}
+        self.hashes: dict[str, dict[str, int]] = {}
+        self.acked: list = []
+        self.deleted: list = []
+        self.script_calls: list = []
+        self.script_results: list = []
+
+    def register_script(self, source):
+        async def run(keys, args):
+            self.script_calls.append((source, keys, args))
+            return self.script_results.pop(0)
+        return run
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    async def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.values:
+            return None
+        self.values[key] = int(value) if key.startswith("wallet:balance:") else value
+        return True
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.values.pop(key, None)
+
+    async def get(self, key):
+        value = self.values.get(key)
+        return None if value is None else str(value).encode()
+
+    async def mget(self, keys):
+        return [await self.get(key) for key in keys]
+
+    async def hmget(self, key, fields):
+        return [self.hashes.get(key, {}).get(f) for f in fields]
+
+    async def hincrby(self, key, field, amount):
+        bucket = self.hashes.setdefault(key, {})
+        bucket[field] = bucket.get(field, 0) + amount
+        return bucket[field]
+
+    async def xack(self, stream, group, *ids):
+        self.acked.append((stream, group, ids))
+
+    async def xdel(self, stream, *ids):
+        self.deleted.extend(ids)
+
+    async def scan_iter(self, match, count=None):
+        prefix = match.rstrip("*")
+        for key in list(self.values):
+            if key.startswith(prefix):
+                yield key.encode()
+
+
+def db_session(balances: dict[str, int]) -> MagicMock:
+    session = MagicMock()
+    result = MagicMock()
+    result.all.return_value = list(balances.items())
+    session.execute = AsyncMock(return_value=result)
+    return session
+
+
+class TestHotPathTransfer:
+    @pytest.mark.asyncio
+    async def test_buy_in_is_one_script_call_without_db(self):
+        redis = FakeRedis()
+        redis.script_results = [[1, 700, -1, b"OK"]]
+        session = MagicMock()
+        service = WalletService(session, hot_path=True)
+        service._redis = redis
+
+        tx = await service.buy_in("user-1", 300, table_id="table-1")
+
+        assert (tx.krw_balance_before, tx.krw_balance_after) == (1000, 700)
+        assert tx.krw_amount == -300
+        assert WalletService.verify_integrity(tx)
+        _, keys, args = redis.script_calls[0]
+        assert keys == [
+            "wallet:lock:user-1",
+            "wallet:balance:user-1",
+            "",
+            "wallet:journal",
+            "wallet:pending",
+        ]
+        assert args[2:4] == [300, "debit"]
+        payload = json.loads(args[5])
+        assert payload["id"] == tx.id and payload["amount"] == -300
+        session.execute.assert_not_called()
+        session.add.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_cold_balance_loaded_from_db_plus_pending(self):
+        redis = FakeRedis()
+        redis.hashes["wallet:pending"] = {"user-1": -200}
+        redis.script_results = [
+            [0, -1, -1, b"COLD_BALANCE: Balance not loaded"],
+            [1, 500, -1, b"OK"],
+        ]
+        service = WalletService(db_session({"user-1": 1000}), hot_path=True)
+        service._redis = redis
+
+        tx = await service.buy_in("user-1", 300, table_id="table-1")
+
+        # DB 1000 + 미반영 -200 = 800 적재 후 재시도
+        assert redis.values["wallet:balance:user-1"] == 800
+        assert len(redis.script_calls) == 2
+        assert tx.krw_balance_after == 500
+
+    @pytest.mark.asyncio
+    async def test_insufficient_balance(self):
+        redis = FakeRedis()
+        redis.script_results = [
+            [0, -1, -1, b"INSUFFICIENT_BALANCE: Current=100, Required=300"],
+        ]
+        service = WalletService(MagicMock(), hot_path=True)
+        service._redis = redis
+
+        with pytest.raises(InsufficientBalanceError) as exc_info:
+            await service.buy_in("user-1", 300, table_id="table-1")
+
+        assert exc_info.value.current == 100
+        assert exc_info.value.required == 300
+
+    @pytest.mark.asyncio
+    async def test_get_balance_loads_authoritative_key_without_ttl(self):
+        redis = FakeRedis()
+        service = WalletService(db_session({"user-1": 1000}), hot_path=True)
+        service._redis = redis
+
+        assert await service.get_balance("user-1") == 1000
+        assert redis.values["wallet:balance:user-1"] == 1000
+
+    @pytest.mark.asyncio
+    async def test_load_unknown_user(self):
+        service = WalletService(db_session({}), hot_path=True)
+
+        with pytest.raises(WalletError) as exc_info:
+            await service.load_hot_balances(FakeRedis(), ["ghost"])
+
+        assert exc_info.value.code == "USER_NOT_FOUND"
+
+
+class TestHotPathSettlement:
+    @pytest.mark.asyncio
+    async def test_hand_settled_by_one_batch_script(self):
+        redis = FakeRedis()
+        redis.script_results = [[1, 1300, 985, 1285]]
+        session = MagicMock()
+        service = HandSettlementService(session, redis=redis, hot_path=True)
+
+        rows = await service.settle_hand("t-1", "h-1", [
+            LedgerEntry("u-b", 300, TransactionType.WIN),
+            LedgerEntry("u-a", -15, TransactionType.RAKE),
+            LedgerEntry("u-b", -15, TransactionType.RAKE),
+        ])
+
+        _, keys, args = redis.script_calls[0]
+        assert keys == ["wallet:journal", "wallet:pending", "wallet:balance:u-a", "wallet:balance:u-b"]
+        assert args[0] == 3
+        assert args[1:4] == [2, 300, "u-b"]
+        assert [(r["krw_balance_before"], r["krw_balance_after"]) for r in rows] == [
+            (1000, 1300),
+            (1000, 985),
+            (1300, 1285),
+        ]
+        session.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_insufficient_balance_in_batch(self):
+        redis = FakeRedis()
+        redis.script_results = [[0, b"INSUFFICIENT_BALANCE", 1, 5, 15]]
+        service = HandSettlementService(MagicMock(), redis=redis, hot_path=True)
+
+        with pytest.raises(InsufficientBalanceError) as exc_info:
+            await service.settle_hand("t-1", "h-1", [LedgerEntry("u-a", -15, TransactionType.RAKE)])
+
+        assert (exc_info.value.current, exc_info.value.required) == (5, 15)
+
+
+def hot_withdrawal_service(redis, user):
+    session = MagicMock()
+    session.get = AsyncMock(return_value=user)
+    session.flush = AsyncMock()
+    service = crypto_withdrawal.CryptoWithdrawalService(session)
+    service._redis = redis
+    service._wallet = WalletService(session, hot_path=True)
+    service._wallet._redis = redis
+    service._exchange = MagicMock()
+    service._exchange.convert_krw_to_crypto = AsyncMock(return_value=(Decimal("38.46"), 1300))
+    service._get_daily_withdrawal_total = AsyncMock(return_value=0)
+    service._validate_address_with_checksum = MagicMock(return_value=MagicMock(is_valid=True))
+    return service
+
+
+class TestHotPathCrypto:
+    @pytest.mark.asyncio
+    async def test_withdrawal_hold_goes_through_lua(self):
+        redis = FakeRedis()
+        redis.script_results = [[1, 950_000, -1, b"OK"]]
+        # DB krw_balance는 저널 반영 전이라 낡은 값
+        user = SimpleNamespace(id="user-1", krw_balance=0, pending_withdrawal_krw=0)
+        service = hot_withdrawal_service(redis, user)
+
+        tx = await service.request_withdrawal("user-1", 50_000, CryptoType.USDT, "T" + "a" * 33)
+
+        _, keys, args = redis.script_calls[0]
+        assert keys[1] == "wallet:balance:user-1"
+        assert args[2:4] == [50_000, "debit"]
+        payload = json.loads(args[5])
+        assert payload["status"] == "pending"
+        assert payload["crypto_type"] == "usdt"
+        assert payload["crypto_address"] == "T" + "a" * 33
+        assert (tx.krw_balance_before, tx.krw_balance_after) == (1_000_000, 950_000)
+        assert user.krw_balance == 0
+        assert user.pending_withdrawal_krw == 50_000
+        service.session.add.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_withdrawal_insufficient_authoritative_balance(self):
+        redis = FakeRedis()
+        redis.script_results = [[0, -1, -1, b"INSUFFICIENT_BALANCE: Current=10000, Required=50000"]]
+        # DB 잔액은 충분해 보여도 권위 잔액 기준으로 거절
+        user = SimpleNamespace(id="user-1", krw_balance=1_000_000, pending_withdrawal_krw=0)
+        service = hot_withdrawal_service(redis, user)
+
+        with pytest.raises(crypto_withdrawal.InsufficientBalanceError):
+            await service.request_withdrawal("user-1", 50_000, CryptoType.USDT, "T" + "a" * 33)
+
+    @pytest.mark.asyncio
+    async def test_cancel_refunds_through_lua(self):
+        redis = FakeRedis()
+        redis.script_results = [[1, 1_000_000, -1, b"OK"]]
+        user = SimpleNamespace(id="user-1", krw_balance=0, pending_withdrawal_krw=50_000)
+        pending = SimpleNamespace(
+            user_id="user-1",
+            status=TransactionStatus.PENDING,
+            krw_amount=-50_000,
+            description="Withdrawal request",
+        )
+        service = hot_withdrawal_service(redis, user)
+        service.session.get = AsyncMock(side_effect=[pending, user])
+
+        await service.cancel_withdrawal("user-1", "tx-1")
+
+        _, _, args = redis.script_calls[0]
+        assert args[2:4] == [50_000, "credit"]
+        assert pending.status == TransactionStatus.CANCELLED
+        assert (user.krw_balance, user.pending_withdrawal_krw) == (0, 0)
+
+    @pytest.mark.asyncio
+    async def test_duplicate_deposit_webhook_credits_once(self):
+        redis = FakeRedis()
+        redis.script_results = [[1, 130_000, -1, b"OK"]]
+        address = SimpleNamespace(user_id="user-1", total_deposits=0, last_deposit_at=None)
+        lookup = MagicMock()
+        lookup.scalar_one_or_none.return_value = address
+        session = MagicMock()
+        session.execute = AsyncMock(return_value=lookup)
+        session.get = AsyncMock(return_value=SimpleNamespace(krw_balance=0))
+        session.flush = AsyncMock()
+        service = CryptoDepositService(session)
+        service._redis = redis
+        service._wallet = WalletService(session, hot_path=True)
+        service._wallet._redis = redis
+        service._exchange = MagicMock()
+        service._exchange.convert_crypto_to_krw = AsyncMock(return_value=(130_000, 1300))
+        # 저널 기록기가 아직 거래 행을 저장하지 않은 상태
+        service._check_processed = AsyncMock(return_value=None)
+
+        webhook = dict(
+            crypto_type=CryptoType.USDT,
+            tx_hash="0xabc",
+            address="T" + "a" * 33,
+            amount="100",
+            confirmations=25,
+        )
+        tx = await service.handle_deposit_webhook(**webhook)
+        duplicate = await service.handle_deposit_webhook(**webhook)
+
+        assert len(redis.script_calls) == 1
+        assert tx.krw_balance_after == 130_000
+        assert duplicate is None
+        assert address.total_deposits == 1
+        session.add.assert_not_called()
+
+
+def journal_entry(entry_id, tx_id, user_id, amount, before, tx_type="buy_in", **extra):
+    payload = {
+        "id": tx_id,
+        "user_id": user_id,
+        "tx_type": tx_type,
+        "amount": amount,
+        "table_id": None,
+        "hand_id": None,
+        "description": None,
+        "created_at": "2026-10-18T12:00:00+00:00",
+        **extra,
+    }
+    return (
+        entry_id,
+        {b"tx": json.dumps(payload).encode(), b"before": str(before).encode(), b"after": str(before + amount).encode()},
+    )
+
+
+class TestJournalWriter:
+    @pytest.mark.asyncio
+    async def test_apply_is_idempotent_and_acks_with_pending(self):
+        redis = FakeRedis()
+        redis.hashes["wallet:pending"] = {"u-a": -315, "u-b": -100}
+        session = MagicMock()
+        insert_result = MagicMock()
+        # tx-2는 이전 시도에서 이미 기록됨
+        insert_result.scalars.return_value.all.return_value = ["tx-1", "tx-3"]
+        session.execute = AsyncMock(return_value=insert_result)
+        session.commit = AsyncMock()
+        factory = MagicMock()
+        factory.return_value.__aenter__ = AsyncMock(return_value=session)
+        factory.return_value.__aexit__ = AsyncMock(return_value=False)
+        writer = WalletJournalWriter(redis, factory)
+
+        entries = [
+            journal_entry(b"1-0", "tx-1", "u-a", -300, 1000),
+            journal_entry(b"1-1", "tx-2", "u-b", -100, 500),
+            journal_entry(b"1-2", "tx-3", "u-a", -15, 700, tx_type="rake"),
+        ]
+        await writer.apply(entries)
+
+        insert_stmt = session.execute.call_args_list[0].args[0]
+        assert "ON CONFLICT (id) DO NOTHING" in str(
+            insert_stmt.compile(dialect=postgresql.dialect())
+        )
+        update_params = session.execute.call_args_list[1].args[1]
+        assert update_params == [{"b_id": "u-a", "b_delta": -315, "b_rake": 15}]
+        session.commit.assert_awaited_once()
+
+        # 모든 엔트리의 pending 차감 + ACK (중복 엔트리 포함)
+        assert redis.hashes["wallet:pending"] == {"u-a": 0, "u-b": 0}
+        assert redis.acked == [("wallet:journal", JOURNAL_GROUP, (b"1-0", b"1-1", b"1-2"))]
+        assert redis.deleted == [b"1-0", b"1-1", b"1-2"]
+
+
+    @pytest.mark.asyncio
+    async def test_apply_keeps_withdrawal_status_and_crypto_fields(self):
+        redis = FakeRedis()
+        session = MagicMock()
+        insert_result = MagicMock()
+        insert_result.scalars.return_value.all.return_value = ["tx-w"]
+        session.execute = AsyncMock(return_value=insert_result)
+        session.commit = AsyncMock()
+        factory = MagicMock()
+        factory.return_value.__aenter__ = AsyncMock(return_value=session)
+        factory.return_value.__aexit__ = AsyncMock(return_value=False)
+        writer = WalletJournalWriter(redis, factory)
+
+        await writer.apply([
+            journal_entry(
+                b"1-0", "tx-w", "u-a", -50_000, 100_000, tx_type="crypto_withdrawal",
+                status="pending", crypto_type="usdt", crypto_amount="38.46",
+                crypto_tx_hash=None, crypto_address="T" + "a" * 33, exchange_rate_krw=1300,
+                withdrawal_requested_at="2026-10-18T12:00:00",
+            ),
+        ])
+
+        params = session.execute.call_args_list[0].args[0].compile(
+            dialect=postgresql.dialect()
+        ).params
+        assert params["status_m0"] == TransactionStatus.PENDING
+        assert params["crypto_type_m0"] == CryptoType.USDT
+        assert params["exchange_rate_krw_m0"] == 1300
+
+
+class TestReconciliation:
+    @pytest.mark.asyncio
+    async def test_reports_only_persistent_drift(self):
+        redis = FakeRedis()
+        redis.values = {
+            "wallet:balance:u-ok": 700,
+            "wallet:balance:u-lag": 500,
+            "wallet:balance:u-bad": 900,
+        }
+        redis.hashes["wallet:pending"] = {"u-ok": -300, "u-lag": -500}
+
+        first = MagicMock()
+        first.all.return_value = [("u-ok", 1000), ("u-lag", 500), ("u-bad", 1000)]
+        second = MagicMock()
+        # u-lag: 기록기가 커밋한 직후 (pending 차감 전) → 두 번째 확인에서 해소
+        second.all.return_value = [("u-lag", 1000), ("u-bad", 1000)]
+        session = MagicMock()
+        session.execute = AsyncMock(side_effect=[first, second])
+
+        async def settle_lag(_):
+            redis.hashes["wallet:pending"]["u-lag"] = 0
+            second.all.return_value = [("u-lag", 500), ("u-bad", 1000)]
+
+        with patch("app.services.wallet_journal.asyncio.sleep", settle_lag):
+            drifts = await reconcile_balances(redis, session)
+
+        assert [(d.user_id, d.drift) for d in drifts] == [("u-bad", -100)]
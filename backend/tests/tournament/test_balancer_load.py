@@ -0,0 +1,303 @@
+"""
+TableBalancer 최소 이동 / 대규모 부하 테스트.
+
+테스트 범위:
+─────────────────────────────────────────────────────────────────────────────────
+
+1. 최소 이동 수 보장 (Σ max(0, 현재 - 목표))
+2. 블라인드 공정성 (다음 BB 플레이어 이동, BB 우선 좌석 배정)
+3. 핸드 진행 중 테이블 처리
+4. 테이블 인원 변경 시에만 재계산 (plan 캐시)
+5. 10,000명 / 1,200 테이블 스트레스 벤치마크
+
+─────────────────────────────────────────────────────────────────────────────────
+"""
+
+import random
+import time
+from dataclasses import replace
+from typing import Dict, List, Optional
+
+import pytest
+
+from app.tournament.balancer import TableBalancer
+from app.tournament.models import (
+    TournamentConfig,
+    TournamentPlayer,
+    TournamentState,
+    TournamentTable,
+)
+
+
+def build_state(
+    counts: List[int],
+    max_seats: int = 9,
+    hand_in_progress: Optional[List[bool]] = None,
+    button_positions: Optional[List[Optional[int]]] = None,
+) -> TournamentState:
+    """테이블별 인원 목록으로 토너먼트 상태 생성."""
+    tables: Dict[str, TournamentTable] = {}
+    players: Dict[str, TournamentPlayer] = {}
+
+    for t, count in enumerate(counts):
+        table_id = f"table_{t}"
+        seats: List[Optional[str]] = [None] * max_seats
+        for s in range(count):
+            user_id = f"user_{t}_{s}"
+            seats[s] = user_id
+            players[user_id] = TournamentPlayer(
+                user_id=user_id,
+                nickname=f"P{t}_{s}",
+                chip_count=10000,
+                table_id=table_id,
+                seat_position=s,
+            )
+        tables[table_id] = TournamentTable(
+            table_id=table_id,
+            table_number=t + 1,
+            seats=tuple(seats),
+            max_seats=max_seats,
+            hand_in_progress=hand_in_progress[t] if hand_in_progress else False,
+            button_position=button_positions[t] if button_positions else None,
+        )
+
+    return TournamentState(
+        tournament_id="t_balance",
+        config=TournamentConfig(),
+        players=players,
+        tables=tables,
+    )
+
+
+def minimum_moves(counts: List[int]) -> int:
+    """이론적 최소 이동 수."""
+    ordered = sorted(counts, reverse=True)
+    base, remainder = divmod(sum(counts), len(counts))
+    return sum(
+        max(0, c - (base + (1 if i < remainder else 0)))
+        for i, c in enumerate(ordered)
+    )
+
+
+def apply_moves(state: TournamentState, plan) -> Dict[str, int]:
+    counts = {tid: t.player_count for tid, t in state.tables.items()}
+    for move in plan.moves:
+        counts[move.from_table_id] -= 1
+        counts[move.to_table_id] += 1
+    return counts
+
+
+class TestMinimumMoves:
+    """최소 이동 계산 테스트."""
+
+    def test_single_move_when_off_by_two(self):
+        balancer = TableBalancer()
+        state = build_state([9, 7, 8])
+
+        plan = balancer.calculate_balancing_plan(state)
+
+        assert plan.total_moves == 1
+        assert plan.moves[0].from_table_id == "table_0"
+        assert plan.moves[0].to_table_id == "table_1"
+
+    def test_extra_seat_goes_to_fuller_table(self):
+        """+1 목표는 인원이 많은 테이블에 배정되어 불필요한 이동이 없다."""
+        balancer = TableBalancer()
+        # 총 22명 / 3테이블 → 목표 (8, 7, 7), 최소 이동은 1
+        state = build_state([6, 7, 9])
+
+        plan = balancer.calculate_balancing_plan(state)
+
+        assert plan.total_moves == minimum_moves([6, 7, 9]) == 1
+        final = apply_moves(state, plan)
+        assert max(final.values()) - min(final.values()) <= 1
+
+    def test_random_layouts_are_minimal(self):
+        balancer = TableBalancer()
+        rng = random.Random(42)
+
+        for _ in range(200):
+            num_tables = rng.randint(2, 30)
+            counts = [rng.randint(2, 9) for _ in range(num_tables)]
+            if sum(counts) <= balancer.final_table_size:
+                continue
+            state = build_state(counts)
+
+            plan = balancer.calculate_balancing_plan(state)
+
+            if max(counts) - min(counts) <= 1:
+                assert plan.total_moves == 0
+                continue
+            assert plan.total_moves == minimum_moves(counts)
+            final = apply_moves(state, plan)
+            assert max(final.values()) - min(final.values()) <= 1
+
+            # 동일 좌석/플레이어 중복 배정 없음
+            assert len({m.user_id for m in plan.moves}) == plan.total_moves
+            assert len({(m.to_table_id, m.to_seat) for m in plan.moves}) == (
+                plan.total_moves
+            )
+
+    def test_hand_in_progress_table_keeps_extra_seat(self):
+        """동률일 때 핸드 진행 중인 테이블이 +1 목표를 가져간다."""
+        balancer = TableBalancer()
+        # 총 19명 / 3테이블 → 목표 (7, 6, 6). +1은 핸드 진행 중인 table_1.
+        state = build_state([8, 8, 3], hand_in_progress=[False, True, False])
+
+        plan = balancer.calculate_balancing_plan(state)
+
+        sources = [m.from_table_id for m in plan.moves]
+        assert plan.total_moves == 3
+        assert sources.count("table_0") == 2
+        assert sources.count("table_1") == 1
+        assert all(
+            m.execute_after_hand == (m.from_table_id == "table_1")
+            for m in plan.moves
+        )
+
+    def test_table_break_fills_distinct_seats(self):
+        balancer = TableBalancer()
+        state = build_state([1, 6, 7, 5])
+
+        plan = balancer.calculate_balancing_plan(state)
+
+        assert plan.tables_to_break == ["table_0"]
+        assert plan.total_moves == 1
+        assert plan.moves[0].to_table_id == "table_3"
+
+
+class TestBlindFairness:
+    """블라인드 공정성 테스트."""
+
+    def test_moves_next_big_blind_player(self):
+        balancer = TableBalancer()
+        # table_0: 버튼 seat 0 → 다음 버튼 1, SB 2, BB 3
+        state = build_state([9, 7, 8], button_positions=[0, None, None])
+
+        plan = balancer.calculate_balancing_plan(state)
+
+        assert plan.moves[0].user_id == "user_0_3"
+        assert plan.moves[0].from_seat == 3
+
+    def test_destination_seat_posts_big_blind_first(self):
+        balancer = TableBalancer()
+        table = TournamentTable(
+            table_id="dest",
+            seats=("a", None, "b", "c", None, "d", None, None, None),
+            button_position=0,
+        )
+        # 다음 버튼 seat 2, SB seat 3 → SB 바로 뒤 빈 좌석(4)이 다음 BB
+        assert balancer._select_destination_seat(table) == 4
+        # 버튼과 다음 버튼 사이 좌석(1)은 블라인드 없이 참여 가능하므로 마지막
+        assert balancer._seats_in_fill_order(table)[-1] == 1
+
+    def test_without_button_falls_back_to_lowest_seat(self):
+        balancer = TableBalancer()
+        table = TournamentTable(
+            table_id="dest", seats=("a", None, "b") + (None,) * 6
+        )
+        assert balancer._select_destination_seat(table) == 1
+
+
+class TestPlanCache:
+    """테이블 인원 변경 시에만 재계산."""
+
+    def test_plan_reused_until_counts_change(self):
+        balancer = TableBalancer()
+        state = build_state([9, 6, 8])
+
+        first = balancer.get_plan(state)
+        assert balancer.get_plan(state) is first
+
+        moved = state.tables["table_0"].with_player_removed("user_0_8")
+        new_tables = dict(state.tables)
+        new_tables["table_0"] = moved
+        changed = TournamentState(
+            tournament_id=state.tournament_id,
+            config=state.config,
+            players=state.players,
+            tables=new_tables,
+        )
+
+        second = balancer.get_plan(changed)
+        assert second is not first
+
+    def test_plan_recomputed_on_button_or_hand_change(self):
+        balancer = TableBalancer()
+        state = build_state([9, 6, 8])
+        first = balancer.get_plan(state)
+
+        for changes in ({"button_position": 3}, {"hand_in_progress": True}):
+            new_tables = dict(state.tables)
+            new_tables["table_1"] = replace(state.tables["table_1"], **changes)
+            changed = TournamentState(
+                tournament_id=state.tournament_id,
+                config=state.config,
+                players=state.players,
+                tables=new_tables,
+            )
+            assert balancer.get_plan(changed) is not first
+
+    def test_invalidate(self):
+        balancer = TableBalancer()
+        state = build_state([9, 6, 8])
+
+        first = balancer.get_plan(state)
+        balancer.invalidate(state.tournament_id)
+        assert balancer.get_plan(state) is not first
+
+
+class TestLargeFieldStress:
+    """10,000명 / 1,200 테이블 스트레스 벤치마크."""
+
+    NUM_PLAYERS = 10_000
+    NUM_TABLES = 1_200
+
+    @pytest.fixture
+    def large_state(self) -> TournamentState:
+        rng = random.Random(7)
+        counts = [self.NUM_PLAYERS // self.NUM_TABLES] * self.NUM_TABLES
+        for i in range(self.NUM_PLAYERS % self.NUM_TABLES):
+            counts[i] += 1
+        # 탈락으로 불균형 발생: 무작위 테이블에서 인원 이동
+        for _ in range(1_500):
+            src = rng.randrange(self.NUM_TABLES)
+            dst = rng.randrange(self.NUM_TABLES)
+            if counts[src] > 3 and counts[dst] < 9:
+                counts[src] -= 1
+                counts[dst] += 1
+        return build_state(
+            counts,
+            hand_in_progress=[rng.random() < 0.5 for _ in counts],
+            button_positions=[rng.randrange(9) for _ in counts],
+        )
+
+    def test_plan_under_budget(self, large_state):
+        balancer = TableBalancer()
+        counts = [t.player_count for t in large_state.tables.values()]
+
+        start = time.perf_counter()
+        plan = balancer.calculate_balancing_plan(large_state)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        print(
+            f"\n[Balancer] {self.NUM_PLAYERS} players / {self.NUM_TABLES} tables: "
+            f"{plan.total_moves} moves in {elapsed_ms:.1f}ms"
+        )
+
+        assert plan.total_moves == minimum_moves(counts)
+        final = apply_moves(large_state, plan)
+        assert max(final.values()) - min(final.values()) <= 1
+        assert elapsed_ms < 500
+
+    def test_unchanged_tournament_skips_recompute(self, large_state):
+        balancer = TableBalancer()
+        balancer.get_plan(large_state)
+
+        start = time.perf_counter()
+        for _ in range(100):
+            balancer.get_plan(large_state)
+        per_tick_ms = (time.perf_counter() - start) * 1000 / 100
+
+        print(f"\n[Balancer] cached tick: {per_tick_ms:.3f}ms")
+        assert per_tick_ms < 20
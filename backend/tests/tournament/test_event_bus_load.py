@@ -0,0 +1,310 @@
+"""
+TournamentEventBus 처리량 / 배치 소비 테스트.
+
+테스트 범위:
+─────────────────────────────────────────────────────────────────────────────────
+
+1. publish()가 로컬 핸들러를 기다리지 않고 반환
+2. 배치 핸들러 병합 (틱당 한 번 호출)
+3. 토너먼트별 스트림 파티션 + 레지스트리 등록
+4. XREADGROUP 배치 소비 + 스트림별 배치 XACK
+5. 초당 10,000+ 이벤트 처리량 벤치마크
+
+─────────────────────────────────────────────────────────────────────────────────
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, List
+
+import pytest
+
+from app.tournament.event_bus import TournamentEventBus
+from app.tournament.models import TournamentEvent, TournamentEventType
+
+
+class StreamMockRedis:
+    """In-memory Redis with the stream commands used by the event bus."""
+
+    def __init__(self):
+        self.streams: Dict[str, List[tuple]] = {}
+        self.sets: Dict[str, set] = {}
+        self.acked: List[tuple] = []
+        self.expires: Dict[str, int] = {}
+        self.pending_reads: List[Any] = []
+        self._seq = 0
+
+    async def xadd(self, stream, data, maxlen=None, approximate=False):
+        self._seq += 1
+        entry_id = f"0-{self._seq}"
+        self.streams.setdefault(stream, []).append((entry_id, data))
+        return entry_id
+
+    async def sadd(self, key, *members):
+        self.sets.setdefault(key, set()).update(members)
+
+    async def srem(self, key, *members):
+        self.sets.get(key, set()).difference_update(members)
+
+    async def expire(self, key, seconds):
+        self.expires[key] = seconds
+
+    async def smembers(self, key):
+        return set(self.sets.get(key, set()))
+
+    async def xgroup_create(self, stream, group, id="0", mkstream=False):
+        pass
+
+    async def xreadgroup(self, groupname, consumername, streams, count=None, block=None):
+        if self.pending_reads:
+            return self.pending_reads.pop(0)
+        await asyncio.sleep(0.01)
+        return []
+
+    async def xack(self, stream, group, *ids):
+        self.acked.append((stream, ids))
+
+    def pipeline(self, transaction=False):
+        return StreamMockPipeline(self)
+
+
+class StreamMockPipeline:
+    def __init__(self, redis):
+        self._redis = redis
+        self._commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+    def xadd(self, stream, data, maxlen=None, approximate=False):
+        self._commands.append(("xadd", stream, data))
+        return self
+
+    def sadd(self, key, *members):
+        self._commands.append(("sadd", key, members))
+        return self
+
+    def srem(self, key, *members):
+        self._commands.append(("srem", key, members))
+        return self
+
+    def expire(self, key, seconds):
+        self._commands.append(("expire", key, seconds))
+        return self
+
+    async def execute(self):
+        for cmd in self._commands:
+            if cmd[0] == "xadd":
+                await self._redis.xadd(cmd[1], cmd[2])
+            elif cmd[0] == "expire":
+                await self._redis.expire(cmd[1], cmd[2])
+            else:
+                await getattr(self._redis, cmd[0])(cmd[1], *cmd[2])
+        return [True] * len(self._commands)
+
+
+def make_event(tournament_id: str = "t1", i: int = 0) -> TournamentEvent:
+    return TournamentEvent(
+        event_type=TournamentEventType.RANKING_UPDATED,
+        tournament_id=tournament_id,
+        data={"seq": i},
+    )
+
+
+@pytest.fixture
+async def bus():
+    event_bus = TournamentEventBus(StreamMockRedis(), instance_id="test")
+    await event_bus.initialize()
+    yield event_bus
+    await event_bus.shutdown()
+
+
+class TestDecoupledDispatch:
+    @pytest.mark.asyncio
+    async def test_publish_does_not_wait_for_handlers(self, bus):
+        release = asyncio.Event()
+        received = []
+
+        async def slow_handler(event):
+            await release.wait()
+            received.append(event)
+
+        bus.subscribe({TournamentEventType.RANKING_UPDATED}, slow_handler)
+
+        await asyncio.wait_for(bus.publish(make_event()), timeout=0.5)
+        assert received == []
+
+        release.set()
+        await bus.drain()
+        assert len(received) == 1
+
+    @pytest.mark.asyncio
+    async def test_publish_dispatches_inline_before_initialize(self):
+        event_bus = TournamentEventBus(StreamMockRedis())
+        received = []
+
+        async def handler(event):
+            received.append(event)
+
+        event_bus.subscribe({TournamentEventType.RANKING_UPDATED}, handler)
+        await event_bus.publish(make_event())
+
+        assert len(received) == 1
+
+    @pytest.mark.asyncio
+    async def test_batch_handler_coalesces_events(self, bus):
+        batches: List[List[TournamentEvent]] = []
+
+        async def on_ranking(events):
+            batches.append(events)
+
+        bus.subscribe(
+            {TournamentEventType.RANKING_UPDATED}, on_ranking, batch=True
+        )
+
+        for i in range(50):
+            await bus.publish(make_event(i=i))
+        await bus.drain()
+
+        assert sum(len(b) for b in batches) == 50
+        assert len(batches) < 50
+        ordered = [e.data["seq"] for b in batches for e in b]
+        assert ordered == list(range(50))
+
+    @pytest.mark.asyncio
+    async def test_local_handlers_do_not_receive_stream_events(self, bus):
+        local, distributed = [], []
+
+        async def on_local(event):
+            local.append(event)
+
+        async def on_distributed(event):
+            distributed.append(event)
+
+        bus.subscribe({TournamentEventType.RANKING_UPDATED}, on_local)
+        bus.subscribe(
+            {TournamentEventType.RANKING_UPDATED}, on_distributed, distributed=True
+        )
+
+        event = make_event()
+        await bus._dispatch_distributed([event])
+        assert local == [] and distributed == [event]
+
+
+class TestStreamPartitioning:
+    @pytest.mark.asyncio
+    async def test_events_partitioned_per_tournament(self, bus):
+        await bus.publish(make_event("t1"))
+        await bus.publish(make_event("t2"))
+        await asyncio.sleep(0.2)  # batch publisher window
+
+        redis_client = bus.redis
+        assert set(redis_client.streams) == {
+            "tournament:events:t1",
+            "tournament:events:t2",
+        }
+        assert redis_client.sets[bus.STREAM_REGISTRY_KEY] == {
+            "tournament:events:t1",
+            "tournament:events:t2",
+        }
+
+    @pytest.mark.asyncio
+    async def test_retired_stream_unregistered_and_expired(self, bus):
+        await bus.publish(make_event("t1"))
+        await bus.publish(make_event("t2"))
+        await asyncio.sleep(0.2)
+        await bus._refresh_consumer_streams()
+
+        await bus.retire_stream("t1")
+        # 종료 직후 발행된 마지막 이벤트도 다시 등록하지 않음
+        await bus.publish(make_event("t1", 1))
+        await asyncio.sleep(0.2)
+
+        redis_client = bus.redis
+        assert redis_client.sets[bus.STREAM_REGISTRY_KEY] == {"tournament:events:t2"}
+        assert redis_client.expires == {"tournament:events:t1": bus.STREAM_RETIRE_TTL}
+        assert len(redis_client.streams["tournament:events:t1"]) == 2
+        assert bus._consumer_streams == {"tournament:events:t2"}
+
+    @pytest.mark.asyncio
+    async def test_refresh_drops_streams_retired_elsewhere(self, bus):
+        bus.redis.sets[bus.STREAM_REGISTRY_KEY] = {
+            "tournament:events:t1",
+            "tournament:events:t2",
+        }
+        await bus._refresh_consumer_streams()
+
+        bus.redis.sets[bus.STREAM_REGISTRY_KEY].discard("tournament:events:t1")
+        await bus._refresh_consumer_streams()
+
+        assert bus._consumer_streams == {"tournament:events:t2"}
+
+    @pytest.mark.asyncio
+    async def test_consumer_acks_batch_once_per_stream(self, bus):
+        received = []
+
+        async def handler(events):
+            received.extend(events)
+
+        bus.subscribe(
+            {TournamentEventType.RANKING_UPDATED},
+            handler,
+            batch=True,
+            distributed=True,
+        )
+        bus._consumer_streams.add("tournament:events:t1")
+
+        messages = [
+            (f"0-{i}", TournamentEventBus._encode(make_event(i=i)))
+            for i in range(20)
+        ]
+        bus.redis.pending_reads.append([("tournament:events:t1", messages)])
+
+        for _ in range(50):
+            if bus.redis.acked:
+                break
+            await asyncio.sleep(0.01)
+
+        assert len(received) == 20
+        assert bus.redis.acked == [
+            ("tournament:events:t1", tuple(f"0-{i}" for i in range(20)))
+        ]
+
+
+class TestThroughput:
+    """초당 10,000+ 이벤트 처리량 벤치마크."""
+
+    NUM_EVENTS = 50_000
+
+    @pytest.mark.asyncio
+    async def test_local_publish_throughput(self, bus):
+        handled = 0
+
+        async def handler(event):
+            nonlocal handled
+            handled += 1
+
+        async def batch_handler(events):
+            pass
+
+        bus.subscribe({TournamentEventType.RANKING_UPDATED}, handler)
+        bus.subscribe(
+            {TournamentEventType.RANKING_UPDATED}, batch_handler, batch=True
+        )
+
+        events = [make_event(f"t{i % 20}", i) for i in range(self.NUM_EVENTS)]
+
+        start = time.perf_counter()
+        for event in events:
+            await bus.publish(event)
+        await bus.drain()
+        elapsed = time.perf_counter() - start
+
+        rate = self.NUM_EVENTS / elapsed
+        print(f"\n[EventBus] {self.NUM_EVENTS} events in {elapsed:.2f}s = {rate:,.0f}/s")
+
+        assert handled == self.NUM_EVENTS
+        assert rate > 10_000
@@ -0,0 +1,386 @@
+"""
+Sharded tournament execution tests.
+
+테스트 범위:
+1. Rendezvous Hashing 테이블 소유권 (분할, 안정성)
+2. 워커: 소유 테이블만 처리, 샤드 스트림 기록
+3. 코디네이터: 여러 샤드 결과를 단일 상태로 집계 (멱등)
+4. 재시작: pending 재처리, entry ID 기반 중복 제거, 워커 상태 동기화
+5. 이벤트 발행 실패 시 적용 위치를 저장하지 않고 재발행
+6. 런타임: 코디네이터 시작, 핸드 결과 전달, 워커 스냅샷 동기화
+"""
+
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.tournament.engine import TournamentEngine
+from app.tournament.models import (
+    TournamentConfig,
+    TournamentPlayer,
+    TournamentState,
+    TournamentStatus,
+    TournamentTable,
+)
+from app.tournament.sharding import (
+    ShardAssignment,
+    TableNotOwnedError,
+    TableShardWorker,
+    TournamentShardCoordinator,
+    TournamentShardRuntime,
+    shard_applied_key,
+    shard_stream_key,
+)
+
+
+class StreamRedis:
+    """Minimal Redis stand-in: XADD, single-group XREADGROUP/XACK, GET/SET."""
+
+    def __init__(self):
+        self.streams = {}
+        self.values = {}
+        self.pending = {}  # consumer -> [(entry_id, data)]
+        self._delivered = 0
+        self._seq = 0
+
+    async def xadd(self, stream, data, maxlen=None, approximate=False):
+        self._seq += 1
+        entry_id = f"{int(datetime.utcnow().timestamp() * 1000)}-{self._seq}"
+        self.streams.setdefault(stream, []).append((entry_id, dict(data)))
+        return entry_id
+
+    async def xgroup_create(self, stream, group, id="0", mkstream=False):
+        pass
+
+    async def xreadgroup(self, groupname, consumername, streams, count=None, block=None):
+        (stream, read_id), = streams.items()
+        pending = self.pending.setdefault(consumername, [])
+        if read_id == "0":
+            return [(stream, list(pending))]
+        new = self.streams.get(stream, [])[self._delivered :]
+        if not new:
+            await asyncio.sleep(0.01)
+            return []
+        self._delivered += len(new)
+        pending.extend(new)
+        return [(stream, new)]
+
+    async def xack(self, stream, group, *ids):
+        for consumer, entries in self.pending.items():
+            self.pending[consumer] = [e for e in entries if e[0] not in ids]
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def set(self, key, value):
+        self.values[key] = value
+
+
+def build_engine(num_tables: int = 4) -> TournamentEngine:
+    engine = TournamentEngine(StreamRedis())
+    engine.event_bus.publish = AsyncMock()
+    engine.event_bus.emit_player_eliminated = AsyncMock()
+    engine.ranking.update_batch = AsyncMock()
+    engine.snapshot.complete_hand = AsyncMock()
+
+    tables = {}
+    players = {}
+    for t in range(num_tables):
+        table_id = f"table_{t}"
+        seats = [f"u{t}_{s}" for s in range(6)] + [None] * 3
+        tables[table_id] = TournamentTable(
+            table_id=table_id, table_number=t + 1, seats=tuple(seats)
+        )
+        for s in range(6):
+            uid = f"u{t}_{s}"
+            players[uid] = TournamentPlayer(
+                user_id=uid,
+                nickname=uid,
+                chip_count=10000,
+                table_id=table_id,
+                seat_position=s,
+            )
+
+    engine.set_state("t1", TournamentState(
+        tournament_id="t1",
+        config=TournamentConfig(tournament_id="t1"),
+        status=TournamentStatus.RUNNING,
+        players=players,
+        tables=tables,
+    ))
+    return engine
+
+
+class TestShardAssignment:
+    def test_partition_covers_all_tables_once(self):
+        assignment = ShardAssignment(["w1", "w2", "w3"])
+        table_ids = [f"table_{i}" for i in range(300)]
+
+        parts = assignment.partition(table_ids)
+
+        assigned = [t for tables in parts.values() for t in tables]
+        assert sorted(assigned) == sorted(table_ids)
+        assert all(len(tables) > 50 for tables in parts.values())
+
+    def test_removing_worker_only_moves_its_tables(self):
+        before = ShardAssignment(["w1", "w2", "w3"])
+        after = ShardAssignment(["w1", "w2"])
+
+        for i in range(200):
+            table_id = f"table_{i}"
+            if before.owner_of(table_id) != "w3":
+                assert after.owner_of(table_id) == before.owner_of(table_id)
+
+    def test_empty_worker_list_rejected(self):
+        with pytest.raises(ValueError):
+            ShardAssignment([])
+
+
+class TestShardWorker:
+    @pytest.mark.asyncio
+    async def test_rejects_unowned_table(self):
+        redis_client = StreamRedis()
+        assignment = ShardAssignment(["w1", "w2"])
+        worker = TableShardWorker(redis_client, "w1", assignment)
+        foreign = next(
+            f"table_{i}"
+            for i in range(100)
+            if assignment.owner_of(f"table_{i}") == "w2"
+        )
+
+        with pytest.raises(TableNotOwnedError):
+            await worker.complete_hand("t1", foreign, [], {}, [])
+
+    @pytest.mark.asyncio
+    async def test_attach_filters_hand_starts(self):
+        engine = build_engine()
+        assignment = ShardAssignment(["w1", "w2"])
+        worker = TableShardWorker(engine.redis, "w1", assignment)
+        worker.attach(engine)
+
+        started = []
+
+        async def on_start(tid, table_id):
+            started.append(table_id)
+
+        engine._hand_started_callback = on_start
+        engine.lock_manager.lock = _noop_lock
+
+        for table_id in engine.get_state("t1").tables:
+            await engine._start_table_hand("t1", table_id)
+
+        assert started
+        assert all(assignment.owner_of(t) == "w1" for t in started)
+
+
+class TestShardCoordinator:
+    @pytest.mark.asyncio
+    async def test_aggregates_results_from_all_shards(self):
+        engine = build_engine()
+        assignment = ShardAssignment(["w1", "w2"])
+        workers = {
+            w: TableShardWorker(engine.redis, w, assignment) for w in ("w1", "w2")
+        }
+
+        for t in range(4):
+            table_id = f"table_{t}"
+            owner = workers[assignment.owner_of(table_id)]
+            await owner.complete_hand(
+                "t1",
+                table_id,
+                winners=[f"u{t}_0"],
+                chip_changes={f"u{t}_0": 20000, f"u{t}_1": 0},
+                eliminated=[f"u{t}_1"],
+                button_position=2,
+            )
+
+        coordinator = TournamentShardCoordinator(engine, "t1")
+        messages = engine.redis.streams[shard_stream_key("t1")]
+        applied = await coordinator.apply_entries(messages)
+
+        state = engine.get_state("t1")
+        assert applied == 4
+        assert state.active_player_count == 20
+        ranks = sorted(
+            p.elimination_rank for p in state.players.values() if not p.is_active
+        )
+        assert ranks == [21, 22, 23, 24]
+        assert all(t.player_count == 5 for t in state.tables.values())
+        assert all(t.button_position == 2 for t in state.tables.values())
+        assert engine.event_bus.emit_player_eliminated.await_count == 4
+
+        # Redelivery after a crash is idempotent
+        assert await coordinator.apply_entries(messages) == 0
+        assert engine.get_state("t1").active_player_count == 20
+        assert coordinator.get_metrics().duplicates_skipped == 4
+
+    @pytest.mark.asyncio
+    async def test_applied_position_survives_coordinator_restart(self):
+        engine = build_engine()
+        worker = TableShardWorker(engine.redis, "w1", ShardAssignment(["w1"]))
+        await worker.complete_hand("t1", "table_0", [], {"u0_0": 0}, ["u0_0"])
+        messages = engine.redis.streams[shard_stream_key("t1")]
+
+        assert await TournamentShardCoordinator(engine, "t1").apply_entries(messages) == 1
+
+        restarted = TournamentShardCoordinator(engine, "t1")
+        await restarted._load_last_applied()
+        assert await restarted.apply_entries(messages) == 0
+        assert engine.get_state("t1").active_player_count == 23
+
+    @pytest.mark.asyncio
+    async def test_restart_replays_unacked_entries(self):
+        engine = build_engine()
+        worker = TableShardWorker(engine.redis, "w1", ShardAssignment(["w1"]))
+        for t in range(2):
+            await worker.complete_hand(
+                "t1", f"table_{t}", [], {f"u{t}_0": 0}, [f"u{t}_0"]
+            )
+
+        # 이전 코디네이터가 읽은 뒤 XACK 전에 종료됨
+        stream_key = shard_stream_key("t1")
+        await engine.redis.xreadgroup(
+            TournamentShardCoordinator.CONSUMER_GROUP,
+            TournamentShardCoordinator.CONSUMER_NAME,
+            {stream_key: ">"},
+        )
+
+        coordinator = TournamentShardCoordinator(engine, "t1")
+        await coordinator.start()
+        for _ in range(100):
+            if coordinator.get_metrics().hands_applied == 2:
+                break
+            await asyncio.sleep(0.01)
+        await coordinator.stop()
+
+        assert engine.get_state("t1").active_player_count == 22
+        assert engine.redis.pending[coordinator.consumer_name] == []
+
+    @pytest.mark.asyncio
+    async def test_worker_starts_hands_from_coordinator_snapshot(self):
+        coordinator_engine = build_engine()
+        assignment = ShardAssignment(["w1", "w2"])
+        owner = TableShardWorker(coordinator_engine.redis, "w1", assignment)
+        table_id = next(
+            t for t in coordinator_engine.get_state("t1").tables if owner.owns(t)
+        )
+        await owner.complete_hand("t1", table_id, [], {}, [])
+        await TournamentShardCoordinator(coordinator_engine, "t1").apply_entries(
+            coordinator_engine.redis.streams[shard_stream_key("t1")]
+        )
+
+        # 워커 엔진은 집계 상태가 없음 → 스냅샷 로드 후 소유 테이블만 시작
+        worker_engine = TournamentEngine(coordinator_engine.redis)
+        worker_engine.event_bus.publish = AsyncMock()
+        worker_engine.lock_manager.lock = _noop_lock
+        started = []
+
+        async def on_start(tid, started_table):
+            started.append(started_table)
+
+        worker_engine._hand_started_callback = on_start
+        owner.attach(worker_engine)
+
+        state = await owner.sync_state(worker_engine, "t1")
+        for candidate in state.tables:
+            await worker_engine._start_table_hand("t1", candidate)
+
+        assert table_id in started
+        assert all(owner.owns(t) for t in started)
+
+
+    @pytest.mark.asyncio
+    async def test_publish_failure_keeps_entries_for_retry(self):
+        engine = build_engine()
+        worker = TableShardWorker(engine.redis, "w1", ShardAssignment(["w1"]))
+        for t in range(2):
+            await worker.complete_hand(
+                "t1", f"table_{t}", [], {f"u{t}_0": 0}, [f"u{t}_0"]
+            )
+        messages = engine.redis.streams[shard_stream_key("t1")]
+
+        published = []
+        original = engine.publish_hand_result
+
+        async def flaky_publish(state, table_id, *args):
+            if table_id == "table_1" and "failed" not in published:
+                published.append("failed")
+                raise ConnectionError("redis down")
+            published.append(table_id)
+            await original(state, table_id, *args)
+
+        engine.publish_hand_result = flaky_publish
+        coordinator = TournamentShardCoordinator(engine, "t1")
+
+        with pytest.raises(ConnectionError):
+            await coordinator.apply_entries(messages)
+        # 발행이 끝나지 않았으므로 적용 위치 미저장 (재시작 시 재적용)
+        assert engine.redis.values.get(shard_applied_key("t1")) is None
+
+        # 재전송된 항목은 상태에 다시 적용하지 않고 남은 이벤트만 발행
+        assert await coordinator.apply_entries(messages) == 0
+        assert published == ["table_0", "failed", "table_1"]
+        assert engine.get_state("t1").active_player_count == 22
+        assert engine.redis.values[shard_applied_key("t1")] == messages[-1][0]
+
+
+class TestShardRuntime:
+    @pytest.mark.asyncio
+    async def test_coordinator_instance_aggregates_forwarded_results(self):
+        engine = build_engine()
+        engine.lock_manager.lock = _noop_lock
+        runtime = TournamentShardRuntime(
+            engine, "w1", ["w1"], coordinator=True, sync_interval=60
+        )
+        await runtime.start()
+        try:
+            assert runtime.coordinated_tournaments == ["t1"]
+
+            # 핸드 결과는 로컬 적용 대신 샤드 스트림 → 코디네이터
+            await engine.complete_hand("t1", "table_0", [], {"u0_0": 0}, ["u0_0"])
+            assert len(engine.redis.streams[shard_stream_key("t1")]) == 1
+
+            for _ in range(100):
+                if engine.get_state("t1").active_player_count == 23:
+                    break
+                await asyncio.sleep(0.01)
+            assert engine.get_state("t1").active_player_count == 23
+        finally:
+            await runtime.stop()
+
+        assert runtime.coordinated_tournaments == []
+
+    @pytest.mark.asyncio
+    async def test_worker_instance_syncs_coordinator_snapshot(self):
+        coordinator_engine = build_engine()
+        await coordinator_engine.snapshot.save_full_snapshot(
+            coordinator_engine.get_state("t1")
+        )
+
+        worker_engine = TournamentEngine(coordinator_engine.redis)
+        worker_engine.snapshot.list_recoverable_tournaments = AsyncMock(
+            return_value=["t1"]
+        )
+        runtime = TournamentShardRuntime(
+            worker_engine, "w1", ["w1", "w2"], sync_interval=60
+        )
+        await runtime.start()
+        try:
+            assert worker_engine.get_state("t1") is not None
+            assert runtime.coordinated_tournaments == []
+        finally:
+            await runtime.stop()
+
+
+class _NoopLock:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+
+def _noop_lock(*args, **kwargs):
+    return _NoopLock()
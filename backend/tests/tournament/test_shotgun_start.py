@@ -0,0 +1,260 @@
+"""
+Shotgun start 병렬 시작 파이프라인 테스트.
+
+테스트 범위:
+─────────────────────────────────────────────────────────────────────────────────
+
+1. 테이블 배정 (라운드 로빈, 테이블당 1회 생성)
+2. 카운트다운 중 사전 준비 (동시성 제한)
+3. 목표 시각에 모든 테이블 동시 시작 (동시성 제한, 실패 집계)
+4. 1,000 테이블 start skew 벤치마크
+
+─────────────────────────────────────────────────────────────────────────────────
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.tournament.bridge import TournamentHandBridge
+from app.tournament.engine import ShotgunStartState, TournamentEngine
+from app.tournament.models import (
+    TournamentConfig,
+    TournamentPlayer,
+    TournamentState,
+    TournamentStatus,
+)
+
+
+class _NoopLock:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+
+def _noop_lock(*args, **kwargs):
+    return _NoopLock()
+
+
+def build_engine(num_players: int) -> TournamentEngine:
+    engine = TournamentEngine(AsyncMock())
+    engine.event_bus.publish = AsyncMock()
+    engine.lock_manager.lock = _noop_lock
+
+    players = {
+        f"u{i}": TournamentPlayer(user_id=f"u{i}", nickname=f"P{i}", chip_count=10000)
+        for i in range(num_players)
+    }
+    state = TournamentState(
+        tournament_id="t1",
+        config=TournamentConfig(tournament_id="t1"),
+        status=TournamentStatus.STARTING,
+        players=players,
+    )
+    tables = engine._create_tables_and_seat_players(state)
+    engine._tournaments["t1"] = TournamentState(
+        tournament_id="t1",
+        config=state.config,
+        status=TournamentStatus.STARTING,
+        players=players,
+        tables=tables,
+    )
+    engine._shotgun_states["t1"] = ShotgunStartState(
+        tournament_id="t1",
+        target_start_time=datetime.utcnow() + timedelta(milliseconds=50),
+        countdown_seconds=0,
+        registered_players=num_players,
+    )
+    return engine
+
+
+class TestTableAssignment:
+    def test_round_robin_balanced(self):
+        engine = build_engine(100)
+        tables = engine.get_state("t1").tables
+
+        counts = sorted(t.player_count for t in tables.values())
+        seated = [uid for t in tables.values() for uid in t.seats if uid]
+
+        assert len(tables) == 12
+        assert counts[-1] - counts[0] <= 1
+        assert sorted(seated) == sorted(f"u{i}" for i in range(100))
+
+
+class TestShotgunPipeline:
+    @pytest.mark.asyncio
+    async def test_prepares_during_countdown_then_starts_all(self):
+        engine = build_engine(90)
+        order = []
+
+        async def prepare(state, table_id):
+            order.append(("prepare", table_id))
+
+        async def on_start(tid, table_id):
+            order.append(("start", table_id))
+
+        engine.set_hand_prepare_callback(prepare)
+        engine._hand_started_callback = on_start
+
+        await engine._execute_shotgun_start("t1", 0)
+
+        phases = [phase for phase, _ in order]
+        assert phases == ["prepare"] * 10 + ["start"] * 10
+        assert engine.get_state("t1").status == TournamentStatus.RUNNING
+
+        metrics = engine.get_shotgun_metrics("t1")
+        assert metrics.table_count == 10
+        assert metrics.tables_prepared == 10
+        assert metrics.tables_started == 10
+        assert engine._shotgun_states["t1"].started
+
+    @pytest.mark.asyncio
+    async def test_start_concurrency_bounded(self):
+        engine = build_engine(900)
+        in_flight = 0
+        peak = 0
+
+        async def on_start(tid, table_id):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.001)
+            in_flight -= 1
+
+        engine._hand_started_callback = on_start
+
+        with patch("app.tournament.engine.SHOTGUN_START_CONCURRENCY", 8):
+            await engine._execute_shotgun_start("t1", 0)
+
+        assert engine.get_shotgun_metrics("t1").tables_started == 100
+        assert peak <= 8
+
+    @pytest.mark.asyncio
+    async def test_failed_table_does_not_block_others(self):
+        engine = build_engine(90)
+        failing = next(iter(engine.get_state("t1").tables))
+
+        async def on_start(tid, table_id):
+            if table_id == failing:
+                raise RuntimeError("boom")
+
+        engine._hand_started_callback = on_start
+
+        await engine._execute_shotgun_start("t1", 0)
+
+        metrics = engine.get_shotgun_metrics("t1")
+        assert metrics.tables_failed == 1
+        assert metrics.tables_started == 9
+
+    @pytest.mark.asyncio
+    async def test_cancelled_tournament_not_started(self):
+        engine = build_engine(18)
+        state = engine.get_state("t1")
+        engine._tournaments["t1"] = TournamentState(
+            tournament_id="t1",
+            config=state.config,
+            status=TournamentStatus.CANCELLED,
+            players=state.players,
+            tables=state.tables,
+        )
+        engine._hand_started_callback = AsyncMock()
+
+        await engine._execute_shotgun_start("t1", 0)
+
+        engine._hand_started_callback.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_tournament_discards_prepared(self):
+        engine = build_engine(18)
+        state = engine.get_state("t1")
+        discarded = []
+
+        async def prepare(state, table_id):
+            engine._tournaments["t1"] = TournamentState(
+                tournament_id="t1",
+                config=state.config,
+                status=TournamentStatus.CANCELLED,
+                players=state.players,
+                tables=state.tables,
+            )
+
+        engine.set_hand_prepare_callback(prepare, discard=discarded.extend)
+
+        await engine._execute_shotgun_start("t1", 0)
+
+        assert sorted(discarded) == sorted(state.tables)
+
+
+class TestHandBridge:
+    """TournamentHandBridge 사전 준비 연동."""
+
+    def _bridge(self, engine):
+        bridge = TournamentHandBridge(engine.snapshot, engine.event_bus)
+        bridge.snapshot.save_hand_snapshot = AsyncMock()
+        bridge.attach(engine)
+        return bridge
+
+    @pytest.mark.asyncio
+    async def test_attach_prepares_then_discards_unused(self):
+        engine = build_engine(18)
+        bridge = self._bridge(engine)
+        seen = {}
+
+        async def on_start(tid, table_id):
+            seen[table_id] = table_id in bridge._prepared_hands
+
+        engine._hand_started_callback = on_start
+
+        await engine._execute_shotgun_start("t1", 0)
+
+        assert engine.get_shotgun_metrics("t1").tables_prepared == 2
+        assert all(seen.values()) and len(seen) == 2
+        assert bridge._prepared_hands == {}
+
+    @pytest.mark.asyncio
+    async def test_start_hand_reuses_prepared_state(self):
+        engine = build_engine(18)
+        bridge = self._bridge(engine)
+        state = engine.get_state("t1")
+        table_id = next(iter(state.tables))
+
+        await bridge.prepare_hand(state, table_id)
+        prepared_hand_id = bridge._prepared_hands[table_id][1]
+
+        table_state, hand_id = await bridge.start_hand(state, table_id)
+
+        assert hand_id == prepared_hand_id
+        assert table_state.hand is not None
+        assert table_id not in bridge._prepared_hands
+
+
+class TestLargeFieldSkew:
+    """9,000명 / 1,000 테이블 start skew."""
+
+    NUM_PLAYERS = 9_000
+    TARGET_SKEW_MS = 500
+
+    @pytest.mark.asyncio
+    async def test_start_skew_under_target(self):
+        engine = build_engine(self.NUM_PLAYERS)
+
+        async def on_start(tid, table_id):
+            await asyncio.sleep(0.002)  # 핸드 시작 I/O
+
+        engine._hand_started_callback = on_start
+
+        await engine._execute_shotgun_start("t1", 0)
+
+        metrics = engine.get_shotgun_metrics("t1")
+        print(
+            f"\n[Shotgun] {metrics.table_count} tables: "
+            f"first={metrics.first_start_delay_ms:.1f}ms, "
+            f"skew={metrics.start_skew_ms:.1f}ms"
+        )
+
+        assert metrics.tables_started == 1_000
+        assert metrics.start_skew_ms < self.TARGET_SKEW_MS
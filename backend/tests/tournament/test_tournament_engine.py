@@ -305,6 +305,38 @@ class TestTournamentEngine:
         assert player.user_id == "user1"
         assert player.is_active is True
 
+    @pytest.mark.asyncio
+    async def test_completed_tournament_drops_balancing_plan(self, mock_redis):
+        from unittest.mock import AsyncMock
+
+        from app.tournament.engine import TournamentEngine
+        from app.tournament.models import (
+            TournamentConfig,
+            TournamentPlayer,
+            TournamentState,
+            TournamentStatus,
+        )
+
+        engine = TournamentEngine(mock_redis)
+        engine.event_bus.publish = AsyncMock()
+        engine.ranking.update_batch = AsyncMock()
+        engine.snapshot.complete_hand = AsyncMock()
+        engine.event_bus.retire_stream = AsyncMock()
+
+        state = TournamentState(
+            tournament_id="t1",
+            config=TournamentConfig(tournament_id="t1"),
+            status=TournamentStatus.COMPLETED,
+            players={"u1": TournamentPlayer(user_id="u1", nickname="P1")},
+        )
+        engine.balancer.get_plan(state)
+        assert "t1" in engine.balancer._plan_cache
+
+        await engine.publish_hand_result(state, "table_0", ["u1"], {"u1": 0}, [], [])
+
+        assert "t1" not in engine.balancer._plan_cache
+        engine.event_bus.retire_stream.assert_awaited_once_with("t1")
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
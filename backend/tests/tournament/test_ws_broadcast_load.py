@@ -0,0 +1,166 @@
+"""
+토너먼트 WebSocket 팬아웃 부하 테스트.
+
+테스트 범위:
+─────────────────────────────────────────────────────────────────────────────────
+
+1. 이벤트당 인코딩 1회 (구독자 수와 무관)
+2. 동시 배치 수 상한 준수
+3. 실패 연결 집계
+4. 10,000 클라이언트 블라인드 변경 burst latency 목표
+
+─────────────────────────────────────────────────────────────────────────────────
+"""
+
+import asyncio
+import json
+import time
+from typing import List
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.tournament.ws_handler import TournamentWebSocketHandler
+
+
+class FakeConnection:
+    """send_text만 기록하는 가상 연결."""
+
+    def __init__(self, connection_id: str, fail: bool = False, delay: float = 0.0):
+        self.connection_id = connection_id
+        self.received: List[str] = []
+        self.fail = fail
+        self.delay = delay
+
+    async def send_text(self, text: str) -> bool:
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.fail:
+            return False
+        self.received.append(text)
+        return True
+
+
+class FakeManager:
+    def __init__(self, connections):
+        self.connections = connections
+        self.publish_to_instances = AsyncMock()
+
+    def get_channel_connections(self, channel):
+        return list(self.connections)
+
+
+class TestEncodeOnceFanOut:
+    @pytest.mark.asyncio
+    async def test_message_encoded_once(self):
+        connections = [FakeConnection(f"c{i}") for i in range(500)]
+        handler = TournamentWebSocketHandler(FakeManager(connections))
+
+        with patch(
+            "app.tournament.ws_handler.json_dumps", wraps=json.dumps
+        ) as dumps:
+            sent = await handler.broadcast_blind_change("t1", 2, 50, 100, 0)
+
+        assert sent == 500
+        assert dumps.call_count == 1
+        assert all(c.received[0] is connections[0].received[0] for c in connections)
+        payload = json.loads(connections[0].received[0])
+        assert payload["payload"]["bigBlind"] == 100
+
+    @pytest.mark.asyncio
+    async def test_remote_instances_published_once(self):
+        manager = FakeManager([FakeConnection("c1")])
+        handler = TournamentWebSocketHandler(manager)
+
+        await handler.broadcast_shotgun_countdown("t1", 5, "2026-01-01T00:00:00")
+
+        manager.publish_to_instances.assert_awaited_once()
+        # 로컬 전송과 같은 인코딩 결과를 그대로 발행
+        published = manager.publish_to_instances.await_args.kwargs["text"]
+        assert published is manager.connections[0].received[0]
+
+    @pytest.mark.asyncio
+    async def test_remote_instance_sends_pre_encoded_text(self):
+        from app.ws.manager import ConnectionManager
+
+        sender = ConnectionManager(AsyncMock())
+        await sender.publish_to_instances("tournament:t1", {"type": "BLIND_CHANGE"})
+        envelope = sender.redis.publish.await_args.args[1]
+
+        receiver = ConnectionManager(AsyncMock())
+        conns = {handle: AsyncMock() for handle in range(1, 4)}
+        receiver._by_handle.update(conns)
+        receiver._channel_members["tournament:t1"] = set(conns)
+
+        await receiver._handle_pubsub_message(
+            {"channel": b"ws:pubsub:tournament:t1", "data": envelope.encode()}
+        )
+
+        for conn in conns.values():
+            conn.send_text.assert_awaited_once_with('{"type":"BLIND_CHANGE"}')
+            conn.send.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_concurrency_bounded(self):
+        in_flight = 0
+        peak = 0
+
+        class TrackingConnection(FakeConnection):
+            async def send_text(self, text):
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.001)
+                in_flight -= 1
+                return True
+
+        connections = [TrackingConnection(f"c{i}") for i in range(400)]
+        handler = TournamentWebSocketHandler(
+            FakeManager(connections), chunk_size=10, max_concurrent_chunks=4
+        )
+
+        assert await handler.broadcast_blind_change("t1", 2, 50, 100, 0) == 400
+        assert peak <= 40
+
+    @pytest.mark.asyncio
+    async def test_failures_counted(self):
+        connections = [FakeConnection(f"c{i}", fail=(i % 10 == 0)) for i in range(100)]
+        handler = TournamentWebSocketHandler(FakeManager(connections))
+
+        sent = await handler.broadcast_tournament_event("t1", "PLAYER_ELIMINATED", {})
+
+        metrics = handler.get_broadcast_metrics()
+        assert sent == 90
+        assert metrics.messages_failed == 10
+        assert metrics.last_recipients == 100
+
+    @pytest.mark.asyncio
+    async def test_no_subscribers(self):
+        handler = TournamentWebSocketHandler(FakeManager([]))
+        assert await handler.broadcast_blind_change("t1", 2, 50, 100, 0) == 0
+
+
+class TestLargeFieldBurst:
+    """10,000 클라이언트 블라인드 변경 burst latency."""
+
+    NUM_CLIENTS = 10_000
+    TARGET_BURST_MS = 1_000
+
+    @pytest.mark.asyncio
+    async def test_blind_change_reaches_10k_clients(self):
+        connections = [FakeConnection(f"c{i}") for i in range(self.NUM_CLIENTS)]
+        handler = TournamentWebSocketHandler(FakeManager(connections))
+
+        start = time.perf_counter()
+        sent = await handler.broadcast_blind_change("t1", 5, 150, 300, 25)
+        total_ms = (time.perf_counter() - start) * 1000
+
+        metrics = handler.get_broadcast_metrics()
+        print(
+            f"\n[Broadcast] {self.NUM_CLIENTS} clients: total={total_ms:.1f}ms, "
+            f"first={metrics.last_first_delivery_ms:.1f}ms, "
+            f"burst={metrics.last_burst_ms:.1f}ms"
+        )
+
+        assert sent == self.NUM_CLIENTS
+        assert metrics.last_burst_ms < self.TARGET_BURST_MS
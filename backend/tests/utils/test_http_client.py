@@ -0,0 +1,112 @@
+"""Tests for shared HTTP pool, upstream metrics and SWR cache."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from app.models.wallet import CryptoType
+from app.services.exchange_rate import ExchangeRateService
+from app.utils import http_client
+from app.utils.http_client import (
+    AsyncHttpClient,
+    SWRCache,
+    create_client,
+    get_upstream_stats,
+    rate_cache,
+)
+
+
+@pytest.fixture
+def mock_pool(monkeypatch):
+    """Replace the shared pool with a MockTransport."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/fail":
+            return httpx.Response(502)
+        return httpx.Response(200, json={"usd": {"krw": 1470.5}})
+
+    pool = httpx.MockTransport(handler)
+    monkeypatch.setattr(http_client, "_get_pool", lambda: pool)
+    monkeypatch.setattr(http_client, "_upstream_stats", {})
+    return pool
+
+
+@pytest.fixture(autouse=True)
+def clear_rate_cache():
+    rate_cache.clear()
+    yield
+    rate_cache.clear()
+
+
+class TestSharedPool:
+    @pytest.mark.asyncio
+    async def test_retry_client_uses_pool_and_records_metrics(self, mock_pool):
+        async with AsyncHttpClient() as client:
+            data = await client.get_json("https://cdn.example/rates")
+        plain = create_client()
+        await plain.get("https://cdn.example/fail")
+
+        stats = get_upstream_stats()["cdn.example"]
+
+        assert data["usd"]["krw"] == 1470.5
+        assert stats["requests"] == 2
+        assert stats["errors"] == 1
+        assert stats["last_error"] == "HTTP 502"
+
+    @pytest.mark.asyncio
+    async def test_closing_client_keeps_pool(self):
+        client = create_client()
+        pool = client._transport._pool
+        await client.aclose()
+
+        assert create_client()._transport._pool is pool
+        await http_client.close_http_pool()
+        assert http_client._pool is None
+
+
+class TestSWRCache:
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_load(self):
+        cache = SWRCache()
+        loader = AsyncMock(return_value=7)
+
+        results = await asyncio.gather(*(cache.get("k", loader, ttl=60) for _ in range(10)))
+
+        assert results == [7] * 10
+        assert loader.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_value_served_while_refreshing(self):
+        cache = SWRCache()
+        loader = AsyncMock(side_effect=[1, 2])
+
+        assert await cache.get("k", loader, ttl=0, stale_ttl=60) == 1
+        assert await cache.get("k", loader, ttl=0, stale_ttl=60) == 1
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert await cache.get("k", loader, ttl=60) == 2
+
+
+class TestExchangeRateCoalescing:
+    @pytest.mark.asyncio
+    async def test_concurrent_rate_requests_fetch_once(self):
+        redis = AsyncMock()
+        redis.get = AsyncMock(return_value=None)
+
+        async def fetch():
+            await asyncio.sleep(0.01)
+            return 1470
+
+        service = ExchangeRateService()
+        with patch("app.services.exchange_rate.get_redis", return_value=redis), \
+                patch.object(service, "_fetch_rate_jsdelivr", side_effect=fetch) as mock_fetch:
+            rates = await asyncio.gather(
+                *(service.get_rate_to_krw(CryptoType.USDT) for _ in range(5))
+            )
+        await service.close()
+
+        assert rates == [1470] * 5
+        assert mock_fetch.call_count == 1
+        assert redis.setex.await_count == 2  # fresh + stale copy, once
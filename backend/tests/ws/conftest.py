@@ -75,6 +75,7 @@ class MockWebSocket:
         self.close_code = None
         self.close_reason = None
         self.sent_messages: list[dict[str, Any]] = []
+        self.sent_bytes: list[bytes] = []
         self.receive_queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
 
     async def accept(self) -> None:
@@ -90,6 +91,11 @@ class MockWebSocket:
             raise RuntimeError("WebSocket closed")
         self.sent_messages.append(data)
 
+    async def send_bytes(self, data: bytes) -> None:
+        if self.closed:
+            raise RuntimeError("WebSocket closed")
+        self.sent_bytes.append(data)
+
     async def receive_json(self) -> dict[str, Any]:
         if self.closed:
             raise RuntimeError("WebSocket closed")
@@ -275,7 +281,6 @@ async def test_connection(
         user_id=test_user_id,
         session_id=str(uuid4()),
         connection_id=str(uuid4()),
-        connected_at=datetime.utcnow(),
     )
 
 
@@ -7,11 +7,12 @@ Validates Requirements 10.3 from code-quality-security-upgrade spec.
 import asyncio
 import pytest
 import pytest_asyncio
-from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
-from app.ws.handlers.action import ActionHandler, is_bot_player
+from app.game.table_actor import TableActor
+from app.utils.async_utils import cancel_task_safe
+from app.ws.handlers.action import TURN_TIMER, ActionHandler, is_bot_player
 from app.ws.connection import WebSocketConnection
 from app.ws.events import EventType
 from app.ws.messages import MessageEnvelope
@@ -103,7 +104,6 @@ def mock_connection():
         user_id="user1",
         session_id="session1",
         connection_id=str(uuid4()),
-        connected_at=datetime.utcnow(),
     )
 
 
@@ -128,6 +128,24 @@ def mock_table():
     return table
 
 
+@pytest.fixture
+def bot_table():
+    """Create PokerTable seated with bots only."""
+    table = PokerTable(
+        room_id="bot-room",
+        name="Bot Table",
+        small_blind=10,
+        big_blind=20,
+        min_buy_in=400,
+        max_buy_in=2000,
+    )
+    for seat in range(3):
+        table.seat_player(seat, Player(
+            user_id=f"bot_{seat}", username=f"Bot{seat}", seat=seat, stack=1000, is_bot=True
+        ))
+    return table
+
+
 # =============================================================================
 # is_bot_player Tests
 # =============================================================================
@@ -198,34 +216,45 @@ class TestHandlerEvents:
 
 
 # =============================================================================
-# Table Lock Tests
+# Table Actor Tests
 # =============================================================================
 
 
-class TestTableLocks:
-    """Tests for table lock management."""
+class TestTableActors:
+    """Tests for per-table actor management."""
 
-    def test_get_table_lock_creates_new(self, action_handler):
-        """Test getting lock creates new lock if not exists."""
-        lock = action_handler._get_table_lock("room1")
+    @pytest.mark.asyncio
+    async def test_get_actor_creates_new(self, action_handler):
+        """Test getting actor creates it if not exists."""
+        actor = action_handler._get_actor("room1")
         
-        assert lock is not None
-        assert isinstance(lock, asyncio.Lock)
-        assert "room1" in action_handler._table_locks
+        assert isinstance(actor, TableActor)
+        assert "room1" in action_handler._actors
 
-    def test_get_table_lock_returns_existing(self, action_handler):
-        """Test getting lock returns existing lock."""
-        lock1 = action_handler._get_table_lock("room1")
-        lock2 = action_handler._get_table_lock("room1")
+    @pytest.mark.asyncio
+    async def test_get_actor_returns_existing(self, action_handler):
+        """Test getting actor returns existing actor."""
+        actor1 = action_handler._get_actor("room1")
+        actor2 = action_handler._get_actor("room1")
         
-        assert lock1 is lock2
+        assert actor1 is actor2
 
-    def test_different_rooms_different_locks(self, action_handler):
-        """Test different rooms have different locks."""
-        lock1 = action_handler._get_table_lock("room1")
-        lock2 = action_handler._get_table_lock("room2")
+    @pytest.mark.asyncio
+    async def test_different_rooms_different_actors(self, action_handler):
+        """Test different rooms have different actors."""
+        actor1 = action_handler._get_actor("room1")
+        actor2 = action_handler._get_actor("room2")
         
-        assert lock1 is not lock2
+        assert actor1 is not actor2
+
+    @pytest.mark.asyncio
+    async def test_actor_shared_between_handlers(self, action_handler, mock_manager):
+        """Handlers created ad hoc (e.g. by TableHandler) share the table's actor."""
+        other = ActionHandler(mock_manager, None)
+        try:
+            assert other._get_actor("room1") is action_handler._get_actor("room1")
+        finally:
+            await cancel_task_safe(other._cleanup_task)
 
 
 # =============================================================================
@@ -237,25 +266,52 @@ class TestTimeoutManagement:
     """Tests for turn timeout management."""
 
     @pytest.mark.asyncio
-    async def test_cancel_turn_timeout_no_task(self, action_handler):
-        """Test cancelling timeout when no task exists."""
-        # Should not raise
-        await action_handler._cancel_turn_timeout("nonexistent-room")
+    async def test_cancel_turn_timeout_no_actor(self, action_handler):
+        """Test cancelling timeout when no actor exists."""
+        # Should not raise or create an actor
+        action_handler._cancel_turn_timeout("nonexistent-room")
+        assert "nonexistent-room" not in action_handler._actors
 
     @pytest.mark.asyncio
-    async def test_cancel_turn_timeout_with_task(self, action_handler):
-        """Test cancelling existing timeout task."""
-        # Create a dummy task
-        async def dummy_task():
-            await asyncio.sleep(100)
+    async def test_start_and_cancel_turn_timeout(self, action_handler, mock_table):
+        """Timeout is scheduled on the table actor and cancelled by key."""
+        action_handler._start_turn_timeout("test-room", mock_table, 0, turn_time=100)
+        actor = action_handler._get_actor("test-room")
+        assert actor.is_scheduled(TURN_TIMER)
         
-        task = asyncio.create_task(dummy_task())
-        action_handler._timeout_tasks["room1"] = task
+        action_handler._cancel_turn_timeout("test-room")
         
-        await action_handler._cancel_turn_timeout("room1")
+        assert not actor.is_scheduled(TURN_TIMER)
+
+    @pytest.mark.asyncio
+    async def test_no_timeout_for_bot(self, action_handler, mock_table):
+        """Bots do not get a server-side turn timeout."""
+        mock_table.players[0].user_id = "bot_1"
         
-        assert "room1" not in action_handler._timeout_tasks
-        assert task.cancelled()
+        action_handler._start_turn_timeout("test-room", mock_table, 0, turn_time=100)
+        
+        assert not action_handler._get_actor("test-room").is_scheduled(TURN_TIMER)
+
+    @pytest.mark.asyncio
+    async def test_timeout_folds_on_actor(self, action_handler, mock_manager, mock_table):
+        """Expired timeout auto-folds (or checks) through the table actor."""
+        mock_table.start_new_hand()
+        seat = mock_table.current_player_seat
+        
+        with patch("app.ws.handlers.action.game_manager") as mock_gm:
+            mock_gm.get_table.return_value = mock_table
+            action_handler._start_turn_timeout("test-room", mock_table, seat, turn_time=0)
+            
+            actor = action_handler._get_actor("test-room")
+            await asyncio.sleep(0.01)
+            await actor.drain()
+        
+        timeout_events = [
+            message for _, message in mock_manager.broadcast_messages
+            if message["type"] == EventType.TIMEOUT_FOLD.value
+        ]
+        assert len(timeout_events) == 1
+        assert timeout_events[0]["payload"]["position"] == seat
 
 
 # =============================================================================
@@ -267,43 +323,28 @@ class TestCleanup:
     """Tests for resource cleanup methods."""
 
     @pytest.mark.asyncio
-    async def test_cleanup_table_resources(self, action_handler):
-        """Test cleanup_table_resources removes all resources."""
-        # Setup resources
-        action_handler._table_locks["room1"] = asyncio.Lock()
-        
-        async def dummy_task():
-            await asyncio.sleep(100)
-        
-        task = asyncio.create_task(dummy_task())
-        action_handler._timeout_tasks["room1"] = task
+    async def test_cleanup_table_resources(self, action_handler, mock_table):
+        """Test cleanup_table_resources stops the actor and its timers."""
+        action_handler._start_turn_timeout("test-room", mock_table, 0, turn_time=100)
+        actor = action_handler._get_actor("test-room")
         
         # Cleanup
-        await action_handler.cleanup_table_resources("room1")
+        await action_handler.cleanup_table_resources("test-room")
         
-        assert "room1" not in action_handler._table_locks
-        assert "room1" not in action_handler._timeout_tasks
+        assert "test-room" not in action_handler._actors
+        assert actor.closed
+        assert not actor.is_scheduled(TURN_TIMER)
 
     @pytest.mark.asyncio
     async def test_cleanup_all_resources(self, action_handler):
         """Test cleanup_all_resources clears everything."""
-        # Setup multiple resources
-        action_handler._table_locks["room1"] = asyncio.Lock()
-        action_handler._table_locks["room2"] = asyncio.Lock()
-        
-        async def dummy_task():
-            await asyncio.sleep(100)
-        
-        task1 = asyncio.create_task(dummy_task())
-        task2 = asyncio.create_task(dummy_task())
-        action_handler._timeout_tasks["room1"] = task1
-        action_handler._timeout_tasks["room2"] = task2
+        action_handler._get_actor("room1").post(lambda: None)
+        action_handler._get_actor("room2").post(lambda: None)
         
         # Cleanup all
         await action_handler.cleanup_all_resources()
         
-        assert len(action_handler._table_locks) == 0
-        assert len(action_handler._timeout_tasks) == 0
+        assert len(action_handler._actors) == 0
 
     @pytest.mark.asyncio
     async def test_cleanup_idempotent(self, action_handler):
@@ -555,46 +596,109 @@ class TestActionHandlerIntegration:
     """Integration-like tests for ActionHandler."""
 
     @pytest.mark.asyncio
-    async def test_concurrent_lock_acquisition(self, action_handler):
-        """Test concurrent lock acquisition for same room."""
-        lock = action_handler._get_table_lock("room1")
-        
-        acquired_count = 0
-        
-        async def try_acquire():
-            nonlocal acquired_count
-            async with lock:
-                acquired_count += 1
-                await asyncio.sleep(0.01)
-        
-        # Run multiple concurrent acquisitions
-        await asyncio.gather(
-            try_acquire(),
-            try_acquire(),
-            try_acquire(),
+    async def test_concurrent_starts_serialized(self, action_handler, mock_connection, mock_table):
+        """Concurrent START_GAME requests run one at a time on the table actor."""
+        event = MessageEnvelope.create(
+            event_type=EventType.START_GAME,
+            payload={"tableId": "test-room"},
+            request_id="req-1",
+            trace_id="trace-1",
         )
         
-        # All should have acquired the lock sequentially
-        assert acquired_count == 3
+        with patch("app.ws.handlers.action.game_manager") as mock_gm:
+            mock_gm.get_table.return_value = mock_table
+            
+            results = await asyncio.gather(*(
+                action_handler._handle_start_game(mock_connection, event)
+                for _ in range(3)
+            ))
+        
+        successes = [r for r in results if r.payload["success"]]
+        assert len(successes) == 1
+        assert all(
+            r.payload["errorCode"] == "GAME_ALREADY_IN_PROGRESS"
+            for r in results if not r.payload["success"]
+        )
+        # 첫 턴은 딜링 애니메이션 후로 예약됨
+        assert action_handler._get_actor("test-room").is_scheduled(TURN_TIMER)
+
+    @pytest.mark.asyncio
+    async def test_bot_turn_uses_worker_decision(self, action_handler, bot_table):
+        """Bot turns apply the decision evaluated by the bot decision worker."""
+        bot_table.start_new_hand()
+        seat = bot_table.current_player_seat
+        decisions_before = action_handler._bot_decisions.decisions
+
+        with patch("app.ws.handlers.action.game_manager") as mock_gm, \
+                patch.object(action_handler, "_bot_think_delay", return_value=0.0), \
+                patch.object(action_handler, "_decide_bot_action", side_effect=AssertionError("on-loop decision")):
+            mock_gm.get_table.return_value = bot_table
+            actor = action_handler._get_actor("bot-room")
+            actor.post(lambda: action_handler._advance_turn("bot-room"))
+
+            for _ in range(100):
+                if bot_table.current_player_seat != seat or bot_table.phase == GamePhase.WAITING:
+                    break
+                await asyncio.sleep(0.01)
+            await actor.call(lambda: actor.cancel(TURN_TIMER))
+
+        assert action_handler._bot_decisions.decisions > decisions_before
+        assert bot_table.current_player_seat != seat or bot_table.phase == GamePhase.WAITING
+
+    @pytest.mark.asyncio
+    async def test_stale_bot_decision_not_applied(self, action_handler, bot_table):
+        """A decision requested for an earlier hand is discarded and the turn re-requested."""
+        bot_table.start_new_hand()
+        seat = bot_table.current_player_seat
+        pot = bot_table.pot
+        stale = asyncio.get_running_loop().create_future()
+        stale.set_result(("fold", 0))
+
+        with patch("app.ws.handlers.action.game_manager") as mock_gm:
+            mock_gm.get_table.return_value = bot_table
+            actor = action_handler._get_actor("bot-room")
+            await actor.call(lambda: action_handler._bot_move(
+                "bot-room", seat, bot_table.hand_number - 1, stale
+            ))
+
+        assert bot_table.current_player_seat == seat
+        assert bot_table.pot == pot
+        assert actor.is_scheduled(TURN_TIMER)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_bot_decision_falls_back(self, action_handler, bot_table):
+        """If the worker decision was cancelled (shutdown), decide on the loop instead."""
+        bot_table.start_new_hand()
+        seat = bot_table.current_player_seat
+        cancelled = asyncio.get_running_loop().create_future()
+        cancelled.cancel()
+
+        with patch("app.ws.handlers.action.game_manager") as mock_gm, \
+                patch.object(action_handler, "_decide_bot_action", return_value=("fold", 0)) as fallback:
+            mock_gm.get_table.return_value = bot_table
+            actor = action_handler._get_actor("bot-room")
+            await actor.call(lambda: action_handler._bot_move(
+                "bot-room", seat, bot_table.hand_number, cancelled
+            ))
+            actor.cancel(TURN_TIMER)
+
+        fallback.assert_called_once()
+        assert bot_table.players[seat].status == "folded"
 
     @pytest.mark.asyncio
-    async def test_cleanup_during_active_timeout(self, action_handler):
+    async def test_cleanup_during_active_timeout(self, action_handler, mock_table):
         """Test cleanup properly cancels active timeout."""
-        timeout_executed = False
+        mock_table.start_new_hand()
+        seat = mock_table.current_player_seat
         
-        async def timeout_handler():
-            nonlocal timeout_executed
-            await asyncio.sleep(0.5)
-            timeout_executed = True
-        
-        task = asyncio.create_task(timeout_handler())
-        action_handler._timeout_tasks["room1"] = task
-        
-        # Cleanup immediately
-        await action_handler.cleanup_table_resources("room1")
-        
-        # Wait a bit to ensure timeout didn't execute
-        await asyncio.sleep(0.1)
+        with patch("app.ws.handlers.action.game_manager") as mock_gm:
+            mock_gm.get_table.return_value = mock_table
+            action_handler._start_turn_timeout("test-room", mock_table, seat, turn_time=0.05)
+            
+            # Cleanup immediately
+            await action_handler.cleanup_table_resources("test-room")
+            
+            # Wait a bit to ensure timeout didn't execute
+            await asyncio.sleep(0.1)
         
-        assert timeout_executed is False
-        assert task.cancelled()
+        assert mock_table.current_player_seat == seat
@@ -22,6 +22,10 @@ class TestCCUTracking:
         redis.pfcount = AsyncMock(return_value=0)
         redis.setex = AsyncMock()
         redis.get = AsyncMock(return_value=None)
+        redis.hget = AsyncMock(return_value=None)
+        redis.hset = AsyncMock()
+        redis.hkeys = AsyncMock(return_value=[])
+        redis.hdel = AsyncMock()
         redis.expire = AsyncMock()
         redis.pipeline = MagicMock(return_value=redis)
         redis.execute = AsyncMock(return_value=[1, 1, 1, True, 1, True])
@@ -84,16 +88,17 @@ class TestCCUTracking:
     @pytest.mark.asyncio
     async def test_save_ccu_snapshot(self, mock_redis):
         """CCU 스냅샷 저장 테스트"""
-        from app.ws.manager import ConnectionManager, CCU_HISTORY_TTL
+        from app.ws.manager import ConnectionManager, CCU_SERIES_KEY
 
         mock_redis.scard = AsyncMock(return_value=100)
-        mock_redis.get = AsyncMock(return_value=None)
 
         manager = ConnectionManager(mock_redis)
         await manager._save_ccu_snapshot()
 
-        # setex가 호출되었는지 확인 (시간별, 분별)
-        assert mock_redis.setex.call_count >= 1
+        # 시간별 CCU는 단일 해시 필드에 저장
+        hour_key = datetime.utcnow().strftime("%Y-%m-%d:%H")
+        mock_redis.hset.assert_called_once_with(CCU_SERIES_KEY, hour_key, "100")
+        assert mock_redis.setex.call_count == 1  # 분별 CCU
 
     @pytest.mark.asyncio
     async def test_save_ccu_snapshot_keeps_higher_value(self, mock_redis):
@@ -102,18 +107,30 @@ class TestCCUTracking:
 
         # 현재 CCU가 50이고, 저장된 값이 100인 경우
         mock_redis.scard = AsyncMock(return_value=50)
-        mock_redis.get = AsyncMock(return_value="100")
+        mock_redis.hget = AsyncMock(return_value="100")
 
         manager = ConnectionManager(mock_redis)
         await manager._save_ccu_snapshot()
 
         # 시간별 CCU는 업데이트되지 않아야 함 (더 낮은 값이므로)
+        mock_redis.hset.assert_not_called()
         # 하지만 분별 CCU는 항상 저장됨
         calls = mock_redis.setex.call_args_list
-        # 분별 CCU만 저장되었는지 확인 (ccu_minute 키)
         minute_calls = [c for c in calls if "ccu_minute" in str(c)]
         assert len(minute_calls) >= 1
 
+    @pytest.mark.asyncio
+    async def test_new_hour_prunes_expired_fields(self, mock_redis):
+        """새 시간 첫 스냅샷에서 보관 기간이 지난 필드 정리"""
+        from app.ws.manager import ConnectionManager, CCU_SERIES_KEY
+
+        mock_redis.hkeys = AsyncMock(return_value=[b"2000-01-01:00", "2999-01-01:00"])
+
+        manager = ConnectionManager(mock_redis)
+        await manager._save_ccu_snapshot()
+
+        mock_redis.hdel.assert_called_once_with(CCU_SERIES_KEY, "2000-01-01:00")
+
 
 class TestDAUTracking:
     """DAU 트래킹 테스트"""
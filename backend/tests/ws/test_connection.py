@@ -1,7 +1,9 @@
 """Tests for WebSocket connection management."""
 
 import asyncio
-from datetime import datetime, timedelta
+import subprocess
+import sys
+from pathlib import Path
 from uuid import uuid4
 
 import pytest
@@ -11,6 +13,8 @@ from app.ws.connection import WebSocketConnection, ConnectionState
 from app.ws.manager import ConnectionManager
 from tests.ws.conftest import MockWebSocket, MockRedis
 
+BACKEND_ROOT = Path(__file__).resolve().parents[2]
+
 
 class TestWebSocketConnection:
     """Tests for WebSocketConnection class."""
@@ -24,7 +28,6 @@ class TestWebSocketConnection:
             user_id="user-1",
             session_id="session-1",
             connection_id="conn-1",
-            connected_at=datetime.utcnow(),
         )
 
     @pytest.mark.asyncio
@@ -104,7 +107,6 @@ class TestConnectionManager:
             user_id="user-1",
             session_id="session-1",
             connection_id=str(uuid4()),
-            connected_at=datetime.utcnow(),
         )
 
     @pytest.mark.asyncio
@@ -145,14 +147,12 @@ class TestConnectionManager:
             user_id=user_id,
             session_id="session-1",
             connection_id=str(uuid4()),
-            connected_at=datetime.utcnow(),
         )
         conn2 = WebSocketConnection(
             websocket=MockWebSocket(),
             user_id=user_id,
             session_id="session-2",
             connection_id=str(uuid4()),
-            connected_at=datetime.utcnow(),
         )
 
         await manager.connect(conn1)
@@ -218,14 +218,12 @@ class TestConnectionManager:
             user_id=user_id,
             session_id="session-1",
             connection_id=str(uuid4()),
-            connected_at=datetime.utcnow(),
         )
         conn2 = WebSocketConnection(
             websocket=MockWebSocket(),
             user_id=user_id,
             session_id="session-2",
             connection_id=str(uuid4()),
-            connected_at=datetime.utcnow(),
         )
 
         await manager.connect(conn1)
@@ -248,14 +246,12 @@ class TestConnectionManager:
             user_id="user-1",
             session_id="session-1",
             connection_id=str(uuid4()),
-            connected_at=datetime.utcnow(),
         )
         conn2 = WebSocketConnection(
             websocket=MockWebSocket(),
             user_id="user-2",
             session_id="session-2",
             connection_id=str(uuid4()),
-            connected_at=datetime.utcnow(),
         )
 
         await manager.connect(conn1)
@@ -281,14 +277,12 @@ class TestConnectionManager:
             user_id="user-1",
             session_id="session-1",
             connection_id=str(uuid4()),
-            connected_at=datetime.utcnow(),
         )
         conn2 = WebSocketConnection(
             websocket=MockWebSocket(),
             user_id="user-2",
             session_id="session-2",
             connection_id=str(uuid4()),
-            connected_at=datetime.utcnow(),
         )
 
         await manager.connect(conn1)
@@ -355,3 +349,133 @@ class TestConnectionManager:
 
         assert connection.connection_id not in manager.get_channel_subscribers("lobby")
         assert connection.connection_id not in manager.get_channel_subscribers("table:123")
+
+
+class NullPipeline:
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self
+
+    async def execute(self):
+        return []
+
+
+class NullRedis:
+    """아무것도 저장하지 않는 Redis (레지스트리 메모리만 측정)."""
+
+    async def _noop(self, *args, **kwargs):
+        return None
+
+    hset = hdel = sadd = srem = publish = setex = _noop
+
+    def pipeline(self):
+        return NullPipeline()
+
+
+MEMORY_PER_CONNECTION_SCRIPT = """
+import asyncio
+import tracemalloc
+from uuid import uuid4
+
+from app.ws.connection import WebSocketConnection
+from app.ws.manager import ConnectionManager
+from tests.ws.conftest import MockWebSocket
+from tests.ws.test_connection import NullRedis
+
+
+async def main():
+    count = 20_000
+    manager = ConnectionManager(NullRedis())
+    manager._max_connections = count
+    websocket = MockWebSocket()
+    ids = [(f"user-{i}", str(uuid4()), f"room-{i // 6}") for i in range(count)]
+
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    for user_id, connection_id, room_id in ids:
+        conn = WebSocketConnection(
+            websocket=websocket,
+            user_id=user_id,
+            session_id="s",
+            connection_id=connection_id,
+        )
+        await manager.connect(conn)
+        conn.update_ping()
+        await manager.subscribe(connection_id, "lobby")
+        await manager.subscribe_as_player(connection_id, room_id)
+    per_conn = (tracemalloc.get_traced_memory()[0] - base) / count
+    tracemalloc.stop()
+
+    print(manager.get_player_count("room-0"), per_conn)
+
+
+asyncio.run(main())
+"""
+
+
+class TestCompactRegistry:
+    """Slotted connections, integer handles, interned table channels."""
+
+    def test_connection_is_slotted(self):
+        conn = WebSocketConnection(
+            websocket=MockWebSocket(),
+            user_id="user-1",
+            session_id="session-1",
+            connection_id="conn-1",
+        )
+
+        assert not hasattr(conn, "__dict__")
+        assert isinstance(conn.connected_at, float)
+
+    def test_table_channels_precomputed(self):
+        from app.ws.channels import table_channel, table_channels
+
+        channels = table_channels("room-1")
+
+        assert channels == ("table:room-1", "table:room-1:players", "table:room-1:spectators")
+        assert table_channels("room-1") is channels
+        assert table_channel("room-1") is channels.main
+
+    @pytest.mark.asyncio
+    async def test_channel_names_shared_and_handles_unique(self):
+        manager = ConnectionManager(NullRedis())
+        conns = [
+            WebSocketConnection(
+                websocket=MockWebSocket(),
+                user_id=f"user-{i}",
+                session_id="s",
+                connection_id=f"conn-{i}",
+            )
+            for i in range(3)
+        ]
+        for conn in conns:
+            await manager.connect(conn)
+            # 호출마다 새로 만든 문자열이어도 같은 객체로 저장
+            await manager.subscribe(conn.connection_id, "".join(["lob", "by"]))
+
+        assert len({conn.handle for conn in conns}) == 3
+        names = [next(iter(conn.subscribed_channels)) for conn in conns]
+        assert all(name is names[0] for name in names)
+
+        await manager.disconnect(conns[0].connection_id, save_state=False)
+        assert sorted(manager.get_channel_subscribers("lobby")) == ["conn-1", "conn-2"]
+        assert conns[0].handle not in manager._by_handle
+
+    def test_memory_per_connection(self):
+        """로비 + 테이블(플레이어) 구독 연결당 레지스트리 메모리.
+
+        기존 레이아웃(dict 기반 dataclass, datetime 3개, 구독마다 f-string 채널명,
+        사용자별 set)은 같은 조건에서 약 1.4 KB/conn.
+        앞서 실행된 테스트의 캐시/할당 상태에 영향받지 않도록 새 인터프리터에서 측정.
+        """
+        result = subprocess.run(
+            [sys.executable, "-c", MEMORY_PER_CONNECTION_SCRIPT],
+            cwd=BACKEND_ROOT,
+            capture_output=True,
+            text=True,
+            timeout=120,
+        )
+        assert result.returncode == 0, result.stderr
+
+        player_count, per_conn = result.stdout.split()[-2:]
+        assert int(player_count) == 6
+        assert float(per_conn) < 1_300
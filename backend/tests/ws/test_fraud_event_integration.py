@@ -71,7 +71,7 @@ class TestBotPlayerEventFiltering:
     def mock_redis(self):
         """Mock Redis client."""
         redis = AsyncMock()
-        redis.publish = AsyncMock()
+        redis.xadd = AsyncMock()
         return redis
 
     @pytest.fixture
@@ -92,8 +92,8 @@ class TestBotPlayerEventFiltering:
             is_bot=True,
         )
 
-        # Redis publish가 호출되지 않아야 함
-        mock_redis.publish.assert_not_called()
+        # Redis xadd가 호출되지 않아야 함
+        mock_redis.xadd.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_human_action_published(self, action_handler, mock_redis):
@@ -114,11 +114,11 @@ class TestBotPlayerEventFiltering:
                 is_bot=False,
             )
 
-            # Redis publish가 호출되어야 함
-            mock_redis.publish.assert_called_once()
+            # Redis xadd가 호출되어야 함
+            mock_redis.xadd.assert_called_once()
             
             # 채널 확인
-            call_args = mock_redis.publish.call_args
+            call_args = mock_redis.xadd.call_args
             assert call_args[0][0] == "fraud:player_action"
 
     @pytest.mark.asyncio
@@ -132,7 +132,7 @@ class TestBotPlayerEventFiltering:
             is_bot=True,
         )
 
-        mock_redis.publish.assert_not_called()
+        mock_redis.xadd.assert_not_called()
 
 
 class TestTurnStartTimeTracking:
@@ -181,7 +181,7 @@ class TestHandCompletedEventPublishing:
     @pytest.fixture
     def mock_redis(self):
         redis = AsyncMock()
-        redis.publish = AsyncMock()
+        redis.xadd = AsyncMock()
         return redis
 
     @pytest.fixture
@@ -217,11 +217,11 @@ class TestHandCompletedEventPublishing:
                 hand_result=hand_result,
             )
 
-            # Redis publish가 호출되어야 함
-            mock_redis.publish.assert_called_once()
+            # Redis xadd가 호출되어야 함
+            mock_redis.xadd.assert_called_once()
             
             # 채널 확인
-            call_args = mock_redis.publish.call_args
+            call_args = mock_redis.xadd.call_args
             assert call_args[0][0] == "fraud:hand_completed"
 
     @pytest.mark.asyncio
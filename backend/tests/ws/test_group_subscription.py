@@ -10,7 +10,6 @@ Tests ConnectionManager's group subscription methods:
 from __future__ import annotations
 
 import asyncio
-from datetime import datetime
 from typing import AsyncGenerator
 from uuid import uuid4
 
@@ -36,7 +35,6 @@ def create_test_connection(user_id: str | None = None) -> tuple[WebSocketConnect
         user_id=user_id,
         session_id=str(uuid4()),
         connection_id=str(uuid4()),
-        connected_at=datetime.utcnow(),
     )
     return conn, mock_ws
 
@@ -1,6 +1,5 @@
 """Tests for WebSocket event handlers."""
 
-from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
@@ -38,7 +37,6 @@ class TestSystemHandler:
             user_id="user-1",
             session_id="session-1",
             connection_id=str(uuid4()),
-            connected_at=datetime.utcnow(),
         )
 
     def test_handled_events(self, handler: SystemHandler):
@@ -150,7 +148,6 @@ class TestLobbyHandler:
             user_id="user-1",
             session_id="session-1",
             connection_id=str(uuid4()),
-            connected_at=datetime.utcnow(),
         )
         await manager.connect(conn)
         return conn
@@ -255,7 +252,6 @@ class TestTableHandler:
             user_id="user-1",
             session_id="session-1",
             connection_id=str(uuid4()),
-            connected_at=datetime.utcnow(),
         )
         await manager.connect(conn)
         return conn
@@ -377,7 +373,6 @@ class TestChatHandler:
             user_id="user-1",
             session_id="session-1",
             connection_id=str(uuid4()),
-            connected_at=datetime.utcnow(),
         )
         await manager.connect(conn)
         await manager.subscribe(conn.connection_id, "table:123")
@@ -2,14 +2,19 @@
 
 import pytest
 import asyncio
-from datetime import datetime, timedelta
-from unittest.mock import AsyncMock, MagicMock, patch
+import json
+import time
+import tracemalloc
+from unittest.mock import AsyncMock, MagicMock
 
-from app.ws.gateway import (
-    HeartbeatManager,
+from app.ws.sweeper import (
+    ConnectionSweeper,
     HEARTBEAT_INTERVAL_SECONDS,
     HEARTBEAT_TIMEOUT_SECONDS,
     MAX_MISSED_PONGS,
+    SERVER_TIMEOUT,
+    SWEEP_TICK_SECONDS,
+    WHEEL_SLOTS,
 )
 from app.ws.handlers.system import SystemHandler
 from app.ws.events import EventType
@@ -33,257 +38,277 @@ class TestHeartbeatConfiguration:
         assert MAX_MISSED_PONGS == 2
 
 
-class TestHeartbeatManager:
-    """HeartbeatManager 클래스 테스트."""
+class FakeManager:
+    """ConnectionSweeper가 사용하는 ConnectionManager 인터페이스만 구현."""
 
-    @pytest.fixture
-    def mock_connection(self):
-        """Mock WebSocket connection 생성."""
-        conn = MagicMock()
-        conn.user_id = "user-123"
-        conn.connection_id = "conn-456"
-        conn.send = AsyncMock(return_value=True)
-        conn.websocket = MagicMock()
-        conn.websocket.close = AsyncMock()
-        conn.last_ping_at = None
-        conn.last_pong_at = None
-        conn.missed_pongs = 0
-        return conn
+    def __init__(self):
+        self.connections: dict = {}
+        self.disconnect = AsyncMock(side_effect=self._disconnect)
 
-    def test_init_stores_connection(self, mock_connection):
-        """HeartbeatManager 초기화 시 connection이 저장되어야 함."""
-        manager = HeartbeatManager(mock_connection)
-        assert manager.connection == mock_connection
-        assert manager._running is False
-        assert manager._task is None
+    def get_connection(self, connection_id):
+        return self.connections.get(connection_id)
 
-    @pytest.mark.asyncio
-    async def test_start_sets_running_flag(self, mock_connection):
-        """start()는 running 플래그를 설정하고 task를 생성해야 함."""
-        manager = HeartbeatManager(mock_connection)
+    async def _disconnect(self, connection_id, save_state=True):
+        self.connections.pop(connection_id, None)
 
-        await manager.start()
-        assert manager._running is True
-        assert manager._task is not None
 
-        await manager.stop()
+def make_connection(connection_id: str = "conn-456") -> MagicMock:
+    """Mock WebSocket connection 생성."""
+    conn = MagicMock()
+    conn.user_id = "user-123"
+    conn.connection_id = connection_id
+    conn.connected_at = time.monotonic()
+    conn.send = AsyncMock(return_value=True)
+    conn.send_text = AsyncMock(return_value=True)
+    conn.close = AsyncMock()
+    conn.websocket = MagicMock()
+    conn.websocket.close = AsyncMock()
+    conn.last_ping_at = None
+    conn.last_pong_at = None
+    conn.missed_pongs = 0
+    conn.token_expires_at = None
+    return conn
 
-    @pytest.mark.asyncio
-    async def test_stop_cancels_task(self, mock_connection):
-        """stop()은 task를 취소해야 함."""
-        manager = HeartbeatManager(mock_connection)
 
-        await manager.start()
-        await manager.stop()
+async def full_rotation(sweeper: ConnectionSweeper) -> None:
+    """휠 한 바퀴 (HEARTBEAT_INTERVAL_SECONDS) 진행."""
+    for _ in range(WHEEL_SLOTS):
+        await sweeper.sweep_once()
 
-        assert manager._running is False
-        assert manager._task is None
 
-    @pytest.mark.asyncio
-    async def test_record_pong_updates_connection(self, mock_connection):
-        """record_pong()은 connection 상태를 업데이트해야 함."""
-        manager = HeartbeatManager(mock_connection)
-        mock_connection.missed_pongs = 1
+class TestConnectionSweeperHeartbeat:
+    """ConnectionSweeper 하트비트 (서버 → 클라이언트 PING) 테스트."""
 
-        manager.record_pong()
+    @pytest.fixture
+    def manager(self):
+        return FakeManager()
 
-        assert mock_connection.last_pong_at is not None
-        assert mock_connection.missed_pongs == 0
+    @pytest.fixture
+    def mock_connection(self, manager):
+        conn = make_connection()
+        manager.connections[conn.connection_id] = conn
+        return conn
 
-    @pytest.mark.asyncio
-    async def test_heartbeat_loop_sends_ping(self, mock_connection):
-        """하트비트 루프는 PING 메시지를 전송해야 함."""
-        manager = HeartbeatManager(mock_connection)
+    @pytest.fixture
+    def sweeper(self, manager, mock_connection):
+        sweeper = ConnectionSweeper(manager)
+        sweeper.add(mock_connection)
+        return sweeper
 
-        call_count = 0
+    def test_wheel_covers_heartbeat_interval(self):
+        """휠 한 바퀴가 PING 주기와 같아야 함."""
+        assert WHEEL_SLOTS * SWEEP_TICK_SECONDS == HEARTBEAT_INTERVAL_SECONDS
 
-        async def mock_sleep(seconds):
-            nonlocal call_count
-            call_count += 1
-            # 두 번째 sleep에서 종료 (첫 번째 sleep 후 PING 전송됨)
-            if call_count >= 2:
-                manager._running = False
+    @pytest.mark.asyncio
+    async def test_start_and_stop_single_task(self, sweeper):
+        """start()/stop()은 프로세스당 1개 태스크만 관리해야 함."""
+        await sweeper.start()
+        assert sweeper._task is not None
 
-        with patch('app.ws.gateway.asyncio.sleep', side_effect=mock_sleep):
-            manager._running = True
-            await manager._heartbeat_loop()
+        await sweeper.stop()
+        assert sweeper._running is False
+        assert sweeper._task is None
 
-        # PING 메시지 전송 확인
-        mock_connection.send.assert_called()
-        call_args = mock_connection.send.call_args[0][0]
-        assert call_args["type"] == "PING"
-        assert "timestamp" in call_args
+    @pytest.mark.asyncio
+    async def test_first_ping_after_one_interval(self, sweeper, mock_connection):
+        """등록 후 한 바퀴(30초)가 지나야 첫 PING을 보내야 함."""
+        for _ in range(WHEEL_SLOTS - 1):
+            await sweeper.sweep_once()
+        mock_connection.send_text.assert_not_called()
+
+        await sweeper.sweep_once()
+
+        mock_connection.send_text.assert_awaited_once()
+        message = json.loads(mock_connection.send_text.await_args.args[0])
+        assert message["type"] == "PING"
+        assert "timestamp" in message
+        assert mock_connection.last_ping_at is not None
 
     @pytest.mark.asyncio
-    async def test_heartbeat_loop_increments_missed_pongs_on_no_response(self, mock_connection):
+    async def test_increments_missed_pongs_on_no_response(self, sweeper, mock_connection):
         """PONG 응답이 없으면 missed_pongs가 증가해야 함."""
-        manager = HeartbeatManager(mock_connection)
-
-        # 첫 번째 PING 이후 시뮬레이션 (PONG 없음)
-        mock_connection.last_ping_at = datetime.utcnow() - timedelta(seconds=35)
-        mock_connection.last_pong_at = None
-        mock_connection.missed_pongs = 0
-
-        call_count = 0
+        mock_connection.last_ping_at = time.monotonic() - 35
 
-        async def mock_sleep(seconds):
-            nonlocal call_count
-            call_count += 1
-            # 두 번째 sleep에서 종료 (첫 번째 sleep 후 missed_pongs 증가)
-            if call_count >= 2:
-                manager._running = False
+        await full_rotation(sweeper)
 
-        with patch('app.ws.gateway.asyncio.sleep', side_effect=mock_sleep):
-            manager._running = True
-            await manager._heartbeat_loop()
-
-        # missed_pongs가 증가해야 함
         assert mock_connection.missed_pongs == 1
+        mock_connection.websocket.close.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_heartbeat_loop_closes_connection_on_max_missed(self, mock_connection):
+    async def test_closes_connection_on_max_missed(self, sweeper, mock_connection):
         """최대 미응답 횟수 초과 시 연결을 종료해야 함."""
-        manager = HeartbeatManager(mock_connection)
-
-        # 이미 1회 미응답 상태
-        mock_connection.last_ping_at = datetime.utcnow() - timedelta(seconds=35)
-        mock_connection.last_pong_at = None
+        mock_connection.last_ping_at = time.monotonic() - 35
         mock_connection.missed_pongs = 1  # 다음에 2가 되면 종료
 
-        with patch('app.ws.gateway.asyncio.sleep', new_callable=AsyncMock):
-            manager._running = True
-            await manager._heartbeat_loop()
+        await full_rotation(sweeper)
 
-        # 연결 종료 확인
-        mock_connection.websocket.close.assert_called_once()
+        mock_connection.websocket.close.assert_awaited_once()
         close_args = mock_connection.websocket.close.call_args
         assert close_args[0][0] == 4003  # Heartbeat timeout close code
         assert "Heartbeat timeout" in close_args[0][1]
+        mock_connection.send_text.assert_not_called()
+        assert len(sweeper) == 0
 
     @pytest.mark.asyncio
-    async def test_heartbeat_loop_resets_missed_pongs_on_pong(self, mock_connection):
-        """PONG 응답을 받으면 missed_pongs가 리셋되어야 함."""
-        manager = HeartbeatManager(mock_connection)
-
-        # PONG 응답이 있는 상태 시뮬레이션
-        mock_connection.last_ping_at = datetime.utcnow() - timedelta(seconds=25)
-        mock_connection.last_pong_at = datetime.utcnow()  # PING 이후 PONG 수신
-        mock_connection.missed_pongs = 0
-
-        call_count = 0
-
-        async def mock_sleep(seconds):
-            nonlocal call_count
-            call_count += 1
-            if call_count >= 1:
-                manager._running = False
+    async def test_pong_keeps_connection(self, sweeper, mock_connection):
+        """PONG 응답을 받으면 missed_pongs가 유지되어야 함."""
+        mock_connection.last_ping_at = time.monotonic() - 25
+        mock_connection.last_pong_at = time.monotonic()  # PING 이후 PONG 수신
 
-        with patch('app.ws.gateway.asyncio.sleep', side_effect=mock_sleep):
-            manager._running = True
-            await manager._heartbeat_loop()
+        await full_rotation(sweeper)
 
-        # missed_pongs는 0 유지
         assert mock_connection.missed_pongs == 0
-        # 연결 종료되지 않아야 함
         mock_connection.websocket.close.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_heartbeat_updates_last_ping_at(self, mock_connection):
-        """PING 전송 후 last_ping_at이 업데이트되어야 함."""
-        manager = HeartbeatManager(mock_connection)
+    async def test_idle_connection_closed_and_disconnected(self, manager, sweeper, mock_connection):
+        """SERVER_TIMEOUT 동안 PING이 없으면 종료 + disconnect 해야 함."""
+        mock_connection.connected_at = time.monotonic() - (SERVER_TIMEOUT + 1)
 
-        call_count = 0
+        await full_rotation(sweeper)
 
-        async def mock_sleep(seconds):
-            nonlocal call_count
-            call_count += 1
-            # 두 번째 sleep에서 종료 (첫 번째 sleep 후 PING 전송)
-            if call_count >= 2:
-                manager._running = False
+        mock_connection.close.assert_awaited_once_with(4000, "Connection timeout")
+        manager.disconnect.assert_awaited_once_with("conn-456", save_state=True)
 
-        with patch('app.ws.gateway.asyncio.sleep', side_effect=mock_sleep):
-            manager._running = True
-            await manager._heartbeat_loop()
-
-        # last_ping_at이 설정되어야 함
-        assert mock_connection.last_ping_at is not None
+    @pytest.mark.asyncio
+    async def test_removed_connection_not_pinged(self, sweeper, mock_connection):
+        """remove() 이후에는 PING을 보내지 않아야 함."""
+        sweeper.remove(mock_connection.connection_id)
 
+        await full_rotation(sweeper)
 
-class TestHeartbeatErrorHandling:
-    """HeartbeatManager 에러 처리 테스트."""
+        mock_connection.send_text.assert_not_called()
 
-    @pytest.fixture
-    def mock_connection(self):
-        """Mock WebSocket connection 생성."""
-        conn = MagicMock()
-        conn.user_id = "user-123"
-        conn.connection_id = "conn-456"
-        conn.send = AsyncMock(return_value=True)
-        conn.websocket = MagicMock()
-        conn.websocket.close = AsyncMock()
-        conn.last_ping_at = None
-        conn.last_pong_at = None
-        conn.missed_pongs = 0
-        return conn
+    @pytest.mark.asyncio
+    async def test_pings_spread_over_wheel_and_encoded_once(self, manager):
+        """같은 tick의 PING은 한 번 인코딩, 연결들은 휠 칸에 분산되어야 함."""
+        sweeper = ConnectionSweeper(manager)
+        conns = []
+        for tick in range(3):
+            for i in range(4):
+                conn = make_connection(f"conn-{tick}-{i}")
+                manager.connections[conn.connection_id] = conn
+                sweeper.add(conn)
+                conns.append(conn)
+            await sweeper.sweep_once()
+
+        sent_per_tick = []
+        for _ in range(WHEEL_SLOTS):
+            before = sum(c.send_text.await_count for c in conns)
+            await sweeper.sweep_once()
+            sent_per_tick.append(sum(c.send_text.await_count for c in conns) - before)
+
+        assert sorted(sent_per_tick, reverse=True)[:3] == [4, 4, 4]
+        assert sum(sent_per_tick) == len(conns)
+        first_tick = [c for c in conns if c.connection_id.startswith("conn-0-")]
+        texts = {c.send_text.await_args.args[0] for c in first_tick}
+        assert len(texts) == 1
 
     @pytest.mark.asyncio
-    async def test_handles_send_failure(self, mock_connection):
-        """send 실패 시에도 루프가 계속되어야 함."""
-        manager = HeartbeatManager(mock_connection)
-        mock_connection.send.return_value = False
+    async def test_handles_send_failure(self, sweeper, mock_connection):
+        """send 실패 시 last_ping_at을 갱신하지 않고 계속되어야 함."""
+        mock_connection.send_text.return_value = False
 
-        call_count = 0
+        await full_rotation(sweeper)
 
-        async def mock_sleep(seconds):
-            nonlocal call_count
-            call_count += 1
-            if call_count >= 2:
-                manager._running = False
+        assert mock_connection.last_ping_at is None
 
-        with patch('app.ws.gateway.asyncio.sleep', side_effect=mock_sleep):
-            manager._running = True
-            # 에러 없이 완료되어야 함
-            await manager._heartbeat_loop()
+    @pytest.mark.asyncio
+    async def test_handles_send_exception(self, sweeper, mock_connection):
+        """send 예외가 스윕을 중단시키지 않아야 함."""
+        mock_connection.send_text.side_effect = Exception("Send exception")
+
+        await full_rotation(sweeper)
+        await full_rotation(sweeper)
 
-        # 여러 번 시도했어야 함
-        assert call_count >= 1
+        assert mock_connection.send_text.await_count == 2
 
     @pytest.mark.asyncio
-    async def test_handles_close_error(self, mock_connection):
+    async def test_handles_close_error(self, sweeper, mock_connection):
         """연결 종료 에러 시에도 gracefully 처리되어야 함."""
-        manager = HeartbeatManager(mock_connection)
-
-        mock_connection.last_ping_at = datetime.utcnow() - timedelta(seconds=35)
-        mock_connection.last_pong_at = None
-        mock_connection.missed_pongs = 1  # 다음에 2가 되면 종료 시도
+        mock_connection.last_ping_at = time.monotonic() - 35
+        mock_connection.missed_pongs = 1
         mock_connection.websocket.close.side_effect = Exception("Close failed")
 
-        with patch('app.ws.gateway.asyncio.sleep', new_callable=AsyncMock):
-            manager._running = True
-            # 에러 없이 완료되어야 함
-            await manager._heartbeat_loop()
-
-        # 루프가 종료되어야 함
-        assert manager._running is False
+        await full_rotation(sweeper)
+
+        assert len(sweeper) == 0
+
+
+class IdleWebSocket:
+    """전송만 받는 유휴 소켓 (AsyncMock 오버헤드 제외)."""
+
+    async def send_text(self, text: str) -> None:
+        pass
+
+
+class TestSweeperBenchmark:
+    """유휴 연결 10k/50k: 연결당 태스크 2개 방식 대비 메모리/CPU."""
+
+    @staticmethod
+    def _idle_connections(count: int) -> list[WebSocketConnection]:
+        websocket = IdleWebSocket()
+        now = time.monotonic()
+        return [
+            WebSocketConnection(
+                websocket=websocket,
+                user_id=f"user-{i}",
+                session_id="s",
+                connection_id=f"conn-{i}",
+                last_pong_at=now,
+                token_expires_at=time.time() + 3600,
+            )
+            for i in range(count)
+        ]
+
+    @staticmethod
+    async def _measure_tasks(count: int) -> int:
+        """기존 방식: 연결당 하트비트 + 토큰 검사 sleeping 태스크 2개."""
+        tracemalloc.start()
+        base = tracemalloc.get_traced_memory()[0]
+        tasks = [
+            asyncio.create_task(asyncio.sleep(300))
+            for _ in range(count * 2)
+        ]
+        await asyncio.sleep(0)
+        used = tracemalloc.get_traced_memory()[0] - base
+        tracemalloc.stop()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        return used
 
     @pytest.mark.asyncio
-    async def test_handles_send_exception(self, mock_connection):
-        """send 예외 발생 시에도 루프가 계속되어야 함."""
-        manager = HeartbeatManager(mock_connection)
-        mock_connection.send.side_effect = Exception("Send exception")
-
-        call_count = 0
-
-        async def mock_sleep(seconds):
-            nonlocal call_count
-            call_count += 1
-            if call_count >= 2:
-                manager._running = False
-
-        with patch('app.ws.gateway.asyncio.sleep', side_effect=mock_sleep):
-            manager._running = True
-            # 에러 없이 완료되어야 함
-            await manager._heartbeat_loop()
+    @pytest.mark.parametrize("count", [10_000, 50_000])
+    async def test_idle_connections(self, count):
+        conns = self._idle_connections(count)
+        manager = FakeManager()
+        manager.connections = {c.connection_id: c for c in conns}
+
+        tracemalloc.start()
+        base = tracemalloc.get_traced_memory()[0]
+        sweeper = ConnectionSweeper(manager)
+        for conn in conns:
+            sweeper.add(conn)
+        sweeper_bytes = tracemalloc.get_traced_memory()[0] - base
+        tracemalloc.stop()
+
+        start = time.perf_counter()
+        await full_rotation(sweeper)
+        rotation_s = time.perf_counter() - start
+
+        task_bytes = await self._measure_tasks(count)
+
+        print(
+            f"\n[sweeper] {count:,} idle conns: "
+            f"sweeper {sweeper_bytes / count:.0f} B/conn, "
+            f"2 tasks {task_bytes / count:.0f} B/conn, "
+            f"CPU {rotation_s * 1000:.0f} ms per {HEARTBEAT_INTERVAL_SECONDS:.0f}s "
+            f"({rotation_s / HEARTBEAT_INTERVAL_SECONDS * 100:.2f}% of one core)"
+        )
+        assert all(c.last_ping_at is not None for c in conns)
+        assert sweeper_bytes * 5 < task_bytes
+        assert rotation_s < HEARTBEAT_INTERVAL_SECONDS * 0.5
 
 
 class TestSystemHandlerPong:
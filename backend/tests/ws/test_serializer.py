@@ -0,0 +1,201 @@
+"""Tests for the negotiated /ws wire protocol (JSON text / MessagePack binary).
+
+- AUTH payload 협상 → 연결별 serializer
+- send / send_text(브로드캐스트) / 수신 디코딩이 협상 결과를 따름
+- 실제 테이블 상태 payload 기준 직렬화 크기/인코딩 시간 벤치마크
+"""
+
+import gzip
+import time
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import msgpack
+import pytest
+from fastapi import WebSocketDisconnect
+
+from app.game import Player, game_manager
+from app.utils.json_utils import json_dumps, json_loads
+from app.ws.connection import ConnectionState, WebSocketConnection
+from app.ws.events import EventType
+from app.ws.gateway import negotiate_serializer, receive_message
+from app.ws.handlers.system import create_connection_state_message
+from app.ws.messages import MessageEnvelope
+from app.ws.serializer import (
+    COMPRESSION_THRESHOLD,
+    MessageSerializer,
+    SerializationProtocol,
+    compare_serialization_sizes,
+)
+from tests.ws.conftest import MockWebSocket
+
+
+def make_connection(serializer: MessageSerializer | None) -> WebSocketConnection:
+    return WebSocketConnection(
+        websocket=MockWebSocket(),
+        user_id="user-1",
+        session_id="session-1",
+        connection_id=str(uuid4()),
+        serializer=serializer,
+    )
+
+
+def table_snapshots(seats: int = 9) -> list[dict]:
+    """핸드 진행 중 테이블의 플레이어별 TABLE_SNAPSHOT 메시지."""
+    room_id = str(uuid4())
+    table = game_manager.create_table_sync(room_id, "Bench", 10, 20, 400, 2000, seats)
+    try:
+        for seat in range(seats):
+            table.seat_player(
+                seat,
+                Player(user_id=str(uuid4()), username=f"player{seat}", seat=seat, stack=1000),
+            )
+        table.start_new_hand()
+        return [
+            MessageEnvelope.create(
+                event_type=EventType.TABLE_SNAPSHOT,
+                payload={"tableId": room_id, "state": table.get_state_for_player(player.user_id)},
+            ).to_dict()
+            for player in table.players.values()
+            if player
+        ]
+    finally:
+        game_manager.clear_all()
+
+
+class TestNegotiation:
+    def test_json_by_default(self):
+        assert negotiate_serializer({"token": "t"}) is None
+        assert negotiate_serializer({"token": "t", "protocol": "json"}) is None
+
+    def test_msgpack_with_optional_gzip(self):
+        plain = negotiate_serializer({"protocol": "msgpack"})
+        gzipped = negotiate_serializer({"protocol": "msgpack", "compression": "gzip"})
+
+        assert plain.protocol == SerializationProtocol.MSGPACK
+        assert not plain.compresses
+        assert gzipped.compresses
+        # 연결마다 새 객체를 만들지 않음
+        assert negotiate_serializer({"protocol": "msgpack"}) is plain
+
+    def test_connection_state_reports_protocol(self):
+        serializer = negotiate_serializer({"protocol": "msgpack", "compression": "gzip"})
+        message = create_connection_state_message(
+            ConnectionState.CONNECTED, "u", "s", serializer=serializer
+        )
+
+        assert message.payload["protocol"] == "msgpack"
+        assert message.payload["compression"] == "gzip"
+        plain = create_connection_state_message(ConnectionState.CONNECTED, "u", "s")
+        assert plain.payload["protocol"] == "json"
+
+
+class TestSend:
+    @pytest.mark.asyncio
+    async def test_json_connection_unchanged(self):
+        conn = make_connection(None)
+
+        assert await conn.send({"type": "PING"})
+        assert conn.websocket.sent_messages == [{"type": "PING"}]
+        assert conn.websocket.sent_bytes == []
+
+    @pytest.mark.asyncio
+    async def test_msgpack_values_match_json(self):
+        conn = make_connection(MessageSerializer.negotiate_protocol(accept_binary=True))
+        message = {
+            "type": "TABLE_SNAPSHOT",
+            "at": datetime(2026, 1, 1, tzinfo=timezone.utc),
+            "payload": {"tableId": uuid4(), "pot": 120, "cards": ["As", "Kd"]},
+        }
+
+        await conn.send(message)
+
+        decoded = msgpack.unpackb(conn.websocket.sent_bytes[0], raw=False)
+        assert decoded == json_loads(json_dumps(message))
+        assert decoded["at"] == "2026-01-01T00:00:00Z"
+
+    @pytest.mark.asyncio
+    async def test_broadcast_text_transcoded_once(self):
+        serializer = MessageSerializer.negotiate_protocol(accept_binary=True)
+        conns = [make_connection(serializer) for _ in range(3)]
+        text = json_dumps({"type": "TURN_CHANGED", "payload": {"currentPlayer": 3}})
+
+        for conn in conns:
+            assert await conn.send_text(text)
+
+        frames = [conn.websocket.sent_bytes[0] for conn in conns]
+        assert all(frame is frames[0] for frame in frames)
+        assert msgpack.unpackb(frames[0])["payload"]["currentPlayer"] == 3
+
+    @pytest.mark.asyncio
+    async def test_large_snapshot_gzipped_when_negotiated(self):
+        serializer = negotiate_serializer({"protocol": "msgpack", "compression": "gzip"})
+        conn = make_connection(serializer)
+        snapshot = {"type": "TABLE_SNAPSHOT", "payload": {"log": ["raise 40"] * 400}}
+
+        await conn.send(snapshot)
+        await conn.send({"type": "PONG"})
+
+        big, small = conn.websocket.sent_bytes
+        assert big[:2] == b"\x1f\x8b"
+        assert msgpack.unpackb(gzip.decompress(big)) == snapshot
+        assert msgpack.unpackb(small) == {"type": "PONG"}
+
+
+class ReceivingWebSocket:
+    def __init__(self, *messages):
+        self.messages = list(messages)
+
+    async def receive(self):
+        return self.messages.pop(0)
+
+
+class TestReceive:
+    @pytest.mark.asyncio
+    async def test_binary_and_text_frames(self):
+        ping = {"type": "PING", "payload": {}}
+        websocket = ReceivingWebSocket(
+            {"type": "websocket.receive", "bytes": msgpack.packb(ping)},
+            {"type": "websocket.receive", "text": json_dumps(ping)},
+            {"type": "websocket.disconnect", "code": 1001},
+        )
+
+        assert await receive_message(websocket) == ping
+        assert await receive_message(websocket) == ping
+        with pytest.raises(WebSocketDisconnect) as exc:
+            await receive_message(websocket)
+        assert exc.value.code == 1001
+
+
+class TestSerializationBenchmark:
+    """실제 TABLE_SNAPSHOT payload 기준 JSON / MessagePack / gzip 비교."""
+
+    @pytest.mark.parametrize("seats", [6, 9])
+    def test_table_snapshot_sizes(self, seats):
+        snapshots = table_snapshots(seats)
+        sizes = [compare_serialization_sizes(message) for message in snapshots]
+        serializer = MessageSerializer.negotiate_protocol(accept_binary=True)
+
+        iterations = 2_000
+        start = time.perf_counter()
+        for _ in range(iterations):
+            json_dumps(snapshots[0])
+        json_us = (time.perf_counter() - start) / iterations * 1e6
+        start = time.perf_counter()
+        for _ in range(iterations):
+            serializer.encode(snapshots[0])
+        msgpack_us = (time.perf_counter() - start) / iterations * 1e6
+
+        avg = {key: sum(s[key] for s in sizes) / len(sizes) for key in sizes[0]}
+        print(
+            f"\n[serializer] {seats}-max TABLE_SNAPSHOT: "
+            f"json {avg['json_bytes']:.0f} B, msgpack {avg['msgpack_bytes']:.0f} B "
+            f"(-{avg['msgpack_reduction_pct']:.1f}%), "
+            f"msgpack+gzip {avg['msgpack_gzip_bytes']:.0f} B "
+            f"(-{avg['msgpack_gzip_reduction_pct']:.1f}%), "
+            f"encode json {json_us:.1f} us / msgpack {msgpack_us:.1f} us"
+        )
+        assert all(s["msgpack_bytes"] < s["json_bytes"] for s in sizes)
+        assert avg["msgpack_gzip_bytes"] < avg["msgpack_bytes"]
+        # 스냅샷은 압축 임계값을 넘으므로 gzip 협상 시 압축 대상
+        assert all(s["json_bytes"] > COMPRESSION_THRESHOLD for s in sizes)
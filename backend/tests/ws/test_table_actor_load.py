@@ -0,0 +1,289 @@
+"""
+봇 전용 테이블 처리량 벤치마크 - 테이블 액터 vs 테이블 락.
+
+테스트 범위:
+─────────────────────────────────────────────────────────────────────────────────
+
+1. 봇 테이블이 액터만으로 핸드를 끝까지 진행 (딜레이 0)
+2. 브로드캐스트 I/O 지연이 있을 때 상태 전이 처리량 (액터 > 락)
+3. CPU 포화(I/O 지연 0) 시 처리량이 락 방식과 같은 수준
+
+락 방식 기준선은 이전 ActionHandler의 봇 루프와 같은 구조입니다:
+테이블 락을 잡은 채 결정 → process_action → 브로드캐스트 await → 다음 턴.
+두 방식 모두 같은 메시지 빌더/전송 코드를 사용하고 애니메이션 대기는 0입니다.
+
+─────────────────────────────────────────────────────────────────────────────────
+"""
+
+import asyncio
+import random
+import time
+from dataclasses import dataclass
+from typing import Dict, List
+from unittest.mock import patch
+
+import pytest
+
+from app.game import game_manager, Player
+from app.game.poker_table import GamePhase
+from app.ws.events import EventType
+from app.ws.handlers.action import TURN_TIMER, ActionHandler
+
+
+class NullLogger:
+    """벤치마크 중 로그 비용 제거."""
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+class LatencyManager:
+    """전송마다 고정 I/O 지연을 주는 ConnectionManager 대역."""
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.actions = 0
+        self.sent = 0
+        self.hands_started: Dict[str, int] = {}
+
+    async def broadcast_to_channel(self, channel: str, message: dict) -> None:
+        self.sent += 1
+        if message["type"] == EventType.TABLE_STATE_UPDATE.value:
+            self.actions += 1
+        elif message["type"] == EventType.HAND_STARTED.value:
+            room_id = message["payload"]["tableId"]
+            self.hands_started[room_id] = self.hands_started.get(room_id, 0) + 1
+        await asyncio.sleep(self.latency)
+
+    async def send_to_user(self, user_id: str, message: dict) -> None:
+        self.sent += 1
+        await asyncio.sleep(self.latency)
+
+    def get_channel_subscribers(self, channel: str) -> List[str]:
+        return []
+
+
+class InstantActionHandler(ActionHandler):
+    """애니메이션/생각 시간 0, 지정 핸드 수 후 정지."""
+
+    def __init__(self, manager, hands: int):
+        super().__init__(manager, None)
+        self.hands = hands
+        self.finished: Dict[str, asyncio.Event] = {}
+
+    def _bot_think_delay(self) -> float:
+        return 0.0
+
+    def _dealing_delay(self, table) -> float:
+        return 0.0
+
+    def _phase_transition_delay(self) -> float:
+        return 0.0
+
+    def _next_hand_delay(self) -> float:
+        return 0.0
+
+    def _auto_start_next_hand(self, room_id: str) -> None:
+        table = game_manager.get_table(room_id)
+        if table.hand_number >= self.hands:
+            self.finished[room_id].set()
+            return
+        super()._auto_start_next_hand(room_id)
+
+
+@dataclass
+class RunStats:
+    actions: int
+    sent: int
+    transitions_elapsed: float  # 마지막 상태 전이까지
+    delivered_elapsed: float    # 모든 브로드캐스트 전송 완료까지
+
+    @property
+    def transitions_per_sec(self) -> float:
+        return self.actions / self.transitions_elapsed
+
+    @property
+    def delivered_per_sec(self) -> float:
+        return self.actions / self.delivered_elapsed
+
+
+def create_bot_tables(prefix: str, count: int, seats: int = 6) -> List[str]:
+    room_ids = []
+    for t in range(count):
+        room_id = f"{prefix}-{t}"
+        table = game_manager.create_table_sync(
+            room_id, "bench", 10, 20, 400, 10**9, max_players=seats
+        )
+        for s in range(seats):
+            table.seat_player(s, Player(
+                user_id=f"bot_{prefix}_{t}_{s}",
+                username=f"Bot{s}",
+                seat=s,
+                stack=1_000_000,
+                is_bot=True,
+            ))
+        room_ids.append(room_id)
+    return room_ids
+
+
+def remove_tables(room_ids: List[str]) -> None:
+    for room_id in room_ids:
+        game_manager._tables.pop(room_id, None)
+
+
+async def run_actor_tables(count: int, hands: int, latency: float) -> RunStats:
+    manager = LatencyManager(latency)
+    handler = InstantActionHandler(manager, hands)
+    room_ids = create_bot_tables("actor-bench", count)
+    try:
+        for room_id in room_ids:
+            handler.finished[room_id] = asyncio.Event()
+
+        start = time.perf_counter()
+        for room_id in room_ids:
+            await handler._get_actor(room_id).call(
+                lambda room_id=room_id: handler._start_game(room_id, "bench")
+            )
+        await asyncio.gather(*(handler.finished[r].wait() for r in room_ids))
+        transitions_done = time.perf_counter()
+        for room_id in room_ids:
+            await handler._get_actor(room_id).drain()
+        delivered = time.perf_counter()
+
+        for room_id in room_ids:
+            table = game_manager.get_table(room_id)
+            assert table.phase == GamePhase.WAITING
+            assert table.hand_number == hands
+            assert manager.hands_started[room_id] == hands
+            assert not handler._get_actor(room_id).is_scheduled(TURN_TIMER)
+
+        return RunStats(
+            actions=manager.actions,
+            sent=manager.sent,
+            transitions_elapsed=transitions_done - start,
+            delivered_elapsed=delivered - start,
+        )
+    finally:
+        await handler.cleanup_all_resources()
+        remove_tables(room_ids)
+
+
+async def run_locked_tables(count: int, hands: int, latency: float) -> RunStats:
+    """이전 설계: 테이블 락을 잡은 채 액션 처리와 브로드캐스트를 모두 await."""
+    manager = LatencyManager(latency)
+    handler = InstantActionHandler(manager, hands)
+    room_ids = create_bot_tables("lock-bench", count)
+    locks = {room_id: asyncio.Lock() for room_id in room_ids}
+
+    async def bot_loop(room_id: str) -> None:
+        table = game_manager.get_table(room_id)
+        while True:
+            async with locks[room_id]:
+                if table.phase == GamePhase.WAITING:
+                    if table.hand_number >= hands:
+                        return
+                    result = table.start_new_hand()
+                    await handler._broadcast(
+                        room_id, handler._hand_started_message(room_id, result, table)
+                    )
+                    await handler._send_to_users(
+                        handler._personalized_state_messages(room_id, table)
+                    )
+                    continue
+
+                player = table.players.get(table.current_player_seat)
+                available = table.get_available_actions(player.user_id)
+                action, amount = handler._decide_bot_action(
+                    actions=available.get("actions", []),
+                    call_amount=available.get("call_amount", 0),
+                    stack=player.stack,
+                    available=available,
+                    hole_cards=player.hole_cards or [],
+                    community_cards=table.community_cards or [],
+                    pot=table.pot,
+                )
+                result = table.process_action(player.user_id, action, amount)
+
+                if result.get("hand_complete"):
+                    player_seats = {
+                        p.user_id: seat for seat, p in table.players.items() if p
+                    }
+                    await handler._broadcast_hand_result(
+                        room_id, result.get("hand_result"), player_seats
+                    )
+                    await handler._broadcast_action(room_id, result)
+                    await handler._send_to_users(
+                        handler._personalized_state_messages(room_id, table)
+                    )
+                    continue
+
+                await handler._broadcast_action(room_id, result)
+                if result.get("phase_changed"):
+                    await handler._broadcast(
+                        room_id, handler._community_cards_message(room_id, table)
+                    )
+                await handler._broadcast(
+                    room_id, handler._turn_changed_message(room_id, table)
+                )
+
+    try:
+        start = time.perf_counter()
+        await asyncio.gather(*(bot_loop(room_id) for room_id in room_ids))
+        elapsed = time.perf_counter() - start
+        return RunStats(
+            actions=manager.actions,
+            sent=manager.sent,
+            transitions_elapsed=elapsed,
+            delivered_elapsed=elapsed,
+        )
+    finally:
+        await handler.cleanup_all_resources()
+        remove_tables(room_ids)
+
+
+def report(label: str, locked: RunStats, actor: RunStats) -> None:
+    print(
+        f"\n[{label}] lock: {locked.actions} actions, "
+        f"{locked.delivered_per_sec:,.0f} actions/s | "
+        f"actor: {actor.actions} actions, "
+        f"{actor.transitions_per_sec:,.0f} transitions/s, "
+        f"{actor.delivered_per_sec:,.0f} delivered actions/s"
+    )
+
+
+@pytest.fixture(autouse=True)
+def quiet_handler_logs():
+    random.seed(7)
+    with patch("app.ws.handlers.action.logger", NullLogger()):
+        yield
+
+
+class TestActorBotTables:
+    @pytest.mark.asyncio
+    async def test_bot_tables_play_to_completion(self):
+        stats = await run_actor_tables(count=5, hands=2, latency=0.0)
+
+        assert stats.actions > 0
+        assert stats.sent > stats.actions
+
+    @pytest.mark.asyncio
+    async def test_io_latency_does_not_block_actions(self):
+        """브로드캐스트 지연(5ms/전송) 동안에도 상태 전이는 계속 진행."""
+        locked = await run_locked_tables(count=4, hands=3, latency=0.005)
+        actor = await run_actor_tables(count=4, hands=3, latency=0.005)
+        report("io-bound 4 tables", locked, actor)
+
+        # 락 방식은 액션마다 전송 지연을 기다림 → 액터 상태 전이가 훨씬 빠름
+        assert actor.transitions_per_sec > 3 * locked.delivered_per_sec
+        # 테이블별 outbox도 순차 전송이므로 전송 완료 기준은 같은 수준
+        assert actor.delivered_per_sec > 0.7 * locked.delivered_per_sec
+
+    @pytest.mark.asyncio
+    async def test_cpu_bound_throughput_vs_lock(self):
+        """I/O 지연 0 (엔진 CPU가 병목)에서 액터 오버헤드가 크지 않음."""
+        locked = await run_locked_tables(count=30, hands=3, latency=0.0)
+        actor = await run_actor_tables(count=30, hands=3, latency=0.0)
+        report("cpu-bound 30 tables", locked, actor)
+
+        # 핸드 구성(셔플)이 실행마다 달라 여유 있게 비교
+        assert actor.delivered_per_sec > 0.5 * locked.delivered_per_sec
@@ -1,16 +1,15 @@
-"""Tests for WebSocket token validation."""
+"""Tests for WebSocket token expiry (ConnectionSweeper)."""
+
+import time
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
-import asyncio
-from datetime import datetime, timedelta, timezone
-from unittest.mock import AsyncMock, MagicMock, patch
 
-from app.ws.gateway import (
-    TokenValidator,
-    TOKEN_VALIDATION_INTERVAL_SECONDS,
+from app.ws.sweeper import (
+    ConnectionSweeper,
     create_reauth_required_message,
 )
-from app.utils.security import create_access_token, TokenError
 
 
 class TestCreateReauthRequiredMessage:
@@ -34,236 +33,111 @@ class TestCreateReauthRequiredMessage:
         assert "timestamp" in msg
 
 
-class TestTokenValidator:
-    """Tests for TokenValidator class."""
+def make_connection(connection_id: str, expires_at: float | None) -> MagicMock:
+    """Create mock WebSocket connection."""
+    conn = MagicMock()
+    conn.user_id = "user-123"
+    conn.connection_id = connection_id
+    conn.connected_at = datetime.utcnow()
+    conn.send = AsyncMock()
+    conn.send_text = AsyncMock(return_value=True)
+    conn.websocket = MagicMock()
+    conn.websocket.close = AsyncMock()
+    conn.last_ping_at = None
+    conn.last_pong_at = None
+    conn.missed_pongs = 0
+    conn.token_expires_at = expires_at
+    return conn
 
-    @pytest.fixture
-    def mock_connection(self):
-        """Create mock WebSocket connection."""
-        conn = MagicMock()
-        conn.user_id = "user-123"
-        conn.connection_id = "conn-456"
-        conn.send = AsyncMock()
-        conn.websocket = MagicMock()
-        conn.websocket.close = AsyncMock()
-        return conn
 
-    @pytest.fixture
-    def valid_token(self):
-        """Create a valid token."""
-        return create_access_token("user-123")
+class TestTokenExpiry:
+    """Tests for precomputed token expiry enforcement."""
 
     @pytest.fixture
-    def expired_token(self):
-        """Create an expired token."""
-        return create_access_token(
-            "user-123",
-            expires_delta=timedelta(seconds=-1)
-        )
-
-    def test_init_stores_token_and_connection(self, mock_connection, valid_token):
-        """TokenValidator should store token and connection."""
-        validator = TokenValidator(valid_token, mock_connection)
-        assert validator.token == valid_token
-        assert validator.connection == mock_connection
-        assert validator._running is False
-        assert validator._task is None
+    def manager(self):
+        manager = MagicMock()
+        manager.connections = {}
+        manager.get_connection = manager.connections.get
+        return manager
 
-    @pytest.mark.asyncio
-    async def test_start_sets_running_flag(self, mock_connection, valid_token):
-        """Start should set running flag and create task."""
-        validator = TokenValidator(valid_token, mock_connection)
-        
-        # Start and immediately stop to avoid long wait
-        await validator.start()
-        assert validator._running is True
-        assert validator._task is not None
-        
-        await validator.stop()
-
-    @pytest.mark.asyncio
-    async def test_stop_cancels_task(self, mock_connection, valid_token):
-        """Stop should cancel the validation task."""
-        validator = TokenValidator(valid_token, mock_connection)
-        
-        await validator.start()
-        await validator.stop()
-        
-        assert validator._running is False
-        assert validator._task is None
+    def register(self, manager, sweeper, conn) -> None:
+        manager.connections[conn.connection_id] = conn
+        sweeper.add(conn)
 
     @pytest.mark.asyncio
-    async def test_validate_token_returns_true_for_valid(self, mock_connection, valid_token):
-        """_validate_token should return True for valid token."""
-        validator = TokenValidator(valid_token, mock_connection)
-        
-        result = await validator._validate_token()
-        assert result is True
+    async def test_sends_reauth_and_closes_on_expiry(self, manager):
+        """Expired token should get REAUTH_REQUIRED and close code 4002."""
+        sweeper = ConnectionSweeper(manager)
+        now = time.time()
+        conn = make_connection("conn-1", expires_at=now + 10)
+        self.register(manager, sweeper, conn)
 
-    @pytest.mark.asyncio
-    async def test_validate_token_returns_false_for_expired(self, mock_connection, expired_token):
-        """_validate_token should return False for expired token."""
-        validator = TokenValidator(expired_token, mock_connection)
-        
-        result = await validator._validate_token()
-        assert result is False
+        await sweeper.sweep_once(now=now + 9)
+        conn.send.assert_not_called()
 
-    @pytest.mark.asyncio
-    async def test_validate_token_returns_false_for_invalid(self, mock_connection):
-        """_validate_token should return False for invalid token."""
-        validator = TokenValidator("invalid-token", mock_connection)
-        
-        result = await validator._validate_token()
-        assert result is False
+        await sweeper.sweep_once(now=now + 10)
 
-    @pytest.mark.asyncio
-    async def test_validation_loop_sends_reauth_on_expiry(self, mock_connection, expired_token):
-        """Validation loop should send REAUTH_REQUIRED when token expires."""
-        validator = TokenValidator(expired_token, mock_connection)
-        
-        # Patch sleep to return immediately
-        with patch('asyncio.sleep', new_callable=AsyncMock):
-            validator._running = True
-            
-            # Run one iteration of the loop
-            await validator._validation_loop()
-        
-        # Should have sent reauth message
-        mock_connection.send.assert_called_once()
-        call_args = mock_connection.send.call_args[0][0]
-        assert call_args["type"] == "REAUTH_REQUIRED"
-        
-        # Should have closed connection
-        mock_connection.websocket.close.assert_called_once()
-        close_args = mock_connection.websocket.close.call_args
-        assert close_args[0][0] == 4002  # Close code
+        conn.send.assert_awaited_once()
+        assert conn.send.call_args[0][0]["type"] == "REAUTH_REQUIRED"
+        conn.websocket.close.assert_awaited_once()
+        assert conn.websocket.close.call_args[0][0] == 4002
+        assert len(sweeper) == 0
 
     @pytest.mark.asyncio
-    async def test_validation_loop_continues_on_valid_token(self, mock_connection, valid_token):
-        """Validation loop should continue when token is valid."""
-        validator = TokenValidator(valid_token, mock_connection)
-        
-        call_count = 0
-        
-        async def mock_sleep(seconds):
-            nonlocal call_count
-            call_count += 1
-            if call_count >= 2:
-                validator._running = False
-            return None
-        
-        with patch('asyncio.sleep', side_effect=mock_sleep):
-            validator._running = True
-            await validator._validation_loop()
-        
-        # Should not have sent reauth message
-        mock_connection.send.assert_not_called()
-        
-        # Should not have closed connection
-        mock_connection.websocket.close.assert_not_called()
+    async def test_only_expired_connections_closed(self, manager):
+        """Connections with later expiry are untouched."""
+        sweeper = ConnectionSweeper(manager)
+        now = time.time()
+        early = make_connection("conn-early", expires_at=now + 5)
+        late = make_connection("conn-late", expires_at=now + 3600)
+        forever = make_connection("conn-none", expires_at=None)
+        for conn in (late, early, forever):
+            self.register(manager, sweeper, conn)
+
+        await sweeper.sweep_once(now=now + 60)
+
+        early.websocket.close.assert_awaited_once()
+        late.websocket.close.assert_not_called()
+        forever.websocket.close.assert_not_called()
+        assert len(sweeper) == 2
 
     @pytest.mark.asyncio
-    async def test_stop_while_running(self, mock_connection, valid_token):
-        """Stop should properly cancel running validation."""
-        validator = TokenValidator(valid_token, mock_connection)
-        
-        await validator.start()
-        
-        # Give task time to start
-        await asyncio.sleep(0.01)
-        
-        await validator.stop()
-        
-        assert validator._running is False
-
-
-class TestTokenValidationInterval:
-    """Tests for token validation interval configuration."""
+    async def test_disconnected_connection_ignored(self, manager):
+        """Expiry entries of already-disconnected connections are skipped."""
+        sweeper = ConnectionSweeper(manager)
+        now = time.time()
+        conn = make_connection("conn-1", expires_at=now + 5)
+        self.register(manager, sweeper, conn)
+        del manager.connections["conn-1"]
+        sweeper.remove("conn-1")
 
-    def test_interval_is_5_minutes(self):
-        """Token validation interval should be 5 minutes (300 seconds)."""
-        assert TOKEN_VALIDATION_INTERVAL_SECONDS == 300.0
+        await sweeper.sweep_once(now=now + 60)
 
-    def test_interval_is_reasonable(self):
-        """Interval should be between 1 and 10 minutes."""
-        assert 60 <= TOKEN_VALIDATION_INTERVAL_SECONDS <= 600
+        conn.send.assert_not_called()
+        assert sweeper._expiries == []
 
+    @pytest.mark.asyncio
+    async def test_handles_send_error_gracefully(self, manager):
+        """Should still close when the reauth message cannot be sent."""
+        sweeper = ConnectionSweeper(manager)
+        now = time.time()
+        conn = make_connection("conn-1", expires_at=now - 1)
+        conn.send.side_effect = Exception("Send failed")
+        self.register(manager, sweeper, conn)
 
-class TestTokenValidatorErrorHandling:
-    """Tests for error handling in TokenValidator."""
+        await sweeper.sweep_once(now=now)
 
-    @pytest.fixture
-    def mock_connection(self):
-        """Create mock WebSocket connection."""
-        conn = MagicMock()
-        conn.user_id = "user-123"
-        conn.connection_id = "conn-456"
-        conn.send = AsyncMock()
-        conn.websocket = MagicMock()
-        conn.websocket.close = AsyncMock()
-        return conn
+        conn.websocket.close.assert_awaited_once()
 
     @pytest.mark.asyncio
-    async def test_handles_send_error_gracefully(self, mock_connection):
-        """Should handle send errors gracefully."""
-        expired_token = create_access_token(
-            "user-123",
-            expires_delta=timedelta(seconds=-1)
-        )
-        validator = TokenValidator(expired_token, mock_connection)
-        
-        # Make send raise an exception
-        mock_connection.send.side_effect = Exception("Send failed")
-        
-        with patch('asyncio.sleep', new_callable=AsyncMock):
-            validator._running = True
-            # Should not raise
-            await validator._validation_loop()
-        
-        # Should still try to close connection
-        mock_connection.websocket.close.assert_called_once()
+    async def test_handles_close_error_gracefully(self, manager):
+        """Should not raise when closing fails."""
+        sweeper = ConnectionSweeper(manager)
+        now = time.time()
+        conn = make_connection("conn-1", expires_at=now - 1)
+        conn.websocket.close.side_effect = Exception("Close failed")
+        self.register(manager, sweeper, conn)
 
-    @pytest.mark.asyncio
-    async def test_handles_close_error_gracefully(self, mock_connection):
-        """Should handle close errors gracefully."""
-        expired_token = create_access_token(
-            "user-123",
-            expires_delta=timedelta(seconds=-1)
-        )
-        validator = TokenValidator(expired_token, mock_connection)
-        
-        # Make close raise an exception
-        mock_connection.websocket.close.side_effect = Exception("Close failed")
-        
-        with patch('asyncio.sleep', new_callable=AsyncMock):
-            validator._running = True
-            # Should not raise
-            await validator._validation_loop()
-        
-        # Should have stopped running
-        assert validator._running is False
+        await sweeper.sweep_once(now=now)
 
-    @pytest.mark.asyncio
-    async def test_handles_validation_exception(self, mock_connection):
-        """Should handle unexpected validation exceptions."""
-        validator = TokenValidator("some-token", mock_connection)
-        
-        call_count = 0
-        
-        async def mock_sleep(seconds):
-            nonlocal call_count
-            call_count += 1
-            if call_count >= 2:
-                validator._running = False
-        
-        with patch('asyncio.sleep', side_effect=mock_sleep):
-            with patch.object(
-                validator, '_validate_token',
-                side_effect=Exception("Unexpected error")
-            ):
-                validator._running = True
-                # Should not raise, should continue loop
-                await validator._validation_loop()
-        
-        # Should have continued after error
-        assert call_count >= 1
+        assert len(sweeper) == 0